@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   benchcallovh_bf.py
+# Purpose:  Benchmark the per call overhead of bytesfunc functions.
+# Language: Python 3.5
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+
+"""This measures the time taken by each call to bytesfunc functions when
+the sequences are very short. At these sizes the time is dominated by the
+overhead of calling the function and parsing its parameters rather than by
+the calculation itself. Each function is called with positional parameters
+only, and again with keyword parameters.
+The equivalent operation using native Python is included for comparison.
+"""
+
+##############################################################################
+
+import timeit
+import itertools
+import json
+import argparse
+
+import bytesfunc
+
+##############################################################################
+
+
+# The functions to benchmark. Each entry has a call using only positional
+# parameters, a call using keyword parameters, and a native Python equivalent.
+BenchFuncs = {
+	'and_' : ('bytesfunc.and_(datax, 15, dataout)',
+			'bytesfunc.and_(datax, 15, dataout, nosimd=False)',
+			'bytearray(x & 15 for x in datax)'),
+	'invert' : ('bytesfunc.invert(datax, dataout)',
+			'bytesfunc.invert(datax, dataout, nosimd=False)',
+			'bytearray(~x & 0xff for x in datax)'),
+	'eq' : ('bytesfunc.eq(datax, datay)',
+			'bytesfunc.eq(datax, datay, nosimd=False)',
+			'datax == datay'),
+	'ball' : ('bytesfunc.ball("==", datax, 255)',
+			'bytesfunc.ball("==", datax, 255, threads=1)',
+			'all(x == 255 for x in datax)'),
+	'findindex' : ('bytesfunc.findindex("==", datax, 255)',
+			'bytesfunc.findindex("==", datax, 255, threads=1)',
+			'datax.find(255)'),
+	'bmax' : ('bytesfunc.bmax(datax)',
+			'bytesfunc.bmax(datax, threads=1)',
+			'max(datax)'),
+	'bsum' : ('bytesfunc.bsum(datax)',
+			'bytesfunc.bsum(datax, threads=1)',
+			'sum(datax)'),
+}
+
+
+########################################################
+def InitData(arraysize):
+	"""Initialise the data used for the benchmarks.
+	"""
+	datax = bytearray(itertools.islice(itertools.cycle(range(128)), arraysize))
+	datay = bytearray(datax)
+	dataout = bytearray(arraysize)
+
+	return {'bytesfunc' : bytesfunc, 'datax' : datax, 'datay' : datay, 'dataout' : dataout}
+
+
+########################################################
+def TimeCall(stmt, testdata, itercounts, repeats):
+	"""Return the best time in nanoseconds for a single call.
+	"""
+	timer = timeit.Timer(stmt, globals = testdata)
+	return min(timer.repeat(repeats, itercounts)) / itercounts * 1.0e9
+
+
+##############################################################################
+
+def GetCmdArguments():
+	""" Get any command line arguments. These modify the operation of the program.
+			rawoutput = If specified, will output raw data instead of a report.
+			arraysize = Size of the array in elements.
+			itercounts = The number of calls to time in each repeat.
+			repeats = The number of repeats. The best time is used.
+	"""
+	arraysize = 16
+	itercounts = 100000
+	repeats = 5
+
+	# Get any command line arguments.
+	parser = argparse.ArgumentParser()
+
+	# Output just the raw data.
+	parser.add_argument('--rawoutput', action = 'store_true', help = 'Output raw data.')
+
+	# Size of the test arrays.
+	parser.add_argument('--arraysize', type = int, default = arraysize,
+		help='Size of test arrays in number of elements.')
+
+	# The number of calls to time.
+	parser.add_argument('--itercounts', type = int, default = itercounts,
+		help='Number of calls to time in each repeat.')
+
+	# The number of repeats.
+	parser.add_argument('--repeats', type = int, default = repeats,
+		help='Number of repeats.')
+
+	args = parser.parse_args()
+
+	return args
+
+
+##############################################################################
+
+
+CmdArgs = GetCmdArguments()
+
+ArraySize = CmdArgs.arraysize
+TestData = InitData(ArraySize)
+
+
+##############################################################################
+
+TestResults = {}
+
+for funcname, stmts in BenchFuncs.items():
+	TestResults[funcname] = [TimeCall(x, TestData, CmdArgs.itercounts, CmdArgs.repeats) for x in stmts]
+
+
+##############################################################################
+
+# If raw data is requested, output the raw numbers as JSON.
+if CmdArgs.rawoutput:
+	print(json.dumps({'arraysize' : ArraySize, 'results' : TestResults}))
+
+else:
+	header = '{0:<12}{1:>12}{2:>12}{3:>12}'.format('Function', 'Positional', 'Keyword', 'Python')
+
+	print('\nBytesfunc call overhead benchmark.')
+	print('Array size: %d bytes. Time per call in nanoseconds.\n' % ArraySize)
+	print(header)
+	print('=' * len(header))
+
+	for funcname, results in TestResults.items():
+		print('{0:<12}'.format(funcname) + ''.join(['{0:>12.0f}'.format(x) for x in results]))
+
+	print()
+
+
+##############################################################################
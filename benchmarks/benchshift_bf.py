@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   benchshift_bf.py
+# Purpose:  Benchmark the throughput of the bytesfunc shift functions.
+# Language: Python 3.5
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+
+"""This measures the throughput of lshift and rshift for each parameter
+form, with and without SIMD. Unlike the general benchmarks, this does not
+compare against native Python. It is intended for comparing different
+versions of the SIMD shift kernels. The default array size is small enough
+to stay in the CPU cache, so that the results reflect the kernels rather
+than memory bandwidth.
+"""
+
+##############################################################################
+
+import time
+import itertools
+import json
+import argparse
+
+import bytesfunc
+
+##############################################################################
+
+
+# The parameter forms to benchmark. Each takes the data, the shift
+# counts, an output sequence, the single shift count, and nosimd.
+BenchForms = {
+	'seq, param' : lambda func, datax, datay, dataout, param, nosimd: func(datax, param, nosimd=nosimd),
+	'seq, param, out' : lambda func, datax, datay, dataout, param, nosimd: func(datax, param, dataout, nosimd=nosimd),
+	'param, seq, out' : lambda func, datax, datay, dataout, param, nosimd: func(param, datay, dataout, nosimd=nosimd),
+	'seq, seq, out' : lambda func, datax, datay, dataout, param, nosimd: func(datax, datay, dataout, nosimd=nosimd),
+}
+
+
+BenchFuncs = {
+	'lshift' : bytesfunc.lshift,
+	'rshift' : bytesfunc.rshift,
+}
+
+
+########################################################
+def InitData(arraysize):
+	"""Initialise the data. The shift counts cover the range 0 to 7.
+	"""
+	datax = bytearray(itertools.islice(itertools.cycle(range(256)), arraysize))
+	datay = bytearray(itertools.islice(itertools.cycle(range(8)), arraysize))
+	dataout = bytearray(arraysize)
+
+	return datax, datay, dataout
+
+
+########################################################
+def RunBench(func, form, param, nosimd, arraysize, runtimetarget):
+	"""Run one benchmark for approximately the target run time, and return
+	the number of bytes processed per second.
+	"""
+	datax, datay, dataout = InitData(arraysize)
+
+	# Calibrate the number of iterations.
+	itercounts = 10
+	starttime = time.perf_counter()
+	for i in range(itercounts):
+		form(func, datax, datay, dataout, param, nosimd)
+	endtime = time.perf_counter()
+
+	itercounts = max(int(runtimetarget / ((endtime - starttime) / itercounts)), 1)
+
+	# The actual benchmark.
+	starttime = time.perf_counter()
+	for i in range(itercounts):
+		form(func, datax, datay, dataout, param, nosimd)
+	endtime = time.perf_counter()
+
+	return (itercounts * arraysize) / (endtime - starttime)
+
+
+##############################################################################
+
+def GetCmdArguments():
+	""" Get any command line arguments. These modify the operation of the program.
+			rawoutput = If specified, will output raw data instead of a report.
+			arraysize = Size of the array in elements.
+			runtimetarget = The target length of time in seconds to run a benchmark for.
+	"""
+	arraysize = 65536
+	runtimetarget = 0.2
+
+	# Get any command line arguments.
+	parser = argparse.ArgumentParser()
+
+	# Output just the raw data.
+	parser.add_argument('--rawoutput', action = 'store_true', help = 'Output raw data.')
+
+	# Size of the test arrays.
+	parser.add_argument('--arraysize', type = int, default = arraysize,
+		help='Size of test arrays in number of elements.')
+
+	# The length of time to run each benchmark.
+	parser.add_argument('--runtimetarget', type = float, default = runtimetarget,
+		help='Target length of time to run each benchmark for.')
+
+	args = parser.parse_args()
+
+	return args
+
+
+##############################################################################
+
+
+CmdArgs = GetCmdArguments()
+
+ArraySize = CmdArgs.arraysize
+RunTimeTarget = CmdArgs.runtimetarget
+
+# The single shift count used with the 'param' forms.
+ShiftParam = 3
+
+
+##############################################################################
+
+TestResults = {}
+
+for funcname, func in BenchFuncs.items():
+	TestResults[funcname] = {}
+	for formname, form in BenchForms.items():
+		TestResults[funcname][formname] = {
+			'simd' : RunBench(func, form, ShiftParam, False, ArraySize, RunTimeTarget),
+			'nosimd' : RunBench(func, form, ShiftParam, True, ArraySize, RunTimeTarget),
+		}
+
+
+##############################################################################
+
+# If raw data is requested, output the raw numbers as JSON.
+if CmdArgs.rawoutput:
+	print(json.dumps({'arraysize' : ArraySize, 'simdlevel' : bytesfunc.simdsupport.simdlevel,
+				'results' : TestResults}))
+
+else:
+	print('\nBytesfunc shift benchmark.')
+	print('Array size: %d bytes. SIMD level: %s. Throughput in GB/s.\n' % (ArraySize, bytesfunc.simdsupport.simdlevel))
+
+	header = '{0:<10}{1:<18}{2:>10}{3:>10}{4:>10}'.format('Function', 'Form', 'SIMD', 'No SIMD', 'Ratio')
+	print(header)
+	print('=' * len(header))
+
+	for funcname, forms in TestResults.items():
+		for formname, results in forms.items():
+			print('{0:<10}{1:<18}{2:>10.2f}{3:>10.2f}{4:>10.1f}'.format(funcname, formname,
+				results['simd'] / 1e9, results['nosimd'] / 1e9, results['simd'] / results['nosimd']))
+
+	print()
+
+
+##############################################################################
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   benchthreads_bf.py
+# Purpose:  Benchmark the scaling of bytesfunc functions across Python threads.
+# Language: Python 3.5
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+
+"""This measures how the total throughput of bytesfunc functions scales
+when the same function is called from several Python threads at once.
+Each thread works on its own data so that the only shared resource is the
+GIL. The GIL is released by bytesfunc for long sequences, so throughput
+should increase with the number of threads until the number of cores or
+memory bandwidth is exhausted.
+It also measures how a single call scales when the calculation is divided
+between threads using the 'threads' parameter.
+"""
+
+##############################################################################
+
+import time
+import itertools
+import os
+import json
+import argparse
+import threading
+
+import bytesfunc
+
+##############################################################################
+
+
+# The functions to benchmark, and how to call them. Each takes an
+# input sequence and an output sequence.
+BenchFuncs = {
+	'and_' : lambda datax, dataout: bytesfunc.and_(datax, 15, dataout),
+	'xor' : lambda datax, dataout: bytesfunc.xor(datax, 15, dataout),
+	'lshift' : lambda datax, dataout: bytesfunc.lshift(datax, 2, dataout),
+	'invert' : lambda datax, dataout: bytesfunc.invert(datax, dataout),
+	'eq' : lambda datax, dataout: bytesfunc.eq(datax, datax),
+	'bany' : lambda datax, dataout: bytesfunc.bany('==', datax, 255),
+	'findindex' : lambda datax, dataout: bytesfunc.findindex('==', datax, 255),
+	'bmax' : lambda datax, dataout: bytesfunc.bmax(datax),
+	'bsum' : lambda datax, dataout: bytesfunc.bsum(datax),
+}
+
+
+# The functions which accept the 'threads' parameter.
+ThreadParamFuncs = {
+	'and_' : lambda datax, dataout, threads: bytesfunc.and_(datax, 15, dataout, threads=threads),
+	'xor' : lambda datax, dataout, threads: bytesfunc.xor(datax, 15, dataout, threads=threads),
+	'lshift' : lambda datax, dataout, threads: bytesfunc.lshift(datax, 2, dataout, threads=threads),
+	'bmax' : lambda datax, dataout, threads: bytesfunc.bmax(datax, threads=threads),
+	'bmin' : lambda datax, dataout, threads: bytesfunc.bmin(datax, threads=threads),
+	'bsum' : lambda datax, dataout, threads: bytesfunc.bsum(datax, threads=threads),
+	'bany' : lambda datax, dataout, threads: bytesfunc.bany('==', datax, 255, threads=threads),
+	'findindex' : lambda datax, dataout, threads: bytesfunc.findindex('==', datax, 255, threads=threads),
+}
+
+
+########################################################
+def InitData(arraysize):
+	"""Initialise the data used by one thread.
+	"""
+	datax = bytearray(itertools.islice(itertools.cycle(range(128)), arraysize))
+	dataout = bytearray(arraysize)
+
+	return datax, dataout
+
+
+########################################################
+def RunThreads(func, threadcount, arraysize, itercounts):
+	"""Run the function in the specified number of threads and return the
+	total number of bytes processed per second.
+	"""
+	data = [InitData(arraysize) for x in range(threadcount)]
+
+	# All the threads are started together.
+	startbarrier = threading.Barrier(threadcount + 1)
+
+	def worker(datax, dataout):
+		startbarrier.wait()
+		for i in range(itercounts):
+			func(datax, dataout)
+
+	threads = [threading.Thread(target = worker, args = x) for x in data]
+	for t in threads:
+		t.start()
+
+	startbarrier.wait()
+	starttime = time.perf_counter()
+	for t in threads:
+		t.join()
+	endtime = time.perf_counter()
+
+	return (threadcount * itercounts * arraysize) / (endtime - starttime)
+
+
+########################################################
+def RunThreadParam(func, threadcount, arraysize, itercounts):
+	"""Run the function from one Python thread, dividing each call between
+	the specified number of threads. Return the number of bytes processed
+	per second.
+	"""
+	datax, dataout = InitData(arraysize)
+
+	starttime = time.perf_counter()
+	for i in range(itercounts):
+		func(datax, dataout, threadcount)
+	endtime = time.perf_counter()
+
+	return (itercounts * arraysize) / (endtime - starttime)
+
+
+########################################################
+def calibrateruntime(func, arraysize, runtimetarget):
+	"""Calculate the number of iterations needed to run for approximately
+	the target run time in a single thread.
+	"""
+	itercounts = 10
+
+	starttime = time.perf_counter()
+	datax, dataout = InitData(arraysize)
+	for i in range(itercounts):
+		func(datax, dataout)
+	endtime = time.perf_counter()
+
+	itertime = (endtime - starttime) / itercounts
+
+	return max(int(runtimetarget / itertime), 1)
+
+
+##############################################################################
+
+def GetCmdArguments():
+	""" Get any command line arguments. These modify the operation of the program.
+			rawoutput = If specified, will output raw data instead of a report.
+			arraysize = Size of the array in elements.
+			runtimetarget = The target length of time in seconds to run a benchmark for.
+			maxthreads = The maximum number of threads to test.
+	"""
+	arraysize = 4000000
+	runtimetarget = 0.2
+	maxthreads = os.cpu_count() or 1
+
+	# Get any command line arguments.
+	parser = argparse.ArgumentParser()
+
+	# Output just the raw data.
+	parser.add_argument('--rawoutput', action = 'store_true', help = 'Output raw data.')
+
+	# Size of the test arrays.
+	parser.add_argument('--arraysize', type = int, default = arraysize,
+		help='Size of test arrays in number of elements.')
+
+	# The length of time to run each benchmark.
+	parser.add_argument('--runtimetarget', type = float, default = runtimetarget,
+		help='Target length of time to run each benchmark for.')
+
+	# The maximum number of threads.
+	parser.add_argument('--maxthreads', type = int, default = maxthreads,
+		help='Maximum number of threads to test.')
+
+	args = parser.parse_args()
+
+	return args
+
+
+##############################################################################
+
+
+CmdArgs = GetCmdArguments()
+
+ArraySize = CmdArgs.arraysize
+RunTimeTarget = CmdArgs.runtimetarget
+ThreadCounts = sorted(set([1, 2, 4, 8, CmdArgs.maxthreads]))
+ThreadCounts = [x for x in ThreadCounts if x <= CmdArgs.maxthreads]
+
+
+##############################################################################
+
+TestResults = {}
+
+for funcname, func in BenchFuncs.items():
+	itercounts = calibrateruntime(func, ArraySize, RunTimeTarget)
+	TestResults[funcname] = {x : RunThreads(func, x, ArraySize, itercounts) for x in ThreadCounts}
+
+
+ThreadParamResults = {}
+
+for funcname, func in ThreadParamFuncs.items():
+	itercounts = calibrateruntime(lambda x, y: func(x, y, 1), ArraySize, RunTimeTarget)
+	ThreadParamResults[funcname] = {x : RunThreadParam(func, x, ArraySize, itercounts) for x in ThreadCounts}
+
+
+##############################################################################
+
+# If raw data is requested, output the raw numbers as JSON.
+if CmdArgs.rawoutput:
+	print(json.dumps({'arraysize' : ArraySize, 'results' : TestResults, 
+				'threadparam' : ThreadParamResults}))
+
+else:
+	header = '{0:<12}'.format('Function') + ''.join(['{0:>8}'.format('%d thr' % x) for x in ThreadCounts])
+
+	print('\nBytesfunc thread scaling benchmark.')
+	print('Array size: %d bytes. Speed-up relative to one thread.' % ArraySize)
+
+	for title, testresults in (('Calls from multiple Python threads.', TestResults),
+						('Single call using the threads parameter.', ThreadParamResults)):
+		print('\n' + title + '\n')
+		print(header)
+		print('=' * len(header))
+
+		for funcname, results in testresults.items():
+			ratios = [results[x] / results[1] for x in ThreadCounts]
+			print('{0:<12}'.format(funcname) + ''.join(['{0:>8.2f}'.format(x) for x in ratios]))
+
+	print()
+
+
+##############################################################################
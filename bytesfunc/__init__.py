@@ -1,32 +1,132 @@
-"""The BytesFunc module provides high speed bytes and bytearray processing 
-functions. These functions are patterned after the functions in the standard 
+"""The BytesFunc module provides high speed bytes and bytearray processing
+functions. These functions are patterned after the functions in the standard
 Python Itertools module together with some additional ones import other sources.
 """
 
 # The version number should be updated automatically by the build script.
 __version__ = '3.4.4'
 
-from bytesfunc.bmax import bmax
-from bytesfunc.bmin import bmin
-from bytesfunc.bsum import bsum
+import sys as _sys
+import types as _types
 
-from bytesfunc.eq import eq
-from bytesfunc.ge import ge
-from bytesfunc.gt import gt
-from bytesfunc.le import le
-from bytesfunc.lt import lt
-from bytesfunc.ne import ne
 
-from bytesfunc.ball import ball
-from bytesfunc.bany import bany
-from bytesfunc.findindex import findindex
+# The functions, and the extension module which each is in when they are
+# built as separate extension modules. If they are built as a single
+# extension module, they are all in "_bytesfunc".
+_funcmodules = {
+	'bmax' : 'bmax', 'bmin' : 'bmin', 'bsum' : 'bsum',
+	'eq' : 'eq', 'ge' : 'ge', 'gt' : 'gt', 'le' : 'le', 'lt' : 'lt', 'ne' : 'ne',
+	'cmpmask' : 'cmpmask',
+	'ball' : 'ball', 'bany' : 'bany', 'findindex' : 'findindex',
+	'and_' : 'and_', 'or_' : 'or_', 'xor' : 'xor', 'lshift' : 'lshift', 'rshift' : 'rshift',
+	'invert' : 'invert', 'where' : 'where',
+	'bmax_many' : 'bmax', 'bmin_many' : 'bmin', 'bsum_many' : 'bsum',
+	'ball_many' : 'ball', 'bany_many' : 'bany', 'findindex_many' : 'findindex',
+	'findall' : 'findindex', 'finditer' : 'findindex', 'countif' : 'findindex',
+	'and__many' : 'and_', 'or__many' : 'or_', 'xor_many' : 'xor', 'lshift_many' : 'lshift', 'rshift_many' : 'rshift',
+	'SumAccumulator' : 'accumulators', 'MinMaxAccumulator' : 'accumulators',
+	'histogram' : 'histogram', 'bstats' : 'bstats',
+	'setthreads' : 'threadpool', 'getthreads' : 'threadpool',
+}
 
-from bytesfunc.and_ import and_
-from bytesfunc.or_ import or_
-from bytesfunc.xor import xor
-from bytesfunc.lshift import lshift
-from bytesfunc.rshift import rshift
+# The public names. The functions are imported when they are first used, so
+# they must be listed here for "from bytesfunc import *".
+__all__ = list(_funcmodules) + ['simdsupport']
 
-from bytesfunc.invert import invert
+# Submodules which are imported when they are first used. The extension
+# modules which contain the thread pool must be included, as the thread
+# pool API is looked up as an attribute of this package.
+_submodules = ('simdsupport', 'threadpool', '_bytesfunc')
 
-import bytesfunc.simdsupport
+
+# The single extension module, or None if the functions were built as
+# separate extension modules. This is not known until the first function
+# is used.
+_singlemodule = None
+_singlechecked = False
+
+
+########################################################
+def _importmodule(name):
+	"""Import a submodule and return it. Importlib is not used as importing
+	it would add to the import time.
+	"""
+	fullname = 'bytesfunc.' + name
+	__import__(fullname)
+	return _sys.modules[fullname]
+
+
+########################################################
+def _getfunc(name):
+	"""Import the extension module containing a function and return the
+	function.
+	"""
+	global _singlemodule, _singlechecked
+
+	if not _singlechecked:
+		try:
+			_singlemodule = _importmodule('_bytesfunc')
+		except ImportError:
+			_singlemodule = None
+		_singlechecked = True
+
+	if _singlemodule is not None:
+		return getattr(_singlemodule, name)
+	else:
+		modname = _funcmodules[name]
+		module = _importmodule(modname)
+		return getattr(module, name)
+
+
+##############################################################################
+class _PackageModule(_types.ModuleType):
+	"""Importing an extension module sets an attribute of the same name in
+	this package. When the module contains a function of that name as well,
+	such as "xor" which also contains "xor_many", the function is stored
+	instead so that the name stays callable however the module was imported.
+	"""
+
+	########################################################
+	def __setattr__(self, name, value):
+		if (isinstance(value, _types.ModuleType) and (_funcmodules.get(name) == name)
+				and hasattr(value, name)):
+			value = getattr(value, name)
+		super().__setattr__(name, value)
+
+
+_sys.modules[__name__].__class__ = _PackageModule
+
+
+########################################################
+def __getattr__(name):
+	"""Import functions and submodules the first time they are used. Once
+	imported they are stored in the module so this is not called again for
+	the same name.
+	"""
+	if name in _funcmodules:
+		func = _getfunc(name)
+		globals()[name] = func
+		return func
+
+	if name in _submodules:
+		try:
+			return _importmodule(name)
+		except ImportError:
+			pass
+
+	raise AttributeError("module 'bytesfunc' has no attribute '%s'" % name)
+
+
+########################################################
+def __dir__():
+	"""Include the functions which have not been imported yet.
+	"""
+	return sorted(set(globals()) | set(_funcmodules) | set(['simdsupport']))
+
+
+# Module level __getattr__ is not supported before Python 3.7, so
+# everything must be imported now.
+if _sys.version_info < (3, 7):
+	for _name in _funcmodules:
+		globals()[_name] = _getfunc(_name)
+	_importmodule('simdsupport')
@@ -71,6 +71,8 @@ mathops_head = """//------------------------------------------------------------
 #include "bytesparams_base.h"
 
 #include "bytesparams_two.h"
+#include "bytesparams_many.h"
+#include "bytesthreads.h"
 
 /*--------------------------------------------------------------------------- */
 
@@ -86,6 +88,23 @@ mathops_head = """//------------------------------------------------------------
 
 # ==============================================================================
 
+# For lshift and rshift only.
+shift_byte = """
+/*--------------------------------------------------------------------------- */
+/* Shift a byte value. A shift count of 8 or more shifts out every bit, as
+   it would if a Python integer was shifted and then truncated to a byte.
+   C does not define shifts by 32 or more, so the count is limited to 8.
+   This form (rather than selecting zero) lets the compiler vectorise the
+   non-SIMD loops.
+*/
+#define %(funclabel)s_byte(x, n) ((x) %(copname)s (((n) > 7) ? 8 : (n)))
+
+/*--------------------------------------------------------------------------- */
+
+"""
+
+# ==============================================================================
+
 # For all binary operators with two arguments.
 ops_binop = """
 /*--------------------------------------------------------------------------- */
@@ -103,7 +122,7 @@ void %(funclabel)s_1(Py_ssize_t arraylen, unsigned char *data1, unsigned char pa
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data1[x] = data1[x] %(copname)s param;
+		data1[x] = %(op_arr_num)s;
 	}
 
 
@@ -116,7 +135,7 @@ void %(funclabel)s_2(Py_ssize_t arraylen, unsigned char *data1, unsigned char pa
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data3[x] = data1[x] %(copname)s param;
+		data3[x] = %(op_arr_num)s;
 	}
 
 }
@@ -128,7 +147,7 @@ void %(funclabel)s_3(Py_ssize_t arraylen, unsigned char param, unsigned char *da
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data2[x] = param %(copname)s data2[x];
+		data2[x] = %(op_num_arr)s;
 	}
 
 }
@@ -140,7 +159,7 @@ void %(funclabel)s_4(Py_ssize_t arraylen, unsigned char param, unsigned char *da
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data3[x] = param %(copname)s data2[x];
+		data3[x] = %(op_num_arr)s;
 	}
 
 }
@@ -154,7 +173,7 @@ void %(funclabel)s_5(Py_ssize_t arraylen, unsigned char *data1, unsigned char *d
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data1[x] = data1[x] %(copname)s data2[x];
+		data1[x] = %(op_arr_arr)s;
 	}
 
 }
@@ -166,7 +185,7 @@ void %(funclabel)s_6(Py_ssize_t arraylen, unsigned char *data1, unsigned char *d
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data3[x] = data1[x] %(copname)s data2[x];
+		data3[x] = %(op_arr_arr)s;
 	}
 
 }
@@ -208,7 +227,7 @@ void %(funclabel)s_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigne
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -217,11 +236,11 @@ void %(funclabel)s_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigne
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data1[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
 		// The actual SIMD operation. 
-		datasliceleft = %(vopinstr)s( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceleft = (v16qi) %(vopinstr)s((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data1[index], datasliceleft);
+		_mm_storeu_si128((__m128i *) &data1[index], (__m128i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -250,7 +269,7 @@ void %(funclabel)s_2_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigne
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -259,11 +278,11 @@ void %(funclabel)s_2_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigne
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data1[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
 		// The actual SIMD operation. 
-		datasliceleft = %(vopinstr)s( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceleft = (v16qi) %(vopinstr)s((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data3[index], datasliceleft);
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -292,7 +311,7 @@ void %(funclabel)s_3_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -301,11 +320,11 @@ void %(funclabel)s_3_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *) &data2[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		// The actual SIMD operation. 
-		datasliceright = %(vopinstr)s( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceright = (v16qi) %(vopinstr)s((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data2[index], datasliceright);
+		_mm_storeu_si128((__m128i *) &data2[index], (__m128i) datasliceright);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -334,7 +353,7 @@ void %(funclabel)s_4_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -343,11 +362,11 @@ void %(funclabel)s_4_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *) &data2[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		// The actual SIMD operation. 
-		datasliceright = %(vopinstr)s( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceright = (v16qi) %(vopinstr)s((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data3[index], datasliceright);
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) datasliceright);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -377,12 +396,12 @@ void %(funclabel)s_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigne
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data1[index]);
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *) &data2[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		// The actual SIMD operation. 
-		datasliceleft = %(vopinstr)s( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceleft = (v16qi) %(vopinstr)s((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data1[index], datasliceleft);
+		_mm_storeu_si128((__m128i *) &data1[index], (__m128i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -412,12 +431,12 @@ void %(funclabel)s_6_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigne
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data1[index]);
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *) &data2[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		// The actual SIMD operation. 
-		datasliceleft = %(vopinstr)s( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceleft = (v16qi) %(vopinstr)s((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data3[index], datasliceleft);
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -429,21 +448,16 @@ void %(funclabel)s_6_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigne
 #endif
 
 """
-# ==============================================================================
 
+# ==============================================================================
 
-# The actual shift operations using SIMD operations.
-# This is a special version for x86-64 lshift and rshift only. This 
-# implements array shifted by a constant only, as shift by a vector
-# (array shifted by elements in another array) do not appear to work
-# when handled by GCC built-in functions. 
-# x86 does not have SIMD operations for all data types. This version implements
-# it for small data sizes by using shift from a larger size together with
-# a mask to mask off bits which should fall off the end. The shift operation
-# therefore should be the one for array type "I". 
-ops_simdsupport_shift_mask_x86 = """
+# The same operations using x86 AVX2 256 bit SIMD operations. Vector
+# extensions are used for the operation itself, as the compiler generates
+# the correct instruction.
+ops_simdsupport_avx2 = """
 /*--------------------------------------------------------------------------- */
-/* The following series of functions reflect the different parameter options possible.
+/* For x86 AVX2 SIMD.
+   The following series of functions reflect the different parameter options possible.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    data2 = The second data array.
@@ -451,60 +465,37 @@ ops_simdsupport_shift_mask_x86 = """
    param = The parameter to be applied to each array element.
 */
 // param_arr_num_none
-#if defined(AF_HASSIMD_X86)
-void %(funclabel)s_1_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void %(funclabel)s_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
-
-	// The mask and shift operations are done using a different data
-	// type than the parameters passed to the function. We always use
-	// the largest x86 shift operation available, which is unsigned int
-	v4si datasliceleft, vmaskslice;
-
-	// This mask gets rid of the bits which would otherwise get shifted
-	// into the adjoining vector element.
-	unsigned int maskvals[] = {%(vmaskvalues)s};
-	unsigned int compvals[INTSIMDSIZE];
-	unsigned int selectedmask;
 	unsigned int y;
 
-	// Select the mask value based on how many positions we are required
-	// to shift. This is limited to the number of masks defined.
-	if ((param > 7) || (param < 0)) {
-		selectedmask = 0;
-	} else {
-		selectedmask = maskvals[param];
-	}
-	
-	// Initialise the mask values.
-	for (y = 0; y < INTSIMDSIZE; y++) {
-		compvals[y] = selectedmask;
-	}
-	vmaskslice = (v4si) __builtin_ia32_lddqu((char *) compvals);
+	v32qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
 
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
 		// Load the data into the vector register.
-		datasliceleft = (v4si) __builtin_ia32_lddqu((char *) &data1[index]);
-
-		// Mask off the bits that would otherwise overflow into the adjacent byte.
-		datasliceleft = (v4si) __builtin_ia32_pand128( (v2di) datasliceleft,  (v2di) vmaskslice);
-
-		// The actual SIMD operation. This should always be the lshift or rshift
-		// operation for unsigned integer.
-		datasliceleft = %(vopinstr)s(datasliceleft, (int) param);
-
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft %(copname)s datasliceright;
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data1[index], (v16qi) datasliceleft);
+		_mm256_storeu_si256((__m256i *) &data1[index], (__m256i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -517,58 +508,36 @@ void %(funclabel)s_1_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1
 
 
 // param_arr_num_arr
-void %(funclabel)s_2_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+AF_TARGET_AVX2 void %(funclabel)s_2_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	unsigned int y;
 
-	// The mask and shift operations are done using a different data
-	// type than the parameters passed to the function. We always use
-	// the largest x86 shift operation available, which is unsigned int
-	v4si datasliceleft, vmaskslice;
-
-	// This mask gets rid of the bits which would otherwise get shifted
-	// into the adjoining vector element.
-	unsigned int maskvals[] = {%(vmaskvalues)s};
-	unsigned int compvals[INTSIMDSIZE];
-	unsigned int selectedmask, y;
-
-	// Select the mask value based on how many positions we are required
-	// to shift. This is limited to the number of masks defined.
-	if ((param > 7) || (param < 0)) {
-		selectedmask = 0;
-	} else {
-		selectedmask = maskvals[param];
-	}
-	
-	// Initialise the mask values.
-	for (y = 0; y < INTSIMDSIZE; y++) {
-		compvals[y] = selectedmask;
-	}
-	vmaskslice = (v4si) __builtin_ia32_lddqu((char *) compvals);
+	v32qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
 
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
 		// Load the data into the vector register.
-		datasliceleft = (v4si) __builtin_ia32_lddqu((char *) &data1[index]);
-
-		// Mask off the bits that would otherwise overflow into the adjacent byte.
-		datasliceleft = (v4si) __builtin_ia32_pand128( (v2di) datasliceleft,  (v2di) vmaskslice);
-
-		// The actual SIMD operation. This should always be the lshift or rshift
-		// operation for unsigned integer.
-		datasliceleft = %(vopinstr)s(datasliceleft, (int) param);
-
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft %(copname)s datasliceright;
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data3[index], (v16qi) datasliceleft);
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -577,31 +546,11 @@ void %(funclabel)s_2_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1
 	}
 
 }
-#endif
-
-
-"""
 
 
-# ==============================================================================
-
-
-
-# ==============================================================================
 
-# The actual compare operations using SIMD operations.
-ops_simdsupport_arm = """
-/*--------------------------------------------------------------------------- */
-/* The following series of functions reflect the different parameter options possible.
-   arraylen = The length of the data arrays.
-   data1 = The first data array.
-   data2 = The second data array.
-   data3 = The third data array.
-   param = The parameter to be applied to each array element.
-*/
-// param_arr_num_none
-#if defined(%(SIMD_platform)s)
-void %(funclabel)s_1_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+// param_num_arr_none
+AF_TARGET_AVX2 void %(funclabel)s_3_avx2_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
 
 	// array index counter. 
 	Py_ssize_t index; 
@@ -610,40 +559,40 @@ void %(funclabel)s_1_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1
 	Py_ssize_t alignedlength;
 	unsigned int y;
 
-	%(vsimdattr)s datasliceleft, datasliceright;
-	unsigned char compvals[CHARSIMDSIZE];
+	v32qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
 		compvals[y] = param;
 	}
-	datasliceright = %(vloadop)s(compvals);
+	datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
 		// Load the data into the vector register.
-		datasliceleft = %(vloadop)s(&data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
 		// The actual SIMD operation. 
-		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		datasliceright = datasliceleft %(copname)s datasliceright;
 		// Store the result.
-		%(vstoreop)s(&data1[index], datasliceleft);
+		_mm256_storeu_si256((__m256i *) &data2[index], (__m256i) datasliceright);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
 	for (index = alignedlength; index < arraylen; index++) {
-		data1[index] = data1[index] %(copname)s param;
+		data2[index] = param %(copname)s data2[index];
 	}
 
 }
 
 
 
-// param_arr_num_arr
-void %(funclabel)s_2_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+// param_num_arr_arr
+AF_TARGET_AVX2 void %(funclabel)s_4_avx2_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
 
 	// array index counter. 
 	Py_ssize_t index; 
@@ -652,328 +601,1907 @@ void %(funclabel)s_2_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1
 	Py_ssize_t alignedlength;
 	unsigned int y;
 
-	%(vsimdattr)s datasliceleft, datasliceright;
-	unsigned char compvals[CHARSIMDSIZE];
+	v32qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
 		compvals[y] = param;
 	}
-	datasliceright = %(vloadop)s(compvals);
+	datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
 		// Load the data into the vector register.
-		datasliceleft = %(vloadop)s(&data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
 		// The actual SIMD operation. 
-		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		datasliceright = datasliceleft %(copname)s datasliceright;
 		// Store the result.
-		%(vstoreop)s(&data3[index], datasliceleft);
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) datasliceright);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
 	for (index = alignedlength; index < arraylen; index++) {
-		data3[index] = data1[index] %(copname)s param;
+		data3[index] = param %(copname)s data2[index];
 	}
 
 }
 
 
 
-// param_num_arr_none
-void %(funclabel)s_3_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+// param_arr_arr_none
+AF_TARGET_AVX2 void %(funclabel)s_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
-	unsigned int y;
 
-	%(vsimdattr)s datasliceleft, datasliceright;
-	unsigned char compvals[CHARSIMDSIZE];
-
-	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
-		compvals[y] = param;
-	}
-	datasliceleft = %(vloadop)s(compvals);
+	v32qi datasliceleft, datasliceright;
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
 		// Load the data into the vector register.
-		datasliceright = %(vloadop)s(&data2[index]);
-		// The actual SIMD operation. The compiler generates the correct instruction.
-		datasliceright = %(vopinstr)s(datasliceleft, datasliceright);
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft %(copname)s datasliceright;
 		// Store the result.
-		%(vstoreop)s(&data2[index], datasliceright);
+		_mm256_storeu_si256((__m256i *) &data1[index], (__m256i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
 	for (index = alignedlength; index < arraylen; index++) {
-		data2[index] = param %(copname)s data2[index];
+		data1[index] = data1[index] %(copname)s data2[index];
 	}
 
 }
 
 
 
-// param_num_arr_arr
-void %(funclabel)s_4_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+// param_arr_arr_arr
+AF_TARGET_AVX2 void %(funclabel)s_6_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
-	unsigned int y;
-
-	%(vsimdattr)s datasliceleft, datasliceright;
-	unsigned char compvals[CHARSIMDSIZE];
 
-	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
-		compvals[y] = param;
-	}
-	datasliceleft = %(vloadop)s(compvals);
+	v32qi datasliceleft, datasliceright;
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
 		// Load the data into the vector register.
-		datasliceright = %(vloadop)s(&data2[index]);
-		// The actual SIMD operation. The compiler generates the correct instruction.
-		datasliceright = %(vopinstr)s(datasliceleft, datasliceright);
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft %(copname)s datasliceright;
 		// Store the result.
-		%(vstoreop)s(&data3[index], datasliceright);
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
 	for (index = alignedlength; index < arraylen; index++) {
-		data3[index] = param %(copname)s data2[index];
+		data3[index] = data1[index] %(copname)s data2[index];
 	}
 
 }
+#endif
 
+"""
+# ==============================================================================
 
-
-// param_arr_arr_none
-void %(funclabel)s_5_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+# The same operations using x86 AVX-512BW 512 bit SIMD operations. The left 
+# over elements at the end of the array are handled using masked loads and 
+# stores instead of a non-SIMD loop.
+ops_simdsupport_avx512 = """
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX-512BW SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void %(funclabel)s_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	unsigned int y;
 
-	%(vsimdattr)s datasliceleft, datasliceright;
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
 		// Load the data into the vector register.
-		datasliceleft = %(vloadop)s(&data1[index]);
-		datasliceright = %(vloadop)s(&data2[index]);
-		// The actual SIMD operation. The compiler generates the correct instruction.
-		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft %(copname)s datasliceright;
 		// Store the result.
-		%(vstoreop)s(&data1[index], datasliceleft);
+		_mm512_storeu_si512(&data1[index], (__m512i) datasliceleft);
 	}
 
-	// Get the max value within the left over elements at the end of the array.
-	for (index = alignedlength; index < arraylen; index++) {
-		data1[index] = data1[index] %(copname)s data2[index];
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceleft = datasliceleft %(copname)s datasliceright;
+		_mm512_mask_storeu_epi8(&data1[alignedlength], tailmask, (__m512i) datasliceleft);
 	}
 
 }
 
 
 
-// param_arr_arr_arr
-void %(funclabel)s_6_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+// param_arr_num_arr
+AF_TARGET_AVX512BW void %(funclabel)s_2_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	unsigned int y;
 
-	%(vsimdattr)s datasliceleft, datasliceright;
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
 		// Load the data into the vector register.
-		datasliceleft = %(vloadop)s(&data1[index]);
-		datasliceright = %(vloadop)s(&data2[index]);
-		// The actual SIMD operation. The compiler generates the correct instruction.
-		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft %(copname)s datasliceright;
 		// Store the result.
-		%(vstoreop)s(&data3[index], datasliceleft);
+		_mm512_storeu_si512(&data3[index], (__m512i) datasliceleft);
 	}
 
-	// Get the max value within the left over elements at the end of the array.
-	for (index = alignedlength; index < arraylen; index++) {
-		data3[index] = data1[index] %(copname)s data2[index];
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceleft = datasliceleft %(copname)s datasliceright;
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, (__m512i) datasliceleft);
 	}
 
 }
-#endif
 
-"""
 
-# ==============================================================================
 
-# The actual compare operations using SIMD operations. Shift operations have
-# more limited support in terms of the forms of the equations.
-ops_simdsupport_shift_arm = """
-/*--------------------------------------------------------------------------- */
-/* The following series of functions reflect the different parameter options possible.
-   arraylen = The length of the data arrays.
-   data1 = The first data array.
-   data2 = The second data array.
-   data3 = The third data array.
-   param = The parameter to be applied to each array element.
-*/
-// param_arr_num_none
-#if defined(%(SIMD_platform)s)
-void %(funclabel)s_1_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+// param_num_arr_none
+AF_TARGET_AVX512BW void %(funclabel)s_3_avx512_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
 	unsigned int y;
 
-	%(vsimdattr)s datasliceleft;
-	%(vsimdattr2)s datasliceright;
-	signed char compvals[CHARSIMDSIZE];
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
-		compvals[y] = %(vshift_sign)s(signed char)param;
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
 	}
-	datasliceright = %(vloadop2)s(compvals);
-
+	datasliceleft = (v64qi) _mm512_loadu_si512(compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
 		// Load the data into the vector register.
-		datasliceleft = %(vloadop)s(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
 		// The actual SIMD operation. 
-		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		datasliceright = datasliceleft %(copname)s datasliceright;
 		// Store the result.
-		%(vstoreop)s(&data1[index], datasliceleft);
+		_mm512_storeu_si512(&data2[index], (__m512i) datasliceright);
 	}
 
-	// Get the max value within the left over elements at the end of the array.
-	for (index = alignedlength; index < arraylen; index++) {
-		data1[index] = data1[index] %(copname)s param;
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		datasliceright = datasliceleft %(copname)s datasliceright;
+		_mm512_mask_storeu_epi8(&data2[alignedlength], tailmask, (__m512i) datasliceright);
 	}
 
 }
 
 
 
-// param_arr_num_arr
-void %(funclabel)s_2_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+// param_num_arr_arr
+AF_TARGET_AVX512BW void %(funclabel)s_4_avx512_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
 	unsigned int y;
 
-	%(vsimdattr)s datasliceleft;
-	%(vsimdattr2)s datasliceright;
-	signed char compvals[CHARSIMDSIZE];
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
-		compvals[y] = %(vshift_sign)s(signed char)param;
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
 	}
-	datasliceright = %(vloadop2)s(compvals);
+	datasliceleft = (v64qi) _mm512_loadu_si512(compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
 		// Load the data into the vector register.
-		datasliceleft = %(vloadop)s(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
 		// The actual SIMD operation. 
-		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		datasliceright = datasliceleft %(copname)s datasliceright;
 		// Store the result.
-		%(vstoreop)s(&data3[index], datasliceleft);
+		_mm512_storeu_si512(&data3[index], (__m512i) datasliceright);
 	}
 
-	// Get the max value within the left over elements at the end of the array.
-	for (index = alignedlength; index < arraylen; index++) {
-		data3[index] = data1[index] %(copname)s param;
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		datasliceright = datasliceleft %(copname)s datasliceright;
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, (__m512i) datasliceright);
 	}
 
 }
-#endif
 
-"""
 
-# ==============================================================================
 
-# ==============================================================================
+// param_arr_arr_none
+AF_TARGET_AVX512BW void %(funclabel)s_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
 
-# Functions to select the SIMD or non-SIMD version of the function.
-binops_select = """
-/*--------------------------------------------------------------------------- */
-/* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
-   arraylen = The length of the data arrays.
-   data1 = The first data array.
-   data2 = The second data array.
-   data3 = The third data array.
-   param = The parameter to be applied to each array element.
-   nosimd = If true, disable SIMD acceleration.
-*/
-// param_arr_num_none
-void %(funclabel)s_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) {
+	// array index counter. 
+	Py_ssize_t index; 
 
-	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
-	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			%(funclabel)s_1_x86_simd(arraylen, data1, param);
-		#endif
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft %(copname)s datasliceright;
+		// Store the result.
+		_mm512_storeu_si512(&data1[index], (__m512i) datasliceleft);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		datasliceleft = datasliceleft %(copname)s datasliceright;
+		_mm512_mask_storeu_epi8(&data1[alignedlength], tailmask, (__m512i) datasliceleft);
+	}
+
+}
+
+
+
+// param_arr_arr_arr
+AF_TARGET_AVX512BW void %(funclabel)s_6_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft %(copname)s datasliceright;
+		// Store the result.
+		_mm512_storeu_si512(&data3[index], (__m512i) datasliceleft);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		datasliceleft = datasliceleft %(copname)s datasliceright;
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, (__m512i) datasliceleft);
+	}
+
+}
+#endif
+
+"""
+# ==============================================================================
+
+
+# The actual shift operations using SIMD operations.
+# This is a special version for x86-64 lshift and rshift only, for a sequence
+# shifted by a single count. x86 does not have SIMD shift operations for 
+# bytes. The bytes are shifted in 16 bit lanes, and a byte mask then clears
+# the bits which were shifted in from the adjoining byte. The mask is 
+# calculated from the shift count, and is zero for counts of 8 or more.
+ops_simdsupport_shift_mask_x86 = """
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(AF_HASSIMD_X86)
+void %(funclabel)s_1_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m128i dataslice, vmaskslice, vcountslice;
+
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm_set1_epi8((char) %(funclabel)s_byte(0xff, param));
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		dataslice = _mm_loadu_si128((__m128i *) &data1[index]);
+
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm_and_si128(%(vopinstr)s(dataslice, vcountslice), vmaskslice);
+
+		// Store the result.
+		_mm_storeu_si128((__m128i *) &data1[index], dataslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = %(funclabel)s_byte(data1[index], param);
+	}
+
+}
+
+
+
+// param_arr_num_arr
+void %(funclabel)s_2_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m128i dataslice, vmaskslice, vcountslice;
+
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm_set1_epi8((char) %(funclabel)s_byte(0xff, param));
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		dataslice = _mm_loadu_si128((__m128i *) &data1[index]);
+
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm_and_si128(%(vopinstr)s(dataslice, vcountslice), vmaskslice);
+
+		// Store the result.
+		_mm_storeu_si128((__m128i *) &data3[index], dataslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = %(funclabel)s_byte(data1[index], param);
+	}
+
+}
+#endif
+
+
+"""
+
+# ==============================================================================
+
+# The x86 AVX2 256 bit version of the shift operations. See the notes for
+# the x86 version above.
+ops_simdsupport_shift_mask_avx2 = """
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX2 SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void %(funclabel)s_1_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m256i dataslice, vmaskslice;
+	__m128i vcountslice;
+
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm256_set1_epi8((char) %(funclabel)s_byte(0xff, param));
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data into the vector register.
+		dataslice = _mm256_loadu_si256((__m256i *) &data1[index]);
+
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm256_and_si256(%(vopinstr)s(dataslice, vcountslice), vmaskslice);
+
+		// Store the result.
+		_mm256_storeu_si256((__m256i *) &data1[index], dataslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = %(funclabel)s_byte(data1[index], param);
+	}
+
+}
+
+
+
+// param_arr_num_arr
+AF_TARGET_AVX2 void %(funclabel)s_2_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m256i dataslice, vmaskslice;
+	__m128i vcountslice;
+
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm256_set1_epi8((char) %(funclabel)s_byte(0xff, param));
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data into the vector register.
+		dataslice = _mm256_loadu_si256((__m256i *) &data1[index]);
+
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm256_and_si256(%(vopinstr)s(dataslice, vcountslice), vmaskslice);
+
+		// Store the result.
+		_mm256_storeu_si256((__m256i *) &data3[index], dataslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = %(funclabel)s_byte(data1[index], param);
+	}
+
+}
+#endif
+
+
+"""
+
+
+# ==============================================================================
+
+# The x86 AVX-512BW 512 bit version of the shift operations. See the notes 
+# for the x86 version above.
+ops_simdsupport_shift_mask_avx512 = """
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX-512BW SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void %(funclabel)s_1_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	__m512i dataslice, vmaskslice;
+	__m128i vcountslice;
+
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm512_set1_epi8((char) %(funclabel)s_byte(0xff, param));
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		dataslice = _mm512_loadu_si512(&data1[index]);
+
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm512_and_si512(%(vopinstr)s(dataslice, vcountslice), vmaskslice);
+
+		// Store the result.
+		_mm512_storeu_si512(&data1[index], dataslice);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		dataslice = _mm512_and_si512(%(vopinstr)s(dataslice, vcountslice), vmaskslice);
+		_mm512_mask_storeu_epi8(&data1[alignedlength], tailmask, dataslice);
+	}
+
+}
+
+
+
+// param_arr_num_arr
+AF_TARGET_AVX512BW void %(funclabel)s_2_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	__m512i dataslice, vmaskslice;
+	__m128i vcountslice;
+
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm512_set1_epi8((char) %(funclabel)s_byte(0xff, param));
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		dataslice = _mm512_loadu_si512(&data1[index]);
+
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm512_and_si512(%(vopinstr)s(dataslice, vcountslice), vmaskslice);
+
+		// Store the result.
+		_mm512_storeu_si512(&data3[index], dataslice);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		dataslice = _mm512_and_si512(%(vopinstr)s(dataslice, vcountslice), vmaskslice);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, dataslice);
+	}
+
+}
+#endif
+
+
+"""
+# ==============================================================================
+
+
+
+# ==============================================================================
+
+# The actual compare operations using SIMD operations.
+ops_simdsupport_arm = """
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(%(SIMD_platform)s)
+void %(funclabel)s_1_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	%(vsimdattr)s datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = %(vloadop)s(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceleft = %(vloadop)s(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		// Store the result.
+		%(vstoreop)s(&data1[index], datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = data1[index] %(copname)s param;
+	}
+
+}
+
+
+
+// param_arr_num_arr
+void %(funclabel)s_2_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	%(vsimdattr)s datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = %(vloadop)s(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceleft = %(vloadop)s(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		// Store the result.
+		%(vstoreop)s(&data3[index], datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = data1[index] %(copname)s param;
+	}
+
+}
+
+
+
+// param_num_arr_none
+void %(funclabel)s_3_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	%(vsimdattr)s datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param;
+	}
+	datasliceleft = %(vloadop)s(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceright = %(vloadop)s(&data2[index]);
+		// The actual SIMD operation. The compiler generates the correct instruction.
+		datasliceright = %(vopinstr)s(datasliceleft, datasliceright);
+		// Store the result.
+		%(vstoreop)s(&data2[index], datasliceright);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data2[index] = param %(copname)s data2[index];
+	}
+
+}
+
+
+
+// param_num_arr_arr
+void %(funclabel)s_4_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	%(vsimdattr)s datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param;
+	}
+	datasliceleft = %(vloadop)s(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceright = %(vloadop)s(&data2[index]);
+		// The actual SIMD operation. The compiler generates the correct instruction.
+		datasliceright = %(vopinstr)s(datasliceleft, datasliceright);
+		// Store the result.
+		%(vstoreop)s(&data3[index], datasliceright);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = param %(copname)s data2[index];
+	}
+
+}
+
+
+
+// param_arr_arr_none
+void %(funclabel)s_5_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	%(vsimdattr)s datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceleft = %(vloadop)s(&data1[index]);
+		datasliceright = %(vloadop)s(&data2[index]);
+		// The actual SIMD operation. The compiler generates the correct instruction.
+		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		// Store the result.
+		%(vstoreop)s(&data1[index], datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = data1[index] %(copname)s data2[index];
+	}
+
+}
+
+
+
+// param_arr_arr_arr
+void %(funclabel)s_6_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	%(vsimdattr)s datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceleft = %(vloadop)s(&data1[index]);
+		datasliceright = %(vloadop)s(&data2[index]);
+		// The actual SIMD operation. The compiler generates the correct instruction.
+		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		// Store the result.
+		%(vstoreop)s(&data3[index], datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = data1[index] %(copname)s data2[index];
+	}
+
+}
+#endif
+
+"""
+
+# ==============================================================================
+
+# The actual compare operations using SIMD operations. Shift operations have
+# more limited support in terms of the forms of the equations.
+ops_simdsupport_shift_arm = """
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(%(SIMD_platform)s)
+void %(funclabel)s_1_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	%(vsimdattr)s datasliceleft;
+	%(vsimdattr2)s datasliceright;
+	signed char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = %(vshift_sign)s(signed char)((param > 8) ? 8 : param);
+	}
+	datasliceright = %(vloadop2)s(compvals);
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceleft = %(vloadop)s(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		// Store the result.
+		%(vstoreop)s(&data1[index], datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = %(funclabel)s_byte(data1[index], param);
+	}
+
+}
+
+
+
+// param_arr_num_arr
+void %(funclabel)s_2_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	%(vsimdattr)s datasliceleft;
+	%(vsimdattr2)s datasliceright;
+	signed char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = %(vshift_sign)s(signed char)((param > 8) ? 8 : param);
+	}
+	datasliceright = %(vloadop2)s(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceleft = %(vloadop)s(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = %(vopinstr)s(datasliceleft, datasliceright);
+		// Store the result.
+		%(vstoreop)s(&data3[index], datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = %(funclabel)s_byte(data1[index], param);
+	}
+
+}
+#endif
+
+"""
+
+# ==============================================================================
+
+# ==============================================================================
+
+# ==============================================================================
+
+# The x86 versions of lshift and rshift where the shift count is taken from
+# a sequence. There are no byte shift instructions, so the bytes are shifted
+# in 16 bit lanes and the bits which cross into the adjoining byte are masked
+# off. Each bit of the count then selects a shift of 4, 2, or 1 positions.
+ops_simdsupport_shift_var_x86 = """
+/*--------------------------------------------------------------------------- */
+/* Shift each byte by the count in the corresponding byte of the second 
+   vector. Counts of 8 or more shift out every bit.
+   dataslice = The values to shift.
+   countslice = The shift counts.
+   Returns: The shifted values.
+*/
+#if defined(AF_HASSIMD_X86)
+static inline __m128i %(funclabel)s_var_%(funcplat)s(__m128i dataslice, __m128i countslice) {
+
+	__m128i shiftslice, selectslice;
+
+	// Counts of 8 or more clear every bit.
+	selectslice = _mm_cmpeq_epi8(_mm_min_epu8(countslice, _mm_set1_epi8(7)), countslice);
+	dataslice = _mm_and_si128(dataslice, selectslice);
+
+	// Shift by 4 where bit 2 of the count is set.
+	selectslice = _mm_cmpeq_epi8(_mm_and_si128(countslice, _mm_set1_epi8(4)), _mm_set1_epi8(4));
+	shiftslice = _mm_and_si128(%(vshift16)s(dataslice, 4), _mm_set1_epi8((char) %(vbytemask4)s));
+	dataslice = _mm_or_si128(_mm_and_si128(selectslice, shiftslice), _mm_andnot_si128(selectslice, dataslice));
+
+	// Shift by 2 where bit 1 of the count is set.
+	selectslice = _mm_cmpeq_epi8(_mm_and_si128(countslice, _mm_set1_epi8(2)), _mm_set1_epi8(2));
+	shiftslice = _mm_and_si128(%(vshift16)s(dataslice, 2), _mm_set1_epi8((char) %(vbytemask2)s));
+	dataslice = _mm_or_si128(_mm_and_si128(selectslice, shiftslice), _mm_andnot_si128(selectslice, dataslice));
+
+	// Shift by 1 where bit 0 of the count is set.
+	selectslice = _mm_cmpeq_epi8(_mm_and_si128(countslice, _mm_set1_epi8(1)), _mm_set1_epi8(1));
+	shiftslice = _mm_and_si128(%(vshift16)s(dataslice, 1), _mm_set1_epi8((char) %(vbytemask1)s));
+	dataslice = _mm_or_si128(_mm_and_si128(selectslice, shiftslice), _mm_andnot_si128(selectslice, dataslice));
+
+	return dataslice;
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_num_arr_none
+void %(funclabel)s_3_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m128i paramslice, countslice;
+
+	// Initialise the parameter values.
+	paramslice = _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the shift counts into the vector register.
+		countslice = _mm_loadu_si128((__m128i *) &data2[index]);
+		// Shift and store the result.
+		_mm_storeu_si128((__m128i *) &data2[index], %(funclabel)s_var_%(funcplat)s(paramslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data2[index] = %(funclabel)s_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_num_arr_arr
+void %(funclabel)s_4_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m128i paramslice, countslice;
+
+	// Initialise the parameter values.
+	paramslice = _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the shift counts into the vector register.
+		countslice = _mm_loadu_si128((__m128i *) &data2[index]);
+		// Shift and store the result.
+		_mm_storeu_si128((__m128i *) &data3[index], %(funclabel)s_var_%(funcplat)s(paramslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = %(funclabel)s_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_none
+void %(funclabel)s_5_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m128i dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm_loadu_si128((__m128i *) &data1[index]);
+		countslice = _mm_loadu_si128((__m128i *) &data2[index]);
+		// Shift and store the result.
+		_mm_storeu_si128((__m128i *) &data1[index], %(funclabel)s_var_%(funcplat)s(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = %(funclabel)s_byte(data1[index], data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_arr
+void %(funclabel)s_6_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m128i dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm_loadu_si128((__m128i *) &data1[index]);
+		countslice = _mm_loadu_si128((__m128i *) &data2[index]);
+		// Shift and store the result.
+		_mm_storeu_si128((__m128i *) &data3[index], %(funclabel)s_var_%(funcplat)s(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = %(funclabel)s_byte(data1[index], data2[index]);
+	}
+
+}
+#endif
+
+
+"""
+
+# ==============================================================================
+
+# The x86 AVX2 256 bit version of the shift operations where the shift count
+# is taken from a sequence. See the notes for the x86 version above. Where
+# a single value is shifted by each count, there are only 8 possible results,
+# so these are looked up in a table using a byte shuffle.
+ops_simdsupport_shift_var_avx2 = """
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX2 SIMD.
+   Shift each byte by the count in the corresponding byte of the second 
+   vector. Counts of 8 or more shift out every bit.
+   dataslice = The values to shift.
+   countslice = The shift counts.
+   Returns: The shifted values.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static inline __m256i %(funclabel)s_var_%(funcplat)s(__m256i dataslice, __m256i countslice) {
+
+	__m256i shiftslice, selectslice;
+
+	// Counts of 8 or more clear every bit.
+	selectslice = _mm256_cmpeq_epi8(_mm256_min_epu8(countslice, _mm256_set1_epi8(7)), countslice);
+	dataslice = _mm256_and_si256(dataslice, selectslice);
+
+	// Blend selects using the top bit of each byte. Move bit 2 of each 
+	// count there and shift by 4 where it is set.
+	selectslice = _mm256_slli_epi16(countslice, 5);
+	shiftslice = _mm256_and_si256(%(vshift16)s(dataslice, 4), _mm256_set1_epi8((char) %(vbytemask4)s));
+	dataslice = _mm256_blendv_epi8(dataslice, shiftslice, selectslice);
+
+	// Shift by 2 where bit 1 of the count is set.
+	selectslice = _mm256_add_epi8(selectslice, selectslice);
+	shiftslice = _mm256_and_si256(%(vshift16)s(dataslice, 2), _mm256_set1_epi8((char) %(vbytemask2)s));
+	dataslice = _mm256_blendv_epi8(dataslice, shiftslice, selectslice);
+
+	// Shift by 1 where bit 0 of the count is set.
+	selectslice = _mm256_add_epi8(selectslice, selectslice);
+	shiftslice = _mm256_and_si256(%(vshift16)s(dataslice, 1), _mm256_set1_epi8((char) %(vbytemask1)s));
+	dataslice = _mm256_blendv_epi8(dataslice, shiftslice, selectslice);
+
+	return dataslice;
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX2 SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_num_arr_none
+AF_TARGET_AVX2 void %(funclabel)s_3_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+	__m256i tableslice, countslice, maxcountslice;
+
+	// The result for each shift count. The byte shuffle uses the lower 4
+	// bits of the count, and looks up each 128 bit half separately.
+	unsigned char shifttable[CHARSIMDSIZE_AVX2];
+
+	// Initialise the table.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		shifttable[y] = %(funclabel)s_byte(param, y %% 16);
+	}
+	tableslice = _mm256_loadu_si256((__m256i *) shifttable);
+	maxcountslice = _mm256_set1_epi8(15);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the shift counts. Counts above 15 use the last table entry.
+		countslice = _mm256_loadu_si256((__m256i *) &data2[index]);
+		countslice = _mm256_min_epu8(countslice, maxcountslice);
+		// Look up and store the result.
+		_mm256_storeu_si256((__m256i *) &data2[index], _mm256_shuffle_epi8(tableslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data2[index] = %(funclabel)s_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_num_arr_arr
+AF_TARGET_AVX2 void %(funclabel)s_4_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+	__m256i tableslice, countslice, maxcountslice;
+
+	// The result for each shift count. The byte shuffle uses the lower 4
+	// bits of the count, and looks up each 128 bit half separately.
+	unsigned char shifttable[CHARSIMDSIZE_AVX2];
+
+	// Initialise the table.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		shifttable[y] = %(funclabel)s_byte(param, y %% 16);
+	}
+	tableslice = _mm256_loadu_si256((__m256i *) shifttable);
+	maxcountslice = _mm256_set1_epi8(15);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the shift counts. Counts above 15 use the last table entry.
+		countslice = _mm256_loadu_si256((__m256i *) &data2[index]);
+		countslice = _mm256_min_epu8(countslice, maxcountslice);
+		// Look up and store the result.
+		_mm256_storeu_si256((__m256i *) &data3[index], _mm256_shuffle_epi8(tableslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = %(funclabel)s_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_none
+AF_TARGET_AVX2 void %(funclabel)s_5_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m256i dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm256_loadu_si256((__m256i *) &data1[index]);
+		countslice = _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Shift and store the result.
+		_mm256_storeu_si256((__m256i *) &data1[index], %(funclabel)s_var_%(funcplat)s(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = %(funclabel)s_byte(data1[index], data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_arr
+AF_TARGET_AVX2 void %(funclabel)s_6_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m256i dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm256_loadu_si256((__m256i *) &data1[index]);
+		countslice = _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Shift and store the result.
+		_mm256_storeu_si256((__m256i *) &data3[index], %(funclabel)s_var_%(funcplat)s(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = %(funclabel)s_byte(data1[index], data2[index]);
+	}
+
+}
+#endif
+
+
+"""
+
+# ==============================================================================
+
+# The x86 AVX-512BW 512 bit version of the shift operations where the shift 
+# count is taken from a sequence. See the notes for the AVX2 version above.
+ops_simdsupport_shift_var_avx512 = """
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX-512BW SIMD.
+   Shift each byte by the count in the corresponding byte of the second 
+   vector. Counts of 8 or more shift out every bit.
+   dataslice = The values to shift.
+   countslice = The shift counts.
+   Returns: The shifted values.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW static inline __m512i %(funclabel)s_var_%(funcplat)s(__m512i dataslice, __m512i countslice) {
+
+	__m512i shiftslice;
+
+	// Counts of 8 or more clear every bit.
+	dataslice = _mm512_maskz_mov_epi8(_mm512_cmple_epu8_mask(countslice, _mm512_set1_epi8(7)), dataslice);
+
+	// Shift by 4 where bit 2 of the count is set.
+	shiftslice = _mm512_and_si512(%(vshift16)s(dataslice, 4), _mm512_set1_epi8((char) %(vbytemask4)s));
+	dataslice = _mm512_mask_mov_epi8(dataslice, _mm512_test_epi8_mask(countslice, _mm512_set1_epi8(4)), shiftslice);
+
+	// Shift by 2 where bit 1 of the count is set.
+	shiftslice = _mm512_and_si512(%(vshift16)s(dataslice, 2), _mm512_set1_epi8((char) %(vbytemask2)s));
+	dataslice = _mm512_mask_mov_epi8(dataslice, _mm512_test_epi8_mask(countslice, _mm512_set1_epi8(2)), shiftslice);
+
+	// Shift by 1 where bit 0 of the count is set.
+	shiftslice = _mm512_and_si512(%(vshift16)s(dataslice, 1), _mm512_set1_epi8((char) %(vbytemask1)s));
+	dataslice = _mm512_mask_mov_epi8(dataslice, _mm512_test_epi8_mask(countslice, _mm512_set1_epi8(1)), shiftslice);
+
+	return dataslice;
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX-512BW SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_num_arr_none
+AF_TARGET_AVX512BW void %(funclabel)s_3_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	unsigned int y;
+	__m512i tableslice, countslice, maxcountslice;
+
+	// The result for each shift count. The byte shuffle uses the lower 4
+	// bits of the count, and looks up each 128 bit part separately.
+	unsigned char shifttable[CHARSIMDSIZE_AVX512];
+
+	// Initialise the table.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		shifttable[y] = %(funclabel)s_byte(param, y %% 16);
+	}
+	tableslice = _mm512_loadu_si512(shifttable);
+	maxcountslice = _mm512_set1_epi8(15);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the shift counts. Counts above 15 use the last table entry.
+		countslice = _mm512_min_epu8(_mm512_loadu_si512(&data2[index]), maxcountslice);
+		// Look up and store the result.
+		_mm512_storeu_si512(&data2[index], _mm512_shuffle_epi8(tableslice, countslice));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		countslice = _mm512_min_epu8(_mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]), maxcountslice);
+		_mm512_mask_storeu_epi8(&data2[alignedlength], tailmask, _mm512_shuffle_epi8(tableslice, countslice));
+	}
+
+}
+
+
+// param_num_arr_arr
+AF_TARGET_AVX512BW void %(funclabel)s_4_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	unsigned int y;
+	__m512i tableslice, countslice, maxcountslice;
+
+	// The result for each shift count. The byte shuffle uses the lower 4
+	// bits of the count, and looks up each 128 bit part separately.
+	unsigned char shifttable[CHARSIMDSIZE_AVX512];
+
+	// Initialise the table.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		shifttable[y] = %(funclabel)s_byte(param, y %% 16);
+	}
+	tableslice = _mm512_loadu_si512(shifttable);
+	maxcountslice = _mm512_set1_epi8(15);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the shift counts. Counts above 15 use the last table entry.
+		countslice = _mm512_min_epu8(_mm512_loadu_si512(&data2[index]), maxcountslice);
+		// Look up and store the result.
+		_mm512_storeu_si512(&data3[index], _mm512_shuffle_epi8(tableslice, countslice));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		countslice = _mm512_min_epu8(_mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]), maxcountslice);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_shuffle_epi8(tableslice, countslice));
+	}
+
+}
+
+
+// param_arr_arr_none
+AF_TARGET_AVX512BW void %(funclabel)s_5_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	__m512i dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm512_loadu_si512(&data1[index]);
+		countslice = _mm512_loadu_si512(&data2[index]);
+		// Shift and store the result.
+		_mm512_storeu_si512(&data1[index], %(funclabel)s_var_%(funcplat)s(dataslice, countslice));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		countslice = _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		_mm512_mask_storeu_epi8(&data1[alignedlength], tailmask, %(funclabel)s_var_%(funcplat)s(dataslice, countslice));
+	}
+
+}
+
+
+// param_arr_arr_arr
+AF_TARGET_AVX512BW void %(funclabel)s_6_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	__m512i dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm512_loadu_si512(&data1[index]);
+		countslice = _mm512_loadu_si512(&data2[index]);
+		// Shift and store the result.
+		_mm512_storeu_si512(&data3[index], %(funclabel)s_var_%(funcplat)s(dataslice, countslice));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		countslice = _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, %(funclabel)s_var_%(funcplat)s(dataslice, countslice));
+	}
+
+}
+#endif
+
+
+"""
+
+# ==============================================================================
+
+# The ARM versions of lshift and rshift where the shift count is taken from
+# a sequence. The NEON shift instruction accepts a different count for each 
+# element, with negative counts shifting right.
+ops_simdsupport_shift_var_arm = """
+/*--------------------------------------------------------------------------- */
+/* Shift each byte by the count in the corresponding byte of the second 
+   vector. Counts of 8 or more shift out every bit. They are limited to 8, 
+   as counts of 128 or more would otherwise be taken as negative.
+   dataslice = The values to shift.
+   countslice = The shift counts.
+   Returns: The shifted values.
+*/
+#if defined(%(SIMD_platform)s)
+static inline %(vsimdattr)s %(funclabel)s_var_%(funcplat)s(%(vsimdattr)s dataslice, %(vsimdattr)s countslice) {
+
+	%(vsimdattr2)s shiftslice;
+
+	shiftslice = %(vnegop)s(%(vreinterpretop)s(%(vminop)s(countslice, %(vdupop)s(8))));
+
+	return %(vopinstr)s(dataslice, shiftslice);
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_num_arr_none
+void %(funclabel)s_3_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	%(vsimdattr)s paramslice, countslice;
+
+	// Initialise the parameter values.
+	paramslice = %(vdupop)s(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the shift counts into the vector register.
+		countslice = %(vloadop)s(&data2[index]);
+		// Shift and store the result.
+		%(vstoreop)s(&data2[index], %(funclabel)s_var_%(funcplat)s(paramslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data2[index] = %(funclabel)s_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_num_arr_arr
+void %(funclabel)s_4_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	%(vsimdattr)s paramslice, countslice;
+
+	// Initialise the parameter values.
+	paramslice = %(vdupop)s(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the shift counts into the vector register.
+		countslice = %(vloadop)s(&data2[index]);
+		// Shift and store the result.
+		%(vstoreop)s(&data3[index], %(funclabel)s_var_%(funcplat)s(paramslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = %(funclabel)s_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_none
+void %(funclabel)s_5_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	%(vsimdattr)s dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = %(vloadop)s(&data1[index]);
+		countslice = %(vloadop)s(&data2[index]);
+		// Shift and store the result.
+		%(vstoreop)s(&data1[index], %(funclabel)s_var_%(funcplat)s(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = %(funclabel)s_byte(data1[index], data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_arr
+void %(funclabel)s_6_%(funcplat)s_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	%(vsimdattr)s dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = %(vloadop)s(&data1[index]);
+		countslice = %(vloadop)s(&data2[index]);
+		// Shift and store the result.
+		%(vstoreop)s(&data3[index], %(funclabel)s_var_%(funcplat)s(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = %(funclabel)s_byte(data1[index], data2[index]);
+	}
+
+}
+#endif
+
+"""
+
+# ==============================================================================
+
+# Functions to select the SIMD or non-SIMD version of the function.
+binops_select = """
+/*--------------------------------------------------------------------------- */
+/* The SIMD functions to use. These are selected once when the module is 
+   initialised, according to the SIMD features supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	void (*param_arr_num_none)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param);
+	void (*param_arr_num_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*param_num_arr_none)(Py_ssize_t arraylen, unsigned char param, unsigned char *data2);
+	void (*param_num_arr_arr)(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3);
+	void (*param_arr_arr_none)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2);
+	void (*param_arr_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3);
+} %(funclabel)s_simdfuncs;
+
+
+/* Select the SIMD functions for this CPU.
+*/
+static void %(funclabel)s_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		%(funclabel)s_simdfuncs.param_arr_num_none = %(funclabel)s_1_avx512_simd;
+		%(funclabel)s_simdfuncs.param_arr_num_arr = %(funclabel)s_2_avx512_simd;
+		%(funclabel)s_simdfuncs.param_num_arr_none = %(funclabel)s_3_avx512_simd;
+		%(funclabel)s_simdfuncs.param_num_arr_arr = %(funclabel)s_4_avx512_simd;
+		%(funclabel)s_simdfuncs.param_arr_arr_none = %(funclabel)s_5_avx512_simd;
+		%(funclabel)s_simdfuncs.param_arr_arr_arr = %(funclabel)s_6_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		%(funclabel)s_simdfuncs.param_arr_num_none = %(funclabel)s_1_avx2_simd;
+		%(funclabel)s_simdfuncs.param_arr_num_arr = %(funclabel)s_2_avx2_simd;
+		%(funclabel)s_simdfuncs.param_num_arr_none = %(funclabel)s_3_avx2_simd;
+		%(funclabel)s_simdfuncs.param_num_arr_arr = %(funclabel)s_4_avx2_simd;
+		%(funclabel)s_simdfuncs.param_arr_arr_none = %(funclabel)s_5_avx2_simd;
+		%(funclabel)s_simdfuncs.param_arr_arr_arr = %(funclabel)s_6_avx2_simd;
+	} else {
+		%(funclabel)s_simdfuncs.param_arr_num_none = %(funclabel)s_1_x86_simd;
+		%(funclabel)s_simdfuncs.param_arr_num_arr = %(funclabel)s_2_x86_simd;
+		%(funclabel)s_simdfuncs.param_num_arr_none = %(funclabel)s_3_x86_simd;
+		%(funclabel)s_simdfuncs.param_num_arr_arr = %(funclabel)s_4_x86_simd;
+		%(funclabel)s_simdfuncs.param_arr_arr_none = %(funclabel)s_5_x86_simd;
+		%(funclabel)s_simdfuncs.param_arr_arr_arr = %(funclabel)s_6_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	%(funclabel)s_simdfuncs.param_arr_num_none = %(funclabel)s_1_armv7_simd;
+	%(funclabel)s_simdfuncs.param_arr_num_arr = %(funclabel)s_2_armv7_simd;
+	%(funclabel)s_simdfuncs.param_num_arr_none = %(funclabel)s_3_armv7_simd;
+	%(funclabel)s_simdfuncs.param_num_arr_arr = %(funclabel)s_4_armv7_simd;
+	%(funclabel)s_simdfuncs.param_arr_arr_none = %(funclabel)s_5_armv7_simd;
+	%(funclabel)s_simdfuncs.param_arr_arr_arr = %(funclabel)s_6_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_simdfuncs.param_arr_num_none = %(funclabel)s_1_armv8_simd;
+	%(funclabel)s_simdfuncs.param_arr_num_arr = %(funclabel)s_2_armv8_simd;
+	%(funclabel)s_simdfuncs.param_num_arr_none = %(funclabel)s_3_armv8_simd;
+	%(funclabel)s_simdfuncs.param_num_arr_arr = %(funclabel)s_4_armv8_simd;
+	%(funclabel)s_simdfuncs.param_arr_arr_none = %(funclabel)s_5_armv8_simd;
+	%(funclabel)s_simdfuncs.param_arr_arr_arr = %(funclabel)s_6_armv8_simd;
+	#endif
 
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			%(funclabel)s_1_armv7_simd(arraylen, data1, param);
-		#endif
+}
+#endif
 
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			%(funclabel)s_1_armv8_simd(arraylen, data1, param);
-		#endif
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD acceleration.
+*/
+// param_arr_num_none
+void %(funclabel)s_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) {
 
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		%(funclabel)s_simdfuncs.param_arr_num_none(arraylen, data1, param);
 	} else {
 	#endif
 		%(funclabel)s_1(arraylen, data1, param);
@@ -988,18 +2516,7 @@ void %(funclabel)s_2_select(Py_ssize_t arraylen, int nosimd, unsigned char *data
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			%(funclabel)s_2_x86_simd(arraylen, data1, param, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			%(funclabel)s_2_armv7_simd(arraylen, data1, param, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			%(funclabel)s_2_armv8_simd(arraylen, data1, param, data3);
-		#endif
-
+		%(funclabel)s_simdfuncs.param_arr_num_arr(arraylen, data1, param, data3);
 	} else {
 	#endif
 		%(funclabel)s_2(arraylen, data1, param, data3);
@@ -1014,18 +2531,7 @@ void %(funclabel)s_3_select(Py_ssize_t arraylen, int nosimd, unsigned char param
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			%(funclabel)s_3_x86_simd(arraylen, param, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			%(funclabel)s_3_armv7_simd(arraylen, param, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			%(funclabel)s_3_armv8_simd(arraylen, param, data2);
-		#endif
-
+		%(funclabel)s_simdfuncs.param_num_arr_none(arraylen, param, data2);
 	} else {
 	#endif
 		%(funclabel)s_3(arraylen, param, data2);
@@ -1040,18 +2546,7 @@ void %(funclabel)s_4_select(Py_ssize_t arraylen, int nosimd, unsigned char param
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			%(funclabel)s_4_x86_simd(arraylen, param, data2, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			%(funclabel)s_4_armv7_simd(arraylen, param, data2, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			%(funclabel)s_4_armv8_simd(arraylen, param, data2, data3);
-		#endif
-
+		%(funclabel)s_simdfuncs.param_num_arr_arr(arraylen, param, data2, data3);
 	} else {
 	#endif
 		%(funclabel)s_4(arraylen, param, data2, data3);
@@ -1066,18 +2561,7 @@ void %(funclabel)s_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			%(funclabel)s_5_x86_simd(arraylen, data1, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			%(funclabel)s_5_armv7_simd(arraylen, data1, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			%(funclabel)s_5_armv8_simd(arraylen, data1, data2);
-		#endif
-
+		%(funclabel)s_simdfuncs.param_arr_arr_none(arraylen, data1, data2);
 	} else {
 	#endif
 		%(funclabel)s_5(arraylen, data1, data2);
@@ -1092,18 +2576,7 @@ void %(funclabel)s_6_select(Py_ssize_t arraylen, int nosimd, unsigned char *data
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			%(funclabel)s_6_x86_simd(arraylen, data1, data2, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			%(funclabel)s_6_armv7_simd(arraylen, data1, data2, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			%(funclabel)s_6_armv8_simd(arraylen, data1, data2, data3);
-		#endif
-
+		%(funclabel)s_simdfuncs.param_arr_arr_arr(arraylen, data1, data2, data3);
 	} else {
 	#endif
 		%(funclabel)s_6(arraylen, data1, data2, data3);
@@ -1120,101 +2593,77 @@ void %(funclabel)s_6_select(Py_ssize_t arraylen, int nosimd, unsigned char *data
 
 # ==============================================================================
 
-# Functions to select the SIMD or non-SIMD version of the function.
-# This is for lshift and rshift only, as these only implement SIMD for some
-# parameter forms.
-binops_select_shift = """
+binops_params = """
 /*--------------------------------------------------------------------------- */
-/* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
-   arraylen = The length of the data arrays.
-   data1 = The first data array.
-   data2 = The second data array.
-   data3 = The third data array.
-   param = The parameter to be applied to each array element.
-   nosimd = If true, disable SIMD acceleration.
-*/
-// param_arr_num_none
-void %(funclabel)s_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) {
-
-	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
-	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
 
-		#if defined(AF_HASSIMD_X86)
-			%(funclabel)s_1_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			%(funclabel)s_1_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			%(funclabel)s_1_armv8_simd(arraylen, data1, param);
-		#endif
-		
-	} else {
-	#endif
-		%(funclabel)s_1(arraylen, data1, param);
-	#if  defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
-	}
-	#endif
-
-}
-
-// param_arr_num_arr
-void %(funclabel)s_2_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
-
-	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
-	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+/* Calculate one part of the sequences. If the calculation is not divided
+	between threads, then there is just one part covering the whole sequence.
+	ctx = The parsed parameters (struct args_params_2).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void %(funclabel)s_part(void *ctx, int part, int nparts) {
 
-		#if defined(AF_HASSIMD_X86)
-			%(funclabel)s_2_x86_simd(arraylen, data1, param, data3);
-		#endif
+	struct args_params_2 *bytesdata = (struct args_params_2 *) ctx;
 
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			%(funclabel)s_2_armv7_simd(arraylen, data1, param, data3);
-		#endif
+	// The range of this part of the sequences.
+	Py_ssize_t start, partlen;
 
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			%(funclabel)s_2_armv8_simd(arraylen, data1, param, data3);
-		#endif
+	partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
 
-	} else {
-	#endif
-		%(funclabel)s_2(arraylen, data1, param, data3);
-	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	// Select the correct implementation.
+	switch (bytesdata->paramcat) {
+		case param_arr_num_none : {
+			%(funclabel)s_1_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param);
+			break;
+		}
+		case param_arr_num_arr : {
+			%(funclabel)s_2_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_num_arr_none : {
+			%(funclabel)s_3_select(partlen, bytesdata->nosimd, bytesdata->param, bytesdata->bytes2.B + start);
+			break;
+		}
+		case param_num_arr_arr : {
+			%(funclabel)s_4_select(partlen, bytesdata->nosimd, bytesdata->param, bytesdata->bytes2.B + start, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_arr_arr_none : {
+			%(funclabel)s_5_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start);
+			break;
+		}
+		case param_arr_arr_arr : {
+			%(funclabel)s_6_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start, bytesdata->bytes3.B + start);
+			break;
+		}
+		// The other categories are only used by functions which take a mask.
+		default : {
+			break;
+		}
 	}
-	#endif
 
 }
 
-
-/*--------------------------------------------------------------------------- */
-
-"""
-
-
-# ==============================================================================
-
-
-# ==============================================================================
-
-binops_params = """
 /*--------------------------------------------------------------------------- */
 
 /* The wrapper to the underlying C function */
-static PyObject *py_%(funclabel)s(PyObject *self, PyObject *args, PyObject *keywds) {
+static PyObject *py_%(funclabel)s(PyObject *self, BF_ARGSDECL) {
 
 
 	// This is used to hold the parsed parameters.
 	struct args_params_2 bytesdata = ARGSINIT_TWO;
 
+	// The number of parts to divide the calculation into.
+	int nparts;
+
 
 	// -----------------------------------------------------
 
 
 	// Get the parameters passed from Python. 
-	bytesdata = getparams_two(self, args, keywds, "%(funclabel)s");
+	bytesdata = getparams_two(self, BF_ARGSPASS);
 
 	// If there was an error, we count on the parameter parsing function to 
 	// release the buffers if this was necessary.
@@ -1222,39 +2671,24 @@ static PyObject *py_%(funclabel)s(PyObject *self, PyObject *args, PyObject *keyw
 		return NULL;
 	}
 
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+
 	// Call the C function.
-	// Select the correct implementation.
-	switch (bytesdata.paramcat) {
-		case param_arr_num_none : {
-			%(funclabel)s_1_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
-		}
-		case param_arr_num_arr : {
-			%(funclabel)s_2_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param, bytesdata.bytes3.B);
-			break;
-		}
-		case param_num_arr_none : {
-			%(funclabel)s_3%(paramselect)s(bytesdata.arraylen,%(paramnosimd)s bytesdata.param, bytesdata.bytes2.B);
-			break;
-		}
-		case param_num_arr_arr : {
-			%(funclabel)s_4%(paramselect)s(bytesdata.arraylen,%(paramnosimd)s bytesdata.param, bytesdata.bytes2.B, bytesdata.bytes3.B);
-			break;
-		}
-		case param_arr_arr_none : {
-			%(funclabel)s_5%(paramselect)s(bytesdata.arraylen,%(paramnosimd)s bytesdata.bytes1.B, bytesdata.bytes2.B);
-			break;
-		}
-		case param_arr_arr_arr : {
-			%(funclabel)s_6%(paramselect)s(bytesdata.arraylen,%(paramnosimd)s bytesdata.bytes1.B, bytesdata.bytes2.B, bytesdata.bytes3.B);
-			break;
-		}
-	}
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	runparallel(%(funclabel)s_part, &bytesdata, nparts);
+	BF_END_ALLOW_THREADS
 
 	// Release the buffers. 
 	releasebuffers_two(bytesdata);
 
 
+	// Return the new output sequence if one was created.
+	if (bytesdata.outobj != NULL) {
+		return bytesdata.outobj;
+	}
+
 	// Everything was successful.
 	Py_RETURN_NONE;
 
@@ -1286,7 +2720,10 @@ Call formats: \\n\\
   %(funclabel)s(sequence1, sequence2) \\n\\
   %(funclabel)s(sequence1, sequence2, outpsequence) \\n\\
   %(funclabel)s(sequence1, param, maxlen=y) \\n\\
+  %(funclabel)s(sequence1, param, start=i, stop=j) \\n\\
   %(funclabel)s(sequence1, param, nosimd=False) \\n\\
+  %(funclabel)s(sequence1, param, threads=4) \\n\\
+  result = %(funclabel)s(sequence1, param, outtype=bytes) \\n\\
 \\n\\
 * sequence1 - The first input data bytes or bytearray sequence to be \\n\\
   examined. If no output sequence is provided the results will overwrite \\n\\
@@ -1299,8 +2736,122 @@ Call formats: \\n\\
   positive integer. If a zero or negative length, or a value which is \\n\\
   greater than the actual length of the sequence is specified, this \\n\\
   parameter is ignored. \\n\\
+* start, stop - Work on only part of the sequence, as if it had been \\n\\
+  sliced with sequence[start:stop]. The same part of every sequence is \\n\\
+  used. These are optional keyword parameters and are applied before \\n\\
+  maxlen. No data is copied. \\n\\
+* nosimd - If True, SIMD acceleration is disabled. This parameter is \\n\\
+  optional. The default is FALSE. \\n\\
+* threads - The number of threads to divide the calculation between. \\n\\
+  This parameter is optional. If zero or not specified, the default set \\n\\
+  by setthreads is used. Short sequences are not divided. \\n\\
+* outtype - If bytes or bytearray, a new sequence of that type is \\n\\
+  created, filled with the results, and returned. The input sequences \\n\\
+  are not changed and may be read only. The new sequence has the length \\n\\
+  of the part of the input which is used. This cannot be combined with \\n\\
+  outpsequence. This is an optional keyword parameter. \\n\\
+* result - The new sequence if outtype was given, otherwise None. \\n\\
+");
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function for a batch of sequences */
+static PyObject *py_%(funclabel)s_many(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The parameters for each sequence in the batch.
+	struct args_params_2 seqdata = ARGSINIT_TWO;
+
+	Py_ssize_t x;
+
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python. 
+	bytesdata = getparams_many_two(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+	// The same parameter is used with every sequence.
+	seqdata.nosimd = bytesdata.nosimd;
+	seqdata.param = bytesdata.param;
+	if (bytesdata.hasparambuffer) {
+		seqdata.bytes2.buf = bytesdata.parambuffer.buf;
+		seqdata.paramcat = (bytesdata.outlist != NULL) ? param_arr_arr_arr : param_arr_arr_none;
+	} else {
+		seqdata.paramcat = (bytesdata.outlist != NULL) ? param_arr_num_arr : param_arr_num_none;
+	}
+
+	// Call the C function for each sequence.
+	// The GIL is released if the batch is large.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.totallen)
+	for (x = 0; x < bytesdata.nseqs; x++) {
+		seqdata.arraylen = bytesdata.pybuffers[x].len;
+		seqdata.bytes1.buf = bytesdata.pybuffers[x].buf;
+		if (bytesdata.outlist != NULL) {
+			seqdata.bytes3.B = bytesdata.outdata[x];
+		}
+		%(funclabel)s_part(&seqdata, 0, 1);
+	}
+	BF_END_ALLOW_THREADS
+
+	// Release the buffers. 
+	releasebuffers_many(bytesdata);
+
+
+	// Return the new output sequences if they were created.
+	if (bytesdata.outlist != NULL) {
+		return bytesdata.outlist;
+	}
+
+	// Everything was successful.
+	Py_RETURN_NONE;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(%(funclabel)s_many__doc__,
+"%(funclabel)s_many \\n\\
+_____________________________ \\n\\
+\\n\\
+Calculate %(funclabel)s over the values in each sequence in a batch. \\n\\
+\\n\\
+======================  ============================================== \\n\\
+Equivalent to:          [%(funclabel)s(x, param) for x in sequences] \\n\\
+======================  ============================================== \\n\\
+\\n\\
+Call formats: \\n\\
+\\n\\
+  %(funclabel)s_many(sequences, param) \\n\\
+  %(funclabel)s_many(sequences, paramsequence) \\n\\
+  %(funclabel)s_many(sequences, param, nosimd=False) \\n\\
+  result = %(funclabel)s_many(sequences, param, outtype=bytes) \\n\\
+\\n\\
+* sequences - A list or other iterable of bytes or bytearray sequences. \\n\\
+  If outtype is not given the results overwrite the input data, so each \\n\\
+  sequence must be writable. \\n\\
+* param - A non-sequence numeric parameter. \\n\\
+* paramsequence - A sequence which is applied to each sequence in the \\n\\
+  batch. It must be the same length as each of them. \\n\\
 * nosimd - If True, SIMD acceleration is disabled. This parameter is \\n\\
   optional. The default is FALSE. \\n\\
+* outtype - If bytes or bytearray, a new sequence of that type is \\n\\
+  created for each input sequence, filled with the results, and a list \\n\\
+  of them is returned. The input sequences are not changed and may be \\n\\
+  read only. This is an optional keyword parameter. \\n\\
+* result - A list of new sequences if outtype was given, otherwise None. \\n\\
 ");
 
 
@@ -1309,14 +2860,32 @@ Call formats: \\n\\
 /* A list of all the methods defined by this module. 
  "%(funclabel)s" is the name seen inside of Python. 
  "py_%(funclabel)s" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef %(funclabel)s_methods[] = {
-	{"%(funclabel)s",  (PyCFunction)py_%(funclabel)s, METH_VARARGS | METH_KEYWORDS, %(funclabel)s__doc__}, 
+	{"%(funclabel)s",  (PyCFunction)py_%(funclabel)s, BF_METHFLAGS, %(funclabel)s__doc__}, 
+	{"%(funclabel)s_many",  (PyCFunction)py_%(funclabel)s_many, BF_METHFLAGS, %(funclabel)s_many__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int %(funclabel)s_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_initsimd();
+	#endif
+
+	return PyModule_AddFunctions(module, %(funclabel)s_methods);
+};
+
+#else
+
 static struct PyModuleDef %(funclabel)smodule = {
     PyModuleDef_HEAD_INIT,
     "%(funclabel)s",
@@ -1327,9 +2896,15 @@ static struct PyModuleDef %(funclabel)smodule = {
 
 PyMODINIT_FUNC PyInit_%(funclabel)s(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_initsimd();
+	#endif
+
     return PyModule_Create(&%(funclabel)smodule);
 };
 
+#endif
+
 /*--------------------------------------------------------------------------- */
 
 """
@@ -1343,31 +2918,86 @@ PyMODINIT_FUNC PyInit_%(funclabel)s(void)
 
 # x86 SIMD instructions.
 simdop_x86 = {
-	'lshift' : '__builtin_ia32_pslldi128',
-	'rshift' : '__builtin_ia32_psrldi128',
-	'and_' : '(v16qi) __builtin_ia32_pand128', 
-	'or_' : '(v16qi) __builtin_ia32_por128', 
-	'xor' : '(v16qi) __builtin_ia32_pxor128',
+	'lshift' : '_mm_sll_epi16',
+	'rshift' : '_mm_srl_epi16',
+	'and_' : '_mm_and_si128', 
+	'or_' : '_mm_or_si128', 
+	'xor' : '_mm_xor_si128',
+}
+
+# Used for lshift and rshift where the shift count is taken from a sequence.
+# The bytes are shifted in 16 bit lanes, and these masks clear the bits which
+# were shifted in from the adjoining byte.
+simdop_shift16_x86 = {
+	'lshift' : '_mm_slli_epi16',
+	'rshift' : '_mm_srli_epi16',
+	'and_' : '', 
+	'or_' : '', 
+	'xor' : '',
+}
+
+simdop_shift16_avx2 = {
+	'lshift' : '_mm256_slli_epi16',
+	'rshift' : '_mm256_srli_epi16',
+	'and_' : '', 
+	'or_' : '', 
+	'xor' : '',
+}
+
+simdop_shift16_avx512 = {
+	'lshift' : '_mm512_slli_epi16',
+	'rshift' : '_mm512_srli_epi16',
+	'and_' : '', 
+	'or_' : '', 
+	'xor' : '',
+}
+
+# The masks for shifts of 4, 2, and 1 positions.
+simdop_shift16_mask4 = {
+	'lshift' : '0xf0',
+	'rshift' : '0x0f',
+	'and_' : '', 
+	'or_' : '', 
+	'xor' : '',
 }
 
-# Used for lshift and rshift operations where a larger SIMD size is used 
-# combined with a shift. X86 does not directly support SIMD shift operations
-# on all relevant data types.
-lshiftmaskbasic = ['ff', '7f', '3f', '1f', '0f', '07', '03', '01']
-vmaskvalues_lshift = ', '.join(['0x%s' % (x * 4) for x in lshiftmaskbasic])
+simdop_shift16_mask2 = {
+	'lshift' : '0xfc',
+	'rshift' : '0x3f',
+	'and_' : '', 
+	'or_' : '', 
+	'xor' : '',
+}
+
+simdop_shift16_mask1 = {
+	'lshift' : '0xfe',
+	'rshift' : '0x7f',
+	'and_' : '', 
+	'or_' : '', 
+	'xor' : '',
+}
 
-rshiftmaskbasic = ['ff', 'fe', 'fc', 'f8', 'f0', 'e0', 'c0', '80']
-vmaskvalues_rshift = ', '.join(['0x%s' % (x * 4) for x in rshiftmaskbasic])
 
+# x86 AVX2 SIMD instructions. Only the shift operations need these, as the
+# others use the C operator.
+simdop_avx2 = {
+	'lshift' : '_mm256_sll_epi16',
+	'rshift' : '_mm256_srl_epi16',
+	'and_' : '', 
+	'or_' : '', 
+	'xor' : '',
+}
 
-# Masks for x86 SIMD shift instructions.
-simdop_x86_mask = {
-	'lshift' : vmaskvalues_lshift,
-	'rshift' : vmaskvalues_rshift,
+# x86 AVX-512BW SIMD instructions. Only the shift operations need these, as 
+# the others use the C operator.
+simdop_avx512 = {
+	'lshift' : '_mm512_sll_epi16',
+	'rshift' : '_mm512_srl_epi16',
 	'and_' : '', 
 	'or_' : '', 
 	'xor' : '',
 }
+
 # ==============================================================================
 
 # For ARMv7 NEON 32 bit.
@@ -1401,6 +3031,24 @@ vshift_sign_arm = {
 	'xor' : '',
 }
 
+# Negates the shift counts for right shifts where the count is taken 
+# from a sequence.
+vnegop_armv7 = {
+	'lshift' : '',
+	'rshift' : 'vneg_s8',
+	'and_' : '',
+	'or_' : '',
+	'xor' : '',
+}
+
+vnegop_armv8 = {
+	'lshift' : '',
+	'rshift' : 'vnegq_s8',
+	'and_' : '',
+	'or_' : '',
+	'xor' : '',
+}
+
 
 # ==============================================================================
 
@@ -1421,6 +3069,20 @@ copname = {
 # The functions which are implemented by this program.
 completefuncnames = copname.keys()
 
+# The shift functions, which need their own SIMD templates.
+shiftfuncnames = ('lshift', 'rshift')
+
+
+def scalarop(funcname, left, right):
+	"""Return the C expression for one element of the operation.
+	Shift counts of 8 or more are handled by a macro.
+	"""
+	if funcname in shiftfuncnames:
+		return '%s_byte(%s, %s)' % (funcname, left, right)
+	else:
+		return '%s %s %s' % (left, copname[funcname], right)
+
+
 # Documentation.
 opcodedocs = {
 	'lshift' : '<<', 
@@ -1443,19 +3105,30 @@ for funcname in completefuncnames:
 
 		f.write(mathops_head % {'funclabel' : funcname})
 
+		if funcname in shiftfuncnames:
+			f.write(shift_byte % {'funclabel' : funcname,
+							'copname' : copname[funcname]
+							})
+
 		f.write(ops_binop % {'funclabel' : funcname,
-						'copname' : copname[funcname]
+						'op_arr_num' : scalarop(funcname, 'data1[x]', 'param'),
+						'op_num_arr' : scalarop(funcname, 'param', 'data2[x]'),
+						'op_arr_arr' : scalarop(funcname, 'data1[x]', 'data2[x]'),
 						})
 
 
 		# A different template is required for lshift, rshift than for
 		# the other operations.
-		if funcname in ('lshift', 'rshift'):
-			simdsupport_arm_tmpl = ops_simdsupport_shift_arm
-			simdsupport_x86_tmpl = ops_simdsupport_shift_mask_x86
+		if funcname in shiftfuncnames:
+			simdsupport_arm_tmpl = ops_simdsupport_shift_arm + ops_simdsupport_shift_var_arm
+			simdsupport_x86_tmpl = ops_simdsupport_shift_mask_x86 + ops_simdsupport_shift_var_x86
+			simdsupport_avx2_tmpl = ops_simdsupport_shift_mask_avx2 + ops_simdsupport_shift_var_avx2
+			simdsupport_avx512_tmpl = ops_simdsupport_shift_mask_avx512 + ops_simdsupport_shift_var_avx512
 		else:
 			simdsupport_arm_tmpl = ops_simdsupport_arm
 			simdsupport_x86_tmpl = ops_simdsupport_x86
+			simdsupport_avx2_tmpl = ops_simdsupport_avx2
+			simdsupport_avx512_tmpl = ops_simdsupport_avx512
 
 
 		# x86-64 SIMD operations.
@@ -1464,7 +3137,34 @@ for funcname in completefuncnames:
 						'funcplat' : 'x86',
 						'copname' : copname[funcname],
 						'vopinstr' : simdop_x86[funcname],
-						'vmaskvalues' : simdop_x86_mask[funcname],
+						'vshift16' : simdop_shift16_x86[funcname],
+						'vbytemask4' : simdop_shift16_mask4[funcname],
+						'vbytemask2' : simdop_shift16_mask2[funcname],
+						'vbytemask1' : simdop_shift16_mask1[funcname],
+						})
+
+		# x86-64 AVX2 SIMD operations.
+		f.write(simdsupport_avx2_tmpl % {
+						'funclabel' : funcname,
+						'funcplat' : 'avx2',
+						'copname' : copname[funcname],
+						'vopinstr' : simdop_avx2[funcname],
+						'vshift16' : simdop_shift16_avx2[funcname],
+						'vbytemask4' : simdop_shift16_mask4[funcname],
+						'vbytemask2' : simdop_shift16_mask2[funcname],
+						'vbytemask1' : simdop_shift16_mask1[funcname],
+						})
+
+		# x86-64 AVX-512BW SIMD operations.
+		f.write(simdsupport_avx512_tmpl % {
+						'funclabel' : funcname,
+						'funcplat' : 'avx512',
+						'copname' : copname[funcname],
+						'vopinstr' : simdop_avx512[funcname],
+						'vshift16' : simdop_shift16_avx512[funcname],
+						'vbytemask4' : simdop_shift16_mask4[funcname],
+						'vbytemask2' : simdop_shift16_mask2[funcname],
+						'vbytemask1' : simdop_shift16_mask1[funcname],
 						})
 
 
@@ -1480,6 +3180,10 @@ for funcname in completefuncnames:
 						'vloadop' : 'vld1_u8',
 						'vloadop2' : 'vld1_s8',
 						'vstoreop' : 'vst1_u8',
+						'vminop' : 'vmin_u8',
+						'vdupop' : 'vdup_n_u8',
+						'vreinterpretop' : 'vreinterpret_s8_u8',
+						'vnegop' : vnegop_armv7[funcname],
 						})
 
 		# ARMv8 SIMD operations.
@@ -1494,26 +3198,19 @@ for funcname in completefuncnames:
 						'vloadop' : 'vld1q_u8',
 						'vloadop2' : 'vld1q_s8',
 						'vstoreop' : 'vst1q_u8',
+						'vminop' : 'vminq_u8',
+						'vdupop' : 'vdupq_n_u8',
+						'vreinterpretop' : 'vreinterpretq_s8_u8',
+						'vnegop' : vnegop_armv8[funcname],
 						})
 
 
 		# Functions to select SIMD or non-SIMD code.
-		# lshift and rshift require a different template as they do
-		# not implement x86 SIMD for all parameter forms.
-		if funcname in ('lshift', 'rshift'):
-			f.write(binops_select_shift % {'funclabel' : funcname})
-			paramselect = ''
-			paramnosimd = ''
-		else:
-			f.write(binops_select % {'funclabel' : funcname})
-			paramselect = '_select'
-			paramnosimd = ' bytesdata.nosimd,'
+		f.write(binops_select % {'funclabel' : funcname})
 
 
 		# Construct the case structure to select the correct parameter form.
 		f.write(binops_params % {'funclabel' : funcname,
-								'paramselect' : paramselect,
-								'paramnosimd' : paramnosimd,
 								'opcodedocs' : opcodedocs[funcname], 
 								})
 
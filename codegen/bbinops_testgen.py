@@ -1477,6 +1477,134 @@ class %(funcname)s_seq_immutable_param_errors(unittest.TestCase):
 # ==============================================================================
 
 
+# ==============================================================================
+
+# The template used to generate the tests for shift counts over the full
+# range of a byte. Counts of 8 or more shift out every bit.
+shift_count_template = '''
+
+##############################################################################
+class %(funcname)s_shift_count_%(typecode)s(unittest.TestCase):
+	"""Test %(funcname)s for shift counts over the full range of a byte.
+	shift_count_template
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		# Long enough to use SIMD, with left over elements at the end.
+		testdatasize = 300
+
+		xdata = list(itertools.islice(itertools.cycle([1, 0x81, 0xff, 0x5a, 0x3c]), testdatasize))
+		ydata = list(itertools.islice(itertools.cycle(range(256)), testdatasize))
+
+		self.data1 = %(typecode)s(xdata)
+		self.data2 = %(typecode)s(ydata)
+
+		self.counts = [0, 1, 7, 8, 9, 15, 16, 31, 32, 33, 127, 128, 200, 255]
+
+
+	########################################################
+	def pyshift(self, lop, rop):
+		"""Perform the shift in Python, truncated to a byte.
+		"""
+		return (lop %(pyoperator)s rop) & 255
+
+
+	########################################################
+	def test_%(funcname)s_array_num_none_a1(self):
+		"""Test %(funcname)s as *array-num-none* for shift counts - Array code %(typecode)s.
+		"""
+		for nosimd in (False, True):
+			for testval in self.counts:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					datax = bytearray(self.data1)
+					expected = [self.pyshift(x, testval) for x in datax]
+
+					bytesfunc.%(funcname)s(datax, testval, nosimd=nosimd)
+
+					self.assertEqual(list(datax), expected)
+
+
+	########################################################
+	def test_%(funcname)s_array_num_array_b1(self):
+		"""Test %(funcname)s as *array-num-array* for shift counts - Array code %(typecode)s.
+		"""
+		for nosimd in (False, True):
+			for testval in self.counts:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					dataout = bytearray(len(self.data1))
+					expected = [self.pyshift(x, testval) for x in self.data1]
+
+					bytesfunc.%(funcname)s(self.data1, testval, dataout, nosimd=nosimd)
+
+					self.assertEqual(list(dataout), expected)
+
+
+	########################################################
+	def test_%(funcname)s_num_array_none_c1(self):
+		"""Test %(funcname)s as *num-array-none* for shift counts - Array code %(typecode)s.
+		"""
+		for nosimd in (False, True):
+			for testval in self.data1[:5]:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					datay = bytearray(self.data2)
+					expected = [self.pyshift(testval, y) for y in datay]
+
+					bytesfunc.%(funcname)s(testval, datay, nosimd=nosimd)
+
+					self.assertEqual(list(datay), expected)
+
+
+	########################################################
+	def test_%(funcname)s_num_array_array_d1(self):
+		"""Test %(funcname)s as *num-array-array* for shift counts - Array code %(typecode)s.
+		"""
+		for nosimd in (False, True):
+			for testval in self.data1[:5]:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					dataout = bytearray(len(self.data2))
+					expected = [self.pyshift(testval, y) for y in self.data2]
+
+					bytesfunc.%(funcname)s(testval, self.data2, dataout, nosimd=nosimd)
+
+					self.assertEqual(list(dataout), expected)
+
+
+	########################################################
+	def test_%(funcname)s_array_array_none_e1(self):
+		"""Test %(funcname)s as *array-array-none* for shift counts - Array code %(typecode)s.
+		"""
+		for nosimd in (False, True):
+			with self.subTest(msg='Failed with parameter', nosimd = nosimd):
+				datax = bytearray(self.data1)
+				expected = [self.pyshift(x, y) for x, y in zip(self.data1, self.data2)]
+
+				bytesfunc.%(funcname)s(datax, self.data2, nosimd=nosimd)
+
+				self.assertEqual(list(datax), expected)
+
+
+	########################################################
+	def test_%(funcname)s_array_array_array_f1(self):
+		"""Test %(funcname)s as *array-array-array* for shift counts - Array code %(typecode)s.
+		"""
+		for nosimd in (False, True):
+			with self.subTest(msg='Failed with parameter', nosimd = nosimd):
+				dataout = bytearray(len(self.data1))
+				expected = [self.pyshift(x, y) for x, y in zip(self.data1, self.data2)]
+
+				bytesfunc.%(funcname)s(self.data1, self.data2, dataout, nosimd=nosimd)
+
+				self.assertEqual(list(dataout), expected)
+
+
+##############################################################################
+
+'''
+
+
 # ==============================================================================
 
 
@@ -1586,6 +1714,12 @@ for funcname in allfuncnames:
 			# Test for mismatched sequence lengths.
 			f.write(param_invalid_seqlen_template % funcdata)
 
+			#####
+
+			# Test for shift counts of 8 or more.
+			if funcname in ('lshift', 'rshift'):
+				f.write(shift_count_template % funcdata)
+
 		#####
 
 		# Test for immutable output sequences.
@@ -64,6 +64,8 @@ opstemplate = """//-------------------------------------------------------------
 #include "byteserrs.h"
 #include "bytesparams_base.h"
 #include "bytesparams_comp.h"
+#include "arrayops.h"
+#include "bytesstride.h"
 
 #include "simddefs.h"
 
@@ -155,7 +157,7 @@ signed int %(funclabel)s_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, u
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *)  compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -166,7 +168,7 @@ signed int %(funclabel)s_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, u
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *)  &data1[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
 		%(SIMD_x86_arr_num)s
 	}
 
@@ -200,7 +202,7 @@ signed int %(funclabel)s_3_x86_simd(Py_ssize_t arraylen, unsigned char param, un
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceleft = (v16qi) __builtin_ia32_lddqu((char *)  compvals);
+	datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -211,7 +213,7 @@ signed int %(funclabel)s_3_x86_simd(Py_ssize_t arraylen, unsigned char param, un
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *)  &data2[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		%(SIMD_x86_num_arr)s
 	}
 
@@ -249,8 +251,8 @@ signed int %(funclabel)s_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, u
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *)  &data1[index]);
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *)  &data2[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		%(SIMD_x86_arr_arr)s
 	}
 
@@ -268,6 +270,314 @@ signed int %(funclabel)s_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, u
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 version.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int %(funclabel)s_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice%(SIMD_x86_compslice)s;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		%(SIMD_avx2_arr_num)s
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		if (!(data1[index] %(compare_ops)s param)) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+
+// param_num_arr
+AF_TARGET_AVX2 signed int %(funclabel)s_3_avx2_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice%(SIMD_x86_compslice)s;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param;
+	}
+	datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		%(SIMD_avx2_num_arr)s
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		if (!(param %(compare_ops)s data2[index])) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX2 signed int %(funclabel)s_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice%(SIMD_x86_compslice)s;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		%(SIMD_avx2_arr_arr)s
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		if (!(data1[index] %(compare_ops)s data2[index])) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW version.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int %(funclabel)s_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, %(SIMD_avx512_pred)s);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return 0;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, %(SIMD_avx512_pred)s);
+		if (resultmask != tailmask) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+
+// param_num_arr
+AF_TARGET_AVX512BW signed int %(funclabel)s_3_avx512_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
+	}
+	datasliceleft = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, %(SIMD_avx512_pred)s);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return 0;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, %(SIMD_avx512_pred)s);
+		if (resultmask != tailmask) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX512BW signed int %(funclabel)s_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, %(SIMD_avx512_pred)s);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return 0;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, %(SIMD_avx512_pred)s);
+		if (resultmask != tailmask) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 
 
@@ -590,9 +900,61 @@ signed int %(funclabel)s_5_armv8_simd(Py_ssize_t arraylen, unsigned char *data1,
 /*--------------------------------------------------------------------------- */
 
 
+/*--------------------------------------------------------------------------- */
+/* The SIMD functions to use. These are selected once when the module is 
+   initialised, according to the SIMD features supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	signed int (*param_arr_num)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param);
+	signed int (*param_num_arr)(Py_ssize_t arraylen, unsigned char param, unsigned char *data2);
+	signed int (*param_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2);
+} %(funclabel)s_simdfuncs;
+
+
+/* Select the SIMD functions for this CPU.
+*/
+static void %(funclabel)s_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		%(funclabel)s_simdfuncs.param_arr_num = %(funclabel)s_1_avx512_simd;
+		%(funclabel)s_simdfuncs.param_num_arr = %(funclabel)s_3_avx512_simd;
+		%(funclabel)s_simdfuncs.param_arr_arr = %(funclabel)s_5_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		%(funclabel)s_simdfuncs.param_arr_num = %(funclabel)s_1_avx2_simd;
+		%(funclabel)s_simdfuncs.param_num_arr = %(funclabel)s_3_avx2_simd;
+		%(funclabel)s_simdfuncs.param_arr_arr = %(funclabel)s_5_avx2_simd;
+	} else {
+		%(funclabel)s_simdfuncs.param_arr_num = %(funclabel)s_1_x86_simd;
+		%(funclabel)s_simdfuncs.param_num_arr = %(funclabel)s_3_x86_simd;
+		%(funclabel)s_simdfuncs.param_arr_arr = %(funclabel)s_5_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	%(funclabel)s_simdfuncs.param_arr_num = %(funclabel)s_1_armv7_simd;
+	%(funclabel)s_simdfuncs.param_num_arr = %(funclabel)s_3_armv7_simd;
+	%(funclabel)s_simdfuncs.param_arr_arr = %(funclabel)s_5_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_simdfuncs.param_arr_num = %(funclabel)s_1_armv8_simd;
+	%(funclabel)s_simdfuncs.param_num_arr = %(funclabel)s_3_armv8_simd;
+	%(funclabel)s_simdfuncs.param_arr_arr = %(funclabel)s_5_armv8_simd;
+	#endif
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    data2 = The second data array.
@@ -602,19 +964,7 @@ signed int %(funclabel)s_1_select(Py_ssize_t arraylen, int nosimd, unsigned char
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return %(funclabel)s_1_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return %(funclabel)s_1_armv7_simd(arraylen, data1, param);
-		#endif
-
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return %(funclabel)s_1_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return %(funclabel)s_simdfuncs.param_arr_num(arraylen, data1, param);
 	} else {
 	#endif
 		return %(funclabel)s_1(arraylen, data1, param);
@@ -628,7 +978,7 @@ signed int %(funclabel)s_1_select(Py_ssize_t arraylen, int nosimd, unsigned char
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    data2 = The second data array.
@@ -638,18 +988,7 @@ signed int %(funclabel)s_3_select(Py_ssize_t arraylen, int nosimd, unsigned char
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return %(funclabel)s_3_x86_simd(arraylen, param, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return %(funclabel)s_3_armv7_simd(arraylen, param, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return %(funclabel)s_3_armv8_simd(arraylen, param, data2);
-		#endif
-
+		return %(funclabel)s_simdfuncs.param_num_arr(arraylen, param, data2);
 	} else {
 	#endif
 		return %(funclabel)s_3(arraylen, param, data2);
@@ -662,7 +1001,7 @@ signed int %(funclabel)s_3_select(Py_ssize_t arraylen, int nosimd, unsigned char
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    data2 = The second data array.
@@ -672,18 +1011,7 @@ signed int %(funclabel)s_5_select(Py_ssize_t arraylen, int nosimd, unsigned char
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return %(funclabel)s_5_x86_simd(arraylen, data1, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return %(funclabel)s_5_armv7_simd(arraylen, data1, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return %(funclabel)s_5_armv8_simd(arraylen, data1, data2);
-		#endif
-
+		return %(funclabel)s_simdfuncs.param_arr_arr(arraylen, data1, data2);
 	} else {
 	#endif
 		return %(funclabel)s_5(arraylen, data1, data2);
@@ -698,12 +1026,15 @@ signed int %(funclabel)s_5_select(Py_ssize_t arraylen, int nosimd, unsigned char
 /*--------------------------------------------------------------------------- */
 
 /* The wrapper to the underlying C function */
-static PyObject *py_%(funclabel)s(PyObject *self, PyObject *args, PyObject *keywds) {
+static PyObject *py_%(funclabel)s(PyObject *self, BF_ARGSDECL) {
 
 
 	// The error code returned by the function.
 	signed int resultcode = 0;
 
+	// The result of a search when only every step'th element is used.
+	Py_ssize_t strideresult = ARR_ERR_NOTFOUND;
+
 	// This is used to hold the parsed parameters.
 	struct args_params_comp bytesdata = ARGSINIT_COMP;
 
@@ -711,7 +1042,7 @@ static PyObject *py_%(funclabel)s(PyObject *self, PyObject *args, PyObject *keyw
 
 
 	// Get the parameters passed from Python.
-	bytesdata = getparams_comp(self, args, keywds, "%(funclabel)s");
+	bytesdata = getparams_comp(self, BF_ARGSPASS);
 
 	// If there was an error, we count on the parameter parsing function to 
 	// release the buffers if this was necessary.
@@ -720,20 +1051,44 @@ static PyObject *py_%(funclabel)s(PyObject *self, PyObject *args, PyObject *keyw
 	}
 
 
-	switch (bytesdata.paramcat) {
-		case param_arr_num : {
-			resultcode = %(funclabel)s_1_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
-		}
-		case param_num_arr : {
-			resultcode = %(funclabel)s_3_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.param, bytesdata.bytes2.B);
-			break;
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	if (bytesdata.step > 1) {
+		// When only every step'th element is used, search for the first
+		// element for which the comparison is false. When the parameter 
+		// comes first, the comparison is reversed.
+		switch (bytesdata.paramcat) {
+			case param_arr_num : {
+				strideresult = stridefind_select(stridenegateop(%(stride_opcode)s), bytesdata.arraylen, bytesdata.step, bytesdata.nosimd, bytesdata.bytes1.B, NULL, bytesdata.param);
+				break;
+			}
+			case param_num_arr : {
+				strideresult = stridefind_select(stridenegateop(strideswapop(%(stride_opcode)s)), bytesdata.arraylen, bytesdata.step, bytesdata.nosimd, bytesdata.bytes2.B, NULL, bytesdata.param);
+				break;
+			}
+			case param_arr_arr : {
+				strideresult = stridefind_select(stridenegateop(%(stride_opcode)s), bytesdata.arraylen, bytesdata.step, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.bytes2.B, 0);
+				break;
+			}
 		}
-		case param_arr_arr : {
-			resultcode = %(funclabel)s_5_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.bytes2.B);
-			break;
+		resultcode = (strideresult < 0);
+	} else {
+		switch (bytesdata.paramcat) {
+			case param_arr_num : {
+				resultcode = %(funclabel)s_1_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
+				break;
+			}
+			case param_num_arr : {
+				resultcode = %(funclabel)s_3_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.param, bytesdata.bytes2.B);
+				break;
+			}
+			case param_arr_arr : {
+				resultcode = %(funclabel)s_5_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.bytes2.B);
+				break;
+			}
 		}
 	}
+	BF_END_ALLOW_THREADS
 
 
 	// Release the buffers. 
@@ -772,6 +1127,8 @@ Call formats: \\n\\
   result = %(funclabel)s(param, sequence1) \\n\\
   result = %(funclabel)s(sequence1, sequence2) \\n\\
   result = %(funclabel)s(sequence1, param, maxlen=y) \\n\\
+  result = %(funclabel)s(sequence1, param, start=i, stop=j) \\n\\
+  result = %(funclabel)s(sequence1, param, step=k) \\n\\
   result = %(funclabel)s(sequence1, param, nosimd=False) \\n\\
 \\n\\
 * sequence1 - An input bytes or bytearray to be examined. \\n\\
@@ -786,6 +1143,13 @@ Call formats: \\n\\
   positive integer. If a zero or negative length, or a value which is \\n\\
   greater than the actual length of the sequence is specified, this \\n\\
   parameter is ignored.  \\n\\
+* start, stop - Work on only part of the sequence, as if it had been \\n\\
+  sliced with sequence[start:stop]. The same part of every sequence is \\n\\
+  used. These are optional keyword parameters and are applied before \\n\\
+  maxlen. No data is copied. \\n\\
+* step - Use only every step'th element, as if the sequences had been \\n\\
+  sliced with sequence[start:stop:step]. This must be a positive \\n\\
+  integer. This is an optional keyword parameter. \\n\\
 * nosimd - If True, SIMD acceleration is disabled if present.  \\n\\
   The default is False (SIMD acceleration is enabled if present). \\n\\
 * result - A boolean value corresponding to the result of all the \\n\\
@@ -800,14 +1164,33 @@ Call formats: \\n\\
 /* A list of all the methods defined by this module. 
  "%(funclabel)s" is the name seen inside of Python. 
  "py_%(funclabel)s" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef %(funclabel)s_methods[] = {
-	{"%(funclabel)s",  (PyCFunction)py_%(funclabel)s, METH_VARARGS | METH_KEYWORDS, %(funclabel)s__doc__}, 
+	{"%(funclabel)s",  (PyCFunction)py_%(funclabel)s, BF_METHFLAGS, %(funclabel)s__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int %(funclabel)s_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
+	return PyModule_AddFunctions(module, %(funclabel)s_methods);
+};
+
+#else
+
 static struct PyModuleDef %(funclabel)smodule = {
     PyModuleDef_HEAD_INIT,
     "%(funclabel)s",
@@ -818,9 +1201,17 @@ static struct PyModuleDef %(funclabel)smodule = {
 
 PyMODINIT_FUNC PyInit_%(funclabel)s(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
     return PyModule_Create(&%(funclabel)smodule);
 };
 
+#endif
+
 /*--------------------------------------------------------------------------- */
 
 """
@@ -845,61 +1236,61 @@ compare_ops = {
 # param_arr_num
 SIMD_x86_arr_num = {
 'eq' : '''// Compare the slices.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
 			return 0;
 		}''',
 'ge' : '''// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if ((__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff)) {
+		if ((_mm_movemask_epi8((__m128i) resultslice) != 0xffff)) {
 			return 0;
 		}''',
 'gt' : '''// Make sure they're not equal.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0x0000)) {
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0x0000)) {
 			return 0;
 		}
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if ((__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff)) {
+		if ((_mm_movemask_epi8((__m128i) resultslice) != 0xffff)) {
 			return 0;
 		}''',
 'le' : '''// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if ((__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff)) {
+		if ((_mm_movemask_epi8((__m128i) resultslice) != 0xffff)) {
 			return 0;
 		}''',
 'lt' : '''// Make sure they're not equal.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0x0000)) {
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0x0000)) {
 			return 0;
 		}
 		// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if ((__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff)) {
+		if ((_mm_movemask_epi8((__m128i) resultslice) != 0xffff)) {
 			return 0;
 		}''',
 'ne' : '''// Compare for equality.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0x0000)) {
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0x0000)) {
 			return 0;
 		}''',
 }
@@ -908,61 +1299,61 @@ SIMD_x86_arr_num = {
 # param_num_arr
 SIMD_x86_num_arr = {
 'eq' : '''// Compare the slices.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
 			return 0;
 		}''',
 'ge' : '''// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
 			return 0;
 		}''',
 'gt' : '''// Make sure they're not equal.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0x0000)) {
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0x0000)) {
 			return 0;
 		}
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
 			return 0;
 		}''',
 'le' : '''// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
 			return 0;
 		}''',
 'lt' : '''// Make sure they're not equal.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0x0000)) {
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0x0000)) {
 			return 0;
 		}
 		// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
 			return 0;
 		}''',
 'ne' : '''// Compare for equality.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0x0000)) {
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0x0000)) {
 			return 0;
 		}''',
 }
@@ -971,65 +1362,257 @@ SIMD_x86_num_arr = {
 # param_arr_arr
 SIMD_x86_arr_arr = {
 'eq' : '''// Compare the slices.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
+			return 0;
+		}''',
+'ge' : '''// Find the minimum values. 
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
+			return 0;
+		}''',
+'gt' : '''// Make sure they're not equal.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0x0000)) {
+			return 0;
+		}
+		// Find the minimum values. 
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
+			return 0;
+		}''',
+'le' : '''// Find the maximum values. 
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
+			return 0;
+		}''',
+'lt' : '''// Make sure they're not equal.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0x0000)) {
+			return 0;
+		}
+		// Find the maximum values. 
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
+			return 0;
+		}''',
+'ne' : '''// Compare for equality.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0x0000)) {
+			return 0;
+		}''',
+}
+
+# SIMD code for x86 AVX2. These are the same as the x86 versions above,
+# but with 256 bit vectors.
+
+# param_arr_num
+SIMD_avx2_arr_num = {
+'eq' : '''// Compare the slices.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
+			return 0;
+		}''',
+'ge' : '''// Find the minimum values. 
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff)) {
+			return 0;
+		}''',
+'gt' : '''// Make sure they're not equal.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0x00000000)) {
+			return 0;
+		}
+		// Find the minimum values. 
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff)) {
+			return 0;
+		}''',
+'le' : '''// Find the maximum values. 
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff)) {
+			return 0;
+		}''',
+'lt' : '''// Make sure they're not equal.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0x00000000)) {
+			return 0;
+		}
+		// Find the maximum values. 
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff)) {
+			return 0;
+		}''',
+'ne' : '''// Compare for equality.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0x00000000)) {
+			return 0;
+		}''',
+}
+
+
+# param_num_arr
+SIMD_avx2_num_arr = {
+'eq' : '''// Compare the slices.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
+			return 0;
+		}''',
+'ge' : '''// Find the minimum values. 
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
+			return 0;
+		}''',
+'gt' : '''// Make sure they're not equal.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0x00000000)) {
+			return 0;
+		}
+		// Find the minimum values. 
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
+			return 0;
+		}''',
+'le' : '''// Find the maximum values. 
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
+			return 0;
+		}''',
+'lt' : '''// Make sure they're not equal.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0x00000000)) {
+			return 0;
+		}
+		// Find the maximum values. 
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
+			return 0;
+		}''',
+'ne' : '''// Compare for equality.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0x00000000)) {
+			return 0;
+		}''',
+}
+
+
+# param_arr_arr
+SIMD_avx2_arr_arr = {
+'eq' : '''// Compare the slices.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
 			return 0;
 		}''',
 'ge' : '''// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
 			return 0;
 		}''',
 'gt' : '''// Make sure they're not equal.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0x0000)) {
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0x00000000)) {
 			return 0;
 		}
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
 			return 0;
 		}''',
 'le' : '''// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
 			return 0;
 		}''',
 'lt' : '''// Make sure they're not equal.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0x0000)) {
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0x00000000)) {
 			return 0;
 		}
 		// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
 			return 0;
 		}''',
 'ne' : '''// Compare for equality.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0x0000)) {
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0x00000000)) {
 			return 0;
 		}''',
 }
 
+
 # Which compare operations need an additional vector for intermediate results.
 compslice = ', compslice'
 SIMD_x86_compslice = {
@@ -1079,6 +1662,29 @@ SIMD_ARM_compval = {
 'ne' : '0x0000000000000000',
 }
 
+# The comparison predicates for the x86 AVX-512BW unsigned byte compare. 
+# Greater than or equal is "not less than", and greater than is "not less
+# than or equal". The same predicate is used for all parameter options, as
+# the operands are always in order.
+SIMD_avx512_pred = {
+'eq' : '_MM_CMPINT_EQ',
+'ge' : '_MM_CMPINT_NLT',
+'gt' : '_MM_CMPINT_NLE',
+'le' : '_MM_CMPINT_LE',
+'lt' : '_MM_CMPINT_LT',
+'ne' : '_MM_CMPINT_NE',
+}
+
+# The operator codes used with the step parameter.
+stride_opcode = {
+'eq' : 'OP_AF_EQ',
+'ge' : 'OP_AF_GE',
+'gt' : 'OP_AF_GT',
+'le' : 'OP_AF_LE',
+'lt' : 'OP_AF_LT',
+'ne' : 'OP_AF_NE',
+}
+
 # ==============================================================================
 
 for funcname in compare_ops.keys():
@@ -1092,12 +1698,952 @@ for funcname in compare_ops.keys():
 				'SIMD_x86_arr_num' : SIMD_x86_arr_num[funcname],
 				'SIMD_x86_num_arr' : SIMD_x86_num_arr[funcname],
 				'SIMD_x86_arr_arr' : SIMD_x86_arr_arr[funcname],
+				'SIMD_avx2_arr_num' : SIMD_avx2_arr_num[funcname],
+				'SIMD_avx2_num_arr' : SIMD_avx2_num_arr[funcname],
+				'SIMD_avx2_arr_arr' : SIMD_avx2_arr_arr[funcname],
+				'SIMD_avx512_pred' : SIMD_avx512_pred[funcname],
 				'SIMD_x86_compslice' : SIMD_x86_compslice[funcname],
 				'SIMD_ARMv7_comp' : SIMD_ARMv7_comp[funcname],
 				'SIMD_ARMv8_comp' : SIMD_ARMv8_comp[funcname],
 				'SIMD_ARM_compval' : SIMD_ARM_compval[funcname],
+				'stride_opcode' : stride_opcode[funcname],
 				}
 		f.write(opstemplate % opvals)
 
 
 # ==============================================================================
+
+# ==============================================================================
+
+# cmpmask writes the result of each comparison to an output sequence as a 
+# mask, instead of combining the results into a single value. All the 
+# operators are in one module, and the operator is selected when it is 
+# called. The compare operations are the same as those used above.
+
+cmpmask_head = """//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   cmpmask.c
+// Purpose:  Compare values in a bytes or bytearray object and output a mask.
+// Language: C
+// Date:     18-Oct-2026.
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+/*--------------------------------------------------------------------------- */
+// This must be defined before "Python.h" in order for the pointers in the
+// argument parsing functions to work properly. 
+#define PY_SSIZE_T_CLEAN
+
+#include "Python.h"
+
+#include <limits.h>
+#include <math.h>
+
+#include "byteserrs.h"
+
+#include "bytesparams_base.h"
+#include "arrayops.h"
+
+#include "bytesparams_two.h"
+#include "bytesthreads.h"
+#include "bytesstride.h"
+
+/*--------------------------------------------------------------------------- */
+
+#include "simddefs.h"
+
+#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+#include "arm_neon.h"
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+// The output value for each element where the comparison is true. It is 
+// zero where the comparison is false.
+#define CMPMASK_TRUE 0xff
+
+/*--------------------------------------------------------------------------- */
+
+/* The SIMD functions to use for each compare operation. These are selected
+   once when the module is initialised, according to the SIMD features
+   supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+%(simdfuncfields)s
+} cmpmask_simdfuncs;
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+"""
+
+
+# The SIMD function pointers for one compare operation.
+cmpmask_simdfuncfields = """	void (*%(funclabel)s_arr_num)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*%(funclabel)s_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3);"""
+
+
+# The functions for one compare operation.
+cmpmask_ops = """
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   The output may be the same sequence as one of the inputs.
+   A compare with the parameter on the left is done by swapping the operator.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The output array.
+   param = The parameter to be compared to each array element.
+*/
+// param_arr_num
+void cmpmask_%(funclabel)s_1(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] %(compare_ops)s param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_%(funclabel)s_5(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] %(compare_ops)s data2[x]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 SSE2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86)
+void cmpmask_%(funclabel)s_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice%(SIMD_x86_compslice)s;
+
+	// Initialise the comparison values.
+	datasliceright = (v16qi) _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		%(SIMD_x86_mask)s
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] %(compare_ops)s param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_%(funclabel)s_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice%(SIMD_x86_compslice)s;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
+		%(SIMD_x86_mask)s
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] %(compare_ops)s data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void cmpmask_%(funclabel)s_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice%(SIMD_x86_compslice)s;
+
+	// Initialise the comparison values.
+	datasliceright = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		%(SIMD_avx2_mask)s
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] %(compare_ops)s param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX2 void cmpmask_%(funclabel)s_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice%(SIMD_x86_compslice)s;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		%(SIMD_avx2_mask)s
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] %(compare_ops)s data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW version. See the non-SIMD version for the parameters.
+   AVX-512 compares produce a mask with one bit per element, so every type 
+   of comparison can be done directly. The bit mask is then expanded to
+   one byte per element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void cmpmask_%(funclabel)s_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, %(SIMD_avx512_pred)s);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, %(SIMD_avx512_pred)s);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX512BW void cmpmask_%(funclabel)s_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, %(SIMD_avx512_pred)s);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, %(SIMD_avx512_pred)s);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+void cmpmask_%(funclabel)s_1_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], %(SIMD_ARMv7_mask)s);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] %(compare_ops)s param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_%(funclabel)s_5_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		datasliceright = vld1_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], %(SIMD_ARMv7_mask)s);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] %(compare_ops)s data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 AARCH64 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARM_AARCH64)
+void cmpmask_%(funclabel)s_1_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], %(SIMD_ARMv8_mask)s);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] %(compare_ops)s param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_%(funclabel)s_5_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		datasliceright = vld1q_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], %(SIMD_ARMv8_mask)s);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] %(compare_ops)s data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   nosimd = If true, disable SIMD acceleration.
+   See the non-SIMD version for the other parameters.
+*/
+// param_arr_num
+void cmpmask_%(funclabel)s_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.%(funclabel)s_arr_num(arraylen, data1, param, data3);
+	} else {
+	#endif
+		cmpmask_%(funclabel)s_1(arraylen, data1, param, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_arr
+void cmpmask_%(funclabel)s_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.%(funclabel)s_arr_arr(arraylen, data1, data2, data3);
+	} else {
+	#endif
+		cmpmask_%(funclabel)s_5(arraylen, data1, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+"""
+
+
+# Select the SIMD functions for one compare operation.
+cmpmask_initsimd_x86 = """		cmpmask_simdfuncs.%(funclabel)s_arr_num = cmpmask_%(funclabel)s_1_%(simdplat)s_simd;
+		cmpmask_simdfuncs.%(funclabel)s_arr_arr = cmpmask_%(funclabel)s_5_%(simdplat)s_simd;"""
+
+cmpmask_initsimd_arm = """	cmpmask_simdfuncs.%(funclabel)s_arr_num = cmpmask_%(funclabel)s_1_%(simdplat)s_simd;
+	cmpmask_simdfuncs.%(funclabel)s_arr_arr = cmpmask_%(funclabel)s_5_%(simdplat)s_simd;"""
+
+
+# Call the function for one compare operation.
+cmpmask_case_arr_num = """		case %(stride_opcode)s: {
+			cmpmask_%(funclabel)s_1_select(arraylen, nosimd, data1, param, data3);
+			break;
+		}"""
+
+cmpmask_case_arr_arr = """		case %(stride_opcode)s: {
+			cmpmask_%(funclabel)s_5_select(arraylen, nosimd, data1, data2, data3);
+			break;
+		}"""
+
+
+cmpmask_tail = """
+/*--------------------------------------------------------------------------- */
+
+/* Select the SIMD functions for this CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static void cmpmask_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+%(initsimd_avx512)s
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+%(initsimd_avx2)s
+	} else {
+%(initsimd_x86)s
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+%(initsimd_armv7)s
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+%(initsimd_armv8)s
+	#endif
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* Call the function for the requested compare operation, where the array
+   is compared to a single parameter. See the non-SIMD functions for the 
+   parameters.
+*/
+static void cmpmask_arr_num_select(signed int opcode, Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	switch(opcode) {
+%(cases_arr_num)s
+	}
+
+}
+
+/* Call the function for the requested compare operation, where two arrays
+   are compared. See the non-SIMD functions for the parameters.
+*/
+static void cmpmask_arr_arr_select(signed int opcode, Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	switch(opcode) {
+%(cases_arr_arr)s
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Calculate one part of the sequences. If the calculation is not divided
+	between threads, then there is just one part covering the whole sequence.
+	When the parameter is on the left, the operator is swapped so that it
+	can be on the right instead. When there is no output sequence, the 
+	results overwrite the input sequence.
+	ctx = The parsed parameters (struct args_params_2).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void cmpmask_part(void *ctx, int part, int nparts) {
+
+	struct args_params_2 *bytesdata = (struct args_params_2 *) ctx;
+
+	// The range of this part of the sequences.
+	Py_ssize_t start, partlen;
+
+	partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
+
+	// Select the correct implementation.
+	switch (bytesdata->paramcat) {
+		case param_arr_num_none : {
+			cmpmask_arr_num_select(bytesdata->opcode, partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param, bytesdata->bytes1.B + start);
+			break;
+		}
+		case param_arr_num_arr : {
+			cmpmask_arr_num_select(bytesdata->opcode, partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_num_arr_none : {
+			cmpmask_arr_num_select(strideswapop(bytesdata->opcode), partlen, bytesdata->nosimd, bytesdata->bytes2.B + start, bytesdata->param, bytesdata->bytes2.B + start);
+			break;
+		}
+		case param_num_arr_arr : {
+			cmpmask_arr_num_select(strideswapop(bytesdata->opcode), partlen, bytesdata->nosimd, bytesdata->bytes2.B + start, bytesdata->param, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_arr_arr_none : {
+			cmpmask_arr_arr_select(bytesdata->opcode, partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start, bytesdata->bytes1.B + start);
+			break;
+		}
+		case param_arr_arr_arr : {
+			cmpmask_arr_arr_select(bytesdata->opcode, partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start, bytesdata->bytes3.B + start);
+			break;
+		}
+		// The other categories are only used by functions which take a mask.
+		default : {
+			break;
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_cmpmask(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_2 bytesdata = ARGSINIT_TWO;
+
+	// The number of parts to divide the calculation into.
+	int nparts;
+
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python. 
+	bytesdata = getparams_two_op(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+
+	// Call the C function.
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	runparallel(cmpmask_part, &bytesdata, nparts);
+	BF_END_ALLOW_THREADS
+
+	// Release the buffers. 
+	releasebuffers_two(bytesdata);
+
+
+	// Return the new output sequence if one was created.
+	if (bytesdata.outobj != NULL) {
+		return bytesdata.outobj;
+	}
+
+	// Everything was successful.
+	Py_RETURN_NONE;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(cmpmask__doc__,
+"cmpmask \\n\\
+_____________________________ \\n\\
+\\n\\
+Compare the values in a bytes or bytearray object, and output the result \\n\\
+of each comparison as a mask. Each output element is 255 where the \\n\\
+comparison is true, and 0 where it is false. \\n\\
+\\n\\
+======================  ============================================== \\n\\
+Equivalent to:          [255 if x > param else 0 for x in sequence1] \\n\\
+or                      [255 if param > x else 0 for x in sequence1] \\n\\
+or                      [255 if x > y else 0 for x,y in zip(sequence1, sequence2)] \\n\\
+======================  ============================================== \\n\\
+\\n\\
+Call formats: \\n\\
+\\n\\
+  cmpmask(opstr, sequence1, param) \\n\\
+  cmpmask(opstr, sequence1, param, outpsequence) \\n\\
+  cmpmask(opstr, param, sequence1) \\n\\
+  cmpmask(opstr, param, sequence1, outpsequence) \\n\\
+  cmpmask(opstr, sequence1, sequence2) \\n\\
+  cmpmask(opstr, sequence1, sequence2, outpsequence) \\n\\
+  cmpmask(opstr, sequence1, param, maxlen=y) \\n\\
+  cmpmask(opstr, sequence1, param, start=i, stop=j) \\n\\
+  cmpmask(opstr, sequence1, param, nosimd=False) \\n\\
+  cmpmask(opstr, sequence1, param, threads=4) \\n\\
+  result = cmpmask(opstr, sequence1, param, outtype=bytes) \\n\\
+\\n\\
+* opstr - The arithmetic comparison operation as a string. \\n\\
+          These are: '==', '>', '>=', '<', '<=', '!='. \\n\\
+* sequence1 - The first input data bytes or bytearray sequence to be \\n\\
+  examined. If no output sequence is provided the results will overwrite \\n\\
+  the input data. \\n\\
+* param - A non-sequence numeric parameter. \\n\\
+* sequence2 - A second input data sequence. Each element in this sequence is \\n\\
+  compared to the corresponding element in the first sequence. \\n\\
+* outpsequence - The output sequence. This parameter is optional. \\n\\
+* maxlen - Limit the length of the sequence used. This must be a valid \\n\\
+  positive integer. If a zero or negative length, or a value which is \\n\\
+  greater than the actual length of the sequence is specified, this \\n\\
+  parameter is ignored. \\n\\
+* start, stop - Work on only part of the sequence, as if it had been \\n\\
+  sliced with sequence[start:stop]. The same part of every sequence is \\n\\
+  used. These are optional keyword parameters and are applied before \\n\\
+  maxlen. No data is copied. \\n\\
+* nosimd - If True, SIMD acceleration is disabled. This parameter is \\n\\
+  optional. The default is FALSE. \\n\\
+* threads - The number of threads to divide the calculation between. \\n\\
+  This parameter is optional. If zero or not specified, the default set \\n\\
+  by setthreads is used. Short sequences are not divided. \\n\\
+* outtype - If bytes or bytearray, a new sequence of that type is \\n\\
+  created, filled with the results, and returned. The input sequences \\n\\
+  are not changed and may be read only. The new sequence has the length \\n\\
+  of the part of the input which is used. This cannot be combined with \\n\\
+  outpsequence. This is an optional keyword parameter. \\n\\
+* result - The new sequence if outtype was given, otherwise None. \\n\\
+");
+
+
+/*--------------------------------------------------------------------------- */
+
+/* A list of all the methods defined by this module. 
+ "cmpmask" is the name seen inside of Python. 
+ "py_cmpmask" is the name of the C function handling the Python call. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
+ The {NULL, NULL} entry indicates the end of the method definitions. */
+static PyMethodDef cmpmask_methods[] = {
+	{"cmpmask",  (PyCFunction)py_cmpmask, BF_METHFLAGS, cmpmask__doc__}, 
+	{NULL, NULL, 0, NULL}
+};
+
+
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int cmpmask_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	cmpmask_initsimd();
+	#endif
+
+	return PyModule_AddFunctions(module, cmpmask_methods);
+};
+
+#else
+
+static struct PyModuleDef cmpmaskmodule = {
+    PyModuleDef_HEAD_INIT,
+    "cmpmask",
+    NULL,
+    -1,
+    cmpmask_methods
+};
+
+PyMODINIT_FUNC PyInit_cmpmask(void)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	cmpmask_initsimd();
+	#endif
+
+    return PyModule_Create(&cmpmaskmodule);
+};
+
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+"""
+
+
+# ==============================================================================
+
+# SIMD code for x86 to produce the compare mask. Greater than or equal is
+# found by checking where the maximum is the left value, and less than or
+# equal by checking where the minimum is the left value. The other 
+# operations invert one of these results by comparing it to zero.
+SIMD_x86_mask = {
+'eq' : '''// Compare the slices.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);''',
+'ge' : '''// Find the maximum values, and check where they are the left values.
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);''',
+'gt' : '''// Find the minimum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) resultslice, _mm_setzero_si128());''',
+'le' : '''// Find the minimum values, and check where they are the left values.
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);''',
+'lt' : '''// Find the maximum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) resultslice, _mm_setzero_si128());''',
+'ne' : '''// Compare for equality, and then invert the result.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) resultslice, _mm_setzero_si128());''',
+}
+
+# The same for x86 AVX2.
+SIMD_avx2_mask = {
+'eq' : '''// Compare the slices.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);''',
+'ge' : '''// Find the maximum values, and check where they are the left values.
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);''',
+'gt' : '''// Find the minimum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) resultslice, _mm256_setzero_si256());''',
+'le' : '''// Find the minimum values, and check where they are the left values.
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);''',
+'lt' : '''// Find the maximum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) resultslice, _mm256_setzero_si256());''',
+'ne' : '''// Compare for equality, and then invert the result.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) resultslice, _mm256_setzero_si256());''',
+}
+
+
+# ARM has all the compare operations except for not equal, which inverts 
+# the result of equal.
+def armmaskop(compop, notop, funcname):
+	'''Return the ARM SIMD expression for the compare mask.
+	'''
+	compexpr = '%s(datasliceleft, datasliceright)' % compop
+	if funcname == 'ne':
+		return '%s(%s)' % (notop, compexpr)
+	else:
+		return compexpr
+
+
+# The order that the operators are tested in.
+cmpmask_opsorder = ('eq', 'gt', 'ge', 'lt', 'le', 'ne')
+
+cmpmask_opvals = [{'funclabel' : funcname, 
+				'compare_ops' : compare_ops[funcname],
+				'SIMD_x86_mask' : SIMD_x86_mask[funcname],
+				'SIMD_avx2_mask' : SIMD_avx2_mask[funcname],
+				'SIMD_x86_compslice' : SIMD_x86_compslice[funcname],
+				'SIMD_avx512_pred' : SIMD_avx512_pred[funcname],
+				'SIMD_ARMv7_mask' : armmaskop(SIMD_ARMv7_comp[funcname], 'vmvn_u8', funcname),
+				'SIMD_ARMv8_mask' : armmaskop(SIMD_ARMv8_comp[funcname], 'vmvnq_u8', funcname),
+				'stride_opcode' : stride_opcode[funcname],
+				} for funcname in cmpmask_opsorder]
+
+
+def cmpmask_initsimd(template, simdplat):
+	'''Return the SIMD function selection for all compare operations.
+	'''
+	return '\n'.join([template % dict(opvals, simdplat = simdplat) for opvals in cmpmask_opvals])
+
+
+with open('cmpmask.c', 'w') as f:
+	f.write(cmpmask_head % {'simdfuncfields' : '\n'.join([cmpmask_simdfuncfields % x for x in cmpmask_opvals])})
+
+	for opvals in cmpmask_opvals:
+		f.write(cmpmask_ops % opvals)
+
+	f.write(cmpmask_tail % {'initsimd_avx512' : cmpmask_initsimd(cmpmask_initsimd_x86, 'avx512'),
+				'initsimd_avx2' : cmpmask_initsimd(cmpmask_initsimd_x86, 'avx2'),
+				'initsimd_x86' : cmpmask_initsimd(cmpmask_initsimd_x86, 'x86'),
+				'initsimd_armv7' : cmpmask_initsimd(cmpmask_initsimd_arm, 'armv7'),
+				'initsimd_armv8' : cmpmask_initsimd(cmpmask_initsimd_arm, 'armv8'),
+				'cases_arr_num' : '\n'.join([cmpmask_case_arr_num % x for x in cmpmask_opvals]),
+				'cases_arr_arr' : '\n'.join([cmpmask_case_arr_arr % x for x in cmpmask_opvals]),
+				})
+
+
+# ==============================================================================
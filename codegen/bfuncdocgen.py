@@ -70,8 +70,9 @@ def GetFuncNames(filepath):
 				# split the file prefix from the file extension ('.c') to
 				# get the function name.
 				funcname = os.path.split(os.path.basename(fname))[1].split('.')[0]
-				# We exclude 'simdsupport', as we document it separately.
-				if funcname != 'simdsupport':
+				# We exclude 'simdsupport' and 'threadpool', as we document
+				# them separately.
+				if funcname not in ('simdsupport', 'threadpool'):
 					filedata.append(funcname)
 
 	return filedata
@@ -152,11 +152,11 @@ void invert_1_x86_simd(Py_ssize_t arraylen, unsigned char *data) {
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v2di) __builtin_ia32_lddqu((char *)  &data[index]);
+		datasliceleft = (v2di) _mm_loadu_si128((__m128i *) &data[index]);
 		// The actual SIMD operation. 
-		datasliceleft = __builtin_ia32_pxor128(datasliceleft, vopmask);
+		datasliceleft = (v2di) _mm_xor_si128((__m128i) datasliceleft, (__m128i) vopmask);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data[index], (v16qi) datasliceleft);
+		_mm_storeu_si128((__m128i *) &data[index], (__m128i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -187,11 +187,11 @@ void invert_2_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char *
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v2di) __builtin_ia32_lddqu((char *)  &data[index]);
+		datasliceleft = (v2di) _mm_loadu_si128((__m128i *) &data[index]);
 		// The actual SIMD operation. 
-		datasliceleft = __builtin_ia32_pxor128(datasliceleft, vopmask);
+		datasliceleft = (v2di) _mm_xor_si128((__m128i) datasliceleft, (__m128i) vopmask);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &dataout[index], (v16qi) datasliceleft);
+		_mm_storeu_si128((__m128i *) &dataout[index], (__m128i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -205,6 +205,178 @@ void invert_2_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char *
 /*--------------------------------------------------------------------------- */
 
 
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX2 SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   dataout = The output data array.
+*/
+// param_arr_none
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void invert_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v4di datasliceleft;
+	v4di vopmask = {-1, -1, -1, -1};
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data into the vector register.
+		datasliceleft = (v4di) _mm256_loadu_si256((__m256i *) &data[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft ^ vopmask;
+		// Store the result.
+		_mm256_storeu_si256((__m256i *) &data[index], (__m256i) datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data[index] = ~data[index];
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX2 void invert_2_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char *dataout) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v4di datasliceleft;
+	v4di vopmask = {-1, -1, -1, -1};
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data into the vector register.
+		datasliceleft = (v4di) _mm256_loadu_si256((__m256i *) &data[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft ^ vopmask;
+		// Store the result.
+		_mm256_storeu_si256((__m256i *) &dataout[index], (__m256i) datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		dataout[index] = ~data[index];
+	}
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX-512BW SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   dataout = The output data array.
+*/
+// param_arr_none
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void invert_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+
+	v8di datasliceleft;
+	v8di vopmask = {-1, -1, -1, -1, -1, -1, -1, -1};
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		datasliceleft = (v8di) _mm512_loadu_si512(&data[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft ^ vopmask;
+		// Store the result.
+		_mm512_storeu_si512(&data[index], (__m512i) datasliceleft);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v8di) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		datasliceleft = datasliceleft ^ vopmask;
+		_mm512_mask_storeu_epi8(&data[alignedlength], tailmask, (__m512i) datasliceleft);
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX512BW void invert_2_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char *dataout) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+
+	v8di datasliceleft;
+	v8di vopmask = {-1, -1, -1, -1, -1, -1, -1, -1};
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		datasliceleft = (v8di) _mm512_loadu_si512(&data[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft ^ vopmask;
+		// Store the result.
+		_mm512_storeu_si512(&dataout[index], (__m512i) datasliceleft);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v8di) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		datasliceleft = datasliceleft ^ vopmask;
+		_mm512_mask_storeu_epi8(&dataout[alignedlength], tailmask, (__m512i) datasliceleft);
+	}
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+
 /*--------------------------------------------------------------------------- */
 /* For ARMv7 NEON SIMD.
    The following series of functions reflect the different parameter options possible.
@@ -365,9 +537,55 @@ void invert_2_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char
 /*--------------------------------------------------------------------------- */
 
 
+/*--------------------------------------------------------------------------- */
+/* The SIMD functions to use. These are selected once when the module is 
+   initialised, according to the SIMD features supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	void (*param_arr_none)(Py_ssize_t arraylen, unsigned char *data);
+	void (*param_arr_arr)(Py_ssize_t arraylen, unsigned char *data, unsigned char *dataout);
+} invert_simdfuncs;
+
+
+/* Select the SIMD functions for this CPU.
+*/
+static void invert_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		invert_simdfuncs.param_arr_none = invert_1_avx512_simd;
+		invert_simdfuncs.param_arr_arr = invert_2_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		invert_simdfuncs.param_arr_none = invert_1_avx2_simd;
+		invert_simdfuncs.param_arr_arr = invert_2_avx2_simd;
+	} else {
+		invert_simdfuncs.param_arr_none = invert_1_x86_simd;
+		invert_simdfuncs.param_arr_arr = invert_2_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	invert_simdfuncs.param_arr_none = invert_1_armv7_simd;
+	invert_simdfuncs.param_arr_arr = invert_2_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	invert_simdfuncs.param_arr_none = invert_1_armv8_simd;
+	invert_simdfuncs.param_arr_arr = invert_2_armv8_simd;
+	#endif
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data = The input data array.
    nosimd = If true, disable SIMD acceleration.
@@ -376,18 +594,7 @@ void invert_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data) {
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			invert_1_x86_simd(arraylen, data);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			invert_1_armv7_simd(arraylen, data);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			invert_1_armv8_simd(arraylen, data);
-		#endif
-
+		invert_simdfuncs.param_arr_none(arraylen, data);
 	} else {
 	#endif
 		invert_1(arraylen, data);
@@ -403,7 +610,7 @@ void invert_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data) {
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data = The input data array.
    dataout = The output data array.
@@ -413,18 +620,7 @@ void invert_2_select(Py_ssize_t arraylen, int nosimd, unsigned char *data, unsig
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			invert_2_x86_simd(arraylen, data, dataout);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			invert_2_armv7_simd(arraylen, data, dataout);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			invert_2_armv8_simd(arraylen, data, dataout);
-		#endif
-
+		invert_simdfuncs.param_arr_arr(arraylen, data, dataout);
 	} else {
 	#endif
 		invert_2(arraylen, data, dataout);
@@ -439,7 +635,7 @@ void invert_2_select(Py_ssize_t arraylen, int nosimd, unsigned char *data, unsig
 /*--------------------------------------------------------------------------- */
 
 /* The wrapper to the underlying C function */
-static PyObject *py_invert(PyObject *self, PyObject *args, PyObject *keywds) {
+static PyObject *py_invert(PyObject *self, BF_ARGSDECL) {
 
 
 	// This is used to hold the parsed parameters.
@@ -449,7 +645,7 @@ static PyObject *py_invert(PyObject *self, PyObject *args, PyObject *keywds) {
 
 
 	// Get the parameters passed from Python.
-	bytesdata = getparams_one(self, args, keywds, "invert");
+	bytesdata = getparams_one(self, BF_ARGSPASS);
 
 	// If there was an error, we count on the parameter parsing function to 
 	// release the buffers if this was necessary.
@@ -459,11 +655,14 @@ static PyObject *py_invert(PyObject *self, PyObject *args, PyObject *keywds) {
 
 
 	// Call the C function.
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
 	if (bytesdata.hasoutputseq) {
 		invert_2_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.bytes2.B);
 	} else {
 		invert_1_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B);
 	}
+	BF_END_ALLOW_THREADS
 
 
 
@@ -471,6 +670,11 @@ static PyObject *py_invert(PyObject *self, PyObject *args, PyObject *keywds) {
 	releasebuffers_one(bytesdata);
 
 
+	// Return the new output sequence if one was created.
+	if (bytesdata.outobj != NULL) {
+		return bytesdata.outobj;
+	}
+
 	// Everything was successful.
 	Py_RETURN_NONE;
 
@@ -496,7 +700,9 @@ Call formats: \\n\\
     invert(sequence1) \\n\\
     invert(sequence1, outpseq) \\n\\
     invert(sequence1, maxlen=y) \\n\\
+    invert(sequence1, start=i, stop=j) \\n\\
     invert(sequence1, nosimd=False) \\n\\
+    result = invert(sequence1, outtype=bytes) \\n\\
  \\n\\
 * sequence1 - The input bytes or bytearray to be examined. If no output \\n\\
   bytearray is provided the results will overwrite the input data, in which \\n\\
@@ -506,8 +712,18 @@ Call formats: \\n\\
   positive integer. If a zero or negative length, or a value which is \\n\\
   greater than the actual length of the sequence is specified, this \\n\\
   parameter is ignored. \\n\\
+* start, stop - Work on only part of the sequence, as if it had been \\n\\
+  sliced with sequence[start:stop]. The same part of every sequence is \\n\\
+  used. These are optional keyword parameters and are applied before \\n\\
+  maxlen. No data is copied. \\n\\
 * nosimd - If True, SIMD acceleration is disabled. This parameter is \\n\\
   optional. The default is FALSE. \\n\\
+* outtype - If bytes or bytearray, a new sequence of that type is \\n\\
+  created, filled with the results, and returned. The input sequence \\n\\
+  is not changed and may be read only. The new sequence has the length \\n\\
+  of the part of the input which is used. This cannot be combined with \\n\\
+  outpseq. This is an optional keyword parameter. \\n\\
+* result - The new sequence if outtype was given, otherwise None. \\n\\
 ");
 
 
@@ -516,14 +732,31 @@ Call formats: \\n\\
 /* A list of all the methods defined by this module. 
  "invert" is the name seen inside of Python. 
  "py_invert" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef invert_methods[] = {
-	{"invert",  (PyCFunction)py_invert, METH_VARARGS | METH_KEYWORDS, invert__doc__}, 
+	{"invert",  (PyCFunction)py_invert, BF_METHFLAGS, invert__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int invert_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	invert_initsimd();
+	#endif
+
+	return PyModule_AddFunctions(module, invert_methods);
+};
+
+#else
+
 static struct PyModuleDef invertmodule = {
     PyModuleDef_HEAD_INIT,
     "invert",
@@ -534,9 +767,15 @@ static struct PyModuleDef invertmodule = {
 
 PyMODINIT_FUNC PyInit_invert(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	invert_initsimd();
+	#endif
+
     return PyModule_Create(&invertmodule);
 };
 
+#endif
+
 /*--------------------------------------------------------------------------- */
 
 """
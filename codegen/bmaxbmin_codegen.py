@@ -70,6 +70,9 @@ opstemplate = """//-------------------------------------------------------------
 
 #include "bytesparams_base.h"
 #include "bytesparams_valoutsimd.h"
+#include "bytesparams_many.h"
+#include "bytesthreads.h"
+#include "bytesstride.h"
 
 
 /*--------------------------------------------------------------------------- */
@@ -120,16 +123,16 @@ unsigned char %(funclabel)s_x86_simd(Py_ssize_t arraylen, unsigned char *data) {
 	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
 
 	// Initialise the comparison values.
-	%(optype)sslice = (v16qi) __builtin_ia32_lddqu((char *) &data[0]);
+	%(optype)sslice = (v16qi) _mm_loadu_si128((__m128i *) &data[0]);
 
 	// Use SIMD.
 	for(x = CHARSIMDSIZE; x < alignedlength; x += CHARSIMDSIZE) {
-		dataslice = (v16qi) __builtin_ia32_lddqu((char *) &data[x]);
-		%(optype)sslice = %(simdvalues_x86)s (%(optype)sslice, dataslice);
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x]);
+		%(optype)sslice = (v16qi) %(simdvalues_x86)s ((__m128i) %(optype)sslice, (__m128i) dataslice);
 	}
 
 	// Find the %(optype)s within the slice.
-	__builtin_ia32_storedqu((char *) %(optype)svals,   %(optype)sslice);
+	_mm_storeu_si128((__m128i *) %(optype)svals, (__m128i) %(optype)sslice);
 	%(optype)sfound = %(optype)svals[0];
 	for (y = 1; y < CHARSIMDSIZE; y++) {
 		if (%(optype)svals[y] %(compare_ops)s %(optype)sfound) {
@@ -150,6 +153,119 @@ unsigned char %(funclabel)s_x86_simd(Py_ssize_t arraylen, unsigned char *data) {
 /*--------------------------------------------------------------------------- */
 
 
+/*--------------------------------------------------------------------------- */
+/* For x86-64 AVX2 SIMD.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   Returns: The %(optype)simum value found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 unsigned char %(funclabel)s_avx2_simd(Py_ssize_t arraylen, unsigned char *data) { 
+
+	// array index counter. 
+	Py_ssize_t x, alignedlength; 
+	unsigned int y;
+	unsigned char %(optype)sfound;
+
+	unsigned char %(optype)svals[CHARSIMDSIZE_AVX2];
+	v32qi %(optype)sslice, dataslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Initialise the comparison values.
+	%(optype)sslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[0]);
+
+	// Use SIMD.
+	for(x = CHARSIMDSIZE_AVX2; x < alignedlength; x += CHARSIMDSIZE_AVX2) {
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x]);
+		%(optype)sslice = (v32qi) %(simdvalues_avx2)s ((__m256i) %(optype)sslice, (__m256i) dataslice);
+	}
+
+	// Find the %(optype)s within the slice.
+	_mm256_storeu_si256((__m256i *) %(optype)svals, (__m256i) %(optype)sslice);
+	%(optype)sfound = %(optype)svals[0];
+	for (y = 1; y < CHARSIMDSIZE_AVX2; y++) {
+		if (%(optype)svals[y] %(compare_ops)s %(optype)sfound) {
+			%(optype)sfound = %(optype)svals[y];
+		}
+	}
+
+	// Get the %(optype)s value within the left over elements at the end of the array.
+	for(x = alignedlength; x < arraylen; x++) {
+		if (data[x] %(compare_ops)s %(optype)sfound) {
+			%(optype)sfound = data[x];
+		}
+	}
+
+	return %(optype)sfound;
+}
+#endif
+/*--------------------------------------------------------------------------- */
+
+
+/*--------------------------------------------------------------------------- */
+/* For x86-64 AVX-512BW SIMD.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   Returns: The %(optype)simum value found.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW unsigned char %(funclabel)s_avx512_simd(Py_ssize_t arraylen, unsigned char *data) { 
+
+	// array index counter. 
+	Py_ssize_t x, alignedlength; 
+	unsigned int y;
+	unsigned char %(optype)sfound;
+	unsigned long long tailmask;
+
+	unsigned char %(optype)svals[CHARSIMDSIZE_AVX512];
+	v64qi %(optype)sslice, dataslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Initialise the comparison values. The first element is used in every
+	// position, as the array may be shorter than the SIMD width.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		%(optype)svals[y] = data[0];
+	}
+	%(optype)sslice = (v64qi) _mm512_loadu_si512(%(optype)svals);
+
+	// Use SIMD.
+	for(x = 0; x < alignedlength; x += CHARSIMDSIZE_AVX512) {
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x]);
+		%(optype)sslice = (v64qi) %(simdvalues_avx512)s ((__m512i) %(optype)sslice, (__m512i) dataslice);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load. The elements which are masked off are taken from the
+	// current %(optype)s values, so they do not affect the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = (v64qi) _mm512_mask_loadu_epi8((__m512i) %(optype)sslice, tailmask, &data[alignedlength]);
+		%(optype)sslice = (v64qi) %(simdvalues_avx512)s ((__m512i) %(optype)sslice, (__m512i) dataslice);
+	}
+
+	// Find the %(optype)s within the slice.
+	_mm512_storeu_si512(%(optype)svals, (__m512i) %(optype)sslice);
+	%(optype)sfound = %(optype)svals[0];
+	for (y = 1; y < CHARSIMDSIZE_AVX512; y++) {
+		if (%(optype)svals[y] %(compare_ops)s %(optype)sfound) {
+			%(optype)sfound = %(optype)svals[y];
+		}
+	}
+
+	return %(optype)sfound;
+}
+#endif
+/*--------------------------------------------------------------------------- */
+
+
 /*--------------------------------------------------------------------------- */
 /* For ARMv7 NEON SIMD.
    arraylen = The length of the data arrays.
@@ -257,9 +373,48 @@ unsigned char %(funclabel)s_armv8_simd(Py_ssize_t arraylen, unsigned char *data)
 
 
 
+/*--------------------------------------------------------------------------- */
+/* The SIMD function to use. This is selected once when the module is 
+   initialised, according to the SIMD features supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static unsigned char (*%(funclabel)s_simdfunc)(Py_ssize_t arraylen, unsigned char *data);
+
+
+/* Select the SIMD function for this CPU. This is also used by the
+	accumulators module, which links in the same kernels.
+*/
+void %(funclabel)s_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		%(funclabel)s_simdfunc = %(funclabel)s_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		%(funclabel)s_simdfunc = %(funclabel)s_avx2_simd;
+	} else {
+		%(funclabel)s_simdfunc = %(funclabel)s_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	%(funclabel)s_simdfunc = %(funclabel)s_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_simdfunc = %(funclabel)s_armv8_simd;
+	#endif
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data = The input data array.
    Returns: The %(optype)simum value found.
@@ -268,18 +423,7 @@ unsigned char %(funclabel)s_select(Py_ssize_t arraylen, int nosimd, unsigned cha
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return %(funclabel)s_x86_simd(arraylen, data);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return %(funclabel)s_armv7_simd(arraylen, data);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return %(funclabel)s_armv8_simd(arraylen, data);
-		#endif
-
+		return %(funclabel)s_simdfunc(arraylen, data);
 	} else {
 	#endif
 		return %(funclabel)s(arraylen, data);
@@ -292,13 +436,73 @@ unsigned char %(funclabel)s_select(Py_ssize_t arraylen, int nosimd, unsigned cha
 
 /*--------------------------------------------------------------------------- */
 
+// The accumulators module links in this file for the functions above only.
+// It defines BF_KERNELSONLY to leave out the rest, which includes the Python
+// functions and the module initialisation.
+#if !defined(BF_KERNELSONLY)
+
+/*--------------------------------------------------------------------------- */
+
+// The data for a calculation which may be divided between threads.
+struct %(funclabel)s_threadctx {
+	struct args_params_valoutsimd *bytesdata;
+	// The %(optype)simum value found in each part.
+	unsigned char partresults[BF_MAXTHREADS];
+};
+
+
+/* Calculate the %(optype)simum for one part of the sequence. If the calculation
+	is not divided between threads, then there is just one part covering the
+	whole sequence.
+	ctx = The calculation data (struct %(funclabel)s_threadctx).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void %(funclabel)s_part(void *ctx, int part, int nparts) {
+
+	struct %(funclabel)s_threadctx *threadctx = (struct %(funclabel)s_threadctx *) ctx;
+	struct args_params_valoutsimd *bytesdata = threadctx->bytesdata;
+
+	// The range of this part of the sequence.
+	Py_ssize_t start, partlen;
+
+	// When a step is used, each part must begin on an element which is used.
+	if (bytesdata->step > 1) {
+		partrangestep(bytesdata->arraylen, bytesdata->step, part, nparts, &start, &partlen);
+	} else {
+		partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
+	}
+
+	// An empty part is given a value from the sequence so it cannot
+	// affect the combined result.
+	if (partlen < 1) {
+		threadctx->partresults[part] = bytesdata->bytes1.B[0];
+		return;
+	}
+
+	if (bytesdata->step > 1) {
+		threadctx->partresults[part] = stride%(optype)s_select(partlen, bytesdata->step, bytesdata->nosimd, bytesdata->bytes1.B + start);
+	} else {
+		threadctx->partresults[part] = %(funclabel)s_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start);
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
 /* The wrapper to the underlying C function */
-static PyObject *py_%(funclabel)s(PyObject *self, PyObject *args, PyObject *keywds) {
+static PyObject *py_%(funclabel)s(PyObject *self, BF_ARGSDECL) {
 
 
 	// This is used to hold the parsed parameters.
 	struct args_params_valoutsimd bytesdata = ARGSINIT_VALOUTSIMD;
 
+	// The data for the calculation, including the result of each part.
+	struct %(funclabel)s_threadctx threadctx;
+
+	// The number of parts to divide the calculation into.
+	int nparts, part;
 
 	// The output will be an integer.
 	unsigned char result;
@@ -307,7 +511,7 @@ static PyObject *py_%(funclabel)s(PyObject *self, PyObject *args, PyObject *keyw
 
 
 	// Get the parameters passed from Python.
-	bytesdata = getparams_valoutsimd(self, args, keywds, "%(funclabel)s");
+	bytesdata = getparams_valoutsimd(self, BF_ARGSPASS);
 
 
 	// If there was an error, we count on the parameter parsing function to 
@@ -325,8 +529,23 @@ static PyObject *py_%(funclabel)s(PyObject *self, PyObject *args, PyObject *keyw
 		return NULL;
 	}
 
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+	threadctx.bytesdata = &bytesdata;
+
 	// Call the calculation function.
-	result = %(funclabel)s_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B);
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	nparts = runparallel(%(funclabel)s_part, &threadctx, nparts);
+	BF_END_ALLOW_THREADS
+
+	// Combine the results from each part.
+	result = threadctx.partresults[0];
+	for (part = 1; part < nparts; part++) {
+		if (threadctx.partresults[part] %(compare_ops)s result) {
+			result = threadctx.partresults[part];
+		}
+	}
 
 	// Release the buffers. 
 	releasebuffers_valoutsimd(bytesdata);
@@ -355,32 +574,153 @@ Call formats: \\n\\
 \\n\\
   result = %(funclabel)s(sequence) \\n\\
   result = %(funclabel)s(sequence, maxlen=y) \\n\\
+  result = %(funclabel)s(sequence, start=i, stop=j) \\n\\
+  result = %(funclabel)s(sequence, step=k) \\n\\
   result = %(funclabel)s(sequence, nosimd=False) \\n\\
+  result = %(funclabel)s(sequence, threads=4) \\n\\
 \\n\\
 * sequence - The input bytes or bytearray to be examined. \\n\\
 * maxlen - Limit the length of the sequence used. This must be a valid \\n\\
   positive integer. If a zero or negative length, or a value which is \\n\\
   greater than the actual length of the sequence is specified, this \\n\\
   parameter is ignored. \\n\\
+* start, stop - Work on only part of the sequence, as if it had been \\n\\
+  sliced with sequence[start:stop]. These are optional keyword \\n\\
+  parameters and are applied before maxlen. No data is copied. \\n\\
+* step - Use only every step'th element, as if the sequence had been \\n\\
+  sliced with sequence[start:stop:step]. This must be a positive \\n\\
+  integer. This is an optional keyword parameter. \\n\\
 * nosimd - If True, SIMD acceleration is disabled if present. \\n\\
   The default is False (SIMD acceleration is enabled if present). \\n\\
+* threads - The number of threads to divide the calculation between. \\n\\
+  This parameter is optional. If zero or not specified, the default set \\n\\
+  by setthreads is used. Short sequences are not divided. \\n\\
 * result = The %(optype)simum of all the values in the sequence. \\n\\
 ");
 
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function for a batch of sequences */
+static PyObject *py_%(funclabel)s_many(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The result for each sequence.
+	Py_ssize_t *results;
+
+	// The results as a python list.
+	PyObject *resultlist;
+
+	Py_ssize_t x;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_many_one(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// Every sequence must contain data.
+	if (hasemptyseq_many(&bytesdata)) {
+		// Release the buffers. 
+		releasebuffers_many(bytesdata);
+		ErrMsgArrayLengthErr();
+		return NULL;
+	}
+
+	results = PyMem_New(Py_ssize_t, bytesdata.nseqs + 1);
+	if (results == NULL) {
+		releasebuffers_many(bytesdata);
+		return PyErr_NoMemory();
+	}
+
+	// Call the calculation function for each sequence.
+	// The GIL is released if the batch is large.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.totallen)
+	for (x = 0; x < bytesdata.nseqs; x++) {
+		results[x] = %(funclabel)s_select(bytesdata.pybuffers[x].len, bytesdata.nosimd, bytesdata.pybuffers[x].buf);
+	}
+	BF_END_ALLOW_THREADS
+
+	// Release the buffers. 
+	releasebuffers_many(bytesdata);
+
+	resultlist = ssizelist_many(results, bytesdata.nseqs);
+	PyMem_Free(results);
+
+	return resultlist;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(%(funclabel)s_many__doc__,
+"%(funclabel)s_many \\n\\
+_____________________________ \\n\\
+\\n\\
+Calculate %(funclabel)s over the values in each sequence in a batch.  \\n\\
+\\n\\
+======================  ============================================== \\n\\
+Equivalent to:          [%(optype)s(x) for x in sequences] \\n\\
+======================  ============================================== \\n\\
+\\n\\
+Call formats: \\n\\
+\\n\\
+  result = %(funclabel)s_many(sequences) \\n\\
+  result = %(funclabel)s_many(sequences, nosimd=False) \\n\\
+\\n\\
+* sequences - A list or other iterable of bytes or bytearray sequences. \\n\\
+  None of them may be empty. \\n\\
+* nosimd - If True, SIMD acceleration is disabled if present. \\n\\
+  The default is False (SIMD acceleration is enabled if present). \\n\\
+* result = A list with the %(optype)simum of each sequence. \\n\\
+");
+
 
 /*--------------------------------------------------------------------------- */
 
 /* A list of all the methods defined by this module. 
  "%(funclabel)s" is the name seen inside of Python. 
  "py_%(funclabel)s" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef %(funclabel)s_methods[] = {
-	{"%(funclabel)s",  (PyCFunction)py_%(funclabel)s, METH_VARARGS | METH_KEYWORDS, %(funclabel)s__doc__}, 
+	{"%(funclabel)s",  (PyCFunction)py_%(funclabel)s, BF_METHFLAGS, %(funclabel)s__doc__}, 
+	{"%(funclabel)s_many",  (PyCFunction)py_%(funclabel)s_many, BF_METHFLAGS, %(funclabel)s_many__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int %(funclabel)s_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
+	return PyModule_AddFunctions(module, %(funclabel)s_methods);
+};
+
+#else
+
 static struct PyModuleDef %(funclabel)smodule = {
     PyModuleDef_HEAD_INIT,
     "%(funclabel)s",
@@ -391,9 +731,20 @@ static struct PyModuleDef %(funclabel)smodule = {
 
 PyMODINIT_FUNC PyInit_%(funclabel)s(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
     return PyModule_Create(&%(funclabel)smodule);
 };
 
+#endif
+
+// End of the code which is left out of the accumulators module.
+#endif
+
 /*--------------------------------------------------------------------------- */
 """
 
@@ -401,7 +752,9 @@ PyMODINIT_FUNC PyInit_%(funclabel)s(void)
 
 optype = {'bmax' : 'max', 'bmin' : 'min'}
 compare_ops = {'bmax' : '>', 'bmin' : '<'}
-simdvalues_x86 = {'bmax' : '__builtin_ia32_pmaxub128', 'bmin' : '__builtin_ia32_pminub128'}
+simdvalues_x86 = {'bmax' : '_mm_max_epu8', 'bmin' : '_mm_min_epu8'}
+simdvalues_avx2 = {'bmax' : '_mm256_max_epu8', 'bmin' : '_mm256_min_epu8'}
+simdvalues_avx512 = {'bmax' : '_mm512_max_epu8', 'bmin' : '_mm512_min_epu8'}
 simdvalues_armv7 = {'bmax' : 'vmax_u8', 'bmin' : 'vmin_u8'}
 simdvalues_armv8 = {'bmax' : 'vmaxq_u8', 'bmin' : 'vminq_u8'}
 
@@ -418,6 +771,8 @@ for funcname in ('bmax', 'bmin'):
 								'optype' : optype[funcname],
 								'compare_ops' : compare_ops[funcname],
 								'simdvalues_x86' : simdvalues_x86[funcname],
+								'simdvalues_avx2' : simdvalues_avx2[funcname],
+								'simdvalues_avx512' : simdvalues_avx512[funcname],
 								'simdvalues_armv7' : simdvalues_armv7[funcname],
 								'simdvalues_armv8' : simdvalues_armv8[funcname],
 								})
@@ -70,6 +70,9 @@ sumbin_head = """//-------------------------------------------------------------
 #include "byteserrs.h"
 #include "bytesparams_base.h"
 #include "bytesparams_bsum.h"
+#include "bytesparams_many.h"
+#include "bytesthreads.h"
+#include "bytesstride.h"
 
 #include "simddefs.h"
 
@@ -127,6 +130,15 @@ sumbin_head = """//-------------------------------------------------------------
 // enough that overflow cannot occur within the "chunk".
 #define LOOPCHUNKSIZE 256
 
+// The chunk size used with SIMD. The x86 SIMD functions accumulate into 64 
+// bit sums, so they need larger chunks only to limit how often the overflow
+// checks are done. The ARM SIMD functions accumulate into 16 bit sums.
+#if defined(AF_HASSIMD_X86)
+#define SIMDCHUNKSIZE 1048576
+#else
+#define SIMDCHUNKSIZE LOOPCHUNKSIZE
+#endif
+
 
 // Integer overflow checks.
 
@@ -159,7 +171,7 @@ unsigned long long bsum_unsigned_char(Py_ssize_t arraylen, unsigned char *data,
 
 	*errflag = 0;
 
-	#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
 		// Overflow checking disabled.
 		if (ignoreerrors || skipovflcheck(arraylen)) {
@@ -186,13 +198,183 @@ unsigned long long bsum_unsigned_char(Py_ssize_t arraylen, unsigned char *data,
 				partialsum = partialsum + (unsigned long long) data[x];
 			}
 		}
-	#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	}
 	#endif
 
 	return partialsum;
 }
 /*--------------------------------------------------------------------------- */
+
+/*--------------------------------------------------------------------------- */
+
+// The accumulators module links in this file for the functions above only.
+// It defines BF_KERNELSONLY to leave out the rest, which includes the Python
+// functions and the module initialisation.
+#if !defined(BF_KERNELSONLY)
+
+/*--------------------------------------------------------------------------- */
+/* For array code: B, using only every step'th element.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   errflag = Set to true if an overflow error occured in integer operations.
+   ignoreerrors = If true, arithmetic overflow checking is disabled.
+   Returns: The sum of the elements used.
+*/
+unsigned long long bsum_unsigned_char_step(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data, signed int *errflag, signed int ignoreerrors, signed int nosimd) { 
+
+	// array index counter. 
+	Py_ssize_t x; 
+	unsigned long long partialsum = 0;
+
+	*errflag = 0;
+
+	// Overflow checking disabled.
+	if (ignoreerrors || skipovflcheck(arraylen)) {
+		return stridesum_select(arraylen, step, nosimd, data);
+	}
+
+	// Overflow checking enabled.
+	for (x = 0; x < arraylen; x += step) {
+		if (data[x] > (ULLONG_MAX - partialsum)) { 
+			*errflag = ARR_ERR_OVFL;
+			return partialsum; 
+		}
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	return partialsum;
+}
+/*--------------------------------------------------------------------------- */
+"""
+
+# ==============================================================================
+# Template for integer SIMD support for x86.
+ops_simdsupport_x86_innerloop = """
+/*--------------------------------------------------------------------------- */
+
+/* For array code: B
+   arraylen = The length of the data array.
+   data = The input data array.
+   Returns: The sum of the array.
+*/
+// psadbw against zero adds each group of 8 bytes into a 64 bit sum, so
+// the accumulator cannot overflow within a chunk of any practical size.
+%(simdplatform)s
+%(simdtarget)sunsigned long long innerloop_bsum_unsigned_char%(simdfunclabel)s(Py_ssize_t arraylen, unsigned char *data) { 
+
+	// array index counter. 
+	Py_ssize_t x, alignedlength; 
+	unsigned int y;
+	unsigned long long partialsum = 0;
+
+	unsigned long long sumvals[%(simdwidth)s / 8];
+	%(simdattr)s dataslice, zeroslice, resultslice;
+
+
+	// Initialise the accumulator.
+	zeroslice = (%(simdattr)s) %(simdzero)s();
+	resultslice = zeroslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, %(simdwidth)s);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += %(simdwidth)s) {
+
+		// Load the data into the vector register.
+		dataslice = (%(simdattr)s) %(simdload)s(%(simdcast)s&data[x]);
+
+		// The actual SIMD operation. 
+		resultslice = (%(simdattr)s) %(simdadd)s((%(simdtype)s) resultslice, %(simdsad)s((%(simdtype)s) dataslice, (%(simdtype)s) zeroslice));
+
+	}
+
+	// Add up the values within the slice.
+	%(simdstore)s(%(simdcast)ssumvals, (%(simdtype)s) resultslice);
+	for (y = 0; y < (%(simdwidth)s / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	// Add the values within the left over elements at the end of the array.
+	for (x = alignedlength; x < arraylen; x++) {
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	return partialsum;
+
+}
+#endif
+
+"""
+
+# ==============================================================================
+# Template for integer SIMD support for x86 AVX-512. The left over elements
+# at the end of the array are handled with a masked load.
+ops_simdsupport_avx512_innerloop = """
+/*--------------------------------------------------------------------------- */
+
+/* For array code: B
+   arraylen = The length of the data array.
+   data = The input data array.
+   Returns: The sum of the array.
+*/
+// psadbw against zero adds each group of 8 bytes into a 64 bit sum, so
+// the accumulator cannot overflow within a chunk of any practical size.
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW unsigned long long innerloop_bsum_unsigned_char_avx512_simd(Py_ssize_t arraylen, unsigned char *data) { 
+
+	// array index counter. 
+	Py_ssize_t x, alignedlength; 
+	unsigned int y;
+	unsigned long long partialsum = 0;
+	unsigned long long tailmask;
+
+	unsigned long long sumvals[CHARSIMDSIZE_AVX512 / 8];
+	v64qi dataslice, zeroslice, resultslice;
+
+
+	// Initialise the accumulator.
+	zeroslice = (v64qi) _mm512_setzero_si512();
+	resultslice = zeroslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += CHARSIMDSIZE_AVX512) {
+
+		// Load the data into the vector register.
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x]);
+
+		// The actual SIMD operation. 
+		resultslice = (v64qi) _mm512_add_epi64((__m512i) resultslice, _mm512_sad_epu8((__m512i) dataslice, (__m512i) zeroslice));
+
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load. The elements which are masked off are set to zero, so
+	// they do not affect the sum.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultslice = (v64qi) _mm512_add_epi64((__m512i) resultslice, _mm512_sad_epu8((__m512i) dataslice, (__m512i) zeroslice));
+	}
+
+	// Add up the values within the slice.
+	_mm512_storeu_si512(sumvals, (__m512i) resultslice);
+	for (y = 0; y < (CHARSIMDSIZE_AVX512 / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	return partialsum;
+
+}
+#endif
+
 """
 
 # ==============================================================================
@@ -256,37 +438,66 @@ unsigned long long innerloop_bsum_unsigned_char%(simdfunclabel)s(Py_ssize_t arra
 """
 
 # This is needed only once.
-ops_simdsupport_arm_outerloop = """
+ops_simdsupport_outerloop = """
 
 /*--------------------------------------------------------------------------- */
+/* The SIMD inner loop to use. This is selected once when the module is 
+   initialised, according to the SIMD features supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static unsigned long long (*bsum_simdfunc)(Py_ssize_t arraylen, unsigned char *data);
+
+
+/* Select the SIMD function for this CPU. This is also used by the
+	accumulators module, which links in the same kernels.
+*/
+void bsum_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		bsum_simdfunc = innerloop_bsum_unsigned_char_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		bsum_simdfunc = innerloop_bsum_unsigned_char_avx2_simd;
+	} else {
+		bsum_simdfunc = innerloop_bsum_unsigned_char_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	bsum_simdfunc = innerloop_bsum_unsigned_char_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	bsum_simdfunc = innerloop_bsum_unsigned_char_armv8_simd;
+	#endif
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
 /* For array code: B
    arraylen = The length of the data array.
    data = The input data array.
    Returns: The sum of the array.
 */
 // Version without error checking.
-#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 unsigned long long bsum_unsigned_char_simd(Py_ssize_t arraylen, unsigned char *data) { 
 
 	Py_ssize_t x, loopremaining, loopchunk;
 	unsigned long long partialsum = 0;
 
-	for(x=0; x < arraylen; x += LOOPCHUNKSIZE) {
+	for(x=0; x < arraylen; x += SIMDCHUNKSIZE) {
 		// The array is summed in "chunks" using SIMD and then each
 		// chunk added to the total.
 		loopremaining = arraylen - x;
-		loopchunk = (loopremaining >  LOOPCHUNKSIZE) ? LOOPCHUNKSIZE : loopremaining;
+		loopchunk = (loopremaining >  SIMDCHUNKSIZE) ? SIMDCHUNKSIZE : loopremaining;
 
 		// Add the chunk to the grand total.
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-		partialsum = partialsum + innerloop_bsum_unsigned_char_armv7_simd(loopchunk, &data[x]);
-#endif
-
-#if defined(AF_HASSIMD_ARM_AARCH64)
-		partialsum = partialsum + innerloop_bsum_unsigned_char_armv8_simd(loopchunk, &data[x]);
-#endif
-
-
+		partialsum = partialsum + bsum_simdfunc(loopchunk, &data[x]);
 	}
 
 	return partialsum;
@@ -302,27 +513,21 @@ unsigned long long bsum_unsigned_char_simd(Py_ssize_t arraylen, unsigned char *d
    errflag = Set to true if an error occured.
    Returns: The sum of the array.
 */
-#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 unsigned long long bsum_unsigned_char_simd_ovfl(Py_ssize_t arraylen, unsigned char *data, signed int *errflag) { 
 
 	unsigned long long partialsum = 0;
 	unsigned long long chunksum;
 	Py_ssize_t x, loopremaining, loopchunk;
 
-	for(x=0; x < arraylen; x += LOOPCHUNKSIZE) {
+	for(x=0; x < arraylen; x += SIMDCHUNKSIZE) {
 		// The array is summed in "chunks" using SIMD and then each
 		// chunk added to the total.
 		loopremaining = arraylen - x;
-		loopchunk = (loopremaining >  LOOPCHUNKSIZE) ? LOOPCHUNKSIZE : loopremaining;
+		loopchunk = (loopremaining >  SIMDCHUNKSIZE) ? SIMDCHUNKSIZE : loopremaining;
 
 		// Add up one "chunk" of the array.
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-		chunksum = innerloop_bsum_unsigned_char_armv7_simd(loopchunk, &data[x]);
-#endif
-
-#if defined(AF_HASSIMD_ARM_AARCH64)
-		chunksum = innerloop_bsum_unsigned_char_armv8_simd(loopchunk, &data[x]);
-#endif
+		chunksum = bsum_simdfunc(loopchunk, &data[x]);
 
 		// Check for overflow.
 		if (loop_willoverflow_unsigned(chunksum, partialsum)) {
@@ -350,13 +555,62 @@ unsigned long long bsum_unsigned_char_simd_ovfl(Py_ssize_t arraylen, unsigned ch
 bsum_params = """
 /*--------------------------------------------------------------------------- */
 
+// The data for a calculation which may be divided between threads.
+struct bsum_threadctx {
+	struct args_params_bsum *bytesdata;
+	// The sum of each part.
+	unsigned long long partsums[BF_MAXTHREADS];
+	// The error flag for each part.
+	signed int parterrors[BF_MAXTHREADS];
+};
+
+
+/* Calculate the sum of one part of the sequence. If the calculation is not
+	divided between threads, then there is just one part covering the whole
+	sequence.
+	ctx = The calculation data (struct bsum_threadctx).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void bsum_part(void *ctx, int part, int nparts) {
+
+	struct bsum_threadctx *threadctx = (struct bsum_threadctx *) ctx;
+	struct args_params_bsum *bytesdata = threadctx->bytesdata;
+
+	// The range of this part of the sequence.
+	Py_ssize_t start, partlen;
+
+	// When a step is used, each part must begin on an element which is used.
+	if (bytesdata->step > 1) {
+		partrangestep(bytesdata->arraylen, bytesdata->step, part, nparts, &start, &partlen);
+		threadctx->partsums[part] = bsum_unsigned_char_step(partlen, bytesdata->step, bytesdata->bytes1.B + start, 
+				&threadctx->parterrors[part], bytesdata->ignoreerrors, bytesdata->nosimd);
+		return;
+	}
+
+	partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
+
+	threadctx->partsums[part] = bsum_unsigned_char(partlen, bytesdata->bytes1.B + start, 
+				&threadctx->parterrors[part], bytesdata->ignoreerrors, bytesdata->nosimd);
+
+}
+
+/*--------------------------------------------------------------------------- */
+
 /* The wrapper to the underlying C function */
-static PyObject *py_bsum(PyObject *self, PyObject *args, PyObject *keywds) {
+static PyObject *py_bsum(PyObject *self, BF_ARGSDECL) {
 
 
 	// This is used to hold the parsed parameters.
 	struct args_params_bsum bytesdata = ARGSINIT_BSUM;
 
+	// The data for the calculation, including the result of each part.
+	struct bsum_threadctx threadctx;
+
+	// The number of parts to divide the calculation into.
+	int nparts, part;
+
 	// The sum of the array, as a python object.
 	PyObject *sumreturn;
 
@@ -370,7 +624,7 @@ static PyObject *py_bsum(PyObject *self, PyObject *args, PyObject *keywds) {
 
 
 	// Get the parameters passed from Python.
-	bytesdata = getparams_bsum(self, args, keywds, "bsum");
+	bytesdata = getparams_bsum(self, BF_ARGSPASS);
 
 	// If there was an error, we count on the parameter parsing function to 
 	// release the buffers if this was necessary.
@@ -388,8 +642,29 @@ static PyObject *py_bsum(PyObject *self, PyObject *args, PyObject *keywds) {
 	}
 
 
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+	threadctx.bytesdata = &bytesdata;
+
 	// Call the implementing function.
-	resultull = bsum_unsigned_char(bytesdata.arraylen, bytesdata.bytes1.B, &errflag, bytesdata.ignoreerrors, bytesdata.nosimd);
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	nparts = runparallel(bsum_part, &threadctx, nparts);
+	BF_END_ALLOW_THREADS
+
+	// Combine the results from each part. The overflow checks are
+	// the same as when the sequence is summed in one piece.
+	for (part = 0; part < nparts; part++) {
+		if (threadctx.parterrors[part]) {
+			errflag = threadctx.parterrors[part];
+			break;
+		}
+		if (!bytesdata.ignoreerrors && loop_willoverflow_unsigned(threadctx.partsums[part], resultull)) {
+			errflag = ARR_ERR_OVFL;
+			break;
+		}
+		resultull = resultull + threadctx.partsums[part];
+	}
 	sumreturn = PyLong_FromUnsignedLongLong(resultull);
 
 	// Release the buffers. 
@@ -427,21 +702,140 @@ Call formats: \\n\\
 \\n\\
   result = bsum(sequence) \\n\\
   result = bsum(sequence, maxlen=y) \\n\\
+  result = bsum(sequence, start=i, stop=j) \\n\\
+  result = bsum(sequence, step=k) \\n\\
   result = bsum(sequence, matherrors=False) \\n\\
   result = bsum(sequence, nosimd=False) \\n\\
+  result = bsum(sequence, threads=4) \\n\\
 \\n\\
 * sequence - An input bytes or bytearray to be examined. \\n\\
 * maxlen - Limit the length of the sequence used. This must be a valid \\n\\
   positive integer. If a zero or negative length, or a value which is \\n\\
   greater than the actual length of the sequence is specified, this \\n\\
   parameter is ignored. \\n\\
+* start, stop - Work on only part of the sequence, as if it had been \\n\\
+  sliced with sequence[start:stop]. These are optional keyword \\n\\
+  parameters and are applied before maxlen. No data is copied. \\n\\
+* step - Use only every step'th element, as if the sequence had been \\n\\
+  sliced with sequence[start:stop:step]. This must be a positive \\n\\
+  integer. This is an optional keyword parameter. \\n\\
 * matherrors - If True, checks for numerical errors including integer \\n\\
   overflow are ignored. \\n\\
 * nosimd - If True, SIMD acceleration is disabled if present. The \\n\\
   default is False (SIMD acceleration is enabled if present). \\n\\
+* threads - The number of threads to divide the calculation between. \\n\\
+  This parameter is optional. If zero or not specified, the default set \\n\\
+  by setthreads is used. Short sequences are not divided. \\n\\
 * result - The sum of the sequence. \\n\\
 ");
 
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function for a batch of sequences */
+static PyObject *py_bsum_many(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The sum of each sequence.
+	unsigned long long *results;
+
+	// The results as a python list.
+	PyObject *resultlist;
+
+	// Indicates an error.
+	signed int errflag = 0;
+
+	Py_ssize_t x;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_many_bsum(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// Every sequence must contain data.
+	if (hasemptyseq_many(&bytesdata)) {
+		// Release the buffers. 
+		releasebuffers_many(bytesdata);
+		ErrMsgArrayLengthErr();
+		return NULL;
+	}
+
+	results = PyMem_New(unsigned long long, bytesdata.nseqs + 1);
+	if (results == NULL) {
+		releasebuffers_many(bytesdata);
+		return PyErr_NoMemory();
+	}
+
+	// Call the implementing function for each sequence.
+	// The GIL is released if the batch is large.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.totallen)
+	for (x = 0; x < bytesdata.nseqs; x++) {
+		results[x] = bsum_unsigned_char(bytesdata.pybuffers[x].len, bytesdata.pybuffers[x].buf, 
+				&errflag, bytesdata.ignoreerrors, bytesdata.nosimd);
+		if (errflag) {
+			break;
+		}
+	}
+	BF_END_ALLOW_THREADS
+
+	// Release the buffers. 
+	releasebuffers_many(bytesdata);
+
+
+	// Signal the errors.
+	if (errflag == ARR_ERR_OVFL) {
+		PyMem_Free(results);
+		ErrMsgArithOverflowCalc();
+		return NULL;
+	}
+
+	resultlist = ulonglonglist_many(results, bytesdata.nseqs);
+	PyMem_Free(results);
+
+	return resultlist;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(bsum_many__doc__,
+"bsum_many \\n\\
+_____________________________ \\n\\
+\\n\\
+Calculate the arithmetic sum of each sequence in a batch.  \\n\\
+\\n\\
+======================  ============================================== \\n\\
+Equivalent to:          [sum(x) for x in sequences] \\n\\
+======================  ============================================== \\n\\
+\\n\\
+Call formats: \\n\\
+\\n\\
+  result = bsum_many(sequences) \\n\\
+  result = bsum_many(sequences, matherrors=False) \\n\\
+  result = bsum_many(sequences, nosimd=False) \\n\\
+\\n\\
+* sequences - A list or other iterable of bytes or bytearray sequences. \\n\\
+  None of them may be empty. \\n\\
+* matherrors - If True, checks for numerical errors including integer \\n\\
+  overflow are ignored. \\n\\
+* nosimd - If True, SIMD acceleration is disabled if present. The \\n\\
+  default is False (SIMD acceleration is enabled if present). \\n\\
+* result - A list with the sum of each sequence. \\n\\
+");
+
 """
 
 # ==============================================================================
@@ -453,14 +847,34 @@ footer_boilerplate = """
 /* A list of all the methods defined by this module. 
  "%(funclabel)s" is the name seen inside of Python. 
  "py_%(funclabel)s" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef %(funclabel)s_methods[] = {
-	{"%(funclabel)s",  (PyCFunction)py_%(funclabel)s, METH_VARARGS | METH_KEYWORDS, %(funclabel)s__doc__}, 
+	{"%(funclabel)s",  (PyCFunction)py_%(funclabel)s, BF_METHFLAGS, %(funclabel)s__doc__}, 
+	{"%(funclabel)s_many",  (PyCFunction)py_%(funclabel)s_many, BF_METHFLAGS, %(funclabel)s_many__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int %(funclabel)s_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
+	return PyModule_AddFunctions(module, %(funclabel)s_methods);
+};
+
+#else
+
 static struct PyModuleDef %(funclabel)smodule = {
     PyModuleDef_HEAD_INIT,
     "%(funclabel)s",
@@ -471,9 +885,20 @@ static struct PyModuleDef %(funclabel)smodule = {
 
 PyMODINIT_FUNC PyInit_%(funclabel)s(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	%(funclabel)s_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
     return PyModule_Create(&%(funclabel)smodule);
 };
 
+#endif
+
+// End of the code which is left out of the accumulators module.
+#endif
+
 /*--------------------------------------------------------------------------- */
 
 """
@@ -484,9 +909,42 @@ PyMODINIT_FUNC PyInit_%(funclabel)s(void)
 SIMD_platform_ARMv7 = '#if defined(AF_HASSIMD_ARMv7_32BIT)'
 SIMD_platform_ARM64v8 = '#if defined(AF_HASSIMD_ARM_AARCH64)'
 SIMD_platform_ARM = '#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)'
+SIMD_platform_x86 = '#if defined(AF_HASSIMD_X86)'
+SIMD_platform_x86_AVX2 = '#if defined(AF_HASSIMD_X86_AVX2)'
+SIMD_platform_x86_AVX512 = '#if defined(AF_HASSIMD_X86_AVX512)'
 
 
 # SIMD support.
+simd_x86 = {
+	'simdplatform' : SIMD_platform_x86,
+	'simdtarget' : '',
+	'simdfunclabel' : '_x86_simd',
+	'simdwidth' : 'CHARSIMDSIZE',
+	'simdattr' : 'v16qi',
+	'simdtype' : '__m128i',
+	'simdcast' : '(__m128i *) ',
+	'simdzero' : '_mm_setzero_si128',
+	'simdload' : '_mm_loadu_si128',
+	'simdsad' : '_mm_sad_epu8',
+	'simdadd' : '_mm_add_epi64',
+	'simdstore' : '_mm_storeu_si128',
+}
+
+simd_avx2 = {
+	'simdplatform' : SIMD_platform_x86_AVX2,
+	'simdtarget' : 'AF_TARGET_AVX2 ',
+	'simdfunclabel' : '_avx2_simd',
+	'simdwidth' : 'CHARSIMDSIZE_AVX2',
+	'simdattr' : 'v32qi',
+	'simdtype' : '__m256i',
+	'simdcast' : '(__m256i *) ',
+	'simdzero' : '_mm256_setzero_si256',
+	'simdload' : '_mm256_loadu_si256',
+	'simdsad' : '_mm256_sad_epu8',
+	'simdadd' : '_mm256_add_epi64',
+	'simdstore' : '_mm256_storeu_si256',
+}
+
 simd_armv7 = {
 	'simdplatform' : SIMD_platform_ARMv7,
 	'simdfunclabel' : '_armv7_simd',
@@ -521,13 +979,17 @@ with open(filename, 'w') as f:
 	f.write(sumbin_head % {'funclabel' : funcname})
 	# The implementing code.
 
+	# SIMD support for x86
+	f.write(ops_simdsupport_x86_innerloop % simd_x86)
+	f.write(ops_simdsupport_x86_innerloop % simd_avx2)
+	f.write(ops_simdsupport_avx512_innerloop)
 	# SIMD support for ARMv7
 	f.write(ops_simdsupport_arm_innerloop % simd_armv7)
 	# SIMD support for ARMv8
 	f.write(ops_simdsupport_arm_innerloop % simd_armv8)
 
 	# Platform independent SIMD.
-	f.write(ops_simdsupport_arm_outerloop)
+	f.write(ops_simdsupport_outerloop)
 
 	f.write(bsum_code)
 	f.write(bsum_params)
@@ -1,44 +1,63 @@
 #!/usr/bin/env python3
 
 # Setup file for bytesfunc. As part of the setup process this script will
-# attempt to detect if the current system is x86-64 or ARMv7 with GCC,
-# and if so will enable SIMD extensions. If the current system is any 
+# attempt to detect if the current system is x86-64 or ARMv7 with GCC or
+# LLVM Clang, and if so will enable SIMD extensions. If the current system is any 
 # other architecture or compiler they will be disabled.
 
 
+import os
 import platform
 from setuptools import setup, Extension
 
 
 # This is a list of the files and all the dependencies.
 extensions = [
-	('eq', ['src/eq.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('ge', ['src/ge.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('gt', ['src/gt.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('le', ['src/le.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('lt', ['src/lt.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('ne', ['src/ne.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-
-	('bmax', ['src/bmax.c', 'src/bytesparams_valoutsimd.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('bmin', ['src/bmin.c', 'src/bytesparams_valoutsimd.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('bsum', ['src/bsum.c', 'src/bytesparams_bsum.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-
-	('ball', ['src/ball.c', 'src/bytesparams_allany.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/byteserrs.c']),
-	('bany', ['src/bany.c', 'src/bytesparams_allany.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/byteserrs.c']),
-	('findindex', ['src/findindex.c', 'src/bytesparams_allany.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/byteserrs.c']),
-
-	('and_', ['src/and_.c', 'src/bytesparams_two.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('or_', ['src/or_.c', 'src/bytesparams_two.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('xor', ['src/xor.c', 'src/bytesparams_two.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('lshift', ['src/lshift.c', 'src/bytesparams_two.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
-	('rshift', ['src/rshift.c', 'src/bytesparams_two.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
+	('eq', ['src/eq.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+	('ge', ['src/ge.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+	('gt', ['src/gt.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+	('le', ['src/le.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+	('lt', ['src/lt.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+	('ne', ['src/ne.c', 'src/bytesparams_comp.c', 'src/bytesparams_base.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+	('cmpmask', ['src/cmpmask.c', 'src/bytesparams_two.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+
+	('bmax', ['src/bmax.c', 'src/bytesparams_valoutsimd.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+	('bmin', ['src/bmin.c', 'src/bytesparams_valoutsimd.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+	('bsum', ['src/bsum.c', 'src/bytesparams_bsum.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+
+	('ball', ['src/ball.c', 'src/bytesparams_allany.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+	('bany', ['src/bany.c', 'src/bytesparams_allany.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+	('findindex', ['src/findindex.c', 'src/bytesparams_allany.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+
+	('and_', ['src/and_.c', 'src/bytesparams_two.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/byteserrs.c']),
+	('or_', ['src/or_.c', 'src/bytesparams_two.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/byteserrs.c']),
+	('xor', ['src/xor.c', 'src/bytesparams_two.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/byteserrs.c']),
+	('lshift', ['src/lshift.c', 'src/bytesparams_two.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/byteserrs.c']),
+	('rshift', ['src/rshift.c', 'src/bytesparams_two.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/byteserrs.c']),
+
+	('where', ['src/where.c', 'src/bytesparams_two.c', 'src/bytesparams_many.c', 'src/bytesparams_base.c', 'src/arrayops.c', 'src/bytesthreads.c', 'src/byteserrs.c']),
 
 	('invert', ['src/invert.c', 'src/bytesparams_invert.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
 
+	('accumulators', ['src/accumulators.c', 'src/bmax.c', 'src/bmin.c', 'src/bsum.c', 'src/bytesparams_base.c', 'src/byteserrs.c']),
+
+	('bstats', ['src/bstats.c', 'src/bytesparams_base.c', 'src/bytesthreads.c', 'src/bytesstride.c', 'src/byteserrs.c']),
+
+	('histogram', ['src/histogram.c', 'src/bytesparams_base.c', 'src/bytesthreads.c', 'src/byteserrs.c']),
+
 	('simdsupport', ['src/simdsupport.c']),
 
+	('threadpool', ['src/threadpool.c', 'src/byteserrs.c']),
+
 ]
 
+# Macros which are defined for individual extension modules. The accumulators
+# module uses only the calculation functions from the bsum, bmax, and bmin
+# source files, and not their Python functions or module initialisation.
+extmacros = {
+	'accumulators' : [('BF_KERNELSONLY', '1')],
+}
+
 
 # Used for Raspberry Pi CPU version detection. 
 def GetRaspCPUType():
@@ -79,29 +98,32 @@ def GetRaspCPUType():
 
 # Detect the compiler used for Python. We will assume that this same compiler is
 # being used to compile our own modules (since the two are supposed to match).
-# We are looking specifically for GCC.
+# We are looking for GCC or LLVM Clang, which both accept the SIMD code.
 # The names used by MSVC for the SIMD instructions are not compatible with
-# other compilers. LLVM Clang does not have full compiler intrinsics SIMD 
-# support yet. Hence, we can only use SIMD with GCC at this time. We suppress
-# the command line option for unsupported compilers to avoid compiler warnings.
+# other compilers, so SIMD is not used with MSVC. We suppress the command 
+# line option for unsupported compilers to avoid compiler warnings.
 # GCC is expected to return a string which looks something like the 
 # following: 'GCC 5.4.0 20160609'
-# LLVM Clang returned something like: 'GCC 4.2.1 Compatible Clang <etc.>'
+# LLVM Clang returns something like: 'GCC 4.2.1 Compatible Clang <etc.>'
+# or 'Clang 14.0.0 <etc.>'
 # MSVC Returns something like 'MSC <version> <chip architecture>'
-# Because LLVM Clang masquerades as GCC, we must take extra effort to ensure that
-# we're actually dealing with GCC. If this changes in future, we can change the 
-# following to enable the option. There are however also #define statements in
-# the C source which must also be changed.
+# There are also #define statements in the C source which select SIMD
+# according to the compiler.
 # First however, we must check to make sure this is an x86 CPU, otherwise the
 # SIMD flags are completely different.
 PyCompilerType = platform.python_compiler()
-if ('x86' in platform.machine()) and ('GCC' in PyCompilerType) and ('Clang' not in PyCompilerType):
-	Compile_Args = ['-msse4.1']
+GNUCompatible = ('GCC' in PyCompilerType) or ('Clang' in PyCompilerType)
+if ('x86' in platform.machine()) and GNUCompatible:
+	# No SIMD options are needed. The library is compiled for the basic x86-64
+	# instruction set, and the functions which use newer SIMD instructions are
+	# marked individually in the C source. Which ones are used is decided at
+	# run time according to the CPU.
+	Compile_Args = []
 # For ARMv7 32 bit. 
-elif ('GCC' in PyCompilerType) and ('armv7l' in platform.machine()):
+elif GNUCompatible and ('armv7l' in platform.machine()):
 	Compile_Args = ['-mcpu=cortex-a7', '-mfpu=neon-vfpv4']
 # For ARM AARCH 64 bit. 
-elif ('GCC' in PyCompilerType) and ('aarch64' in platform.machine()):
+elif GNUCompatible and ('aarch64' in platform.machine()):
 	# Get the CPU part string from the kernel.
 	cpupart = GetRaspCPUType()
 	# For Raspberry Pi 3 in 64 bit mode.
@@ -116,6 +138,25 @@ else:
 	Compile_Args = []
 
 
+# All the functions may instead be built as a single extension module
+# called "_bytesfunc". This loads faster, as only one shared library is
+# needed and the common code is linked only once. Set the environment
+# variable BYTESFUNC_SINGLEMODULE=1 to select this. The simdsupport module 
+# is built separately in either case.
+if os.environ.get('BYTESFUNC_SINGLEMODULE', '0') not in ('', '0'):
+	singlesrc = ['src/bytesfuncmodule.c']
+	for extname, extsrc in extensions:
+		if extname != 'simdsupport':
+			singlesrc.extend([x for x in extsrc if x not in singlesrc])
+
+	ext_modules = [Extension('_bytesfunc', singlesrc, extra_compile_args=Compile_Args, 
+						define_macros=[('BF_SINGLEMODULE', '1')])]
+	ext_modules.extend([Extension(x, y, extra_compile_args=Compile_Args) for x,y in extensions if x == 'simdsupport'])
+else:
+	ext_modules = [Extension(x, y, extra_compile_args=Compile_Args, 
+						define_macros=extmacros.get(x, [])) for x,y in extensions]
+
+
 with open('README.rst') as longdescdata:
     long_description = longdescdata.read()
 
@@ -141,7 +182,7 @@ setup(name = 'bytesfunc',
 		],
 	keywords = 'bytes and bytearray functions',
 	ext_package='bytesfunc',
-	ext_modules = [Extension(x, y, extra_compile_args=Compile_Args) for x,y in extensions],
+	ext_modules = ext_modules,
 	packages=['bytesfunc']
 	)
 
@@ -0,0 +1,539 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   accumulators.c
+// Purpose:  Accumulate bsum, bmax and bmin results over a stream of sequences.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+/* The accumulators keep a running result in C while data is passed to them
+	one chunk at a time, such as when reading a large file. Each chunk is
+	calculated using the same functions as bsum, bmax, and bmin. These are
+	linked into this module from the source files for those functions. The
+	running result is changed only after the GIL has been re-acquired, so an
+	accumulator may be shared between threads.
+*/
+
+/*--------------------------------------------------------------------------- */
+
+#include "Python.h"
+#include "structmember.h"
+
+#include <limits.h>
+#include <stdbool.h>
+
+#include "byteserrs.h"
+
+#include "simddefs.h"
+
+#include "bytesparams_base.h"
+
+/*--------------------------------------------------------------------------- */
+
+// The functions which calculate the result for each chunk.
+unsigned long long bsum_unsigned_char(Py_ssize_t arraylen, unsigned char *data, signed int *errflag, signed int ignoreerrors, signed int nosimd);
+unsigned char bmax_select(Py_ssize_t arraylen, int nosimd, unsigned char *data);
+unsigned char bmin_select(Py_ssize_t arraylen, int nosimd, unsigned char *data);
+
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+void bsum_initsimd(void);
+void bmax_initsimd(void);
+void bmin_initsimd(void);
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+// The keyword arguments for creating each accumulator.
+static char *kwlist_sum[] = {"matherrors", "nosimd", NULL};
+static char *kwlist_minmax[] = {"nosimd", NULL};
+
+/*--------------------------------------------------------------------------- */
+
+/* Parse the keyword parameters used to create an accumulator. These are
+	keyword only.
+	args, kwds = The parameters passed from Python.
+	kwlist = The names of the parameters.
+	values = Receives the value of each parameter. Parameters which were
+		not given are not changed.
+	Returns: 0 if OK, or -1 with a Python exception set.
+*/
+static int getaccumparams(PyObject *args, PyObject *kwds, char **kwlist, int *values) {
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	int x;
+
+	if (getargobjs(&PyTuple_GET_ITEM(args, 0), PyTuple_GET_SIZE(args), NULL, kwds, kwlist, 0, 0, argobjs)) {
+		ErrMsgParameterError();
+		return -1;
+	}
+
+	for (x = 0; kwlist[x] != NULL; x++) {
+		if (getintarg(argobjs[x], &values[x])) {
+			ErrMsgParameterError();
+			return -1;
+		}
+	}
+
+	return 0;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Get the buffer for a chunk of data passed to update.
+	dataobj = The chunk of data as a PyObject (not parsed).
+	pybuffer = Receives the buffer, which must be released after use.
+	Returns: 0 if OK, or -1 with a Python exception set.
+*/
+static int getchunkbuffer(PyObject *dataobj, Py_buffer *pybuffer) {
+
+	struct paramsdata paramobjdata;
+	bool hasbuffer, paramoverflow;
+
+	if (get_paramdata(dataobj, &paramobjdata, &hasbuffer, &paramoverflow)
+			|| ((paramobjdata.paramtype != paramobj_readonly) && (paramobjdata.paramtype != paramobj_writable))) {
+		ErrMsgParameterError();
+		return -1;
+	}
+
+	*pybuffer = paramobjdata.pybuffer;
+
+	return 0;
+}
+
+/*--------------------------------------------------------------------------- */
+
+// The running sum of a stream of sequences.
+typedef struct {
+	PyObject_HEAD
+	unsigned long long total;
+	// The number of elements which have been added.
+	Py_ssize_t count;
+	int ignoreerrors;
+	int nosimd;
+} SumAccumulatorObject;
+
+
+/* Create a new SumAccumulator. */
+static PyObject *SumAccumulator_new(PyTypeObject *type, PyObject *args, PyObject *kwds) {
+
+	SumAccumulatorObject *self;
+
+	// matherrors, nosimd
+	int values[2] = {0, 0};
+
+	if (getaccumparams(args, kwds, kwlist_sum, values)) {
+		return NULL;
+	}
+
+	self = (SumAccumulatorObject *) type->tp_alloc(type, 0);
+	if (self == NULL) {
+		return NULL;
+	}
+
+	self->total = 0;
+	self->count = 0;
+	self->ignoreerrors = values[0];
+	self->nosimd = values[1];
+
+	return (PyObject *) self;
+}
+
+
+/* Add a chunk of data to the sum. */
+static PyObject *SumAccumulator_update(SumAccumulatorObject *self, PyObject *dataobj) {
+
+	Py_buffer pybuffer;
+
+	// The sum of this chunk.
+	unsigned long long chunksum;
+
+	// Indicates an error.
+	signed int errflag = 0;
+
+	// The length of this chunk. This must be kept as the buffer is released
+	// before the count is updated.
+	Py_ssize_t chunklen;
+
+	if (getchunkbuffer(dataobj, &pybuffer)) {
+		return NULL;
+	}
+
+	chunklen = pybuffer.len;
+
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(chunklen)
+	chunksum = bsum_unsigned_char(chunklen, pybuffer.buf, &errflag, self->ignoreerrors, self->nosimd);
+	BF_END_ALLOW_THREADS
+
+	PyBuffer_Release(&pybuffer);
+
+	// Adding the chunk to the total can also overflow.
+	if (!errflag && !self->ignoreerrors && (chunksum > (ULLONG_MAX - self->total))) {
+		errflag = ARR_ERR_OVFL;
+	}
+
+	// The total is not changed if there was an error.
+	if (errflag) {
+		ErrMsgArithOverflowCalc();
+		return NULL;
+	}
+
+	self->total = self->total + chunksum;
+	self->count = self->count + chunklen;
+
+	Py_RETURN_NONE;
+}
+
+
+/* Return the sum. */
+static PyObject *SumAccumulator_result(SumAccumulatorObject *self, PyObject *Py_UNUSED(ignored)) {
+
+	return PyLong_FromUnsignedLongLong(self->total);
+}
+
+
+PyDoc_STRVAR(SumAccumulator_update__doc__,
+"update(sequence) \n\
+Add the values in a bytes or bytearray sequence to the sum. The sum is \n\
+not changed if this raises an exception.");
+
+PyDoc_STRVAR(SumAccumulator_result__doc__,
+"result() \n\
+Return the sum of all the values added so far.");
+
+
+static PyMethodDef SumAccumulator_methods[] = {
+	{"update", (PyCFunction)SumAccumulator_update, METH_O, SumAccumulator_update__doc__},
+	{"result", (PyCFunction)SumAccumulator_result, METH_NOARGS, SumAccumulator_result__doc__},
+	{NULL, NULL, 0, NULL}
+};
+
+
+static PyMemberDef SumAccumulator_members[] = {
+	{"count", T_PYSSIZET, offsetof(SumAccumulatorObject, count), READONLY, "The number of values added so far."},
+	{NULL, 0, 0, 0, NULL}
+};
+
+
+PyDoc_STRVAR(SumAccumulator__doc__,
+"SumAccumulator \n\
+_____________________________ \n\
+\n\
+Calculate the arithmetic sum of a stream of bytes or bytearray sequences \n\
+which are passed one at a time. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          sum(sequence1) + sum(sequence2) + ... \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  acc = SumAccumulator() \n\
+  acc = SumAccumulator(matherrors=False) \n\
+  acc = SumAccumulator(nosimd=False) \n\
+  acc.update(sequence) \n\
+  result = acc.result() \n\
+\n\
+* matherrors - If True, checks for numerical errors including integer \n\
+  overflow are ignored. \n\
+* nosimd - If True, SIMD acceleration is disabled if present. The \n\
+  default is False (SIMD acceleration is enabled if present). \n\
+* sequence - An input bytes or bytearray to be added to the sum. \n\
+* result - The sum of all the sequences added so far. \n\
+* count - The number of values added so far. \n\
+");
+
+
+static PyTypeObject SumAccumulatorType = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "bytesfunc.SumAccumulator",
+	.tp_basicsize = sizeof(SumAccumulatorObject),
+	.tp_itemsize = 0,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = SumAccumulator__doc__,
+	.tp_methods = SumAccumulator_methods,
+	.tp_members = SumAccumulator_members,
+	.tp_new = SumAccumulator_new,
+};
+
+/*--------------------------------------------------------------------------- */
+
+// The running minimum and maximum of a stream of sequences.
+typedef struct {
+	PyObject_HEAD
+	unsigned char minval;
+	unsigned char maxval;
+	// The number of elements which have been examined.
+	Py_ssize_t count;
+	int nosimd;
+} MinMaxAccumulatorObject;
+
+
+/* Create a new MinMaxAccumulator. */
+static PyObject *MinMaxAccumulator_new(PyTypeObject *type, PyObject *args, PyObject *kwds) {
+
+	MinMaxAccumulatorObject *self;
+
+	// nosimd
+	int values[1] = {0};
+
+	if (getaccumparams(args, kwds, kwlist_minmax, values)) {
+		return NULL;
+	}
+
+	self = (MinMaxAccumulatorObject *) type->tp_alloc(type, 0);
+	if (self == NULL) {
+		return NULL;
+	}
+
+	self->minval = 255;
+	self->maxval = 0;
+	self->count = 0;
+	self->nosimd = values[0];
+
+	return (PyObject *) self;
+}
+
+
+/* Examine a chunk of data. */
+static PyObject *MinMaxAccumulator_update(MinMaxAccumulatorObject *self, PyObject *dataobj) {
+
+	Py_buffer pybuffer;
+
+	// The minimum and maximum of this chunk.
+	unsigned char chunkmin, chunkmax;
+
+	// The length of this chunk. This must be kept as the buffer is released
+	// before the count is updated.
+	Py_ssize_t chunklen;
+
+	if (getchunkbuffer(dataobj, &pybuffer)) {
+		return NULL;
+	}
+
+	chunklen = pybuffer.len;
+
+	// An empty chunk does not change anything.
+	if (chunklen < 1) {
+		PyBuffer_Release(&pybuffer);
+		Py_RETURN_NONE;
+	}
+
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(chunklen)
+	chunkmin = bmin_select(chunklen, self->nosimd, pybuffer.buf);
+	chunkmax = bmax_select(chunklen, self->nosimd, pybuffer.buf);
+	BF_END_ALLOW_THREADS
+
+	PyBuffer_Release(&pybuffer);
+
+	if (chunkmin < self->minval) {
+		self->minval = chunkmin;
+	}
+	if (chunkmax > self->maxval) {
+		self->maxval = chunkmax;
+	}
+	self->count = self->count + chunklen;
+
+	Py_RETURN_NONE;
+}
+
+
+/* Return the minimum and maximum. */
+static PyObject *MinMaxAccumulator_result(MinMaxAccumulatorObject *self, PyObject *Py_UNUSED(ignored)) {
+
+	// There is no result until some data has been examined.
+	if (self->count < 1) {
+		ErrMsgArrayLengthErr();
+		return NULL;
+	}
+
+	return Py_BuildValue("(ii)", (int) self->minval, (int) self->maxval);
+}
+
+
+PyDoc_STRVAR(MinMaxAccumulator_update__doc__,
+"update(sequence) \n\
+Examine the values in a bytes or bytearray sequence.");
+
+PyDoc_STRVAR(MinMaxAccumulator_result__doc__,
+"result() \n\
+Return the minimum and maximum of all the values examined so far, as a \n\
+tuple of (minimum, maximum).");
+
+
+static PyMethodDef MinMaxAccumulator_methods[] = {
+	{"update", (PyCFunction)MinMaxAccumulator_update, METH_O, MinMaxAccumulator_update__doc__},
+	{"result", (PyCFunction)MinMaxAccumulator_result, METH_NOARGS, MinMaxAccumulator_result__doc__},
+	{NULL, NULL, 0, NULL}
+};
+
+
+static PyMemberDef MinMaxAccumulator_members[] = {
+	{"count", T_PYSSIZET, offsetof(MinMaxAccumulatorObject, count), READONLY, "The number of values examined so far."},
+	{NULL, 0, 0, 0, NULL}
+};
+
+
+PyDoc_STRVAR(MinMaxAccumulator__doc__,
+"MinMaxAccumulator \n\
+_____________________________ \n\
+\n\
+Calculate the minimum and maximum of a stream of bytes or bytearray \n\
+sequences which are passed one at a time. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          (min(sequence1 + sequence2 + ...), \n\
+                        max(sequence1 + sequence2 + ...)) \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  acc = MinMaxAccumulator() \n\
+  acc = MinMaxAccumulator(nosimd=False) \n\
+  acc.update(sequence) \n\
+  result = acc.result() \n\
+\n\
+* nosimd - If True, SIMD acceleration is disabled if present. The \n\
+  default is False (SIMD acceleration is enabled if present). \n\
+* sequence - An input bytes or bytearray to be examined. Empty \n\
+  sequences are ignored. \n\
+* result - A tuple of (minimum, maximum) for all the sequences examined \n\
+  so far. This raises IndexError if no values have been examined. \n\
+* count - The number of values examined so far. \n\
+");
+
+
+static PyTypeObject MinMaxAccumulatorType = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "bytesfunc.MinMaxAccumulator",
+	.tp_basicsize = sizeof(MinMaxAccumulatorObject),
+	.tp_itemsize = 0,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = MinMaxAccumulator__doc__,
+	.tp_methods = MinMaxAccumulator_methods,
+	.tp_members = MinMaxAccumulator_members,
+	.tp_new = MinMaxAccumulator_new,
+};
+
+/*--------------------------------------------------------------------------- */
+
+/* Add one type to a module.
+	m = The module which the type is added to.
+	name = The name of the type in the module.
+	type = The type.
+	Returns: 0 if OK, or -1 if an error occurred.
+*/
+static int addtype(PyObject *m, const char *name, PyTypeObject *type) {
+
+	if (PyType_Ready(type) < 0) {
+		return -1;
+	}
+
+	Py_INCREF(type);
+	if (PyModule_AddObject(m, name, (PyObject *) type) < 0) {
+		Py_DECREF(type);
+		return -1;
+	}
+
+	return 0;
+}
+
+
+/* Select the SIMD functions and add the accumulator types to a module.
+	m = The module which the types are added to.
+	Returns: 0 if OK, or -1 if an error occurred.
+*/
+static int initaccumulators(PyObject *m) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	bsum_initsimd();
+	bmax_initsimd();
+	bmin_initsimd();
+	#endif
+
+	if (addtype(m, "SumAccumulator", &SumAccumulatorType)
+			|| addtype(m, "MinMaxAccumulator", &MinMaxAccumulatorType)) {
+		return -1;
+	}
+
+	return 0;
+}
+
+/*--------------------------------------------------------------------------- */
+
+#if defined(BF_SINGLEMODULE)
+
+/* Add the accumulators to the combined extension module. This is used in
+	place of the module initialisation when all the functions are built as
+	a single extension module.
+*/
+int accumulators_addfunc(PyObject *module) {
+
+	return initaccumulators(module);
+}
+
+#else
+
+PyDoc_STRVAR(module_doc,
+"This provides the accumulator types, which calculate a result over a \n\
+stream of sequences. These should be used through the bytesfunc package \n\
+rather than directly from here.\n\
+");
+
+
+static struct PyModuleDef accumulatorsmodule = {
+	PyModuleDef_HEAD_INIT,
+	"accumulators",
+	module_doc,
+	-1,
+	NULL,
+	NULL,
+	NULL,
+	NULL,
+	NULL
+};
+
+/*--------------------------------------------------------------------------- */
+
+
+PyMODINIT_FUNC PyInit_accumulators(void) {
+	PyObject *m;
+
+	m = PyModule_Create(&accumulatorsmodule);
+	if (m == NULL) { goto iserror; }
+
+	if (initaccumulators(m)) { goto iserror; }
+
+	// This is the normal exit point.
+	return m;
+
+	// An error occurred.
+	iserror:
+	Py_XDECREF(m);
+	return NULL;
+
+}
+
+#endif
+
+/*--------------------------------------------------------------------------- */
@@ -39,6 +39,9 @@
 #include "arrayops.h"
 
 #include "bytesparams_allany.h"
+#include "bytesparams_many.h"
+#include "bytesthreads.h"
+#include "bytesstride.h"
 
 #include "simddefs.h"
 #if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
@@ -46,6 +49,23 @@
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+
+/* The SIMD functions to use for each compare operation. These are selected
+   once when the module is initialised, according to the SIMD features
+   supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	signed int (*eq)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	signed int (*gt)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	signed int (*ge)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	signed int (*lt)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	signed int (*le)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	signed int (*ne)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+} ball_simdfuncs;
+#endif
+
 /*--------------------------------------------------------------------------- */
 
 /*--------------------------------------------------------------------------- */
@@ -101,7 +121,7 @@ signed int ball_eq_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -112,11 +132,73 @@ signed int ball_eq_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Compare the slices.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (!(data[index] == param1)) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int ball_eq_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Compare the slices.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			return ARR_ERR_NOTFOUND;
 		}
 	}
@@ -135,6 +217,70 @@ signed int ball_eq_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int ball_eq_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		if (resultmask != tailmask) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -264,7 +410,7 @@ signed int ball_eq_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -273,18 +419,7 @@ signed int ball_eq_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return ball_eq_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return ball_eq_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return ball_eq_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return ball_simdfuncs.eq(arraylen, data1, param);
 	} else {
 	#endif
 		return ball_eq(arraylen, data1, param);
@@ -350,7 +485,7 @@ signed int ball_gt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -361,19 +496,89 @@ signed int ball_gt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Make sure they're not equal.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0x0000) {
+			return ARR_ERR_NOTFOUND;
+		}
+		// Find the minimum values. 
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (!(data[index] > param1)) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int ball_gt_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Make sure they're not equal.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0x0000) {
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0x00000000) {
 			return ARR_ERR_NOTFOUND;
 		}
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			return ARR_ERR_NOTFOUND;
 		}
 	}
@@ -392,6 +597,70 @@ signed int ball_gt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int ball_gt_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		if (resultmask != tailmask) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -521,7 +790,7 @@ signed int ball_gt_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -530,18 +799,7 @@ signed int ball_gt_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return ball_gt_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return ball_gt_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return ball_gt_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return ball_simdfuncs.gt(arraylen, data1, param);
 	} else {
 	#endif
 		return ball_gt(arraylen, data1, param);
@@ -607,7 +865,7 @@ signed int ball_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -618,14 +876,14 @@ signed int ball_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
 			return ARR_ERR_NOTFOUND;
 		}
 	}
@@ -645,7 +903,7 @@ signed int ball_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 
 
 /*--------------------------------------------------------------------------- */
-/* ARMv7 version.
+/* x86 AVX2 SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
@@ -654,8 +912,8 @@ signed int ball_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
    Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
 		 if it was false at least once.
 */
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-signed int ball_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int ball_ge_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
 	Py_ssize_t index; 
@@ -664,27 +922,33 @@ signed int ball_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 	Py_ssize_t alignedlength;
 	unsigned int y;
 
-	uint8x8_t datasliceleft, datasliceright;
-	uint8x8_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1_u8( compvals);
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = vld1_u8( &data[index]);
-		// The actual SIMD operation. 
-		resultslice = vcge_u8(datasliceleft, datasliceright);
-		// Compare the results of the SIMD operation.
-		if (vreinterpret_u64_u8(resultslice) != 0xffffffffffffffff) {
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
+		// Find the minimum values. 
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			return ARR_ERR_NOTFOUND;
 		}
 	}
@@ -703,62 +967,59 @@ signed int ball_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 #endif
 
 
-
 /*--------------------------------------------------------------------------- */
-/* ARMv8 version.
+/* x86 AVX-512BW SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
    param1 = The parameter to be applied to each array element.
-   nosimd = If true, disable SIMD.
    Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
 		 if it was false at least once.
 */
-#if defined(AF_HASSIMD_ARM_AARCH64)
-signed int ball_ge_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int ball_ge_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
 	unsigned int y;
 
-	uint8x16_t datasliceleft, datasliceright;
-	uint8x16_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
-	uint64x2_t veccombine;
-	uint64_t highresult, lowresult;
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1q_u8( compvals);
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = vld1q_u8( &data[index]);
-		// The actual SIMD operation. 
-		resultslice = vcgeq_u8(datasliceleft, datasliceright);
-		// Combine the result to two 64 bit vectors.
-		veccombine = vreinterpretq_u64_u8(resultslice);
-		// Get the high and low lanes of the combined vector.
-		lowresult = vgetq_lane_u64(veccombine, 0);
-		highresult = vgetq_lane_u64(veccombine, 1);
-		// Compare the results of the SIMD operation.
-		if ((lowresult != 0xffffffffffffffff) || (highresult != 0xffffffffffffffff)) {
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
 			return ARR_ERR_NOTFOUND;
 		}
 	}
 
-	// Get the max value within the left over elements at the end of the array.
-	for (index = alignedlength; index < arraylen; index++) {
-		if (!(data[index] >= param1)) {
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		if (resultmask != tailmask) {
 			return ARR_ERR_NOTFOUND;
 		}
 	}
@@ -770,30 +1031,145 @@ signed int ball_ge_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 #endif
 
 
-
 /*--------------------------------------------------------------------------- */
-/* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+/* ARMv7 version.
+   opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
-   data1 = The first data array.
-   param = The parameter to be applied to each array element.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
 */
-signed int ball_ge_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) { 
-
-	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
-	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return ball_ge_x86_simd(arraylen, data1, param);
-		#endif
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+signed int ball_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x8_t datasliceleft, datasliceright;
+	uint8x8_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data[index]);
+		// The actual SIMD operation. 
+		resultslice = vcge_u8(datasliceleft, datasliceright);
+		// Compare the results of the SIMD operation.
+		if (vreinterpret_u64_u8(resultslice) != 0xffffffffffffffff) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (!(data[index] >= param1)) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_ARM_AARCH64)
+signed int ball_ge_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x16_t datasliceleft, datasliceright;
+	uint8x16_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+	uint64x2_t veccombine;
+	uint64_t highresult, lowresult;
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1q_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data[index]);
+		// The actual SIMD operation. 
+		resultslice = vcgeq_u8(datasliceleft, datasliceright);
+		// Combine the result to two 64 bit vectors.
+		veccombine = vreinterpretq_u64_u8(resultslice);
+		// Get the high and low lanes of the combined vector.
+		lowresult = vgetq_lane_u64(veccombine, 0);
+		highresult = vgetq_lane_u64(veccombine, 1);
+		// Compare the results of the SIMD operation.
+		if ((lowresult != 0xffffffffffffffff) || (highresult != 0xffffffffffffffff)) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (!(data[index] >= param1)) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
 
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return ball_ge_armv7_simd(arraylen, data1, param);
-		#endif
 
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return ball_ge_armv8_simd(arraylen, data1, param);
-		#endif
 
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   param = The parameter to be applied to each array element.
+*/
+signed int ball_ge_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) { 
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		return ball_simdfuncs.ge(arraylen, data1, param);
 	} else {
 	#endif
 		return ball_ge(arraylen, data1, param);
@@ -859,7 +1235,7 @@ signed int ball_lt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -870,19 +1246,89 @@ signed int ball_lt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Make sure they're not equal.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0x0000) {
+			return ARR_ERR_NOTFOUND;
+		}
+		// Find the maximum values. 
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (!(data[index] < param1)) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int ball_lt_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Make sure they're not equal.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0x0000) {
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0x00000000) {
 			return ARR_ERR_NOTFOUND;
 		}
 		// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			return ARR_ERR_NOTFOUND;
 		}
 	}
@@ -901,6 +1347,70 @@ signed int ball_lt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int ball_lt_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		if (resultmask != tailmask) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -1030,7 +1540,7 @@ signed int ball_lt_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -1039,18 +1549,7 @@ signed int ball_lt_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return ball_lt_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return ball_lt_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return ball_lt_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return ball_simdfuncs.lt(arraylen, data1, param);
 	} else {
 	#endif
 		return ball_lt(arraylen, data1, param);
@@ -1116,7 +1615,7 @@ signed int ball_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -1127,14 +1626,14 @@ signed int ball_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
 		// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
 			return ARR_ERR_NOTFOUND;
 		}
 	}
@@ -1154,7 +1653,7 @@ signed int ball_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 
 
 /*--------------------------------------------------------------------------- */
-/* ARMv7 version.
+/* x86 AVX2 SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
@@ -1163,8 +1662,8 @@ signed int ball_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
    Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
 		 if it was false at least once.
 */
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-signed int ball_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int ball_le_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
 	Py_ssize_t index; 
@@ -1173,27 +1672,33 @@ signed int ball_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 	Py_ssize_t alignedlength;
 	unsigned int y;
 
-	uint8x8_t datasliceleft, datasliceright;
-	uint8x8_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1_u8( compvals);
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = vld1_u8( &data[index]);
-		// The actual SIMD operation. 
-		resultslice = vcle_u8(datasliceleft, datasliceright);
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
+		// Find the maximum values. 
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (vreinterpret_u64_u8(resultslice) != 0xffffffffffffffff) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			return ARR_ERR_NOTFOUND;
 		}
 	}
@@ -1212,42 +1717,165 @@ signed int ball_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 #endif
 
 
-
 /*--------------------------------------------------------------------------- */
-/* ARMv8 version.
+/* x86 AVX-512BW SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
    param1 = The parameter to be applied to each array element.
-   nosimd = If true, disable SIMD.
    Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
 		 if it was false at least once.
 */
-#if defined(AF_HASSIMD_ARM_AARCH64)
-signed int ball_le_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int ball_le_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
 	unsigned int y;
 
-	uint8x16_t datasliceleft, datasliceright;
-	uint8x16_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
-	uint64x2_t veccombine;
-	uint64_t highresult, lowresult;
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1q_u8( compvals);
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		if (resultmask != tailmask) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+signed int ball_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x8_t datasliceleft, datasliceright;
+	uint8x8_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data[index]);
+		// The actual SIMD operation. 
+		resultslice = vcle_u8(datasliceleft, datasliceright);
+		// Compare the results of the SIMD operation.
+		if (vreinterpret_u64_u8(resultslice) != 0xffffffffffffffff) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (!(data[index] <= param1)) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_ARM_AARCH64)
+signed int ball_le_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x16_t datasliceleft, datasliceright;
+	uint8x16_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+	uint64x2_t veccombine;
+	uint64_t highresult, lowresult;
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1q_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
 
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
@@ -1282,7 +1910,7 @@ signed int ball_le_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -1291,18 +1919,7 @@ signed int ball_le_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return ball_le_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return ball_le_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return ball_le_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return ball_simdfuncs.le(arraylen, data1, param);
 	} else {
 	#endif
 		return ball_le(arraylen, data1, param);
@@ -1368,7 +1985,7 @@ signed int ball_ne_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -1379,11 +1996,73 @@ signed int ball_ne_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Compare for equality.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0x0000) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (!(data[index] != param1)) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int ball_ne_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Compare for equality.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0x0000) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0x00000000) {
 			return ARR_ERR_NOTFOUND;
 		}
 	}
@@ -1402,6 +2081,70 @@ signed int ball_ne_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns 1 if the condition was true for all array elements, or ARR_ERR_NOTFOUND
+		 if it was false at least once.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int ball_ne_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		if (resultmask != tailmask) {
+			return ARR_ERR_NOTFOUND;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -1531,7 +2274,7 @@ signed int ball_ne_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -1540,18 +2283,7 @@ signed int ball_ne_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return ball_ne_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return ball_ne_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return ball_ne_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return ball_simdfuncs.ne(arraylen, data1, param);
 	} else {
 	#endif
 		return ball_ne(arraylen, data1, param);
@@ -1566,77 +2298,233 @@ signed int ball_ne_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 /*--------------------------------------------------------------------------- */
 
-/* The wrapper to the underlying C function */
-static PyObject *py_ball(PyObject *self, PyObject *args, PyObject *keywds) {
-
+/* Select the SIMD functions for this CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static void ball_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		ball_simdfuncs.eq = ball_eq_avx512_simd;
+		ball_simdfuncs.gt = ball_gt_avx512_simd;
+		ball_simdfuncs.ge = ball_ge_avx512_simd;
+		ball_simdfuncs.lt = ball_lt_avx512_simd;
+		ball_simdfuncs.le = ball_le_avx512_simd;
+		ball_simdfuncs.ne = ball_ne_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		ball_simdfuncs.eq = ball_eq_avx2_simd;
+		ball_simdfuncs.gt = ball_gt_avx2_simd;
+		ball_simdfuncs.ge = ball_ge_avx2_simd;
+		ball_simdfuncs.lt = ball_lt_avx2_simd;
+		ball_simdfuncs.le = ball_le_avx2_simd;
+		ball_simdfuncs.ne = ball_ne_avx2_simd;
+	} else {
+		ball_simdfuncs.eq = ball_eq_x86_simd;
+		ball_simdfuncs.gt = ball_gt_x86_simd;
+		ball_simdfuncs.ge = ball_ge_x86_simd;
+		ball_simdfuncs.lt = ball_lt_x86_simd;
+		ball_simdfuncs.le = ball_le_x86_simd;
+		ball_simdfuncs.ne = ball_ne_x86_simd;
+	}
+	#endif
 
-	// The error code returned by the function.
-	signed int resultcode = 0;
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	ball_simdfuncs.eq = ball_eq_armv7_simd;
+	ball_simdfuncs.gt = ball_gt_armv7_simd;
+	ball_simdfuncs.ge = ball_ge_armv7_simd;
+	ball_simdfuncs.lt = ball_lt_armv7_simd;
+	ball_simdfuncs.le = ball_le_armv7_simd;
+	ball_simdfuncs.ne = ball_ne_armv7_simd;
+	#endif
 
-	// This is used to hold the parsed parameters.
-	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	ball_simdfuncs.eq = ball_eq_armv8_simd;
+	ball_simdfuncs.gt = ball_gt_armv8_simd;
+	ball_simdfuncs.ge = ball_ge_armv8_simd;
+	ball_simdfuncs.lt = ball_lt_armv8_simd;
+	ball_simdfuncs.le = ball_le_armv8_simd;
+	ball_simdfuncs.ne = ball_ne_armv8_simd;
+	#endif
 
-	// -----------------------------------------------------
+}
+#endif
 
+/*--------------------------------------------------------------------------- */
 
-	// Get the parameters passed from Python.
-	bytesdata = getparams_allany(self, args, keywds, "ball");
+/* Call the C function for the requested operation on one block of the sequence.
+	bytesdata = The parsed parameters.
+	start = The index of the start of the block.
+	blocklen = The length of the block.
+	Returns: The result code for the block.
+*/
+static signed int ball_block(struct args_params_allany *bytesdata, Py_ssize_t start, Py_ssize_t blocklen) {
 
-	// If there was an error, we count on the parameter parsing function to 
-	// release the buffers if this was necessary.
-	if (bytesdata.errorcode) {
-		return NULL;
-	}
+	unsigned char *data = bytesdata->bytes1.B + start;
 
+	// The result of a search when only every step'th element is used.
+	Py_ssize_t strideresult;
 
-	// The length of the data array.
-	if (bytesdata.arraylen < 1) {
-		// Release the buffers. 
-		releasebuffers_allany(bytesdata);
-		ErrMsgArrayLengthErr();
-		return NULL;
+	// Use only every step'th element. The block must start on an element
+	// which is used.
+	if (bytesdata->step > 1) {
+		strideresult = stridefind_select(stridenegateop(bytesdata->opcode), blocklen, bytesdata->step, bytesdata->nosimd, data, NULL, bytesdata->param);
+		if (strideresult == ARR_ERR_INVALIDOP) {
+			return ARR_ERR_INVALIDOP;
+		}
+		return (strideresult >= 0) ? ARR_ERR_NOTFOUND : 1;
 	}
 
-
-	/* Call the C function for the requested operation. */
-	switch(bytesdata.opcode) {
+	switch(bytesdata->opcode) {
 		// AF_EQ
 		case OP_AF_EQ: {
-			resultcode = ball_eq_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return ball_eq_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_GT
 		case OP_AF_GT: {
-			resultcode = ball_gt_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return ball_gt_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_GE
 		case OP_AF_GE: {
-			resultcode = ball_ge_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return ball_ge_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_LT
 		case OP_AF_LT: {
-			resultcode = ball_lt_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return ball_lt_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_LE
 		case OP_AF_LE: {
-			resultcode = ball_le_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return ball_le_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_NE
 		case OP_AF_NE: {
-			resultcode = ball_ne_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return ball_ne_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// The operation code is unknown.
 		default: {
-			resultcode = ARR_ERR_INVALIDOP;
+			return ARR_ERR_INVALIDOP;
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+// The data for a search which is divided between threads.
+struct ball_threadctx {
+	struct args_params_allany *bytesdata;
+	// This is set to zero when any part finds a false comparison.
+	struct sharedpos found;
+};
+
+
+/* Search one part of the sequence. Each part searches every nparts'th
+	block, starting with block number "part". The search stops as soon as
+	the shared position shows that the remaining blocks cannot affect the 
+	result.
+	ctx = The calculation data (struct ball_threadctx).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void ball_part(void *ctx, int part, int nparts) {
+
+	struct ball_threadctx *threadctx = (struct ball_threadctx *) ctx;
+	struct args_params_allany *bytesdata = threadctx->bytesdata;
+
+	Py_ssize_t start, blocklen;
+	signed int resultcode;
+
+	// The blocks must start on an element which is used.
+	Py_ssize_t blocksize = searchblocksize(bytesdata->step);
+
+	for (start = (Py_ssize_t) part * blocksize; start < bytesdata->arraylen; start += (Py_ssize_t) nparts * blocksize) {
+
+		// Another thread has already found the result.
+		if (start >= sharedpos_get(&threadctx->found)) {
+			return;
+		}
+
+		blocklen = bytesdata->arraylen - start;
+		if (blocklen > blocksize) {
+			blocklen = blocksize;
 		}
+
+		resultcode = ball_block(bytesdata, start, blocklen);
+
+		// A false comparison ends the entire search.
+		if (resultcode == ARR_ERR_NOTFOUND) {
+			sharedpos_lower(&threadctx->found, 0);
+			return;
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_ball(PyObject *self, BF_ARGSDECL) {
+
+
+	// The error code returned by the function.
+	signed int resultcode = 0;
+
+	// This is used to hold the parsed parameters.
+	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+
+	// The data for a search which is divided between threads.
+	struct ball_threadctx threadctx;
+
+	// The number of parts to divide the search into.
+	int nparts;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_allany(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// The length of the data array.
+	if (bytesdata.arraylen < 1) {
+		// Release the buffers. 
+		releasebuffers_allany(bytesdata);
+		ErrMsgArrayLengthErr();
+		return NULL;
 	}
 
 
+	// The search is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+	threadctx.bytesdata = &bytesdata;
+
+	// If the shared position cannot be created, don't use threads.
+	if ((nparts > 1) && sharedpos_init(&threadctx.found, bytesdata.arraylen)) {
+		nparts = 1;
+	}
+
+
+	/* Call the C function for the requested operation. */
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	if (nparts > 1) {
+		runparallel(ball_part, &threadctx, nparts);
+		resultcode = (sharedpos_get(&threadctx.found) < bytesdata.arraylen) ? ARR_ERR_NOTFOUND : 1;
+		sharedpos_free(&threadctx.found);
+	} else {
+		resultcode = ball_block(&bytesdata, 0, bytesdata.arraylen);
+	}
+	BF_END_ALLOW_THREADS
+
+
 	// Release the buffers. 
 	releasebuffers_allany(bytesdata);
 
@@ -1678,7 +2566,10 @@ Call formats: \n\
 \n\
   result = ball(opstr, sequence, param) \n\
   result = ball(opstr, sequence, param, maxlen=y) \n\
+  result = ball(opstr, sequence, param, start=i, stop=j) \n\
+  result = ball(opstr, sequence, param, step=k) \n\
   result = ball(opstr, sequence, param, nosimd=False) \n\
+  result = ball(opstr, sequence, param, threads=4) \n\
 \n\
 * opstr - The arithmetic comparison operation as a string. \n\
           These are: '==', '>', '>=', '<', '<=', '!='. \n\
@@ -1688,28 +2579,180 @@ Call formats: \n\
   positive integer. If a zero or negative length, or a value which is \n\
   greater than the actual length of the sequence is specified, this \n\
   parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. These are optional keyword \n\
+  parameters and are applied before maxlen. No data is copied. \n\
+  Indexes returned by findindex are relative to the whole sequence. \n\
+* step - Use only every step'th element, as if the sequence had been \n\
+  sliced with sequence[start:stop:step]. This must be a positive \n\
+  integer. This is an optional keyword parameter. Indexes returned by \n\
+  findindex are positions in the whole sequence, not in the slice. \n\
 * nosimd - If True, SIMD acceleration is disabled if present. \n\
   The default is False (SIMD acceleration is enabled if present). \n\
+* threads - The number of threads to divide the search between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
 * result - A boolean value corresponding to the result of all the \n\
   comparison operations. If any comparison operations result in true, \n\
   the return value will be true. If all of them result in false, the \n\
   return value will be false. \n\
 ");
 
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function for a batch of sequences */
+static PyObject *py_ball_many(PyObject *self, BF_ARGSDECL) {
+
+
+	// The error code returned by the function.
+	signed int resultcode = 0;
+
+	// This is used to hold the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The parameters for each sequence in the batch.
+	struct args_params_allany seqdata = ARGSINIT_ALLANY;
+
+	// The result for each sequence.
+	Py_ssize_t *results;
+
+	// The results as a python list.
+	PyObject *resultlist;
+
+	Py_ssize_t x;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_many_allany(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// Every sequence must contain data.
+	if (hasemptyseq_many(&bytesdata)) {
+		// Release the buffers. 
+		releasebuffers_many(bytesdata);
+		ErrMsgArrayLengthErr();
+		return NULL;
+	}
+
+	results = PyMem_New(Py_ssize_t, bytesdata.nseqs + 1);
+	if (results == NULL) {
+		releasebuffers_many(bytesdata);
+		return PyErr_NoMemory();
+	}
+
+	// The same operation is used with every sequence.
+	seqdata.opcode = bytesdata.opcode;
+	seqdata.param = bytesdata.param;
+	seqdata.nosimd = bytesdata.nosimd;
+
+
+	/* Call the C function for each sequence. */
+	// The GIL is released if the batch is large.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.totallen)
+	for (x = 0; x < bytesdata.nseqs; x++) {
+		seqdata.arraylen = bytesdata.pybuffers[x].len;
+		seqdata.bytes1.buf = bytesdata.pybuffers[x].buf;
+		resultcode = ball_block(&seqdata, 0, seqdata.arraylen);
+		if (resultcode == ARR_ERR_INVALIDOP) {
+			break;
+		}
+		results[x] = (resultcode != ARR_ERR_NOTFOUND);
+	}
+	BF_END_ALLOW_THREADS
+
+
+	// Release the buffers. 
+	releasebuffers_many(bytesdata);
+
+
+	// Signal the errors.
+	if (resultcode == ARR_ERR_INVALIDOP) {
+		PyMem_Free(results);
+		ErrMsgOperatorNotValidforthisFunction();
+		return NULL;
+	}
+
+
+	resultlist = boollist_many(results, bytesdata.nseqs);
+	PyMem_Free(results);
+
+	return resultlist;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(ball_many__doc__,
+"ball_many \n\
+_____________________________ \n\
+\n\
+Calculate ball over the values in each sequence in a batch. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          [ball(opstr, x, param) for x in sequences] \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  result = ball_many(opstr, sequences, param) \n\
+  result = ball_many(opstr, sequences, param, nosimd=False) \n\
+\n\
+* opstr - The arithmetic comparison operation as a string. \n\
+          These are: '==', '>', '>=', '<', '<=', '!='. \n\
+* sequences - A list or other iterable of bytes or bytearray sequences. \n\
+  None of them may be empty. \n\
+* param - A non-array numeric parameter. \n\
+* nosimd - If True, SIMD acceleration is disabled if present. \n\
+  The default is False (SIMD acceleration is enabled if present). \n\
+* result - A list with a boolean for each sequence, which is True if \n\
+  all the values in that sequence meet the criteria. \n\
+");
+
 
 /*--------------------------------------------------------------------------- */
 
 /* A list of all the methods defined by this module. 
  "ball" is the name seen inside of Python. 
  "py_ball" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef ball_methods[] = {
-	{"ball",  (PyCFunction)py_ball, METH_VARARGS | METH_KEYWORDS, ball__doc__}, 
+	{"ball",  (PyCFunction)py_ball, BF_METHFLAGS, ball__doc__}, 
+	{"ball_many",  (PyCFunction)py_ball_many, BF_METHFLAGS, ball_many__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int ball_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	ball_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
+	return PyModule_AddFunctions(module, ball_methods);
+};
+
+#else
+
 static struct PyModuleDef ballmodule = {
     PyModuleDef_HEAD_INIT,
     "ball",
@@ -1720,8 +2763,16 @@ static struct PyModuleDef ballmodule = {
 
 PyMODINIT_FUNC PyInit_ball(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	ball_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
     return PyModule_Create(&ballmodule);
 };
 
+#endif
+
 /*--------------------------------------------------------------------------- */
 
@@ -39,6 +39,9 @@
 #include "arrayops.h"
 
 #include "bytesparams_allany.h"
+#include "bytesparams_many.h"
+#include "bytesthreads.h"
+#include "bytesstride.h"
 
 #include "simddefs.h"
 #if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
@@ -46,6 +49,23 @@
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+
+/* The SIMD functions to use for each compare operation. These are selected
+   once when the module is initialised, according to the SIMD features
+   supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	signed int (*eq)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	signed int (*gt)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	signed int (*ge)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	signed int (*lt)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	signed int (*le)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	signed int (*ne)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+} bany_simdfuncs;
+#endif
+
 /*--------------------------------------------------------------------------- */
 
 /*--------------------------------------------------------------------------- */
@@ -100,7 +120,7 @@ signed int bany_eq_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -111,11 +131,73 @@ signed int bany_eq_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Compare the slices.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0x0000) {
+			return 1;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] == param1) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int bany_eq_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Compare the slices.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0x0000) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0x00000000) {
 			return 1;
 		}
 	}
@@ -134,6 +216,70 @@ signed int bany_eq_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns 1 if the condition was true for any array elements, or ARR_ERR_NOTFOUND
+		 if it was always false.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int bany_eq_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		// Any element may pass the test.
+		if (resultmask != 0) {
+			return 1;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		if (resultmask != 0) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -263,7 +409,7 @@ signed int bany_eq_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -272,18 +418,7 @@ signed int bany_eq_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return bany_eq_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return bany_eq_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return bany_eq_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return bany_simdfuncs.eq(arraylen, data1, param);
 	} else {
 	#endif
 		return bany_eq(arraylen, data1, param);
@@ -348,7 +483,7 @@ signed int bany_gt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -359,14 +494,79 @@ signed int bany_gt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Find the maximum values. 
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// If this is different from our compare parameter, then at
+		// least one value is greater than. 
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
+			return 1;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] > param1) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int bany_gt_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// If this is different from our compare parameter, then at
 		// least one value is greater than. 
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			return 1;
 		}
 	}
@@ -385,6 +585,70 @@ signed int bany_gt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns 1 if the condition was true for any array elements, or ARR_ERR_NOTFOUND
+		 if it was always false.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int bany_gt_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		// Any element may pass the test.
+		if (resultmask != 0) {
+			return 1;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		if (resultmask != 0) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -514,7 +778,7 @@ signed int bany_gt_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -523,18 +787,7 @@ signed int bany_gt_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return bany_gt_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return bany_gt_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return bany_gt_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return bany_simdfuncs.gt(arraylen, data1, param);
 	} else {
 	#endif
 		return bany_gt(arraylen, data1, param);
@@ -599,7 +852,7 @@ signed int bany_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -610,14 +863,14 @@ signed int bany_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then a least.
 		// one value is less than.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0x0000) {
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0x0000) {
 			return 1;
 		}
 	}
@@ -637,7 +890,7 @@ signed int bany_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 
 
 /*--------------------------------------------------------------------------- */
-/* ARMv7 version.
+/* x86 AVX2 SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
@@ -646,8 +899,8 @@ signed int bany_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
    Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
 		if it was not found.
 */
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-signed int bany_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int bany_ge_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
 	Py_ssize_t index; 
@@ -656,27 +909,33 @@ signed int bany_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 	Py_ssize_t alignedlength;
 	unsigned int y;
 
-	uint8x8_t datasliceleft, datasliceright;
-	uint8x8_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1_u8( compvals);
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = vld1_u8( &data[index]);
-		// The actual SIMD operation. 
-		resultslice = vcge_u8(datasliceleft, datasliceright);
-		// Compare the results of the SIMD operation.
-		if (vreinterpret_u64_u8(resultslice) != 0x0000000000000000) {
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
+		// Find the minimum values. 
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then a least.
+		// one value is less than.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0x00000000) {
 			return 1;
 		}
 	}
@@ -695,62 +954,59 @@ signed int bany_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 #endif
 
 
-
 /*--------------------------------------------------------------------------- */
-/* ARMv8 version.
+/* x86 AVX-512BW SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
    param1 = The parameter to be applied to each array element.
-   nosimd = If true, disable SIMD.
-   Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
-		if it was not found.
+   Returns 1 if the condition was true for any array elements, or ARR_ERR_NOTFOUND
+		 if it was always false.
 */
-#if defined(AF_HASSIMD_ARM_AARCH64)
-signed int bany_ge_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int bany_ge_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
 	unsigned int y;
 
-	uint8x16_t datasliceleft, datasliceright;
-	uint8x16_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
-	uint64x2_t veccombine;
-	uint64_t highresult, lowresult;
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1q_u8( compvals);
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = vld1q_u8( &data[index]);
-		// The actual SIMD operation. 
-		resultslice = vcgeq_u8(datasliceleft, datasliceright);
-		// Combine the result to two 64 bit vectors.
-		veccombine = vreinterpretq_u64_u8(resultslice);
-		// Get the high and low lanes of the combined vector.
-		lowresult = vgetq_lane_u64(veccombine, 0);
-		highresult = vgetq_lane_u64(veccombine, 1);
-		// Compare the results of the SIMD operation.
-		if ((lowresult != 0x0000000000000000) || (highresult != 0x0000000000000000)) {
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		// Any element may pass the test.
+		if (resultmask != 0) {
 			return 1;
 		}
 	}
 
-	// Get the max value within the left over elements at the end of the array.
-	for (index = alignedlength; index < arraylen; index++) {
-		if (data[index] >= param1) {
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		if (resultmask != 0) {
 			return 1;
 		}
 	}
@@ -762,30 +1018,145 @@ signed int bany_ge_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 #endif
 
 
-
 /*--------------------------------------------------------------------------- */
-/* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+/* ARMv7 version.
+   opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
-   data1 = The first data array.
-   param = The parameter to be applied to each array element.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
+		if it was not found.
 */
-signed int bany_ge_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) { 
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+signed int bany_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
-	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
-	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return bany_ge_x86_simd(arraylen, data1, param);
-		#endif
+	// array index counter. 
+	Py_ssize_t index; 
 
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return bany_ge_armv7_simd(arraylen, data1, param);
-		#endif
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x8_t datasliceleft, datasliceright;
+	uint8x8_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data[index]);
+		// The actual SIMD operation. 
+		resultslice = vcge_u8(datasliceleft, datasliceright);
+		// Compare the results of the SIMD operation.
+		if (vreinterpret_u64_u8(resultslice) != 0x0000000000000000) {
+			return 1;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] >= param1) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_ARM_AARCH64)
+signed int bany_ge_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x16_t datasliceleft, datasliceright;
+	uint8x16_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+	uint64x2_t veccombine;
+	uint64_t highresult, lowresult;
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1q_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data[index]);
+		// The actual SIMD operation. 
+		resultslice = vcgeq_u8(datasliceleft, datasliceright);
+		// Combine the result to two 64 bit vectors.
+		veccombine = vreinterpretq_u64_u8(resultslice);
+		// Get the high and low lanes of the combined vector.
+		lowresult = vgetq_lane_u64(veccombine, 0);
+		highresult = vgetq_lane_u64(veccombine, 1);
+		// Compare the results of the SIMD operation.
+		if ((lowresult != 0x0000000000000000) || (highresult != 0x0000000000000000)) {
+			return 1;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] >= param1) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
 
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return bany_ge_armv8_simd(arraylen, data1, param);
-		#endif
+}
+
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   param = The parameter to be applied to each array element.
+*/
+signed int bany_ge_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) { 
 
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		return bany_simdfuncs.ge(arraylen, data1, param);
 	} else {
 	#endif
 		return bany_ge(arraylen, data1, param);
@@ -850,7 +1221,7 @@ signed int bany_lt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -861,14 +1232,79 @@ signed int bany_lt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Find the minimum values. 
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// If this is different from our compare parameter, then at
+		// least one value is less than.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
+			return 1;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] < param1) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int bany_lt_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// If this is different from our compare parameter, then at
 		// least one value is less than.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			return 1;
 		}
 	}
@@ -887,6 +1323,70 @@ signed int bany_lt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns 1 if the condition was true for any array elements, or ARR_ERR_NOTFOUND
+		 if it was always false.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int bany_lt_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		// Any element may pass the test.
+		if (resultmask != 0) {
+			return 1;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		if (resultmask != 0) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -1016,7 +1516,7 @@ signed int bany_lt_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -1025,18 +1525,7 @@ signed int bany_lt_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return bany_lt_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return bany_lt_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return bany_lt_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return bany_simdfuncs.lt(arraylen, data1, param);
 	} else {
 	#endif
 		return bany_lt(arraylen, data1, param);
@@ -1101,7 +1590,7 @@ signed int bany_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -1112,14 +1601,14 @@ signed int bany_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
 		// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then at
 		// least one value is less than or equal to.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0x0000) {
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0x0000) {
 			return 1;
 		}
 	}
@@ -1139,7 +1628,7 @@ signed int bany_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 
 
 /*--------------------------------------------------------------------------- */
-/* ARMv7 version.
+/* x86 AVX2 SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
@@ -1148,8 +1637,8 @@ signed int bany_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
    Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
 		if it was not found.
 */
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-signed int bany_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int bany_le_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
 	Py_ssize_t index; 
@@ -1158,27 +1647,33 @@ signed int bany_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 	Py_ssize_t alignedlength;
 	unsigned int y;
 
-	uint8x8_t datasliceleft, datasliceright;
-	uint8x8_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1_u8( compvals);
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = vld1_u8( &data[index]);
-		// The actual SIMD operation. 
-		resultslice = vcle_u8(datasliceleft, datasliceright);
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
+		// Find the maximum values. 
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then at
+		// least one value is less than or equal to.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (vreinterpret_u64_u8(resultslice) != 0x0000000000000000) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0x00000000) {
 			return 1;
 		}
 	}
@@ -1197,54 +1692,177 @@ signed int bany_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 #endif
 
 
-
 /*--------------------------------------------------------------------------- */
-/* ARMv8 version.
+/* x86 AVX-512BW SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
    param1 = The parameter to be applied to each array element.
-   nosimd = If true, disable SIMD.
-   Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
-		if it was not found.
+   Returns 1 if the condition was true for any array elements, or ARR_ERR_NOTFOUND
+		 if it was always false.
 */
-#if defined(AF_HASSIMD_ARM_AARCH64)
-signed int bany_le_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int bany_le_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
 	unsigned int y;
 
-	uint8x16_t datasliceleft, datasliceright;
-	uint8x16_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
-	uint64x2_t veccombine;
-	uint64_t highresult, lowresult;
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1q_u8( compvals);
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = vld1q_u8( &data[index]);
-		// The actual SIMD operation. 
-		resultslice = vcleq_u8(datasliceleft, datasliceright);
-		// Combine the result to two 64 bit vectors.
-		veccombine = vreinterpretq_u64_u8(resultslice);
-		// Get the high and low lanes of the combined vector.
-		lowresult = vgetq_lane_u64(veccombine, 0);
-		highresult = vgetq_lane_u64(veccombine, 1);
-		// Compare the results of the SIMD operation.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		// Any element may pass the test.
+		if (resultmask != 0) {
+			return 1;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		if (resultmask != 0) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+signed int bany_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x8_t datasliceleft, datasliceright;
+	uint8x8_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data[index]);
+		// The actual SIMD operation. 
+		resultslice = vcle_u8(datasliceleft, datasliceright);
+		// Compare the results of the SIMD operation.
+		if (vreinterpret_u64_u8(resultslice) != 0x0000000000000000) {
+			return 1;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] <= param1) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_ARM_AARCH64)
+signed int bany_le_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x16_t datasliceleft, datasliceright;
+	uint8x16_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+	uint64x2_t veccombine;
+	uint64_t highresult, lowresult;
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1q_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data[index]);
+		// The actual SIMD operation. 
+		resultslice = vcleq_u8(datasliceleft, datasliceright);
+		// Combine the result to two 64 bit vectors.
+		veccombine = vreinterpretq_u64_u8(resultslice);
+		// Get the high and low lanes of the combined vector.
+		lowresult = vgetq_lane_u64(veccombine, 0);
+		highresult = vgetq_lane_u64(veccombine, 1);
+		// Compare the results of the SIMD operation.
 		if ((lowresult != 0x0000000000000000) || (highresult != 0x0000000000000000)) {
 			return 1;
 		}
@@ -1267,7 +1885,7 @@ signed int bany_le_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -1276,18 +1894,7 @@ signed int bany_le_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return bany_le_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return bany_le_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return bany_le_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return bany_simdfuncs.le(arraylen, data1, param);
 	} else {
 	#endif
 		return bany_le(arraylen, data1, param);
@@ -1352,7 +1959,7 @@ signed int bany_ne_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -1363,11 +1970,73 @@ signed int bany_ne_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Compare for equality.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
+			return 1;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] != param1) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns 1 if the condition was true at least once, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int bany_ne_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Compare for equality.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			return 1;
 		}
 	}
@@ -1386,6 +2055,70 @@ signed int bany_ne_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsigned c
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns 1 if the condition was true for any array elements, or ARR_ERR_NOTFOUND
+		 if it was always false.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int bany_ne_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		// Any element may pass the test.
+		if (resultmask != 0) {
+			return 1;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		if (resultmask != 0) {
+			return 1;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -1515,7 +2248,7 @@ signed int bany_ne_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -1524,18 +2257,7 @@ signed int bany_ne_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return bany_ne_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return bany_ne_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return bany_ne_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return bany_simdfuncs.ne(arraylen, data1, param);
 	} else {
 	#endif
 		return bany_ne(arraylen, data1, param);
@@ -1550,77 +2272,233 @@ signed int bany_ne_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1,
 
 /*--------------------------------------------------------------------------- */
 
-/* The wrapper to the underlying C function */
-static PyObject *py_bany(PyObject *self, PyObject *args, PyObject *keywds) {
-
+/* Select the SIMD functions for this CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static void bany_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		bany_simdfuncs.eq = bany_eq_avx512_simd;
+		bany_simdfuncs.gt = bany_gt_avx512_simd;
+		bany_simdfuncs.ge = bany_ge_avx512_simd;
+		bany_simdfuncs.lt = bany_lt_avx512_simd;
+		bany_simdfuncs.le = bany_le_avx512_simd;
+		bany_simdfuncs.ne = bany_ne_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		bany_simdfuncs.eq = bany_eq_avx2_simd;
+		bany_simdfuncs.gt = bany_gt_avx2_simd;
+		bany_simdfuncs.ge = bany_ge_avx2_simd;
+		bany_simdfuncs.lt = bany_lt_avx2_simd;
+		bany_simdfuncs.le = bany_le_avx2_simd;
+		bany_simdfuncs.ne = bany_ne_avx2_simd;
+	} else {
+		bany_simdfuncs.eq = bany_eq_x86_simd;
+		bany_simdfuncs.gt = bany_gt_x86_simd;
+		bany_simdfuncs.ge = bany_ge_x86_simd;
+		bany_simdfuncs.lt = bany_lt_x86_simd;
+		bany_simdfuncs.le = bany_le_x86_simd;
+		bany_simdfuncs.ne = bany_ne_x86_simd;
+	}
+	#endif
 
-	// The error code returned by the function.
-	signed int resultcode = 0;
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	bany_simdfuncs.eq = bany_eq_armv7_simd;
+	bany_simdfuncs.gt = bany_gt_armv7_simd;
+	bany_simdfuncs.ge = bany_ge_armv7_simd;
+	bany_simdfuncs.lt = bany_lt_armv7_simd;
+	bany_simdfuncs.le = bany_le_armv7_simd;
+	bany_simdfuncs.ne = bany_ne_armv7_simd;
+	#endif
 
-	// This is used to hold the parsed parameters.
-	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	bany_simdfuncs.eq = bany_eq_armv8_simd;
+	bany_simdfuncs.gt = bany_gt_armv8_simd;
+	bany_simdfuncs.ge = bany_ge_armv8_simd;
+	bany_simdfuncs.lt = bany_lt_armv8_simd;
+	bany_simdfuncs.le = bany_le_armv8_simd;
+	bany_simdfuncs.ne = bany_ne_armv8_simd;
+	#endif
 
-	// -----------------------------------------------------
+}
+#endif
 
+/*--------------------------------------------------------------------------- */
 
-	// Get the parameters passed from Python.
-	bytesdata = getparams_allany(self, args, keywds, "bany");
+/* Call the C function for the requested operation on one block of the sequence.
+	bytesdata = The parsed parameters.
+	start = The index of the start of the block.
+	blocklen = The length of the block.
+	Returns: The result code for the block.
+*/
+static signed int bany_block(struct args_params_allany *bytesdata, Py_ssize_t start, Py_ssize_t blocklen) {
 
-	// If there was an error, we count on the parameter parsing function to 
-	// release the buffers if this was necessary.
-	if (bytesdata.errorcode) {
-		return NULL;
-	}
+	unsigned char *data = bytesdata->bytes1.B + start;
 
+	// The result of a search when only every step'th element is used.
+	Py_ssize_t strideresult;
 
-	// The length of the data array.
-	if (bytesdata.arraylen < 1) {
-		// Release the buffers. 
-		releasebuffers_allany(bytesdata);
-		ErrMsgArrayLengthErr();
-		return NULL;
+	// Use only every step'th element. The block must start on an element
+	// which is used.
+	if (bytesdata->step > 1) {
+		strideresult = stridefind_select(bytesdata->opcode, blocklen, bytesdata->step, bytesdata->nosimd, data, NULL, bytesdata->param);
+		if (strideresult == ARR_ERR_INVALIDOP) {
+			return ARR_ERR_INVALIDOP;
+		}
+		return (strideresult >= 0) ? 1 : ARR_ERR_NOTFOUND;
 	}
 
-
-	/* Call the C function for the requested operation. */
-	switch(bytesdata.opcode) {
+	switch(bytesdata->opcode) {
 		// AF_EQ
 		case OP_AF_EQ: {
-			resultcode = bany_eq_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return bany_eq_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_GT
 		case OP_AF_GT: {
-			resultcode = bany_gt_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return bany_gt_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_GE
 		case OP_AF_GE: {
-			resultcode = bany_ge_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return bany_ge_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_LT
 		case OP_AF_LT: {
-			resultcode = bany_lt_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return bany_lt_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_LE
 		case OP_AF_LE: {
-			resultcode = bany_le_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return bany_le_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_NE
 		case OP_AF_NE: {
-			resultcode = bany_ne_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return bany_ne_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// The operation code is unknown.
 		default: {
-			resultcode = ARR_ERR_INVALIDOP;
+			return ARR_ERR_INVALIDOP;
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+// The data for a search which is divided between threads.
+struct bany_threadctx {
+	struct args_params_allany *bytesdata;
+	// This is set to zero when any part finds a true comparison.
+	struct sharedpos found;
+};
+
+
+/* Search one part of the sequence. Each part searches every nparts'th
+	block, starting with block number "part". The search stops as soon as
+	the shared position shows that the remaining blocks cannot affect the 
+	result.
+	ctx = The calculation data (struct bany_threadctx).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void bany_part(void *ctx, int part, int nparts) {
+
+	struct bany_threadctx *threadctx = (struct bany_threadctx *) ctx;
+	struct args_params_allany *bytesdata = threadctx->bytesdata;
+
+	Py_ssize_t start, blocklen;
+	signed int resultcode;
+
+	// The blocks must start on an element which is used.
+	Py_ssize_t blocksize = searchblocksize(bytesdata->step);
+
+	for (start = (Py_ssize_t) part * blocksize; start < bytesdata->arraylen; start += (Py_ssize_t) nparts * blocksize) {
+
+		// Another thread has already found the result.
+		if (start >= sharedpos_get(&threadctx->found)) {
+			return;
+		}
+
+		blocklen = bytesdata->arraylen - start;
+		if (blocklen > blocksize) {
+			blocklen = blocksize;
 		}
+
+		resultcode = bany_block(bytesdata, start, blocklen);
+
+		// A true comparison ends the entire search.
+		if (resultcode != ARR_ERR_NOTFOUND) {
+			sharedpos_lower(&threadctx->found, 0);
+			return;
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_bany(PyObject *self, BF_ARGSDECL) {
+
+
+	// The error code returned by the function.
+	signed int resultcode = 0;
+
+	// This is used to hold the parsed parameters.
+	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+
+	// The data for a search which is divided between threads.
+	struct bany_threadctx threadctx;
+
+	// The number of parts to divide the search into.
+	int nparts;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_allany(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// The length of the data array.
+	if (bytesdata.arraylen < 1) {
+		// Release the buffers. 
+		releasebuffers_allany(bytesdata);
+		ErrMsgArrayLengthErr();
+		return NULL;
+	}
+
+
+	// The search is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+	threadctx.bytesdata = &bytesdata;
+
+	// If the shared position cannot be created, don't use threads.
+	if ((nparts > 1) && sharedpos_init(&threadctx.found, bytesdata.arraylen)) {
+		nparts = 1;
 	}
 
 
+	/* Call the C function for the requested operation. */
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	if (nparts > 1) {
+		runparallel(bany_part, &threadctx, nparts);
+		resultcode = (sharedpos_get(&threadctx.found) < bytesdata.arraylen) ? 1 : ARR_ERR_NOTFOUND;
+		sharedpos_free(&threadctx.found);
+	} else {
+		resultcode = bany_block(&bytesdata, 0, bytesdata.arraylen);
+	}
+	BF_END_ALLOW_THREADS
+
+
 	// Release the buffers. 
 	releasebuffers_allany(bytesdata);
 
@@ -1662,7 +2540,10 @@ Call formats: \n\
 \n\
   result = bany(opstr, sequence, param) \n\
   result = bany(opstr, sequence, param, maxlen=y) \n\
+  result = bany(opstr, sequence, param, start=i, stop=j) \n\
+  result = bany(opstr, sequence, param, step=k) \n\
   result = bany(opstr, sequence, param, nosimd=False) \n\
+  result = bany(opstr, sequence, param, threads=4) \n\
 \n\
 * opstr - The arithmetic comparison operation as a string. \n\
           These are: '==', '>', '>=', '<', '<=', '!='. \n\
@@ -1672,28 +2553,180 @@ Call formats: \n\
   positive integer. If a zero or negative length, or a value which is \n\
   greater than the actual length of the sequence is specified, this \n\
   parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. These are optional keyword \n\
+  parameters and are applied before maxlen. No data is copied. \n\
+  Indexes returned by findindex are relative to the whole sequence. \n\
+* step - Use only every step'th element, as if the sequence had been \n\
+  sliced with sequence[start:stop:step]. This must be a positive \n\
+  integer. This is an optional keyword parameter. Indexes returned by \n\
+  findindex are positions in the whole sequence, not in the slice. \n\
 * nosimd - If True, SIMD acceleration is disabled if present. \n\
   The default is False (SIMD acceleration is enabled if present). \n\
+* threads - The number of threads to divide the search between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
 * result - A boolean value corresponding to the result of all the \n\
   comparison operations. If all comparison operations result in true, \n\
   the return value will be true. If any of them result in false, the \n\
   return value will be false. \n\
 ");
 
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function for a batch of sequences */
+static PyObject *py_bany_many(PyObject *self, BF_ARGSDECL) {
+
+
+	// The error code returned by the function.
+	signed int resultcode = 0;
+
+	// This is used to hold the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The parameters for each sequence in the batch.
+	struct args_params_allany seqdata = ARGSINIT_ALLANY;
+
+	// The result for each sequence.
+	Py_ssize_t *results;
+
+	// The results as a python list.
+	PyObject *resultlist;
+
+	Py_ssize_t x;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_many_allany(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// Every sequence must contain data.
+	if (hasemptyseq_many(&bytesdata)) {
+		// Release the buffers. 
+		releasebuffers_many(bytesdata);
+		ErrMsgArrayLengthErr();
+		return NULL;
+	}
+
+	results = PyMem_New(Py_ssize_t, bytesdata.nseqs + 1);
+	if (results == NULL) {
+		releasebuffers_many(bytesdata);
+		return PyErr_NoMemory();
+	}
+
+	// The same operation is used with every sequence.
+	seqdata.opcode = bytesdata.opcode;
+	seqdata.param = bytesdata.param;
+	seqdata.nosimd = bytesdata.nosimd;
+
+
+	/* Call the C function for each sequence. */
+	// The GIL is released if the batch is large.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.totallen)
+	for (x = 0; x < bytesdata.nseqs; x++) {
+		seqdata.arraylen = bytesdata.pybuffers[x].len;
+		seqdata.bytes1.buf = bytesdata.pybuffers[x].buf;
+		resultcode = bany_block(&seqdata, 0, seqdata.arraylen);
+		if (resultcode == ARR_ERR_INVALIDOP) {
+			break;
+		}
+		results[x] = (resultcode != ARR_ERR_NOTFOUND);
+	}
+	BF_END_ALLOW_THREADS
+
+
+	// Release the buffers. 
+	releasebuffers_many(bytesdata);
+
+
+	// Signal the errors.
+	if (resultcode == ARR_ERR_INVALIDOP) {
+		PyMem_Free(results);
+		ErrMsgOperatorNotValidforthisFunction();
+		return NULL;
+	}
+
+
+	resultlist = boollist_many(results, bytesdata.nseqs);
+	PyMem_Free(results);
+
+	return resultlist;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(bany_many__doc__,
+"bany_many \n\
+_____________________________ \n\
+\n\
+Calculate bany over the values in each sequence in a batch. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          [bany(opstr, x, param) for x in sequences] \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  result = bany_many(opstr, sequences, param) \n\
+  result = bany_many(opstr, sequences, param, nosimd=False) \n\
+\n\
+* opstr - The arithmetic comparison operation as a string. \n\
+          These are: '==', '>', '>=', '<', '<=', '!='. \n\
+* sequences - A list or other iterable of bytes or bytearray sequences. \n\
+  None of them may be empty. \n\
+* param - A non-array numeric parameter. \n\
+* nosimd - If True, SIMD acceleration is disabled if present. \n\
+  The default is False (SIMD acceleration is enabled if present). \n\
+* result - A list with a boolean for each sequence, which is True if \n\
+  any value in that sequence meets the criteria. \n\
+");
+
 
 /*--------------------------------------------------------------------------- */
 
 /* A list of all the methods defined by this module. 
  "bany" is the name seen inside of Python. 
  "py_bany" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef bany_methods[] = {
-	{"bany",  (PyCFunction)py_bany, METH_VARARGS | METH_KEYWORDS, bany__doc__}, 
+	{"bany",  (PyCFunction)py_bany, BF_METHFLAGS, bany__doc__}, 
+	{"bany_many",  (PyCFunction)py_bany_many, BF_METHFLAGS, bany_many__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int bany_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	bany_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
+	return PyModule_AddFunctions(module, bany_methods);
+};
+
+#else
+
 static struct PyModuleDef banymodule = {
     PyModuleDef_HEAD_INIT,
     "bany",
@@ -1704,8 +2737,16 @@ static struct PyModuleDef banymodule = {
 
 PyMODINIT_FUNC PyInit_bany(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	bany_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
     return PyModule_Create(&banymodule);
 };
 
+#endif
+
 /*--------------------------------------------------------------------------- */
 
@@ -0,0 +1,328 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   bstats.c
+// Purpose:  Calculate the minimum, maximum, and sum of a sequence in one pass.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+/* The minimum, maximum, and sum are calculated together so the data is read
+	only once, rather than once each by bmin, bmax, and bsum. The calculation
+	is in bytesstride.c, where the SIMD versions combine the loops used for
+	each of these with a step. A step of one uses the same functions. The
+	sum of a sequence of bytes cannot overflow, so there is no "matherrors"
+	parameter.
+*/
+
+/*--------------------------------------------------------------------------- */
+
+#include "Python.h"
+
+#include <limits.h>
+#include <stdbool.h>
+
+#include "byteserrs.h"
+
+#include "bytesparams_base.h"
+#include "bytesthreads.h"
+#include "bytesstride.h"
+
+/*--------------------------------------------------------------------------- */
+
+// The list of keyword arguments. All argument must be listed, whether we
+// intend to use them for keywords or not.
+static char *kwlist[] = {"data", "maxlen", "nosimd", "threads", "start", "stop", "step", "extended", NULL};
+
+/*--------------------------------------------------------------------------- */
+
+// The data for a calculation which may be divided between threads.
+struct bstats_threadctx {
+	Py_ssize_t arraylen;
+	Py_ssize_t step;
+	int nosimd;
+	unsigned char *data;
+	// The results for each part.
+	struct stridestats partstats[BF_MAXTHREADS];
+	// True for each part which had no elements.
+	bool partempty[BF_MAXTHREADS];
+};
+
+
+/* Calculate the statistics for one part of the sequence. If the calculation
+	is not divided between threads, then there is just one part covering the
+	whole sequence.
+	ctx = The calculation data (struct bstats_threadctx).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void bstats_part(void *ctx, int part, int nparts) {
+
+	struct bstats_threadctx *threadctx = (struct bstats_threadctx *) ctx;
+
+	// The range of this part of the sequence.
+	Py_ssize_t start, partlen;
+
+	// When a step is used, each part must begin on an element which is used.
+	if (threadctx->step > 1) {
+		partrangestep(threadctx->arraylen, threadctx->step, part, nparts, &start, &partlen);
+	} else {
+		partrange(threadctx->arraylen, part, nparts, &start, &partlen);
+	}
+
+	// An empty part is left out when the results are combined.
+	threadctx->partempty[part] = (partlen < 1);
+	if (partlen < 1) {
+		return;
+	}
+
+	stridestats_select(partlen, threadctx->step, threadctx->nosimd, &threadctx->data[start], &threadctx->partstats[part]);
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_bstats(PyObject *self, BF_ARGSDECL) {
+
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	struct paramsdata paramobjdata1;
+	bool hasbuffer1 = false, paramoverflow = false;
+
+	// Number of elements to work on. If zero or less, ignore this parameter.
+	Py_ssize_t bytesmaxlen = 0;
+
+	// The part of the sequence to work on.
+	Py_ssize_t arraylen, startpos = 0, step = 1;
+
+	// If True, SIMD processing is disabled.
+	int nosimd = 0;
+
+	// The number of threads to use. If zero, use the default.
+	int threads = 0;
+
+	// If true, the count and mean are included in the result.
+	int extended = 0;
+
+	// The number of parts to divide the calculation into.
+	int nparts, part;
+
+	struct bstats_threadctx threadctx;
+	// These start with values which any element will replace.
+	struct stridestats stats = {UCHAR_MAX, 0, 0};
+
+	// The number of elements used.
+	Py_ssize_t count;
+
+	PyObject *result = NULL;
+
+	// -----------------------------------------------------
+
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist, 1, 3, argobjs)
+			|| getssizearg(argobjs[1], &bytesmaxlen)
+			|| getintarg(argobjs[2], &nosimd)
+			|| getintarg(argobjs[3], &threads)
+			|| getintarg(argobjs[7], &extended)) {
+		ErrMsgParameterError();
+		return NULL;
+	}
+
+
+	// The data must be a bytes or bytearray.
+	if (get_paramdata(argobjs[0], &paramobjdata1, &hasbuffer1, &paramoverflow)
+			|| ((paramobjdata1.paramtype != paramobj_readonly) && (paramobjdata1.paramtype != paramobj_writable))) {
+		ErrMsgParameterError();
+		goto done;
+	}
+
+	// Get the number of threads to use.
+	threads = getthreadcount(threads);
+	if (threads < 0) {
+		goto done;
+	}
+
+	// Select the part of the sequence to work on.
+	arraylen = paramobjdata1.pybuffer.len;
+	if (getseqwindow(argobjs[4], argobjs[5], &arraylen, &startpos)
+			|| getseqstep(argobjs[6], &step)) {
+		ErrMsgParameterError();
+		goto done;
+	}
+	offsetseqdata(&paramobjdata1, startpos);
+	arraylen = adjustbytesmaxlen(arraylen, bytesmaxlen);
+
+
+	// The minimum and maximum of an empty sequence are not defined.
+	if (arraylen < 1) {
+		ErrMsgArrayLengthErr();
+		goto done;
+	}
+
+
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(threads, arraylen);
+
+	threadctx.arraylen = arraylen;
+	threadctx.step = step;
+	threadctx.nosimd = nosimd;
+	threadctx.data = paramobjdata1.byteseq.B;
+
+
+	// Call the implementing function.
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(arraylen)
+	nparts = runparallel(bstats_part, &threadctx, nparts);
+	BF_END_ALLOW_THREADS
+
+
+	// Combine the results from each part.
+	for (part = 0; part < nparts; part++) {
+		if (threadctx.partempty[part]) {
+			continue;
+		}
+		if (threadctx.partstats[part].minval < stats.minval) {
+			stats.minval = threadctx.partstats[part].minval;
+		}
+		if (threadctx.partstats[part].maxval > stats.maxval) {
+			stats.maxval = threadctx.partstats[part].maxval;
+		}
+		stats.sum += threadctx.partstats[part].sum;
+	}
+
+
+	if (extended) {
+		count = ((arraylen - 1) / step) + 1;
+		result = Py_BuildValue("(kkKnd)", (unsigned long) stats.minval, (unsigned long) stats.maxval, 
+						stats.sum, count, (double) stats.sum / (double) count);
+	} else {
+		result = Py_BuildValue("(kkK)", (unsigned long) stats.minval, (unsigned long) stats.maxval, stats.sum);
+	}
+
+
+	done:
+	// An integer which is out of range sets hasbuffer1 without a buffer.
+	if (hasbuffer1 && ((paramobjdata1.paramtype == paramobj_readonly) || (paramobjdata1.paramtype == paramobj_writable))) {
+		PyBuffer_Release(&paramobjdata1.pybuffer);
+	}
+
+	return result;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(bstats__doc__,
+"bstats \n\
+_____________________________ \n\
+\n\
+Calculate the minimum, maximum, and sum of a bytes or bytearray object \n\
+in one pass over the data. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          (min(sequence), max(sequence), sum(sequence)) \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  result = bstats(sequence) \n\
+  result = bstats(sequence, maxlen=y) \n\
+  result = bstats(sequence, start=i, stop=j) \n\
+  result = bstats(sequence, step=k) \n\
+  result = bstats(sequence, nosimd=False) \n\
+  result = bstats(sequence, threads=4) \n\
+  result = bstats(sequence, extended=True) \n\
+\n\
+* sequence - An input bytes or bytearray to be examined. \n\
+* maxlen - Limit the length of the sequence used. This must be a valid \n\
+  positive integer. If a zero or negative length, or a value which is \n\
+  greater than the actual length of the sequence is specified, this \n\
+  parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. These are optional keyword \n\
+  parameters and are applied before maxlen. No data is copied. \n\
+* step - Use only every step'th element, as if the sequence had been \n\
+  sliced with sequence[start:stop:step]. This must be a positive \n\
+  integer. This is an optional keyword parameter. \n\
+* nosimd - If True, SIMD acceleration is disabled if present. \n\
+  The default is False (SIMD acceleration is enabled if present). \n\
+* threads - The number of threads to divide the calculation between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
+* extended - If True, the number of elements used and their mean are \n\
+  added to the result. The default is False. \n\
+* result - A tuple of (minimum, maximum, sum), or of (minimum, maximum, \n\
+  sum, count, mean) if extended is True. \n\
+");
+
+
+/*--------------------------------------------------------------------------- */
+
+/* A list of all the methods defined by this module. 
+ "bstats" is the name seen inside of Python. 
+ "py_bstats" is the name of the C function handling the Python call. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
+ The {NULL, NULL} entry indicates the end of the method definitions. */
+static PyMethodDef bstats_methods[] = {
+	{"bstats",  (PyCFunction)py_bstats, BF_METHFLAGS, bstats__doc__}, 
+	{NULL, NULL, 0, NULL}
+};
+
+
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int bstats_addfunc(PyObject *module)
+{
+	bytesstride_initsimd();
+
+	return PyModule_AddFunctions(module, bstats_methods);
+};
+
+#else
+
+static struct PyModuleDef bstatsmodule = {
+    PyModuleDef_HEAD_INIT,
+    "bstats",
+    NULL,
+    -1,
+    bstats_methods
+};
+
+PyMODINIT_FUNC PyInit_bstats(void)
+{
+	bytesstride_initsimd();
+
+    return PyModule_Create(&bstatsmodule);
+};
+
+#endif
+
+/*--------------------------------------------------------------------------- */
@@ -36,6 +36,9 @@
 #include "byteserrs.h"
 #include "bytesparams_base.h"
 #include "bytesparams_bsum.h"
+#include "bytesparams_many.h"
+#include "bytesthreads.h"
+#include "bytesstride.h"
 
 #include "simddefs.h"
 
@@ -93,6 +96,15 @@
 // enough that overflow cannot occur within the "chunk".
 #define LOOPCHUNKSIZE 256
 
+// The chunk size used with SIMD. The x86 SIMD functions accumulate into 64 
+// bit sums, so they need larger chunks only to limit how often the overflow
+// checks are done. The ARM SIMD functions accumulate into 16 bit sums.
+#if defined(AF_HASSIMD_X86)
+#define SIMDCHUNKSIZE 1048576
+#else
+#define SIMDCHUNKSIZE LOOPCHUNKSIZE
+#endif
+
 
 // Integer overflow checks.
 
@@ -103,6 +115,182 @@
 /*--------------------------------------------------------------------------- */
 
 
+/*--------------------------------------------------------------------------- */
+
+/* For array code: B
+   arraylen = The length of the data array.
+   data = The input data array.
+   Returns: The sum of the array.
+*/
+// psadbw against zero adds each group of 8 bytes into a 64 bit sum, so
+// the accumulator cannot overflow within a chunk of any practical size.
+#if defined(AF_HASSIMD_X86)
+unsigned long long innerloop_bsum_unsigned_char_x86_simd(Py_ssize_t arraylen, unsigned char *data) { 
+
+	// array index counter. 
+	Py_ssize_t x, alignedlength; 
+	unsigned int y;
+	unsigned long long partialsum = 0;
+
+	unsigned long long sumvals[CHARSIMDSIZE / 8];
+	v16qi dataslice, zeroslice, resultslice;
+
+
+	// Initialise the accumulator.
+	zeroslice = (v16qi) _mm_setzero_si128();
+	resultslice = zeroslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += CHARSIMDSIZE) {
+
+		// Load the data into the vector register.
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x]);
+
+		// The actual SIMD operation. 
+		resultslice = (v16qi) _mm_add_epi64((__m128i) resultslice, _mm_sad_epu8((__m128i) dataslice, (__m128i) zeroslice));
+
+	}
+
+	// Add up the values within the slice.
+	_mm_storeu_si128((__m128i *) sumvals, (__m128i) resultslice);
+	for (y = 0; y < (CHARSIMDSIZE / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	// Add the values within the left over elements at the end of the array.
+	for (x = alignedlength; x < arraylen; x++) {
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	return partialsum;
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+
+/* For array code: B
+   arraylen = The length of the data array.
+   data = The input data array.
+   Returns: The sum of the array.
+*/
+// psadbw against zero adds each group of 8 bytes into a 64 bit sum, so
+// the accumulator cannot overflow within a chunk of any practical size.
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 unsigned long long innerloop_bsum_unsigned_char_avx2_simd(Py_ssize_t arraylen, unsigned char *data) { 
+
+	// array index counter. 
+	Py_ssize_t x, alignedlength; 
+	unsigned int y;
+	unsigned long long partialsum = 0;
+
+	unsigned long long sumvals[CHARSIMDSIZE_AVX2 / 8];
+	v32qi dataslice, zeroslice, resultslice;
+
+
+	// Initialise the accumulator.
+	zeroslice = (v32qi) _mm256_setzero_si256();
+	resultslice = zeroslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += CHARSIMDSIZE_AVX2) {
+
+		// Load the data into the vector register.
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x]);
+
+		// The actual SIMD operation. 
+		resultslice = (v32qi) _mm256_add_epi64((__m256i) resultslice, _mm256_sad_epu8((__m256i) dataslice, (__m256i) zeroslice));
+
+	}
+
+	// Add up the values within the slice.
+	_mm256_storeu_si256((__m256i *) sumvals, (__m256i) resultslice);
+	for (y = 0; y < (CHARSIMDSIZE_AVX2 / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	// Add the values within the left over elements at the end of the array.
+	for (x = alignedlength; x < arraylen; x++) {
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	return partialsum;
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+
+/* For array code: B
+   arraylen = The length of the data array.
+   data = The input data array.
+   Returns: The sum of the array.
+*/
+// psadbw against zero adds each group of 8 bytes into a 64 bit sum, so
+// the accumulator cannot overflow within a chunk of any practical size.
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW unsigned long long innerloop_bsum_unsigned_char_avx512_simd(Py_ssize_t arraylen, unsigned char *data) { 
+
+	// array index counter. 
+	Py_ssize_t x, alignedlength; 
+	unsigned int y;
+	unsigned long long partialsum = 0;
+	unsigned long long tailmask;
+
+	unsigned long long sumvals[CHARSIMDSIZE_AVX512 / 8];
+	v64qi dataslice, zeroslice, resultslice;
+
+
+	// Initialise the accumulator.
+	zeroslice = (v64qi) _mm512_setzero_si512();
+	resultslice = zeroslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += CHARSIMDSIZE_AVX512) {
+
+		// Load the data into the vector register.
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x]);
+
+		// The actual SIMD operation. 
+		resultslice = (v64qi) _mm512_add_epi64((__m512i) resultslice, _mm512_sad_epu8((__m512i) dataslice, (__m512i) zeroslice));
+
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load. The elements which are masked off are set to zero, so
+	// they do not affect the sum.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultslice = (v64qi) _mm512_add_epi64((__m512i) resultslice, _mm512_sad_epu8((__m512i) dataslice, (__m512i) zeroslice));
+	}
+
+	// Add up the values within the slice.
+	_mm512_storeu_si512(sumvals, (__m512i) resultslice);
+	for (y = 0; y < (CHARSIMDSIZE_AVX512 / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	return partialsum;
+
+}
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 
 /* For array code: B
@@ -217,34 +405,63 @@ unsigned long long innerloop_bsum_unsigned_char_armv8_simd(Py_ssize_t arraylen,
 
 
 /*--------------------------------------------------------------------------- */
+/* The SIMD inner loop to use. This is selected once when the module is 
+   initialised, according to the SIMD features supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static unsigned long long (*bsum_simdfunc)(Py_ssize_t arraylen, unsigned char *data);
+
+
+/* Select the SIMD function for this CPU. This is also used by the
+	accumulators module, which links in the same kernels.
+*/
+void bsum_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		bsum_simdfunc = innerloop_bsum_unsigned_char_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		bsum_simdfunc = innerloop_bsum_unsigned_char_avx2_simd;
+	} else {
+		bsum_simdfunc = innerloop_bsum_unsigned_char_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	bsum_simdfunc = innerloop_bsum_unsigned_char_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	bsum_simdfunc = innerloop_bsum_unsigned_char_armv8_simd;
+	#endif
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
 /* For array code: B
    arraylen = The length of the data array.
    data = The input data array.
    Returns: The sum of the array.
 */
 // Version without error checking.
-#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 unsigned long long bsum_unsigned_char_simd(Py_ssize_t arraylen, unsigned char *data) { 
 
 	Py_ssize_t x, loopremaining, loopchunk;
 	unsigned long long partialsum = 0;
 
-	for(x=0; x < arraylen; x += LOOPCHUNKSIZE) {
+	for(x=0; x < arraylen; x += SIMDCHUNKSIZE) {
 		// The array is summed in "chunks" using SIMD and then each
 		// chunk added to the total.
 		loopremaining = arraylen - x;
-		loopchunk = (loopremaining >  LOOPCHUNKSIZE) ? LOOPCHUNKSIZE : loopremaining;
+		loopchunk = (loopremaining >  SIMDCHUNKSIZE) ? SIMDCHUNKSIZE : loopremaining;
 
 		// Add the chunk to the grand total.
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-		partialsum = partialsum + innerloop_bsum_unsigned_char_armv7_simd(loopchunk, &data[x]);
-#endif
-
-#if defined(AF_HASSIMD_ARM_AARCH64)
-		partialsum = partialsum + innerloop_bsum_unsigned_char_armv8_simd(loopchunk, &data[x]);
-#endif
-
-
+		partialsum = partialsum + bsum_simdfunc(loopchunk, &data[x]);
 	}
 
 	return partialsum;
@@ -260,27 +477,21 @@ unsigned long long bsum_unsigned_char_simd(Py_ssize_t arraylen, unsigned char *d
    errflag = Set to true if an error occured.
    Returns: The sum of the array.
 */
-#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 unsigned long long bsum_unsigned_char_simd_ovfl(Py_ssize_t arraylen, unsigned char *data, signed int *errflag) { 
 
 	unsigned long long partialsum = 0;
 	unsigned long long chunksum;
 	Py_ssize_t x, loopremaining, loopchunk;
 
-	for(x=0; x < arraylen; x += LOOPCHUNKSIZE) {
+	for(x=0; x < arraylen; x += SIMDCHUNKSIZE) {
 		// The array is summed in "chunks" using SIMD and then each
 		// chunk added to the total.
 		loopremaining = arraylen - x;
-		loopchunk = (loopremaining >  LOOPCHUNKSIZE) ? LOOPCHUNKSIZE : loopremaining;
+		loopchunk = (loopremaining >  SIMDCHUNKSIZE) ? SIMDCHUNKSIZE : loopremaining;
 
 		// Add up one "chunk" of the array.
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-		chunksum = innerloop_bsum_unsigned_char_armv7_simd(loopchunk, &data[x]);
-#endif
-
-#if defined(AF_HASSIMD_ARM_AARCH64)
-		chunksum = innerloop_bsum_unsigned_char_armv8_simd(loopchunk, &data[x]);
-#endif
+		chunksum = bsum_simdfunc(loopchunk, &data[x]);
 
 		// Check for overflow.
 		if (loop_willoverflow_unsigned(chunksum, partialsum)) {
@@ -317,7 +528,7 @@ unsigned long long bsum_unsigned_char(Py_ssize_t arraylen, unsigned char *data,
 
 	*errflag = 0;
 
-	#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
 		// Overflow checking disabled.
 		if (ignoreerrors || skipovflcheck(arraylen)) {
@@ -344,7 +555,7 @@ unsigned long long bsum_unsigned_char(Py_ssize_t arraylen, unsigned char *data,
 				partialsum = partialsum + (unsigned long long) data[x];
 			}
 		}
-	#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	}
 	#endif
 
@@ -354,13 +565,104 @@ unsigned long long bsum_unsigned_char(Py_ssize_t arraylen, unsigned char *data,
 
 /*--------------------------------------------------------------------------- */
 
+// The accumulators module links in this file for the functions above only.
+// It defines BF_KERNELSONLY to leave out the rest, which includes the Python
+// functions and the module initialisation.
+#if !defined(BF_KERNELSONLY)
+
+/*--------------------------------------------------------------------------- */
+/* For array code: B, using only every step'th element.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   errflag = Set to true if an overflow error occured in integer operations.
+   ignoreerrors = If true, arithmetic overflow checking is disabled.
+   Returns: The sum of the elements used.
+*/
+unsigned long long bsum_unsigned_char_step(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data, signed int *errflag, signed int ignoreerrors, signed int nosimd) { 
+
+	// array index counter. 
+	Py_ssize_t x; 
+	unsigned long long partialsum = 0;
+
+	*errflag = 0;
+
+	// Overflow checking disabled.
+	if (ignoreerrors || skipovflcheck(arraylen)) {
+		return stridesum_select(arraylen, step, nosimd, data);
+	}
+
+	// Overflow checking enabled.
+	for (x = 0; x < arraylen; x += step) {
+		if (data[x] > (ULLONG_MAX - partialsum)) { 
+			*errflag = ARR_ERR_OVFL;
+			return partialsum; 
+		}
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	return partialsum;
+}
+/*--------------------------------------------------------------------------- */
+
+/*--------------------------------------------------------------------------- */
+
+// The data for a calculation which may be divided between threads.
+struct bsum_threadctx {
+	struct args_params_bsum *bytesdata;
+	// The sum of each part.
+	unsigned long long partsums[BF_MAXTHREADS];
+	// The error flag for each part.
+	signed int parterrors[BF_MAXTHREADS];
+};
+
+
+/* Calculate the sum of one part of the sequence. If the calculation is not
+	divided between threads, then there is just one part covering the whole
+	sequence.
+	ctx = The calculation data (struct bsum_threadctx).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void bsum_part(void *ctx, int part, int nparts) {
+
+	struct bsum_threadctx *threadctx = (struct bsum_threadctx *) ctx;
+	struct args_params_bsum *bytesdata = threadctx->bytesdata;
+
+	// The range of this part of the sequence.
+	Py_ssize_t start, partlen;
+
+	// When a step is used, each part must begin on an element which is used.
+	if (bytesdata->step > 1) {
+		partrangestep(bytesdata->arraylen, bytesdata->step, part, nparts, &start, &partlen);
+		threadctx->partsums[part] = bsum_unsigned_char_step(partlen, bytesdata->step, bytesdata->bytes1.B + start, 
+				&threadctx->parterrors[part], bytesdata->ignoreerrors, bytesdata->nosimd);
+		return;
+	}
+
+	partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
+
+	threadctx->partsums[part] = bsum_unsigned_char(partlen, bytesdata->bytes1.B + start, 
+				&threadctx->parterrors[part], bytesdata->ignoreerrors, bytesdata->nosimd);
+
+}
+
+/*--------------------------------------------------------------------------- */
+
 /* The wrapper to the underlying C function */
-static PyObject *py_bsum(PyObject *self, PyObject *args, PyObject *keywds) {
+static PyObject *py_bsum(PyObject *self, BF_ARGSDECL) {
 
 
 	// This is used to hold the parsed parameters.
 	struct args_params_bsum bytesdata = ARGSINIT_BSUM;
 
+	// The data for the calculation, including the result of each part.
+	struct bsum_threadctx threadctx;
+
+	// The number of parts to divide the calculation into.
+	int nparts, part;
+
 	// The sum of the array, as a python object.
 	PyObject *sumreturn;
 
@@ -374,7 +676,7 @@ static PyObject *py_bsum(PyObject *self, PyObject *args, PyObject *keywds) {
 
 
 	// Get the parameters passed from Python.
-	bytesdata = getparams_bsum(self, args, keywds, "bsum");
+	bytesdata = getparams_bsum(self, BF_ARGSPASS);
 
 	// If there was an error, we count on the parameter parsing function to 
 	// release the buffers if this was necessary.
@@ -392,8 +694,29 @@ static PyObject *py_bsum(PyObject *self, PyObject *args, PyObject *keywds) {
 	}
 
 
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+	threadctx.bytesdata = &bytesdata;
+
 	// Call the implementing function.
-	resultull = bsum_unsigned_char(bytesdata.arraylen, bytesdata.bytes1.B, &errflag, bytesdata.ignoreerrors, bytesdata.nosimd);
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	nparts = runparallel(bsum_part, &threadctx, nparts);
+	BF_END_ALLOW_THREADS
+
+	// Combine the results from each part. The overflow checks are
+	// the same as when the sequence is summed in one piece.
+	for (part = 0; part < nparts; part++) {
+		if (threadctx.parterrors[part]) {
+			errflag = threadctx.parterrors[part];
+			break;
+		}
+		if (!bytesdata.ignoreerrors && loop_willoverflow_unsigned(threadctx.partsums[part], resultull)) {
+			errflag = ARR_ERR_OVFL;
+			break;
+		}
+		resultull = resultull + threadctx.partsums[part];
+	}
 	sumreturn = PyLong_FromUnsignedLongLong(resultull);
 
 	// Release the buffers. 
@@ -431,35 +754,174 @@ Call formats: \n\
 \n\
   result = bsum(sequence) \n\
   result = bsum(sequence, maxlen=y) \n\
+  result = bsum(sequence, start=i, stop=j) \n\
+  result = bsum(sequence, step=k) \n\
   result = bsum(sequence, matherrors=False) \n\
   result = bsum(sequence, nosimd=False) \n\
+  result = bsum(sequence, threads=4) \n\
 \n\
 * sequence - An input bytes or bytearray to be examined. \n\
 * maxlen - Limit the length of the sequence used. This must be a valid \n\
   positive integer. If a zero or negative length, or a value which is \n\
   greater than the actual length of the sequence is specified, this \n\
   parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. These are optional keyword \n\
+  parameters and are applied before maxlen. No data is copied. \n\
+* step - Use only every step'th element, as if the sequence had been \n\
+  sliced with sequence[start:stop:step]. This must be a positive \n\
+  integer. This is an optional keyword parameter. \n\
 * matherrors - If True, checks for numerical errors including integer \n\
   overflow are ignored. \n\
 * nosimd - If True, SIMD acceleration is disabled if present. The \n\
   default is False (SIMD acceleration is enabled if present). \n\
+* threads - The number of threads to divide the calculation between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
 * result - The sum of the sequence. \n\
 ");
 
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function for a batch of sequences */
+static PyObject *py_bsum_many(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The sum of each sequence.
+	unsigned long long *results;
+
+	// The results as a python list.
+	PyObject *resultlist;
+
+	// Indicates an error.
+	signed int errflag = 0;
+
+	Py_ssize_t x;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_many_bsum(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// Every sequence must contain data.
+	if (hasemptyseq_many(&bytesdata)) {
+		// Release the buffers. 
+		releasebuffers_many(bytesdata);
+		ErrMsgArrayLengthErr();
+		return NULL;
+	}
+
+	results = PyMem_New(unsigned long long, bytesdata.nseqs + 1);
+	if (results == NULL) {
+		releasebuffers_many(bytesdata);
+		return PyErr_NoMemory();
+	}
+
+	// Call the implementing function for each sequence.
+	// The GIL is released if the batch is large.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.totallen)
+	for (x = 0; x < bytesdata.nseqs; x++) {
+		results[x] = bsum_unsigned_char(bytesdata.pybuffers[x].len, bytesdata.pybuffers[x].buf, 
+				&errflag, bytesdata.ignoreerrors, bytesdata.nosimd);
+		if (errflag) {
+			break;
+		}
+	}
+	BF_END_ALLOW_THREADS
+
+	// Release the buffers. 
+	releasebuffers_many(bytesdata);
+
+
+	// Signal the errors.
+	if (errflag == ARR_ERR_OVFL) {
+		PyMem_Free(results);
+		ErrMsgArithOverflowCalc();
+		return NULL;
+	}
+
+	resultlist = ulonglonglist_many(results, bytesdata.nseqs);
+	PyMem_Free(results);
+
+	return resultlist;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(bsum_many__doc__,
+"bsum_many \n\
+_____________________________ \n\
+\n\
+Calculate the arithmetic sum of each sequence in a batch.  \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          [sum(x) for x in sequences] \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  result = bsum_many(sequences) \n\
+  result = bsum_many(sequences, matherrors=False) \n\
+  result = bsum_many(sequences, nosimd=False) \n\
+\n\
+* sequences - A list or other iterable of bytes or bytearray sequences. \n\
+  None of them may be empty. \n\
+* matherrors - If True, checks for numerical errors including integer \n\
+  overflow are ignored. \n\
+* nosimd - If True, SIMD acceleration is disabled if present. The \n\
+  default is False (SIMD acceleration is enabled if present). \n\
+* result - A list with the sum of each sequence. \n\
+");
+
 
 /*--------------------------------------------------------------------------- */
 
 /* A list of all the methods defined by this module. 
  "bsum" is the name seen inside of Python. 
  "py_bsum" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef bsum_methods[] = {
-	{"bsum",  (PyCFunction)py_bsum, METH_VARARGS | METH_KEYWORDS, bsum__doc__}, 
+	{"bsum",  (PyCFunction)py_bsum, BF_METHFLAGS, bsum__doc__}, 
+	{"bsum_many",  (PyCFunction)py_bsum_many, BF_METHFLAGS, bsum_many__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int bsum_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	bsum_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
+	return PyModule_AddFunctions(module, bsum_methods);
+};
+
+#else
+
 static struct PyModuleDef bsummodule = {
     PyModuleDef_HEAD_INIT,
     "bsum",
@@ -470,8 +932,19 @@ static struct PyModuleDef bsummodule = {
 
 PyMODINIT_FUNC PyInit_bsum(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	bsum_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
     return PyModule_Create(&bsummodule);
 };
 
+#endif
+
+// End of the code which is left out of the accumulators module.
+#endif
+
 /*--------------------------------------------------------------------------- */
 
@@ -58,4 +58,8 @@ void ErrMsgArrayLengthMismatch(void) {
 	PyErr_SetString(PyExc_TypeError, "sequence length mismatch.");
 }
 
+void ErrMsgThreadsValue(void) {
+	PyErr_SetString(PyExc_ValueError, "invalid number of threads.");
+}
+
 /*--------------------------------------------------------------------------- */
@@ -44,3 +44,4 @@ void ErrMsgOperatorNotValidforthisFunction(void);
 void ErrMsgArithOverflowParam(void);
 void ErrMsgOutputNotMutableParam(void);
 void ErrMsgArrayLengthMismatch(void);
+void ErrMsgThreadsValue(void);
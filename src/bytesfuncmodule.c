@@ -0,0 +1,130 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   bytesfuncmodule.c
+// Purpose:  Combine all the functions into a single extension module.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+/* This is used only when all the functions are built as a single extension
+	module called "_bytesfunc" (BF_SINGLEMODULE is defined). Each function
+	provides a function which adds it to this module in place of its own
+	module initialisation. This means only one shared library needs to be
+	loaded, and the common code is linked only once.
+*/
+
+/*--------------------------------------------------------------------------- */
+
+#include "Python.h"
+
+/*--------------------------------------------------------------------------- */
+
+// The functions which add each function to the module.
+int and__addfunc(PyObject *module);
+int or__addfunc(PyObject *module);
+int xor_addfunc(PyObject *module);
+int lshift_addfunc(PyObject *module);
+int rshift_addfunc(PyObject *module);
+int invert_addfunc(PyObject *module);
+int where_addfunc(PyObject *module);
+
+int eq_addfunc(PyObject *module);
+int ge_addfunc(PyObject *module);
+int gt_addfunc(PyObject *module);
+int le_addfunc(PyObject *module);
+int lt_addfunc(PyObject *module);
+int ne_addfunc(PyObject *module);
+int cmpmask_addfunc(PyObject *module);
+
+int ball_addfunc(PyObject *module);
+int bany_addfunc(PyObject *module);
+int findindex_addfunc(PyObject *module);
+
+int bmax_addfunc(PyObject *module);
+int bmin_addfunc(PyObject *module);
+int bsum_addfunc(PyObject *module);
+
+int accumulators_addfunc(PyObject *module);
+
+int histogram_addfunc(PyObject *module);
+int bstats_addfunc(PyObject *module);
+
+int threadpool_addfunc(PyObject *module);
+
+
+typedef int (*addfuncptr)(PyObject *module);
+
+static addfuncptr addfuncs[] = {
+	and__addfunc, or__addfunc, xor_addfunc, lshift_addfunc, rshift_addfunc, invert_addfunc, where_addfunc,
+	eq_addfunc, ge_addfunc, gt_addfunc, le_addfunc, lt_addfunc, ne_addfunc, cmpmask_addfunc,
+	ball_addfunc, bany_addfunc, findindex_addfunc,
+	bmax_addfunc, bmin_addfunc, bsum_addfunc,
+	accumulators_addfunc,
+	histogram_addfunc, bstats_addfunc,
+	threadpool_addfunc,
+	NULL
+};
+
+/*--------------------------------------------------------------------------- */
+
+PyDoc_STRVAR(module_doc,
+"This contains all the bytesfunc functions in a single module. The \n\
+functions should be used through the bytesfunc package rather than \n\
+directly from here.\n\
+");
+
+
+static struct PyModuleDef bytesfuncmodule = {
+	PyModuleDef_HEAD_INIT,
+	"_bytesfunc",
+	module_doc,
+	-1,
+	NULL,
+	NULL,
+	NULL,
+	NULL,
+	NULL
+};
+
+/*--------------------------------------------------------------------------- */
+
+
+PyMODINIT_FUNC PyInit__bytesfunc(void) {
+	PyObject *m;
+	int i;
+
+	m = PyModule_Create(&bytesfuncmodule);
+	if (m == NULL) { goto iserror; }
+
+	for (i = 0; addfuncs[i] != NULL; i++) {
+		if (addfuncs[i](m) < 0) { goto iserror; }
+	}
+
+	// This is the normal exit point.
+	return m;
+
+	// An error occurred.
+	iserror:
+	Py_XDECREF(m);
+	return NULL;
+
+}
+
+/*--------------------------------------------------------------------------- */
@@ -33,12 +33,17 @@
 #include "bytesparams_base.h"
 #include "arrayops.h"
 #include "bytesparams_allany.h"
+#include "bytesthreads.h"
 
 /*--------------------------------------------------------------------------- */
 
 // The list of keyword arguments. All argument must be listed, whether we 
 // intend to use them for keywords or not. 
-static char *kwlist_allany[] = {"op", "data", "param", "maxlen", "nosimd", NULL};
+static char *kwlist_allany[] = {"op", "data", "param", "maxlen", "nosimd", "threads", "start", "stop", "step", NULL};
+
+// The same without "threads", for functions which cannot divide the work 
+// between threads.
+static char *kwlist_nothreads[] = {"op", "data", "param", "maxlen", "nosimd", "start", "stop", "step", NULL};
 
 /*--------------------------------------------------------------------------- */
 
@@ -57,23 +62,15 @@ void releasebuffers_allany(struct args_params_allany bytesdata) {
 
 /*--------------------------------------------------------------------------- */
 
-/* Get the parameters passed from Python with a function which takes one input 
- * 		array and one input value, or two input arrays, plus an optional
- * 		output array.
- * self, args, keywds = The parameters of the same name passed from the PyObject
- * 		function which forms the original entry point.
- * funcname = A string which represents the C extension name. This is passed to
- * 		PyArg_ParseTupleAndKeywords for error reporting.
+/* Parse the parameters for a function which takes an operator, one input 
+ * 		array and one input value.
+ * argobjs = The parameters in the order given by kwlist_allany. Parameters
+ * 		which were not given are NULL.
  * Returns: A structure which contains the parameter data.
 */
-struct args_params_allany getparams_allany(PyObject *self, PyObject *args, PyObject *keywds, char *funcname) {
+static struct args_params_allany parseparams_allany(PyObject **argobjs) {
 
 
-	// This is used for constructing parameter format strings. The size must
-	// be able to hold the largest string, which will be determined by the 
-	// names of the functions which use this.
-	char formatstr[FMTSTRLEN];
-	
 
 	// This is used to return the parsed parameters.
 	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
@@ -90,8 +87,16 @@ struct args_params_allany getparams_allany(PyObject *self, PyObject *args, PyObj
 
 	// Number of elements to work on. If zero or less, ignore this parameter.
 	Py_ssize_t bytesmaxlen = 0;
+
+	// The start of the part of the sequence to work on.
+	Py_ssize_t startpos = 0;
+
+	// Only every step'th element is used.
+	Py_ssize_t step = 1;
 	// If True, SIMD processing is disabled.
 	int nosimd = 0;
+	// The number of threads to use. If zero, use the default.
+	int threads = 0;
 	// The integer parameter value. We check later to see if it is in range.
 	int paramval = 0;
 
@@ -107,18 +112,20 @@ struct args_params_allany getparams_allany(PyObject *self, PyObject *args, PyObj
 	// This section determines the type of the arrays. We do this by parsing
 	// the parameters as objects. We then examine the parameters 
 
-	// Construct the format string. This is constructed dynamically because
-	// we must be able to call this same function from different C extensions.
-	makefmtstr("UOi|ni:", funcname, formatstr);
-
-	// Import the raw objects. 
-	if (!PyArg_ParseTupleAndKeywords(args, keywds, formatstr, kwlist_allany, &opstr, 
-					&dataobj1, &paramval, &bytesmaxlen, &nosimd)) {
+	// Check the types of the arguments.
+	if (!PyUnicode_Check(argobjs[0])
+			|| getintarg(argobjs[2], &paramval)
+			|| getssizearg(argobjs[3], &bytesmaxlen)
+			|| getintarg(argobjs[4], &nosimd)
+			|| getintarg(argobjs[5], &threads)) {
 		ErrMsgParameterError();
 		bytesdata.errorcode = 1;
 		return bytesdata;
 	}
 
+	opstr = argobjs[0];
+	dataobj1 = argobjs[1];
+
 	// Convert the command string to an integer.
 	opcode = opstrdecode(opstr);
 
@@ -143,10 +150,12 @@ struct args_params_allany getparams_allany(PyObject *self, PyObject *args, PyObj
 		releasebuffers_allany(bytesdata);
 		return bytesdata;
 	}
+	// Keep the buffer so that it can be released if a later step fails.
+	bytesdata.pybuffer1 = paramobjdata1.pybuffer;
 
 
 	// The second parameter must be a bytes or bytearray object.
-	if ((paramobjdata1.paramtype != paramobj_bytes) && (paramobjdata1.paramtype != paramobj_bytearray)) {
+	if ((paramobjdata1.paramtype != paramobj_readonly) && (paramobjdata1.paramtype != paramobj_writable)) {
 		ErrMsgParameterError();
 		bytesdata.errorcode = 4;
 		releasebuffers_allany(bytesdata);
@@ -167,19 +176,113 @@ struct args_params_allany getparams_allany(PyObject *self, PyObject *args, PyObj
 	}
 
 
+	// Get the number of threads to use.
+	threads = getthreadcount(threads);
+	if (threads < 0) {
+		bytesdata.errorcode = 6;
+		releasebuffers_allany(bytesdata);
+		return bytesdata;
+	}
+
+
+	// Select the part of the sequence to work on.
+	if (getseqwindow(argobjs[6], argobjs[7], &arraylen, &startpos)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 7;
+		releasebuffers_allany(bytesdata);
+		return bytesdata;
+	}
+	offsetseqdata(&paramobjdata1, startpos);
+
+	// Get the step between the elements which are used.
+	if (getseqstep(argobjs[8], &step)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 8;
+		releasebuffers_allany(bytesdata);
+		return bytesdata;
+	}
+
+
 	bytesdata.errorcode = 0;
 	bytesdata.opcode = opcode;
 	bytesdata.arraylen = adjustbytesmaxlen(arraylen, bytesmaxlen);
+	bytesdata.step = step;
 	bytesdata.nosimd = nosimd;
 	bytesdata.bytes1.buf = paramobjdata1.byteseq.buf;
 	bytesdata.pybuffer1 = paramobjdata1.pybuffer;
 	bytesdata.param = (unsigned char) paramval;
+	bytesdata.threads = threads;
+	bytesdata.startpos = startpos;
 
 
 	return bytesdata;
 
 }
 
+/*--------------------------------------------------------------------------- */
+
+/* Get the parameters passed from Python with a function which takes an
+ * 		operator, one input array and one input value.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
+ * Returns: A structure which contains the parameter data.
+*/
+struct args_params_allany getparams_allany(PyObject *self, BF_ARGSDECL) {
+
+	// This is used to return an error.
+	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_allany, 3, 5, argobjs)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
+
+	return parseparams_allany(argobjs);
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The same as getparams_allany, but for functions which do not accept the
+ * 		"threads" parameter. The default number of threads is returned.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
+ * Returns: A structure which contains the parameter data.
+*/
+struct args_params_allany getparams_allany_nothreads(PyObject *self, BF_ARGSDECL) {
+
+	// This is used to return an error.
+	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	// The parameters in the order used by getparams_allany.
+	PyObject *allanyobjs[BF_MAXPARAMS];
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_nothreads, 3, 5, argobjs)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
+
+	// op, data, param, maxlen, nosimd.
+	memcpy(allanyobjs, argobjs, 5 * sizeof(PyObject *));
+	// There is no threads parameter.
+	allanyobjs[5] = NULL;
+	// start, stop, step.
+	memcpy(&allanyobjs[6], &argobjs[5], 3 * sizeof(PyObject *));
+
+	return parseparams_allany(allanyobjs);
+
+}
+
 
 /*--------------------------------------------------------------------------- */
 
@@ -29,7 +29,7 @@
 
 /*--------------------------------------------------------------------------- */
 
-#define ARGSINIT_ALLANY {0, 0, 0, 0, 0, {NULL}, {NULL}, 0}
+#define ARGSINIT_ALLANY {0, 0, 0, 0, 0, {NULL}, {NULL}, 0, 0, 0, 1}
 
 
 
@@ -43,11 +43,16 @@ struct args_params_allany {
 	union dataseq bytes1;
 	Py_buffer pybuffer1;
 	unsigned char param;
+	int threads;
+	Py_ssize_t startpos;
+	Py_ssize_t step;
 };
 
 /*--------------------------------------------------------------------------- */
 
-struct args_params_allany getparams_allany(PyObject *self, PyObject *args, PyObject *keywds, char *funcname);
+struct args_params_allany getparams_allany(PyObject *self, BF_ARGSDECL);
+
+struct args_params_allany getparams_allany_nothreads(PyObject *self, BF_ARGSDECL);
 
 void releasebuffers_allany(struct args_params_allany bytesdata);
 
@@ -54,50 +54,340 @@ Py_ssize_t adjustbytesmaxlen(Py_ssize_t arraylen, Py_ssize_t bytesmaxlen) {
 /*--------------------------------------------------------------------------- */
 
 
-/* Create the format string from two substrings, one the base format and one
- * with the name of the C extension.
- * basestr = The first part of the desired format string.
- * funcname = The name of the function to be added to the end.
- * formatstr = The output string.
- * Assert: The lengths of basestr and funcname are less than the size of formatstr.
+/* Find the parameter which a keyword argument is for.
+   keyname = The keyword.
+   kwlist = The names of the parameters, terminated by NULL.
+   Returns the index of the parameter, or -1 if there is no such parameter.
 */
-void makefmtstr(char *basestr, char *funcname, char *formatstr) {
+static int findkeyword(PyObject *keyname, char **kwlist) {
 
-	// Make sure there won't be a string overflow. While the sizes are fixed,
-	// we could have a programming error.
-	assert((strlen(basestr) + strlen(funcname)) < FMTSTRLEN);
+	int i;
 
-	strcat(strcpy(formatstr, basestr), funcname);
+	if (!PyUnicode_Check(keyname)) {
+		return -1;
+	}
+
+	for (i = 0; kwlist[i] != NULL; i++) {
+		if (PyUnicode_CompareWithASCIIString(keyname, kwlist[i]) == 0) {
+			return i;
+		}
+	}
+
+	return -1;
+}
+
+
+/* Place a keyword argument in the array of parameters.
+   keyname = The keyword.
+   value = The argument value.
+   kwlist = The names of the parameters, terminated by NULL.
+   argobjs = The array of parameters.
+   Returns 0 if OK, or -1 if the keyword is not valid or the parameter 
+   was already given.
+*/
+static int setkeywordarg(PyObject *keyname, PyObject *value, char **kwlist, PyObject **argobjs) {
+
+	int paramindex;
+
+	paramindex = findkeyword(keyname, kwlist);
+
+	if ((paramindex < 0) || (argobjs[paramindex] != NULL)) {
+		return -1;
+	}
+
+	argobjs[paramindex] = value;
+
+	return 0;
+}
+
+
+/* Sort the arguments to a function into parameter order. This is used in
+   place of PyArg_ParseTupleAndKeywords, which has to parse a format string
+   on every call. That overhead is significant for short sequences. 
+   The arguments are returned as borrowed references, which must be 
+   converted to the required types by the caller.
+   args = The positional arguments, followed by the values of any keyword
+     arguments given in kwnames.
+   nargs = The number of positional arguments.
+   kwnames = A tuple with the keyword names, or NULL if there are none.
+   kwdict = A dictionary of keyword arguments, or NULL if there are none.
+     This is used instead of kwnames with the older calling convention.
+   kwlist = The names of the parameters, terminated by NULL. There must be
+     no more than BF_MAXPARAMS.
+   minargs = The number of parameters which are required.
+   maxpos = The number of parameters which may be passed by position. Any
+     parameters after this are keyword only.
+   argobjs = The array which receives the parameters. This must be at least 
+     as long as kwlist. Parameters which were not given are set to NULL.
+   Returns 0 if OK, or -1 if the arguments did not match the parameters.
+*/
+int getargobjs(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, PyObject *kwdict, 
+			char **kwlist, int minargs, int maxpos, PyObject **argobjs) {
+
+	int i, nparams;
+	Py_ssize_t kwindex, kwcount;
+	PyObject *keyname, *value;
+
+
+	for (nparams = 0; kwlist[nparams] != NULL; nparams++) {
+		argobjs[nparams] = NULL;
+	}
+
+	assert(nparams <= BF_MAXPARAMS);
+
+	// Too many positional arguments.
+	if (nargs > maxpos) {
+		return -1;
+	}
+
+	for (i = 0; i < nargs; i++) {
+		argobjs[i] = args[i];
+	}
+
+	// Keyword arguments passed with the fast call convention.
+	if (kwnames != NULL) {
+		kwcount = PyTuple_GET_SIZE(kwnames);
+		for (kwindex = 0; kwindex < kwcount; kwindex++) {
+			if (setkeywordarg(PyTuple_GET_ITEM(kwnames, kwindex), args[nargs + kwindex], kwlist, argobjs)) {
+				return -1;
+			}
+		}
+	}
+
+	// Keyword arguments passed as a dictionary.
+	if (kwdict != NULL) {
+		kwindex = 0;
+		while (PyDict_Next(kwdict, &kwindex, &keyname, &value)) {
+			if (setkeywordarg(keyname, value, kwlist, argobjs)) {
+				return -1;
+			}
+		}
+	}
+
+	// Check that all the required parameters are present.
+	for (i = 0; i < minargs; i++) {
+		if (argobjs[i] == NULL) {
+			return -1;
+		}
+	}
+
+	return 0;
+}
+
+
+/* Convert an optional parameter to a Py_ssize_t. This accepts the same
+   values as the "n" format code for PyArg_ParseTuple.
+   argobj = The parameter, or NULL if it was not given.
+   result = Receives the value. This is not altered if the parameter was 
+     not given.
+   Returns 0 if OK, or -1 if the parameter was not valid.
+*/
+int getssizearg(PyObject *argobj, Py_ssize_t *result) {
+
+	Py_ssize_t val;
+
+	if (argobj == NULL) {
+		return 0;
+	}
+
+	val = PyNumber_AsSsize_t(argobj, PyExc_OverflowError);
+	if ((val == -1) && PyErr_Occurred()) {
+		return -1;
+	}
+
+	*result = val;
+
+	return 0;
+}
+
+
+/* Convert an optional parameter to an int. This accepts the same values
+   as the "i" format code for PyArg_ParseTuple.
+   argobj = The parameter, or NULL if it was not given.
+   result = Receives the value. This is not altered if the parameter was 
+     not given.
+   Returns 0 if OK, or -1 if the parameter was not valid.
+*/
+int getintarg(PyObject *argobj, int *result) {
+
+	long val;
+
+	if (argobj == NULL) {
+		return 0;
+	}
+
+	// Floats are not silently truncated.
+	if (PyFloat_Check(argobj)) {
+		return -1;
+	}
+
+	val = PyLong_AsLong(argobj);
+	if ((val == -1) && PyErr_Occurred()) {
+		return -1;
+	}
+
+	if ((val > INT_MAX) || (val < INT_MIN)) {
+		return -1;
+	}
+
+	*result = (int) val;
+
+	return 0;
 }
 
 
 /*--------------------------------------------------------------------------- */
 
-/* Determines if the Python object is an bytes object.
- * dataobj = The object to be tested.
- * Returns TRUE if a bytes object, otherwise returns FALSE.
+/* Get the part of a sequence selected by the "start" and "stop" parameters.
+   These have the same meaning as when slicing a sequence. Negative values
+   count from the end of the sequence, and values which are out of range
+   are limited to the sequence length. Either may be None.
+   startobj = The start parameter, or NULL if it was not given.
+   stopobj = The stop parameter, or NULL if it was not given.
+   arraylen = The length of the sequence. This is replaced by the length
+     of the selected part. This may be zero.
+   startpos = Receives the index of the start of the selected part.
+   Returns 0 if OK, or -1 if the parameters were not valid.
 */
-int isbytesobjtype(PyObject *dataobj) {
+int getseqwindow(PyObject *startobj, PyObject *stopobj, Py_ssize_t *arraylen, Py_ssize_t *startpos) {
+
+	Py_ssize_t start = 0;
+	Py_ssize_t stop = PY_SSIZE_T_MAX;
+
+	// Large integers are clamped rather than raising an error.
+	if ((startobj != NULL) && (startobj != Py_None)) {
+		start = PyNumber_AsSsize_t(startobj, NULL);
+		if ((start == -1) && PyErr_Occurred()) {
+			return -1;
+		}
+	}
 
-	if (dataobj == NULL) { return 0; }
+	if ((stopobj != NULL) && (stopobj != Py_None)) {
+		stop = PyNumber_AsSsize_t(stopobj, NULL);
+		if ((stop == -1) && PyErr_Occurred()) {
+			return -1;
+		}
+	}
 
-	// Check if is bytes object.
-	return (strcmp(dataobj->ob_type->tp_name, "bytes") == 0);
+	*arraylen = PySlice_AdjustIndices(*arraylen, &start, &stop, 1);
+	*startpos = start;
 
+	return 0;
 }
 
 
+/* Get the "step" parameter. Only every step'th element of the part of the
+   sequence selected by getseqwindow is used, starting with the first one,
+   as when slicing a sequence with sequence[start:stop:step]. The step must
+   be a positive integer.
+   stepobj = The step parameter, or NULL if it was not given.
+   step = Receives the step. This is 1 if the parameter was not given.
+   Returns 0 if OK, or -1 if the parameter was not valid.
+*/
+int getseqstep(PyObject *stepobj, Py_ssize_t *step) {
+
+	*step = 1;
+
+	if ((stepobj == NULL) || (stepobj == Py_None)) {
+		return 0;
+	}
+
+	// Large integers are clamped rather than raising an error.
+	*step = PyNumber_AsSsize_t(stepobj, NULL);
+	if ((*step == -1) && PyErr_Occurred()) {
+		return -1;
+	}
+
+	if (*step < 1) {
+		return -1;
+	}
+
+	return 0;
+}
+
 
-/* Determines if the Python object is an bytearray object.
- * dataobj = The object to be tested.
- * Returns TRUE if a bytearray object, otherwise returns FALSE.
+/* Move the data pointer of a sequence parameter to the start of the part
+   of the sequence selected by getseqwindow. Parameters which are not 
+   sequences are not changed.
+   paramobjdata = The parameter data returned by get_paramdata.
+   startpos = The index of the start of the selected part.
+   Returns nothing.
 */
-int isbytearrayobjtype(PyObject *dataobj) {
+void offsetseqdata(struct paramsdata *paramobjdata, Py_ssize_t startpos) {
+
+	if ((paramobjdata->paramtype == paramobj_readonly) || (paramobjdata->paramtype == paramobj_writable)) {
+		paramobjdata->byteseq.buf += startpos;
+	}
 
-	if (dataobj == NULL) { return 0; }
+}
+
+
+/* Get the "outtype" parameter. This selects whether the results are returned
+   in a new sequence, and if so the type of that sequence. The parameter
+   must be the bytes or bytearray type itself.
+   outtypeobj = The outtype parameter, or NULL if it was not given.
+   outtype = Receives the output type. This is outtype_none if the parameter 
+     was not given or is None.
+   Returns 0 if OK, or -1 if the parameter was not valid.
+*/
+int getouttype(PyObject *outtypeobj, enum outtypes *outtype) {
 
-	// Check if is bytearray object.
-	return (strcmp(dataobj->ob_type->tp_name, "bytearray") == 0);
+	*outtype = outtype_none;
+
+	if ((outtypeobj == NULL) || (outtypeobj == Py_None)) {
+		return 0;
+	}
+
+	if (outtypeobj == (PyObject *) &PyBytes_Type) {
+		*outtype = outtype_bytes;
+		return 0;
+	}
+
+	if (outtypeobj == (PyObject *) &PyByteArray_Type) {
+		*outtype = outtype_bytearray;
+		return 0;
+	}
+
+	return -1;
+}
+
+
+/* Create a new output sequence to hold the results. The contents are not
+   initialised, as every element will be written by the calculation. This 
+   must be called while the GIL is held.
+   outtype = The type of sequence to create. This must not be outtype_none.
+   arraylen = The length of the new sequence.
+   outdata = Receives a pointer to the data in the new sequence.
+   Returns a new reference to the sequence, or NULL with a Python exception
+     set if it could not be created.
+*/
+PyObject *newoutputseq(enum outtypes outtype, Py_ssize_t arraylen, unsigned char **outdata) {
+
+	PyObject *outobj;
+
+	if (outtype == outtype_bytes) {
+		outobj = PyBytes_FromStringAndSize(NULL, arraylen);
+		if (outobj != NULL) {
+			*outdata = (unsigned char *) PyBytes_AS_STRING(outobj);
+		}
+	} else {
+		outobj = PyByteArray_FromStringAndSize(NULL, arraylen);
+		if (outobj != NULL) {
+			*outdata = (unsigned char *) PyByteArray_AS_STRING(outobj);
+		}
+	}
+
+	return outobj;
+}
+
+
+/* Determines if a parameter is a sequence which may be written to.
+ * paramobjdata = The parameter data returned by get_paramdata.
+ * Returns TRUE if a writable sequence, otherwise returns FALSE.
+*/
+int iswritableseq(struct paramsdata *paramobjdata) {
+
+	return (paramobjdata->paramtype == paramobj_writable);
 
 }
 
@@ -166,28 +456,29 @@ int get_paramdata(PyObject *dataobj, struct paramsdata *paramobjdata, bool *hasb
 	*hasbuffer = false;
 	*paramoverflow = false;
 
-	// Parameter is a sequence.
+	// Parameter is a sequence. This may be any object which supports the 
+	// buffer protocol, provided the data is contiguous and the items are
+	// one byte in size. The bytes are always treated as unsigned.
 	if (PyObject_CheckBuffer(dataobj)) {
-		// Check that this is actually an bytes object or bytearray 
-		// and not some other buffer type.
-		if(!isbytesobjtype(dataobj) && !isbytearrayobjtype(dataobj)) {
+
+		if (PyObject_GetBuffer(dataobj, &datapy, PyBUF_C_CONTIGUOUS)) {
 			paramobjdata->paramtype = paramobj_error;
-			return -1;
+			return -2;
 		}
 
-		// Not entirely sure if PyBUF_ND is the correct flag.
-		if (PyObject_GetBuffer(dataobj, &datapy, PyBUF_ND)) {
+		if (datapy.itemsize != 1) {
+			PyBuffer_Release(&datapy);
 			paramobjdata->paramtype = paramobj_error;
-			return -2;
+			return -1;
 		}
 
 		paramobjdata->pybuffer = datapy;
 
-		// Determine whether bytes or bytearray.
-		if (isbytesobjtype(dataobj)) {
-			paramobjdata->paramtype = paramobj_bytes;
+		// Determine whether the sequence may be used for output.
+		if (datapy.readonly) {
+			paramobjdata->paramtype = paramobj_readonly;
 		} else {
-			paramobjdata->paramtype = paramobj_bytearray;
+			paramobjdata->paramtype = paramobj_writable;
 		}
 		paramobjdata->byteseq.buf = datapy.buf;
 		*hasbuffer = true;
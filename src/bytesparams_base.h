@@ -29,8 +29,50 @@
 
 /*--------------------------------------------------------------------------- */
 
-// The maximum length of dynamically created format strings.
-#define FMTSTRLEN 25
+/* The calling convention used by the functions. From Python 3.7 onwards
+	the "fast call" convention is used. The arguments are passed as a C
+	array with the keyword names in a tuple, so no argument tuple or keyword
+	dictionary has to be created for each call. Older versions pass a tuple
+	and dictionary, which are converted to the same form before parsing.
+	BF_METHFLAGS = The flags for the PyMethodDef table.
+	BF_ARGSDECL = The parameters of the function entry point.
+	BF_ARGSPASS = Passes the parameters on to the parameter parsing function.
+	BF_ARGSUNPACK = Passes the parameters on to getargobjs.
+*/
+#if PY_VERSION_HEX >= 0x03070000
+#define BF_METHFLAGS (METH_FASTCALL | METH_KEYWORDS)
+#define BF_ARGSDECL PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames
+#define BF_ARGSPASS args, nargs, kwnames
+#define BF_ARGSUNPACK args, nargs, kwnames, NULL
+#else
+#define BF_METHFLAGS (METH_VARARGS | METH_KEYWORDS)
+#define BF_ARGSDECL PyObject *args, PyObject *keywds
+#define BF_ARGSPASS args, keywds
+#define BF_ARGSUNPACK &PyTuple_GET_ITEM(args, 0), PyTuple_GET_SIZE(args), NULL, keywds
+#endif
+
+// The maximum number of parameters accepted by any function.
+#define BF_MAXPARAMS 12
+
+/*--------------------------------------------------------------------------- */
+
+// The minimum sequence length (in bytes) for which the GIL will be released
+// while the calculation is in progress. For shorter sequences the cost of
+// releasing and re-acquiring the GIL outweighs any benefit.
+#define GILRELEASE_MINLEN 65536
+
+/* Release the GIL around a calculation if the sequence is long enough.
+	These must be used as a pair in the same function. No Python objects
+	may be accessed between them. The buffers must remain exported until
+	after the GIL has been re-acquired so that a bytearray cannot be resized
+	while the calculation is in progress.
+	arraylen = The length of the sequence.
+*/
+#define BF_BEGIN_ALLOW_THREADS(arraylen) { \
+	PyThreadState *_bf_save = ((arraylen) >= GILRELEASE_MINLEN) ? PyEval_SaveThread() : NULL;
+
+#define BF_END_ALLOW_THREADS \
+	if (_bf_save != NULL) { PyEval_RestoreThread(_bf_save); } }
 
 /*--------------------------------------------------------------------------- */
 
@@ -42,15 +84,26 @@ union dataseq {
 };
 
 
-// The categories that a parameter can fall into.
+// The categories that a parameter can fall into. Sequences may be any
+// contiguous buffer of bytes, such as bytes, bytearray, memoryview or 
+// array('B'). They are categorised by whether they may be written to.
 enum paramtypes
 { 
 	paramobj_error,
-	paramobj_bytes,
-	paramobj_bytearray,
+	paramobj_readonly,
+	paramobj_writable,
 	paramobj_uchar,
 };
 
+// The type of a new output sequence which is created to hold the results
+// when the "outtype" parameter is used.
+enum outtypes
+{
+	outtype_none,
+	outtype_bytes,
+	outtype_bytearray,
+};
+
 // This holds both sequence and numeric (integer) data values.
 // This is used to parse the parameters.
 struct paramsdata {
@@ -65,10 +118,25 @@ struct paramsdata {
 
 Py_ssize_t adjustbytesmaxlen(Py_ssize_t arraylen, Py_ssize_t bytesmaxlen);
 	
-void makefmtstr(char *basestr, char *funcname, char *formatstr);
+int getargobjs(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, PyObject *kwdict, 
+			char **kwlist, int minargs, int maxpos, PyObject **argobjs);
+
+int getssizearg(PyObject *argobj, Py_ssize_t *result);
+
+int getintarg(PyObject *argobj, int *result);
 
 int get_paramdata(PyObject *dataobj, struct paramsdata *paramobjdata, bool *hasbuffer, bool *paramoverflow);
 
-int isbytearrayobjtype(PyObject *dataobj);
+int iswritableseq(struct paramsdata *paramobjdata);
+
+int getseqwindow(PyObject *startobj, PyObject *stopobj, Py_ssize_t *arraylen, Py_ssize_t *startpos);
+
+int getseqstep(PyObject *stepobj, Py_ssize_t *step);
+
+void offsetseqdata(struct paramsdata *paramobjdata, Py_ssize_t startpos);
+
+int getouttype(PyObject *outtypeobj, enum outtypes *outtype);
+
+PyObject *newoutputseq(enum outtypes outtype, Py_ssize_t arraylen, unsigned char **outdata);
 
 /*--------------------------------------------------------------------------- */
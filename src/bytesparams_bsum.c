@@ -32,13 +32,14 @@
 #include "byteserrs.h"
 #include "bytesparams_base.h"
 #include "bytesparams_bsum.h"
+#include "bytesthreads.h"
 
 /*--------------------------------------------------------------------------- */
 
 
 // The list of keyword arguments. All argument must be listed, whether we 
 // intend to use them for keywords or not. 
-static char *kwlist[] = {"data", "matherrors", "maxlen", "nosimd", NULL};
+static char *kwlist[] = {"data", "matherrors", "maxlen", "nosimd", "threads", "start", "stop", "step", NULL};
 
 
 /*--------------------------------------------------------------------------- */
@@ -61,24 +62,31 @@ void releasebuffers_bsum(struct args_params_bsum bytesdata) {
 
 
 /* Get the parameters passed from Python with a function which takes one array.
- * self, args, keywds = The parameters of the same name passed from the PyObject
- * 		function which forms the original entry point.
- * funcname = A string which represents the C extension name. This is passed to
- * 		PyArg_ParseTupleAndKeywords for error reporting.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
  * Returns: A structure which contains the parameter data.
 */
-struct args_params_bsum getparams_bsum(PyObject *self, PyObject *args, PyObject *keywds, char *funcname) {
+struct args_params_bsum getparams_bsum(PyObject *self, BF_ARGSDECL) {
 
 
 	// This is used to return the parsed parameters.
 	struct args_params_bsum bytesdata = ARGSINIT_BSUM;
 
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
 	PyObject *dataobj1 = NULL;
 
 	struct paramsdata paramobjdata1;
 
 	// Number of elements to work on. If zero or less, ignore this parameter.
 	Py_ssize_t bytesmaxlen = 0;
+
+	// The start of the part of the sequence to work on.
+	Py_ssize_t startpos = 0;
+
+	// Only every step'th element is used.
+	Py_ssize_t step = 1;
 	Py_ssize_t arraylen;
 
 	// If true, *disabled* overflow checking.
@@ -87,7 +95,9 @@ struct args_params_bsum getparams_bsum(PyObject *self, PyObject *args, PyObject
 	// If True, SIMD processing is disabled.
 	signed int nosimd = 0;
 
-	char formatstr[FMTSTRLEN];
+	// The number of threads to use. If zero, use the default.
+	int threads = 0;
+
 
 	bool paramoverflow = false;
 
@@ -96,18 +106,19 @@ struct args_params_bsum getparams_bsum(PyObject *self, PyObject *args, PyObject
 
 	// This section determines the type of the arrays.
 
-	// Construct the format string. This is constructed dynamically because
-	// we must be able to call this same function from different C extensions.
-	makefmtstr("O|ini:", funcname, formatstr);
-
-	// Import the raw objects. 
-	if (!PyArg_ParseTupleAndKeywords(args, keywds, formatstr, kwlist, &dataobj1, 
-							&ignoreerrors, &bytesmaxlen, &nosimd)) {
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist, 1, 4, argobjs)
+			|| getintarg(argobjs[1], &ignoreerrors)
+			|| getssizearg(argobjs[2], &bytesmaxlen)
+			|| getintarg(argobjs[3], &nosimd)
+			|| getintarg(argobjs[4], &threads)) {
 		ErrMsgParameterError();
 		bytesdata.errorcode = 1;
 		return bytesdata;
 	}
 
+	dataobj1 = argobjs[0];
+
 
 	// Parse the first object parameter. 
 	if (get_paramdata(dataobj1, &paramobjdata1, &bytesdata.hasbuffer1, &paramoverflow)) {
@@ -116,10 +127,12 @@ struct args_params_bsum getparams_bsum(PyObject *self, PyObject *args, PyObject
 		releasebuffers_bsum(bytesdata);
 		return bytesdata;
 	}
+	// Keep the buffer so that it can be released if a later step fails.
+	bytesdata.pybuffer1 = paramobjdata1.pybuffer;
 
 
 	// The first parameter must be a bytes or bytearray.
-	if ((paramobjdata1.paramtype != paramobj_bytes) && (paramobjdata1.paramtype != paramobj_bytearray)) {
+	if ((paramobjdata1.paramtype != paramobj_readonly) && (paramobjdata1.paramtype != paramobj_writable)) {
 		ErrMsgParameterError();
 		bytesdata.errorcode = 3;
 		releasebuffers_bsum(bytesdata);
@@ -127,15 +140,44 @@ struct args_params_bsum getparams_bsum(PyObject *self, PyObject *args, PyObject
 	}
 
 
+	// Get the number of threads to use.
+	threads = getthreadcount(threads);
+	if (threads < 0) {
+		bytesdata.errorcode = 4;
+		releasebuffers_bsum(bytesdata);
+		return bytesdata;
+	}
+
+
 	// The number of bytes.
 	arraylen = paramobjdata1.pybuffer.len;
 
 
+	// Select the part of the sequence to work on.
+	if (getseqwindow(argobjs[5], argobjs[6], &arraylen, &startpos)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 5;
+		releasebuffers_bsum(bytesdata);
+		return bytesdata;
+	}
+	offsetseqdata(&paramobjdata1, startpos);
+
+	// Get the step between the elements which are used.
+	if (getseqstep(argobjs[7], &step)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 6;
+		releasebuffers_bsum(bytesdata);
+		return bytesdata;
+	}
+
+
 	// Collect the parameter data for return to the calling function.
 	bytesdata.errorcode = 0;
 	bytesdata.ignoreerrors = ignoreerrors;
 	bytesdata.nosimd = nosimd;
+	bytesdata.threads = threads;
 	bytesdata.arraylen = adjustbytesmaxlen(arraylen, bytesmaxlen);
+	bytesdata.step = step;
 	bytesdata.bytes1.buf = paramobjdata1.byteseq.buf;
 	bytesdata.pybuffer1 = paramobjdata1.pybuffer;
 
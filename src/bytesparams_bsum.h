@@ -29,7 +29,7 @@
 
 /*--------------------------------------------------------------------------- */
 
-#define ARGSINIT_BSUM {0, 0, 0, 0, 0, {NULL}, {NULL}}
+#define ARGSINIT_BSUM {0, 0, 0, 0, 0, 0, {NULL}, {NULL}, 1}
 
 
 // Provide a struct for returning data from parsing Python arguments.
@@ -38,15 +38,17 @@ struct args_params_bsum {
 	bool hasbuffer1;
 	signed int ignoreerrors;
 	signed int nosimd;
+	int threads;
 	Py_ssize_t arraylen;
 	union dataseq bytes1;
 	Py_buffer pybuffer1;
+	Py_ssize_t step;
 };
 
 
 /*--------------------------------------------------------------------------- */
 
-struct args_params_bsum getparams_bsum(PyObject *self, PyObject *args, PyObject *keywds, char *funcname);
+struct args_params_bsum getparams_bsum(PyObject *self, BF_ARGSDECL);
 
 void releasebuffers_bsum(struct args_params_bsum arraydata);
 
@@ -38,7 +38,7 @@
 
 // The list of keyword arguments. All argument must be listed, whether we 
 // intend to use them for keywords or not. 
-static char *kwlist_comp[] = {"data1", "data2", "maxlen", "nosimd", NULL};
+static char *kwlist_comp[] = {"data1", "data2", "maxlen", "nosimd", "start", "stop", "step", NULL};
 
 /*--------------------------------------------------------------------------- */
 
@@ -64,24 +64,20 @@ void releasebuffers_comp(struct args_params_comp bytesdata) {
 
 /* Get the parameters passed from Python with a function which takes one input 
  * 		sequence and one input value, or two input sequences.
- * self, args, keywds = The parameters of the same name passed from the PyObject
- * 		function which forms the original entry point.
- * funcname = A string which represents the C extension name. This is passed to
- * 		PyArg_ParseTupleAndKeywords for error reporting.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
  * Returns: A structure which contains the parameter data.
 */
-struct args_params_comp getparams_comp(PyObject *self, PyObject *args, PyObject *keywds, char *funcname) {
+struct args_params_comp getparams_comp(PyObject *self, BF_ARGSDECL) {
 
 
-	// This is used for constructing parameter format strings. The size must
-	// be able to hold the largest string, which will be determined by the 
-	// names of the functions which use this.
-	char formatstr[FMTSTRLEN];
-	
 
 	// This is used to return the parsed parameters.
 	struct args_params_comp bytesdata = ARGSINIT_COMP;
 
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
 	PyObject *dataobj1 = NULL;
 	PyObject *dataobj2 = NULL;
 
@@ -96,6 +92,12 @@ struct args_params_comp getparams_comp(PyObject *self, PyObject *args, PyObject
 
 	// Number of elements to work on. If zero or less, ignore this parameter.
 	Py_ssize_t bytesmaxlen = 0;
+
+	// The start of the part of the sequence to work on.
+	Py_ssize_t startpos = 0;
+
+	// Only every step'th element is used.
+	Py_ssize_t step = 1;
 	// If True, SIMD processing is disabled.
 	int nosimd = 0;
 
@@ -116,18 +118,18 @@ struct args_params_comp getparams_comp(PyObject *self, PyObject *args, PyObject
 	// This section determines the type of the sequence. We do this by parsing
 	// the parameters as objects. We then examine the parameters 
 
-	// Construct the format string. This is constructed dynamically because
-	// we must be able to call this same function from different C extensions.
-	makefmtstr("OO|ni:", funcname, formatstr);
-
-	// Import the raw objects. 
-	if (!PyArg_ParseTupleAndKeywords(args, keywds, formatstr, kwlist_comp, &dataobj1, 
-							&dataobj2, &bytesmaxlen, &nosimd)) {
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_comp, 2, 4, argobjs)
+			|| getssizearg(argobjs[2], &bytesmaxlen)
+			|| getintarg(argobjs[3], &nosimd)) {
 		ErrMsgParameterError();
 		bytesdata.errorcode = 2;
 		return bytesdata;
 	}
 
+	dataobj1 = argobjs[0];
+	dataobj2 = argobjs[1];
+
 
 	// Parse the first object parameter. 
 	if (get_paramdata(dataobj1, &paramobjdata1, &bytesdata.hasbuffer1, &paramoverflow)) {
@@ -136,6 +138,8 @@ struct args_params_comp getparams_comp(PyObject *self, PyObject *args, PyObject
 		releasebuffers_comp(bytesdata);
 		return bytesdata;
 	}
+	// Keep the buffer so that it can be released if a later step fails.
+	bytesdata.pybuffer1 = paramobjdata1.pybuffer;
 
 	// Parse the second object parameter. 
 	if (get_paramdata(dataobj2, &paramobjdata2, &bytesdata.hasbuffer2, &paramoverflow)) {
@@ -144,12 +148,14 @@ struct args_params_comp getparams_comp(PyObject *self, PyObject *args, PyObject
 		releasebuffers_comp(bytesdata);
 		return bytesdata;
 	}
+	// Keep the buffer so that it can be released if a later step fails.
+	bytesdata.pybuffer2 = paramobjdata2.pybuffer;
 
 	// Determine which of the parameters are bytes or bytearrays. For the purposes of the functions
 	// we are dealing with here it doesn't matter which of the two they are as they do not
 	// alter the data.
-	param1issequence = ((paramobjdata1.paramtype == paramobj_bytes) || (paramobjdata1.paramtype == paramobj_bytearray));
-	param2issequence = ((paramobjdata2.paramtype == paramobj_bytes) || (paramobjdata2.paramtype == paramobj_bytearray));
+	param1issequence = ((paramobjdata1.paramtype == paramobj_readonly) || (paramobjdata1.paramtype == paramobj_writable));
+	param2issequence = ((paramobjdata2.paramtype == paramobj_readonly) || (paramobjdata2.paramtype == paramobj_writable));
 
 
 	// Either the first or second parameter (or both) must be an bytes or bytearray sequence.
@@ -207,8 +213,28 @@ struct args_params_comp getparams_comp(PyObject *self, PyObject *args, PyObject
 
 
 
+	// Select the part of the sequence to work on.
+	if (getseqwindow(argobjs[4], argobjs[5], &arraylen, &startpos)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 9;
+		releasebuffers_comp(bytesdata);
+		return bytesdata;
+	}
+	offsetseqdata(&paramobjdata1, startpos);
+	offsetseqdata(&paramobjdata2, startpos);
+
+	// Get the step between the elements which are used.
+	if (getseqstep(argobjs[6], &step)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 10;
+		releasebuffers_comp(bytesdata);
+		return bytesdata;
+	}
+
+
 	bytesdata.errorcode = 0;
 	bytesdata.arraylen = adjustbytesmaxlen(arraylen, bytesmaxlen);
+	bytesdata.step = step;
 	bytesdata.nosimd = nosimd;
 	bytesdata.bytes1.buf = paramobjdata1.byteseq.buf;
 	bytesdata.bytes2.buf = paramobjdata2.byteseq.buf;
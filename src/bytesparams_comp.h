@@ -29,7 +29,7 @@
 
 /*--------------------------------------------------------------------------- */
 
-#define ARGSINIT_COMP {0, 0, 0, 0, 0, {NULL}, {NULL}, {NULL}, {NULL}, 0, 0}
+#define ARGSINIT_COMP {0, 0, 0, 0, 0, {NULL}, {NULL}, {NULL}, {NULL}, 0, 0, 1}
 
 
 enum paramcats
@@ -53,11 +53,12 @@ struct args_params_comp {
 	Py_buffer pybuffer2;
 	unsigned char param;
 	enum paramcats paramcat;
+	Py_ssize_t step;
 };
 
 /*--------------------------------------------------------------------------- */
 
-struct args_params_comp getparams_comp(PyObject *self, PyObject *args, PyObject *keywds, char *funcname);
+struct args_params_comp getparams_comp(PyObject *self, BF_ARGSDECL);
 
 void releasebuffers_comp(struct args_params_comp bytesdata);
 
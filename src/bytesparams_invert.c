@@ -39,7 +39,7 @@
 
 // The list of keyword arguments. All argument must be listed, whether we 
 // intend to use them for keywords or not. 
-static char *kwlist_invert[] = {"data", "dataout", "maxlen", "nosimd", NULL};
+static char *kwlist_invert[] = {"data", "dataout", "maxlen", "nosimd", "start", "stop", "outtype", NULL};
 
 
 /*--------------------------------------------------------------------------- */
@@ -68,18 +68,19 @@ void releasebuffers_one(struct args_params_1 bytesdata) {
 
 /* Get the parameters passed from Python with a function which takes one or
  * 		optionally, two arrays.
- * self, args, keywds = The parameters of the same name passed from the PyObject
- * 		function which forms the original entry point.
- * funcname = A string which represents the C extension name. This is passed to
- * 		PyArg_ParseTupleAndKeywords for error reporting.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
  * Returns: A structure which contains the parameter data.
 */
-struct args_params_1 getparams_one(PyObject *self, PyObject *args, PyObject *keywds, char *funcname) {
+struct args_params_1 getparams_one(PyObject *self, BF_ARGSDECL) {
 
 
 	// This is used to return the parsed parameters.
 	struct args_params_1 bytesdata = ARGSINIT_ONE;
 
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
 	PyObject *dataobj1 = NULL;
 	PyObject *dataobj2 = NULL;
 
@@ -91,6 +92,9 @@ struct args_params_1 getparams_one(PyObject *self, PyObject *args, PyObject *key
 	// Number of elements to work on. If zero or less, ignore this parameter.
 	Py_ssize_t bytesmaxlen = 0;
 
+	// The start of the part of the sequence to work on.
+	Py_ssize_t startpos = 0;
+
 	// If True, SIMD processing is disabled.
 	int nosimd = 0;
 
@@ -98,31 +102,40 @@ struct args_params_1 getparams_one(PyObject *self, PyObject *args, PyObject *key
 
 	// If true, then there is a third parameter for data output.
 	bool hasoutputseq = false;
+	// The type of a new output sequence, if one is to be created.
+	enum outtypes outtype = outtype_none;
 	// If true, then the output sequence is mutable (a bytearray).
 	int outputmutable = 0;
 	// If true the sequences are all the same length (required).
 	int validparamlength = 0;
 
 
-	char formatstr[FMTSTRLEN];
 
 	// -----------------------------------------------------
 
 
 	// This section determines the type of the arrays.
 
-	// Construct the format string. This is constructed dynamically because
-	// we must be able to call this same function from different C extensions.
-	makefmtstr("O|Oni:", funcname, formatstr);
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_invert, 1, 4, argobjs)
+			|| getssizearg(argobjs[2], &bytesmaxlen)
+			|| getintarg(argobjs[3], &nosimd)
+			|| getouttype(argobjs[6], &outtype)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
 
-	// Import the raw objects. 
-	if (!PyArg_ParseTupleAndKeywords(args, keywds, formatstr, kwlist_invert, &dataobj1, 
-							&dataobj2, &bytesmaxlen, &nosimd)) {
+	// A new output sequence cannot be combined with an output parameter.
+	if ((outtype != outtype_none) && (argobjs[1] != NULL)) {
 		ErrMsgParameterError();
 		bytesdata.errorcode = 1;
 		return bytesdata;
 	}
 
+	dataobj1 = argobjs[0];
+	dataobj2 = argobjs[1];
+
 
 
 	// Parse the first object parameter. 
@@ -132,6 +145,8 @@ struct args_params_1 getparams_one(PyObject *self, PyObject *args, PyObject *key
 		releasebuffers_one(bytesdata);
 		return bytesdata;
 	}
+	// Keep the buffer so that it can be released if a later step fails.
+	bytesdata.pybuffer1 = paramobjdata1.pybuffer;
 
 
 	// Parse the second object parameter. This one is optional.
@@ -142,6 +157,8 @@ struct args_params_1 getparams_one(PyObject *self, PyObject *args, PyObject *key
 			releasebuffers_one(bytesdata);
 			return bytesdata;
 		}
+		// Keep the buffer so that it can be released if a later step fails.
+		bytesdata.pybuffer2 = paramobjdata2.pybuffer;
 	
 		hasoutputseq = true;
 	} else {
@@ -156,14 +173,15 @@ struct args_params_1 getparams_one(PyObject *self, PyObject *args, PyObject *key
 	// and if the output is mutable (writable).
 	if (hasoutputseq) {
 		validparamlength = (arraylen == paramobjdata2.pybuffer.len);
-		outputmutable = isbytearrayobjtype(dataobj2);
+		outputmutable = iswritableseq(&paramobjdata2);
 	} else {
 		validparamlength = 1;
-		outputmutable = isbytearrayobjtype(dataobj1);
+		outputmutable = iswritableseq(&paramobjdata1);
 	}
 
-	// If the output is not mutable, signal the error.
-	if (!outputmutable) {
+	// If the output is not mutable, signal the error. This does not apply
+	// if a new output sequence is to be created.
+	if (!outputmutable && (outtype == outtype_none)) {
 		ErrMsgOutputNotMutableParam();
 		bytesdata.errorcode = 4;
 		releasebuffers_one(bytesdata);
@@ -180,6 +198,19 @@ struct args_params_1 getparams_one(PyObject *self, PyObject *args, PyObject *key
 	}
 
 
+	// Select the part of the sequence to work on.
+	if (getseqwindow(argobjs[4], argobjs[5], &arraylen, &startpos)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 6;
+		releasebuffers_one(bytesdata);
+		return bytesdata;
+	}
+	offsetseqdata(&paramobjdata1, startpos);
+	if (hasoutputseq) {
+		offsetseqdata(&paramobjdata2, startpos);
+	}
+
+
 	// Collect the parameter data for return to the calling function.
 	bytesdata.errorcode = 0;
 	bytesdata.hasoutputseq = hasoutputseq;
@@ -191,6 +222,20 @@ struct args_params_1 getparams_one(PyObject *self, PyObject *args, PyObject *key
 	bytesdata.pybuffer2 = paramobjdata2.pybuffer;
 
 
+	// Create a new output sequence if one was requested. The results are
+	// written to this in place of the input. It is the same length as the
+	// part of the input which is used.
+	if (outtype != outtype_none) {
+		bytesdata.outobj = newoutputseq(outtype, bytesdata.arraylen, &bytesdata.bytes2.B);
+		if (bytesdata.outobj == NULL) {
+			bytesdata.errorcode = 7;
+			releasebuffers_one(bytesdata);
+			return bytesdata;
+		}
+		bytesdata.hasoutputseq = true;
+	}
+
+
 	return bytesdata;
 
 
@@ -29,7 +29,7 @@
 
 /*--------------------------------------------------------------------------- */
 
-#define ARGSINIT_ONE {0, 0, 0, 0, 0, 0, {NULL}, {NULL}, {NULL}, {NULL}}
+#define ARGSINIT_ONE {0, 0, 0, 0, 0, 0, {NULL}, {NULL}, {NULL}, {NULL}, NULL}
 
 
 // Provide a struct for returning data from parsing Python arguments.
@@ -44,11 +44,13 @@ struct args_params_1 {
 	union dataseq bytes2;
 	Py_buffer pybuffer1;
 	Py_buffer pybuffer2;
+	// A new output sequence created to hold the results, or NULL.
+	PyObject *outobj;
 };
 
 /*--------------------------------------------------------------------------- */
 
-struct args_params_1 getparams_one(PyObject *self, PyObject *args, PyObject *keywds, char *funcname);
+struct args_params_1 getparams_one(PyObject *self, BF_ARGSDECL);
 
 void releasebuffers_one(struct args_params_1 arraydata);
 
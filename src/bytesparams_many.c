@@ -0,0 +1,512 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   bytesparams_many.c
+// Purpose:  Functions for parsing parameters for functions which work on a batch of sequences.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+#include "Python.h"
+
+#include <string.h>
+#include <limits.h>
+#include <stdbool.h>
+
+#include "byteserrs.h"
+#include "bytesparams_base.h"
+#include "arrayops.h"
+#include "bytesparams_many.h"
+
+/*--------------------------------------------------------------------------- */
+
+// The lists of keyword arguments. All argument must be listed, whether we
+// intend to use them for keywords or not.
+static char *kwlist_one[] = {"data", "nosimd", NULL};
+static char *kwlist_bsum[] = {"data", "matherrors", "nosimd", NULL};
+static char *kwlist_allany[] = {"op", "data", "param", "nosimd", NULL};
+static char *kwlist_two[] = {"data", "param", "nosimd", "outtype", NULL};
+
+/*--------------------------------------------------------------------------- */
+
+/* Release the buffers which represent the sequences. This function checks
+ * 	which buffers were obtained. A list of new output sequences is not
+ * 	released, as this is returned to the caller.
+ * bytesdata = Structure which contains the buffers to be released.
+ * Returns: Nothing.
+*/
+void releasebuffers_many(struct args_params_many bytesdata) {
+
+	Py_ssize_t x;
+
+	for (x = 0; x < bytesdata.nbuffers; x++) {
+		PyBuffer_Release(&bytesdata.pybuffers[x]);
+	}
+	PyMem_Free(bytesdata.pybuffers);
+	PyMem_Free(bytesdata.outdata);
+
+	if (bytesdata.hasparambuffer) {
+		PyBuffer_Release(&bytesdata.parambuffer);
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Release everything after an error while parsing the parameters. This
+ * 	includes any list of new output sequences.
+ * bytesdata = Structure which contains the buffers to be released.
+ * errorcode = The error code to record.
+ * Returns: The structure with the error code set.
+*/
+static struct args_params_many failparams_many(struct args_params_many bytesdata, int errorcode) {
+
+	releasebuffers_many(bytesdata);
+	Py_CLEAR(bytesdata.outlist);
+
+	bytesdata.nbuffers = 0;
+	bytesdata.pybuffers = NULL;
+	bytesdata.outdata = NULL;
+	bytesdata.hasparambuffer = false;
+	bytesdata.errorcode = errorcode;
+
+	return bytesdata;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Get the buffer for each sequence in the batch. The batch may be a list,
+ * 	tuple, or other iterable. Each item must be a sequence of bytes.
+ * 	A Python exception is set if there is an error.
+ * seqsobj = The batch of sequences as a PyObject (not parsed).
+ * bytesdata = Receives the buffers, the number of sequences, and their
+ * 	total length.
+ * writable = If true, each sequence must be one which can be written to.
+ * Returns 0 if OK, otherwise non-zero.
+*/
+static int getseqbatch(PyObject *seqsobj, struct args_params_many *bytesdata, bool writable) {
+
+	PyObject *seqlist;
+	PyObject **items;
+	Py_ssize_t x;
+
+	struct paramsdata paramobjdata;
+	bool hasbuffer, paramoverflow;
+
+
+	// A single sequence is not a batch, even though it can be iterated.
+	if (PyObject_CheckBuffer(seqsobj)) {
+		ErrMsgParameterError();
+		return -1;
+	}
+
+	seqlist = PySequence_Fast(seqsobj, "");
+	if (seqlist == NULL) {
+		PyErr_Clear();
+		ErrMsgParameterError();
+		return -1;
+	}
+
+	bytesdata->nseqs = PySequence_Fast_GET_SIZE(seqlist);
+	items = PySequence_Fast_ITEMS(seqlist);
+
+	// Make sure there is something to allocate even for an empty batch.
+	bytesdata->pybuffers = PyMem_New(Py_buffer, bytesdata->nseqs + 1);
+	if (bytesdata->pybuffers == NULL) {
+		Py_DECREF(seqlist);
+		PyErr_NoMemory();
+		return -1;
+	}
+
+	for (x = 0; x < bytesdata->nseqs; x++) {
+
+		if (get_paramdata(items[x], &paramobjdata, &hasbuffer, &paramoverflow)
+				|| ((paramobjdata.paramtype != paramobj_readonly) && (paramobjdata.paramtype != paramobj_writable))) {
+			if (hasbuffer && (paramobjdata.paramtype != paramobj_error)) {
+				PyBuffer_Release(&paramobjdata.pybuffer);
+			}
+			Py_DECREF(seqlist);
+			ErrMsgParameterError();
+			return -1;
+		}
+
+		bytesdata->pybuffers[x] = paramobjdata.pybuffer;
+		bytesdata->nbuffers++;
+
+		if (writable && !iswritableseq(&paramobjdata)) {
+			Py_DECREF(seqlist);
+			ErrMsgOutputNotMutableParam();
+			return -1;
+		}
+
+		bytesdata->totallen += paramobjdata.pybuffer.len;
+	}
+
+	// The buffers keep the sequences alive.
+	Py_DECREF(seqlist);
+
+	return 0;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Get the parameters passed from Python with a function which takes only
+ * 		a batch of sequences, such as bmax_many.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
+ * Returns: A structure which contains the parameter data.
+*/
+struct args_params_many getparams_many_one(PyObject *self, BF_ARGSDECL) {
+
+	// This is used to return the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	// If True, SIMD processing is disabled.
+	int nosimd = 0;
+
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_one, 1, 1, argobjs)
+			|| getintarg(argobjs[1], &nosimd)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
+
+	if (getseqbatch(argobjs[0], &bytesdata, false)) {
+		return failparams_many(bytesdata, 2);
+	}
+
+	bytesdata.errorcode = 0;
+	bytesdata.nosimd = nosimd;
+
+	return bytesdata;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Get the parameters passed from Python for bsum_many.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
+ * Returns: A structure which contains the parameter data.
+*/
+struct args_params_many getparams_many_bsum(PyObject *self, BF_ARGSDECL) {
+
+	// This is used to return the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	// If True, math errors are ignored.
+	int ignoreerrors = 0;
+	// If True, SIMD processing is disabled.
+	int nosimd = 0;
+
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_bsum, 1, 2, argobjs)
+			|| getintarg(argobjs[1], &ignoreerrors)
+			|| getintarg(argobjs[2], &nosimd)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
+
+	if (getseqbatch(argobjs[0], &bytesdata, false)) {
+		return failparams_many(bytesdata, 2);
+	}
+
+	bytesdata.errorcode = 0;
+	bytesdata.ignoreerrors = ignoreerrors;
+	bytesdata.nosimd = nosimd;
+
+	return bytesdata;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Get the parameters passed from Python for ball_many, bany_many and
+ * 		findindex_many.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
+ * Returns: A structure which contains the parameter data.
+*/
+struct args_params_many getparams_many_allany(PyObject *self, BF_ARGSDECL) {
+
+	// This is used to return the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	// If True, SIMD processing is disabled.
+	int nosimd = 0;
+	// The integer parameter value. We check later to see if it is in range.
+	int paramval = 0;
+
+	signed int opcode = 0;
+
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_allany, 3, 3, argobjs)
+			|| !PyUnicode_Check(argobjs[0])
+			|| getintarg(argobjs[2], &paramval)
+			|| getintarg(argobjs[3], &nosimd)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
+
+	// Convert the command string to an integer.
+	opcode = opstrdecode(argobjs[0]);
+
+	// Check if the command string is valid.
+	if (opcode < 0) {
+		ErrMsgOperatorNotValidforthisFunction();
+		bytesdata.errorcode = 2;
+		return bytesdata;
+	}
+
+	// Check that the parameter value is in range.
+	if ((paramval < 0) || (paramval > 255)) {
+		ErrMsgArithOverflowParam();
+		bytesdata.errorcode = 3;
+		return bytesdata;
+	}
+
+	if (getseqbatch(argobjs[1], &bytesdata, false)) {
+		return failparams_many(bytesdata, 4);
+	}
+
+	bytesdata.errorcode = 0;
+	bytesdata.opcode = opcode;
+	bytesdata.param = (unsigned char) paramval;
+	bytesdata.nosimd = nosimd;
+
+	return bytesdata;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Get the parameters passed from Python with a function which applies a
+ * 		numeric parameter or a parameter sequence to each sequence in a
+ * 		batch, such as xor_many. The results either overwrite the input
+ * 		sequences, or are written to a list of new sequences.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
+ * Returns: A structure which contains the parameter data.
+*/
+struct args_params_many getparams_many_two(PyObject *self, BF_ARGSDECL) {
+
+	// This is used to return the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	struct paramsdata paramobjdata;
+	bool hasbuffer, paramoverflow;
+
+	// If True, SIMD processing is disabled.
+	int nosimd = 0;
+
+	// The type of the new output sequences, if any.
+	enum outtypes outtype = outtype_none;
+
+	PyObject *outobj;
+	Py_ssize_t x;
+
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_two, 2, 3, argobjs)
+			|| getintarg(argobjs[2], &nosimd)
+			|| getouttype(argobjs[3], &outtype)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
+
+
+	// The parameter may be a single value or a sequence.
+	if (get_paramdata(argobjs[1], &paramobjdata, &hasbuffer, &paramoverflow)) {
+		if (paramoverflow) {
+			ErrMsgArithOverflowParam();
+		} else {
+			ErrMsgParameterError();
+		}
+		bytesdata.errorcode = 2;
+		return bytesdata;
+	}
+
+	if (paramobjdata.paramtype == paramobj_uchar) {
+		bytesdata.param = paramobjdata.ucharparam;
+	} else {
+		bytesdata.hasparambuffer = true;
+		bytesdata.parambuffer = paramobjdata.pybuffer;
+	}
+
+
+	// Without new output sequences, the results overwrite the inputs.
+	if (getseqbatch(argobjs[0], &bytesdata, outtype == outtype_none)) {
+		return failparams_many(bytesdata, 3);
+	}
+
+
+	// A parameter sequence must be the same length as every sequence.
+	if (bytesdata.hasparambuffer) {
+		for (x = 0; x < bytesdata.nseqs; x++) {
+			if (bytesdata.pybuffers[x].len != bytesdata.parambuffer.len) {
+				ErrMsgArrayLengthMismatch();
+				return failparams_many(bytesdata, 4);
+			}
+		}
+	}
+
+
+	// Create the new output sequences. This must be done while the GIL is held.
+	if (outtype != outtype_none) {
+		bytesdata.outdata = PyMem_New(unsigned char *, bytesdata.nseqs + 1);
+		bytesdata.outlist = PyList_New(bytesdata.nseqs);
+		if ((bytesdata.outdata == NULL) || (bytesdata.outlist == NULL)) {
+			if (!PyErr_Occurred()) {
+				PyErr_NoMemory();
+			}
+			return failparams_many(bytesdata, 5);
+		}
+
+		for (x = 0; x < bytesdata.nseqs; x++) {
+			outobj = newoutputseq(outtype, bytesdata.pybuffers[x].len, &bytesdata.outdata[x]);
+			if (outobj == NULL) {
+				return failparams_many(bytesdata, 6);
+			}
+			PyList_SET_ITEM(bytesdata.outlist, x, outobj);
+		}
+	}
+
+
+	bytesdata.errorcode = 0;
+	bytesdata.nosimd = nosimd;
+
+	return bytesdata;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Check if any sequence in the batch is empty.
+ * bytesdata = The parsed parameters.
+ * Returns TRUE if any sequence is empty, otherwise returns FALSE.
+*/
+int hasemptyseq_many(struct args_params_many *bytesdata) {
+
+	Py_ssize_t x;
+
+	for (x = 0; x < bytesdata->nseqs; x++) {
+		if (bytesdata->pybuffers[x].len < 1) {
+			return 1;
+		}
+	}
+
+	return 0;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Create a list of integers from the result for each sequence.
+ * results = The results.
+ * nseqs = The number of results.
+ * Returns a new reference to the list, or NULL with a Python exception set.
+*/
+PyObject *ssizelist_many(Py_ssize_t *results, Py_ssize_t nseqs) {
+
+	PyObject *resultlist, *item;
+	Py_ssize_t x;
+
+	resultlist = PyList_New(nseqs);
+	if (resultlist == NULL) {
+		return NULL;
+	}
+
+	for (x = 0; x < nseqs; x++) {
+		item = PyLong_FromSsize_t(results[x]);
+		if (item == NULL) {
+			Py_DECREF(resultlist);
+			return NULL;
+		}
+		PyList_SET_ITEM(resultlist, x, item);
+	}
+
+	return resultlist;
+}
+
+
+/* Create a list of integers from the sum for each sequence.
+ * results = The results.
+ * nseqs = The number of results.
+ * Returns a new reference to the list, or NULL with a Python exception set.
+*/
+PyObject *ulonglonglist_many(unsigned long long *results, Py_ssize_t nseqs) {
+
+	PyObject *resultlist, *item;
+	Py_ssize_t x;
+
+	resultlist = PyList_New(nseqs);
+	if (resultlist == NULL) {
+		return NULL;
+	}
+
+	for (x = 0; x < nseqs; x++) {
+		item = PyLong_FromUnsignedLongLong(results[x]);
+		if (item == NULL) {
+			Py_DECREF(resultlist);
+			return NULL;
+		}
+		PyList_SET_ITEM(resultlist, x, item);
+	}
+
+	return resultlist;
+}
+
+
+/* Create a list of True or False from the result for each sequence.
+ * results = The results. Any non-zero value is True.
+ * nseqs = The number of results.
+ * Returns a new reference to the list, or NULL with a Python exception set.
+*/
+PyObject *boollist_many(Py_ssize_t *results, Py_ssize_t nseqs) {
+
+	PyObject *resultlist;
+	Py_ssize_t x;
+
+	resultlist = PyList_New(nseqs);
+	if (resultlist == NULL) {
+		return NULL;
+	}
+
+	for (x = 0; x < nseqs; x++) {
+		PyList_SET_ITEM(resultlist, x, PyBool_FromLong(results[x] != 0));
+	}
+
+	return resultlist;
+}
+
+/*--------------------------------------------------------------------------- */
@@ -0,0 +1,81 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   bytesparams_many.h
+// Purpose:  Functions for parsing parameters for functions which work on a batch of sequences.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+#include <stdbool.h>
+
+#include "Python.h"
+
+/*--------------------------------------------------------------------------- */
+
+#define ARGSINIT_MANY {0, 0, 0, 0, 0, false, {NULL}, 0, 0, 0, NULL, NULL, NULL}
+
+
+// Provide a struct for returning data from parsing Python arguments for
+// functions which apply the same operation to each sequence in a batch.
+struct args_params_many {
+	int errorcode;
+	int nosimd;
+	signed int ignoreerrors;
+	signed int opcode;
+	unsigned char param;
+	// If true, the parameter is a sequence rather than a single value.
+	bool hasparambuffer;
+	Py_buffer parambuffer;
+	// The number of sequences in the batch.
+	Py_ssize_t nseqs;
+	// The number of sequence buffers which were obtained and must be released.
+	Py_ssize_t nbuffers;
+	// The total length of all the sequences.
+	Py_ssize_t totallen;
+	// The buffer for each sequence in the batch.
+	Py_buffer *pybuffers;
+	// A list of new output sequences created to hold the results, or NULL.
+	PyObject *outlist;
+	// The data in each new output sequence.
+	unsigned char **outdata;
+};
+
+
+/*--------------------------------------------------------------------------- */
+
+struct args_params_many getparams_many_one(PyObject *self, BF_ARGSDECL);
+
+struct args_params_many getparams_many_bsum(PyObject *self, BF_ARGSDECL);
+
+struct args_params_many getparams_many_allany(PyObject *self, BF_ARGSDECL);
+
+struct args_params_many getparams_many_two(PyObject *self, BF_ARGSDECL);
+
+void releasebuffers_many(struct args_params_many bytesdata);
+
+int hasemptyseq_many(struct args_params_many *bytesdata);
+
+PyObject *ssizelist_many(Py_ssize_t *results, Py_ssize_t nseqs);
+
+PyObject *ulonglonglist_many(unsigned long long *results, Py_ssize_t nseqs);
+
+PyObject *boollist_many(Py_ssize_t *results, Py_ssize_t nseqs);
+
+/*--------------------------------------------------------------------------- */
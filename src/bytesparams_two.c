@@ -32,6 +32,8 @@
 #include "byteserrs.h"
 #include "bytesparams_base.h"
 #include "bytesparams_two.h"
+#include "bytesthreads.h"
+#include "arrayops.h"
 
 
 /*--------------------------------------------------------------------------- */
@@ -41,7 +43,13 @@
 
 // The list of keyword arguments. All argument must be listed, whether we 
 // intend to use them for keywords or not. 
-static char *kwlist_2wsimdwomath[] = {"data1", "data2", "dataout", "maxlen", "nosimd", NULL};
+static char *kwlist_2wsimdwomath[] = {"data1", "data2", "dataout", "maxlen", "nosimd", "threads", "start", "stop", "outtype", NULL};
+
+// The same with a compare operator before the data.
+static char *kwlist_2op[] = {"op", "data1", "data2", "dataout", "maxlen", "nosimd", "threads", "start", "stop", "outtype", NULL};
+
+// The same with a mask sequence before the data.
+static char *kwlist_2mask[] = {"mask", "data1", "data2", "dataout", "maxlen", "nosimd", "threads", "start", "stop", "outtype", NULL};
 
 /*--------------------------------------------------------------------------- */
 
@@ -70,6 +78,11 @@ void releasebuffers_two(struct args_params_2 bytesdata) {
 		bytesdata.hasbuffer3 = false;
 	}
 
+	if (bytesdata.hasbuffermask) {
+		PyBuffer_Release(&bytesdata.pybuffermask);
+		bytesdata.hasbuffermask = false;
+	}
+
 }
 
 /*--------------------------------------------------------------------------- */
@@ -79,30 +92,25 @@ void releasebuffers_two(struct args_params_2 bytesdata) {
  * Returns TRUE if a bytes or bytearray object, otherwise returns FALSE.
 */
 int isseqobjtype(enum paramtypes paramtype) {
-	return ((paramtype == paramobj_bytes) || (paramtype == paramobj_bytearray));
+	return ((paramtype == paramobj_readonly) || (paramtype == paramobj_writable));
 }
 
 /*--------------------------------------------------------------------------- */
 
 /*--------------------------------------------------------------------------- */
 
-/* Get the parameters passed from Python with a function which takes one input 
- * 		array and one input value, or two input arrays, plus an optional
- * 		output array.
- * self, args, keywds = The parameters of the same name passed from the PyObject
- * 		function which forms the original entry point.
- * funcname = A string which represents the C extension name. This is passed to
- * 		PyArg_ParseTupleAndKeywords for error reporting.
+/* Parse the parameters for a function which takes one input array and one 
+ * 		input value, or two input arrays, plus an optional output array.
+ * argobjs = The parameters in the order given by kwlist_2wsimdwomath. 
+ * 		Parameters which were not given are NULL.
+ * maskdata = A mask sequence which has already been parsed, or NULL if the
+ * 		function does not take one. This must be the same length as the
+ * 		other sequences, and the same part of it is used.
  * Returns: A structure which contains the parameter data.
 */
-struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *keywds, char *funcname) {
+static struct args_params_2 parseparams_two(PyObject **argobjs, struct paramsdata *maskdata) {
 
 
-	// This is used for constructing parameter format strings. The size must
-	// be able to hold the largest string, which will be determined by the 
-	// names of the functions which use this.
-	char formatstr[FMTSTRLEN];
-	
 
 	// This is used to return the parsed parameters.
 	struct args_params_2 bytesdata = ARGSINIT_TWO;
@@ -124,9 +132,15 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 	// Number of elements to work on. If zero or less, ignore this parameter.
 	Py_ssize_t bytesmaxlen = 0;
 
+	// The start of the part of the sequence to work on.
+	Py_ssize_t startpos = 0;
+
 	// If True, SIMD processing is disabled.
 	int nosimd = 0;
 
+	// The number of threads to use. If zero, use the default.
+	int threads = 0;
+
 	// The integer parameter value. We check later to see if it is in range.
 	bool paramoverflow = false;
 
@@ -137,6 +151,8 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 
 	// If true, then there is a third parameter for data output.
 	int hasoutputseq = 0;
+	// The type of a new output sequence, if one is to be created.
+	enum outtypes outtype = outtype_none;
 	// If true, then the output sequence is mutable (a bytearray).
 	int outputmutable = 0;
 
@@ -154,18 +170,27 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 	// This section determines the type of the arrays. We do this by parsing
 	// the parameters as objects. 
 
-	// Construct the format string. This is constructed dynamically because
-	// we must be able to call this same function from different C extensions.
-	makefmtstr("OO|Oni:", funcname, formatstr);
+	// Check the types of the arguments.
+	if (getssizearg(argobjs[3], &bytesmaxlen)
+			|| getintarg(argobjs[4], &nosimd)
+			|| getintarg(argobjs[5], &threads)
+			|| getouttype(argobjs[8], &outtype)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 2;
+		return bytesdata;
+	}
 
-	// Import the raw objects. 
-	if (!PyArg_ParseTupleAndKeywords(args, keywds, formatstr, kwlist_2wsimdwomath, &dataobj1, 
-							&dataobj2, &dataobj3, &bytesmaxlen, &nosimd)) {
+	// A new output sequence cannot be combined with an output parameter.
+	if ((outtype != outtype_none) && (argobjs[2] != NULL)) {
 		ErrMsgParameterError();
 		bytesdata.errorcode = 2;
 		return bytesdata;
 	}
 
+	dataobj1 = argobjs[0];
+	dataobj2 = argobjs[1];
+	dataobj3 = argobjs[2];
+
 
 	// Parse the first object parameter. 
 	if (get_paramdata(dataobj1, &paramobjdata1, &bytesdata.hasbuffer1, &paramoverflow)) {
@@ -174,6 +199,8 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 		releasebuffers_two(bytesdata);
 		return bytesdata;
 	}
+	// Keep the buffer so that it can be released if a later step fails.
+	bytesdata.pybuffer1 = paramobjdata1.pybuffer;
 
 	// Parse the second object parameter. 
 	if (get_paramdata(dataobj2, &paramobjdata2, &bytesdata.hasbuffer2, &paramoverflow)) {
@@ -182,6 +209,8 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 		releasebuffers_two(bytesdata);
 		return bytesdata;
 	}
+	// Keep the buffer so that it can be released if a later step fails.
+	bytesdata.pybuffer2 = paramobjdata2.pybuffer;
 
 	// Parse the third object parameter. This one is optional.
 	if (dataobj3 != NULL) {
@@ -191,6 +220,8 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 			releasebuffers_two(bytesdata);
 			return bytesdata;
 		}
+		// Keep the buffer so that it can be released if a later step fails.
+		bytesdata.pybuffer3 = paramobjdata3.pybuffer;
 
 		hasoutputseq = 1;
 	} else {
@@ -204,6 +235,15 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 
 
 
+	// At least one of the first two parameters must be a sequence, unless
+	// there is a mask to give the length.
+	if (!param1isseq && !param2isseq && (maskdata == NULL)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 6;
+		releasebuffers_two(bytesdata);
+		return bytesdata;
+	}
+
 	// Now determine the parameter pattern.
 	if (param1isseq && !param2isseq) {
 		if (hasoutputseq) {
@@ -229,51 +269,76 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 		}
 	}
 
+	if (!param1isseq && !param2isseq) {
+		if (hasoutputseq) {
+			paramcat = param_num_num_arr;
+		} else {
+			paramcat = param_num_num_none;
+		}
+	}
+
 
 	// Check to ensure that the output parameter is writeable (bytearray).
 	// Also, get the numeric integer parameter if it is present.
 	// Also, get the sequence length.
 	switch (paramcat) {
 		case param_arr_num_none : {
-			outputmutable = isbytearrayobjtype(dataobj1);
+			outputmutable = iswritableseq(&paramobjdata1);
 			parampy = paramobjdata2.ucharparam;
 			arraylen = paramobjdata1.pybuffer.len;
 			validparamlength = 1;
 			break;
 		}
 		case param_arr_num_arr : {
-			outputmutable = isbytearrayobjtype(dataobj3);
+			outputmutable = iswritableseq(&paramobjdata3);
 			parampy = paramobjdata2.ucharparam;
 			arraylen = paramobjdata1.pybuffer.len;
 			validparamlength = (arraylen == paramobjdata3.pybuffer.len);
 			break;
 		}
 		case param_num_arr_none : {
-			outputmutable = isbytearrayobjtype(dataobj2);
+			outputmutable = iswritableseq(&paramobjdata2);
 			parampy = paramobjdata1.ucharparam;
 			arraylen = paramobjdata2.pybuffer.len;
 			validparamlength = 1;
 			break;
 		}
 		case param_num_arr_arr : {
-			outputmutable = isbytearrayobjtype(dataobj3);
+			outputmutable = iswritableseq(&paramobjdata3);
 			parampy = paramobjdata1.ucharparam;
 			arraylen = paramobjdata2.pybuffer.len;
 			validparamlength = (arraylen == paramobjdata3.pybuffer.len);
 			break;
 		}
 		case param_arr_arr_none : {
-			outputmutable = isbytearrayobjtype(dataobj1);
+			outputmutable = iswritableseq(&paramobjdata1);
 			arraylen = paramobjdata1.pybuffer.len;
 			validparamlength = (arraylen == paramobjdata2.pybuffer.len);
 			break;
 		}
 		case param_arr_arr_arr : {
-			outputmutable = isbytearrayobjtype(dataobj3);
+			outputmutable = iswritableseq(&paramobjdata3);
 			arraylen = paramobjdata1.pybuffer.len;
 			validparamlength = ((arraylen == paramobjdata2.pybuffer.len) && (arraylen == paramobjdata3.pybuffer.len));
 			break;
 		}
+		// Both parameters are numbers, so the output is the mask.
+		case param_num_num_none : {
+			outputmutable = iswritableseq(maskdata);
+			parampy = paramobjdata1.ucharparam;
+			bytesdata.param2 = paramobjdata2.ucharparam;
+			arraylen = maskdata->pybuffer.len;
+			validparamlength = 1;
+			break;
+		}
+		case param_num_num_arr : {
+			outputmutable = iswritableseq(&paramobjdata3);
+			parampy = paramobjdata1.ucharparam;
+			bytesdata.param2 = paramobjdata2.ucharparam;
+			arraylen = maskdata->pybuffer.len;
+			validparamlength = (arraylen == paramobjdata3.pybuffer.len);
+			break;
+		}
 		// The parameter pattern is invalid.
 		default : {
 			ErrMsgParameterError();
@@ -283,8 +348,9 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 		}
 	}
 
-	// If the output is not mutable, signal the error.
-	if (!outputmutable) {
+	// If the output is not mutable, signal the error. This does not apply
+	// if a new output sequence is to be created.
+	if (!outputmutable && (outtype == outtype_none)) {
 		ErrMsgOutputNotMutableParam();
 		bytesdata.errorcode = 7;
 		releasebuffers_two(bytesdata);
@@ -292,7 +358,10 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 	}
 
 
-	// All sequences must be the same length.
+	// All sequences must be the same length, including the mask.
+	if ((maskdata != NULL) && (maskdata->pybuffer.len != arraylen)) {
+		validparamlength = 0;
+	}
 	if (!validparamlength) {
 		ErrMsgArrayLengthMismatch();
 		bytesdata.errorcode = 8;
@@ -300,11 +369,37 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 		return bytesdata;
 	}
 
+	// Get the number of threads to use.
+	threads = getthreadcount(threads);
+	if (threads < 0) {
+		bytesdata.errorcode = 9;
+		releasebuffers_two(bytesdata);
+		return bytesdata;
+	}
+
+
+
+	// Select the part of the sequence to work on.
+	if (getseqwindow(argobjs[6], argobjs[7], &arraylen, &startpos)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 10;
+		releasebuffers_two(bytesdata);
+		return bytesdata;
+	}
+	offsetseqdata(&paramobjdata1, startpos);
+	offsetseqdata(&paramobjdata2, startpos);
+	if (hasoutputseq) {
+		offsetseqdata(&paramobjdata3, startpos);
+	}
+	if (maskdata != NULL) {
+		offsetseqdata(maskdata, startpos);
+	}
 
 
 	// Collect the parameter data for return to the calling function.
 	bytesdata.errorcode = 0;
 	bytesdata.nosimd = nosimd;
+	bytesdata.threads = threads;
 	bytesdata.paramcat = paramcat;
 	bytesdata.arraylen = adjustbytesmaxlen(arraylen, bytesmaxlen);
 	bytesdata.bytes1.buf = paramobjdata1.byteseq.buf;
@@ -317,6 +412,167 @@ struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *key
 	bytesdata.paramcat = paramcat;
 
 
+	// Create a new output sequence if one was requested. The results are
+	// written to this in place of the input. It is the same length as the
+	// part of the input which is used.
+	if (outtype != outtype_none) {
+		bytesdata.outobj = newoutputseq(outtype, bytesdata.arraylen, &bytesdata.bytes3.B);
+		if (bytesdata.outobj == NULL) {
+			bytesdata.errorcode = 11;
+			releasebuffers_two(bytesdata);
+			return bytesdata;
+		}
+
+		switch (paramcat) {
+			case param_arr_num_none : {
+				bytesdata.paramcat = param_arr_num_arr;
+				break;
+			}
+			case param_num_arr_none : {
+				bytesdata.paramcat = param_num_arr_arr;
+				break;
+			}
+			case param_arr_arr_none : {
+				bytesdata.paramcat = param_arr_arr_arr;
+				break;
+			}
+			case param_num_num_none : {
+				bytesdata.paramcat = param_num_num_arr;
+				break;
+			}
+			default : {
+				break;
+			}
+		}
+	}
+
+
+	return bytesdata;
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Get the parameters passed from Python with a function which takes one input 
+ * 		array and one input value, or two input arrays, plus an optional
+ * 		output array.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
+ * Returns: A structure which contains the parameter data.
+*/
+struct args_params_2 getparams_two(PyObject *self, BF_ARGSDECL) {
+
+	// This is used to return an error.
+	struct args_params_2 bytesdata = ARGSINIT_TWO;
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_2wsimdwomath, 2, 5, argobjs)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 2;
+		return bytesdata;
+	}
+
+	return parseparams_two(argobjs, NULL);
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The same as getparams_two, but for functions which take a compare operator
+ * 		before the other parameters.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
+ * Returns: A structure which contains the parameter data.
+*/
+struct args_params_2 getparams_two_op(PyObject *self, BF_ARGSDECL) {
+
+	// This is used to return the parsed parameters.
+	struct args_params_2 bytesdata = ARGSINIT_TWO;
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	signed int opcode;
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_2op, 3, 6, argobjs)
+			|| !PyUnicode_Check(argobjs[0])) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
+
+	// Convert the command string to an integer.
+	opcode = opstrdecode(argobjs[0]);
+	if (opcode < 0) {
+		ErrMsgOperatorNotValidforthisFunction();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
+
+	// The remaining parameters are in the order used by getparams_two.
+	bytesdata = parseparams_two(&argobjs[1], NULL);
+	bytesdata.opcode = opcode;
+
 	return bytesdata;
 
 }
+
+/*--------------------------------------------------------------------------- */
+
+/* The same as getparams_two, but for functions which take a mask sequence
+ * 		before the other parameters.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
+ * Returns: A structure which contains the parameter data.
+*/
+struct args_params_2 getparams_two_mask(PyObject *self, BF_ARGSDECL) {
+
+	// This is used to return the parsed parameters.
+	struct args_params_2 bytesdata = ARGSINIT_TWO;
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	struct paramsdata maskdata;
+	bool hasbuffermask = false;
+	bool paramoverflow = false;
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist_2mask, 3, 6, argobjs)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
+
+	// The mask must be a sequence.
+	if (get_paramdata(argobjs[0], &maskdata, &hasbuffermask, &paramoverflow)
+			|| !isseqobjtype(maskdata.paramtype)) {
+		// An integer which is out of range sets hasbuffermask without a buffer.
+		if (hasbuffermask && isseqobjtype(maskdata.paramtype)) {
+			PyBuffer_Release(&maskdata.pybuffer);
+		}
+		ErrMsgParameterError();
+		bytesdata.errorcode = 1;
+		return bytesdata;
+	}
+
+	// The remaining parameters are in the order used by getparams_two.
+	bytesdata = parseparams_two(&argobjs[1], &maskdata);
+	if (bytesdata.errorcode) {
+		PyBuffer_Release(&maskdata.pybuffer);
+		return bytesdata;
+	}
+
+	bytesdata.hasbuffermask = hasbuffermask;
+	bytesdata.bytesmask.buf = maskdata.byteseq.buf;
+	bytesdata.pybuffermask = maskdata.pybuffer;
+
+	return bytesdata;
+
+}
+
+/*--------------------------------------------------------------------------- */
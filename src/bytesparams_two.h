@@ -29,7 +29,7 @@
 
 /*--------------------------------------------------------------------------- */
 
-#define ARGSINIT_TWO {0, 0, 0, 0, 0, 0, 0, 0, {NULL}, {NULL}, {NULL}, {NULL}, {NULL}, {NULL}}
+#define ARGSINIT_TWO {0, 0, 0, 0, 0, 0, 0, 0, 0, {NULL}, {NULL}, {NULL}, {NULL}, {NULL}, {NULL}, NULL, 0, 0, {NULL}, {NULL}, 0}
 
 
 enum paramcats
@@ -39,7 +39,10 @@ enum paramcats
 	param_num_arr_none,
 	param_num_arr_arr,
 	param_arr_arr_none,
-	param_arr_arr_arr
+	param_arr_arr_arr,
+	// These are only used with a mask, which gives the length.
+	param_num_num_none,
+	param_num_num_arr
 };
 
 
@@ -51,6 +54,7 @@ struct args_params_2 {
 	bool hasbuffer2;
 	bool hasbuffer3;
 	int nosimd;
+	int threads;
 	Py_ssize_t arraylen;
 	unsigned char param;
 	union dataseq bytes1;
@@ -59,12 +63,26 @@ struct args_params_2 {
 	Py_buffer pybuffer1;
 	Py_buffer pybuffer2;
 	Py_buffer pybuffer3;
+	// A new output sequence created to hold the results, or NULL.
+	PyObject *outobj;
+	// The compare operator, for functions which take one.
+	signed int opcode;
+	// The mask sequence, for functions which take one.
+	bool hasbuffermask;
+	union dataseq bytesmask;
+	Py_buffer pybuffermask;
+	// The second numeric parameter, when both parameters are numbers.
+	unsigned char param2;
 };
 
 
 /*--------------------------------------------------------------------------- */
 
-struct args_params_2 getparams_two(PyObject *self, PyObject *args, PyObject *keywds, char *funcname);
+struct args_params_2 getparams_two(PyObject *self, BF_ARGSDECL);
+
+struct args_params_2 getparams_two_op(PyObject *self, BF_ARGSDECL);
+
+struct args_params_2 getparams_two_mask(PyObject *self, BF_ARGSDECL);
 
 void releasebuffers_two(struct args_params_2 arraydata);
 
@@ -32,6 +32,7 @@
 #include "byteserrs.h"
 #include "bytesparams_base.h"
 #include "bytesparams_valoutsimd.h"
+#include "bytesthreads.h"
 
 /*--------------------------------------------------------------------------- */
 
@@ -39,7 +40,7 @@
 
 // The list of keyword arguments. All argument must be listed, whether we 
 // intend to use them for keywords or not. 
-static char *kwlist[] = {"data", "maxlen", "nosimd", NULL};
+static char *kwlist[] = {"data", "maxlen", "nosimd", "threads", "start", "stop", "step", NULL};
 
 
 /*--------------------------------------------------------------------------- */
@@ -62,30 +63,39 @@ void releasebuffers_valoutsimd(struct args_params_valoutsimd bytesdata) {
 /*--------------------------------------------------------------------------- */
 
 /* Get the parameters passed from Python with a function which takes one sequence.
- * self, args, keywds = The parameters of the same name passed from the PyObject
- * 		function which forms the original entry point.
- * funcname = A string which represents the C extension name. This is passed to
- * 		PyArg_ParseTupleAndKeywords for error reporting.
+ * self, BF_ARGSDECL = The parameters passed from the PyObject function which
+ * 		forms the original entry point.
  * Returns: A structure which contains the parameter data.
 */
-struct args_params_valoutsimd getparams_valoutsimd(PyObject *self, PyObject *args, PyObject *keywds, char *funcname) {
+struct args_params_valoutsimd getparams_valoutsimd(PyObject *self, BF_ARGSDECL) {
 
 
 	// This is used to return the parsed parameters.
 	struct args_params_valoutsimd bytesdata = ARGSINIT_VALOUTSIMD;
 
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
 	PyObject *dataobj1 = NULL;
 
 	struct paramsdata paramobjdata1;
 
 	// Number of elements to work on. If zero or less, ignore this parameter.
 	Py_ssize_t bytesmaxlen = 0;
+
+	// The start of the part of the sequence to work on.
+	Py_ssize_t startpos = 0;
+
+	// Only every step'th element is used.
+	Py_ssize_t step = 1;
 	Py_ssize_t arraylen;
 
 	// If True, SIMD processing is disabled.
 	int nosimd = 0;
 
-	char formatstr[FMTSTRLEN];
+	// The number of threads to use. If zero, use the default.
+	int threads = 0;
+
 
 	bool paramoverflow = false;
 
@@ -94,18 +104,18 @@ struct args_params_valoutsimd getparams_valoutsimd(PyObject *self, PyObject *arg
 
 	// This section determines the type of the bytes or bytearray object.
 
-	// Construct the format string. This is constructed dynamically because
-	// we must be able to call this same function from different C extensions.
-	makefmtstr("O|ni:", funcname, formatstr);
-
-	// Import the raw objects. 
-	if (!PyArg_ParseTupleAndKeywords(args, keywds, formatstr, kwlist, &dataobj1, 
-							&bytesmaxlen, &nosimd)) {
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist, 1, 3, argobjs)
+			|| getssizearg(argobjs[1], &bytesmaxlen)
+			|| getintarg(argobjs[2], &nosimd)
+			|| getintarg(argobjs[3], &threads)) {
 		ErrMsgParameterError();
 		bytesdata.errorcode = 1;
 		return bytesdata;
 	}
 
+	dataobj1 = argobjs[0];
+
 	// Parse the first object parameter. 
 	if (get_paramdata(dataobj1, &paramobjdata1, &bytesdata.hasbuffer1, &paramoverflow)) {
 		ErrMsgParameterError();
@@ -113,24 +123,55 @@ struct args_params_valoutsimd getparams_valoutsimd(PyObject *self, PyObject *arg
 		releasebuffers_valoutsimd(bytesdata);
 		return bytesdata;
 	}
+	// Keep the buffer so that it can be released if a later step fails.
+	bytesdata.pybuffer1 = paramobjdata1.pybuffer;
 
 
 	// The first parameter must be an bytes or bytearray.
-	if ((paramobjdata1.paramtype != paramobj_bytes) && (paramobjdata1.paramtype != paramobj_bytearray)) {
+	if ((paramobjdata1.paramtype != paramobj_readonly) && (paramobjdata1.paramtype != paramobj_writable)) {
 		ErrMsgParameterError();
 		bytesdata.errorcode = 3;
 		releasebuffers_valoutsimd(bytesdata);
 		return bytesdata;
 	}
 
+	// Get the number of threads to use.
+	threads = getthreadcount(threads);
+	if (threads < 0) {
+		bytesdata.errorcode = 4;
+		releasebuffers_valoutsimd(bytesdata);
+		return bytesdata;
+	}
+
+
 	// Get the raw bytes or bytesarray length.
 	arraylen = paramobjdata1.pybuffer.len;
 
 
+	// Select the part of the sequence to work on.
+	if (getseqwindow(argobjs[4], argobjs[5], &arraylen, &startpos)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 5;
+		releasebuffers_valoutsimd(bytesdata);
+		return bytesdata;
+	}
+	offsetseqdata(&paramobjdata1, startpos);
+
+	// Get the step between the elements which are used.
+	if (getseqstep(argobjs[6], &step)) {
+		ErrMsgParameterError();
+		bytesdata.errorcode = 6;
+		releasebuffers_valoutsimd(bytesdata);
+		return bytesdata;
+	}
+
+
 	// Collect the parameter data for return to the calling function.
 	bytesdata.errorcode = 0;
 	bytesdata.nosimd = nosimd;
+	bytesdata.threads = threads;
 	bytesdata.arraylen = adjustbytesmaxlen(arraylen, bytesmaxlen);
+	bytesdata.step = step;
 	bytesdata.bytes1.buf = paramobjdata1.byteseq.buf;
 	bytesdata.pybuffer1 = paramobjdata1.pybuffer;
 
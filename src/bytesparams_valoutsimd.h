@@ -30,21 +30,23 @@
 
 /*--------------------------------------------------------------------------- */
 
-#define ARGSINIT_VALOUTSIMD {0, 0, 0, 0, {NULL}, {NULL}}
+#define ARGSINIT_VALOUTSIMD {0, 0, 0, 0, 0, {NULL}, {NULL}, 1}
 
 // Provide a struct for returning data from parsing Python arguments.
 struct args_params_valoutsimd {
 	int errorcode;
 	bool hasbuffer1;
 	int nosimd;
+	int threads;
 	Py_ssize_t arraylen;
 	union dataseq bytes1;
 	Py_buffer pybuffer1;
+	Py_ssize_t step;
 };
 
 /*--------------------------------------------------------------------------- */
 
-struct args_params_valoutsimd getparams_valoutsimd(PyObject *self, PyObject *args, PyObject *keywds, char *funcname);
+struct args_params_valoutsimd getparams_valoutsimd(PyObject *self, BF_ARGSDECL);
 
 void releasebuffers_valoutsimd(struct args_params_valoutsimd seqdata);
 
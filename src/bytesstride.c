@@ -0,0 +1,2279 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   bytesstride.c
+// Purpose:  Calculations which use only every step'th element of a sequence.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+/* This is linked into each C extension which accepts the "step" parameter.
+	These are used in place of the normal calculation functions when the
+	step is greater than one, for example to work on one channel of
+	interleaved data.
+
+	The SIMD versions load whole SIMD vectors in the normal way, and then
+	use a mask to select the elements which are used. The pattern of
+	elements which are used repeats every STRIDE_SIMDPERIOD vectors for
+	the steps which have SIMD versions, so the masks are calculated once
+	for each call. The reductions do not need the mask inside the loop at
+	all, as the elements which are not used are discarded when the SIMD
+	vectors are combined at the end.
+
+	The search for every matching element (stridefindall_select) and the
+	count of matching elements (stridecountif_select) are also used when
+	the step is one, as the same masked comparisons select the matching
+	elements in each SIMD vector. So is the combined minimum, maximum, and
+	sum (stridestats_select), which reads each SIMD vector once for all
+	three.
+
+	Only x86-64 has SIMD versions of these. Other platforms use the non-SIMD
+	versions.
+*/
+
+/*--------------------------------------------------------------------------- */
+
+#include "Python.h"
+
+#include "byteserrs.h"
+#include "arrayops.h"
+
+#include "simddefs.h"
+
+#include "bytesstride.h"
+
+/*--------------------------------------------------------------------------- */
+
+// The value to compare to. This is either the corresponding element in a
+// second sequence, or a single parameter if there is no second sequence.
+#define stridevalue(data2, x, param) (((data2) != NULL) ? (data2)[x] : (param))
+
+/*--------------------------------------------------------------------------- */
+
+/* Return the operator which is true when the given operator is false.
+   opcode = The operator code.
+   Returns the inverse operator code, or -1 if the operator is not valid.
+*/
+int stridenegateop(int opcode) {
+
+	switch (opcode) {
+		case OP_AF_EQ: { return OP_AF_NE; }
+		case OP_AF_GT: { return OP_AF_LE; }
+		case OP_AF_GE: { return OP_AF_LT; }
+		case OP_AF_LT: { return OP_AF_GE; }
+		case OP_AF_LE: { return OP_AF_GT; }
+		case OP_AF_NE: { return OP_AF_EQ; }
+		default: { return -1; }
+	}
+
+}
+
+
+/* Return the operator which gives the same result when the values being
+   compared are swapped. This is used when the parameter comes before the
+   sequence.
+   opcode = The operator code.
+   Returns the swapped operator code, or -1 if the operator is not valid.
+*/
+int strideswapop(int opcode) {
+
+	switch (opcode) {
+		case OP_AF_EQ: { return OP_AF_EQ; }
+		case OP_AF_GT: { return OP_AF_LT; }
+		case OP_AF_GE: { return OP_AF_LE; }
+		case OP_AF_LT: { return OP_AF_GT; }
+		case OP_AF_LE: { return OP_AF_GE; }
+		case OP_AF_NE: { return OP_AF_NE; }
+		default: { return -1; }
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Non-SIMD versions.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   Returns: The maximum, minimum, or sum of the elements used.
+*/
+static unsigned char stridemax(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x;
+	unsigned char maxfound = 0;
+
+	for (x = 0; x < arraylen; x += step) {
+		if (data[x] > maxfound) {
+			maxfound = data[x];
+		}
+	}
+
+	return maxfound;
+}
+
+
+static unsigned char stridemin(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x;
+	unsigned char minfound = UCHAR_MAX;
+
+	for (x = 0; x < arraylen; x += step) {
+		if (data[x] < minfound) {
+			minfound = data[x];
+		}
+	}
+
+	return minfound;
+}
+
+
+static unsigned long long stridesum(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x;
+	unsigned long long partialsum = 0;
+
+	for (x = 0; x < arraylen; x += step) {
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	return partialsum;
+}
+
+
+/* Non-SIMD version.
+   opcode = The comparison operator.
+   arraylen = The length of the data arrays.
+   step = The step between the elements which are used.
+   data1 = The input data array.
+   data2 = The second input data array, or NULL if param is to be used.
+   param = The parameter to compare to if there is no second array.
+   Returns the array index of the first element for which the comparison
+		is true, ARR_ERR_NOTFOUND if there is none, or ARR_ERR_INVALIDOP if
+		the operator is not valid.
+*/
+static Py_ssize_t stridefind(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data1, unsigned char *data2, unsigned char param) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	switch (opcode) {
+		case OP_AF_EQ: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data1[x] == stridevalue(data2, x, param)) { return x; }
+			}
+			break;
+		}
+		case OP_AF_GT: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data1[x] > stridevalue(data2, x, param)) { return x; }
+			}
+			break;
+		}
+		case OP_AF_GE: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data1[x] >= stridevalue(data2, x, param)) { return x; }
+			}
+			break;
+		}
+		case OP_AF_LT: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data1[x] < stridevalue(data2, x, param)) { return x; }
+			}
+			break;
+		}
+		case OP_AF_LE: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data1[x] <= stridevalue(data2, x, param)) { return x; }
+			}
+			break;
+		}
+		case OP_AF_NE: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data1[x] != stridevalue(data2, x, param)) { return x; }
+			}
+			break;
+		}
+		default: {
+			return ARR_ERR_INVALIDOP;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Non-SIMD version.
+   opcode = The comparison operator. This must be valid.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   param = The parameter to compare to.
+   offset = This is added to each index which is recorded.
+   results = Receives the index of every element for which the comparison
+		is true. This must have room for one index for each element used.
+   Returns the number of indexes recorded.
+*/
+static Py_ssize_t stridefindall(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data, unsigned char param, Py_ssize_t offset, long long *results) {
+
+	// array index counter.
+	Py_ssize_t x;
+	Py_ssize_t nfound = 0;
+
+	switch (opcode) {
+		case OP_AF_EQ: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data[x] == param) { results[nfound++] = offset + x; }
+			}
+			break;
+		}
+		case OP_AF_GT: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data[x] > param) { results[nfound++] = offset + x; }
+			}
+			break;
+		}
+		case OP_AF_GE: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data[x] >= param) { results[nfound++] = offset + x; }
+			}
+			break;
+		}
+		case OP_AF_LT: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data[x] < param) { results[nfound++] = offset + x; }
+			}
+			break;
+		}
+		case OP_AF_LE: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data[x] <= param) { results[nfound++] = offset + x; }
+			}
+			break;
+		}
+		default: {
+			for (x = 0; x < arraylen; x += step) {
+				if (data[x] != param) { results[nfound++] = offset + x; }
+			}
+			break;
+		}
+	}
+
+	return nfound;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Non-SIMD version.
+   opcode = The comparison operator. This must be valid.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   param = The parameter to compare to.
+   Returns the number of elements for which the comparison is true.
+*/
+static Py_ssize_t stridecountif(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data, unsigned char param) {
+
+	// array index counter.
+	Py_ssize_t x;
+	Py_ssize_t count = 0;
+
+	switch (opcode) {
+		case OP_AF_EQ: {
+			for (x = 0; x < arraylen; x += step) {
+				count += (data[x] == param);
+			}
+			break;
+		}
+		case OP_AF_GT: {
+			for (x = 0; x < arraylen; x += step) {
+				count += (data[x] > param);
+			}
+			break;
+		}
+		case OP_AF_GE: {
+			for (x = 0; x < arraylen; x += step) {
+				count += (data[x] >= param);
+			}
+			break;
+		}
+		case OP_AF_LT: {
+			for (x = 0; x < arraylen; x += step) {
+				count += (data[x] < param);
+			}
+			break;
+		}
+		case OP_AF_LE: {
+			for (x = 0; x < arraylen; x += step) {
+				count += (data[x] <= param);
+			}
+			break;
+		}
+		default: {
+			for (x = 0; x < arraylen; x += step) {
+				count += (data[x] != param);
+			}
+			break;
+		}
+	}
+
+	return count;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Non-SIMD version.
+   arraylen = The length of the data array. This must be at least one.
+   step = The step between the elements which are used.
+   data = The input data array.
+   stats = Receives the minimum, maximum, and sum of the elements used.
+   Returns: Nothing.
+*/
+static void stridestats(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data, struct stridestats *stats) {
+
+	// array index counter.
+	Py_ssize_t x;
+	unsigned char minfound = data[0], maxfound = data[0];
+	unsigned long long partialsum = 0;
+
+	for (x = 0; x < arraylen; x += step) {
+		if (data[x] < minfound) {
+			minfound = data[x];
+		}
+		if (data[x] > maxfound) {
+			maxfound = data[x];
+		}
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	stats->minval = minfound;
+	stats->maxval = maxfound;
+	stats->sum = partialsum;
+}
+
+/*--------------------------------------------------------------------------- */
+
+#if defined(AF_HASSIMD_X86)
+
+/*   stridesimdstep
+   Whether there is a SIMD version for this step. The pattern of elements
+   which are used must repeat every STRIDE_SIMDPERIOD vectors. This is the
+   same for every x86 SIMD width.
+*/
+#define stridesimdstep(step) ((step <= STRIDE_SIMDMAXSTEP) && (((STRIDE_SIMDPERIOD * CHARSIMDSIZE) % step) == 0))
+
+
+/* Fill in the byte masks which select the elements which are used. Each
+   byte is 0xff if the element in that position is used, or zero if not.
+   maskvals = The array to fill in.
+   masklen = The length of the array.
+   step = The step between the elements which are used.
+*/
+static void stridemaskvals(unsigned char *maskvals, unsigned int masklen, Py_ssize_t step) {
+
+	unsigned int y;
+
+	for (y = 0; y < masklen; y++) {
+		maskvals[y] = ((y % step) == 0) ? 0xff : 0x00;
+	}
+}
+
+
+/* Calculate the bit mask which selects the elements which are used within
+   one SIMD vector. This has the same layout as the result of a movemask
+   instruction or an AVX-512 compare.
+   offset = The position of the SIMD vector within the repeating pattern.
+   simdwidth = The number of elements in a SIMD vector.
+   step = The step between the elements which are used.
+*/
+static unsigned long long stridemaskbits(unsigned int offset, unsigned int simdwidth, Py_ssize_t step) {
+
+	unsigned int y;
+	unsigned long long maskbits = 0;
+
+	for (y = 0; y < simdwidth; y++) {
+		if (((offset + y) % step) == 0) {
+			maskbits = maskbits | (1ULL << y);
+		}
+	}
+
+	return maskbits;
+}
+
+
+/* SSE2 and AVX2 have only equal, and signed greater than comparisons for
+   bytes. The other unsigned comparisons are made from these and max and
+   min, with the result inverted where necessary.
+   opcode = The comparison operator.
+   invert = Set to true if the result of the comparison must be inverted.
+   Returns: The comparison to perform (OP_AF_EQ, OP_AF_GE, or OP_AF_LE).
+*/
+static int stridebaseop(int opcode, int *invert) {
+
+	*invert = (opcode == OP_AF_NE) || (opcode == OP_AF_LT) || (opcode == OP_AF_GT);
+
+	switch (opcode) {
+		case OP_AF_GE:
+		case OP_AF_LT: {
+			return OP_AF_GE;
+		}
+		case OP_AF_LE:
+		case OP_AF_GT: {
+			return OP_AF_LE;
+		}
+		default: {
+			return OP_AF_EQ;
+		}
+	}
+}
+
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* For x86-64 SIMD.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   Returns: The maximum value found.
+*/
+#if defined(AF_HASSIMD_X86)
+static unsigned char stridemax_x86_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned char maxfound;
+
+	unsigned char maskvals[STRIDE_SIMDPERIOD * CHARSIMDSIZE];
+	unsigned char maxvals[CHARSIMDSIZE];
+	v16qi maxslice0, maxslice1, maxslice2, dataslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE));
+
+	// Zero cannot be greater than any element.
+	maxslice0 = (v16qi) _mm_setzero_si128();
+	maxslice1 = maxslice0;
+	maxslice2 = maxslice0;
+
+	// Use SIMD. Every element is included here.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE) {
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x]);
+		maxslice0 = (v16qi) _mm_max_epu8((__m128i) maxslice0, (__m128i) dataslice);
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x + CHARSIMDSIZE]);
+		maxslice1 = (v16qi) _mm_max_epu8((__m128i) maxslice1, (__m128i) dataslice);
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x + (2 * CHARSIMDSIZE)]);
+		maxslice2 = (v16qi) _mm_max_epu8((__m128i) maxslice2, (__m128i) dataslice);
+	}
+
+	// The elements which are not used are set to zero and then discarded.
+	stridemaskvals(maskvals, STRIDE_SIMDPERIOD * CHARSIMDSIZE, step);
+	maxslice0 = (v16qi) _mm_and_si128((__m128i) maxslice0, _mm_loadu_si128((__m128i *) &maskvals[0]));
+	maxslice1 = (v16qi) _mm_and_si128((__m128i) maxslice1, _mm_loadu_si128((__m128i *) &maskvals[CHARSIMDSIZE]));
+	maxslice2 = (v16qi) _mm_and_si128((__m128i) maxslice2, _mm_loadu_si128((__m128i *) &maskvals[2 * CHARSIMDSIZE]));
+	maxslice0 = (v16qi) _mm_max_epu8((__m128i) maxslice0, (__m128i) maxslice1);
+	maxslice0 = (v16qi) _mm_max_epu8((__m128i) maxslice0, (__m128i) maxslice2);
+
+	// Find the max within the slice.
+	_mm_storeu_si128((__m128i *) maxvals, (__m128i) maxslice0);
+	maxfound = maxvals[0];
+	for (y = 1; y < CHARSIMDSIZE; y++) {
+		if (maxvals[y] > maxfound) {
+			maxfound = maxvals[y];
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		if (data[x] > maxfound) {
+			maxfound = data[x];
+		}
+	}
+
+	return maxfound;
+}
+#endif
+
+
+/* For x86-64 AVX2 SIMD.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   Returns: The maximum value found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static unsigned char stridemax_avx2_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned char maxfound;
+
+	unsigned char maskvals[STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2];
+	unsigned char maxvals[CHARSIMDSIZE_AVX2];
+	v32qi maxslice0, maxslice1, maxslice2, dataslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2));
+
+	// Zero cannot be greater than any element.
+	maxslice0 = (v32qi) _mm256_setzero_si256();
+	maxslice1 = maxslice0;
+	maxslice2 = maxslice0;
+
+	// Use SIMD. Every element is included here.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2) {
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x]);
+		maxslice0 = (v32qi) _mm256_max_epu8((__m256i) maxslice0, (__m256i) dataslice);
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x + CHARSIMDSIZE_AVX2]);
+		maxslice1 = (v32qi) _mm256_max_epu8((__m256i) maxslice1, (__m256i) dataslice);
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x + (2 * CHARSIMDSIZE_AVX2)]);
+		maxslice2 = (v32qi) _mm256_max_epu8((__m256i) maxslice2, (__m256i) dataslice);
+	}
+
+	// The elements which are not used are set to zero and then discarded.
+	stridemaskvals(maskvals, STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2, step);
+	maxslice0 = (v32qi) _mm256_and_si256((__m256i) maxslice0, _mm256_loadu_si256((__m256i *) &maskvals[0]));
+	maxslice1 = (v32qi) _mm256_and_si256((__m256i) maxslice1, _mm256_loadu_si256((__m256i *) &maskvals[CHARSIMDSIZE_AVX2]));
+	maxslice2 = (v32qi) _mm256_and_si256((__m256i) maxslice2, _mm256_loadu_si256((__m256i *) &maskvals[2 * CHARSIMDSIZE_AVX2]));
+	maxslice0 = (v32qi) _mm256_max_epu8((__m256i) maxslice0, (__m256i) maxslice1);
+	maxslice0 = (v32qi) _mm256_max_epu8((__m256i) maxslice0, (__m256i) maxslice2);
+
+	// Find the max within the slice.
+	_mm256_storeu_si256((__m256i *) maxvals, (__m256i) maxslice0);
+	maxfound = maxvals[0];
+	for (y = 1; y < CHARSIMDSIZE_AVX2; y++) {
+		if (maxvals[y] > maxfound) {
+			maxfound = maxvals[y];
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		if (data[x] > maxfound) {
+			maxfound = data[x];
+		}
+	}
+
+	return maxfound;
+}
+#endif
+
+
+/* For x86-64 AVX-512BW SIMD.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   Returns: The maximum value found.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW static unsigned char stridemax_avx512_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned char maxfound;
+
+	unsigned char maxvals[CHARSIMDSIZE_AVX512];
+	v64qi maxslice0, maxslice1, maxslice2, dataslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512));
+
+	// Zero cannot be greater than any element.
+	maxslice0 = (v64qi) _mm512_setzero_si512();
+	maxslice1 = maxslice0;
+	maxslice2 = maxslice0;
+
+	// Use SIMD. Every element is included here.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512) {
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x]);
+		maxslice0 = (v64qi) _mm512_max_epu8((__m512i) maxslice0, (__m512i) dataslice);
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x + CHARSIMDSIZE_AVX512]);
+		maxslice1 = (v64qi) _mm512_max_epu8((__m512i) maxslice1, (__m512i) dataslice);
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x + (2 * CHARSIMDSIZE_AVX512)]);
+		maxslice2 = (v64qi) _mm512_max_epu8((__m512i) maxslice2, (__m512i) dataslice);
+	}
+
+	// The elements which are not used are set to zero and then discarded.
+	maxslice0 = (v64qi) _mm512_maskz_mov_epi8(stridemaskbits(0, CHARSIMDSIZE_AVX512, step), (__m512i) maxslice0);
+	maxslice1 = (v64qi) _mm512_maskz_mov_epi8(stridemaskbits(CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step), (__m512i) maxslice1);
+	maxslice2 = (v64qi) _mm512_maskz_mov_epi8(stridemaskbits(2 * CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step), (__m512i) maxslice2);
+	maxslice0 = (v64qi) _mm512_max_epu8((__m512i) maxslice0, (__m512i) maxslice1);
+	maxslice0 = (v64qi) _mm512_max_epu8((__m512i) maxslice0, (__m512i) maxslice2);
+
+	// Find the max within the slice.
+	_mm512_storeu_si512(maxvals, (__m512i) maxslice0);
+	maxfound = maxvals[0];
+	for (y = 1; y < CHARSIMDSIZE_AVX512; y++) {
+		if (maxvals[y] > maxfound) {
+			maxfound = maxvals[y];
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		if (data[x] > maxfound) {
+			maxfound = data[x];
+		}
+	}
+
+	return maxfound;
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* For x86-64 SIMD.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   Returns: The minimum value found.
+*/
+#if defined(AF_HASSIMD_X86)
+static unsigned char stridemin_x86_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned char minfound;
+
+	unsigned char maskvals[STRIDE_SIMDPERIOD * CHARSIMDSIZE];
+	unsigned char minvals[CHARSIMDSIZE];
+	v16qi minslice0, minslice1, minslice2, dataslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE));
+
+	// No element can be less than all bits set.
+	minslice0 = (v16qi) _mm_set1_epi8((char) UCHAR_MAX);
+	minslice1 = minslice0;
+	minslice2 = minslice0;
+
+	// Use SIMD. Every element is included here.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE) {
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x]);
+		minslice0 = (v16qi) _mm_min_epu8((__m128i) minslice0, (__m128i) dataslice);
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x + CHARSIMDSIZE]);
+		minslice1 = (v16qi) _mm_min_epu8((__m128i) minslice1, (__m128i) dataslice);
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x + (2 * CHARSIMDSIZE)]);
+		minslice2 = (v16qi) _mm_min_epu8((__m128i) minslice2, (__m128i) dataslice);
+	}
+
+	// The elements which are not used have all bits set and then are discarded.
+	stridemaskvals(maskvals, STRIDE_SIMDPERIOD * CHARSIMDSIZE, step);
+	minslice0 = (v16qi) _mm_or_si128((__m128i) minslice0, _mm_andnot_si128(_mm_loadu_si128((__m128i *) &maskvals[0]), _mm_set1_epi8((char) UCHAR_MAX)));
+	minslice1 = (v16qi) _mm_or_si128((__m128i) minslice1, _mm_andnot_si128(_mm_loadu_si128((__m128i *) &maskvals[CHARSIMDSIZE]), _mm_set1_epi8((char) UCHAR_MAX)));
+	minslice2 = (v16qi) _mm_or_si128((__m128i) minslice2, _mm_andnot_si128(_mm_loadu_si128((__m128i *) &maskvals[2 * CHARSIMDSIZE]), _mm_set1_epi8((char) UCHAR_MAX)));
+	minslice0 = (v16qi) _mm_min_epu8((__m128i) minslice0, (__m128i) minslice1);
+	minslice0 = (v16qi) _mm_min_epu8((__m128i) minslice0, (__m128i) minslice2);
+
+	// Find the min within the slice.
+	_mm_storeu_si128((__m128i *) minvals, (__m128i) minslice0);
+	minfound = minvals[0];
+	for (y = 1; y < CHARSIMDSIZE; y++) {
+		if (minvals[y] < minfound) {
+			minfound = minvals[y];
+		}
+	}
+
+	// Get the min value within the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		if (data[x] < minfound) {
+			minfound = data[x];
+		}
+	}
+
+	return minfound;
+}
+#endif
+
+
+/* For x86-64 AVX2 SIMD.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   Returns: The minimum value found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static unsigned char stridemin_avx2_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned char minfound;
+
+	unsigned char maskvals[STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2];
+	unsigned char minvals[CHARSIMDSIZE_AVX2];
+	v32qi minslice0, minslice1, minslice2, dataslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2));
+
+	// No element can be less than all bits set.
+	minslice0 = (v32qi) _mm256_set1_epi8((char) UCHAR_MAX);
+	minslice1 = minslice0;
+	minslice2 = minslice0;
+
+	// Use SIMD. Every element is included here.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2) {
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x]);
+		minslice0 = (v32qi) _mm256_min_epu8((__m256i) minslice0, (__m256i) dataslice);
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x + CHARSIMDSIZE_AVX2]);
+		minslice1 = (v32qi) _mm256_min_epu8((__m256i) minslice1, (__m256i) dataslice);
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x + (2 * CHARSIMDSIZE_AVX2)]);
+		minslice2 = (v32qi) _mm256_min_epu8((__m256i) minslice2, (__m256i) dataslice);
+	}
+
+	// The elements which are not used have all bits set and then are discarded.
+	stridemaskvals(maskvals, STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2, step);
+	minslice0 = (v32qi) _mm256_or_si256((__m256i) minslice0, _mm256_andnot_si256(_mm256_loadu_si256((__m256i *) &maskvals[0]), _mm256_set1_epi8((char) UCHAR_MAX)));
+	minslice1 = (v32qi) _mm256_or_si256((__m256i) minslice1, _mm256_andnot_si256(_mm256_loadu_si256((__m256i *) &maskvals[CHARSIMDSIZE_AVX2]), _mm256_set1_epi8((char) UCHAR_MAX)));
+	minslice2 = (v32qi) _mm256_or_si256((__m256i) minslice2, _mm256_andnot_si256(_mm256_loadu_si256((__m256i *) &maskvals[2 * CHARSIMDSIZE_AVX2]), _mm256_set1_epi8((char) UCHAR_MAX)));
+	minslice0 = (v32qi) _mm256_min_epu8((__m256i) minslice0, (__m256i) minslice1);
+	minslice0 = (v32qi) _mm256_min_epu8((__m256i) minslice0, (__m256i) minslice2);
+
+	// Find the min within the slice.
+	_mm256_storeu_si256((__m256i *) minvals, (__m256i) minslice0);
+	minfound = minvals[0];
+	for (y = 1; y < CHARSIMDSIZE_AVX2; y++) {
+		if (minvals[y] < minfound) {
+			minfound = minvals[y];
+		}
+	}
+
+	// Get the min value within the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		if (data[x] < minfound) {
+			minfound = data[x];
+		}
+	}
+
+	return minfound;
+}
+#endif
+
+
+/* For x86-64 AVX-512BW SIMD.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   Returns: The minimum value found.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW static unsigned char stridemin_avx512_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned char minfound;
+
+	unsigned char minvals[CHARSIMDSIZE_AVX512];
+	v64qi minslice0, minslice1, minslice2, dataslice, fillslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512));
+
+	// No element can be less than all bits set.
+	fillslice = (v64qi) _mm512_set1_epi8((char) UCHAR_MAX);
+	minslice0 = fillslice;
+	minslice1 = fillslice;
+	minslice2 = fillslice;
+
+	// Use SIMD. Every element is included here.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512) {
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x]);
+		minslice0 = (v64qi) _mm512_min_epu8((__m512i) minslice0, (__m512i) dataslice);
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x + CHARSIMDSIZE_AVX512]);
+		minslice1 = (v64qi) _mm512_min_epu8((__m512i) minslice1, (__m512i) dataslice);
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x + (2 * CHARSIMDSIZE_AVX512)]);
+		minslice2 = (v64qi) _mm512_min_epu8((__m512i) minslice2, (__m512i) dataslice);
+	}
+
+	// The elements which are not used have all bits set and then are discarded.
+	minslice0 = (v64qi) _mm512_mask_mov_epi8((__m512i) fillslice, stridemaskbits(0, CHARSIMDSIZE_AVX512, step), (__m512i) minslice0);
+	minslice1 = (v64qi) _mm512_mask_mov_epi8((__m512i) fillslice, stridemaskbits(CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step), (__m512i) minslice1);
+	minslice2 = (v64qi) _mm512_mask_mov_epi8((__m512i) fillslice, stridemaskbits(2 * CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step), (__m512i) minslice2);
+	minslice0 = (v64qi) _mm512_min_epu8((__m512i) minslice0, (__m512i) minslice1);
+	minslice0 = (v64qi) _mm512_min_epu8((__m512i) minslice0, (__m512i) minslice2);
+
+	// Find the min within the slice.
+	_mm512_storeu_si512(minvals, (__m512i) minslice0);
+	minfound = minvals[0];
+	for (y = 1; y < CHARSIMDSIZE_AVX512; y++) {
+		if (minvals[y] < minfound) {
+			minfound = minvals[y];
+		}
+	}
+
+	// Get the min value within the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		if (data[x] < minfound) {
+			minfound = data[x];
+		}
+	}
+
+	return minfound;
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* For x86-64 SIMD. The elements which are not used are set to zero, and
+   then groups of 8 bytes are added together using psadbw (sum of absolute
+   differences from zero), which gives 64 bit sums.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   Returns: The sum of the elements used.
+*/
+#if defined(AF_HASSIMD_X86)
+static unsigned long long stridesum_x86_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned long long partialsum = 0;
+
+	unsigned char maskvals[STRIDE_SIMDPERIOD * CHARSIMDSIZE];
+	unsigned long long sumvals[CHARSIMDSIZE / 8];
+	v16qi maskslice0, maskslice1, maskslice2, dataslice, zeroslice;
+	v2di sumslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE));
+
+	// The masks which select the elements which are used.
+	stridemaskvals(maskvals, STRIDE_SIMDPERIOD * CHARSIMDSIZE, step);
+	maskslice0 = (v16qi) _mm_loadu_si128((__m128i *) &maskvals[0]);
+	maskslice1 = (v16qi) _mm_loadu_si128((__m128i *) &maskvals[CHARSIMDSIZE]);
+	maskslice2 = (v16qi) _mm_loadu_si128((__m128i *) &maskvals[2 * CHARSIMDSIZE]);
+
+	zeroslice = (v16qi) _mm_setzero_si128();
+	sumslice = (v2di) _mm_setzero_si128();
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE) {
+		dataslice = (v16qi) _mm_and_si128(_mm_loadu_si128((__m128i *) &data[x]), (__m128i) maskslice0);
+		sumslice = (v2di) _mm_add_epi64((__m128i) sumslice, _mm_sad_epu8((__m128i) dataslice, (__m128i) zeroslice));
+		dataslice = (v16qi) _mm_and_si128(_mm_loadu_si128((__m128i *) &data[x + CHARSIMDSIZE]), (__m128i) maskslice1);
+		sumslice = (v2di) _mm_add_epi64((__m128i) sumslice, _mm_sad_epu8((__m128i) dataslice, (__m128i) zeroslice));
+		dataslice = (v16qi) _mm_and_si128(_mm_loadu_si128((__m128i *) &data[x + (2 * CHARSIMDSIZE)]), (__m128i) maskslice2);
+		sumslice = (v2di) _mm_add_epi64((__m128i) sumslice, _mm_sad_epu8((__m128i) dataslice, (__m128i) zeroslice));
+	}
+
+	// Add the sums within the slice.
+	_mm_storeu_si128((__m128i *) sumvals, (__m128i) sumslice);
+	for (y = 0; y < (CHARSIMDSIZE / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	// Add the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	return partialsum;
+}
+#endif
+
+
+/* For x86-64 AVX2 SIMD. See the SSE2 version.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   Returns: The sum of the elements used.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static unsigned long long stridesum_avx2_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned long long partialsum = 0;
+
+	unsigned char maskvals[STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2];
+	unsigned long long sumvals[CHARSIMDSIZE_AVX2 / 8];
+	v32qi maskslice0, maskslice1, maskslice2, dataslice, zeroslice;
+	v4di sumslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2));
+
+	// The masks which select the elements which are used.
+	stridemaskvals(maskvals, STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2, step);
+	maskslice0 = (v32qi) _mm256_loadu_si256((__m256i *) &maskvals[0]);
+	maskslice1 = (v32qi) _mm256_loadu_si256((__m256i *) &maskvals[CHARSIMDSIZE_AVX2]);
+	maskslice2 = (v32qi) _mm256_loadu_si256((__m256i *) &maskvals[2 * CHARSIMDSIZE_AVX2]);
+
+	zeroslice = (v32qi) _mm256_setzero_si256();
+	sumslice = (v4di) _mm256_setzero_si256();
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2) {
+		dataslice = (v32qi) _mm256_and_si256(_mm256_loadu_si256((__m256i *) &data[x]), (__m256i) maskslice0);
+		sumslice = (v4di) _mm256_add_epi64((__m256i) sumslice, _mm256_sad_epu8((__m256i) dataslice, (__m256i) zeroslice));
+		dataslice = (v32qi) _mm256_and_si256(_mm256_loadu_si256((__m256i *) &data[x + CHARSIMDSIZE_AVX2]), (__m256i) maskslice1);
+		sumslice = (v4di) _mm256_add_epi64((__m256i) sumslice, _mm256_sad_epu8((__m256i) dataslice, (__m256i) zeroslice));
+		dataslice = (v32qi) _mm256_and_si256(_mm256_loadu_si256((__m256i *) &data[x + (2 * CHARSIMDSIZE_AVX2)]), (__m256i) maskslice2);
+		sumslice = (v4di) _mm256_add_epi64((__m256i) sumslice, _mm256_sad_epu8((__m256i) dataslice, (__m256i) zeroslice));
+	}
+
+	// Add the sums within the slice.
+	_mm256_storeu_si256((__m256i *) sumvals, (__m256i) sumslice);
+	for (y = 0; y < (CHARSIMDSIZE_AVX2 / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	// Add the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	return partialsum;
+}
+#endif
+
+
+/* For x86-64 AVX-512BW SIMD. See the SSE2 version. The elements which are
+   not used are set to zero by masked loads.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   Returns: The sum of the elements used.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW static unsigned long long stridesum_avx512_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned long long partialsum = 0;
+	unsigned long long selectmask0, selectmask1, selectmask2;
+
+	unsigned long long sumvals[CHARSIMDSIZE_AVX512 / 8];
+	v64qi dataslice, zeroslice;
+	v8di sumslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512));
+
+	// The masks which select the elements which are used.
+	selectmask0 = stridemaskbits(0, CHARSIMDSIZE_AVX512, step);
+	selectmask1 = stridemaskbits(CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step);
+	selectmask2 = stridemaskbits(2 * CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step);
+
+	zeroslice = (v64qi) _mm512_setzero_si512();
+	sumslice = (v8di) _mm512_setzero_si512();
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512) {
+		dataslice = (v64qi) _mm512_maskz_loadu_epi8(selectmask0, &data[x]);
+		sumslice = (v8di) _mm512_add_epi64((__m512i) sumslice, _mm512_sad_epu8((__m512i) dataslice, (__m512i) zeroslice));
+		dataslice = (v64qi) _mm512_maskz_loadu_epi8(selectmask1, &data[x + CHARSIMDSIZE_AVX512]);
+		sumslice = (v8di) _mm512_add_epi64((__m512i) sumslice, _mm512_sad_epu8((__m512i) dataslice, (__m512i) zeroslice));
+		dataslice = (v64qi) _mm512_maskz_loadu_epi8(selectmask2, &data[x + (2 * CHARSIMDSIZE_AVX512)]);
+		sumslice = (v8di) _mm512_add_epi64((__m512i) sumslice, _mm512_sad_epu8((__m512i) dataslice, (__m512i) zeroslice));
+	}
+
+	// Add the sums within the slice.
+	_mm512_storeu_si512(sumvals, (__m512i) sumslice);
+	for (y = 0; y < (CHARSIMDSIZE_AVX512 / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	// Add the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	return partialsum;
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* For x86-64 SIMD. This combines the loops of the max, min, and sum
+   functions, so that the data is read only once. The maximum and minimum
+   include every element within the loop, and the elements which are not
+   used are discarded at the end. The sum uses the mask for each vector.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   stats = Receives the minimum, maximum, and sum of the elements used.
+   Returns: Nothing.
+*/
+#if defined(AF_HASSIMD_X86)
+static void stridestats_x86_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data, struct stridestats *stats) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned char minfound, maxfound;
+	unsigned long long partialsum = 0;
+
+	unsigned char maskvals[STRIDE_SIMDPERIOD * CHARSIMDSIZE];
+	unsigned char minvals[CHARSIMDSIZE];
+	unsigned char maxvals[CHARSIMDSIZE];
+	unsigned long long sumvals[CHARSIMDSIZE / 8];
+	v16qi maskslice0, maskslice1, maskslice2, dataslice, zeroslice, onesslice;
+	v16qi minslice0, minslice1, minslice2, maxslice0, maxslice1, maxslice2;
+	v2di sumslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE));
+
+	// The masks which select the elements which are used.
+	stridemaskvals(maskvals, STRIDE_SIMDPERIOD * CHARSIMDSIZE, step);
+	maskslice0 = (v16qi) _mm_loadu_si128((__m128i *) &maskvals[0]);
+	maskslice1 = (v16qi) _mm_loadu_si128((__m128i *) &maskvals[CHARSIMDSIZE]);
+	maskslice2 = (v16qi) _mm_loadu_si128((__m128i *) &maskvals[2 * CHARSIMDSIZE]);
+
+	zeroslice = (v16qi) _mm_setzero_si128();
+	onesslice = (v16qi) _mm_set1_epi8((char) 0xff);
+	sumslice = (v2di) _mm_setzero_si128();
+
+	// Zero cannot be greater than any element, and 0xff cannot be less.
+	maxslice0 = zeroslice;
+	maxslice1 = zeroslice;
+	maxslice2 = zeroslice;
+	minslice0 = onesslice;
+	minslice1 = onesslice;
+	minslice2 = onesslice;
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE) {
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x]);
+		maxslice0 = (v16qi) _mm_max_epu8((__m128i) maxslice0, (__m128i) dataslice);
+		minslice0 = (v16qi) _mm_min_epu8((__m128i) minslice0, (__m128i) dataslice);
+		dataslice = (v16qi) _mm_and_si128((__m128i) dataslice, (__m128i) maskslice0);
+		sumslice = (v2di) _mm_add_epi64((__m128i) sumslice, _mm_sad_epu8((__m128i) dataslice, (__m128i) zeroslice));
+
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x + CHARSIMDSIZE]);
+		maxslice1 = (v16qi) _mm_max_epu8((__m128i) maxslice1, (__m128i) dataslice);
+		minslice1 = (v16qi) _mm_min_epu8((__m128i) minslice1, (__m128i) dataslice);
+		dataslice = (v16qi) _mm_and_si128((__m128i) dataslice, (__m128i) maskslice1);
+		sumslice = (v2di) _mm_add_epi64((__m128i) sumslice, _mm_sad_epu8((__m128i) dataslice, (__m128i) zeroslice));
+
+		dataslice = (v16qi) _mm_loadu_si128((__m128i *) &data[x + (2 * CHARSIMDSIZE)]);
+		maxslice2 = (v16qi) _mm_max_epu8((__m128i) maxslice2, (__m128i) dataslice);
+		minslice2 = (v16qi) _mm_min_epu8((__m128i) minslice2, (__m128i) dataslice);
+		dataslice = (v16qi) _mm_and_si128((__m128i) dataslice, (__m128i) maskslice2);
+		sumslice = (v2di) _mm_add_epi64((__m128i) sumslice, _mm_sad_epu8((__m128i) dataslice, (__m128i) zeroslice));
+	}
+
+	// The elements which are not used are set to zero for the maximum, and
+	// to 0xff for the minimum, and then discarded.
+	maxslice0 = (v16qi) _mm_and_si128((__m128i) maxslice0, (__m128i) maskslice0);
+	maxslice1 = (v16qi) _mm_and_si128((__m128i) maxslice1, (__m128i) maskslice1);
+	maxslice2 = (v16qi) _mm_and_si128((__m128i) maxslice2, (__m128i) maskslice2);
+	maxslice0 = (v16qi) _mm_max_epu8((__m128i) maxslice0, (__m128i) maxslice1);
+	maxslice0 = (v16qi) _mm_max_epu8((__m128i) maxslice0, (__m128i) maxslice2);
+
+	minslice0 = (v16qi) _mm_or_si128((__m128i) minslice0, _mm_andnot_si128((__m128i) maskslice0, (__m128i) onesslice));
+	minslice1 = (v16qi) _mm_or_si128((__m128i) minslice1, _mm_andnot_si128((__m128i) maskslice1, (__m128i) onesslice));
+	minslice2 = (v16qi) _mm_or_si128((__m128i) minslice2, _mm_andnot_si128((__m128i) maskslice2, (__m128i) onesslice));
+	minslice0 = (v16qi) _mm_min_epu8((__m128i) minslice0, (__m128i) minslice1);
+	minslice0 = (v16qi) _mm_min_epu8((__m128i) minslice0, (__m128i) minslice2);
+
+	// Find the min, max, and sum within the slices.
+	_mm_storeu_si128((__m128i *) maxvals, (__m128i) maxslice0);
+	_mm_storeu_si128((__m128i *) minvals, (__m128i) minslice0);
+	_mm_storeu_si128((__m128i *) sumvals, (__m128i) sumslice);
+	maxfound = maxvals[0];
+	minfound = minvals[0];
+	for (y = 1; y < CHARSIMDSIZE; y++) {
+		if (maxvals[y] > maxfound) {
+			maxfound = maxvals[y];
+		}
+		if (minvals[y] < minfound) {
+			minfound = minvals[y];
+		}
+	}
+	for (y = 0; y < (CHARSIMDSIZE / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		if (data[x] > maxfound) {
+			maxfound = data[x];
+		}
+		if (data[x] < minfound) {
+			minfound = data[x];
+		}
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	stats->minval = minfound;
+	stats->maxval = maxfound;
+	stats->sum = partialsum;
+}
+#endif
+
+
+/* For x86-64 AVX2 SIMD. See the SSE2 version.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static void stridestats_avx2_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data, struct stridestats *stats) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned char minfound, maxfound;
+	unsigned long long partialsum = 0;
+
+	unsigned char maskvals[STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2];
+	unsigned char minvals[CHARSIMDSIZE_AVX2];
+	unsigned char maxvals[CHARSIMDSIZE_AVX2];
+	unsigned long long sumvals[CHARSIMDSIZE_AVX2 / 8];
+	v32qi maskslice0, maskslice1, maskslice2, dataslice, zeroslice, onesslice;
+	v32qi minslice0, minslice1, minslice2, maxslice0, maxslice1, maxslice2;
+	v4di sumslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2));
+
+	// The masks which select the elements which are used.
+	stridemaskvals(maskvals, STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2, step);
+	maskslice0 = (v32qi) _mm256_loadu_si256((__m256i *) &maskvals[0]);
+	maskslice1 = (v32qi) _mm256_loadu_si256((__m256i *) &maskvals[CHARSIMDSIZE_AVX2]);
+	maskslice2 = (v32qi) _mm256_loadu_si256((__m256i *) &maskvals[2 * CHARSIMDSIZE_AVX2]);
+
+	zeroslice = (v32qi) _mm256_setzero_si256();
+	onesslice = (v32qi) _mm256_set1_epi8((char) 0xff);
+	sumslice = (v4di) _mm256_setzero_si256();
+
+	// Zero cannot be greater than any element, and 0xff cannot be less.
+	maxslice0 = zeroslice;
+	maxslice1 = zeroslice;
+	maxslice2 = zeroslice;
+	minslice0 = onesslice;
+	minslice1 = onesslice;
+	minslice2 = onesslice;
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2) {
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x]);
+		maxslice0 = (v32qi) _mm256_max_epu8((__m256i) maxslice0, (__m256i) dataslice);
+		minslice0 = (v32qi) _mm256_min_epu8((__m256i) minslice0, (__m256i) dataslice);
+		dataslice = (v32qi) _mm256_and_si256((__m256i) dataslice, (__m256i) maskslice0);
+		sumslice = (v4di) _mm256_add_epi64((__m256i) sumslice, _mm256_sad_epu8((__m256i) dataslice, (__m256i) zeroslice));
+
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x + CHARSIMDSIZE_AVX2]);
+		maxslice1 = (v32qi) _mm256_max_epu8((__m256i) maxslice1, (__m256i) dataslice);
+		minslice1 = (v32qi) _mm256_min_epu8((__m256i) minslice1, (__m256i) dataslice);
+		dataslice = (v32qi) _mm256_and_si256((__m256i) dataslice, (__m256i) maskslice1);
+		sumslice = (v4di) _mm256_add_epi64((__m256i) sumslice, _mm256_sad_epu8((__m256i) dataslice, (__m256i) zeroslice));
+
+		dataslice = (v32qi) _mm256_loadu_si256((__m256i *) &data[x + (2 * CHARSIMDSIZE_AVX2)]);
+		maxslice2 = (v32qi) _mm256_max_epu8((__m256i) maxslice2, (__m256i) dataslice);
+		minslice2 = (v32qi) _mm256_min_epu8((__m256i) minslice2, (__m256i) dataslice);
+		dataslice = (v32qi) _mm256_and_si256((__m256i) dataslice, (__m256i) maskslice2);
+		sumslice = (v4di) _mm256_add_epi64((__m256i) sumslice, _mm256_sad_epu8((__m256i) dataslice, (__m256i) zeroslice));
+	}
+
+	// The elements which are not used are set to zero for the maximum, and
+	// to 0xff for the minimum, and then discarded.
+	maxslice0 = (v32qi) _mm256_and_si256((__m256i) maxslice0, (__m256i) maskslice0);
+	maxslice1 = (v32qi) _mm256_and_si256((__m256i) maxslice1, (__m256i) maskslice1);
+	maxslice2 = (v32qi) _mm256_and_si256((__m256i) maxslice2, (__m256i) maskslice2);
+	maxslice0 = (v32qi) _mm256_max_epu8((__m256i) maxslice0, (__m256i) maxslice1);
+	maxslice0 = (v32qi) _mm256_max_epu8((__m256i) maxslice0, (__m256i) maxslice2);
+
+	minslice0 = (v32qi) _mm256_or_si256((__m256i) minslice0, _mm256_andnot_si256((__m256i) maskslice0, (__m256i) onesslice));
+	minslice1 = (v32qi) _mm256_or_si256((__m256i) minslice1, _mm256_andnot_si256((__m256i) maskslice1, (__m256i) onesslice));
+	minslice2 = (v32qi) _mm256_or_si256((__m256i) minslice2, _mm256_andnot_si256((__m256i) maskslice2, (__m256i) onesslice));
+	minslice0 = (v32qi) _mm256_min_epu8((__m256i) minslice0, (__m256i) minslice1);
+	minslice0 = (v32qi) _mm256_min_epu8((__m256i) minslice0, (__m256i) minslice2);
+
+	// Find the min, max, and sum within the slices.
+	_mm256_storeu_si256((__m256i *) maxvals, (__m256i) maxslice0);
+	_mm256_storeu_si256((__m256i *) minvals, (__m256i) minslice0);
+	_mm256_storeu_si256((__m256i *) sumvals, (__m256i) sumslice);
+	maxfound = maxvals[0];
+	minfound = minvals[0];
+	for (y = 1; y < CHARSIMDSIZE_AVX2; y++) {
+		if (maxvals[y] > maxfound) {
+			maxfound = maxvals[y];
+		}
+		if (minvals[y] < minfound) {
+			minfound = minvals[y];
+		}
+	}
+	for (y = 0; y < (CHARSIMDSIZE_AVX2 / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		if (data[x] > maxfound) {
+			maxfound = data[x];
+		}
+		if (data[x] < minfound) {
+			minfound = data[x];
+		}
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	stats->minval = minfound;
+	stats->maxval = maxfound;
+	stats->sum = partialsum;
+}
+#endif
+
+
+/* For x86-64 AVX-512BW SIMD. See the SSE2 version. The masks are bit masks
+   rather than vectors.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW static void stridestats_avx512_simd(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data, struct stridestats *stats) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+	unsigned char minfound, maxfound;
+	unsigned long long partialsum = 0;
+	unsigned long long selectmask0, selectmask1, selectmask2;
+
+	unsigned char minvals[CHARSIMDSIZE_AVX512];
+	unsigned char maxvals[CHARSIMDSIZE_AVX512];
+	unsigned long long sumvals[CHARSIMDSIZE_AVX512 / 8];
+	v64qi dataslice, zeroslice, onesslice;
+	v64qi minslice0, minslice1, minslice2, maxslice0, maxslice1, maxslice2;
+	v8di sumslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512));
+
+	// The masks which select the elements which are used.
+	selectmask0 = stridemaskbits(0, CHARSIMDSIZE_AVX512, step);
+	selectmask1 = stridemaskbits(CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step);
+	selectmask2 = stridemaskbits(2 * CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step);
+
+	zeroslice = (v64qi) _mm512_setzero_si512();
+	onesslice = (v64qi) _mm512_set1_epi8((char) 0xff);
+	sumslice = (v8di) _mm512_setzero_si512();
+
+	// Zero cannot be greater than any element, and 0xff cannot be less.
+	maxslice0 = zeroslice;
+	maxslice1 = zeroslice;
+	maxslice2 = zeroslice;
+	minslice0 = onesslice;
+	minslice1 = onesslice;
+	minslice2 = onesslice;
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512) {
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x]);
+		maxslice0 = (v64qi) _mm512_max_epu8((__m512i) maxslice0, (__m512i) dataslice);
+		minslice0 = (v64qi) _mm512_min_epu8((__m512i) minslice0, (__m512i) dataslice);
+		dataslice = (v64qi) _mm512_maskz_mov_epi8(selectmask0, (__m512i) dataslice);
+		sumslice = (v8di) _mm512_add_epi64((__m512i) sumslice, _mm512_sad_epu8((__m512i) dataslice, (__m512i) zeroslice));
+
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x + CHARSIMDSIZE_AVX512]);
+		maxslice1 = (v64qi) _mm512_max_epu8((__m512i) maxslice1, (__m512i) dataslice);
+		minslice1 = (v64qi) _mm512_min_epu8((__m512i) minslice1, (__m512i) dataslice);
+		dataslice = (v64qi) _mm512_maskz_mov_epi8(selectmask1, (__m512i) dataslice);
+		sumslice = (v8di) _mm512_add_epi64((__m512i) sumslice, _mm512_sad_epu8((__m512i) dataslice, (__m512i) zeroslice));
+
+		dataslice = (v64qi) _mm512_loadu_si512(&data[x + (2 * CHARSIMDSIZE_AVX512)]);
+		maxslice2 = (v64qi) _mm512_max_epu8((__m512i) maxslice2, (__m512i) dataslice);
+		minslice2 = (v64qi) _mm512_min_epu8((__m512i) minslice2, (__m512i) dataslice);
+		dataslice = (v64qi) _mm512_maskz_mov_epi8(selectmask2, (__m512i) dataslice);
+		sumslice = (v8di) _mm512_add_epi64((__m512i) sumslice, _mm512_sad_epu8((__m512i) dataslice, (__m512i) zeroslice));
+	}
+
+	// The elements which are not used are set to zero for the maximum, and
+	// to 0xff for the minimum, and then discarded.
+	maxslice0 = (v64qi) _mm512_maskz_mov_epi8(selectmask0, (__m512i) maxslice0);
+	maxslice1 = (v64qi) _mm512_maskz_mov_epi8(selectmask1, (__m512i) maxslice1);
+	maxslice2 = (v64qi) _mm512_maskz_mov_epi8(selectmask2, (__m512i) maxslice2);
+	maxslice0 = (v64qi) _mm512_max_epu8((__m512i) maxslice0, (__m512i) maxslice1);
+	maxslice0 = (v64qi) _mm512_max_epu8((__m512i) maxslice0, (__m512i) maxslice2);
+
+	minslice0 = (v64qi) _mm512_mask_mov_epi8((__m512i) onesslice, selectmask0, (__m512i) minslice0);
+	minslice1 = (v64qi) _mm512_mask_mov_epi8((__m512i) onesslice, selectmask1, (__m512i) minslice1);
+	minslice2 = (v64qi) _mm512_mask_mov_epi8((__m512i) onesslice, selectmask2, (__m512i) minslice2);
+	minslice0 = (v64qi) _mm512_min_epu8((__m512i) minslice0, (__m512i) minslice1);
+	minslice0 = (v64qi) _mm512_min_epu8((__m512i) minslice0, (__m512i) minslice2);
+
+	// Find the min, max, and sum within the slices.
+	_mm512_storeu_si512(maxvals, (__m512i) maxslice0);
+	_mm512_storeu_si512(minvals, (__m512i) minslice0);
+	_mm512_storeu_si512(sumvals, (__m512i) sumslice);
+	maxfound = maxvals[0];
+	minfound = minvals[0];
+	for (y = 1; y < CHARSIMDSIZE_AVX512; y++) {
+		if (maxvals[y] > maxfound) {
+			maxfound = maxvals[y];
+		}
+		if (minvals[y] < minfound) {
+			minfound = minvals[y];
+		}
+	}
+	for (y = 0; y < (CHARSIMDSIZE_AVX512 / 8); y++) {
+		partialsum = partialsum + sumvals[y];
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	for (x = alignedlength; x < arraylen; x += step) {
+		if (data[x] > maxfound) {
+			maxfound = data[x];
+		}
+		if (data[x] < minfound) {
+			minfound = data[x];
+		}
+		partialsum = partialsum + (unsigned long long) data[x];
+	}
+
+	stats->minval = minfound;
+	stats->maxval = maxfound;
+	stats->sum = partialsum;
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* Compare two SIMD vectors. Each byte of the result is 0xff where the
+   comparison is true, or zero where it is false.
+   datasliceleft, datasliceright = The vectors to compare.
+   baseop = The comparison from stridebaseop.
+*/
+#if defined(AF_HASSIMD_X86)
+static inline v16qi stridecomparevec_x86(v16qi datasliceleft, v16qi datasliceright, int baseop) {
+
+	switch (baseop) {
+		case OP_AF_GE: {
+			return (v16qi) _mm_cmpeq_epi8(_mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright), (__m128i) datasliceleft);
+		}
+		case OP_AF_LE: {
+			return (v16qi) _mm_cmpeq_epi8(_mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright), (__m128i) datasliceleft);
+		}
+		default: {
+			return (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		}
+	}
+}
+#endif
+
+
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static inline v32qi stridecomparevec_avx2(v32qi datasliceleft, v32qi datasliceright, int baseop) {
+
+	switch (baseop) {
+		case OP_AF_GE: {
+			return (v32qi) _mm256_cmpeq_epi8(_mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright), (__m256i) datasliceleft);
+		}
+		case OP_AF_LE: {
+			return (v32qi) _mm256_cmpeq_epi8(_mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright), (__m256i) datasliceleft);
+		}
+		default: {
+			return (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		}
+	}
+}
+#endif
+
+
+/* Compare two SIMD vectors and return the result as a bit mask with one bit
+   per element.
+   datasliceleft, datasliceright = The vectors to compare.
+   baseop = The comparison from stridebaseop.
+*/
+#if defined(AF_HASSIMD_X86)
+static inline unsigned int stridecompare_x86(v16qi datasliceleft, v16qi datasliceright, int baseop) {
+
+	return (unsigned int) _mm_movemask_epi8((__m128i) stridecomparevec_x86(datasliceleft, datasliceright, baseop));
+}
+#endif
+
+
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static inline unsigned int stridecompare_avx2(v32qi datasliceleft, v32qi datasliceright, int baseop) {
+
+	return (unsigned int) _mm256_movemask_epi8((__m256i) stridecomparevec_avx2(datasliceleft, datasliceright, baseop));
+}
+#endif
+
+
+/* AVX-512 compares produce a mask with one bit per element, so every type
+   of comparison can be done directly. Only the elements selected by
+   selectmask are compared.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW static inline unsigned long long stridecompare_avx512(unsigned long long selectmask, v64qi datasliceleft, v64qi datasliceright, int opcode) {
+
+	switch (opcode) {
+		case OP_AF_EQ: {
+			return _mm512_mask_cmp_epu8_mask(selectmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		}
+		case OP_AF_GT: {
+			return _mm512_mask_cmp_epu8_mask(selectmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		}
+		case OP_AF_GE: {
+			return _mm512_mask_cmp_epu8_mask(selectmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		}
+		case OP_AF_LT: {
+			return _mm512_mask_cmp_epu8_mask(selectmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		}
+		case OP_AF_LE: {
+			return _mm512_mask_cmp_epu8_mask(selectmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		}
+		default: {
+			return _mm512_mask_cmp_epu8_mask(selectmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		}
+	}
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* For x86-64 SIMD.
+   opcode = The comparison operator. This must be valid.
+   arraylen = The length of the data arrays.
+   step = The step between the elements which are used.
+   data1 = The input data array.
+   data2 = The second input data array, or NULL if param is to be used.
+   param = The parameter to compare to if there is no second array.
+   Returns the array index of the first element for which the comparison
+		is true, or ARR_ERR_NOTFOUND if there is none.
+*/
+#if defined(AF_HASSIMD_X86)
+static Py_ssize_t stridefind_x86_simd(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data1, unsigned char *data2, unsigned char param) {
+
+	// array index counter.
+	Py_ssize_t x, index, resultcode;
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	int baseop, invert;
+	unsigned int invertmask, resultmask;
+	unsigned int selectmask[STRIDE_SIMDPERIOD];
+
+	v16qi datasliceleft, datasliceright, paramslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE));
+
+	// The comparison and the masks which select the elements which are used.
+	baseop = stridebaseop(opcode, &invert);
+	invertmask = invert ? 0xffff : 0x0000;
+	for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+		selectmask[y] = (unsigned int) stridemaskbits(y * CHARSIMDSIZE, CHARSIMDSIZE, step);
+	}
+
+	paramslice = (v16qi) _mm_set1_epi8((char) param);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE) {
+		for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+			index = x + (y * CHARSIMDSIZE);
+			datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+			datasliceright = (data2 != NULL) ? (v16qi) _mm_loadu_si128((__m128i *) &data2[index]) : paramslice;
+			resultmask = (stridecompare_x86(datasliceleft, datasliceright, baseop) ^ invertmask) & selectmask[y];
+			// The lowest bit set in the mask is the first matching element.
+			if (resultmask != 0) {
+				return index + __builtin_ctz(resultmask);
+			}
+		}
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	resultcode = stridefind(opcode, arraylen - alignedlength, step, &data1[alignedlength],
+					(data2 != NULL) ? &data2[alignedlength] : NULL, param);
+
+	return (resultcode >= 0) ? (alignedlength + resultcode) : resultcode;
+}
+#endif
+
+
+/* For x86-64 AVX2 SIMD. See the SSE2 version.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static Py_ssize_t stridefind_avx2_simd(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data1, unsigned char *data2, unsigned char param) {
+
+	// array index counter.
+	Py_ssize_t x, index, resultcode;
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	int baseop, invert;
+	unsigned int invertmask, resultmask;
+	unsigned int selectmask[STRIDE_SIMDPERIOD];
+
+	v32qi datasliceleft, datasliceright, paramslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2));
+
+	// The comparison and the masks which select the elements which are used.
+	baseop = stridebaseop(opcode, &invert);
+	invertmask = invert ? 0xffffffff : 0x00000000;
+	for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+		selectmask[y] = (unsigned int) stridemaskbits(y * CHARSIMDSIZE_AVX2, CHARSIMDSIZE_AVX2, step);
+	}
+
+	paramslice = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2) {
+		for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+			index = x + (y * CHARSIMDSIZE_AVX2);
+			datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+			datasliceright = (data2 != NULL) ? (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]) : paramslice;
+			resultmask = (stridecompare_avx2(datasliceleft, datasliceright, baseop) ^ invertmask) & selectmask[y];
+			// The lowest bit set in the mask is the first matching element.
+			if (resultmask != 0) {
+				return index + __builtin_ctz(resultmask);
+			}
+		}
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	resultcode = stridefind(opcode, arraylen - alignedlength, step, &data1[alignedlength],
+					(data2 != NULL) ? &data2[alignedlength] : NULL, param);
+
+	return (resultcode >= 0) ? (alignedlength + resultcode) : resultcode;
+}
+#endif
+
+
+/* For x86-64 AVX-512BW SIMD. See the SSE2 version.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW static Py_ssize_t stridefind_avx512_simd(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data1, unsigned char *data2, unsigned char param) {
+
+	// array index counter.
+	Py_ssize_t x, index, resultcode;
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	unsigned long long resultmask;
+	unsigned long long selectmask[STRIDE_SIMDPERIOD];
+
+	v64qi datasliceleft, datasliceright, paramslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512));
+
+	// The masks which select the elements which are used.
+	for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+		selectmask[y] = stridemaskbits(y * CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step);
+	}
+
+	paramslice = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512) {
+		for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+			index = x + (y * CHARSIMDSIZE_AVX512);
+			datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+			datasliceright = (data2 != NULL) ? (v64qi) _mm512_loadu_si512(&data2[index]) : paramslice;
+			resultmask = stridecompare_avx512(selectmask[y], datasliceleft, datasliceright, opcode);
+			// The lowest bit set in the mask is the first matching element.
+			if (resultmask != 0) {
+				return index + __builtin_ctzll(resultmask);
+			}
+		}
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	resultcode = stridefind(opcode, arraylen - alignedlength, step, &data1[alignedlength],
+					(data2 != NULL) ? &data2[alignedlength] : NULL, param);
+
+	return (resultcode >= 0) ? (alignedlength + resultcode) : resultcode;
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* For x86-64 SIMD. Each SIMD vector is compared to give a bit mask with one
+   bit per element. The index of each bit which is set is then recorded,
+   lowest first.
+   opcode = The comparison operator. This must be valid.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   param = The parameter to compare to.
+   offset = This is added to each index which is recorded.
+   results = Receives the index of every element for which the comparison
+		is true. This must have room for one index for each element used.
+   Returns the number of indexes recorded.
+*/
+#if defined(AF_HASSIMD_X86)
+static Py_ssize_t stridefindall_x86_simd(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data, unsigned char param, Py_ssize_t offset, long long *results) {
+
+	// array index counter.
+	Py_ssize_t x, index;
+	Py_ssize_t alignedlength;
+	Py_ssize_t nfound = 0;
+	unsigned int y;
+
+	int baseop, invert;
+	unsigned int invertmask, resultmask;
+	unsigned int selectmask[STRIDE_SIMDPERIOD];
+
+	v16qi datasliceleft, paramslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE));
+
+	// The comparison and the masks which select the elements which are used.
+	baseop = stridebaseop(opcode, &invert);
+	invertmask = invert ? 0xffff : 0x0000;
+	for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+		selectmask[y] = (unsigned int) stridemaskbits(y * CHARSIMDSIZE, CHARSIMDSIZE, step);
+	}
+
+	paramslice = (v16qi) _mm_set1_epi8((char) param);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE) {
+		for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+			index = x + (y * CHARSIMDSIZE);
+			datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+			resultmask = (stridecompare_x86(datasliceleft, paramslice, baseop) ^ invertmask) & selectmask[y];
+			// Record each bit which is set, and then clear it.
+			while (resultmask != 0) {
+				results[nfound++] = offset + index + __builtin_ctz(resultmask);
+				resultmask = resultmask & (resultmask - 1);
+			}
+		}
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	nfound += stridefindall(opcode, arraylen - alignedlength, step, &data[alignedlength],
+					param, offset + alignedlength, &results[nfound]);
+
+	return nfound;
+}
+#endif
+
+
+/* For x86-64 AVX2 SIMD. See the SSE2 version.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static Py_ssize_t stridefindall_avx2_simd(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data, unsigned char param, Py_ssize_t offset, long long *results) {
+
+	// array index counter.
+	Py_ssize_t x, index;
+	Py_ssize_t alignedlength;
+	Py_ssize_t nfound = 0;
+	unsigned int y;
+
+	int baseop, invert;
+	unsigned int invertmask, resultmask;
+	unsigned int selectmask[STRIDE_SIMDPERIOD];
+
+	v32qi datasliceleft, paramslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2));
+
+	// The comparison and the masks which select the elements which are used.
+	baseop = stridebaseop(opcode, &invert);
+	invertmask = invert ? 0xffffffff : 0x00000000;
+	for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+		selectmask[y] = (unsigned int) stridemaskbits(y * CHARSIMDSIZE_AVX2, CHARSIMDSIZE_AVX2, step);
+	}
+
+	paramslice = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2) {
+		for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+			index = x + (y * CHARSIMDSIZE_AVX2);
+			datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
+			resultmask = (stridecompare_avx2(datasliceleft, paramslice, baseop) ^ invertmask) & selectmask[y];
+			// Record each bit which is set, and then clear it.
+			while (resultmask != 0) {
+				results[nfound++] = offset + index + __builtin_ctz(resultmask);
+				resultmask = resultmask & (resultmask - 1);
+			}
+		}
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	nfound += stridefindall(opcode, arraylen - alignedlength, step, &data[alignedlength],
+					param, offset + alignedlength, &results[nfound]);
+
+	return nfound;
+}
+#endif
+
+
+/* For x86-64 AVX-512BW SIMD. See the SSE2 version.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW static Py_ssize_t stridefindall_avx512_simd(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data, unsigned char param, Py_ssize_t offset, long long *results) {
+
+	// array index counter.
+	Py_ssize_t x, index;
+	Py_ssize_t alignedlength;
+	Py_ssize_t nfound = 0;
+	unsigned int y;
+
+	unsigned long long resultmask;
+	unsigned long long selectmask[STRIDE_SIMDPERIOD];
+
+	v64qi datasliceleft, paramslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512));
+
+	// The masks which select the elements which are used.
+	for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+		selectmask[y] = stridemaskbits(y * CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step);
+	}
+
+	paramslice = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512) {
+		for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+			index = x + (y * CHARSIMDSIZE_AVX512);
+			datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+			resultmask = stridecompare_avx512(selectmask[y], datasliceleft, paramslice, opcode);
+			// Record each bit which is set, and then clear it.
+			while (resultmask != 0) {
+				results[nfound++] = offset + index + __builtin_ctzll(resultmask);
+				resultmask = resultmask & (resultmask - 1);
+			}
+		}
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	nfound += stridefindall(opcode, arraylen - alignedlength, step, &data[alignedlength],
+					param, offset + alignedlength, &results[nfound]);
+
+	return nfound;
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+// The counts are kept in one byte per element, and each pass through the
+// repeating pattern can add one to each byte for each vector. The counts
+// must be added to the total before they can overflow.
+#define STRIDE_COUNTMAXPASSES (255 / STRIDE_SIMDPERIOD)
+
+
+/* For x86-64 SIMD. Each SIMD vector is compared to give 0xff in each byte
+   which matches, and the elements which are not used are then set to zero.
+   Subtracting this from a vector of counts adds one to the count for each
+   match. The counts are periodically added together using psadbw (sum of
+   absolute differences from zero), which gives 64 bit sums.
+   opcode = The comparison operator. This must be valid.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   data = The input data array.
+   param = The parameter to compare to.
+   Returns the number of elements for which the comparison is true.
+*/
+#if defined(AF_HASSIMD_X86)
+static Py_ssize_t stridecountif_x86_simd(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data, unsigned char param) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	Py_ssize_t count = 0;
+	unsigned int y, passes = 0;
+
+	int baseop, invert;
+
+	unsigned char maskvals[STRIDE_SIMDPERIOD * CHARSIMDSIZE];
+	unsigned long long sumvals[CHARSIMDSIZE / 8];
+	v16qi maskslice[STRIDE_SIMDPERIOD];
+	v16qi datasliceleft, paramslice, invertslice, resultslice, countslice, zeroslice;
+	v2di sumslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE));
+
+	// The comparison and the masks which select the elements which are used.
+	baseop = stridebaseop(opcode, &invert);
+	stridemaskvals(maskvals, STRIDE_SIMDPERIOD * CHARSIMDSIZE, step);
+	for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+		maskslice[y] = (v16qi) _mm_loadu_si128((__m128i *) &maskvals[y * CHARSIMDSIZE]);
+	}
+
+	paramslice = (v16qi) _mm_set1_epi8((char) param);
+	invertslice = invert ? (v16qi) _mm_set1_epi8((char) 0xff) : (v16qi) _mm_setzero_si128();
+	zeroslice = (v16qi) _mm_setzero_si128();
+	countslice = (v16qi) _mm_setzero_si128();
+	sumslice = (v2di) _mm_setzero_si128();
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE) {
+		for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+			datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[x + (y * CHARSIMDSIZE)]);
+			resultslice = (v16qi) _mm_xor_si128((__m128i) stridecomparevec_x86(datasliceleft, paramslice, baseop), (__m128i) invertslice);
+			resultslice = (v16qi) _mm_and_si128((__m128i) resultslice, (__m128i) maskslice[y]);
+			countslice = (v16qi) _mm_sub_epi8((__m128i) countslice, (__m128i) resultslice);
+		}
+
+		// Add the counts to the total before they overflow.
+		passes++;
+		if (passes >= STRIDE_COUNTMAXPASSES) {
+			sumslice = (v2di) _mm_add_epi64((__m128i) sumslice, _mm_sad_epu8((__m128i) countslice, (__m128i) zeroslice));
+			countslice = (v16qi) _mm_setzero_si128();
+			passes = 0;
+		}
+	}
+
+	// Add the counts within the slice.
+	sumslice = (v2di) _mm_add_epi64((__m128i) sumslice, _mm_sad_epu8((__m128i) countslice, (__m128i) zeroslice));
+	_mm_storeu_si128((__m128i *) sumvals, (__m128i) sumslice);
+	for (y = 0; y < (CHARSIMDSIZE / 8); y++) {
+		count = count + (Py_ssize_t) sumvals[y];
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	count += stridecountif(opcode, arraylen - alignedlength, step, &data[alignedlength], param);
+
+	return count;
+}
+#endif
+
+
+/* For x86-64 AVX2 SIMD. See the SSE2 version.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static Py_ssize_t stridecountif_avx2_simd(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data, unsigned char param) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	Py_ssize_t count = 0;
+	unsigned int y, passes = 0;
+
+	int baseop, invert;
+
+	unsigned char maskvals[STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2];
+	unsigned long long sumvals[CHARSIMDSIZE_AVX2 / 8];
+	v32qi maskslice[STRIDE_SIMDPERIOD];
+	v32qi datasliceleft, paramslice, invertslice, resultslice, countslice, zeroslice;
+	v4di sumslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2));
+
+	// The comparison and the masks which select the elements which are used.
+	baseop = stridebaseop(opcode, &invert);
+	stridemaskvals(maskvals, STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2, step);
+	for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+		maskslice[y] = (v32qi) _mm256_loadu_si256((__m256i *) &maskvals[y * CHARSIMDSIZE_AVX2]);
+	}
+
+	paramslice = (v32qi) _mm256_set1_epi8((char) param);
+	invertslice = invert ? (v32qi) _mm256_set1_epi8((char) 0xff) : (v32qi) _mm256_setzero_si256();
+	zeroslice = (v32qi) _mm256_setzero_si256();
+	countslice = (v32qi) _mm256_setzero_si256();
+	sumslice = (v4di) _mm256_setzero_si256();
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX2) {
+		for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+			datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[x + (y * CHARSIMDSIZE_AVX2)]);
+			resultslice = (v32qi) _mm256_xor_si256((__m256i) stridecomparevec_avx2(datasliceleft, paramslice, baseop), (__m256i) invertslice);
+			resultslice = (v32qi) _mm256_and_si256((__m256i) resultslice, (__m256i) maskslice[y]);
+			countslice = (v32qi) _mm256_sub_epi8((__m256i) countslice, (__m256i) resultslice);
+		}
+
+		// Add the counts to the total before they overflow.
+		passes++;
+		if (passes >= STRIDE_COUNTMAXPASSES) {
+			sumslice = (v4di) _mm256_add_epi64((__m256i) sumslice, _mm256_sad_epu8((__m256i) countslice, (__m256i) zeroslice));
+			countslice = (v32qi) _mm256_setzero_si256();
+			passes = 0;
+		}
+	}
+
+	// Add the counts within the slice.
+	sumslice = (v4di) _mm256_add_epi64((__m256i) sumslice, _mm256_sad_epu8((__m256i) countslice, (__m256i) zeroslice));
+	_mm256_storeu_si256((__m256i *) sumvals, (__m256i) sumslice);
+	for (y = 0; y < (CHARSIMDSIZE_AVX2 / 8); y++) {
+		count = count + (Py_ssize_t) sumvals[y];
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	count += stridecountif(opcode, arraylen - alignedlength, step, &data[alignedlength], param);
+
+	return count;
+}
+#endif
+
+
+/* For x86-64 AVX-512BW SIMD. See the SSE2 version. The compare gives a bit
+   mask, which is used to add one to the count for each matching element.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW static Py_ssize_t stridecountif_avx512_simd(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data, unsigned char param) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	Py_ssize_t count = 0;
+	unsigned int y, passes = 0;
+
+	unsigned long long resultmask;
+	unsigned long long selectmask[STRIDE_SIMDPERIOD];
+
+	unsigned long long sumvals[CHARSIMDSIZE_AVX512 / 8];
+	v64qi datasliceleft, paramslice, onesslice, countslice, zeroslice;
+	v8di sumslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the repeating pattern length.
+	alignedlength = calcalignedlength(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512));
+
+	// The masks which select the elements which are used.
+	for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+		selectmask[y] = stridemaskbits(y * CHARSIMDSIZE_AVX512, CHARSIMDSIZE_AVX512, step);
+	}
+
+	paramslice = (v64qi) _mm512_set1_epi8((char) param);
+	onesslice = (v64qi) _mm512_set1_epi8(1);
+	zeroslice = (v64qi) _mm512_setzero_si512();
+	countslice = (v64qi) _mm512_setzero_si512();
+	sumslice = (v8di) _mm512_setzero_si512();
+
+	// Use SIMD.
+	for (x = 0; x < alignedlength; x += STRIDE_SIMDPERIOD * CHARSIMDSIZE_AVX512) {
+		for (y = 0; y < STRIDE_SIMDPERIOD; y++) {
+			datasliceleft = (v64qi) _mm512_loadu_si512(&data[x + (y * CHARSIMDSIZE_AVX512)]);
+			resultmask = stridecompare_avx512(selectmask[y], datasliceleft, paramslice, opcode);
+			countslice = (v64qi) _mm512_mask_add_epi8((__m512i) countslice, resultmask, (__m512i) countslice, (__m512i) onesslice);
+		}
+
+		// Add the counts to the total before they overflow.
+		passes++;
+		if (passes >= STRIDE_COUNTMAXPASSES) {
+			sumslice = (v8di) _mm512_add_epi64((__m512i) sumslice, _mm512_sad_epu8((__m512i) countslice, (__m512i) zeroslice));
+			countslice = (v64qi) _mm512_setzero_si512();
+			passes = 0;
+		}
+	}
+
+	// Add the counts within the slice.
+	sumslice = (v8di) _mm512_add_epi64((__m512i) sumslice, _mm512_sad_epu8((__m512i) countslice, (__m512i) zeroslice));
+	_mm512_storeu_si512(sumvals, (__m512i) sumslice);
+	for (y = 0; y < (CHARSIMDSIZE_AVX512 / 8); y++) {
+		count = count + (Py_ssize_t) sumvals[y];
+	}
+
+	// Check the left over elements at the end of the array.
+	// The aligned length is a multiple of the step.
+	count += stridecountif(opcode, arraylen - alignedlength, step, &data[alignedlength], param);
+
+	return count;
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* The SIMD functions to use. These are selected once when the module is
+   initialised, according to the SIMD features supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86)
+static unsigned char (*stridemax_simdfunc)(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data);
+static unsigned char (*stridemin_simdfunc)(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data);
+static unsigned long long (*stridesum_simdfunc)(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data);
+static Py_ssize_t (*stridefind_simdfunc)(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data1, unsigned char *data2, unsigned char param);
+static Py_ssize_t (*stridefindall_simdfunc)(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data, unsigned char param, Py_ssize_t offset, long long *results);
+static Py_ssize_t (*stridecountif_simdfunc)(int opcode, Py_ssize_t arraylen, Py_ssize_t step,
+			unsigned char *data, unsigned char param);
+static void (*stridestats_simdfunc)(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data, struct stridestats *stats);
+#endif
+
+
+/* Select the SIMD functions for this CPU. This must be called when each
+   module which uses these functions is initialised.
+*/
+void bytesstride_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		stridemax_simdfunc = stridemax_avx512_simd;
+		stridemin_simdfunc = stridemin_avx512_simd;
+		stridesum_simdfunc = stridesum_avx512_simd;
+		stridefind_simdfunc = stridefind_avx512_simd;
+		stridefindall_simdfunc = stridefindall_avx512_simd;
+		stridecountif_simdfunc = stridecountif_avx512_simd;
+		stridestats_simdfunc = stridestats_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		stridemax_simdfunc = stridemax_avx2_simd;
+		stridemin_simdfunc = stridemin_avx2_simd;
+		stridesum_simdfunc = stridesum_avx2_simd;
+		stridefind_simdfunc = stridefind_avx2_simd;
+		stridefindall_simdfunc = stridefindall_avx2_simd;
+		stridecountif_simdfunc = stridecountif_avx2_simd;
+		stridestats_simdfunc = stridestats_avx2_simd;
+	} else {
+		stridemax_simdfunc = stridemax_x86_simd;
+		stridemin_simdfunc = stridemin_x86_simd;
+		stridesum_simdfunc = stridesum_x86_simd;
+		stridefind_simdfunc = stridefind_x86_simd;
+		stridefindall_simdfunc = stridefindall_x86_simd;
+		stridecountif_simdfunc = stridecountif_x86_simd;
+		stridestats_simdfunc = stridestats_x86_simd;
+	}
+	#endif
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* These select the correct function, whether the platform independent
+   non-SIMD version, or the SIMD version selected for this CPU. SIMD is used
+   only for the steps which have SIMD versions.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   nosimd = If true, disable SIMD.
+   data = The input data array.
+   Returns: The maximum, minimum, or sum of the elements used.
+*/
+unsigned char stridemax_select(Py_ssize_t arraylen, Py_ssize_t step, int nosimd, unsigned char *data) {
+
+	#if defined(AF_HASSIMD_X86)
+	if (!nosimd && stridesimdstep(step) && enoughforsimd(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE))) {
+		return stridemax_simdfunc(arraylen, step, data);
+	}
+	#endif
+
+	return stridemax(arraylen, step, data);
+}
+
+
+unsigned char stridemin_select(Py_ssize_t arraylen, Py_ssize_t step, int nosimd, unsigned char *data) {
+
+	#if defined(AF_HASSIMD_X86)
+	if (!nosimd && stridesimdstep(step) && enoughforsimd(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE))) {
+		return stridemin_simdfunc(arraylen, step, data);
+	}
+	#endif
+
+	return stridemin(arraylen, step, data);
+}
+
+
+unsigned long long stridesum_select(Py_ssize_t arraylen, Py_ssize_t step, int nosimd, unsigned char *data) {
+
+	#if defined(AF_HASSIMD_X86)
+	if (!nosimd && stridesimdstep(step) && enoughforsimd(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE))) {
+		return stridesum_simdfunc(arraylen, step, data);
+	}
+	#endif
+
+	return stridesum(arraylen, step, data);
+}
+
+
+/* Calculate the minimum, maximum, and sum together, reading the data only
+   once. This is also used when every element is used (the step is one).
+   arraylen = The length of the data array. This must be at least one.
+   step = The step between the elements which are used.
+   nosimd = If true, disable SIMD.
+   data = The input data array.
+   stats = Receives the minimum, maximum, and sum of the elements used.
+   Returns: Nothing.
+*/
+void stridestats_select(Py_ssize_t arraylen, Py_ssize_t step, int nosimd, unsigned char *data, struct stridestats *stats) {
+
+	#if defined(AF_HASSIMD_X86)
+	if (!nosimd && stridesimdstep(step) && enoughforsimd(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE))) {
+		stridestats_simdfunc(arraylen, step, data, stats);
+		return;
+	}
+	#endif
+
+	stridestats(arraylen, step, data, stats);
+}
+
+
+/* Find the first element for which a comparison is true.
+   opcode = The comparison operator.
+   arraylen = The length of the data arrays.
+   step = The step between the elements which are used.
+   nosimd = If true, disable SIMD.
+   data1 = The input data array.
+   data2 = The second input data array, or NULL if param is to be used.
+   param = The parameter to compare to if there is no second array.
+   Returns the array index of the first element for which the comparison
+		is true, ARR_ERR_NOTFOUND if there is none, or ARR_ERR_INVALIDOP if
+		the operator is not valid.
+*/
+Py_ssize_t stridefind_select(int opcode, Py_ssize_t arraylen, Py_ssize_t step, int nosimd,
+			unsigned char *data1, unsigned char *data2, unsigned char param) {
+
+	if (stridenegateop(opcode) < 0) {
+		return ARR_ERR_INVALIDOP;
+	}
+
+	#if defined(AF_HASSIMD_X86)
+	if (!nosimd && stridesimdstep(step) && enoughforsimd(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE))) {
+		return stridefind_simdfunc(opcode, arraylen, step, data1, data2, param);
+	}
+	#endif
+
+	return stridefind(opcode, arraylen, step, data1, data2, param);
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Find every element for which a comparison is true. This is also used
+   when every element is used (the step is one).
+   opcode = The comparison operator.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   nosimd = If true, disable SIMD.
+   data = The input data array.
+   param = The parameter to compare to.
+   offset = This is added to each index which is recorded.
+   results = Receives the index of every element for which the comparison
+		is true, in order. This must have room for one index for each
+		element used.
+   Returns the number of indexes recorded, or ARR_ERR_INVALIDOP if the
+		operator is not valid.
+*/
+Py_ssize_t stridefindall_select(int opcode, Py_ssize_t arraylen, Py_ssize_t step, int nosimd,
+			unsigned char *data, unsigned char param, Py_ssize_t offset, long long *results) {
+
+	if (stridenegateop(opcode) < 0) {
+		return ARR_ERR_INVALIDOP;
+	}
+
+	#if defined(AF_HASSIMD_X86)
+	if (!nosimd && stridesimdstep(step) && enoughforsimd(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE))) {
+		return stridefindall_simdfunc(opcode, arraylen, step, data, param, offset, results);
+	}
+	#endif
+
+	return stridefindall(opcode, arraylen, step, data, param, offset, results);
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Count the elements for which a comparison is true. This is also used
+   when every element is used (the step is one).
+   opcode = The comparison operator.
+   arraylen = The length of the data array.
+   step = The step between the elements which are used.
+   nosimd = If true, disable SIMD.
+   data = The input data array.
+   param = The parameter to compare to.
+   Returns the number of elements for which the comparison is true, or
+		ARR_ERR_INVALIDOP if the operator is not valid.
+*/
+Py_ssize_t stridecountif_select(int opcode, Py_ssize_t arraylen, Py_ssize_t step, int nosimd,
+			unsigned char *data, unsigned char param) {
+
+	if (stridenegateop(opcode) < 0) {
+		return ARR_ERR_INVALIDOP;
+	}
+
+	#if defined(AF_HASSIMD_X86)
+	if (!nosimd && stridesimdstep(step) && enoughforsimd(arraylen, (STRIDE_SIMDPERIOD * CHARSIMDSIZE))) {
+		return stridecountif_simdfunc(opcode, arraylen, step, data, param);
+	}
+	#endif
+
+	return stridecountif(opcode, arraylen, step, data, param);
+}
+
+/*--------------------------------------------------------------------------- */
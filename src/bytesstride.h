@@ -0,0 +1,70 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   bytesstride.h
+// Purpose:  Calculations which use only every step'th element of a sequence.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+#include "Python.h"
+
+/*--------------------------------------------------------------------------- */
+
+// The SIMD versions work on this many SIMD vectors at a time. The pattern
+// of elements which are used must repeat within this many vectors.
+#define STRIDE_SIMDPERIOD 3
+
+// The largest step which has a SIMD version. With larger steps most of the
+// data in each SIMD vector would be unused.
+#define STRIDE_SIMDMAXSTEP 16
+
+// The results of stridestats_select.
+struct stridestats {
+	unsigned char minval;
+	unsigned char maxval;
+	unsigned long long sum;
+};
+
+/*--------------------------------------------------------------------------- */
+
+void bytesstride_initsimd(void);
+
+int stridenegateop(int opcode);
+
+int strideswapop(int opcode);
+
+unsigned char stridemax_select(Py_ssize_t arraylen, Py_ssize_t step, int nosimd, unsigned char *data);
+
+unsigned char stridemin_select(Py_ssize_t arraylen, Py_ssize_t step, int nosimd, unsigned char *data);
+
+unsigned long long stridesum_select(Py_ssize_t arraylen, Py_ssize_t step, int nosimd, unsigned char *data);
+
+void stridestats_select(Py_ssize_t arraylen, Py_ssize_t step, int nosimd, unsigned char *data, struct stridestats *stats);
+
+Py_ssize_t stridefind_select(int opcode, Py_ssize_t arraylen, Py_ssize_t step, int nosimd,
+			unsigned char *data1, unsigned char *data2, unsigned char param);
+
+Py_ssize_t stridefindall_select(int opcode, Py_ssize_t arraylen, Py_ssize_t step, int nosimd,
+			unsigned char *data, unsigned char param, Py_ssize_t offset, long long *results);
+
+Py_ssize_t stridecountif_select(int opcode, Py_ssize_t arraylen, Py_ssize_t step, int nosimd,
+			unsigned char *data, unsigned char param);
+
+/*--------------------------------------------------------------------------- */
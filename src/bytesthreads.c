@@ -0,0 +1,305 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   bytesthreads.c
+// Purpose:  Multi-threaded execution of calculations.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+/* This is linked into each C extension which can divide a calculation
+	between threads. The threads themselves are owned by the threadpool
+	module so that all the C extensions share the same pool and the same
+	default thread count. The functions in the threadpool module are
+	accessed through a capsule.
+*/
+
+/*--------------------------------------------------------------------------- */
+
+#include "Python.h"
+#include "pythread.h"
+
+#include "byteserrs.h"
+#include "bytesthreads.h"
+
+/*--------------------------------------------------------------------------- */
+
+// The functions exported by the threadpool module. This is imported the
+// first time it is needed.
+static struct bfthreads_api *bfthreadsapi = NULL;
+
+/*--------------------------------------------------------------------------- */
+
+/* Get the number of threads to use for a calculation. This must be called
+	while holding the GIL as it may import the threadpool module.
+	threads = The number of threads requested by the caller. If this is
+		zero, the module wide default is used.
+	Returns: The number of threads, or -1 if an error occurred. If an
+		error occurred, the Python exception will have been set.
+*/
+int getthreadcount(int threads) {
+
+	if ((threads < 0) || (threads > BF_MAXTHREADS)) {
+		ErrMsgThreadsValue();
+		return -1;
+	}
+
+	// Import the API from the threadpool module.
+	if (bfthreadsapi == NULL) {
+		bfthreadsapi = (struct bfthreads_api *) PyCapsule_Import(BFTHREADS_CAPSULE, 0);
+		if (bfthreadsapi == NULL) {
+			return -1;
+		}
+	}
+
+	// Use the default.
+	if (threads == 0) {
+		return bfthreadsapi->getthreads();
+	}
+
+	return threads;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Calculate how many parts a calculation should be divided into. Each
+	part will be run in a separate thread. Short sequences are not
+	divided as the overhead is greater than the benefit.
+	threads = The number of threads to use.
+	arraylen = The length of the sequence.
+	Returns: The number of parts. This is always at least 1.
+*/
+int calcthreadparts(int threads, Py_ssize_t arraylen) {
+
+	Py_ssize_t maxparts;
+
+	if (threads <= 1) {
+		return 1;
+	}
+
+	maxparts = arraylen / THREADS_MINCHUNK;
+
+	if (maxparts < threads) {
+		return (maxparts < 1) ? 1 : (int) maxparts;
+	}
+
+	return threads;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Calculate the range of the sequence covered by one part of a calculation.
+	The parts are contiguous and (except for the last) are a multiple of
+	THREADS_CHUNKALIGN in length.
+	arraylen = The length of the sequence.
+	part = The number of this part, starting from zero.
+	nparts = The total number of parts.
+	start = Output of the index of the start of this part.
+	partlen = Output of the length of this part. This may be zero.
+	Returns: Nothing.
+*/
+void partrange(Py_ssize_t arraylen, int part, int nparts, Py_ssize_t *start, Py_ssize_t *partlen) {
+
+	Py_ssize_t chunksize, partstart, partend;
+
+	chunksize = (arraylen + nparts - 1) / nparts;
+	chunksize = ((chunksize + THREADS_CHUNKALIGN - 1) / THREADS_CHUNKALIGN) * THREADS_CHUNKALIGN;
+
+	partstart = chunksize * part;
+	partend = partstart + chunksize;
+
+	if (partstart > arraylen) {
+		partstart = arraylen;
+	}
+	if ((partend > arraylen) || (part == (nparts - 1))) {
+		partend = arraylen;
+	}
+
+	*start = partstart;
+	*partlen = partend - partstart;
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Calculate the range of the sequence covered by one part of a calculation
+	which uses only every step'th element. This is the same as partrange,
+	except that each part starts on an element which is used. 
+	arraylen = The length of the sequence.
+	step = The step between the elements which are used.
+	part = The number of this part, starting from zero.
+	nparts = The total number of parts.
+	start = Output of the index of the start of this part.
+	partlen = Output of the length of this part. This may be zero.
+	Returns: Nothing.
+*/
+void partrangestep(Py_ssize_t arraylen, Py_ssize_t step, int part, int nparts, Py_ssize_t *start, Py_ssize_t *partlen) {
+
+	Py_ssize_t elemcount, elemstart, elemlen;
+
+	// The parts are calculated from the number of elements used.
+	elemcount = (arraylen / step) + ((arraylen % step) ? 1 : 0);
+	partrange(elemcount, part, nparts, &elemstart, &elemlen);
+
+	// The last part ends at the end of the sequence. 
+	if (elemstart >= elemcount) {
+		*start = arraylen;
+		*partlen = 0;
+	} else if ((elemstart + elemlen) >= elemcount) {
+		*start = elemstart * step;
+		*partlen = arraylen - *start;
+	} else {
+		*start = elemstart * step;
+		*partlen = elemlen * step;
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Calculate the size of the blocks used when a search which uses only every
+	step'th element is divided between threads. This is THREADS_SEARCHBLOCK
+	rounded down to a multiple of the step, so that each block starts on
+	an element which is used.
+	step = The step between the elements which are used.
+	Returns: The block size.
+*/
+Py_ssize_t searchblocksize(Py_ssize_t step) {
+
+	if (step >= THREADS_SEARCHBLOCK) {
+		return step;
+	}
+
+	return THREADS_SEARCHBLOCK - (THREADS_SEARCHBLOCK % step);
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Run all the parts of a calculation and wait for them to complete. Part
+	zero is run in the calling thread. The GIL should be released before
+	calling this.
+	partfunc = The function which performs one part of the calculation.
+	ctx = The data for the calculation. This is passed to partfunc.
+	nparts = The number of parts.
+	Returns: The number of parts actually used. This may be less than
+		requested if the worker threads could not be started.
+*/
+int runparallel(threadpartfunc partfunc, void *ctx, int nparts) {
+
+	// Nothing to divide, or the API was never imported.
+	if ((nparts <= 1) || (bfthreadsapi == NULL)) {
+		partfunc(ctx, 0, 1);
+		return 1;
+	}
+
+	return bfthreadsapi->runparts(partfunc, ctx, nparts);
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The following functions operate on a position shared between threads.
+	GCC compatible compilers use atomic operations. Other compilers use
+	a lock.
+*/
+
+/* Initialise a shared position.
+	sharedpos = The shared position.
+	pos = The initial position.
+	Returns: 0 if OK, or -1 if the lock could not be allocated.
+*/
+int sharedpos_init(struct sharedpos *sharedpos, Py_ssize_t pos) {
+
+	sharedpos->pos = pos;
+
+#if !defined(__GNUC__)
+	sharedpos->lock = PyThread_allocate_lock();
+	if (sharedpos->lock == NULL) {
+		return -1;
+	}
+#endif
+
+	return 0;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Free any resources used by a shared position.
+	sharedpos = The shared position.
+	Returns: Nothing.
+*/
+void sharedpos_free(struct sharedpos *sharedpos) {
+
+#if !defined(__GNUC__)
+	PyThread_free_lock(sharedpos->lock);
+#endif
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Get the current value of a shared position.
+	sharedpos = The shared position.
+	Returns: The current position.
+*/
+Py_ssize_t sharedpos_get(struct sharedpos *sharedpos) {
+
+#if defined(__GNUC__)
+	return __atomic_load_n(&sharedpos->pos, __ATOMIC_ACQUIRE);
+#else
+	Py_ssize_t pos;
+
+	PyThread_acquire_lock(sharedpos->lock, WAIT_LOCK);
+	pos = sharedpos->pos;
+	PyThread_release_lock(sharedpos->lock);
+
+	return pos;
+#endif
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Lower a shared position. If the shared position is already lower than
+	the new value, it is left unchanged.
+	sharedpos = The shared position.
+	pos = The new position.
+	Returns: Nothing.
+*/
+void sharedpos_lower(struct sharedpos *sharedpos, Py_ssize_t pos) {
+
+#if defined(__GNUC__)
+	Py_ssize_t current = __atomic_load_n(&sharedpos->pos, __ATOMIC_ACQUIRE);
+
+	// If another thread changes the value first, current is updated and
+	// the comparison repeated.
+	while ((pos < current) && !__atomic_compare_exchange_n(&sharedpos->pos, &current, pos, 
+						0, __ATOMIC_ACQ_REL, __ATOMIC_ACQUIRE)) {
+	}
+#else
+	PyThread_acquire_lock(sharedpos->lock, WAIT_LOCK);
+	if (pos < sharedpos->pos) {
+		sharedpos->pos = pos;
+	}
+	PyThread_release_lock(sharedpos->lock);
+#endif
+
+}
+
+/*--------------------------------------------------------------------------- */
@@ -0,0 +1,102 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   bytesthreads.h
+// Purpose:  Multi-threaded execution of calculations.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+#include "Python.h"
+
+/*--------------------------------------------------------------------------- */
+
+// The maximum number of threads which may be used for one calculation.
+#define BF_MAXTHREADS 64
+
+// The minimum number of bytes each thread will work on. Sequences which
+// are shorter than this will not be divided between threads.
+#define THREADS_MINCHUNK 262144
+
+// The boundaries between the parts of a sequence worked on by each thread
+// are aligned to this (the cache line size). This prevents threads from
+// writing to the same cache line.
+#define THREADS_CHUNKALIGN 64
+
+// The size of the blocks used when a search is divided between threads.
+// Threads search alternate blocks so that a result near the start of a
+// sequence is found quickly.
+#define THREADS_SEARCHBLOCK 65536
+
+// The name of the capsule exported by the threadpool module. When all the
+// functions are built as a single extension module it is exported by that
+// module instead.
+#if defined(BF_SINGLEMODULE)
+#define BFTHREADS_CAPSULE "bytesfunc._bytesfunc._C_API"
+#else
+#define BFTHREADS_CAPSULE "bytesfunc.threadpool._C_API"
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+// A function which performs one part of a calculation.
+// ctx = The data for the calculation. This is shared by all the parts.
+// part = The number of this part, starting from zero.
+// nparts = The total number of parts.
+typedef void (*threadpartfunc)(void *ctx, int part, int nparts);
+
+
+// The functions exported by the threadpool module.
+struct bfthreads_api {
+	int (*getthreads)(void);
+	int (*runparts)(threadpartfunc partfunc, void *ctx, int nparts);
+};
+
+// A position in a sequence shared between threads, which may only be lowered.
+// This is used to tell threads which are searching a sequence where to stop.
+struct sharedpos {
+	Py_ssize_t pos;
+#if !defined(__GNUC__)
+	PyThread_type_lock lock;
+#endif
+};
+
+/*--------------------------------------------------------------------------- */
+
+int getthreadcount(int threads);
+
+int calcthreadparts(int threads, Py_ssize_t arraylen);
+
+void partrange(Py_ssize_t arraylen, int part, int nparts, Py_ssize_t *start, Py_ssize_t *partlen);
+
+void partrangestep(Py_ssize_t arraylen, Py_ssize_t step, int part, int nparts, Py_ssize_t *start, Py_ssize_t *partlen);
+
+Py_ssize_t searchblocksize(Py_ssize_t step);
+
+int runparallel(threadpartfunc partfunc, void *ctx, int nparts);
+
+int sharedpos_init(struct sharedpos *sharedpos, Py_ssize_t pos);
+
+void sharedpos_free(struct sharedpos *sharedpos);
+
+Py_ssize_t sharedpos_get(struct sharedpos *sharedpos);
+
+void sharedpos_lower(struct sharedpos *sharedpos, Py_ssize_t pos);
+
+/*--------------------------------------------------------------------------- */
@@ -0,0 +1,3158 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   cmpmask.c
+// Purpose:  Compare values in a bytes or bytearray object and output a mask.
+// Language: C
+// Date:     18-Oct-2026.
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+/*--------------------------------------------------------------------------- */
+// This must be defined before "Python.h" in order for the pointers in the
+// argument parsing functions to work properly. 
+#define PY_SSIZE_T_CLEAN
+
+#include "Python.h"
+
+#include <limits.h>
+#include <math.h>
+
+#include "byteserrs.h"
+
+#include "bytesparams_base.h"
+#include "arrayops.h"
+
+#include "bytesparams_two.h"
+#include "bytesthreads.h"
+#include "bytesstride.h"
+
+/*--------------------------------------------------------------------------- */
+
+#include "simddefs.h"
+
+#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+#include "arm_neon.h"
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+// The output value for each element where the comparison is true. It is 
+// zero where the comparison is false.
+#define CMPMASK_TRUE 0xff
+
+/*--------------------------------------------------------------------------- */
+
+/* The SIMD functions to use for each compare operation. These are selected
+   once when the module is initialised, according to the SIMD features
+   supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	void (*eq_arr_num)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*eq_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3);
+	void (*gt_arr_num)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*gt_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3);
+	void (*ge_arr_num)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*ge_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3);
+	void (*lt_arr_num)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*lt_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3);
+	void (*le_arr_num)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*le_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3);
+	void (*ne_arr_num)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*ne_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3);
+} cmpmask_simdfuncs;
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   The output may be the same sequence as one of the inputs.
+   A compare with the parameter on the left is done by swapping the operator.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The output array.
+   param = The parameter to be compared to each array element.
+*/
+// param_arr_num
+void cmpmask_eq_1(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] == param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_eq_5(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] == data2[x]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 SSE2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86)
+void cmpmask_eq_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v16qi) _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		// Compare the slices.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] == param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_eq_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
+		// Compare the slices.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] == data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void cmpmask_eq_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// Compare the slices.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] == param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX2 void cmpmask_eq_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Compare the slices.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] == data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW version. See the non-SIMD version for the parameters.
+   AVX-512 compares produce a mask with one bit per element, so every type 
+   of comparison can be done directly. The bit mask is then expanded to
+   one byte per element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void cmpmask_eq_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX512BW void cmpmask_eq_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+void cmpmask_eq_1_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vceq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] == param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_eq_5_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		datasliceright = vld1_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vceq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] == data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 AARCH64 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARM_AARCH64)
+void cmpmask_eq_1_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vceqq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] == param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_eq_5_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		datasliceright = vld1q_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vceqq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] == data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   nosimd = If true, disable SIMD acceleration.
+   See the non-SIMD version for the other parameters.
+*/
+// param_arr_num
+void cmpmask_eq_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.eq_arr_num(arraylen, data1, param, data3);
+	} else {
+	#endif
+		cmpmask_eq_1(arraylen, data1, param, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_arr
+void cmpmask_eq_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.eq_arr_arr(arraylen, data1, data2, data3);
+	} else {
+	#endif
+		cmpmask_eq_5(arraylen, data1, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   The output may be the same sequence as one of the inputs.
+   A compare with the parameter on the left is done by swapping the operator.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The output array.
+   param = The parameter to be compared to each array element.
+*/
+// param_arr_num
+void cmpmask_gt_1(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] > param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_gt_5(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] > data2[x]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 SSE2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86)
+void cmpmask_gt_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice, compslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v16qi) _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		// Find the minimum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) resultslice, _mm_setzero_si128());
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] > param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_gt_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice, compslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
+		// Find the minimum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) resultslice, _mm_setzero_si128());
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] > data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void cmpmask_gt_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// Find the minimum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) resultslice, _mm256_setzero_si256());
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] > param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX2 void cmpmask_gt_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Find the minimum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) resultslice, _mm256_setzero_si256());
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] > data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW version. See the non-SIMD version for the parameters.
+   AVX-512 compares produce a mask with one bit per element, so every type 
+   of comparison can be done directly. The bit mask is then expanded to
+   one byte per element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void cmpmask_gt_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX512BW void cmpmask_gt_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+void cmpmask_gt_1_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vcgt_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] > param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_gt_5_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		datasliceright = vld1_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vcgt_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] > data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 AARCH64 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARM_AARCH64)
+void cmpmask_gt_1_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vcgtq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] > param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_gt_5_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		datasliceright = vld1q_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vcgtq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] > data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   nosimd = If true, disable SIMD acceleration.
+   See the non-SIMD version for the other parameters.
+*/
+// param_arr_num
+void cmpmask_gt_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.gt_arr_num(arraylen, data1, param, data3);
+	} else {
+	#endif
+		cmpmask_gt_1(arraylen, data1, param, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_arr
+void cmpmask_gt_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.gt_arr_arr(arraylen, data1, data2, data3);
+	} else {
+	#endif
+		cmpmask_gt_5(arraylen, data1, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   The output may be the same sequence as one of the inputs.
+   A compare with the parameter on the left is done by swapping the operator.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The output array.
+   param = The parameter to be compared to each array element.
+*/
+// param_arr_num
+void cmpmask_ge_1(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] >= param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_ge_5(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] >= data2[x]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 SSE2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86)
+void cmpmask_ge_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice, compslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v16qi) _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		// Find the maximum values, and check where they are the left values.
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] >= param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_ge_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice, compslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
+		// Find the maximum values, and check where they are the left values.
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] >= data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void cmpmask_ge_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// Find the maximum values, and check where they are the left values.
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] >= param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX2 void cmpmask_ge_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Find the maximum values, and check where they are the left values.
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] >= data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW version. See the non-SIMD version for the parameters.
+   AVX-512 compares produce a mask with one bit per element, so every type 
+   of comparison can be done directly. The bit mask is then expanded to
+   one byte per element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void cmpmask_ge_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX512BW void cmpmask_ge_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+void cmpmask_ge_1_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vcge_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] >= param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_ge_5_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		datasliceright = vld1_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vcge_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] >= data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 AARCH64 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARM_AARCH64)
+void cmpmask_ge_1_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vcgeq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] >= param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_ge_5_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		datasliceright = vld1q_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vcgeq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] >= data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   nosimd = If true, disable SIMD acceleration.
+   See the non-SIMD version for the other parameters.
+*/
+// param_arr_num
+void cmpmask_ge_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.ge_arr_num(arraylen, data1, param, data3);
+	} else {
+	#endif
+		cmpmask_ge_1(arraylen, data1, param, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_arr
+void cmpmask_ge_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.ge_arr_arr(arraylen, data1, data2, data3);
+	} else {
+	#endif
+		cmpmask_ge_5(arraylen, data1, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   The output may be the same sequence as one of the inputs.
+   A compare with the parameter on the left is done by swapping the operator.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The output array.
+   param = The parameter to be compared to each array element.
+*/
+// param_arr_num
+void cmpmask_lt_1(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] < param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_lt_5(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] < data2[x]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 SSE2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86)
+void cmpmask_lt_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice, compslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v16qi) _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		// Find the maximum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) resultslice, _mm_setzero_si128());
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] < param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_lt_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice, compslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
+		// Find the maximum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) resultslice, _mm_setzero_si128());
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] < data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void cmpmask_lt_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// Find the maximum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) resultslice, _mm256_setzero_si256());
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] < param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX2 void cmpmask_lt_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Find the maximum values, check where they are the left values, and
+		// then invert the result.
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) resultslice, _mm256_setzero_si256());
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] < data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW version. See the non-SIMD version for the parameters.
+   AVX-512 compares produce a mask with one bit per element, so every type 
+   of comparison can be done directly. The bit mask is then expanded to
+   one byte per element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void cmpmask_lt_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX512BW void cmpmask_lt_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+void cmpmask_lt_1_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vclt_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] < param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_lt_5_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		datasliceright = vld1_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vclt_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] < data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 AARCH64 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARM_AARCH64)
+void cmpmask_lt_1_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vcltq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] < param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_lt_5_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		datasliceright = vld1q_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vcltq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] < data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   nosimd = If true, disable SIMD acceleration.
+   See the non-SIMD version for the other parameters.
+*/
+// param_arr_num
+void cmpmask_lt_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.lt_arr_num(arraylen, data1, param, data3);
+	} else {
+	#endif
+		cmpmask_lt_1(arraylen, data1, param, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_arr
+void cmpmask_lt_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.lt_arr_arr(arraylen, data1, data2, data3);
+	} else {
+	#endif
+		cmpmask_lt_5(arraylen, data1, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   The output may be the same sequence as one of the inputs.
+   A compare with the parameter on the left is done by swapping the operator.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The output array.
+   param = The parameter to be compared to each array element.
+*/
+// param_arr_num
+void cmpmask_le_1(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] <= param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_le_5(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] <= data2[x]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 SSE2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86)
+void cmpmask_le_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice, compslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v16qi) _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		// Find the minimum values, and check where they are the left values.
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] <= param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_le_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice, compslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
+		// Find the minimum values, and check where they are the left values.
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceleft);
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] <= data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void cmpmask_le_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// Find the minimum values, and check where they are the left values.
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] <= param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX2 void cmpmask_le_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Find the minimum values, and check where they are the left values.
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceleft);
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] <= data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW version. See the non-SIMD version for the parameters.
+   AVX-512 compares produce a mask with one bit per element, so every type 
+   of comparison can be done directly. The bit mask is then expanded to
+   one byte per element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void cmpmask_le_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX512BW void cmpmask_le_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+void cmpmask_le_1_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vcle_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] <= param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_le_5_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		datasliceright = vld1_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vcle_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] <= data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 AARCH64 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARM_AARCH64)
+void cmpmask_le_1_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vcleq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] <= param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_le_5_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		datasliceright = vld1q_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vcleq_u8(datasliceleft, datasliceright));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] <= data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   nosimd = If true, disable SIMD acceleration.
+   See the non-SIMD version for the other parameters.
+*/
+// param_arr_num
+void cmpmask_le_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.le_arr_num(arraylen, data1, param, data3);
+	} else {
+	#endif
+		cmpmask_le_1(arraylen, data1, param, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_arr
+void cmpmask_le_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.le_arr_arr(arraylen, data1, data2, data3);
+	} else {
+	#endif
+		cmpmask_le_5(arraylen, data1, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   The output may be the same sequence as one of the inputs.
+   A compare with the parameter on the left is done by swapping the operator.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The output array.
+   param = The parameter to be compared to each array element.
+*/
+// param_arr_num
+void cmpmask_ne_1(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] != param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_ne_5(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = (data1[x] != data2[x]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 SSE2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86)
+void cmpmask_ne_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v16qi) _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		// Compare for equality, and then invert the result.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) resultslice, _mm_setzero_si128());
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] != param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_ne_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi datasliceleft, datasliceright;
+	v16qi resultslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
+		// Compare for equality, and then invert the result.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) resultslice, _mm_setzero_si128());
+		// Store the compare result as the mask.
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] != data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void cmpmask_ne_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice;
+
+	// Initialise the comparison values.
+	datasliceright = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// Compare for equality, and then invert the result.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) resultslice, _mm256_setzero_si256());
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] != param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX2 void cmpmask_ne_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Compare for equality, and then invert the result.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) resultslice, _mm256_setzero_si256());
+		// Store the compare result as the mask.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] != data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW version. See the non-SIMD version for the parameters.
+   AVX-512 compares produce a mask with one bit per element, so every type 
+   of comparison can be done directly. The bit mask is then expanded to
+   one byte per element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void cmpmask_ne_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX512BW void cmpmask_ne_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		_mm512_storeu_si512(&data3[index], _mm512_movm_epi8(resultmask));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_movm_epi8(resultmask));
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+void cmpmask_ne_1_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vmvn_u8(vceq_u8(datasliceleft, datasliceright)));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] != param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_ne_5_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data1[index]);
+		datasliceright = vld1_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1_u8( &data3[index], vmvn_u8(vceq_u8(datasliceleft, datasliceright)));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] != data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 AARCH64 version. See the non-SIMD version for the parameters.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_ARM_AARCH64)
+void cmpmask_ne_1_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Initialise the comparison values.
+	datasliceright = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vmvnq_u8(vceqq_u8(datasliceleft, datasliceright)));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] != param) ? CMPMASK_TRUE : 0;
+	}
+
+}
+
+
+// param_arr_arr
+void cmpmask_ne_5_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data1[index]);
+		datasliceright = vld1q_u8( &data2[index]);
+		// Store the compare result as the mask.
+		vst1q_u8( &data3[index], vmvnq_u8(vceqq_u8(datasliceleft, datasliceright)));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = (data1[index] != data2[index]) ? CMPMASK_TRUE : 0;
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   nosimd = If true, disable SIMD acceleration.
+   See the non-SIMD version for the other parameters.
+*/
+// param_arr_num
+void cmpmask_ne_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.ne_arr_num(arraylen, data1, param, data3);
+	} else {
+	#endif
+		cmpmask_ne_1(arraylen, data1, param, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_arr
+void cmpmask_ne_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		cmpmask_simdfuncs.ne_arr_arr(arraylen, data1, data2, data3);
+	} else {
+	#endif
+		cmpmask_ne_5(arraylen, data1, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+/* Select the SIMD functions for this CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static void cmpmask_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		cmpmask_simdfuncs.eq_arr_num = cmpmask_eq_1_avx512_simd;
+		cmpmask_simdfuncs.eq_arr_arr = cmpmask_eq_5_avx512_simd;
+		cmpmask_simdfuncs.gt_arr_num = cmpmask_gt_1_avx512_simd;
+		cmpmask_simdfuncs.gt_arr_arr = cmpmask_gt_5_avx512_simd;
+		cmpmask_simdfuncs.ge_arr_num = cmpmask_ge_1_avx512_simd;
+		cmpmask_simdfuncs.ge_arr_arr = cmpmask_ge_5_avx512_simd;
+		cmpmask_simdfuncs.lt_arr_num = cmpmask_lt_1_avx512_simd;
+		cmpmask_simdfuncs.lt_arr_arr = cmpmask_lt_5_avx512_simd;
+		cmpmask_simdfuncs.le_arr_num = cmpmask_le_1_avx512_simd;
+		cmpmask_simdfuncs.le_arr_arr = cmpmask_le_5_avx512_simd;
+		cmpmask_simdfuncs.ne_arr_num = cmpmask_ne_1_avx512_simd;
+		cmpmask_simdfuncs.ne_arr_arr = cmpmask_ne_5_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		cmpmask_simdfuncs.eq_arr_num = cmpmask_eq_1_avx2_simd;
+		cmpmask_simdfuncs.eq_arr_arr = cmpmask_eq_5_avx2_simd;
+		cmpmask_simdfuncs.gt_arr_num = cmpmask_gt_1_avx2_simd;
+		cmpmask_simdfuncs.gt_arr_arr = cmpmask_gt_5_avx2_simd;
+		cmpmask_simdfuncs.ge_arr_num = cmpmask_ge_1_avx2_simd;
+		cmpmask_simdfuncs.ge_arr_arr = cmpmask_ge_5_avx2_simd;
+		cmpmask_simdfuncs.lt_arr_num = cmpmask_lt_1_avx2_simd;
+		cmpmask_simdfuncs.lt_arr_arr = cmpmask_lt_5_avx2_simd;
+		cmpmask_simdfuncs.le_arr_num = cmpmask_le_1_avx2_simd;
+		cmpmask_simdfuncs.le_arr_arr = cmpmask_le_5_avx2_simd;
+		cmpmask_simdfuncs.ne_arr_num = cmpmask_ne_1_avx2_simd;
+		cmpmask_simdfuncs.ne_arr_arr = cmpmask_ne_5_avx2_simd;
+	} else {
+		cmpmask_simdfuncs.eq_arr_num = cmpmask_eq_1_x86_simd;
+		cmpmask_simdfuncs.eq_arr_arr = cmpmask_eq_5_x86_simd;
+		cmpmask_simdfuncs.gt_arr_num = cmpmask_gt_1_x86_simd;
+		cmpmask_simdfuncs.gt_arr_arr = cmpmask_gt_5_x86_simd;
+		cmpmask_simdfuncs.ge_arr_num = cmpmask_ge_1_x86_simd;
+		cmpmask_simdfuncs.ge_arr_arr = cmpmask_ge_5_x86_simd;
+		cmpmask_simdfuncs.lt_arr_num = cmpmask_lt_1_x86_simd;
+		cmpmask_simdfuncs.lt_arr_arr = cmpmask_lt_5_x86_simd;
+		cmpmask_simdfuncs.le_arr_num = cmpmask_le_1_x86_simd;
+		cmpmask_simdfuncs.le_arr_arr = cmpmask_le_5_x86_simd;
+		cmpmask_simdfuncs.ne_arr_num = cmpmask_ne_1_x86_simd;
+		cmpmask_simdfuncs.ne_arr_arr = cmpmask_ne_5_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	cmpmask_simdfuncs.eq_arr_num = cmpmask_eq_1_armv7_simd;
+	cmpmask_simdfuncs.eq_arr_arr = cmpmask_eq_5_armv7_simd;
+	cmpmask_simdfuncs.gt_arr_num = cmpmask_gt_1_armv7_simd;
+	cmpmask_simdfuncs.gt_arr_arr = cmpmask_gt_5_armv7_simd;
+	cmpmask_simdfuncs.ge_arr_num = cmpmask_ge_1_armv7_simd;
+	cmpmask_simdfuncs.ge_arr_arr = cmpmask_ge_5_armv7_simd;
+	cmpmask_simdfuncs.lt_arr_num = cmpmask_lt_1_armv7_simd;
+	cmpmask_simdfuncs.lt_arr_arr = cmpmask_lt_5_armv7_simd;
+	cmpmask_simdfuncs.le_arr_num = cmpmask_le_1_armv7_simd;
+	cmpmask_simdfuncs.le_arr_arr = cmpmask_le_5_armv7_simd;
+	cmpmask_simdfuncs.ne_arr_num = cmpmask_ne_1_armv7_simd;
+	cmpmask_simdfuncs.ne_arr_arr = cmpmask_ne_5_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	cmpmask_simdfuncs.eq_arr_num = cmpmask_eq_1_armv8_simd;
+	cmpmask_simdfuncs.eq_arr_arr = cmpmask_eq_5_armv8_simd;
+	cmpmask_simdfuncs.gt_arr_num = cmpmask_gt_1_armv8_simd;
+	cmpmask_simdfuncs.gt_arr_arr = cmpmask_gt_5_armv8_simd;
+	cmpmask_simdfuncs.ge_arr_num = cmpmask_ge_1_armv8_simd;
+	cmpmask_simdfuncs.ge_arr_arr = cmpmask_ge_5_armv8_simd;
+	cmpmask_simdfuncs.lt_arr_num = cmpmask_lt_1_armv8_simd;
+	cmpmask_simdfuncs.lt_arr_arr = cmpmask_lt_5_armv8_simd;
+	cmpmask_simdfuncs.le_arr_num = cmpmask_le_1_armv8_simd;
+	cmpmask_simdfuncs.le_arr_arr = cmpmask_le_5_armv8_simd;
+	cmpmask_simdfuncs.ne_arr_num = cmpmask_ne_1_armv8_simd;
+	cmpmask_simdfuncs.ne_arr_arr = cmpmask_ne_5_armv8_simd;
+	#endif
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* Call the function for the requested compare operation, where the array
+   is compared to a single parameter. See the non-SIMD functions for the 
+   parameters.
+*/
+static void cmpmask_arr_num_select(signed int opcode, Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	switch(opcode) {
+		case OP_AF_EQ: {
+			cmpmask_eq_1_select(arraylen, nosimd, data1, param, data3);
+			break;
+		}
+		case OP_AF_GT: {
+			cmpmask_gt_1_select(arraylen, nosimd, data1, param, data3);
+			break;
+		}
+		case OP_AF_GE: {
+			cmpmask_ge_1_select(arraylen, nosimd, data1, param, data3);
+			break;
+		}
+		case OP_AF_LT: {
+			cmpmask_lt_1_select(arraylen, nosimd, data1, param, data3);
+			break;
+		}
+		case OP_AF_LE: {
+			cmpmask_le_1_select(arraylen, nosimd, data1, param, data3);
+			break;
+		}
+		case OP_AF_NE: {
+			cmpmask_ne_1_select(arraylen, nosimd, data1, param, data3);
+			break;
+		}
+	}
+
+}
+
+/* Call the function for the requested compare operation, where two arrays
+   are compared. See the non-SIMD functions for the parameters.
+*/
+static void cmpmask_arr_arr_select(signed int opcode, Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	switch(opcode) {
+		case OP_AF_EQ: {
+			cmpmask_eq_5_select(arraylen, nosimd, data1, data2, data3);
+			break;
+		}
+		case OP_AF_GT: {
+			cmpmask_gt_5_select(arraylen, nosimd, data1, data2, data3);
+			break;
+		}
+		case OP_AF_GE: {
+			cmpmask_ge_5_select(arraylen, nosimd, data1, data2, data3);
+			break;
+		}
+		case OP_AF_LT: {
+			cmpmask_lt_5_select(arraylen, nosimd, data1, data2, data3);
+			break;
+		}
+		case OP_AF_LE: {
+			cmpmask_le_5_select(arraylen, nosimd, data1, data2, data3);
+			break;
+		}
+		case OP_AF_NE: {
+			cmpmask_ne_5_select(arraylen, nosimd, data1, data2, data3);
+			break;
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Calculate one part of the sequences. If the calculation is not divided
+	between threads, then there is just one part covering the whole sequence.
+	When the parameter is on the left, the operator is swapped so that it
+	can be on the right instead. When there is no output sequence, the 
+	results overwrite the input sequence.
+	ctx = The parsed parameters (struct args_params_2).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void cmpmask_part(void *ctx, int part, int nparts) {
+
+	struct args_params_2 *bytesdata = (struct args_params_2 *) ctx;
+
+	// The range of this part of the sequences.
+	Py_ssize_t start, partlen;
+
+	partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
+
+	// Select the correct implementation.
+	switch (bytesdata->paramcat) {
+		case param_arr_num_none : {
+			cmpmask_arr_num_select(bytesdata->opcode, partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param, bytesdata->bytes1.B + start);
+			break;
+		}
+		case param_arr_num_arr : {
+			cmpmask_arr_num_select(bytesdata->opcode, partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_num_arr_none : {
+			cmpmask_arr_num_select(strideswapop(bytesdata->opcode), partlen, bytesdata->nosimd, bytesdata->bytes2.B + start, bytesdata->param, bytesdata->bytes2.B + start);
+			break;
+		}
+		case param_num_arr_arr : {
+			cmpmask_arr_num_select(strideswapop(bytesdata->opcode), partlen, bytesdata->nosimd, bytesdata->bytes2.B + start, bytesdata->param, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_arr_arr_none : {
+			cmpmask_arr_arr_select(bytesdata->opcode, partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start, bytesdata->bytes1.B + start);
+			break;
+		}
+		case param_arr_arr_arr : {
+			cmpmask_arr_arr_select(bytesdata->opcode, partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start, bytesdata->bytes3.B + start);
+			break;
+		}
+		// The other categories are only used by functions which take a mask.
+		default : {
+			break;
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_cmpmask(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_2 bytesdata = ARGSINIT_TWO;
+
+	// The number of parts to divide the calculation into.
+	int nparts;
+
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python. 
+	bytesdata = getparams_two_op(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+
+	// Call the C function.
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	runparallel(cmpmask_part, &bytesdata, nparts);
+	BF_END_ALLOW_THREADS
+
+	// Release the buffers. 
+	releasebuffers_two(bytesdata);
+
+
+	// Return the new output sequence if one was created.
+	if (bytesdata.outobj != NULL) {
+		return bytesdata.outobj;
+	}
+
+	// Everything was successful.
+	Py_RETURN_NONE;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(cmpmask__doc__,
+"cmpmask \n\
+_____________________________ \n\
+\n\
+Compare the values in a bytes or bytearray object, and output the result \n\
+of each comparison as a mask. Each output element is 255 where the \n\
+comparison is true, and 0 where it is false. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          [255 if x > param else 0 for x in sequence1] \n\
+or                      [255 if param > x else 0 for x in sequence1] \n\
+or                      [255 if x > y else 0 for x,y in zip(sequence1, sequence2)] \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  cmpmask(opstr, sequence1, param) \n\
+  cmpmask(opstr, sequence1, param, outpsequence) \n\
+  cmpmask(opstr, param, sequence1) \n\
+  cmpmask(opstr, param, sequence1, outpsequence) \n\
+  cmpmask(opstr, sequence1, sequence2) \n\
+  cmpmask(opstr, sequence1, sequence2, outpsequence) \n\
+  cmpmask(opstr, sequence1, param, maxlen=y) \n\
+  cmpmask(opstr, sequence1, param, start=i, stop=j) \n\
+  cmpmask(opstr, sequence1, param, nosimd=False) \n\
+  cmpmask(opstr, sequence1, param, threads=4) \n\
+  result = cmpmask(opstr, sequence1, param, outtype=bytes) \n\
+\n\
+* opstr - The arithmetic comparison operation as a string. \n\
+          These are: '==', '>', '>=', '<', '<=', '!='. \n\
+* sequence1 - The first input data bytes or bytearray sequence to be \n\
+  examined. If no output sequence is provided the results will overwrite \n\
+  the input data. \n\
+* param - A non-sequence numeric parameter. \n\
+* sequence2 - A second input data sequence. Each element in this sequence is \n\
+  compared to the corresponding element in the first sequence. \n\
+* outpsequence - The output sequence. This parameter is optional. \n\
+* maxlen - Limit the length of the sequence used. This must be a valid \n\
+  positive integer. If a zero or negative length, or a value which is \n\
+  greater than the actual length of the sequence is specified, this \n\
+  parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. The same part of every sequence is \n\
+  used. These are optional keyword parameters and are applied before \n\
+  maxlen. No data is copied. \n\
+* nosimd - If True, SIMD acceleration is disabled. This parameter is \n\
+  optional. The default is FALSE. \n\
+* threads - The number of threads to divide the calculation between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
+* outtype - If bytes or bytearray, a new sequence of that type is \n\
+  created, filled with the results, and returned. The input sequences \n\
+  are not changed and may be read only. The new sequence has the length \n\
+  of the part of the input which is used. This cannot be combined with \n\
+  outpsequence. This is an optional keyword parameter. \n\
+* result - The new sequence if outtype was given, otherwise None. \n\
+");
+
+
+/*--------------------------------------------------------------------------- */
+
+/* A list of all the methods defined by this module. 
+ "cmpmask" is the name seen inside of Python. 
+ "py_cmpmask" is the name of the C function handling the Python call. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
+ The {NULL, NULL} entry indicates the end of the method definitions. */
+static PyMethodDef cmpmask_methods[] = {
+	{"cmpmask",  (PyCFunction)py_cmpmask, BF_METHFLAGS, cmpmask__doc__}, 
+	{NULL, NULL, 0, NULL}
+};
+
+
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int cmpmask_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	cmpmask_initsimd();
+	#endif
+
+	return PyModule_AddFunctions(module, cmpmask_methods);
+};
+
+#else
+
+static struct PyModuleDef cmpmaskmodule = {
+    PyModuleDef_HEAD_INIT,
+    "cmpmask",
+    NULL,
+    -1,
+    cmpmask_methods
+};
+
+PyMODINIT_FUNC PyInit_cmpmask(void)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	cmpmask_initsimd();
+	#endif
+
+    return PyModule_Create(&cmpmaskmodule);
+};
+
+#endif
+
+/*--------------------------------------------------------------------------- */
+
@@ -39,6 +39,9 @@
 #include "arrayops.h"
 
 #include "bytesparams_allany.h"
+#include "bytesparams_many.h"
+#include "bytesthreads.h"
+#include "bytesstride.h"
 
 #include "simddefs.h"
 #if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
@@ -46,6 +49,23 @@
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+
+/* The SIMD functions to use for each compare operation. These are selected
+   once when the module is initialised, according to the SIMD features
+   supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	Py_ssize_t (*eq)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	Py_ssize_t (*gt)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	Py_ssize_t (*ge)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	Py_ssize_t (*lt)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	Py_ssize_t (*le)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+	Py_ssize_t (*ne)(Py_ssize_t arraylen, unsigned char *data, unsigned char param1);
+} findindex_simdfuncs;
+#endif
+
 /*--------------------------------------------------------------------------- */
 
 /*--------------------------------------------------------------------------- */
@@ -100,7 +120,7 @@ Py_ssize_t findindex_eq_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -111,11 +131,78 @@ Py_ssize_t findindex_eq_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Compare the slices.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0x0000) {
+			// Home in on the exact location.
+			for (fineindex = index; fineindex < alignedlength; fineindex++) {
+				if (data[fineindex] == param1) {
+					return fineindex;
+				}
+			}
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] == param1) {
+			return index;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 Py_ssize_t findindex_eq_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index, fineindex; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Compare the slices.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0x0000) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0x00000000) {
 			// Home in on the exact location.
 			for (fineindex = index; fineindex < alignedlength; fineindex++) {
 				if (data[fineindex] == param1) {
@@ -139,6 +226,70 @@ Py_ssize_t findindex_eq_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW Py_ssize_t findindex_eq_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		// The lowest bit set in the mask is the first matching element.
+		if (resultmask != 0) {
+			return index + __builtin_ctzll(resultmask);
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_EQ);
+		if (resultmask != 0) {
+			return alignedlength + __builtin_ctzll(resultmask);
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -276,7 +427,7 @@ Py_ssize_t findindex_eq_armv8_simd(Py_ssize_t arraylen, unsigned char *data, uns
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -285,18 +436,7 @@ Py_ssize_t findindex_eq_select(Py_ssize_t arraylen, int nosimd, unsigned char *d
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return findindex_eq_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return findindex_eq_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return findindex_eq_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return findindex_simdfuncs.eq(arraylen, data1, param);
 	} else {
 	#endif
 		return findindex_eq(arraylen, data1, param);
@@ -361,7 +501,7 @@ Py_ssize_t findindex_gt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -372,14 +512,84 @@ Py_ssize_t findindex_gt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Find the maximum values. 
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// If this is different from our compare parameter, then at
+		// least one value is greater than. 
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
+			// Home in on the exact location.
+			for (fineindex = index; fineindex < alignedlength; fineindex++) {
+				if (data[fineindex] > param1) {
+					return fineindex;
+				}
+			}
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] > param1) {
+			return index;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 Py_ssize_t findindex_gt_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index, fineindex; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// If this is different from our compare parameter, then at
 		// least one value is greater than. 
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			// Home in on the exact location.
 			for (fineindex = index; fineindex < alignedlength; fineindex++) {
 				if (data[fineindex] > param1) {
@@ -403,6 +613,70 @@ Py_ssize_t findindex_gt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW Py_ssize_t findindex_gt_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		// The lowest bit set in the mask is the first matching element.
+		if (resultmask != 0) {
+			return index + __builtin_ctzll(resultmask);
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLE);
+		if (resultmask != 0) {
+			return alignedlength + __builtin_ctzll(resultmask);
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -540,7 +814,7 @@ Py_ssize_t findindex_gt_armv8_simd(Py_ssize_t arraylen, unsigned char *data, uns
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -549,18 +823,7 @@ Py_ssize_t findindex_gt_select(Py_ssize_t arraylen, int nosimd, unsigned char *d
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return findindex_gt_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return findindex_gt_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return findindex_gt_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return findindex_simdfuncs.gt(arraylen, data1, param);
 	} else {
 	#endif
 		return findindex_gt(arraylen, data1, param);
@@ -625,7 +888,7 @@ Py_ssize_t findindex_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -636,14 +899,14 @@ Py_ssize_t findindex_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then at
 		// least one value is greater than or equal to.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0x0000) {
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0x0000) {
 			// Home in on the exact location.
 			for (fineindex = index; fineindex < alignedlength; fineindex++) {
 				if (data[fineindex] >= param1) {
@@ -668,7 +931,7 @@ Py_ssize_t findindex_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 
 
 /*--------------------------------------------------------------------------- */
-/* ARMv7 version.
+/* x86 AVX2 SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
@@ -677,8 +940,8 @@ Py_ssize_t findindex_ge_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
    Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
 		if it was not found.
 */
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-Py_ssize_t findindex_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 Py_ssize_t findindex_ge_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
 	Py_ssize_t index, fineindex; 
@@ -687,26 +950,33 @@ Py_ssize_t findindex_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, uns
 	Py_ssize_t alignedlength;
 	unsigned int y;
 
-	uint8x8_t datasliceleft, datasliceright;
-	uint8x8_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1_u8( compvals);
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = vld1_u8( &data[index]);
-		// The actual SIMD operation. 
-		resultslice = vcge_u8(datasliceleft, datasliceright);
-		if (vreinterpret_u64_u8(resultslice) != 0x0000000000000000) {
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
+		// Find the minimum values. 
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then at
+		// least one value is greater than or equal to.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0x00000000) {
 			// Home in on the exact location.
 			for (fineindex = index; fineindex < alignedlength; fineindex++) {
 				if (data[fineindex] >= param1) {
@@ -731,66 +1001,59 @@ Py_ssize_t findindex_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, uns
 
 
 /*--------------------------------------------------------------------------- */
-/* ARMv8 version.
+/* x86 AVX-512BW SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
    param1 = The parameter to be applied to each array element.
-   nosimd = If true, disable SIMD.
    Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
 		if it was not found.
 */
-#if defined(AF_HASSIMD_ARM_AARCH64)
-Py_ssize_t findindex_ge_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW Py_ssize_t findindex_ge_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
-	Py_ssize_t index, fineindex; 
+	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
 	unsigned int y;
 
-	uint8x16_t datasliceleft, datasliceright;
-	uint8x16_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
-	uint64x2_t veccombine;
-	uint64_t highresult, lowresult;
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1q_u8( compvals);
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = vld1q_u8( &data[index]);
-		// The actual SIMD operation. 
-		resultslice = vcgeq_u8(datasliceleft, datasliceright);
-		// Combine the result to two 64 bit vectors.
-		veccombine = vreinterpretq_u64_u8(resultslice);
-		// Get the high and low lanes of the combined vector.
-		lowresult = vgetq_lane_u64(veccombine, 0);
-		highresult = vgetq_lane_u64(veccombine, 1);
-		// Compare the results of the SIMD operation.
-		if ((lowresult != 0x0000000000000000) || (highresult != 0x0000000000000000)) {
-			// Home in on the exact location.
-			for (fineindex = index; fineindex < alignedlength; fineindex++) {
-				if (data[fineindex] >= param1) {
-					return fineindex;
-				}
-			}
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		// The lowest bit set in the mask is the first matching element.
+		if (resultmask != 0) {
+			return index + __builtin_ctzll(resultmask);
 		}
 	}
 
-	// Get the max value within the left over elements at the end of the array.
-	for (index = alignedlength; index < arraylen; index++) {
-		if (data[index] >= param1) {
-			return index;
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		if (resultmask != 0) {
+			return alignedlength + __builtin_ctzll(resultmask);
 		}
 	}
 
@@ -801,30 +1064,153 @@ Py_ssize_t findindex_ge_armv8_simd(Py_ssize_t arraylen, unsigned char *data, uns
 #endif
 
 
-
 /*--------------------------------------------------------------------------- */
-/* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+/* ARMv7 version.
+   opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
-   data1 = The first data array.
-   param = The parameter to be applied to each array element.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
 */
-Py_ssize_t findindex_ge_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) { 
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+Py_ssize_t findindex_ge_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index, fineindex; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x8_t datasliceleft, datasliceright;
+	uint8x8_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data[index]);
+		// The actual SIMD operation. 
+		resultslice = vcge_u8(datasliceleft, datasliceright);
+		if (vreinterpret_u64_u8(resultslice) != 0x0000000000000000) {
+			// Home in on the exact location.
+			for (fineindex = index; fineindex < alignedlength; fineindex++) {
+				if (data[fineindex] >= param1) {
+					return fineindex;
+				}
+			}
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] >= param1) {
+			return index;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_ARM_AARCH64)
+Py_ssize_t findindex_ge_armv8_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index, fineindex; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x16_t datasliceleft, datasliceright;
+	uint8x16_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+	uint64x2_t veccombine;
+	uint64_t highresult, lowresult;
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1q_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1q_u8( &data[index]);
+		// The actual SIMD operation. 
+		resultslice = vcgeq_u8(datasliceleft, datasliceright);
+		// Combine the result to two 64 bit vectors.
+		veccombine = vreinterpretq_u64_u8(resultslice);
+		// Get the high and low lanes of the combined vector.
+		lowresult = vgetq_lane_u64(veccombine, 0);
+		highresult = vgetq_lane_u64(veccombine, 1);
+		// Compare the results of the SIMD operation.
+		if ((lowresult != 0x0000000000000000) || (highresult != 0x0000000000000000)) {
+			// Home in on the exact location.
+			for (fineindex = index; fineindex < alignedlength; fineindex++) {
+				if (data[fineindex] >= param1) {
+					return fineindex;
+				}
+			}
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] >= param1) {
+			return index;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
 
-	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
-	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return findindex_ge_x86_simd(arraylen, data1, param);
-		#endif
 
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return findindex_ge_armv7_simd(arraylen, data1, param);
-		#endif
 
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return findindex_ge_armv8_simd(arraylen, data1, param);
-		#endif
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   param = The parameter to be applied to each array element.
+*/
+Py_ssize_t findindex_ge_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) { 
 
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		return findindex_simdfuncs.ge(arraylen, data1, param);
 	} else {
 	#endif
 		return findindex_ge(arraylen, data1, param);
@@ -889,7 +1275,7 @@ Py_ssize_t findindex_lt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -900,14 +1286,84 @@ Py_ssize_t findindex_lt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Find the minimum values. 
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// If this is different from our compare parameter, then at
+		// least one value is less than.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
+			// Home in on the exact location.
+			for (fineindex = index; fineindex < alignedlength; fineindex++) {
+				if (data[fineindex] < param1) {
+					return fineindex;
+				}
+			}
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] < param1) {
+			return index;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 Py_ssize_t findindex_lt_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index, fineindex; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// If this is different from our compare parameter, then at
 		// least one value is less than.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			// Home in on the exact location.
 			for (fineindex = index; fineindex < alignedlength; fineindex++) {
 				if (data[fineindex] < param1) {
@@ -931,6 +1387,70 @@ Py_ssize_t findindex_lt_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW Py_ssize_t findindex_lt_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		// The lowest bit set in the mask is the first matching element.
+		if (resultmask != 0) {
+			return index + __builtin_ctzll(resultmask);
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LT);
+		if (resultmask != 0) {
+			return alignedlength + __builtin_ctzll(resultmask);
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -1068,7 +1588,7 @@ Py_ssize_t findindex_lt_armv8_simd(Py_ssize_t arraylen, unsigned char *data, uns
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -1077,18 +1597,7 @@ Py_ssize_t findindex_lt_select(Py_ssize_t arraylen, int nosimd, unsigned char *d
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return findindex_lt_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return findindex_lt_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return findindex_lt_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return findindex_simdfuncs.lt(arraylen, data1, param);
 	} else {
 	#endif
 		return findindex_lt(arraylen, data1, param);
@@ -1153,7 +1662,7 @@ Py_ssize_t findindex_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -1164,14 +1673,14 @@ Py_ssize_t findindex_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
 		// Find the maximum values. 
-		compslice = __builtin_ia32_pmaxub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_max_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then at
 		// least one value is less than or equal to.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0x0000) {
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0x0000) {
 			// Home in on the exact location.
 			for (fineindex = index; fineindex < alignedlength; fineindex++) {
 				if (data[fineindex] <= param1) {
@@ -1196,7 +1705,7 @@ Py_ssize_t findindex_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 
 
 /*--------------------------------------------------------------------------- */
-/* ARMv7 version.
+/* x86 AVX2 SIMD version.
    opcode = The operator or function code to select what to execute.
    arraylen = The length of the data arrays.
    data = The input data array.
@@ -1205,8 +1714,8 @@ Py_ssize_t findindex_le_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
    Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
 		if it was not found.
 */
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-Py_ssize_t findindex_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 Py_ssize_t findindex_le_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
 
 	// array index counter. 
 	Py_ssize_t index, fineindex; 
@@ -1215,26 +1724,160 @@ Py_ssize_t findindex_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, uns
 	Py_ssize_t alignedlength;
 	unsigned int y;
 
-	uint8x8_t datasliceleft, datasliceright;
-	uint8x8_t resultslice;
-	unsigned char compvals[CHARSIMDSIZE];
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
 
 	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = vld1_u8( compvals);
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = vld1_u8( &data[index]);
-		// The actual SIMD operation. 
-		resultslice = vcle_u8(datasliceleft, datasliceright);
-		if (vreinterpret_u64_u8(resultslice) != 0x0000000000000000) {
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
+		// Find the maximum values. 
+		compslice = (v32qi) _mm256_max_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then at
+		// least one value is less than or equal to.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0x00000000) {
+			// Home in on the exact location.
+			for (fineindex = index; fineindex < alignedlength; fineindex++) {
+				if (data[fineindex] <= param1) {
+					return fineindex;
+				}
+			}
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] <= param1) {
+			return index;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW Py_ssize_t findindex_le_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		// The lowest bit set in the mask is the first matching element.
+		if (resultmask != 0) {
+			return index + __builtin_ctzll(resultmask);
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_LE);
+		if (resultmask != 0) {
+			return alignedlength + __builtin_ctzll(resultmask);
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+Py_ssize_t findindex_le_armv7_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index, fineindex; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x8_t datasliceleft, datasliceright;
+	uint8x8_t resultslice;
+	unsigned char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = vld1_u8( compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		datasliceleft = vld1_u8( &data[index]);
+		// The actual SIMD operation. 
+		resultslice = vcle_u8(datasliceleft, datasliceright);
+		if (vreinterpret_u64_u8(resultslice) != 0x0000000000000000) {
 			// Home in on the exact location.
 			for (fineindex = index; fineindex < alignedlength; fineindex++) {
 				if (data[fineindex] <= param1) {
@@ -1332,7 +1975,7 @@ Py_ssize_t findindex_le_armv8_simd(Py_ssize_t arraylen, unsigned char *data, uns
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -1341,18 +1984,7 @@ Py_ssize_t findindex_le_select(Py_ssize_t arraylen, int nosimd, unsigned char *d
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return findindex_le_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return findindex_le_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return findindex_le_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return findindex_simdfuncs.le(arraylen, data1, param);
 	} else {
 	#endif
 		return findindex_le(arraylen, data1, param);
@@ -1417,7 +2049,7 @@ Py_ssize_t findindex_ne_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param1;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -1428,11 +2060,78 @@ Py_ssize_t findindex_ne_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data[index]);
+		// Compare for equality.
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) datasliceleft, (__m128i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (_mm_movemask_epi8((__m128i) resultslice) != 0xffff) {
+			// Home in on the exact location.
+			for (fineindex = index; fineindex < alignedlength; fineindex++) {
+				if (data[fineindex] != param1) {
+					return fineindex;
+				}
+			}
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		if (data[index] != param1) {
+			return index;
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 Py_ssize_t findindex_ne_avx2_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index, fineindex; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data[index]);
 		// Compare for equality.
-		resultslice = __builtin_ia32_pcmpeqb128(datasliceleft, datasliceright);
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) datasliceleft, (__m256i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff) {
+		if ((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff) {
 			// Home in on the exact location.
 			for (fineindex = index; fineindex < alignedlength; fineindex++) {
 				if (data[fineindex] != param1) {
@@ -1456,6 +2155,70 @@ Py_ssize_t findindex_ne_x86_simd(Py_ssize_t arraylen, unsigned char *data, unsig
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW SIMD version.
+   opcode = The operator or function code to select what to execute.
+   arraylen = The length of the data arrays.
+   data = The input data array.
+   param1 = The parameter to be applied to each array element.
+   Returns the array index of the first matching instance, or ARR_ERR_NOTFOUND,
+		if it was not found.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW Py_ssize_t findindex_ne_avx512_simd(Py_ssize_t arraylen, unsigned char *data, unsigned char param1) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param1;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		// The lowest bit set in the mask is the first matching element.
+		if (resultmask != 0) {
+			return index + __builtin_ctzll(resultmask);
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NE);
+		if (resultmask != 0) {
+			return alignedlength + __builtin_ctzll(resultmask);
+		}
+	}
+
+	return ARR_ERR_NOTFOUND;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* ARMv7 version.
    opcode = The operator or function code to select what to execute.
@@ -1593,7 +2356,7 @@ Py_ssize_t findindex_ne_armv8_simd(Py_ssize_t arraylen, unsigned char *data, uns
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    param = The parameter to be applied to each array element.
@@ -1602,18 +2365,7 @@ Py_ssize_t findindex_ne_select(Py_ssize_t arraylen, int nosimd, unsigned char *d
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return findindex_ne_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return findindex_ne_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return findindex_ne_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return findindex_simdfuncs.ne(arraylen, data1, param);
 	} else {
 	#endif
 		return findindex_ne(arraylen, data1, param);
@@ -1628,103 +2380,260 @@ Py_ssize_t findindex_ne_select(Py_ssize_t arraylen, int nosimd, unsigned char *d
 
 /*--------------------------------------------------------------------------- */
 
-/* The wrapper to the underlying C function */
-static PyObject *py_findindex(PyObject *self, PyObject *args, PyObject *keywds) {
-
+/* Select the SIMD functions for this CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static void findindex_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		findindex_simdfuncs.eq = findindex_eq_avx512_simd;
+		findindex_simdfuncs.gt = findindex_gt_avx512_simd;
+		findindex_simdfuncs.ge = findindex_ge_avx512_simd;
+		findindex_simdfuncs.lt = findindex_lt_avx512_simd;
+		findindex_simdfuncs.le = findindex_le_avx512_simd;
+		findindex_simdfuncs.ne = findindex_ne_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		findindex_simdfuncs.eq = findindex_eq_avx2_simd;
+		findindex_simdfuncs.gt = findindex_gt_avx2_simd;
+		findindex_simdfuncs.ge = findindex_ge_avx2_simd;
+		findindex_simdfuncs.lt = findindex_lt_avx2_simd;
+		findindex_simdfuncs.le = findindex_le_avx2_simd;
+		findindex_simdfuncs.ne = findindex_ne_avx2_simd;
+	} else {
+		findindex_simdfuncs.eq = findindex_eq_x86_simd;
+		findindex_simdfuncs.gt = findindex_gt_x86_simd;
+		findindex_simdfuncs.ge = findindex_ge_x86_simd;
+		findindex_simdfuncs.lt = findindex_lt_x86_simd;
+		findindex_simdfuncs.le = findindex_le_x86_simd;
+		findindex_simdfuncs.ne = findindex_ne_x86_simd;
+	}
+	#endif
 
-	// The error code returned by the function.
-	Py_ssize_t resultcode = 0;
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	findindex_simdfuncs.eq = findindex_eq_armv7_simd;
+	findindex_simdfuncs.gt = findindex_gt_armv7_simd;
+	findindex_simdfuncs.ge = findindex_ge_armv7_simd;
+	findindex_simdfuncs.lt = findindex_lt_armv7_simd;
+	findindex_simdfuncs.le = findindex_le_armv7_simd;
+	findindex_simdfuncs.ne = findindex_ne_armv7_simd;
+	#endif
 
-	// This is used to hold the parsed parameters.
-	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	findindex_simdfuncs.eq = findindex_eq_armv8_simd;
+	findindex_simdfuncs.gt = findindex_gt_armv8_simd;
+	findindex_simdfuncs.ge = findindex_ge_armv8_simd;
+	findindex_simdfuncs.lt = findindex_lt_armv8_simd;
+	findindex_simdfuncs.le = findindex_le_armv8_simd;
+	findindex_simdfuncs.ne = findindex_ne_armv8_simd;
+	#endif
 
-	// -----------------------------------------------------
+}
+#endif
 
+/*--------------------------------------------------------------------------- */
 
-	// Get the parameters passed from Python.
-	bytesdata = getparams_allany(self, args, keywds, "findindex");
+/* Call the C function for the requested operation on one block of the sequence.
+	bytesdata = The parsed parameters.
+	start = The index of the start of the block.
+	blocklen = The length of the block.
+	Returns: The result code for the block.
+*/
+static Py_ssize_t findindex_block(struct args_params_allany *bytesdata, Py_ssize_t start, Py_ssize_t blocklen) {
 
-	// If there was an error, we count on the parameter parsing function to 
-	// release the buffers if this was necessary.
-	if (bytesdata.errorcode) {
-		return NULL;
-	}
+	unsigned char *data = bytesdata->bytes1.B + start;
 
+	// The result of a search when only every step'th element is used.
+	Py_ssize_t strideresult;
 
-	// The length of the data array.
-	if (bytesdata.arraylen < 1) {
-		// Release the buffers. 
-		releasebuffers_allany(bytesdata);
-		ErrMsgArrayLengthErr();
-		return NULL;
+	// Use only every step'th element. The block must start on an element
+	// which is used.
+	if (bytesdata->step > 1) {
+		strideresult = stridefind_select(bytesdata->opcode, blocklen, bytesdata->step, bytesdata->nosimd, data, NULL, bytesdata->param);
+		return strideresult;
 	}
 
-
-	/* Call the C function for the requested operation. */
-	switch(bytesdata.opcode) {
+	switch(bytesdata->opcode) {
 		// AF_EQ
 		case OP_AF_EQ: {
-			resultcode = findindex_eq_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return findindex_eq_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_GT
 		case OP_AF_GT: {
-			resultcode = findindex_gt_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return findindex_gt_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_GE
 		case OP_AF_GE: {
-			resultcode = findindex_ge_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return findindex_ge_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_LT
 		case OP_AF_LT: {
-			resultcode = findindex_lt_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return findindex_lt_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_LE
 		case OP_AF_LE: {
-			resultcode = findindex_le_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return findindex_le_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// AF_NE
 		case OP_AF_NE: {
-			resultcode = findindex_ne_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
+			return findindex_ne_select(blocklen, bytesdata->nosimd, data, bytesdata->param);
 		}
 		// The operation code is unknown.
 		default: {
-			resultcode = ARR_ERR_INVALIDOP;
+			return ARR_ERR_INVALIDOP;
 		}
 	}
 
+}
 
-	// Release the buffers. 
-	releasebuffers_allany(bytesdata);
+/*--------------------------------------------------------------------------- */
 
+// The data for a search which is divided between threads.
+struct findindex_threadctx {
+	struct args_params_allany *bytesdata;
+	// The lowest index found by any part so far.
+	struct sharedpos found;
+};
 
-	// Signal the errors.
-	if (resultcode == ARR_ERR_INVALIDOP) {
-		ErrMsgOperatorNotValidforthisFunction();
-		return NULL;
-	}
 
+/* Search one part of the sequence. Each part searches every nparts'th
+	block, starting with block number "part". The search stops as soon as
+	the shared position shows that the remaining blocks cannot affect the 
+	result.
+	ctx = The calculation data (struct findindex_threadctx).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void findindex_part(void *ctx, int part, int nparts) {
 
+	struct findindex_threadctx *threadctx = (struct findindex_threadctx *) ctx;
+	struct args_params_allany *bytesdata = threadctx->bytesdata;
 
-	// Adjust the result code if the data was not found, so that we don't leak
-	// internal error codes to user space (and cause problems if they change).
-	if (resultcode < 0) {
-		resultcode = -1;
-	}
+	Py_ssize_t start, blocklen;
+	Py_ssize_t resultcode;
 
-	// Return the number of items filtered through.
-	return PyLong_FromSsize_t(resultcode);
+	// The blocks must start on an element which is used.
+	Py_ssize_t blocksize = searchblocksize(bytesdata->step);
 
+	for (start = (Py_ssize_t) part * blocksize; start < bytesdata->arraylen; start += (Py_ssize_t) nparts * blocksize) {
 
-}
+		// Another thread has already found the result.
+		if (start >= sharedpos_get(&threadctx->found)) {
+			return;
+		}
 
+		blocklen = bytesdata->arraylen - start;
+		if (blocklen > blocksize) {
+			blocklen = blocksize;
+		}
 
-/*--------------------------------------------------------------------------- */
+		resultcode = findindex_block(bytesdata, start, blocklen);
+
+		// No later block in this part can contain a lower index.
+		if (resultcode >= 0) {
+			sharedpos_lower(&threadctx->found, start + resultcode);
+			return;
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_findindex(PyObject *self, BF_ARGSDECL) {
+
+
+	// The error code returned by the function.
+	Py_ssize_t resultcode = 0;
+
+	// This is used to hold the parsed parameters.
+	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+
+	// The data for a search which is divided between threads.
+	struct findindex_threadctx threadctx;
+
+	// The number of parts to divide the search into.
+	int nparts;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_allany(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// The length of the data array.
+	if (bytesdata.arraylen < 1) {
+		// Release the buffers. 
+		releasebuffers_allany(bytesdata);
+		ErrMsgArrayLengthErr();
+		return NULL;
+	}
+
+
+	// The search is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+	threadctx.bytesdata = &bytesdata;
+
+	// If the shared position cannot be created, don't use threads.
+	if ((nparts > 1) && sharedpos_init(&threadctx.found, bytesdata.arraylen)) {
+		nparts = 1;
+	}
+
+
+	/* Call the C function for the requested operation. */
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	if (nparts > 1) {
+		runparallel(findindex_part, &threadctx, nparts);
+		resultcode = (sharedpos_get(&threadctx.found) < bytesdata.arraylen) ? sharedpos_get(&threadctx.found) : ARR_ERR_NOTFOUND;
+		sharedpos_free(&threadctx.found);
+	} else {
+		resultcode = findindex_block(&bytesdata, 0, bytesdata.arraylen);
+	}
+	BF_END_ALLOW_THREADS
+
+
+	// Release the buffers. 
+	releasebuffers_allany(bytesdata);
+
+
+	// Signal the errors.
+	if (resultcode == ARR_ERR_INVALIDOP) {
+		ErrMsgOperatorNotValidforthisFunction();
+		return NULL;
+	}
+
+
+
+	// Adjust the result code if the data was not found, so that we don't leak
+	// internal error codes to user space (and cause problems if they change).
+	// Otherwise the index is relative to the start of the whole sequence,
+	// not to the start parameter.
+	if (resultcode < 0) {
+		resultcode = -1;
+	} else {
+		resultcode = resultcode + bytesdata.startpos;
+	}
+
+	// Return the number of items filtered through.
+	return PyLong_FromSsize_t(resultcode);
+
+
+}
+
+
+/*--------------------------------------------------------------------------- */
 
 
 /* The module doc string */
@@ -1742,7 +2651,10 @@ Call formats: \n\
 \n\
   result = findindex(opstr, sequence, param) \n\
   result = findindex(opstr, sequence, param, maxlen=y) \n\
+  result = findindex(opstr, sequence, param, start=i, stop=j) \n\
+  result = findindex(opstr, sequence, param, step=k) \n\
   result = findindex(opstr, sequence, param, nosimd=False) \n\
+  result = findindex(opstr, sequence, param, threads=4) \n\
 \n\
 * opstr - The arithmetic comparison operation as a string. \n\
           These are: '==', '>', '>=', '<', '<=', '!='. \n\
@@ -1752,25 +2664,771 @@ Call formats: \n\
   positive integer. If a zero or negative length, or a value which is \n\
   greater than the actual length of the sequence is specified, this \n\
   parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. These are optional keyword \n\
+  parameters and are applied before maxlen. No data is copied. \n\
+  Indexes returned by findindex are relative to the whole sequence. \n\
+* step - Use only every step'th element, as if the sequence had been \n\
+  sliced with sequence[start:stop:step]. This must be a positive \n\
+  integer. This is an optional keyword parameter. Indexes returned by \n\
+  findindex are positions in the whole sequence, not in the slice. \n\
 * nosimd - If True, SIMD acceleration is disabled if present. \n\
   The default is False (SIMD acceleration is enabled if present). \n\
+* threads - The number of threads to divide the search between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
 * result - The resulting index. This will be negative if no match was found. \n\
 ");
 
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function for a batch of sequences */
+static PyObject *py_findindex_many(PyObject *self, BF_ARGSDECL) {
+
+
+	// The error code returned by the function.
+	Py_ssize_t resultcode = 0;
+
+	// This is used to hold the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The parameters for each sequence in the batch.
+	struct args_params_allany seqdata = ARGSINIT_ALLANY;
+
+	// The result for each sequence.
+	Py_ssize_t *results;
+
+	// The results as a python list.
+	PyObject *resultlist;
+
+	Py_ssize_t x;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_many_allany(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// Every sequence must contain data.
+	if (hasemptyseq_many(&bytesdata)) {
+		// Release the buffers. 
+		releasebuffers_many(bytesdata);
+		ErrMsgArrayLengthErr();
+		return NULL;
+	}
+
+	results = PyMem_New(Py_ssize_t, bytesdata.nseqs + 1);
+	if (results == NULL) {
+		releasebuffers_many(bytesdata);
+		return PyErr_NoMemory();
+	}
+
+	// The same operation is used with every sequence.
+	seqdata.opcode = bytesdata.opcode;
+	seqdata.param = bytesdata.param;
+	seqdata.nosimd = bytesdata.nosimd;
+
+
+	/* Call the C function for each sequence. */
+	// The GIL is released if the batch is large.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.totallen)
+	for (x = 0; x < bytesdata.nseqs; x++) {
+		seqdata.arraylen = bytesdata.pybuffers[x].len;
+		seqdata.bytes1.buf = bytesdata.pybuffers[x].buf;
+		resultcode = findindex_block(&seqdata, 0, seqdata.arraylen);
+		if (resultcode == ARR_ERR_INVALIDOP) {
+			break;
+		}
+		results[x] = (resultcode < 0) ? -1 : resultcode;
+	}
+	BF_END_ALLOW_THREADS
+
+
+	// Release the buffers. 
+	releasebuffers_many(bytesdata);
+
+
+	// Signal the errors.
+	if (resultcode == ARR_ERR_INVALIDOP) {
+		PyMem_Free(results);
+		ErrMsgOperatorNotValidforthisFunction();
+		return NULL;
+	}
+
+
+	resultlist = ssizelist_many(results, bytesdata.nseqs);
+	PyMem_Free(results);
+
+	return resultlist;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(findindex_many__doc__,
+"findindex_many \n\
+_____________________________ \n\
+\n\
+Calculate findindex over the values in each sequence in a batch. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          [findindex(opstr, x, param) for x in sequences] \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  result = findindex_many(opstr, sequences, param) \n\
+  result = findindex_many(opstr, sequences, param, nosimd=False) \n\
+\n\
+* opstr - The arithmetic comparison operation as a string. \n\
+          These are: '==', '>', '>=', '<', '<=', '!='. \n\
+* sequences - A list or other iterable of bytes or bytearray sequences. \n\
+  None of them may be empty. \n\
+* param - A non-array numeric parameter. \n\
+* nosimd - If True, SIMD acceleration is disabled if present. \n\
+  The default is False (SIMD acceleration is enabled if present). \n\
+* result - A list with the index of the first match in each sequence. \n\
+  This will be negative if no match was found in that sequence. \n\
+");
+
+/*--------------------------------------------------------------------------- */
+
+// The results of searching one part of a sequence for every match.
+struct findall_found {
+	// The indexes of the matches.
+	long long *results;
+	// The number of matches.
+	Py_ssize_t nresults;
+	// The number of indexes which there is room for.
+	Py_ssize_t allocated;
+	// True if memory could not be allocated.
+	int nomem;
+};
+
+
+/* Find every match in one range of a sequence. The range is searched in
+	blocks so that the memory needed for the results grows with the number
+	of matches. This does not use the GIL.
+	bytesdata = The parsed parameters.
+	start = The index of the start of the range. This must be an element
+		which is used.
+	rangelen = The length of the range.
+	found = Receives the results.
+	Returns: Nothing.
+*/
+static void findall_range(struct args_params_allany *bytesdata, Py_ssize_t start, Py_ssize_t rangelen, struct findall_found *found) {
+
+	Py_ssize_t pos, blocklen, newsize;
+	long long *newresults;
+
+	// Each block must start on an element which is used.
+	Py_ssize_t blocksize = searchblocksize(bytesdata->step);
+
+	// The most matches there can be in one block.
+	Py_ssize_t blockmax = (blocksize / bytesdata->step) + 1;
+
+	for (pos = start; pos < start + rangelen; pos += blocklen) {
+
+		blocklen = start + rangelen - pos;
+		if (blocklen > blocksize) {
+			blocklen = blocksize;
+		}
+
+		// Make sure there is room for every element in the block to match.
+		if ((found->allocated - found->nresults) < blockmax) {
+			newsize = (found->allocated * 2) + blockmax;
+			newresults = PyMem_RawRealloc(found->results, newsize * sizeof(long long));
+			if (newresults == NULL) {
+				found->nomem = 1;
+				return;
+			}
+			found->results = newresults;
+			found->allocated = newsize;
+		}
+
+		// The indexes are relative to the whole sequence.
+		found->nresults += stridefindall_select(bytesdata->opcode, blocklen, bytesdata->step, bytesdata->nosimd, 
+					bytesdata->bytes1.B + pos, bytesdata->param, bytesdata->startpos + pos, 
+					found->results + found->nresults);
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+// The data for finding every match, which may be divided between threads.
+struct findall_threadctx {
+	struct args_params_allany *bytesdata;
+	// The results for each part.
+	struct findall_found found[BF_MAXTHREADS];
+};
+
+
+/* Find every match in one part of the sequence. If the calculation is not 
+	divided between threads, then there is just one part covering the whole 
+	sequence.
+	ctx = The calculation data (struct findall_threadctx).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void findall_part(void *ctx, int part, int nparts) {
+
+	struct findall_threadctx *threadctx = (struct findall_threadctx *) ctx;
+	struct args_params_allany *bytesdata = threadctx->bytesdata;
+
+	// The range of this part of the sequence.
+	Py_ssize_t start, partlen;
+
+	// When a step is used, each part must begin on an element which is used.
+	if (bytesdata->step > 1) {
+		partrangestep(bytesdata->arraylen, bytesdata->step, part, nparts, &start, &partlen);
+	} else {
+		partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
+	}
+
+	findall_range(bytesdata, start, partlen, &threadctx->found[part]);
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Create an array('q') containing the indexes of the matches.
+	found = The results for each part, in order.
+	nparts = The number of parts.
+	Returns: A new reference to the array, or NULL with a Python exception set.
+*/
+static PyObject *findall_makearray(struct findall_found *found, int nparts) {
+
+	PyObject *arraymodule, *arrayobj, *viewobj, *callresult;
+	int part;
+
+	arraymodule = PyImport_ImportModule("array");
+	if (arraymodule == NULL) {
+		return NULL;
+	}
+	arrayobj = PyObject_CallMethod(arraymodule, "array", "s", "q");
+	Py_DECREF(arraymodule);
+	if (arrayobj == NULL) {
+		return NULL;
+	}
+
+	// The indexes are copied in directly as raw bytes.
+	for (part = 0; part < nparts; part++) {
+		if (found[part].nresults < 1) {
+			continue;
+		}
+		viewobj = PyMemoryView_FromMemory((char *) found[part].results, found[part].nresults * sizeof(long long), PyBUF_READ);
+		if (viewobj == NULL) {
+			Py_DECREF(arrayobj);
+			return NULL;
+		}
+		callresult = PyObject_CallMethod(arrayobj, "frombytes", "O", viewobj);
+		Py_DECREF(viewobj);
+		if (callresult == NULL) {
+			Py_DECREF(arrayobj);
+			return NULL;
+		}
+		Py_DECREF(callresult);
+	}
+
+	return arrayobj;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_findall(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+
+	// The data for the calculation, including the results of each part.
+	struct findall_threadctx threadctx;
+
+	// The number of parts to divide the calculation into.
+	int nparts, part;
+
+	int nomem = 0;
+
+	// The results as an array('q').
+	PyObject *resultarray = NULL;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_allany(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+	threadctx.bytesdata = &bytesdata;
+	memset(threadctx.found, 0, sizeof(threadctx.found));
+
+
+	// Call the implementing function.
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	nparts = runparallel(findall_part, &threadctx, nparts);
+	BF_END_ALLOW_THREADS
+
+
+	// Release the buffers. 
+	releasebuffers_allany(bytesdata);
+
+
+	for (part = 0; part < nparts; part++) {
+		nomem = nomem || threadctx.found[part].nomem;
+	}
+
+	if (nomem) {
+		PyErr_NoMemory();
+	} else {
+		resultarray = findall_makearray(threadctx.found, nparts);
+	}
+
+	for (part = 0; part < nparts; part++) {
+		PyMem_RawFree(threadctx.found[part].results);
+	}
+
+	return resultarray;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(findall__doc__,
+"findall \n\
+_____________________________ \n\
+\n\
+Find the indexes of every value in a bytes or bytearray object which \n\
+meets the specified criteria. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          array('q', [x for x,y in enumerate(array) if y > param]) \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  result = findall(opstr, sequence, param) \n\
+  result = findall(opstr, sequence, param, maxlen=y) \n\
+  result = findall(opstr, sequence, param, start=i, stop=j) \n\
+  result = findall(opstr, sequence, param, step=k) \n\
+  result = findall(opstr, sequence, param, nosimd=False) \n\
+  result = findall(opstr, sequence, param, threads=4) \n\
+\n\
+* opstr - The arithmetic comparison operation as a string. \n\
+          These are: '==', '>', '>=', '<', '<=', '!='. \n\
+* sequence - An input bytes or bytearray to be examined. \n\
+* param - A non-array numeric parameter. \n\
+* maxlen - Limit the length of the sequence used. This must be a valid \n\
+  positive integer. If a zero or negative length, or a value which is \n\
+  greater than the actual length of the sequence is specified, this \n\
+  parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. These are optional keyword \n\
+  parameters and are applied before maxlen. No data is copied. \n\
+  Indexes are relative to the whole sequence. \n\
+* step - Use only every step'th element, as if the sequence had been \n\
+  sliced with sequence[start:stop:step]. This must be a positive \n\
+  integer. This is an optional keyword parameter. Indexes are positions \n\
+  in the whole sequence, not in the slice. \n\
+* nosimd - If True, SIMD acceleration is disabled if present. \n\
+  The default is False (SIMD acceleration is enabled if present). \n\
+* threads - The number of threads to divide the search between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
+* result - An array('q') with the index of every match, in order. \n\
+");
+
+
+/*--------------------------------------------------------------------------- */
+
+/* The iterator returned by finditer. The matches are found one block at a
+	time, and the indexes found in each block are returned one at a time. 
+	The buffer for the sequence is held until the search is finished, so a
+	bytearray cannot be resized while it is being searched.
+*/
+typedef struct {
+	PyObject_HEAD
+	// The parsed parameters, including the buffer for the sequence.
+	struct args_params_allany bytesdata;
+	// The start of the next block to search.
+	Py_ssize_t nextpos;
+	// The matches found in the current block.
+	long long *results;
+	Py_ssize_t nresults;
+	// The next match in the current block to return.
+	Py_ssize_t nextresult;
+} FindIterObject;
+
+
+/* Release the buffer for the sequence. */
+static void finditer_release(FindIterObject *iterobj) {
+
+	if (iterobj->bytesdata.hasbuffer1) {
+		releasebuffers_allany(iterobj->bytesdata);
+		iterobj->bytesdata.hasbuffer1 = false;
+	}
+}
+
+
+static void finditer_dealloc(FindIterObject *iterobj) {
+
+	finditer_release(iterobj);
+	PyMem_Free(iterobj->results);
+	Py_TYPE(iterobj)->tp_free((PyObject *) iterobj);
+}
+
+
+/* Return the index of the next match. */
+static PyObject *finditer_next(FindIterObject *iterobj) {
+
+	struct args_params_allany *bytesdata = &iterobj->bytesdata;
+
+	// Each block must start on an element which is used.
+	Py_ssize_t blocksize = searchblocksize(bytesdata->step);
+	Py_ssize_t blocklen;
+
+	// Search the following blocks until a match is found.
+	while ((iterobj->nextresult >= iterobj->nresults) && (iterobj->nextpos < bytesdata->arraylen)) {
+
+		blocklen = bytesdata->arraylen - iterobj->nextpos;
+		if (blocklen > blocksize) {
+			blocklen = blocksize;
+		}
+
+		iterobj->nresults = stridefindall_select(bytesdata->opcode, blocklen, bytesdata->step, bytesdata->nosimd, 
+					bytesdata->bytes1.B + iterobj->nextpos, bytesdata->param, 
+					bytesdata->startpos + iterobj->nextpos, iterobj->results);
+		iterobj->nextresult = 0;
+		iterobj->nextpos += blocklen;
+	}
+
+	if (iterobj->nextresult < iterobj->nresults) {
+		return PyLong_FromLongLong(iterobj->results[iterobj->nextresult++]);
+	}
+
+	// There are no more matches. The buffer is not needed any more.
+	finditer_release(iterobj);
+
+	return NULL;
+}
+
+
+static PyTypeObject FindIterType = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "bytesfunc.finditer",
+	.tp_basicsize = sizeof(FindIterObject),
+	.tp_itemsize = 0,
+	.tp_dealloc = (destructor) finditer_dealloc,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_iter = PyObject_SelfIter,
+	.tp_iternext = (iternextfunc) finditer_next,
+};
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_finditer(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+
+	FindIterObject *iterobj;
+
+	// -----------------------------------------------------
+
+
+	// The type is initialised the first time it is used.
+	if (PyType_Ready(&FindIterType) < 0) {
+		return NULL;
+	}
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_allany_nothreads(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+	iterobj = PyObject_New(FindIterObject, &FindIterType);
+	if (iterobj == NULL) {
+		releasebuffers_allany(bytesdata);
+		return NULL;
+	}
+
+	iterobj->bytesdata = bytesdata;
+	iterobj->nextpos = 0;
+	iterobj->nresults = 0;
+	iterobj->nextresult = 0;
+
+	// There must be room for every element in a block to match.
+	iterobj->results = PyMem_New(long long, (searchblocksize(bytesdata.step) / bytesdata.step) + 1);
+	if (iterobj->results == NULL) {
+		Py_DECREF(iterobj);
+		return PyErr_NoMemory();
+	}
+
+	return (PyObject *) iterobj;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(finditer__doc__,
+"finditer \n\
+_____________________________ \n\
+\n\
+Return an iterator over the indexes of every value in a bytes or \n\
+bytearray object which meets the specified criteria. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          (x for x,y in enumerate(array) if y > param) \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  result = finditer(opstr, sequence, param) \n\
+  result = finditer(opstr, sequence, param, maxlen=y) \n\
+  result = finditer(opstr, sequence, param, start=i, stop=j) \n\
+  result = finditer(opstr, sequence, param, step=k) \n\
+  result = finditer(opstr, sequence, param, nosimd=False) \n\
+\n\
+* opstr - The arithmetic comparison operation as a string. \n\
+          These are: '==', '>', '>=', '<', '<=', '!='. \n\
+* sequence - An input bytes or bytearray to be examined. The sequence \n\
+  cannot be resized until the iterator is finished or deleted. \n\
+* param - A non-array numeric parameter. \n\
+* maxlen - Limit the length of the sequence used. This must be a valid \n\
+  positive integer. If a zero or negative length, or a value which is \n\
+  greater than the actual length of the sequence is specified, this \n\
+  parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. These are optional keyword \n\
+  parameters and are applied before maxlen. No data is copied. \n\
+  Indexes are relative to the whole sequence. \n\
+* step - Use only every step'th element, as if the sequence had been \n\
+  sliced with sequence[start:stop:step]. This must be a positive \n\
+  integer. This is an optional keyword parameter. Indexes are positions \n\
+  in the whole sequence, not in the slice. \n\
+* nosimd - If True, SIMD acceleration is disabled if present. \n\
+  The default is False (SIMD acceleration is enabled if present). \n\
+* result - An iterator which returns the index of each match in order. \n\
+  The sequence is searched one block at a time as the iterator is used. \n\
+");
+
+
+/*--------------------------------------------------------------------------- */
+
+// The data for counting the matches, which may be divided between threads.
+struct countif_threadctx {
+	struct args_params_allany *bytesdata;
+	// The count for each part.
+	Py_ssize_t counts[BF_MAXTHREADS];
+};
+
+
+/* Count the matches in one part of the sequence. If the calculation is not 
+	divided between threads, then there is just one part covering the whole 
+	sequence.
+	ctx = The calculation data (struct countif_threadctx).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void countif_part(void *ctx, int part, int nparts) {
+
+	struct countif_threadctx *threadctx = (struct countif_threadctx *) ctx;
+	struct args_params_allany *bytesdata = threadctx->bytesdata;
+
+	// The range of this part of the sequence.
+	Py_ssize_t start, partlen;
+
+	// When a step is used, each part must begin on an element which is used.
+	if (bytesdata->step > 1) {
+		partrangestep(bytesdata->arraylen, bytesdata->step, part, nparts, &start, &partlen);
+	} else {
+		partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
+	}
+
+	threadctx->counts[part] = stridecountif_select(bytesdata->opcode, partlen, bytesdata->step, 
+					bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param);
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_countif(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_allany bytesdata = ARGSINIT_ALLANY;
+
+	// The data for the calculation, including the count for each part.
+	struct countif_threadctx threadctx;
+
+	// The number of parts to divide the calculation into.
+	int nparts, part;
+
+	Py_ssize_t resultcode = 0;
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python.
+	bytesdata = getparams_allany(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+	threadctx.bytesdata = &bytesdata;
+
+
+	// Call the implementing function.
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	nparts = runparallel(countif_part, &threadctx, nparts);
+	BF_END_ALLOW_THREADS
+
+
+	// Release the buffers. 
+	releasebuffers_allany(bytesdata);
+
+
+	// Combine the counts for each part.
+	for (part = 0; part < nparts; part++) {
+		// Signal the errors.
+		if (threadctx.counts[part] == ARR_ERR_INVALIDOP) {
+			ErrMsgOperatorNotValidforthisFunction();
+			return NULL;
+		}
+		resultcode += threadctx.counts[part];
+	}
+
+	return PyLong_FromSsize_t(resultcode);
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(countif__doc__,
+"countif \n\
+_____________________________ \n\
+\n\
+Count the values in a bytes or bytearray object which meet the \n\
+specified criteria. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          sum(1 for x in array if x > param) \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  result = countif(opstr, sequence, param) \n\
+  result = countif(opstr, sequence, param, maxlen=y) \n\
+  result = countif(opstr, sequence, param, start=i, stop=j) \n\
+  result = countif(opstr, sequence, param, step=k) \n\
+  result = countif(opstr, sequence, param, nosimd=False) \n\
+  result = countif(opstr, sequence, param, threads=4) \n\
+\n\
+* opstr - The arithmetic comparison operation as a string. \n\
+          These are: '==', '>', '>=', '<', '<=', '!='. \n\
+* sequence - An input bytes or bytearray to be examined. \n\
+* param - A non-array numeric parameter. \n\
+* maxlen - Limit the length of the sequence used. This must be a valid \n\
+  positive integer. If a zero or negative length, or a value which is \n\
+  greater than the actual length of the sequence is specified, this \n\
+  parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. These are optional keyword \n\
+  parameters and are applied before maxlen. No data is copied. \n\
+* step - Use only every step'th element, as if the sequence had been \n\
+  sliced with sequence[start:stop:step]. This must be a positive \n\
+  integer. This is an optional keyword parameter. \n\
+* nosimd - If True, SIMD acceleration is disabled if present. \n\
+  The default is False (SIMD acceleration is enabled if present). \n\
+* threads - The number of threads to divide the count between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
+* result - The number of values which meet the criteria. \n\
+");
+
+
 
 /*--------------------------------------------------------------------------- */
 
 /* A list of all the methods defined by this module. 
  "findindex" is the name seen inside of Python. 
  "py_findindex" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef findindex_methods[] = {
-	{"findindex",  (PyCFunction)py_findindex, METH_VARARGS | METH_KEYWORDS, findindex__doc__}, 
+	{"findindex",  (PyCFunction)py_findindex, BF_METHFLAGS, findindex__doc__}, 
+	{"findindex_many",  (PyCFunction)py_findindex_many, BF_METHFLAGS, findindex_many__doc__}, 
+	{"findall",  (PyCFunction)py_findall, BF_METHFLAGS, findall__doc__}, 
+	{"finditer",  (PyCFunction)py_finditer, BF_METHFLAGS, finditer__doc__}, 
+	{"countif",  (PyCFunction)py_countif, BF_METHFLAGS, countif__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int findindex_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	findindex_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
+	return PyModule_AddFunctions(module, findindex_methods);
+};
+
+#else
+
 static struct PyModuleDef findindexmodule = {
     PyModuleDef_HEAD_INIT,
     "findindex",
@@ -1781,8 +3439,16 @@ static struct PyModuleDef findindexmodule = {
 
 PyMODINIT_FUNC PyInit_findindex(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	findindex_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
     return PyModule_Create(&findindexmodule);
 };
 
+#endif
+
 /*--------------------------------------------------------------------------- */
 
@@ -36,6 +36,8 @@
 #include "byteserrs.h"
 #include "bytesparams_base.h"
 #include "bytesparams_comp.h"
+#include "arrayops.h"
+#include "bytesstride.h"
 
 #include "simddefs.h"
 
@@ -127,7 +129,7 @@ signed int ge_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned cha
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *)  compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -138,14 +140,14 @@ signed int ge_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned cha
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *)  &data1[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if ((__builtin_ia32_pmovmskb128((v16qi) resultslice) != 0xffff)) {
+		if ((_mm_movemask_epi8((__m128i) resultslice) != 0xffff)) {
 			return 0;
 		}
 	}
@@ -180,7 +182,7 @@ signed int ge_3_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned char
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceleft = (v16qi) __builtin_ia32_lddqu((char *)  compvals);
+	datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -191,14 +193,14 @@ signed int ge_3_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned char
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *)  &data2[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Check the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
 			return 0;
 		}
 	}
@@ -237,15 +239,15 @@ signed int ge_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned cha
 	// types of comparison operations due to how SIMD works on that
 	// platform.
 	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *)  &data1[index]);
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *)  &data2[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		// Find the minimum values. 
-		compslice = __builtin_ia32_pminub128(datasliceleft, datasliceright);
+		compslice = (v16qi) _mm_min_epu8((__m128i) datasliceleft, (__m128i) datasliceright);
 		// If this is different from our compare parameter, then the test
 		// has failed.
-		resultslice = __builtin_ia32_pcmpeqb128(compslice, datasliceright);
+		resultslice = (v16qi) _mm_cmpeq_epi8((__m128i) compslice, (__m128i) datasliceright);
 		// Compare the results of the SIMD operation.
-		if (!(__builtin_ia32_pmovmskb128((v16qi) resultslice) == 0xffff)) {
+		if (!(_mm_movemask_epi8((__m128i) resultslice) == 0xffff)) {
 			return 0;
 		}
 	}
@@ -264,6 +266,338 @@ signed int ge_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned cha
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 version.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 signed int ge_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) { 
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// Find the minimum values. 
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) != 0xffffffff)) {
+			return 0;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		if (!(data1[index] >= param)) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+
+// param_num_arr
+AF_TARGET_AVX2 signed int ge_3_avx2_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param;
+	}
+	datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Find the minimum values. 
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Check the results of the SIMD operation.
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
+			return 0;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		if (!(param >= data2[index])) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX2 signed int ge_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+	v32qi resultslice, compslice;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	// On x86 we have to do this in a round-about fashion for some
+	// types of comparison operations due to how SIMD works on that
+	// platform.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Find the minimum values. 
+		compslice = (v32qi) _mm256_min_epu8((__m256i) datasliceleft, (__m256i) datasliceright);
+		// If this is different from our compare parameter, then the test
+		// has failed.
+		resultslice = (v32qi) _mm256_cmpeq_epi8((__m256i) compslice, (__m256i) datasliceright);
+		// Compare the results of the SIMD operation.
+		if (!((unsigned int) _mm256_movemask_epi8((__m256i) resultslice) == 0xffffffff)) {
+			return 0;
+		}
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		if (!(data1[index] >= data2[index])) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW version.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW signed int ge_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return 0;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		if (resultmask != tailmask) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+
+// param_num_arr
+AF_TARGET_AVX512BW signed int ge_3_avx512_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
+	}
+	datasliceleft = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return 0;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		if (resultmask != tailmask) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+
+// param_arr_arr
+AF_TARGET_AVX512BW signed int ge_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, resultmask;
+
+	v64qi datasliceleft, datasliceright;
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	// AVX-512 compares produce a mask with one bit per element, so every
+	// type of comparison can be done directly.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		resultmask = _mm512_cmp_epu8_mask((__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		// Every element must pass the test.
+		if (resultmask != AVX512_ALLMASK) {
+			return 0;
+		}
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// a masked load and compare. The elements which are masked off are
+	// not set in the result.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		resultmask = _mm512_mask_cmp_epu8_mask(tailmask, (__m512i) datasliceleft, (__m512i) datasliceright, _MM_CMPINT_NLT);
+		if (resultmask != tailmask) {
+			return 0;
+		}
+	}
+
+	return 1;
+
+}
+
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 
 
@@ -586,9 +920,61 @@ signed int ge_5_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned c
 /*--------------------------------------------------------------------------- */
 
 
+/*--------------------------------------------------------------------------- */
+/* The SIMD functions to use. These are selected once when the module is 
+   initialised, according to the SIMD features supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	signed int (*param_arr_num)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param);
+	signed int (*param_num_arr)(Py_ssize_t arraylen, unsigned char param, unsigned char *data2);
+	signed int (*param_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2);
+} ge_simdfuncs;
+
+
+/* Select the SIMD functions for this CPU.
+*/
+static void ge_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		ge_simdfuncs.param_arr_num = ge_1_avx512_simd;
+		ge_simdfuncs.param_num_arr = ge_3_avx512_simd;
+		ge_simdfuncs.param_arr_arr = ge_5_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		ge_simdfuncs.param_arr_num = ge_1_avx2_simd;
+		ge_simdfuncs.param_num_arr = ge_3_avx2_simd;
+		ge_simdfuncs.param_arr_arr = ge_5_avx2_simd;
+	} else {
+		ge_simdfuncs.param_arr_num = ge_1_x86_simd;
+		ge_simdfuncs.param_num_arr = ge_3_x86_simd;
+		ge_simdfuncs.param_arr_arr = ge_5_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	ge_simdfuncs.param_arr_num = ge_1_armv7_simd;
+	ge_simdfuncs.param_num_arr = ge_3_armv7_simd;
+	ge_simdfuncs.param_arr_arr = ge_5_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	ge_simdfuncs.param_arr_num = ge_1_armv8_simd;
+	ge_simdfuncs.param_num_arr = ge_3_armv8_simd;
+	ge_simdfuncs.param_arr_arr = ge_5_armv8_simd;
+	#endif
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    data2 = The second data array.
@@ -598,19 +984,7 @@ signed int ge_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, un
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return ge_1_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return ge_1_armv7_simd(arraylen, data1, param);
-		#endif
-
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return ge_1_armv8_simd(arraylen, data1, param);
-		#endif
-
+		return ge_simdfuncs.param_arr_num(arraylen, data1, param);
 	} else {
 	#endif
 		return ge_1(arraylen, data1, param);
@@ -624,7 +998,7 @@ signed int ge_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, un
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    data2 = The second data array.
@@ -634,18 +1008,7 @@ signed int ge_3_select(Py_ssize_t arraylen, int nosimd, unsigned char param, uns
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return ge_3_x86_simd(arraylen, param, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return ge_3_armv7_simd(arraylen, param, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return ge_3_armv8_simd(arraylen, param, data2);
-		#endif
-
+		return ge_simdfuncs.param_num_arr(arraylen, param, data2);
 	} else {
 	#endif
 		return ge_3(arraylen, param, data2);
@@ -658,7 +1021,7 @@ signed int ge_3_select(Py_ssize_t arraylen, int nosimd, unsigned char param, uns
 
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    data2 = The second data array.
@@ -668,18 +1031,7 @@ signed int ge_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, un
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			return ge_5_x86_simd(arraylen, data1, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			return ge_5_armv7_simd(arraylen, data1, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			return ge_5_armv8_simd(arraylen, data1, data2);
-		#endif
-
+		return ge_simdfuncs.param_arr_arr(arraylen, data1, data2);
 	} else {
 	#endif
 		return ge_5(arraylen, data1, data2);
@@ -694,12 +1046,15 @@ signed int ge_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, un
 /*--------------------------------------------------------------------------- */
 
 /* The wrapper to the underlying C function */
-static PyObject *py_ge(PyObject *self, PyObject *args, PyObject *keywds) {
+static PyObject *py_ge(PyObject *self, BF_ARGSDECL) {
 
 
 	// The error code returned by the function.
 	signed int resultcode = 0;
 
+	// The result of a search when only every step'th element is used.
+	Py_ssize_t strideresult = ARR_ERR_NOTFOUND;
+
 	// This is used to hold the parsed parameters.
 	struct args_params_comp bytesdata = ARGSINIT_COMP;
 
@@ -707,7 +1062,7 @@ static PyObject *py_ge(PyObject *self, PyObject *args, PyObject *keywds) {
 
 
 	// Get the parameters passed from Python.
-	bytesdata = getparams_comp(self, args, keywds, "ge");
+	bytesdata = getparams_comp(self, BF_ARGSPASS);
 
 	// If there was an error, we count on the parameter parsing function to 
 	// release the buffers if this was necessary.
@@ -716,20 +1071,44 @@ static PyObject *py_ge(PyObject *self, PyObject *args, PyObject *keywds) {
 	}
 
 
-	switch (bytesdata.paramcat) {
-		case param_arr_num : {
-			resultcode = ge_1_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
-		}
-		case param_num_arr : {
-			resultcode = ge_3_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.param, bytesdata.bytes2.B);
-			break;
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	if (bytesdata.step > 1) {
+		// When only every step'th element is used, search for the first
+		// element for which the comparison is false. When the parameter 
+		// comes first, the comparison is reversed.
+		switch (bytesdata.paramcat) {
+			case param_arr_num : {
+				strideresult = stridefind_select(stridenegateop(OP_AF_GE), bytesdata.arraylen, bytesdata.step, bytesdata.nosimd, bytesdata.bytes1.B, NULL, bytesdata.param);
+				break;
+			}
+			case param_num_arr : {
+				strideresult = stridefind_select(stridenegateop(strideswapop(OP_AF_GE)), bytesdata.arraylen, bytesdata.step, bytesdata.nosimd, bytesdata.bytes2.B, NULL, bytesdata.param);
+				break;
+			}
+			case param_arr_arr : {
+				strideresult = stridefind_select(stridenegateop(OP_AF_GE), bytesdata.arraylen, bytesdata.step, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.bytes2.B, 0);
+				break;
+			}
 		}
-		case param_arr_arr : {
-			resultcode = ge_5_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.bytes2.B);
-			break;
+		resultcode = (strideresult < 0);
+	} else {
+		switch (bytesdata.paramcat) {
+			case param_arr_num : {
+				resultcode = ge_1_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
+				break;
+			}
+			case param_num_arr : {
+				resultcode = ge_3_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.param, bytesdata.bytes2.B);
+				break;
+			}
+			case param_arr_arr : {
+				resultcode = ge_5_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.bytes2.B);
+				break;
+			}
 		}
 	}
+	BF_END_ALLOW_THREADS
 
 
 	// Release the buffers. 
@@ -768,6 +1147,8 @@ Call formats: \n\
   result = ge(param, sequence1) \n\
   result = ge(sequence1, sequence2) \n\
   result = ge(sequence1, param, maxlen=y) \n\
+  result = ge(sequence1, param, start=i, stop=j) \n\
+  result = ge(sequence1, param, step=k) \n\
   result = ge(sequence1, param, nosimd=False) \n\
 \n\
 * sequence1 - An input bytes or bytearray to be examined. \n\
@@ -782,6 +1163,13 @@ Call formats: \n\
   positive integer. If a zero or negative length, or a value which is \n\
   greater than the actual length of the sequence is specified, this \n\
   parameter is ignored.  \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. The same part of every sequence is \n\
+  used. These are optional keyword parameters and are applied before \n\
+  maxlen. No data is copied. \n\
+* step - Use only every step'th element, as if the sequences had been \n\
+  sliced with sequence[start:stop:step]. This must be a positive \n\
+  integer. This is an optional keyword parameter. \n\
 * nosimd - If True, SIMD acceleration is disabled if present.  \n\
   The default is False (SIMD acceleration is enabled if present). \n\
 * result - A boolean value corresponding to the result of all the \n\
@@ -796,14 +1184,33 @@ Call formats: \n\
 /* A list of all the methods defined by this module. 
  "ge" is the name seen inside of Python. 
  "py_ge" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef ge_methods[] = {
-	{"ge",  (PyCFunction)py_ge, METH_VARARGS | METH_KEYWORDS, ge__doc__}, 
+	{"ge",  (PyCFunction)py_ge, BF_METHFLAGS, ge__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int ge_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	ge_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
+	return PyModule_AddFunctions(module, ge_methods);
+};
+
+#else
+
 static struct PyModuleDef gemodule = {
     PyModuleDef_HEAD_INIT,
     "ge",
@@ -814,8 +1221,16 @@ static struct PyModuleDef gemodule = {
 
 PyMODINIT_FUNC PyInit_ge(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	ge_initsimd();
+	#endif
+
+	bytesstride_initsimd();
+
     return PyModule_Create(&gemodule);
 };
 
+#endif
+
 /*--------------------------------------------------------------------------- */
 
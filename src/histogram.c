@@ -0,0 +1,472 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   histogram.c
+// Purpose:  Count how many times each byte value occurs in a sequence.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+/* The histogram is counted using several separate tables of counts, with
+	consecutive elements added to different tables. When the same value
+	occurs several times in a row, each increment must otherwise wait for
+	the previous one to be stored before it can be loaded again. Using
+	separate tables lets these proceed in parallel. The tables are added
+	together at the end. There is no SIMD version, as SIMD instructions
+	cannot increment a table of counters.
+
+	The counts in the tables are 32 bit to keep them small enough to stay
+	in the cache, so the sequence is counted in blocks which cannot overflow
+	them. The counts for each block are added to 64 bit totals.
+*/
+
+/*--------------------------------------------------------------------------- */
+
+#include "Python.h"
+
+#include <string.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+#include "byteserrs.h"
+
+#include "bytesparams_base.h"
+#include "bytesthreads.h"
+
+/*--------------------------------------------------------------------------- */
+
+// The number of possible byte values, and so the number of counts.
+#define HIST_NUMBINS 256
+
+// The number of separate tables of counts.
+#define HIST_NUMTABLES 4
+
+// The most elements which are counted using the 32 bit tables before the
+// counts are added to the totals.
+#define HIST_MAXBLOCK 16777216
+
+/*--------------------------------------------------------------------------- */
+
+// The list of keyword arguments. All argument must be listed, whether we
+// intend to use them for keywords or not.
+static char *kwlist[] = {"data", "out", "maxlen", "threads", "start", "stop", "step", NULL};
+
+/*--------------------------------------------------------------------------- */
+
+/* Count each byte value in one block of a sequence.
+	arraylen = The length of the block. This must not be more than
+		HIST_MAXBLOCK.
+	step = The step between the elements which are used.
+	data = The input data array.
+	counts = The counts for each value are added to this.
+	Returns: Nothing.
+*/
+static void histogram_block(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data, unsigned long long *counts) {
+
+	// array index counter.
+	Py_ssize_t x, alignedlength;
+	unsigned int y;
+
+	uint32_t tables[HIST_NUMTABLES][HIST_NUMBINS];
+
+	memset(tables, 0, sizeof(tables));
+
+	// The length which can be counted using every table in turn.
+	alignedlength = arraylen - (arraylen % (HIST_NUMTABLES * step));
+
+	for (x = 0; x < alignedlength; x += HIST_NUMTABLES * step) {
+		tables[0][data[x]]++;
+		tables[1][data[x + step]]++;
+		tables[2][data[x + (2 * step)]]++;
+		tables[3][data[x + (3 * step)]]++;
+	}
+
+	// Count the left over elements at the end of the array.
+	for (x = alignedlength; x < arraylen; x += step) {
+		tables[0][data[x]]++;
+	}
+
+	// Add the tables to the totals.
+	for (y = 0; y < HIST_NUMBINS; y++) {
+		counts[y] += (unsigned long long) tables[0][y] + tables[1][y] + tables[2][y] + tables[3][y];
+	}
+
+}
+
+
+/* Count each byte value in a sequence.
+	arraylen = The length of the data array.
+	step = The step between the elements which are used.
+	data = The input data array.
+	counts = The counts for each value are added to this.
+	Returns: Nothing.
+*/
+static void histogram_range(Py_ssize_t arraylen, Py_ssize_t step, unsigned char *data, unsigned long long *counts) {
+
+	Py_ssize_t pos, blocklen;
+
+	// Each block must start on an element which is used.
+	Py_ssize_t blocksize = HIST_MAXBLOCK - (HIST_MAXBLOCK % step);
+
+	for (pos = 0; pos < arraylen; pos += blocklen) {
+		blocklen = arraylen - pos;
+		if (blocklen > blocksize) {
+			blocklen = blocksize;
+		}
+		histogram_block(blocklen, step, &data[pos], counts);
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+// The data for counting a sequence, which may be divided between threads.
+struct histogram_threadctx {
+	Py_ssize_t arraylen;
+	Py_ssize_t step;
+	unsigned char *data;
+	// The counts for each part. There are HIST_NUMBINS for each part.
+	unsigned long long *partcounts;
+};
+
+
+/* Count one part of the sequence. If the calculation is not divided
+	between threads, then there is just one part covering the whole
+	sequence.
+	ctx = The calculation data (struct histogram_threadctx).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void histogram_part(void *ctx, int part, int nparts) {
+
+	struct histogram_threadctx *threadctx = (struct histogram_threadctx *) ctx;
+
+	// The range of this part of the sequence.
+	Py_ssize_t start, partlen;
+
+	// When a step is used, each part must begin on an element which is used.
+	if (threadctx->step > 1) {
+		partrangestep(threadctx->arraylen, threadctx->step, part, nparts, &start, &partlen);
+	} else {
+		partrange(threadctx->arraylen, part, nparts, &start, &partlen);
+	}
+
+	histogram_range(partlen, threadctx->step, &threadctx->data[start], &threadctx->partcounts[part * HIST_NUMBINS]);
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Get the buffer for an existing histogram passed as the "out" parameter.
+	This must be a writable array('Q') with one element for each byte value.
+	outobj = The output object as a PyObject (not parsed).
+	outbuffer = Receives the buffer, which must be released after use.
+	Returns: 0 if OK, or -1 with a Python exception set.
+*/
+static int getoutbuffer(PyObject *outobj, Py_buffer *outbuffer) {
+
+	const char *format;
+
+	if (PyObject_GetBuffer(outobj, outbuffer, PyBUF_WRITABLE | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) < 0) {
+		PyErr_Clear();
+		ErrMsgOutputNotMutableParam();
+		return -1;
+	}
+
+	// The elements must be unsigned 64 bit integers.
+	format = (outbuffer->format != NULL) ? outbuffer->format : "B";
+	if ((outbuffer->itemsize != sizeof(unsigned long long))
+			|| !(!strcmp(format, "Q") || (!strcmp(format, "L") && (sizeof(unsigned long) == sizeof(unsigned long long))))) {
+		PyBuffer_Release(outbuffer);
+		ErrMsgParameterError();
+		return -1;
+	}
+
+	if (outbuffer->len != (HIST_NUMBINS * sizeof(unsigned long long))) {
+		PyBuffer_Release(outbuffer);
+		ErrMsgArrayLengthMismatch();
+		return -1;
+	}
+
+	return 0;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Create an array('Q') containing the counts.
+	counts = The count for each byte value.
+	Returns: A new reference to the array, or NULL with a Python exception set.
+*/
+static PyObject *histogram_makearray(unsigned long long *counts) {
+
+	PyObject *arraymodule, *arrayobj, *viewobj, *callresult;
+
+	arraymodule = PyImport_ImportModule("array");
+	if (arraymodule == NULL) {
+		return NULL;
+	}
+	arrayobj = PyObject_CallMethod(arraymodule, "array", "s", "Q");
+	Py_DECREF(arraymodule);
+	if (arrayobj == NULL) {
+		return NULL;
+	}
+
+	// The counts are copied in directly as raw bytes.
+	viewobj = PyMemoryView_FromMemory((char *) counts, HIST_NUMBINS * sizeof(unsigned long long), PyBUF_READ);
+	if (viewobj == NULL) {
+		Py_DECREF(arrayobj);
+		return NULL;
+	}
+	callresult = PyObject_CallMethod(arrayobj, "frombytes", "O", viewobj);
+	Py_DECREF(viewobj);
+	if (callresult == NULL) {
+		Py_DECREF(arrayobj);
+		return NULL;
+	}
+	Py_DECREF(callresult);
+
+	return arrayobj;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_histogram(PyObject *self, BF_ARGSDECL) {
+
+
+	// The parameters in the order given by the keyword list.
+	PyObject *argobjs[BF_MAXPARAMS];
+
+	struct paramsdata paramobjdata1;
+	bool hasbuffer1 = false, paramoverflow = false;
+
+	// The existing histogram to add to, if one was given.
+	Py_buffer outbuffer;
+	bool hasoutbuffer = false;
+
+	// Number of elements to work on. If zero or less, ignore this parameter.
+	Py_ssize_t bytesmaxlen = 0;
+
+	// The part of the sequence to work on.
+	Py_ssize_t arraylen, startpos = 0, step = 1;
+
+	// The number of threads to use. If zero, use the default.
+	int threads = 0;
+
+	// The number of parts to divide the calculation into.
+	int nparts, part;
+	unsigned int y;
+
+	struct histogram_threadctx threadctx;
+
+	unsigned long long counts[HIST_NUMBINS];
+	unsigned long long *outcounts;
+
+	PyObject *result = NULL;
+
+	// -----------------------------------------------------
+
+
+	// Sort the arguments into parameter order.
+	if (getargobjs(BF_ARGSUNPACK, kwlist, 1, 2, argobjs)
+			|| getssizearg(argobjs[2], &bytesmaxlen)
+			|| getintarg(argobjs[3], &threads)) {
+		ErrMsgParameterError();
+		return NULL;
+	}
+
+
+	// The data must be a bytes or bytearray.
+	if (get_paramdata(argobjs[0], &paramobjdata1, &hasbuffer1, &paramoverflow)
+			|| ((paramobjdata1.paramtype != paramobj_readonly) && (paramobjdata1.paramtype != paramobj_writable))) {
+		ErrMsgParameterError();
+		goto done;
+	}
+
+	// Get the number of threads to use.
+	threads = getthreadcount(threads);
+	if (threads < 0) {
+		goto done;
+	}
+
+	// Select the part of the sequence to work on.
+	arraylen = paramobjdata1.pybuffer.len;
+	if (getseqwindow(argobjs[4], argobjs[5], &arraylen, &startpos)
+			|| getseqstep(argobjs[6], &step)) {
+		ErrMsgParameterError();
+		goto done;
+	}
+	offsetseqdata(&paramobjdata1, startpos);
+	arraylen = adjustbytesmaxlen(arraylen, bytesmaxlen);
+
+
+	// The counts are added to an existing histogram if one was given.
+	if ((argobjs[1] != NULL) && (argobjs[1] != Py_None)) {
+		if (getoutbuffer(argobjs[1], &outbuffer)) {
+			goto done;
+		}
+		hasoutbuffer = true;
+		outcounts = (unsigned long long *) outbuffer.buf;
+	} else {
+		memset(counts, 0, sizeof(counts));
+		outcounts = counts;
+	}
+
+
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(threads, arraylen);
+
+	threadctx.arraylen = arraylen;
+	threadctx.step = step;
+	threadctx.data = paramobjdata1.byteseq.B;
+	threadctx.partcounts = PyMem_Calloc((size_t) nparts * HIST_NUMBINS, sizeof(unsigned long long));
+	if (threadctx.partcounts == NULL) {
+		PyErr_NoMemory();
+		goto done;
+	}
+
+
+	// Call the implementing function.
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(arraylen)
+	nparts = runparallel(histogram_part, &threadctx, nparts);
+	BF_END_ALLOW_THREADS
+
+
+	// Combine the counts for each part.
+	for (part = 0; part < nparts; part++) {
+		for (y = 0; y < HIST_NUMBINS; y++) {
+			outcounts[y] += threadctx.partcounts[(part * HIST_NUMBINS) + y];
+		}
+	}
+	PyMem_Free(threadctx.partcounts);
+
+
+	// Return the existing histogram, or a new one.
+	if (hasoutbuffer) {
+		Py_INCREF(argobjs[1]);
+		result = argobjs[1];
+	} else {
+		result = histogram_makearray(counts);
+	}
+
+
+	done:
+	if (hasoutbuffer) {
+		PyBuffer_Release(&outbuffer);
+	}
+	// An integer which is out of range sets hasbuffer1 without a buffer.
+	if (hasbuffer1 && ((paramobjdata1.paramtype == paramobj_readonly) || (paramobjdata1.paramtype == paramobj_writable))) {
+		PyBuffer_Release(&paramobjdata1.pybuffer);
+	}
+
+	return result;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(histogram__doc__,
+"histogram \n\
+_____________________________ \n\
+\n\
+Count how many times each value occurs in a bytes or bytearray object. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          array('Q', [list(sequence).count(x) for x in range(256)]) \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  result = histogram(sequence) \n\
+  result = histogram(sequence, out) \n\
+  result = histogram(sequence, maxlen=y) \n\
+  result = histogram(sequence, start=i, stop=j) \n\
+  result = histogram(sequence, step=k) \n\
+  result = histogram(sequence, threads=4) \n\
+\n\
+* sequence - An input bytes or bytearray to be examined. \n\
+* out - An existing array('Q') of 256 counts. The counts for sequence \n\
+  are added to it, and it is returned as the result. This allows a \n\
+  histogram to be accumulated over several sequences. If this is None or \n\
+  not specified, a new array is returned. \n\
+* maxlen - Limit the length of the sequence used. This must be a valid \n\
+  positive integer. If a zero or negative length, or a value which is \n\
+  greater than the actual length of the sequence is specified, this \n\
+  parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. These are optional keyword \n\
+  parameters and are applied before maxlen. No data is copied. \n\
+* step - Use only every step'th element, as if the sequence had been \n\
+  sliced with sequence[start:stop:step]. This must be a positive \n\
+  integer. This is an optional keyword parameter. \n\
+* threads - The number of threads to divide the calculation between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
+* result - An array('Q') of 256 elements, where each element is the \n\
+  number of times that value occurred. \n\
+");
+
+
+/*--------------------------------------------------------------------------- */
+
+/* A list of all the methods defined by this module. 
+ "histogram" is the name seen inside of Python. 
+ "py_histogram" is the name of the C function handling the Python call. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
+ The {NULL, NULL} entry indicates the end of the method definitions. */
+static PyMethodDef histogram_methods[] = {
+	{"histogram",  (PyCFunction)py_histogram, BF_METHFLAGS, histogram__doc__}, 
+	{NULL, NULL, 0, NULL}
+};
+
+
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int histogram_addfunc(PyObject *module)
+{
+	return PyModule_AddFunctions(module, histogram_methods);
+};
+
+#else
+
+static struct PyModuleDef histogrammodule = {
+    PyModuleDef_HEAD_INIT,
+    "histogram",
+    NULL,
+    -1,
+    histogram_methods
+};
+
+PyMODINIT_FUNC PyInit_histogram(void)
+{
+    return PyModule_Create(&histogrammodule);
+};
+
+#endif
+
+/*--------------------------------------------------------------------------- */
@@ -38,6 +38,8 @@
 #include "bytesparams_base.h"
 
 #include "bytesparams_two.h"
+#include "bytesparams_many.h"
+#include "bytesthreads.h"
 
 /*--------------------------------------------------------------------------- */
 
@@ -159,7 +161,7 @@ void or__1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char par
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -168,11 +170,11 @@ void or__1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char par
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data1[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
 		// The actual SIMD operation. 
-		datasliceleft = (v16qi) __builtin_ia32_por128( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceleft = (v16qi) _mm_or_si128((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data1[index], datasliceleft);
+		_mm_storeu_si128((__m128i *) &data1[index], (__m128i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -201,7 +203,7 @@ void or__2_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char par
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceright = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceright = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -210,11 +212,11 @@ void or__2_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char par
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data1[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
 		// The actual SIMD operation. 
-		datasliceleft = (v16qi) __builtin_ia32_por128( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceleft = (v16qi) _mm_or_si128((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data3[index], datasliceleft);
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -243,7 +245,7 @@ void or__3_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *dat
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -252,11 +254,11 @@ void or__3_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *dat
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *) &data2[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		// The actual SIMD operation. 
-		datasliceright = (v16qi) __builtin_ia32_por128( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceright = (v16qi) _mm_or_si128((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data2[index], datasliceright);
+		_mm_storeu_si128((__m128i *) &data2[index], (__m128i) datasliceright);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -285,7 +287,7 @@ void or__4_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *dat
 	for (y = 0; y < CHARSIMDSIZE; y++) {
 		compvals[y] = param;
 	}
-	datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) compvals);
+	datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) compvals);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -294,11 +296,11 @@ void or__4_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *dat
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *) &data2[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		// The actual SIMD operation. 
-		datasliceright = (v16qi) __builtin_ia32_por128( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceright = (v16qi) _mm_or_si128((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data3[index], datasliceright);
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) datasliceright);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -328,12 +330,12 @@ void or__5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *da
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data1[index]);
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *) &data2[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		// The actual SIMD operation. 
-		datasliceleft = (v16qi) __builtin_ia32_por128( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceleft = (v16qi) _mm_or_si128((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data1[index], datasliceleft);
+		_mm_storeu_si128((__m128i *) &data1[index], (__m128i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -363,12 +365,12 @@ void or__6_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *da
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v16qi) __builtin_ia32_lddqu((char *) &data1[index]);
-		datasliceright = (v16qi) __builtin_ia32_lddqu((char *) &data2[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
 		// The actual SIMD operation. 
-		datasliceleft = (v16qi) __builtin_ia32_por128( (v2di) datasliceleft,  (v2di) datasliceright);
+		datasliceleft = (v16qi) _mm_or_si128((__m128i) datasliceleft, (__m128i) datasliceright);
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data3[index], datasliceleft);
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) datasliceleft);
 	}
 
 	// Get the max value within the left over elements at the end of the array.
@@ -380,6 +382,534 @@ void or__6_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *da
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX2 SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void or__1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data into the vector register.
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft | datasliceright;
+		// Store the result.
+		_mm256_storeu_si256((__m256i *) &data1[index], (__m256i) datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = data1[index] | param;
+	}
+
+}
+
+
+
+// param_arr_num_arr
+AF_TARGET_AVX2 void or__2_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data into the vector register.
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft | datasliceright;
+		// Store the result.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = data1[index] | param;
+	}
+
+}
+
+
+
+// param_num_arr_none
+AF_TARGET_AVX2 void or__3_avx2_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param;
+	}
+	datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data into the vector register.
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// The actual SIMD operation. 
+		datasliceright = datasliceleft | datasliceright;
+		// Store the result.
+		_mm256_storeu_si256((__m256i *) &data2[index], (__m256i) datasliceright);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data2[index] = param | data2[index];
+	}
+
+}
+
+
+
+// param_num_arr_arr
+AF_TARGET_AVX2 void or__4_avx2_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	v32qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX2];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		compvals[y] = param;
+	}
+	datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data into the vector register.
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// The actual SIMD operation. 
+		datasliceright = datasliceleft | datasliceright;
+		// Store the result.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) datasliceright);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = param | data2[index];
+	}
+
+}
+
+
+
+// param_arr_arr_none
+AF_TARGET_AVX2 void or__5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data into the vector register.
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft | datasliceright;
+		// Store the result.
+		_mm256_storeu_si256((__m256i *) &data1[index], (__m256i) datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = data1[index] | data2[index];
+	}
+
+}
+
+
+
+// param_arr_arr_arr
+AF_TARGET_AVX2 void or__6_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data into the vector register.
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft | datasliceright;
+		// Store the result.
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = data1[index] | data2[index];
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX-512BW SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void or__1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft | datasliceright;
+		// Store the result.
+		_mm512_storeu_si512(&data1[index], (__m512i) datasliceleft);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceleft = datasliceleft | datasliceright;
+		_mm512_mask_storeu_epi8(&data1[alignedlength], tailmask, (__m512i) datasliceleft);
+	}
+
+}
+
+
+
+// param_arr_num_arr
+AF_TARGET_AVX512BW void or__2_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
+	}
+	datasliceright = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft | datasliceright;
+		// Store the result.
+		_mm512_storeu_si512(&data3[index], (__m512i) datasliceleft);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceleft = datasliceleft | datasliceright;
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, (__m512i) datasliceleft);
+	}
+
+}
+
+
+
+// param_num_arr_none
+AF_TARGET_AVX512BW void or__3_avx512_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
+	}
+	datasliceleft = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		// The actual SIMD operation. 
+		datasliceright = datasliceleft | datasliceright;
+		// Store the result.
+		_mm512_storeu_si512(&data2[index], (__m512i) datasliceright);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		datasliceright = datasliceleft | datasliceright;
+		_mm512_mask_storeu_epi8(&data2[alignedlength], tailmask, (__m512i) datasliceright);
+	}
+
+}
+
+
+
+// param_num_arr_arr
+AF_TARGET_AVX512BW void or__4_avx512_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	unsigned int y;
+
+	v64qi datasliceleft, datasliceright;
+	unsigned char compvals[CHARSIMDSIZE_AVX512];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		compvals[y] = param;
+	}
+	datasliceleft = (v64qi) _mm512_loadu_si512(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		// The actual SIMD operation. 
+		datasliceright = datasliceleft | datasliceright;
+		// Store the result.
+		_mm512_storeu_si512(&data3[index], (__m512i) datasliceright);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		datasliceright = datasliceleft | datasliceright;
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, (__m512i) datasliceright);
+	}
+
+}
+
+
+
+// param_arr_arr_none
+AF_TARGET_AVX512BW void or__5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft | datasliceright;
+		// Store the result.
+		_mm512_storeu_si512(&data1[index], (__m512i) datasliceleft);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		datasliceleft = datasliceleft | datasliceright;
+		_mm512_mask_storeu_epi8(&data1[alignedlength], tailmask, (__m512i) datasliceleft);
+	}
+
+}
+
+
+
+// param_arr_arr_arr
+AF_TARGET_AVX512BW void or__6_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+
+	v64qi datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		// The actual SIMD operation. 
+		datasliceleft = datasliceleft | datasliceright;
+		// Store the result.
+		_mm512_storeu_si512(&data3[index], (__m512i) datasliceleft);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		datasliceleft = datasliceleft | datasliceright;
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, (__m512i) datasliceleft);
+	}
+
+}
+#endif
+
+
 /*--------------------------------------------------------------------------- */
 /* The following series of functions reflect the different parameter options possible.
    arraylen = The length of the data arrays.
@@ -874,9 +1404,76 @@ void or__6_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *
 #endif
 
 
+/*--------------------------------------------------------------------------- */
+/* The SIMD functions to use. These are selected once when the module is 
+   initialised, according to the SIMD features supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	void (*param_arr_num_none)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param);
+	void (*param_arr_num_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*param_num_arr_none)(Py_ssize_t arraylen, unsigned char param, unsigned char *data2);
+	void (*param_num_arr_arr)(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3);
+	void (*param_arr_arr_none)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2);
+	void (*param_arr_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3);
+} or__simdfuncs;
+
+
+/* Select the SIMD functions for this CPU.
+*/
+static void or__initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		or__simdfuncs.param_arr_num_none = or__1_avx512_simd;
+		or__simdfuncs.param_arr_num_arr = or__2_avx512_simd;
+		or__simdfuncs.param_num_arr_none = or__3_avx512_simd;
+		or__simdfuncs.param_num_arr_arr = or__4_avx512_simd;
+		or__simdfuncs.param_arr_arr_none = or__5_avx512_simd;
+		or__simdfuncs.param_arr_arr_arr = or__6_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		or__simdfuncs.param_arr_num_none = or__1_avx2_simd;
+		or__simdfuncs.param_arr_num_arr = or__2_avx2_simd;
+		or__simdfuncs.param_num_arr_none = or__3_avx2_simd;
+		or__simdfuncs.param_num_arr_arr = or__4_avx2_simd;
+		or__simdfuncs.param_arr_arr_none = or__5_avx2_simd;
+		or__simdfuncs.param_arr_arr_arr = or__6_avx2_simd;
+	} else {
+		or__simdfuncs.param_arr_num_none = or__1_x86_simd;
+		or__simdfuncs.param_arr_num_arr = or__2_x86_simd;
+		or__simdfuncs.param_num_arr_none = or__3_x86_simd;
+		or__simdfuncs.param_num_arr_arr = or__4_x86_simd;
+		or__simdfuncs.param_arr_arr_none = or__5_x86_simd;
+		or__simdfuncs.param_arr_arr_arr = or__6_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	or__simdfuncs.param_arr_num_none = or__1_armv7_simd;
+	or__simdfuncs.param_arr_num_arr = or__2_armv7_simd;
+	or__simdfuncs.param_num_arr_none = or__3_armv7_simd;
+	or__simdfuncs.param_num_arr_arr = or__4_armv7_simd;
+	or__simdfuncs.param_arr_arr_none = or__5_armv7_simd;
+	or__simdfuncs.param_arr_arr_arr = or__6_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	or__simdfuncs.param_arr_num_none = or__1_armv8_simd;
+	or__simdfuncs.param_arr_num_arr = or__2_armv8_simd;
+	or__simdfuncs.param_num_arr_none = or__3_armv8_simd;
+	or__simdfuncs.param_num_arr_arr = or__4_armv8_simd;
+	or__simdfuncs.param_arr_arr_none = or__5_armv8_simd;
+	or__simdfuncs.param_arr_arr_arr = or__6_armv8_simd;
+	#endif
+
+}
+#endif
+
 /*--------------------------------------------------------------------------- */
 /* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+   version, or the SIMD version selected for this CPU.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    data2 = The second data array.
@@ -889,18 +1486,7 @@ void or__1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigne
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			or__1_x86_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			or__1_armv7_simd(arraylen, data1, param);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			or__1_armv8_simd(arraylen, data1, param);
-		#endif
-
+		or__simdfuncs.param_arr_num_none(arraylen, data1, param);
 	} else {
 	#endif
 		or__1(arraylen, data1, param);
@@ -915,18 +1501,7 @@ void or__2_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigne
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			or__2_x86_simd(arraylen, data1, param, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			or__2_armv7_simd(arraylen, data1, param, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			or__2_armv8_simd(arraylen, data1, param, data3);
-		#endif
-
+		or__simdfuncs.param_arr_num_arr(arraylen, data1, param, data3);
 	} else {
 	#endif
 		or__2(arraylen, data1, param, data3);
@@ -941,18 +1516,7 @@ void or__3_select(Py_ssize_t arraylen, int nosimd, unsigned char param, unsigned
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			or__3_x86_simd(arraylen, param, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			or__3_armv7_simd(arraylen, param, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			or__3_armv8_simd(arraylen, param, data2);
-		#endif
-
+		or__simdfuncs.param_num_arr_none(arraylen, param, data2);
 	} else {
 	#endif
 		or__3(arraylen, param, data2);
@@ -967,18 +1531,7 @@ void or__4_select(Py_ssize_t arraylen, int nosimd, unsigned char param, unsigned
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			or__4_x86_simd(arraylen, param, data2, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			or__4_armv7_simd(arraylen, param, data2, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			or__4_armv8_simd(arraylen, param, data2, data3);
-		#endif
-
+		or__simdfuncs.param_num_arr_arr(arraylen, param, data2, data3);
 	} else {
 	#endif
 		or__4(arraylen, param, data2, data3);
@@ -993,18 +1546,7 @@ void or__5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigne
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			or__5_x86_simd(arraylen, data1, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			or__5_armv7_simd(arraylen, data1, data2);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			or__5_armv8_simd(arraylen, data1, data2);
-		#endif
-
+		or__simdfuncs.param_arr_arr_none(arraylen, data1, data2);
 	} else {
 	#endif
 		or__5(arraylen, data1, data2);
@@ -1019,18 +1561,7 @@ void or__6_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigne
 
 	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
 	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
-		#if defined(AF_HASSIMD_X86)
-			or__6_x86_simd(arraylen, data1, data2, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			or__6_armv7_simd(arraylen, data1, data2, data3);
-		#endif
-
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			or__6_armv8_simd(arraylen, data1, data2, data3);
-		#endif
-
+		or__simdfuncs.param_arr_arr_arr(arraylen, data1, data2, data3);
 	} else {
 	#endif
 		or__6(arraylen, data1, data2, data3);
@@ -1046,59 +1577,99 @@ void or__6_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigne
 
 /*--------------------------------------------------------------------------- */
 
-/* The wrapper to the underlying C function */
-static PyObject *py_or_(PyObject *self, PyObject *args, PyObject *keywds) {
-
-
-	// This is used to hold the parsed parameters.
-	struct args_params_2 bytesdata = ARGSINIT_TWO;
-
-
-	// -----------------------------------------------------
+/* Calculate one part of the sequences. If the calculation is not divided
+	between threads, then there is just one part covering the whole sequence.
+	ctx = The parsed parameters (struct args_params_2).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void or__part(void *ctx, int part, int nparts) {
 
+	struct args_params_2 *bytesdata = (struct args_params_2 *) ctx;
 
-	// Get the parameters passed from Python. 
-	bytesdata = getparams_two(self, args, keywds, "or_");
+	// The range of this part of the sequences.
+	Py_ssize_t start, partlen;
 
-	// If there was an error, we count on the parameter parsing function to 
-	// release the buffers if this was necessary.
-	if (bytesdata.errorcode) {
-		return NULL;
-	}
+	partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
 
-	// Call the C function.
 	// Select the correct implementation.
-	switch (bytesdata.paramcat) {
+	switch (bytesdata->paramcat) {
 		case param_arr_num_none : {
-			or__1_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
+			or__1_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param);
 			break;
 		}
 		case param_arr_num_arr : {
-			or__2_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param, bytesdata.bytes3.B);
+			or__2_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param, bytesdata->bytes3.B + start);
 			break;
 		}
 		case param_num_arr_none : {
-			or__3_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.param, bytesdata.bytes2.B);
+			or__3_select(partlen, bytesdata->nosimd, bytesdata->param, bytesdata->bytes2.B + start);
 			break;
 		}
 		case param_num_arr_arr : {
-			or__4_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.param, bytesdata.bytes2.B, bytesdata.bytes3.B);
+			or__4_select(partlen, bytesdata->nosimd, bytesdata->param, bytesdata->bytes2.B + start, bytesdata->bytes3.B + start);
 			break;
 		}
 		case param_arr_arr_none : {
-			or__5_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.bytes2.B);
+			or__5_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start);
 			break;
 		}
 		case param_arr_arr_arr : {
-			or__6_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.bytes2.B, bytesdata.bytes3.B);
+			or__6_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start, bytesdata->bytes3.B + start);
+			break;
+		}
+		// The other categories are only used by functions which take a mask.
+		default : {
 			break;
 		}
 	}
 
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_or_(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_2 bytesdata = ARGSINIT_TWO;
+
+	// The number of parts to divide the calculation into.
+	int nparts;
+
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python. 
+	bytesdata = getparams_two(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+
+	// Call the C function.
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	runparallel(or__part, &bytesdata, nparts);
+	BF_END_ALLOW_THREADS
+
 	// Release the buffers. 
 	releasebuffers_two(bytesdata);
 
 
+	// Return the new output sequence if one was created.
+	if (bytesdata.outobj != NULL) {
+		return bytesdata.outobj;
+	}
+
 	// Everything was successful.
 	Py_RETURN_NONE;
 
@@ -1130,7 +1701,10 @@ Call formats: \n\
   or_(sequence1, sequence2) \n\
   or_(sequence1, sequence2, outpsequence) \n\
   or_(sequence1, param, maxlen=y) \n\
+  or_(sequence1, param, start=i, stop=j) \n\
   or_(sequence1, param, nosimd=False) \n\
+  or_(sequence1, param, threads=4) \n\
+  result = or_(sequence1, param, outtype=bytes) \n\
 \n\
 * sequence1 - The first input data bytes or bytearray sequence to be \n\
   examined. If no output sequence is provided the results will overwrite \n\
@@ -1143,8 +1717,122 @@ Call formats: \n\
   positive integer. If a zero or negative length, or a value which is \n\
   greater than the actual length of the sequence is specified, this \n\
   parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. The same part of every sequence is \n\
+  used. These are optional keyword parameters and are applied before \n\
+  maxlen. No data is copied. \n\
 * nosimd - If True, SIMD acceleration is disabled. This parameter is \n\
   optional. The default is FALSE. \n\
+* threads - The number of threads to divide the calculation between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
+* outtype - If bytes or bytearray, a new sequence of that type is \n\
+  created, filled with the results, and returned. The input sequences \n\
+  are not changed and may be read only. The new sequence has the length \n\
+  of the part of the input which is used. This cannot be combined with \n\
+  outpsequence. This is an optional keyword parameter. \n\
+* result - The new sequence if outtype was given, otherwise None. \n\
+");
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function for a batch of sequences */
+static PyObject *py_or__many(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The parameters for each sequence in the batch.
+	struct args_params_2 seqdata = ARGSINIT_TWO;
+
+	Py_ssize_t x;
+
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python. 
+	bytesdata = getparams_many_two(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+	// The same parameter is used with every sequence.
+	seqdata.nosimd = bytesdata.nosimd;
+	seqdata.param = bytesdata.param;
+	if (bytesdata.hasparambuffer) {
+		seqdata.bytes2.buf = bytesdata.parambuffer.buf;
+		seqdata.paramcat = (bytesdata.outlist != NULL) ? param_arr_arr_arr : param_arr_arr_none;
+	} else {
+		seqdata.paramcat = (bytesdata.outlist != NULL) ? param_arr_num_arr : param_arr_num_none;
+	}
+
+	// Call the C function for each sequence.
+	// The GIL is released if the batch is large.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.totallen)
+	for (x = 0; x < bytesdata.nseqs; x++) {
+		seqdata.arraylen = bytesdata.pybuffers[x].len;
+		seqdata.bytes1.buf = bytesdata.pybuffers[x].buf;
+		if (bytesdata.outlist != NULL) {
+			seqdata.bytes3.B = bytesdata.outdata[x];
+		}
+		or__part(&seqdata, 0, 1);
+	}
+	BF_END_ALLOW_THREADS
+
+	// Release the buffers. 
+	releasebuffers_many(bytesdata);
+
+
+	// Return the new output sequences if they were created.
+	if (bytesdata.outlist != NULL) {
+		return bytesdata.outlist;
+	}
+
+	// Everything was successful.
+	Py_RETURN_NONE;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(or__many__doc__,
+"or__many \n\
+_____________________________ \n\
+\n\
+Calculate or_ over the values in each sequence in a batch. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          [or_(x, param) for x in sequences] \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  or__many(sequences, param) \n\
+  or__many(sequences, paramsequence) \n\
+  or__many(sequences, param, nosimd=False) \n\
+  result = or__many(sequences, param, outtype=bytes) \n\
+\n\
+* sequences - A list or other iterable of bytes or bytearray sequences. \n\
+  If outtype is not given the results overwrite the input data, so each \n\
+  sequence must be writable. \n\
+* param - A non-sequence numeric parameter. \n\
+* paramsequence - A sequence which is applied to each sequence in the \n\
+  batch. It must be the same length as each of them. \n\
+* nosimd - If True, SIMD acceleration is disabled. This parameter is \n\
+  optional. The default is FALSE. \n\
+* outtype - If bytes or bytearray, a new sequence of that type is \n\
+  created for each input sequence, filled with the results, and a list \n\
+  of them is returned. The input sequences are not changed and may be \n\
+  read only. This is an optional keyword parameter. \n\
+* result - A list of new sequences if outtype was given, otherwise None. \n\
 ");
 
 
@@ -1153,14 +1841,32 @@ Call formats: \n\
 /* A list of all the methods defined by this module. 
  "or_" is the name seen inside of Python. 
  "py_or_" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef or__methods[] = {
-	{"or_",  (PyCFunction)py_or_, METH_VARARGS | METH_KEYWORDS, or___doc__}, 
+	{"or_",  (PyCFunction)py_or_, BF_METHFLAGS, or___doc__}, 
+	{"or__many",  (PyCFunction)py_or__many, BF_METHFLAGS, or__many__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int or__addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	or__initsimd();
+	#endif
+
+	return PyModule_AddFunctions(module, or__methods);
+};
+
+#else
+
 static struct PyModuleDef or_module = {
     PyModuleDef_HEAD_INIT,
     "or_",
@@ -1171,8 +1877,14 @@ static struct PyModuleDef or_module = {
 
 PyMODINIT_FUNC PyInit_or_(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	or__initsimd();
+	#endif
+
     return PyModule_Create(&or_module);
 };
 
+#endif
+
 /*--------------------------------------------------------------------------- */
 
@@ -38,6 +38,8 @@
 #include "bytesparams_base.h"
 
 #include "bytesparams_two.h"
+#include "bytesparams_many.h"
+#include "bytesthreads.h"
 
 /*--------------------------------------------------------------------------- */
 
@@ -50,6 +52,18 @@
 /*--------------------------------------------------------------------------- */
 
 
+/*--------------------------------------------------------------------------- */
+/* Shift a byte value. A shift count of 8 or more shifts out every bit, as
+   it would if a Python integer was shifted and then truncated to a byte.
+   C does not define shifts by 32 or more, so the count is limited to 8.
+   This form (rather than selecting zero) lets the compiler vectorise the
+   non-SIMD loops.
+*/
+#define rshift_byte(x, n) ((x) >> (((n) > 7) ? 8 : (n)))
+
+/*--------------------------------------------------------------------------- */
+
+
 /*--------------------------------------------------------------------------- */
 /* The following series of functions reflect the different parameter options possible.
    arraylen = The length of the data arrays.
@@ -65,7 +79,7 @@ void rshift_1(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data1[x] = data1[x] >> param;
+		data1[x] = rshift_byte(data1[x], param);
 	}
 
 
@@ -78,7 +92,7 @@ void rshift_2(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, un
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data3[x] = data1[x] >> param;
+		data3[x] = rshift_byte(data1[x], param);
 	}
 
 }
@@ -90,7 +104,7 @@ void rshift_3(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data2[x] = param >> data2[x];
+		data2[x] = rshift_byte(param, data2[x]);
 	}
 
 }
@@ -102,7 +116,7 @@ void rshift_4(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, un
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data3[x] = param >> data2[x];
+		data3[x] = rshift_byte(param, data2[x]);
 	}
 
 }
@@ -116,7 +130,7 @@ void rshift_5(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data1[x] = data1[x] >> data2[x];
+		data1[x] = rshift_byte(data1[x], data2[x]);
 	}
 
 }
@@ -128,7 +142,7 @@ void rshift_6(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, u
 	Py_ssize_t x;
 
 	for (x = 0; x < arraylen; x++) {
-		data3[x] = data1[x] >> data2[x];
+		data3[x] = rshift_byte(data1[x], data2[x]);
 	}
 
 }
@@ -150,33 +164,11 @@ void rshift_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	__m128i dataslice, vmaskslice, vcountslice;
 
-	// The mask and shift operations are done using a different data
-	// type than the parameters passed to the function. We always use
-	// the largest x86 shift operation available, which is unsigned int
-	v4si datasliceleft, vmaskslice;
-
-	// This mask gets rid of the bits which would otherwise get shifted
-	// into the adjoining vector element.
-	unsigned int maskvals[] = {0xffffffff, 0xfefefefe, 0xfcfcfcfc, 0xf8f8f8f8, 0xf0f0f0f0, 0xe0e0e0e0, 0xc0c0c0c0, 0x80808080};
-	unsigned int compvals[INTSIMDSIZE];
-	unsigned int selectedmask;
-	unsigned int y;
-
-	// Select the mask value based on how many positions we are required
-	// to shift. This is limited to the number of masks defined.
-	if ((param > 7) || (param < 0)) {
-		selectedmask = 0;
-	} else {
-		selectedmask = maskvals[param];
-	}
-	
-	// Initialise the mask values.
-	for (y = 0; y < INTSIMDSIZE; y++) {
-		compvals[y] = selectedmask;
-	}
-	vmaskslice = (v4si) __builtin_ia32_lddqu((char *) compvals);
-
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm_set1_epi8((char) rshift_byte(0xff, param));
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -185,22 +177,18 @@ void rshift_1_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v4si) __builtin_ia32_lddqu((char *) &data1[index]);
-
-		// Mask off the bits that would otherwise overflow into the adjacent byte.
-		datasliceleft = (v4si) __builtin_ia32_pand128( (v2di) datasliceleft,  (v2di) vmaskslice);
+		dataslice = _mm_loadu_si128((__m128i *) &data1[index]);
 
-		// The actual SIMD operation. This should always be the lshift or rshift
-		// operation for unsigned integer.
-		datasliceleft = __builtin_ia32_psrldi128(datasliceleft, (int) param);
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm_and_si128(_mm_srl_epi16(dataslice, vcountslice), vmaskslice);
 
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data1[index], (v16qi) datasliceleft);
+		_mm_storeu_si128((__m128i *) &data1[index], dataslice);
 	}
 
-	// Get the max value within the left over elements at the end of the array.
+	// Handle the left over elements at the end of the array.
 	for (index = alignedlength; index < arraylen; index++) {
-		data1[index] = data1[index] >> param;
+		data1[index] = rshift_byte(data1[index], param);
 	}
 
 }
@@ -215,32 +203,11 @@ void rshift_2_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
+	__m128i dataslice, vmaskslice, vcountslice;
 
-	// The mask and shift operations are done using a different data
-	// type than the parameters passed to the function. We always use
-	// the largest x86 shift operation available, which is unsigned int
-	v4si datasliceleft, vmaskslice;
-
-	// This mask gets rid of the bits which would otherwise get shifted
-	// into the adjoining vector element.
-	unsigned int maskvals[] = {0xffffffff, 0xfefefefe, 0xfcfcfcfc, 0xf8f8f8f8, 0xf0f0f0f0, 0xe0e0e0e0, 0xc0c0c0c0, 0x80808080};
-	unsigned int compvals[INTSIMDSIZE];
-	unsigned int selectedmask, y;
-
-	// Select the mask value based on how many positions we are required
-	// to shift. This is limited to the number of masks defined.
-	if ((param > 7) || (param < 0)) {
-		selectedmask = 0;
-	} else {
-		selectedmask = maskvals[param];
-	}
-	
-	// Initialise the mask values.
-	for (y = 0; y < INTSIMDSIZE; y++) {
-		compvals[y] = selectedmask;
-	}
-	vmaskslice = (v4si) __builtin_ia32_lddqu((char *) compvals);
-
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm_set1_epi8((char) rshift_byte(0xff, param));
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -249,22 +216,18 @@ void rshift_2_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
 		// Load the data into the vector register.
-		datasliceleft = (v4si) __builtin_ia32_lddqu((char *) &data1[index]);
-
-		// Mask off the bits that would otherwise overflow into the adjacent byte.
-		datasliceleft = (v4si) __builtin_ia32_pand128( (v2di) datasliceleft,  (v2di) vmaskslice);
+		dataslice = _mm_loadu_si128((__m128i *) &data1[index]);
 
-		// The actual SIMD operation. This should always be the lshift or rshift
-		// operation for unsigned integer.
-		datasliceleft = __builtin_ia32_psrldi128(datasliceleft, (int) param);
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm_and_si128(_mm_srl_epi16(dataslice, vcountslice), vmaskslice);
 
 		// Store the result.
-		__builtin_ia32_storedqu((char *) &data3[index], (v16qi) datasliceleft);
+		_mm_storeu_si128((__m128i *) &data3[index], dataslice);
 	}
 
-	// Get the max value within the left over elements at the end of the array.
+	// Handle the left over elements at the end of the array.
 	for (index = alignedlength; index < arraylen; index++) {
-		data3[index] = data1[index] >> param;
+		data3[index] = rshift_byte(data1[index], param);
 	}
 
 }
@@ -272,6 +235,41 @@ void rshift_2_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char
 
 
 
+/*--------------------------------------------------------------------------- */
+/* Shift each byte by the count in the corresponding byte of the second 
+   vector. Counts of 8 or more shift out every bit.
+   dataslice = The values to shift.
+   countslice = The shift counts.
+   Returns: The shifted values.
+*/
+#if defined(AF_HASSIMD_X86)
+static inline __m128i rshift_var_x86(__m128i dataslice, __m128i countslice) {
+
+	__m128i shiftslice, selectslice;
+
+	// Counts of 8 or more clear every bit.
+	selectslice = _mm_cmpeq_epi8(_mm_min_epu8(countslice, _mm_set1_epi8(7)), countslice);
+	dataslice = _mm_and_si128(dataslice, selectslice);
+
+	// Shift by 4 where bit 2 of the count is set.
+	selectslice = _mm_cmpeq_epi8(_mm_and_si128(countslice, _mm_set1_epi8(4)), _mm_set1_epi8(4));
+	shiftslice = _mm_and_si128(_mm_srli_epi16(dataslice, 4), _mm_set1_epi8((char) 0x0f));
+	dataslice = _mm_or_si128(_mm_and_si128(selectslice, shiftslice), _mm_andnot_si128(selectslice, dataslice));
+
+	// Shift by 2 where bit 1 of the count is set.
+	selectslice = _mm_cmpeq_epi8(_mm_and_si128(countslice, _mm_set1_epi8(2)), _mm_set1_epi8(2));
+	shiftslice = _mm_and_si128(_mm_srli_epi16(dataslice, 2), _mm_set1_epi8((char) 0x3f));
+	dataslice = _mm_or_si128(_mm_and_si128(selectslice, shiftslice), _mm_andnot_si128(selectslice, dataslice));
+
+	// Shift by 1 where bit 0 of the count is set.
+	selectslice = _mm_cmpeq_epi8(_mm_and_si128(countslice, _mm_set1_epi8(1)), _mm_set1_epi8(1));
+	shiftslice = _mm_and_si128(_mm_srli_epi16(dataslice, 1), _mm_set1_epi8((char) 0x7f));
+	dataslice = _mm_or_si128(_mm_and_si128(selectslice, shiftslice), _mm_andnot_si128(selectslice, dataslice));
+
+	return dataslice;
+}
+
+
 /*--------------------------------------------------------------------------- */
 /* The following series of functions reflect the different parameter options possible.
    arraylen = The length of the data arrays.
@@ -280,27 +278,51 @@ void rshift_2_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char
    data3 = The third data array.
    param = The parameter to be applied to each array element.
 */
-// param_arr_num_none
-#if defined(AF_HASSIMD_ARMv7_32BIT)
-void rshift_1_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+// param_num_arr_none
+void rshift_3_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
-	unsigned int y;
+	__m128i paramslice, countslice;
 
-	uint8x8_t datasliceleft;
-	int8x8_t datasliceright;
-	signed char compvals[CHARSIMDSIZE];
+	// Initialise the parameter values.
+	paramslice = _mm_set1_epi8((char) param);
 
-	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
-		compvals[y] = -(signed char)param;
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the shift counts into the vector register.
+		countslice = _mm_loadu_si128((__m128i *) &data2[index]);
+		// Shift and store the result.
+		_mm_storeu_si128((__m128i *) &data2[index], rshift_var_x86(paramslice, countslice));
 	}
-	datasliceright = vld1_s8(compvals);
 
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data2[index] = rshift_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_num_arr_arr
+void rshift_4_x86_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m128i paramslice, countslice;
+
+	// Initialise the parameter values.
+	paramslice = _mm_set1_epi8((char) param);
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -308,42 +330,60 @@ void rshift_1_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned cha
 
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		// Load the data into the vector register.
-		datasliceleft = vld1_u8(&data1[index]);
-		// The actual SIMD operation. 
-		datasliceleft = vshl_u8(datasliceleft, datasliceright);
-		// Store the result.
-		vst1_u8(&data1[index], datasliceleft);
+		// Load the shift counts into the vector register.
+		countslice = _mm_loadu_si128((__m128i *) &data2[index]);
+		// Shift and store the result.
+		_mm_storeu_si128((__m128i *) &data3[index], rshift_var_x86(paramslice, countslice));
 	}
 
-	// Get the max value within the left over elements at the end of the array.
+	// Handle the left over elements at the end of the array.
 	for (index = alignedlength; index < arraylen; index++) {
-		data1[index] = data1[index] >> param;
+		data3[index] = rshift_byte(param, data2[index]);
 	}
 
 }
 
 
-
-// param_arr_num_arr
-void rshift_2_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+// param_arr_arr_none
+void rshift_5_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
-	unsigned int y;
+	__m128i dataslice, countslice;
 
-	uint8x8_t datasliceleft;
-	int8x8_t datasliceright;
-	signed char compvals[CHARSIMDSIZE];
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
 
-	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
-		compvals[y] = -(signed char)param;
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm_loadu_si128((__m128i *) &data1[index]);
+		countslice = _mm_loadu_si128((__m128i *) &data2[index]);
+		// Shift and store the result.
+		_mm_storeu_si128((__m128i *) &data1[index], rshift_var_x86(dataslice, countslice));
 	}
-	datasliceright = vld1_s8(compvals);
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = rshift_byte(data1[index], data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_arr
+void rshift_6_x86_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m128i dataslice, countslice;
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
@@ -351,25 +391,26 @@ void rshift_2_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned cha
 
 	// Perform the main operation using SIMD instructions.
 	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
-		// Load the data into the vector register.
-		datasliceleft = vld1_u8(&data1[index]);
-		// The actual SIMD operation. 
-		datasliceleft = vshl_u8(datasliceleft, datasliceright);
-		// Store the result.
-		vst1_u8(&data3[index], datasliceleft);
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm_loadu_si128((__m128i *) &data1[index]);
+		countslice = _mm_loadu_si128((__m128i *) &data2[index]);
+		// Shift and store the result.
+		_mm_storeu_si128((__m128i *) &data3[index], rshift_var_x86(dataslice, countslice));
 	}
 
-	// Get the max value within the left over elements at the end of the array.
+	// Handle the left over elements at the end of the array.
 	for (index = alignedlength; index < arraylen; index++) {
-		data3[index] = data1[index] >> param;
+		data3[index] = rshift_byte(data1[index], data2[index]);
 	}
 
 }
 #endif
 
 
+
 /*--------------------------------------------------------------------------- */
-/* The following series of functions reflect the different parameter options possible.
+/* For x86 AVX2 SIMD.
+   The following series of functions reflect the different parameter options possible.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    data2 = The second data array.
@@ -377,44 +418,40 @@ void rshift_2_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned cha
    param = The parameter to be applied to each array element.
 */
 // param_arr_num_none
-#if defined(AF_HASSIMD_ARM_AARCH64)
-void rshift_1_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 void rshift_1_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
-	unsigned int y;
-
-	uint8x16_t datasliceleft;
-	int8x16_t datasliceright;
-	signed char compvals[CHARSIMDSIZE];
-
-	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
-		compvals[y] = -(signed char)param;
-	}
-	datasliceright = vld1q_s8(compvals);
+	__m256i dataslice, vmaskslice;
+	__m128i vcountslice;
 
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm256_set1_epi8((char) rshift_byte(0xff, param));
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
 		// Load the data into the vector register.
-		datasliceleft = vld1q_u8(&data1[index]);
-		// The actual SIMD operation. 
-		datasliceleft = vshlq_u8(datasliceleft, datasliceright);
+		dataslice = _mm256_loadu_si256((__m256i *) &data1[index]);
+
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm256_and_si256(_mm256_srl_epi16(dataslice, vcountslice), vmaskslice);
+
 		// Store the result.
-		vst1q_u8(&data1[index], datasliceleft);
+		_mm256_storeu_si256((__m256i *) &data1[index], dataslice);
 	}
 
-	// Get the max value within the left over elements at the end of the array.
+	// Handle the left over elements at the end of the array.
 	for (index = alignedlength; index < arraylen; index++) {
-		data1[index] = data1[index] >> param;
+		data1[index] = rshift_byte(data1[index], param);
 	}
 
 }
@@ -422,173 +459,1322 @@ void rshift_1_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned cha
 
 
 // param_arr_num_arr
-void rshift_2_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+AF_TARGET_AVX2 void rshift_2_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
 
 	// array index counter. 
 	Py_ssize_t index; 
 
 	// SIMD related variables.
 	Py_ssize_t alignedlength;
-	unsigned int y;
-
-	uint8x16_t datasliceleft;
-	int8x16_t datasliceright;
-	signed char compvals[CHARSIMDSIZE];
+	__m256i dataslice, vmaskslice;
+	__m128i vcountslice;
 
-	// Initialise the comparison values.
-	for (y = 0; y < CHARSIMDSIZE; y++) {
-		compvals[y] = -(signed char)param;
-	}
-	datasliceright = vld1q_s8(compvals);
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm256_set1_epi8((char) rshift_byte(0xff, param));
 
 	// Calculate array lengths for arrays whose lengths which are not even
 	// multipes of the SIMD slice length.
-	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
 	// Perform the main operation using SIMD instructions.
-	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
 		// Load the data into the vector register.
-		datasliceleft = vld1q_u8(&data1[index]);
-		// The actual SIMD operation. 
-		datasliceleft = vshlq_u8(datasliceleft, datasliceright);
+		dataslice = _mm256_loadu_si256((__m256i *) &data1[index]);
+
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm256_and_si256(_mm256_srl_epi16(dataslice, vcountslice), vmaskslice);
+
 		// Store the result.
-		vst1q_u8(&data3[index], datasliceleft);
+		_mm256_storeu_si256((__m256i *) &data3[index], dataslice);
 	}
 
-	// Get the max value within the left over elements at the end of the array.
+	// Handle the left over elements at the end of the array.
 	for (index = alignedlength; index < arraylen; index++) {
-		data3[index] = data1[index] >> param;
+		data3[index] = rshift_byte(data1[index], param);
 	}
 
 }
 #endif
 
 
+
 /*--------------------------------------------------------------------------- */
-/* This selects the correct function, whether the platform independent non-SIMD
-   version, or the architecture appropriate SIMD version.
+/* For x86 AVX2 SIMD.
+   Shift each byte by the count in the corresponding byte of the second 
+   vector. Counts of 8 or more shift out every bit.
+   dataslice = The values to shift.
+   countslice = The shift counts.
+   Returns: The shifted values.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+AF_TARGET_AVX2 static inline __m256i rshift_var_avx2(__m256i dataslice, __m256i countslice) {
+
+	__m256i shiftslice, selectslice;
+
+	// Counts of 8 or more clear every bit.
+	selectslice = _mm256_cmpeq_epi8(_mm256_min_epu8(countslice, _mm256_set1_epi8(7)), countslice);
+	dataslice = _mm256_and_si256(dataslice, selectslice);
+
+	// Blend selects using the top bit of each byte. Move bit 2 of each 
+	// count there and shift by 4 where it is set.
+	selectslice = _mm256_slli_epi16(countslice, 5);
+	shiftslice = _mm256_and_si256(_mm256_srli_epi16(dataslice, 4), _mm256_set1_epi8((char) 0x0f));
+	dataslice = _mm256_blendv_epi8(dataslice, shiftslice, selectslice);
+
+	// Shift by 2 where bit 1 of the count is set.
+	selectslice = _mm256_add_epi8(selectslice, selectslice);
+	shiftslice = _mm256_and_si256(_mm256_srli_epi16(dataslice, 2), _mm256_set1_epi8((char) 0x3f));
+	dataslice = _mm256_blendv_epi8(dataslice, shiftslice, selectslice);
+
+	// Shift by 1 where bit 0 of the count is set.
+	selectslice = _mm256_add_epi8(selectslice, selectslice);
+	shiftslice = _mm256_and_si256(_mm256_srli_epi16(dataslice, 1), _mm256_set1_epi8((char) 0x7f));
+	dataslice = _mm256_blendv_epi8(dataslice, shiftslice, selectslice);
+
+	return dataslice;
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX2 SIMD.
+   The following series of functions reflect the different parameter options possible.
    arraylen = The length of the data arrays.
    data1 = The first data array.
    data2 = The second data array.
    data3 = The third data array.
    param = The parameter to be applied to each array element.
-   nosimd = If true, disable SIMD acceleration.
 */
-// param_arr_num_none
-void rshift_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) {
+// param_num_arr_none
+AF_TARGET_AVX2 void rshift_3_avx2_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
 
-	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
-	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+	// array index counter. 
+	Py_ssize_t index; 
 
-		#if defined(AF_HASSIMD_X86)
-			rshift_1_x86_simd(arraylen, data1, param);
-		#endif
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+	__m256i tableslice, countslice, maxcountslice;
 
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			rshift_1_armv7_simd(arraylen, data1, param);
-		#endif
+	// The result for each shift count. The byte shuffle uses the lower 4
+	// bits of the count, and looks up each 128 bit half separately.
+	unsigned char shifttable[CHARSIMDSIZE_AVX2];
 
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			rshift_1_armv8_simd(arraylen, data1, param);
-		#endif
-		
-	} else {
-	#endif
-		rshift_1(arraylen, data1, param);
-	#if  defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	// Initialise the table.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		shifttable[y] = rshift_byte(param, y % 16);
 	}
-	#endif
+	tableslice = _mm256_loadu_si256((__m256i *) shifttable);
+	maxcountslice = _mm256_set1_epi8(15);
 
-}
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
-// param_arr_num_arr
-void rshift_2_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the shift counts. Counts above 15 use the last table entry.
+		countslice = _mm256_loadu_si256((__m256i *) &data2[index]);
+		countslice = _mm256_min_epu8(countslice, maxcountslice);
+		// Look up and store the result.
+		_mm256_storeu_si256((__m256i *) &data2[index], _mm256_shuffle_epi8(tableslice, countslice));
+	}
 
-	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
-	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data2[index] = rshift_byte(param, data2[index]);
+	}
 
-		#if defined(AF_HASSIMD_X86)
-			rshift_2_x86_simd(arraylen, data1, param, data3);
-		#endif
+}
 
-		#if defined(AF_HASSIMD_ARMv7_32BIT)
-			rshift_2_armv7_simd(arraylen, data1, param, data3);
-		#endif
 
-		#if defined(AF_HASSIMD_ARM_AARCH64)
-			rshift_2_armv8_simd(arraylen, data1, param, data3);
-		#endif
+// param_num_arr_arr
+AF_TARGET_AVX2 void rshift_4_avx2_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
 
-	} else {
-	#endif
-		rshift_2(arraylen, data1, param, data3);
-	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
-	}
-	#endif
+	// array index counter. 
+	Py_ssize_t index; 
 
-}
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+	__m256i tableslice, countslice, maxcountslice;
 
+	// The result for each shift count. The byte shuffle uses the lower 4
+	// bits of the count, and looks up each 128 bit half separately.
+	unsigned char shifttable[CHARSIMDSIZE_AVX2];
 
-/*--------------------------------------------------------------------------- */
+	// Initialise the table.
+	for (y = 0; y < CHARSIMDSIZE_AVX2; y++) {
+		shifttable[y] = rshift_byte(param, y % 16);
+	}
+	tableslice = _mm256_loadu_si256((__m256i *) shifttable);
+	maxcountslice = _mm256_set1_epi8(15);
 
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
-/*--------------------------------------------------------------------------- */
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the shift counts. Counts above 15 use the last table entry.
+		countslice = _mm256_loadu_si256((__m256i *) &data2[index]);
+		countslice = _mm256_min_epu8(countslice, maxcountslice);
+		// Look up and store the result.
+		_mm256_storeu_si256((__m256i *) &data3[index], _mm256_shuffle_epi8(tableslice, countslice));
+	}
 
-/* The wrapper to the underlying C function */
-static PyObject *py_rshift(PyObject *self, PyObject *args, PyObject *keywds) {
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = rshift_byte(param, data2[index]);
+	}
 
+}
 
-	// This is used to hold the parsed parameters.
-	struct args_params_2 bytesdata = ARGSINIT_TWO;
 
+// param_arr_arr_none
+AF_TARGET_AVX2 void rshift_5_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
 
-	// -----------------------------------------------------
+	// array index counter. 
+	Py_ssize_t index; 
 
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m256i dataslice, countslice;
 
-	// Get the parameters passed from Python. 
-	bytesdata = getparams_two(self, args, keywds, "rshift");
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
 
-	// If there was an error, we count on the parameter parsing function to 
-	// release the buffers if this was necessary.
-	if (bytesdata.errorcode) {
-		return NULL;
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm256_loadu_si256((__m256i *) &data1[index]);
+		countslice = _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Shift and store the result.
+		_mm256_storeu_si256((__m256i *) &data1[index], rshift_var_avx2(dataslice, countslice));
 	}
 
-	// Call the C function.
-	// Select the correct implementation.
-	switch (bytesdata.paramcat) {
-		case param_arr_num_none : {
-			rshift_1_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param);
-			break;
-		}
-		case param_arr_num_arr : {
-			rshift_2_select(bytesdata.arraylen, bytesdata.nosimd, bytesdata.bytes1.B, bytesdata.param, bytesdata.bytes3.B);
-			break;
-		}
-		case param_num_arr_none : {
-			rshift_3(bytesdata.arraylen, bytesdata.param, bytesdata.bytes2.B);
-			break;
-		}
-		case param_num_arr_arr : {
-			rshift_4(bytesdata.arraylen, bytesdata.param, bytesdata.bytes2.B, bytesdata.bytes3.B);
-			break;
-		}
-		case param_arr_arr_none : {
-			rshift_5(bytesdata.arraylen, bytesdata.bytes1.B, bytesdata.bytes2.B);
-			break;
-		}
-		case param_arr_arr_arr : {
-			rshift_6(bytesdata.arraylen, bytesdata.bytes1.B, bytesdata.bytes2.B, bytesdata.bytes3.B);
-			break;
-		}
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = rshift_byte(data1[index], data2[index]);
 	}
 
-	// Release the buffers. 
-	releasebuffers_two(bytesdata);
+}
 
 
-	// Everything was successful.
-	Py_RETURN_NONE;
+// param_arr_arr_arr
+AF_TARGET_AVX2 void rshift_6_avx2_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	__m256i dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm256_loadu_si256((__m256i *) &data1[index]);
+		countslice = _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Shift and store the result.
+		_mm256_storeu_si256((__m256i *) &data3[index], rshift_var_avx2(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = rshift_byte(data1[index], data2[index]);
+	}
+
+}
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX-512BW SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW void rshift_1_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	__m512i dataslice, vmaskslice;
+	__m128i vcountslice;
+
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm512_set1_epi8((char) rshift_byte(0xff, param));
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		dataslice = _mm512_loadu_si512(&data1[index]);
+
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm512_and_si512(_mm512_srl_epi16(dataslice, vcountslice), vmaskslice);
+
+		// Store the result.
+		_mm512_storeu_si512(&data1[index], dataslice);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		dataslice = _mm512_and_si512(_mm512_srl_epi16(dataslice, vcountslice), vmaskslice);
+		_mm512_mask_storeu_epi8(&data1[alignedlength], tailmask, dataslice);
+	}
+
+}
+
+
+
+// param_arr_num_arr
+AF_TARGET_AVX512BW void rshift_2_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	__m512i dataslice, vmaskslice;
+	__m128i vcountslice;
+
+	// Initialise the shift count and the byte mask.
+	vcountslice = _mm_cvtsi32_si128(param);
+	vmaskslice = _mm512_set1_epi8((char) rshift_byte(0xff, param));
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data into the vector register.
+		dataslice = _mm512_loadu_si512(&data1[index]);
+
+		// Shift in 16 bit lanes and mask off the bits from the adjacent byte.
+		dataslice = _mm512_and_si512(_mm512_srl_epi16(dataslice, vcountslice), vmaskslice);
+
+		// Store the result.
+		_mm512_storeu_si512(&data3[index], dataslice);
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		dataslice = _mm512_and_si512(_mm512_srl_epi16(dataslice, vcountslice), vmaskslice);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, dataslice);
+	}
+
+}
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX-512BW SIMD.
+   Shift each byte by the count in the corresponding byte of the second 
+   vector. Counts of 8 or more shift out every bit.
+   dataslice = The values to shift.
+   countslice = The shift counts.
+   Returns: The shifted values.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+AF_TARGET_AVX512BW static inline __m512i rshift_var_avx512(__m512i dataslice, __m512i countslice) {
+
+	__m512i shiftslice;
+
+	// Counts of 8 or more clear every bit.
+	dataslice = _mm512_maskz_mov_epi8(_mm512_cmple_epu8_mask(countslice, _mm512_set1_epi8(7)), dataslice);
+
+	// Shift by 4 where bit 2 of the count is set.
+	shiftslice = _mm512_and_si512(_mm512_srli_epi16(dataslice, 4), _mm512_set1_epi8((char) 0x0f));
+	dataslice = _mm512_mask_mov_epi8(dataslice, _mm512_test_epi8_mask(countslice, _mm512_set1_epi8(4)), shiftslice);
+
+	// Shift by 2 where bit 1 of the count is set.
+	shiftslice = _mm512_and_si512(_mm512_srli_epi16(dataslice, 2), _mm512_set1_epi8((char) 0x3f));
+	dataslice = _mm512_mask_mov_epi8(dataslice, _mm512_test_epi8_mask(countslice, _mm512_set1_epi8(2)), shiftslice);
+
+	// Shift by 1 where bit 0 of the count is set.
+	shiftslice = _mm512_and_si512(_mm512_srli_epi16(dataslice, 1), _mm512_set1_epi8((char) 0x7f));
+	dataslice = _mm512_mask_mov_epi8(dataslice, _mm512_test_epi8_mask(countslice, _mm512_set1_epi8(1)), shiftslice);
+
+	return dataslice;
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* For x86 AVX-512BW SIMD.
+   The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_num_arr_none
+AF_TARGET_AVX512BW void rshift_3_avx512_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	unsigned int y;
+	__m512i tableslice, countslice, maxcountslice;
+
+	// The result for each shift count. The byte shuffle uses the lower 4
+	// bits of the count, and looks up each 128 bit part separately.
+	unsigned char shifttable[CHARSIMDSIZE_AVX512];
+
+	// Initialise the table.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		shifttable[y] = rshift_byte(param, y % 16);
+	}
+	tableslice = _mm512_loadu_si512(shifttable);
+	maxcountslice = _mm512_set1_epi8(15);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the shift counts. Counts above 15 use the last table entry.
+		countslice = _mm512_min_epu8(_mm512_loadu_si512(&data2[index]), maxcountslice);
+		// Look up and store the result.
+		_mm512_storeu_si512(&data2[index], _mm512_shuffle_epi8(tableslice, countslice));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		countslice = _mm512_min_epu8(_mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]), maxcountslice);
+		_mm512_mask_storeu_epi8(&data2[alignedlength], tailmask, _mm512_shuffle_epi8(tableslice, countslice));
+	}
+
+}
+
+
+// param_num_arr_arr
+AF_TARGET_AVX512BW void rshift_4_avx512_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	unsigned int y;
+	__m512i tableslice, countslice, maxcountslice;
+
+	// The result for each shift count. The byte shuffle uses the lower 4
+	// bits of the count, and looks up each 128 bit part separately.
+	unsigned char shifttable[CHARSIMDSIZE_AVX512];
+
+	// Initialise the table.
+	for (y = 0; y < CHARSIMDSIZE_AVX512; y++) {
+		shifttable[y] = rshift_byte(param, y % 16);
+	}
+	tableslice = _mm512_loadu_si512(shifttable);
+	maxcountslice = _mm512_set1_epi8(15);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the shift counts. Counts above 15 use the last table entry.
+		countslice = _mm512_min_epu8(_mm512_loadu_si512(&data2[index]), maxcountslice);
+		// Look up and store the result.
+		_mm512_storeu_si512(&data3[index], _mm512_shuffle_epi8(tableslice, countslice));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		countslice = _mm512_min_epu8(_mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]), maxcountslice);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_shuffle_epi8(tableslice, countslice));
+	}
+
+}
+
+
+// param_arr_arr_none
+AF_TARGET_AVX512BW void rshift_5_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	__m512i dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm512_loadu_si512(&data1[index]);
+		countslice = _mm512_loadu_si512(&data2[index]);
+		// Shift and store the result.
+		_mm512_storeu_si512(&data1[index], rshift_var_avx512(dataslice, countslice));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		countslice = _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		_mm512_mask_storeu_epi8(&data1[alignedlength], tailmask, rshift_var_avx512(dataslice, countslice));
+	}
+
+}
+
+
+// param_arr_arr_arr
+AF_TARGET_AVX512BW void rshift_6_avx512_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask;
+	__m512i dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = _mm512_loadu_si512(&data1[index]);
+		countslice = _mm512_loadu_si512(&data2[index]);
+		// Shift and store the result.
+		_mm512_storeu_si512(&data3[index], rshift_var_avx512(dataslice, countslice));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		dataslice = _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		countslice = _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, rshift_var_avx512(dataslice, countslice));
+	}
+
+}
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+void rshift_1_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x8_t datasliceleft;
+	int8x8_t datasliceright;
+	signed char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = -(signed char)((param > 8) ? 8 : param);
+	}
+	datasliceright = vld1_s8(compvals);
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceleft = vld1_u8(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = vshl_u8(datasliceleft, datasliceright);
+		// Store the result.
+		vst1_u8(&data1[index], datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = rshift_byte(data1[index], param);
+	}
+
+}
+
+
+
+// param_arr_num_arr
+void rshift_2_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x8_t datasliceleft;
+	int8x8_t datasliceright;
+	signed char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = -(signed char)((param > 8) ? 8 : param);
+	}
+	datasliceright = vld1_s8(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceleft = vld1_u8(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = vshl_u8(datasliceleft, datasliceright);
+		// Store the result.
+		vst1_u8(&data3[index], datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = rshift_byte(data1[index], param);
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* Shift each byte by the count in the corresponding byte of the second 
+   vector. Counts of 8 or more shift out every bit. They are limited to 8, 
+   as counts of 128 or more would otherwise be taken as negative.
+   dataslice = The values to shift.
+   countslice = The shift counts.
+   Returns: The shifted values.
+*/
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+static inline uint8x8_t rshift_var_armv7(uint8x8_t dataslice, uint8x8_t countslice) {
+
+	int8x8_t shiftslice;
+
+	shiftslice = vneg_s8(vreinterpret_s8_u8(vmin_u8(countslice, vdup_n_u8(8))));
+
+	return vshl_u8(dataslice, shiftslice);
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_num_arr_none
+void rshift_3_armv7_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	uint8x8_t paramslice, countslice;
+
+	// Initialise the parameter values.
+	paramslice = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the shift counts into the vector register.
+		countslice = vld1_u8(&data2[index]);
+		// Shift and store the result.
+		vst1_u8(&data2[index], rshift_var_armv7(paramslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data2[index] = rshift_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_num_arr_arr
+void rshift_4_armv7_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	uint8x8_t paramslice, countslice;
+
+	// Initialise the parameter values.
+	paramslice = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the shift counts into the vector register.
+		countslice = vld1_u8(&data2[index]);
+		// Shift and store the result.
+		vst1_u8(&data3[index], rshift_var_armv7(paramslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = rshift_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_none
+void rshift_5_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	uint8x8_t dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = vld1_u8(&data1[index]);
+		countslice = vld1_u8(&data2[index]);
+		// Shift and store the result.
+		vst1_u8(&data1[index], rshift_var_armv7(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = rshift_byte(data1[index], data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_arr
+void rshift_6_armv7_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	uint8x8_t dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = vld1_u8(&data1[index]);
+		countslice = vld1_u8(&data2[index]);
+		// Shift and store the result.
+		vst1_u8(&data3[index], rshift_var_armv7(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = rshift_byte(data1[index], data2[index]);
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_arr_num_none
+#if defined(AF_HASSIMD_ARM_AARCH64)
+void rshift_1_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x16_t datasliceleft;
+	int8x16_t datasliceright;
+	signed char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = -(signed char)((param > 8) ? 8 : param);
+	}
+	datasliceright = vld1q_s8(compvals);
+
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceleft = vld1q_u8(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = vshlq_u8(datasliceleft, datasliceright);
+		// Store the result.
+		vst1q_u8(&data1[index], datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = rshift_byte(data1[index], param);
+	}
+
+}
+
+
+
+// param_arr_num_arr
+void rshift_2_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned int y;
+
+	uint8x16_t datasliceleft;
+	int8x16_t datasliceright;
+	signed char compvals[CHARSIMDSIZE];
+
+	// Initialise the comparison values.
+	for (y = 0; y < CHARSIMDSIZE; y++) {
+		compvals[y] = -(signed char)((param > 8) ? 8 : param);
+	}
+	datasliceright = vld1q_s8(compvals);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data into the vector register.
+		datasliceleft = vld1q_u8(&data1[index]);
+		// The actual SIMD operation. 
+		datasliceleft = vshlq_u8(datasliceleft, datasliceright);
+		// Store the result.
+		vst1q_u8(&data3[index], datasliceleft);
+	}
+
+	// Get the max value within the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = rshift_byte(data1[index], param);
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* Shift each byte by the count in the corresponding byte of the second 
+   vector. Counts of 8 or more shift out every bit. They are limited to 8, 
+   as counts of 128 or more would otherwise be taken as negative.
+   dataslice = The values to shift.
+   countslice = The shift counts.
+   Returns: The shifted values.
+*/
+#if defined(AF_HASSIMD_ARM_AARCH64)
+static inline uint8x16_t rshift_var_armv8(uint8x16_t dataslice, uint8x16_t countslice) {
+
+	int8x16_t shiftslice;
+
+	shiftslice = vnegq_s8(vreinterpretq_s8_u8(vminq_u8(countslice, vdupq_n_u8(8))));
+
+	return vshlq_u8(dataslice, shiftslice);
+}
+
+
+/*--------------------------------------------------------------------------- */
+/* The following series of functions reflect the different parameter options possible.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+*/
+// param_num_arr_none
+void rshift_3_armv8_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	uint8x16_t paramslice, countslice;
+
+	// Initialise the parameter values.
+	paramslice = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the shift counts into the vector register.
+		countslice = vld1q_u8(&data2[index]);
+		// Shift and store the result.
+		vst1q_u8(&data2[index], rshift_var_armv8(paramslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data2[index] = rshift_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_num_arr_arr
+void rshift_4_armv8_simd(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	uint8x16_t paramslice, countslice;
+
+	// Initialise the parameter values.
+	paramslice = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the shift counts into the vector register.
+		countslice = vld1q_u8(&data2[index]);
+		// Shift and store the result.
+		vst1q_u8(&data3[index], rshift_var_armv8(paramslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = rshift_byte(param, data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_none
+void rshift_5_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	uint8x16_t dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = vld1q_u8(&data1[index]);
+		countslice = vld1q_u8(&data2[index]);
+		// Shift and store the result.
+		vst1q_u8(&data1[index], rshift_var_armv8(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data1[index] = rshift_byte(data1[index], data2[index]);
+	}
+
+}
+
+
+// param_arr_arr_arr
+void rshift_6_armv8_simd(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	uint8x16_t dataslice, countslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for (index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		// Load the data and the shift counts into the vector registers.
+		dataslice = vld1q_u8(&data1[index]);
+		countslice = vld1q_u8(&data2[index]);
+		// Shift and store the result.
+		vst1q_u8(&data3[index], rshift_var_armv8(dataslice, countslice));
+	}
+
+	// Handle the left over elements at the end of the array.
+	for (index = alignedlength; index < arraylen; index++) {
+		data3[index] = rshift_byte(data1[index], data2[index]);
+	}
+
+}
+#endif
+
+
+/*--------------------------------------------------------------------------- */
+/* The SIMD functions to use. These are selected once when the module is 
+   initialised, according to the SIMD features supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	void (*param_arr_num_none)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param);
+	void (*param_arr_num_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*param_num_arr_none)(Py_ssize_t arraylen, unsigned char param, unsigned char *data2);
+	void (*param_num_arr_arr)(Py_ssize_t arraylen, unsigned char param, unsigned char *data2, unsigned char *data3);
+	void (*param_arr_arr_none)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2);
+	void (*param_arr_arr_arr)(Py_ssize_t arraylen, unsigned char *data1, unsigned char *data2, unsigned char *data3);
+} rshift_simdfuncs;
+
+
+/* Select the SIMD functions for this CPU.
+*/
+static void rshift_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		rshift_simdfuncs.param_arr_num_none = rshift_1_avx512_simd;
+		rshift_simdfuncs.param_arr_num_arr = rshift_2_avx512_simd;
+		rshift_simdfuncs.param_num_arr_none = rshift_3_avx512_simd;
+		rshift_simdfuncs.param_num_arr_arr = rshift_4_avx512_simd;
+		rshift_simdfuncs.param_arr_arr_none = rshift_5_avx512_simd;
+		rshift_simdfuncs.param_arr_arr_arr = rshift_6_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		rshift_simdfuncs.param_arr_num_none = rshift_1_avx2_simd;
+		rshift_simdfuncs.param_arr_num_arr = rshift_2_avx2_simd;
+		rshift_simdfuncs.param_num_arr_none = rshift_3_avx2_simd;
+		rshift_simdfuncs.param_num_arr_arr = rshift_4_avx2_simd;
+		rshift_simdfuncs.param_arr_arr_none = rshift_5_avx2_simd;
+		rshift_simdfuncs.param_arr_arr_arr = rshift_6_avx2_simd;
+	} else {
+		rshift_simdfuncs.param_arr_num_none = rshift_1_x86_simd;
+		rshift_simdfuncs.param_arr_num_arr = rshift_2_x86_simd;
+		rshift_simdfuncs.param_num_arr_none = rshift_3_x86_simd;
+		rshift_simdfuncs.param_num_arr_arr = rshift_4_x86_simd;
+		rshift_simdfuncs.param_arr_arr_none = rshift_5_x86_simd;
+		rshift_simdfuncs.param_arr_arr_arr = rshift_6_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	rshift_simdfuncs.param_arr_num_none = rshift_1_armv7_simd;
+	rshift_simdfuncs.param_arr_num_arr = rshift_2_armv7_simd;
+	rshift_simdfuncs.param_num_arr_none = rshift_3_armv7_simd;
+	rshift_simdfuncs.param_num_arr_arr = rshift_4_armv7_simd;
+	rshift_simdfuncs.param_arr_arr_none = rshift_5_armv7_simd;
+	rshift_simdfuncs.param_arr_arr_arr = rshift_6_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	rshift_simdfuncs.param_arr_num_none = rshift_1_armv8_simd;
+	rshift_simdfuncs.param_arr_num_arr = rshift_2_armv8_simd;
+	rshift_simdfuncs.param_num_arr_none = rshift_3_armv8_simd;
+	rshift_simdfuncs.param_num_arr_arr = rshift_4_armv8_simd;
+	rshift_simdfuncs.param_arr_arr_none = rshift_5_armv8_simd;
+	rshift_simdfuncs.param_arr_arr_arr = rshift_6_armv8_simd;
+	#endif
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   arraylen = The length of the data arrays.
+   data1 = The first data array.
+   data2 = The second data array.
+   data3 = The third data array.
+   param = The parameter to be applied to each array element.
+   nosimd = If true, disable SIMD acceleration.
+*/
+// param_arr_num_none
+void rshift_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		rshift_simdfuncs.param_arr_num_none(arraylen, data1, param);
+	} else {
+	#endif
+		rshift_1(arraylen, data1, param);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_num_arr
+void rshift_2_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		rshift_simdfuncs.param_arr_num_arr(arraylen, data1, param, data3);
+	} else {
+	#endif
+		rshift_2(arraylen, data1, param, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_num_arr_none
+void rshift_3_select(Py_ssize_t arraylen, int nosimd, unsigned char param, unsigned char *data2) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		rshift_simdfuncs.param_num_arr_none(arraylen, param, data2);
+	} else {
+	#endif
+		rshift_3(arraylen, param, data2);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_num_arr_arr
+void rshift_4_select(Py_ssize_t arraylen, int nosimd, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		rshift_simdfuncs.param_num_arr_arr(arraylen, param, data2, data3);
+	} else {
+	#endif
+		rshift_4(arraylen, param, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_arr_none
+void rshift_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		rshift_simdfuncs.param_arr_arr_none(arraylen, data1, data2);
+	} else {
+	#endif
+		rshift_5(arraylen, data1, data2);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_arr_arr
+void rshift_6_select(Py_ssize_t arraylen, int nosimd, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		rshift_simdfuncs.param_arr_arr_arr(arraylen, data1, data2, data3);
+	} else {
+	#endif
+		rshift_6(arraylen, data1, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/*--------------------------------------------------------------------------- */
+
+/* Calculate one part of the sequences. If the calculation is not divided
+	between threads, then there is just one part covering the whole sequence.
+	ctx = The parsed parameters (struct args_params_2).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void rshift_part(void *ctx, int part, int nparts) {
+
+	struct args_params_2 *bytesdata = (struct args_params_2 *) ctx;
+
+	// The range of this part of the sequences.
+	Py_ssize_t start, partlen;
+
+	partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
+
+	// Select the correct implementation.
+	switch (bytesdata->paramcat) {
+		case param_arr_num_none : {
+			rshift_1_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param);
+			break;
+		}
+		case param_arr_num_arr : {
+			rshift_2_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->param, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_num_arr_none : {
+			rshift_3_select(partlen, bytesdata->nosimd, bytesdata->param, bytesdata->bytes2.B + start);
+			break;
+		}
+		case param_num_arr_arr : {
+			rshift_4_select(partlen, bytesdata->nosimd, bytesdata->param, bytesdata->bytes2.B + start, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_arr_arr_none : {
+			rshift_5_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start);
+			break;
+		}
+		case param_arr_arr_arr : {
+			rshift_6_select(partlen, bytesdata->nosimd, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start, bytesdata->bytes3.B + start);
+			break;
+		}
+		// The other categories are only used by functions which take a mask.
+		default : {
+			break;
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_rshift(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_2 bytesdata = ARGSINIT_TWO;
+
+	// The number of parts to divide the calculation into.
+	int nparts;
+
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python. 
+	bytesdata = getparams_two(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+
+	// Call the C function.
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	runparallel(rshift_part, &bytesdata, nparts);
+	BF_END_ALLOW_THREADS
+
+	// Release the buffers. 
+	releasebuffers_two(bytesdata);
+
+
+	// Return the new output sequence if one was created.
+	if (bytesdata.outobj != NULL) {
+		return bytesdata.outobj;
+	}
+
+	// Everything was successful.
+	Py_RETURN_NONE;
 
 }
 
@@ -618,7 +1804,10 @@ Call formats: \n\
   rshift(sequence1, sequence2) \n\
   rshift(sequence1, sequence2, outpsequence) \n\
   rshift(sequence1, param, maxlen=y) \n\
+  rshift(sequence1, param, start=i, stop=j) \n\
   rshift(sequence1, param, nosimd=False) \n\
+  rshift(sequence1, param, threads=4) \n\
+  result = rshift(sequence1, param, outtype=bytes) \n\
 \n\
 * sequence1 - The first input data bytes or bytearray sequence to be \n\
   examined. If no output sequence is provided the results will overwrite \n\
@@ -631,8 +1820,122 @@ Call formats: \n\
   positive integer. If a zero or negative length, or a value which is \n\
   greater than the actual length of the sequence is specified, this \n\
   parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. The same part of every sequence is \n\
+  used. These are optional keyword parameters and are applied before \n\
+  maxlen. No data is copied. \n\
+* nosimd - If True, SIMD acceleration is disabled. This parameter is \n\
+  optional. The default is FALSE. \n\
+* threads - The number of threads to divide the calculation between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
+* outtype - If bytes or bytearray, a new sequence of that type is \n\
+  created, filled with the results, and returned. The input sequences \n\
+  are not changed and may be read only. The new sequence has the length \n\
+  of the part of the input which is used. This cannot be combined with \n\
+  outpsequence. This is an optional keyword parameter. \n\
+* result - The new sequence if outtype was given, otherwise None. \n\
+");
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function for a batch of sequences */
+static PyObject *py_rshift_many(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_many bytesdata = ARGSINIT_MANY;
+
+	// The parameters for each sequence in the batch.
+	struct args_params_2 seqdata = ARGSINIT_TWO;
+
+	Py_ssize_t x;
+
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python. 
+	bytesdata = getparams_many_two(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+	// The same parameter is used with every sequence.
+	seqdata.nosimd = bytesdata.nosimd;
+	seqdata.param = bytesdata.param;
+	if (bytesdata.hasparambuffer) {
+		seqdata.bytes2.buf = bytesdata.parambuffer.buf;
+		seqdata.paramcat = (bytesdata.outlist != NULL) ? param_arr_arr_arr : param_arr_arr_none;
+	} else {
+		seqdata.paramcat = (bytesdata.outlist != NULL) ? param_arr_num_arr : param_arr_num_none;
+	}
+
+	// Call the C function for each sequence.
+	// The GIL is released if the batch is large.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.totallen)
+	for (x = 0; x < bytesdata.nseqs; x++) {
+		seqdata.arraylen = bytesdata.pybuffers[x].len;
+		seqdata.bytes1.buf = bytesdata.pybuffers[x].buf;
+		if (bytesdata.outlist != NULL) {
+			seqdata.bytes3.B = bytesdata.outdata[x];
+		}
+		rshift_part(&seqdata, 0, 1);
+	}
+	BF_END_ALLOW_THREADS
+
+	// Release the buffers. 
+	releasebuffers_many(bytesdata);
+
+
+	// Return the new output sequences if they were created.
+	if (bytesdata.outlist != NULL) {
+		return bytesdata.outlist;
+	}
+
+	// Everything was successful.
+	Py_RETURN_NONE;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(rshift_many__doc__,
+"rshift_many \n\
+_____________________________ \n\
+\n\
+Calculate rshift over the values in each sequence in a batch. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          [rshift(x, param) for x in sequences] \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  rshift_many(sequences, param) \n\
+  rshift_many(sequences, paramsequence) \n\
+  rshift_many(sequences, param, nosimd=False) \n\
+  result = rshift_many(sequences, param, outtype=bytes) \n\
+\n\
+* sequences - A list or other iterable of bytes or bytearray sequences. \n\
+  If outtype is not given the results overwrite the input data, so each \n\
+  sequence must be writable. \n\
+* param - A non-sequence numeric parameter. \n\
+* paramsequence - A sequence which is applied to each sequence in the \n\
+  batch. It must be the same length as each of them. \n\
 * nosimd - If True, SIMD acceleration is disabled. This parameter is \n\
   optional. The default is FALSE. \n\
+* outtype - If bytes or bytearray, a new sequence of that type is \n\
+  created for each input sequence, filled with the results, and a list \n\
+  of them is returned. The input sequences are not changed and may be \n\
+  read only. This is an optional keyword parameter. \n\
+* result - A list of new sequences if outtype was given, otherwise None. \n\
 ");
 
 
@@ -641,14 +1944,32 @@ Call formats: \n\
 /* A list of all the methods defined by this module. 
  "rshift" is the name seen inside of Python. 
  "py_rshift" is the name of the C function handling the Python call. 
- "METH_VARGS" tells Python how to call the handler. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
  The {NULL, NULL} entry indicates the end of the method definitions. */
 static PyMethodDef rshift_methods[] = {
-	{"rshift",  (PyCFunction)py_rshift, METH_VARARGS | METH_KEYWORDS, rshift__doc__}, 
+	{"rshift",  (PyCFunction)py_rshift, BF_METHFLAGS, rshift__doc__}, 
+	{"rshift_many",  (PyCFunction)py_rshift_many, BF_METHFLAGS, rshift_many__doc__}, 
 	{NULL, NULL, 0, NULL}
 };
 
 
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int rshift_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	rshift_initsimd();
+	#endif
+
+	return PyModule_AddFunctions(module, rshift_methods);
+};
+
+#else
+
 static struct PyModuleDef rshiftmodule = {
     PyModuleDef_HEAD_INIT,
     "rshift",
@@ -659,8 +1980,14 @@ static struct PyModuleDef rshiftmodule = {
 
 PyMODINIT_FUNC PyInit_rshift(void)
 {
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	rshift_initsimd();
+	#endif
+
     return PyModule_Create(&rshiftmodule);
 };
 
+#endif
+
 /*--------------------------------------------------------------------------- */
 
@@ -28,19 +28,25 @@
 // This signals that SIMD is supported.
 
 
-// If this is not GCC, we don't use the SIMD features as they are not 
-// compatible with the GCC syntax. We have to check that it is not Clang,
-// as LLVM Clang will claim to be GCC.
-// LLVM Clang has limited SIMD support. For Windows, this library is normally
-// distributed as a precompiled binary and the very wide range of x86 versions
-// makes relying on SIMD problematic.
-#if defined(__GNUC__) && !defined(__clang__)
+// SIMD is used with GCC and LLVM Clang (which also defines __GNUC__). Both
+// accept the vector extensions, the target function attributes, and the
+// standard x86 and ARM intrinsics used here. Other compilers (e.g. MSVC) 
+// use only the non-SIMD versions.
+#if defined(__GNUC__)
 
 // If this is x86 but not 64 bit, we don't use SIMD features. 
 #if defined(__x86_64__)
 #define AF_HASSIMD_X86
 #endif
 
+// The 256 bit AVX2 and 512 bit AVX-512BW versions are compiled in as well 
+// as the 128 bit versions. Which one is used is decided at run time 
+// according to the CPU.
+#if defined(__x86_64__)
+#define AF_HASSIMD_X86_AVX2
+#define AF_HASSIMD_X86_AVX512
+#endif
+
 // For Rasberry Pi 3 and 32 bit OS.
 #if defined(__arm__) && defined(__ARM_ARCH_7A__)
 #define AF_HASSIMD_ARMv7_32BIT
@@ -58,6 +64,11 @@
 // This is for x86-64 only with 128 bit SIMD registers.
 #ifdef AF_HASSIMD_X86
 
+// The SSE2, AVX2, and AVX-512 intrinsics. With both GCC and Clang these 
+// may be used in functions with the matching target attribute without 
+// enabling the instruction set for the whole file.
+#include <immintrin.h>
+
 typedef char v16qi __attribute__ ((vector_size (16)));
 typedef short int v8hi __attribute__ ((vector_size (16)));
 typedef int v4si __attribute__ ((vector_size (16)));
@@ -76,6 +87,95 @@ typedef long long v2di __attribute__ ((vector_size (16)));
 
 /*--------------------------------------------------------------------------- */
 
+// This is for x86-64 with AVX2 and 256 bit SIMD registers.
+#ifdef AF_HASSIMD_X86_AVX2
+
+// The library is compiled for the basic x86-64 instruction set. Functions
+// which use AVX2 must be marked with this so the compiler will generate
+// AVX2 instructions for them. They must only be called if the CPU
+// supports AVX2.
+#define AF_TARGET_AVX2 __attribute__ ((target ("avx2")))
+
+typedef char v32qi __attribute__ ((vector_size (32)));
+typedef short int v16hi __attribute__ ((vector_size (32)));
+typedef int v8si __attribute__ ((vector_size (32)));
+typedef long long v4di __attribute__ ((vector_size (32)));
+
+
+#define CHARSIMDSIZE_AVX2 32
+#define INTSIMDSIZE_AVX2 8
+
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+// This is for x86-64 with AVX-512BW and 512 bit SIMD registers.
+#ifdef AF_HASSIMD_X86_AVX512
+
+// See the notes for AF_TARGET_AVX2. AVX-512BW requires AVX-512F as well.
+#define AF_TARGET_AVX512BW __attribute__ ((target ("avx512f,avx512bw")))
+
+typedef char v64qi __attribute__ ((vector_size (64)));
+typedef int v16si __attribute__ ((vector_size (64)));
+typedef long long v8di __attribute__ ((vector_size (64)));
+
+
+#define CHARSIMDSIZE_AVX512 64
+#define INTSIMDSIZE_AVX512 16
+
+// A mask register value which selects all bytes in a vector.
+#define AVX512_ALLMASK 0xffffffffffffffffULL
+
+
+/*   avx512tailmask
+   Calculate the mask register value which selects the left over elements
+   at the end of an array which are not a multiple of the SIMD width. Masked
+   loads and stores are then used instead of a non-SIMD clean-up loop.
+   Masked loads do not fault on the bytes which are masked off.
+   taillen = The number of left over elements. This must be 1 to 63.
+*/
+
+#define avx512tailmask(taillen) ((1ULL << (taillen)) - 1ULL)
+
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+// The x86 SIMD levels which may be selected at run time. The 128 bit
+// SSE2 versions are always available on x86-64.
+#ifdef AF_HASSIMD_X86
+
+#define AF_SIMDLEVEL_SSE2 1
+#define AF_SIMDLEVEL_AVX2 2
+#define AF_SIMDLEVEL_AVX512BW 3
+
+
+/*   af_x86simdlevel
+   Find the best SIMD level supported by the CPU this is running on. This
+   also checks that the operating system supports the wider registers.
+   This should be called once when a module is initialised and the result
+   used to select the SIMD functions.
+   Returns the SIMD level.
+*/
+static inline int af_x86simdlevel(void) {
+
+	__builtin_cpu_init();
+
+	if (__builtin_cpu_supports("avx512bw")) {
+		return AF_SIMDLEVEL_AVX512BW;
+	}
+
+	if (__builtin_cpu_supports("avx2")) {
+		return AF_SIMDLEVEL_AVX2;
+	}
+
+	return AF_SIMDLEVEL_SSE2;
+}
+
+#endif
+
+/*--------------------------------------------------------------------------- */
+
 // This is for ARM NEON 32 bit only, with 64 bit SIMD registers.
 #ifdef AF_HASSIMD_ARMv7_32BIT
 
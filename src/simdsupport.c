@@ -31,7 +31,8 @@
 #include "simddefs.h"
 
 
-#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+// Only ARMv7 needs to check for NEON at run time.
+#if defined(AF_HASSIMD_ARMv7_32BIT)
 #include <sys/auxv.h>
 #include <asm/hwcap.h>
 #endif
@@ -45,10 +46,14 @@ static PyMethodDef simdsupport_methods[] = {
 
 PyDoc_STRVAR(module_doc,
 "This provides information on the SIMD level compiled into this version \n\
-of the library. There are two attributes, 'hassimd' and 'simdarch'.\n\
+of the library. There are three attributes, 'hassimd', 'simdarch', and\n\
+'simdlevel'.\n\
 * 'hassimd' is TRUE if the CPU supports the required SIMD features.\n\
 * 'simdarch' contains a string indicating the CPU architecture the library\n\
    was compiled for.\n\
+* 'simdlevel' contains a string indicating the SIMD instruction set selected\n\
+   at run time for this CPU. On x86-64 this is 'sse2', 'avx2', or \n\
+   'avx512bw'.\n\
 Examples:\n\
 >>> arrayfunc.simdsupport.hassimd\n\
 True\n\
@@ -78,17 +83,9 @@ static struct PyModuleDef simdsupportmodule = {
 // For x86-64.
 #ifdef AF_HASSIMD_X86
 
+// SSE2 is part of the basic x86-64 instruction set, so it is always present.
 signed int hassimdlevel(void) {
-
-	// Initialise the CPU test.
-	__builtin_cpu_init();
-
-	// Now check to see if SSE 4.1 is supported. 
-	if (__builtin_cpu_supports("sse4.1")) {
-		return 1;
-	} else {
-		return 0;
-	}
+	return 1;
 }
 
 #elif defined(AF_HASSIMD_ARMv7_32BIT)
@@ -120,6 +117,36 @@ signed int hassimdlevel(void) {
 
 
 
+/*--------------------------------------------------------------------------- */
+
+// The name of the SIMD level selected at run time for the CPU this is 
+// running on. 
+const char *simdlevelname(void) {
+
+#if defined(AF_HASSIMD_X86)
+	switch (af_x86simdlevel()) {
+		case AF_SIMDLEVEL_AVX512BW : {
+			return "avx512bw";
+		}
+		case AF_SIMDLEVEL_AVX2 : {
+			return "avx2";
+		}
+		default: {
+			return "sse2";
+		}
+	}
+#elif defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (hassimdlevel() != 0) {
+		return "neon";
+	} else {
+		return "none";
+	}
+#else
+	return "none";
+#endif
+
+}
+
 /*--------------------------------------------------------------------------- */
 
 
@@ -169,6 +196,10 @@ PyMODINIT_FUNC PyInit_simdsupport(void) {
 	}
 
 
+	// The SIMD level selected for this CPU.
+	if (PyModule_AddObject(m, "simdlevel", PyUnicode_FromString(simdlevelname())) < 0) { goto iserror; }
+
+
 	// This is the normal exit point.
 	return m;
 
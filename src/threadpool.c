@@ -0,0 +1,424 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   threadpool.c
+// Purpose:  Worker thread pool shared by all multi-threaded functions.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+/* The worker threads are started the first time they are needed and then
+	wait for further work. The Python portable thread functions are used so
+	that this works on all platforms which Python supports. The worker
+	threads never access Python objects and so never need the GIL.
+	Only one calculation may use the pool at a time. Other threads which
+	attempt to use it at the same time wait until it is free.
+
+	A child process created with fork has none of the worker threads, and
+	the locks may be in any state. The pool is reset in the child so that
+	new workers are started the next time they are needed. The old locks 
+	are abandoned rather than freed, as their state is unknown.
+*/
+
+/*--------------------------------------------------------------------------- */
+
+#define PY_SSIZE_T_CLEAN
+#include "Python.h"
+#include "pythread.h"
+
+#if defined(HAVE_FORK) && defined(HAVE_PTHREAD_H)
+#include <pthread.h>
+#define BF_RESETAFTERFORK
+#endif
+
+#include "byteserrs.h"
+#include "bytesthreads.h"
+
+/*--------------------------------------------------------------------------- */
+
+// The data for each worker thread.
+struct poolworker {
+	// This is released to tell the worker to start.
+	PyThread_type_lock startlock;
+	// The part of the calculation this worker is to run.
+	int part;
+};
+
+
+// The thread pool.
+static struct {
+	// This is held while a calculation is using the pool.
+	PyThread_type_lock joblock;
+	// This protects "remaining".
+	PyThread_type_lock countlock;
+	// This is released by the last worker to finish.
+	PyThread_type_lock donelock;
+	// The number of worker threads which have been started.
+	int workercount;
+	struct poolworker workers[BF_MAXTHREADS];
+	// The current calculation.
+	threadpartfunc partfunc;
+	void *ctx;
+	int nparts;
+	// The number of workers which have not finished yet.
+	int remaining;
+} pool;
+
+
+// The default number of threads for functions which support threads.
+static int defaultthreads = 1;
+
+/*--------------------------------------------------------------------------- */
+
+/* The worker thread. This runs forever, waiting for work.
+	arg = A pointer to the struct poolworker for this thread.
+*/
+static void workerthread(void *arg) {
+
+	struct poolworker *worker = (struct poolworker *) arg;
+	int lastworker;
+
+	while (1) {
+		// Wait for work.
+		PyThread_acquire_lock(worker->startlock, WAIT_LOCK);
+
+		pool.partfunc(pool.ctx, worker->part, pool.nparts);
+
+		// Signal completion if this was the last one.
+		PyThread_acquire_lock(pool.countlock, WAIT_LOCK);
+		pool.remaining--;
+		lastworker = (pool.remaining == 0);
+		PyThread_release_lock(pool.countlock);
+
+		if (lastworker) {
+			PyThread_release_lock(pool.donelock);
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Make sure the required number of worker threads are running. This must
+	be called while holding the job lock.
+	count = The number of worker threads required.
+	Returns: The number of worker threads actually available. This may be
+		less than requested if a thread could not be started.
+*/
+static int startworkers(int count) {
+
+	struct poolworker *worker;
+
+	while (pool.workercount < count) {
+		worker = &pool.workers[pool.workercount];
+
+		// The start lock is created already acquired, so the worker
+		// will wait on it.
+		if (worker->startlock == NULL) {
+			worker->startlock = PyThread_allocate_lock();
+			if (worker->startlock == NULL) {
+				break;
+			}
+			PyThread_acquire_lock(worker->startlock, WAIT_LOCK);
+		}
+
+		if (PyThread_start_new_thread(workerthread, worker) == PYTHREAD_INVALID_THREAD_ID) {
+			break;
+		}
+
+		pool.workercount++;
+	}
+
+	return pool.workercount;
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Allocate the locks used to control the pool.
+	Returns: 0 if OK, or -1 if a lock could not be allocated.
+*/
+static int allocatepoollocks(void) {
+
+	pool.joblock = PyThread_allocate_lock();
+	pool.countlock = PyThread_allocate_lock();
+	pool.donelock = PyThread_allocate_lock();
+	if ((pool.joblock == NULL) || (pool.countlock == NULL) || (pool.donelock == NULL)) {
+		pool.joblock = NULL;
+		return -1;
+	}
+
+	// This is held until the workers have finished.
+	PyThread_acquire_lock(pool.donelock, WAIT_LOCK);
+
+	return 0;
+}
+
+/*--------------------------------------------------------------------------- */
+
+#if defined(BF_RESETAFTERFORK)
+/* Reset the pool in the child process after a fork. Only the thread which
+	called fork exists in the child, so there are no workers. 
+*/
+static void resetpoolafterfork(void) {
+
+	int i;
+
+	pool.workercount = 0;
+	for (i = 0; i < BF_MAXTHREADS; i++) {
+		pool.workers[i].startlock = NULL;
+	}
+
+	// If this fails, calculations are not divided between threads.
+	allocatepoollocks();
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* Run all the parts of a calculation and wait for them to complete. Part
+	zero is run in the calling thread. This may be called without holding
+	the GIL.
+	partfunc = The function which performs one part of the calculation.
+	ctx = The data for the calculation. This is passed to partfunc.
+	nparts = The number of parts.
+	Returns: The number of parts actually used. This may be less than
+		requested if the worker threads could not be started.
+*/
+static int runparts(threadpartfunc partfunc, void *ctx, int nparts) {
+
+	int i, workersavail;
+
+	if (nparts > BF_MAXTHREADS) {
+		nparts = BF_MAXTHREADS;
+	}
+
+	// The locks could not be allocated after a fork.
+	if (pool.joblock == NULL) {
+		partfunc(ctx, 0, 1);
+		return 1;
+	}
+
+	PyThread_acquire_lock(pool.joblock, WAIT_LOCK);
+
+	// If the workers could not be started, use as many as we have.
+	workersavail = startworkers(nparts - 1);
+	if (workersavail < (nparts - 1)) {
+		nparts = workersavail + 1;
+	}
+
+	if (nparts <= 1) {
+		PyThread_release_lock(pool.joblock);
+		partfunc(ctx, 0, 1);
+		return 1;
+	}
+
+	pool.partfunc = partfunc;
+	pool.ctx = ctx;
+	pool.nparts = nparts;
+	pool.remaining = nparts - 1;
+
+	// Start the workers.
+	for (i = 0; i < (nparts - 1); i++) {
+		pool.workers[i].part = i + 1;
+		PyThread_release_lock(pool.workers[i].startlock);
+	}
+
+	// The calling thread does the first part.
+	partfunc(ctx, 0, nparts);
+
+	// Wait for the workers to finish.
+	PyThread_acquire_lock(pool.donelock, WAIT_LOCK);
+
+	PyThread_release_lock(pool.joblock);
+
+	return nparts;
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Return the default number of threads.
+*/
+static int getthreads(void) {
+	return defaultthreads;
+}
+
+/*--------------------------------------------------------------------------- */
+
+// The functions exported via the capsule.
+static struct bfthreads_api threadsapi = {getthreads, runparts};
+
+/*--------------------------------------------------------------------------- */
+
+/* Set the default number of threads. */
+static PyObject *py_setthreads(PyObject *self, PyObject *args) {
+
+	int threads;
+
+	if (!PyArg_ParseTuple(args, "i:setthreads", &threads)) {
+		return NULL;
+	}
+
+	if ((threads < 1) || (threads > BF_MAXTHREADS)) {
+		ErrMsgThreadsValue();
+		return NULL;
+	}
+
+	defaultthreads = threads;
+
+	Py_RETURN_NONE;
+}
+
+
+/* Get the default number of threads. */
+static PyObject *py_getthreads(PyObject *self, PyObject *args) {
+	return PyLong_FromLong((long) defaultthreads);
+}
+
+/*--------------------------------------------------------------------------- */
+
+PyDoc_STRVAR(setthreads__doc__,
+"setthreads \n\
+_____________________________ \n\
+\n\
+Set the default number of threads used by functions which accept the \n\
+'threads' parameter. The initial default is 1 (no multi-threading). \n\
+\n\
+Call formats: \n\
+\n\
+  setthreads(threads) \n\
+\n\
+* threads - The number of threads. This must be in the range 1 to 64. \n\
+");
+
+
+PyDoc_STRVAR(getthreads__doc__,
+"getthreads \n\
+_____________________________ \n\
+\n\
+Return the default number of threads used by functions which accept the \n\
+'threads' parameter. \n\
+\n\
+Call formats: \n\
+\n\
+  getthreads() \n\
+");
+
+
+static PyMethodDef threadpool_methods[] = {
+	{"setthreads", (PyCFunction)py_setthreads, METH_VARARGS, setthreads__doc__},
+	{"getthreads", (PyCFunction)py_getthreads, METH_NOARGS, getthreads__doc__},
+	{NULL, NULL, 0, NULL}
+};
+
+
+/* Initialise the thread pool and export the API for use by the other
+	modules.
+	m = The module which the API is added to.
+	Returns: 0 if OK, or -1 if an error occurred.
+*/
+static int initpool(PyObject *m) {
+	PyObject *capsule;
+
+	// The locks used to control the pool.
+	if (pool.joblock == NULL) {
+		if (allocatepoollocks() < 0) {
+			PyErr_NoMemory();
+			return -1;
+		}
+
+		#if defined(BF_RESETAFTERFORK)
+		if (pthread_atfork(NULL, NULL, resetpoolafterfork) != 0) {
+			PyErr_NoMemory();
+			return -1;
+		}
+		#endif
+	}
+
+	// Export the API for use by the other modules.
+	capsule = PyCapsule_New((void *) &threadsapi, BFTHREADS_CAPSULE, NULL);
+	if (PyModule_AddObject(m, "_C_API", capsule) < 0) {
+		Py_XDECREF(capsule);
+		return -1;
+	}
+
+	return 0;
+}
+
+/*--------------------------------------------------------------------------- */
+
+#if defined(BF_SINGLEMODULE)
+
+/* Add the functions to the combined extension module. This is used in place
+	of the module initialisation when all the functions are built as a 
+	single extension module.
+*/
+int threadpool_addfunc(PyObject *module) {
+
+	if (PyModule_AddFunctions(module, threadpool_methods) < 0) {
+		return -1;
+	}
+
+	return initpool(module);
+}
+
+#else
+
+PyDoc_STRVAR(module_doc,
+"This provides the worker threads used by functions which accept the \n\
+'threads' parameter, and the default number of threads they use.\n\
+");
+
+
+static struct PyModuleDef threadpoolmodule = {
+	PyModuleDef_HEAD_INIT,
+	"threadpool",
+	module_doc,
+	-1,
+	threadpool_methods,
+	NULL,
+	NULL,
+	NULL,
+	NULL
+};
+
+/*--------------------------------------------------------------------------- */
+
+
+PyMODINIT_FUNC PyInit_threadpool(void) {
+	PyObject *m;
+
+	m = PyModule_Create(&threadpoolmodule);
+	if (m == NULL) { goto iserror; }
+
+	if (initpool(m)) { goto iserror; }
+
+	// This is the normal exit point.
+	return m;
+
+	// An error occurred.
+	iserror:
+	Py_XDECREF(m);
+	return NULL;
+
+}
+
+#endif
+
+/*--------------------------------------------------------------------------- */
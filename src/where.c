@@ -0,0 +1,1243 @@
+//------------------------------------------------------------------------------
+// Project:  bytesfunc
+// Module:   where.c
+// Purpose:  Select values from two sources according to a mask.
+// Language: C
+// Date:     18-Oct-2026
+//
+//------------------------------------------------------------------------------
+//
+//   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+//
+//------------------------------------------------------------------------------
+
+/* Each output element is taken from the first source where the mask is 
+	not zero, and from the second source where it is zero. Either source
+	may be a single value instead of a sequence. Any non-zero mask value
+	selects the first source, so the mask does not need to be all 0 or 
+	255 as produced by cmpmask.
+
+	The SIMD versions compare the mask to zero to produce a full width 
+	selection mask, and then select between the sources using a blend 
+	(AVX2), a mask register (AVX-512), or a bitwise select (ARM). SSE2 
+	does not have a blend instruction, so it combines the sources with
+	bitwise AND and OR operations instead.
+*/
+
+/*--------------------------------------------------------------------------- */
+// This must be defined before "Python.h" in order for the pointers in the
+// argument parsing functions to work properly. 
+#define PY_SSIZE_T_CLEAN
+
+#include "Python.h"
+
+#include <stdbool.h>
+
+#include "byteserrs.h"
+
+#include "bytesparams_base.h"
+#include "bytesparams_two.h"
+#include "bytesthreads.h"
+
+/*--------------------------------------------------------------------------- */
+
+#include "simddefs.h"
+
+#if defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+#include "arm_neon.h"
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* The SIMD functions to use for each parameter form. These are selected
+   once when the module is initialised, according to the SIMD features
+   supported by the CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static struct {
+	void (*arr_num)(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char param, unsigned char *data3);
+	void (*num_arr)(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char *data2, unsigned char *data3);
+	void (*arr_arr)(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char *data2, unsigned char *data3);
+	void (*num_num)(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char param2, unsigned char *data3);
+} where_simdfuncs;
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* The following series of functions reflect the different parameter options possible.
+   The output may be the same sequence as any of the inputs.
+   arraylen = The length of the data arrays.
+   mask = The mask array. Where this is not zero the first source is used.
+   data1 = The first source data array.
+   data2 = The second source data array.
+   data3 = The output array.
+   param = A single value used in place of one of the source arrays.
+   param2 = A single value used in place of the second source array, when
+   	both sources are single values.
+*/
+// param_arr_num
+static void where_1(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = mask[x] ? data1[x] : param;
+	}
+
+}
+
+
+// param_num_arr
+static void where_3(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = mask[x] ? param : data2[x];
+	}
+
+}
+
+
+// param_arr_arr
+static void where_5(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = mask[x] ? data1[x] : data2[x];
+	}
+
+}
+
+
+// param_num_num
+static void where_7(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char param2, unsigned char *data3) {
+
+	// array index counter.
+	Py_ssize_t x;
+
+	for(x = 0; x < arraylen; x++) {
+		data3[x] = mask[x] ? param : param2;
+	}
+
+}
+
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 SSE2 version. See the non-SIMD version for the parameters.
+*/
+#if defined(AF_HASSIMD_X86)
+// param_arr_num
+static void where_1_x86_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi maskslice, datasliceleft, datasliceright, resultslice;
+	v16qi zeroslice = (v16qi) _mm_setzero_si128();
+
+	// Initialise the single value.
+	datasliceright = (v16qi) _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = (v16qi) _mm_loadu_si128((__m128i *) &mask[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		// Find where the mask is zero, and select from the sources using it.
+		maskslice = (v16qi) _mm_cmpeq_epi8((__m128i) maskslice, (__m128i) zeroslice);
+		resultslice = (v16qi) _mm_or_si128(_mm_andnot_si128((__m128i) maskslice, (__m128i) datasliceleft), 
+						_mm_and_si128((__m128i) maskslice, (__m128i) datasliceright));
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? data1[index] : param;
+	}
+
+}
+
+// param_num_arr
+static void where_3_x86_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi maskslice, datasliceleft, datasliceright, resultslice;
+	v16qi zeroslice = (v16qi) _mm_setzero_si128();
+
+	// Initialise the single value.
+	datasliceleft = (v16qi) _mm_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = (v16qi) _mm_loadu_si128((__m128i *) &mask[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
+		// Find where the mask is zero, and select from the sources using it.
+		maskslice = (v16qi) _mm_cmpeq_epi8((__m128i) maskslice, (__m128i) zeroslice);
+		resultslice = (v16qi) _mm_or_si128(_mm_andnot_si128((__m128i) maskslice, (__m128i) datasliceleft), 
+						_mm_and_si128((__m128i) maskslice, (__m128i) datasliceright));
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? param : data2[index];
+	}
+
+}
+
+// param_arr_arr
+static void where_5_x86_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi maskslice, datasliceleft, datasliceright, resultslice;
+	v16qi zeroslice = (v16qi) _mm_setzero_si128();
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = (v16qi) _mm_loadu_si128((__m128i *) &mask[index]);
+		datasliceleft = (v16qi) _mm_loadu_si128((__m128i *) &data1[index]);
+		datasliceright = (v16qi) _mm_loadu_si128((__m128i *) &data2[index]);
+		// Find where the mask is zero, and select from the sources using it.
+		maskslice = (v16qi) _mm_cmpeq_epi8((__m128i) maskslice, (__m128i) zeroslice);
+		resultslice = (v16qi) _mm_or_si128(_mm_andnot_si128((__m128i) maskslice, (__m128i) datasliceleft), 
+						_mm_and_si128((__m128i) maskslice, (__m128i) datasliceright));
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? data1[index] : data2[index];
+	}
+
+}
+
+// param_num_num
+static void where_7_x86_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char param2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v16qi maskslice, datasliceleft, datasliceright, resultslice;
+	v16qi zeroslice = (v16qi) _mm_setzero_si128();
+
+	// Initialise the single values.
+	datasliceleft = (v16qi) _mm_set1_epi8((char) param);
+	datasliceright = (v16qi) _mm_set1_epi8((char) param2);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = (v16qi) _mm_loadu_si128((__m128i *) &mask[index]);
+		// Find where the mask is zero, and select from the sources using it.
+		maskslice = (v16qi) _mm_cmpeq_epi8((__m128i) maskslice, (__m128i) zeroslice);
+		resultslice = (v16qi) _mm_or_si128(_mm_andnot_si128((__m128i) maskslice, (__m128i) datasliceleft), 
+						_mm_and_si128((__m128i) maskslice, (__m128i) datasliceright));
+		_mm_storeu_si128((__m128i *) &data3[index], (__m128i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? param : param2;
+	}
+
+}
+
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX2 version. See the non-SIMD version for the parameters.
+*/
+#if defined(AF_HASSIMD_X86_AVX2)
+// param_arr_num
+static AF_TARGET_AVX2 void where_1_avx2_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi maskslice, datasliceleft, datasliceright, resultslice;
+	v32qi zeroslice = (v32qi) _mm256_setzero_si256();
+
+	// Initialise the single value.
+	datasliceright = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		maskslice = (v32qi) _mm256_loadu_si256((__m256i *) &mask[index]);
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		// Find where the mask is zero, and select the second source there.
+		maskslice = (v32qi) _mm256_cmpeq_epi8((__m256i) maskslice, (__m256i) zeroslice);
+		resultslice = (v32qi) _mm256_blendv_epi8((__m256i) datasliceleft, (__m256i) datasliceright, (__m256i) maskslice);
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? data1[index] : param;
+	}
+
+}
+
+// param_num_arr
+static AF_TARGET_AVX2 void where_3_avx2_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi maskslice, datasliceleft, datasliceright, resultslice;
+	v32qi zeroslice = (v32qi) _mm256_setzero_si256();
+
+	// Initialise the single value.
+	datasliceleft = (v32qi) _mm256_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		maskslice = (v32qi) _mm256_loadu_si256((__m256i *) &mask[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Find where the mask is zero, and select the second source there.
+		maskslice = (v32qi) _mm256_cmpeq_epi8((__m256i) maskslice, (__m256i) zeroslice);
+		resultslice = (v32qi) _mm256_blendv_epi8((__m256i) datasliceleft, (__m256i) datasliceright, (__m256i) maskslice);
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? param : data2[index];
+	}
+
+}
+
+// param_arr_arr
+static AF_TARGET_AVX2 void where_5_avx2_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi maskslice, datasliceleft, datasliceright, resultslice;
+	v32qi zeroslice = (v32qi) _mm256_setzero_si256();
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		maskslice = (v32qi) _mm256_loadu_si256((__m256i *) &mask[index]);
+		datasliceleft = (v32qi) _mm256_loadu_si256((__m256i *) &data1[index]);
+		datasliceright = (v32qi) _mm256_loadu_si256((__m256i *) &data2[index]);
+		// Find where the mask is zero, and select the second source there.
+		maskslice = (v32qi) _mm256_cmpeq_epi8((__m256i) maskslice, (__m256i) zeroslice);
+		resultslice = (v32qi) _mm256_blendv_epi8((__m256i) datasliceleft, (__m256i) datasliceright, (__m256i) maskslice);
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? data1[index] : data2[index];
+	}
+
+}
+
+// param_num_num
+static AF_TARGET_AVX2 void where_7_avx2_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char param2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	v32qi maskslice, datasliceleft, datasliceright, resultslice;
+	v32qi zeroslice = (v32qi) _mm256_setzero_si256();
+
+	// Initialise the single values.
+	datasliceleft = (v32qi) _mm256_set1_epi8((char) param);
+	datasliceright = (v32qi) _mm256_set1_epi8((char) param2);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX2);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX2) {
+		maskslice = (v32qi) _mm256_loadu_si256((__m256i *) &mask[index]);
+		// Find where the mask is zero, and select the second source there.
+		maskslice = (v32qi) _mm256_cmpeq_epi8((__m256i) maskslice, (__m256i) zeroslice);
+		resultslice = (v32qi) _mm256_blendv_epi8((__m256i) datasliceleft, (__m256i) datasliceright, (__m256i) maskslice);
+		_mm256_storeu_si256((__m256i *) &data3[index], (__m256i) resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? param : param2;
+	}
+
+}
+
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* x86 AVX-512BW version. See the non-SIMD version for the parameters.
+   The mask is tested directly into a mask register.
+*/
+#if defined(AF_HASSIMD_X86_AVX512)
+// param_arr_num
+static AF_TARGET_AVX512BW void where_1_avx512_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, selectmask;
+
+	v64qi maskslice, datasliceleft, datasliceright;
+
+	// Initialise the single value.
+	datasliceright = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		maskslice = (v64qi) _mm512_loadu_si512(&mask[index]);
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		// Find where the mask is not zero, and select the first source there.
+		selectmask = _mm512_test_epi8_mask((__m512i) maskslice, (__m512i) maskslice);
+		_mm512_storeu_si512(&data3[index], _mm512_mask_blend_epi8(selectmask, (__m512i) datasliceright, (__m512i) datasliceleft));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		maskslice = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &mask[alignedlength]);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		selectmask = _mm512_test_epi8_mask((__m512i) maskslice, (__m512i) maskslice);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_mask_blend_epi8(selectmask, (__m512i) datasliceright, (__m512i) datasliceleft));
+	}
+
+}
+
+// param_num_arr
+static AF_TARGET_AVX512BW void where_3_avx512_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, selectmask;
+
+	v64qi maskslice, datasliceleft, datasliceright;
+
+	// Initialise the single value.
+	datasliceleft = (v64qi) _mm512_set1_epi8((char) param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		maskslice = (v64qi) _mm512_loadu_si512(&mask[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		// Find where the mask is not zero, and select the first source there.
+		selectmask = _mm512_test_epi8_mask((__m512i) maskslice, (__m512i) maskslice);
+		_mm512_storeu_si512(&data3[index], _mm512_mask_blend_epi8(selectmask, (__m512i) datasliceright, (__m512i) datasliceleft));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		maskslice = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &mask[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		selectmask = _mm512_test_epi8_mask((__m512i) maskslice, (__m512i) maskslice);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_mask_blend_epi8(selectmask, (__m512i) datasliceright, (__m512i) datasliceleft));
+	}
+
+}
+
+// param_arr_arr
+static AF_TARGET_AVX512BW void where_5_avx512_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, selectmask;
+
+	v64qi maskslice, datasliceleft, datasliceright;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		maskslice = (v64qi) _mm512_loadu_si512(&mask[index]);
+		datasliceleft = (v64qi) _mm512_loadu_si512(&data1[index]);
+		datasliceright = (v64qi) _mm512_loadu_si512(&data2[index]);
+		// Find where the mask is not zero, and select the first source there.
+		selectmask = _mm512_test_epi8_mask((__m512i) maskslice, (__m512i) maskslice);
+		_mm512_storeu_si512(&data3[index], _mm512_mask_blend_epi8(selectmask, (__m512i) datasliceright, (__m512i) datasliceleft));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		maskslice = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &mask[alignedlength]);
+		datasliceleft = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data1[alignedlength]);
+		datasliceright = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &data2[alignedlength]);
+		selectmask = _mm512_test_epi8_mask((__m512i) maskslice, (__m512i) maskslice);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_mask_blend_epi8(selectmask, (__m512i) datasliceright, (__m512i) datasliceleft));
+	}
+
+}
+
+// param_num_num
+static AF_TARGET_AVX512BW void where_7_avx512_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char param2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+	unsigned long long tailmask, selectmask;
+
+	v64qi maskslice, datasliceleft, datasliceright;
+
+	// Initialise the single values.
+	datasliceleft = (v64qi) _mm512_set1_epi8((char) param);
+	datasliceright = (v64qi) _mm512_set1_epi8((char) param2);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE_AVX512);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE_AVX512) {
+		maskslice = (v64qi) _mm512_loadu_si512(&mask[index]);
+		// Find where the mask is not zero, and select the first source there.
+		selectmask = _mm512_test_epi8_mask((__m512i) maskslice, (__m512i) maskslice);
+		_mm512_storeu_si512(&data3[index], _mm512_mask_blend_epi8(selectmask, (__m512i) datasliceright, (__m512i) datasliceleft));
+	}
+
+	// The left over elements at the end of the array are handled using 
+	// masked loads and stores.
+	if (alignedlength < arraylen) {
+		tailmask = avx512tailmask(arraylen - alignedlength);
+		maskslice = (v64qi) _mm512_maskz_loadu_epi8(tailmask, &mask[alignedlength]);
+		selectmask = _mm512_test_epi8_mask((__m512i) maskslice, (__m512i) maskslice);
+		_mm512_mask_storeu_epi8(&data3[alignedlength], tailmask, _mm512_mask_blend_epi8(selectmask, (__m512i) datasliceright, (__m512i) datasliceleft));
+	}
+
+}
+
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv7 version. See the non-SIMD version for the parameters.
+*/
+#if defined(AF_HASSIMD_ARMv7_32BIT)
+// param_arr_num
+static void where_1_armv7_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t maskslice, datasliceleft, datasliceright, resultslice;
+
+	// Initialise the single value.
+	datasliceright = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = vld1_u8( &mask[index]);
+		datasliceleft = vld1_u8( &data1[index]);
+		// Find where the mask is not zero, and select the first source there.
+		maskslice = vtst_u8(maskslice, maskslice);
+		resultslice = vbsl_u8(maskslice, datasliceleft, datasliceright);
+		vst1_u8( &data3[index], resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? data1[index] : param;
+	}
+
+}
+
+// param_num_arr
+static void where_3_armv7_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t maskslice, datasliceleft, datasliceright, resultslice;
+
+	// Initialise the single value.
+	datasliceleft = vdup_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = vld1_u8( &mask[index]);
+		datasliceright = vld1_u8( &data2[index]);
+		// Find where the mask is not zero, and select the first source there.
+		maskslice = vtst_u8(maskslice, maskslice);
+		resultslice = vbsl_u8(maskslice, datasliceleft, datasliceright);
+		vst1_u8( &data3[index], resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? param : data2[index];
+	}
+
+}
+
+// param_arr_arr
+static void where_5_armv7_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t maskslice, datasliceleft, datasliceright, resultslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = vld1_u8( &mask[index]);
+		datasliceleft = vld1_u8( &data1[index]);
+		datasliceright = vld1_u8( &data2[index]);
+		// Find where the mask is not zero, and select the first source there.
+		maskslice = vtst_u8(maskslice, maskslice);
+		resultslice = vbsl_u8(maskslice, datasliceleft, datasliceright);
+		vst1_u8( &data3[index], resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? data1[index] : data2[index];
+	}
+
+}
+
+// param_num_num
+static void where_7_armv7_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char param2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x8_t maskslice, datasliceleft, datasliceright, resultslice;
+
+	// Initialise the single values.
+	datasliceleft = vdup_n_u8(param);
+	datasliceright = vdup_n_u8(param2);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = vld1_u8( &mask[index]);
+		// Find where the mask is not zero, and select the first source there.
+		maskslice = vtst_u8(maskslice, maskslice);
+		resultslice = vbsl_u8(maskslice, datasliceleft, datasliceright);
+		vst1_u8( &data3[index], resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? param : param2;
+	}
+
+}
+
+#endif
+
+
+
+/*--------------------------------------------------------------------------- */
+/* ARMv8 AARCH64 version. See the non-SIMD version for the parameters.
+*/
+#if defined(AF_HASSIMD_ARM_AARCH64)
+// param_arr_num
+static void where_1_armv8_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t maskslice, datasliceleft, datasliceright, resultslice;
+
+	// Initialise the single value.
+	datasliceright = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = vld1q_u8( &mask[index]);
+		datasliceleft = vld1q_u8( &data1[index]);
+		// Find where the mask is not zero, and select the first source there.
+		maskslice = vtstq_u8(maskslice, maskslice);
+		resultslice = vbslq_u8(maskslice, datasliceleft, datasliceright);
+		vst1q_u8( &data3[index], resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? data1[index] : param;
+	}
+
+}
+
+// param_num_arr
+static void where_3_armv8_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t maskslice, datasliceleft, datasliceright, resultslice;
+
+	// Initialise the single value.
+	datasliceleft = vdupq_n_u8(param);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = vld1q_u8( &mask[index]);
+		datasliceright = vld1q_u8( &data2[index]);
+		// Find where the mask is not zero, and select the first source there.
+		maskslice = vtstq_u8(maskslice, maskslice);
+		resultslice = vbslq_u8(maskslice, datasliceleft, datasliceright);
+		vst1q_u8( &data3[index], resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? param : data2[index];
+	}
+
+}
+
+// param_arr_arr
+static void where_5_armv8_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t maskslice, datasliceleft, datasliceright, resultslice;
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = vld1q_u8( &mask[index]);
+		datasliceleft = vld1q_u8( &data1[index]);
+		datasliceright = vld1q_u8( &data2[index]);
+		// Find where the mask is not zero, and select the first source there.
+		maskslice = vtstq_u8(maskslice, maskslice);
+		resultslice = vbslq_u8(maskslice, datasliceleft, datasliceright);
+		vst1q_u8( &data3[index], resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? data1[index] : data2[index];
+	}
+
+}
+
+// param_num_num
+static void where_7_armv8_simd(Py_ssize_t arraylen, unsigned char *mask, unsigned char param, unsigned char param2, unsigned char *data3) {
+
+	// array index counter. 
+	Py_ssize_t index; 
+
+	// SIMD related variables.
+	Py_ssize_t alignedlength;
+
+	uint8x16_t maskslice, datasliceleft, datasliceright, resultslice;
+
+	// Initialise the single values.
+	datasliceleft = vdupq_n_u8(param);
+	datasliceright = vdupq_n_u8(param2);
+
+	// Calculate array lengths for arrays whose lengths which are not even
+	// multipes of the SIMD slice length.
+	alignedlength = calcalignedlength(arraylen, CHARSIMDSIZE);
+
+	// Perform the main operation using SIMD instructions.
+	for(index = 0; index < alignedlength; index += CHARSIMDSIZE) {
+		maskslice = vld1q_u8( &mask[index]);
+		// Find where the mask is not zero, and select the first source there.
+		maskslice = vtstq_u8(maskslice, maskslice);
+		resultslice = vbslq_u8(maskslice, datasliceleft, datasliceright);
+		vst1q_u8( &data3[index], resultslice);
+	}
+
+	// Handle the left over elements at the end of the array.
+	for(index = alignedlength; index < arraylen; index++) {
+		data3[index] = mask[index] ? param : param2;
+	}
+
+}
+
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* Select the SIMD functions for this CPU.
+*/
+#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+static void where_initsimd(void) {
+
+	#if defined(AF_HASSIMD_X86)
+	int simdlevel = af_x86simdlevel();
+
+	if (simdlevel >= AF_SIMDLEVEL_AVX512BW) {
+		where_simdfuncs.arr_num = where_1_avx512_simd;
+		where_simdfuncs.num_arr = where_3_avx512_simd;
+		where_simdfuncs.arr_arr = where_5_avx512_simd;
+		where_simdfuncs.num_num = where_7_avx512_simd;
+	} else if (simdlevel >= AF_SIMDLEVEL_AVX2) {
+		where_simdfuncs.arr_num = where_1_avx2_simd;
+		where_simdfuncs.num_arr = where_3_avx2_simd;
+		where_simdfuncs.arr_arr = where_5_avx2_simd;
+		where_simdfuncs.num_num = where_7_avx2_simd;
+	} else {
+		where_simdfuncs.arr_num = where_1_x86_simd;
+		where_simdfuncs.num_arr = where_3_x86_simd;
+		where_simdfuncs.arr_arr = where_5_x86_simd;
+		where_simdfuncs.num_num = where_7_x86_simd;
+	}
+	#endif
+
+	#if defined(AF_HASSIMD_ARMv7_32BIT)
+	where_simdfuncs.arr_num = where_1_armv7_simd;
+	where_simdfuncs.num_arr = where_3_armv7_simd;
+	where_simdfuncs.arr_arr = where_5_armv7_simd;
+	where_simdfuncs.num_num = where_7_armv7_simd;
+	#endif
+
+	#if defined(AF_HASSIMD_ARM_AARCH64)
+	where_simdfuncs.arr_num = where_1_armv8_simd;
+	where_simdfuncs.num_arr = where_3_armv8_simd;
+	where_simdfuncs.arr_arr = where_5_armv8_simd;
+	where_simdfuncs.num_num = where_7_armv8_simd;
+	#endif
+
+}
+#endif
+
+/*--------------------------------------------------------------------------- */
+
+/* This selects the correct function, whether the platform independent non-SIMD
+   version, or the SIMD version selected for this CPU.
+   nosimd = If true, disable SIMD acceleration.
+   See the non-SIMD version for the other parameters.
+*/
+// param_arr_num
+static void where_1_select(Py_ssize_t arraylen, int nosimd, unsigned char *mask, unsigned char *data1, unsigned char param, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		where_simdfuncs.arr_num(arraylen, mask, data1, param, data3);
+	} else {
+	#endif
+		where_1(arraylen, mask, data1, param, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_num_arr
+static void where_3_select(Py_ssize_t arraylen, int nosimd, unsigned char *mask, unsigned char param, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		where_simdfuncs.num_arr(arraylen, mask, param, data2, data3);
+	} else {
+	#endif
+		where_3(arraylen, mask, param, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_arr_arr
+static void where_5_select(Py_ssize_t arraylen, int nosimd, unsigned char *mask, unsigned char *data1, unsigned char *data2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		where_simdfuncs.arr_arr(arraylen, mask, data1, data2, data3);
+	} else {
+	#endif
+		where_5(arraylen, mask, data1, data2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+// param_num_num
+static void where_7_select(Py_ssize_t arraylen, int nosimd, unsigned char *mask, unsigned char param, unsigned char param2, unsigned char *data3) {
+
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	if (!nosimd && enoughforsimd(arraylen, CHARSIMDSIZE)) {
+		where_simdfuncs.num_num(arraylen, mask, param, param2, data3);
+	} else {
+	#endif
+		where_7(arraylen, mask, param, param2, data3);
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	}
+	#endif
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* Calculate one part of the sequences. If the calculation is not divided
+	between threads, then there is just one part covering the whole sequence.
+	When there is no output sequence, the results overwrite the first 
+	source sequence, or the mask if both sources are single values.
+	ctx = The parsed parameters (struct args_params_2).
+	part = The number of this part.
+	nparts = The total number of parts.
+	Returns: Nothing.
+*/
+static void where_part(void *ctx, int part, int nparts) {
+
+	struct args_params_2 *bytesdata = (struct args_params_2 *) ctx;
+
+	// The range of this part of the sequences.
+	Py_ssize_t start, partlen;
+
+	unsigned char *mask;
+
+	partrange(bytesdata->arraylen, part, nparts, &start, &partlen);
+
+	mask = bytesdata->bytesmask.B + start;
+
+	// Select the correct implementation.
+	switch (bytesdata->paramcat) {
+		case param_arr_num_none : {
+			where_1_select(partlen, bytesdata->nosimd, mask, bytesdata->bytes1.B + start, bytesdata->param, bytesdata->bytes1.B + start);
+			break;
+		}
+		case param_arr_num_arr : {
+			where_1_select(partlen, bytesdata->nosimd, mask, bytesdata->bytes1.B + start, bytesdata->param, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_num_arr_none : {
+			where_3_select(partlen, bytesdata->nosimd, mask, bytesdata->param, bytesdata->bytes2.B + start, bytesdata->bytes2.B + start);
+			break;
+		}
+		case param_num_arr_arr : {
+			where_3_select(partlen, bytesdata->nosimd, mask, bytesdata->param, bytesdata->bytes2.B + start, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_arr_arr_none : {
+			where_5_select(partlen, bytesdata->nosimd, mask, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start, bytesdata->bytes1.B + start);
+			break;
+		}
+		case param_arr_arr_arr : {
+			where_5_select(partlen, bytesdata->nosimd, mask, bytesdata->bytes1.B + start, bytesdata->bytes2.B + start, bytesdata->bytes3.B + start);
+			break;
+		}
+		case param_num_num_none : {
+			where_7_select(partlen, bytesdata->nosimd, mask, bytesdata->param, bytesdata->param2, mask);
+			break;
+		}
+		case param_num_num_arr : {
+			where_7_select(partlen, bytesdata->nosimd, mask, bytesdata->param, bytesdata->param2, bytesdata->bytes3.B + start);
+			break;
+		}
+	}
+
+}
+
+/*--------------------------------------------------------------------------- */
+
+/* The wrapper to the underlying C function */
+static PyObject *py_where(PyObject *self, BF_ARGSDECL) {
+
+
+	// This is used to hold the parsed parameters.
+	struct args_params_2 bytesdata = ARGSINIT_TWO;
+
+	// The number of parts to divide the calculation into.
+	int nparts;
+
+
+	// -----------------------------------------------------
+
+
+	// Get the parameters passed from Python. 
+	bytesdata = getparams_two_mask(self, BF_ARGSPASS);
+
+	// If there was an error, we count on the parameter parsing function to 
+	// release the buffers if this was necessary.
+	if (bytesdata.errorcode) {
+		return NULL;
+	}
+
+	// The calculation is divided between threads only for long sequences.
+	nparts = calcthreadparts(bytesdata.threads, bytesdata.arraylen);
+
+	// Call the C function.
+	// The GIL is released for long sequences.
+	BF_BEGIN_ALLOW_THREADS(bytesdata.arraylen)
+	runparallel(where_part, &bytesdata, nparts);
+	BF_END_ALLOW_THREADS
+
+	// Release the buffers. 
+	releasebuffers_two(bytesdata);
+
+
+	// Return the new output sequence if one was created.
+	if (bytesdata.outobj != NULL) {
+		return bytesdata.outobj;
+	}
+
+	// Everything was successful.
+	Py_RETURN_NONE;
+
+}
+
+
+/*--------------------------------------------------------------------------- */
+
+
+/* The module doc string */
+PyDoc_STRVAR(where__doc__,
+"where \n\
+_____________________________ \n\
+\n\
+Select each value from one of two sources according to a mask. Where the \n\
+mask is not zero the value from the first source is used, and where it is \n\
+zero the value from the second source is used. \n\
+\n\
+======================  ============================================== \n\
+Equivalent to:          [x if m else y for m,x,y in zip(mask, sequence1, sequence2)] \n\
+or                      [x if m else param for m,x in zip(mask, sequence1)] \n\
+or                      [param if m else y for m,y in zip(mask, sequence2)] \n\
+or                      [param if m else param2 for m in mask] \n\
+======================  ============================================== \n\
+\n\
+Call formats: \n\
+\n\
+  where(mask, sequence1, param) \n\
+  where(mask, sequence1, param, outpsequence) \n\
+  where(mask, param, sequence2) \n\
+  where(mask, param, sequence2, outpsequence) \n\
+  where(mask, sequence1, sequence2) \n\
+  where(mask, sequence1, sequence2, outpsequence) \n\
+  where(mask, param, param2) \n\
+  where(mask, param, param2, outpsequence) \n\
+  where(mask, sequence1, param, maxlen=y) \n\
+  where(mask, sequence1, param, start=i, stop=j) \n\
+  where(mask, sequence1, param, nosimd=False) \n\
+  where(mask, sequence1, param, threads=4) \n\
+  result = where(mask, sequence1, param, outtype=bytes) \n\
+\n\
+* mask - A bytes or bytearray sequence which selects the source for each \n\
+  element. Any non-zero value selects the first source. This is usually \n\
+  created with cmpmask. \n\
+* sequence1 - The first source bytes or bytearray sequence. \n\
+* sequence2 - The second source bytes or bytearray sequence. \n\
+* param, param2 - Non-sequence numeric parameters, used in place of \n\
+  either or both source sequences. \n\
+* outpsequence - The output sequence. This parameter is optional. If no \n\
+  output sequence is provided the results will overwrite the first \n\
+  source sequence, or the mask if neither source is a sequence. \n\
+* maxlen - Limit the length of the sequence used. This must be a valid \n\
+  positive integer. If a zero or negative length, or a value which is \n\
+  greater than the actual length of the sequence is specified, this \n\
+  parameter is ignored. \n\
+* start, stop - Work on only part of the sequence, as if it had been \n\
+  sliced with sequence[start:stop]. The same part of every sequence, \n\
+  including the mask, is used. These are optional keyword parameters \n\
+  and are applied before maxlen. No data is copied. \n\
+* nosimd - If True, SIMD acceleration is disabled. This parameter is \n\
+  optional. The default is FALSE. \n\
+* threads - The number of threads to divide the calculation between. \n\
+  This parameter is optional. If zero or not specified, the default set \n\
+  by setthreads is used. Short sequences are not divided. \n\
+* outtype - If bytes or bytearray, a new sequence of that type is \n\
+  created, filled with the results, and returned. The input sequences \n\
+  are not changed and may be read only. The new sequence has the length \n\
+  of the part of the input which is used. This cannot be combined with \n\
+  outpsequence. This is an optional keyword parameter. \n\
+* result - The new sequence if outtype was given, otherwise None. \n\
+");
+
+
+/*--------------------------------------------------------------------------- */
+
+/* A list of all the methods defined by this module. 
+ "where" is the name seen inside of Python. 
+ "py_where" is the name of the C function handling the Python call. 
+ "BF_METHFLAGS" tells Python how to call the handler. 
+ The {NULL, NULL} entry indicates the end of the method definitions. */
+static PyMethodDef where_methods[] = {
+	{"where",  (PyCFunction)py_where, BF_METHFLAGS, where__doc__}, 
+	{NULL, NULL, 0, NULL}
+};
+
+
+#if defined(BF_SINGLEMODULE)
+
+/* Add the function to the combined extension module. This is used in place
+ of the module initialisation when all the functions are built as a single
+ extension module.
+*/
+int where_addfunc(PyObject *module)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	where_initsimd();
+	#endif
+
+	return PyModule_AddFunctions(module, where_methods);
+};
+
+#else
+
+static struct PyModuleDef wheremodule = {
+    PyModuleDef_HEAD_INIT,
+    "where",
+    NULL,
+    -1,
+    where_methods
+};
+
+PyMODINIT_FUNC PyInit_where(void)
+{
+	#if defined(AF_HASSIMD_X86) || defined(AF_HASSIMD_ARMv7_32BIT) || defined(AF_HASSIMD_ARM_AARCH64)
+	where_initsimd();
+	#endif
+
+    return PyModule_Create(&wheremodule);
+};
+
+#endif
+
+/*--------------------------------------------------------------------------- */
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_accumulators.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for SumAccumulator and MinMaxAccumulator, which
+calculate a result over a stream of sequences.
+"""
+
+##############################################################################
+import sys
+
+import array
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data. This is long enough that the GIL is released
+# for some chunks.
+TestLength = 200000
+
+# The lengths of the chunks the test data is divided into.
+ChunkLengths = (1, 15, 16, 17, 100, 65536, 70000)
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a bytes object.
+	"""
+	return bytes([(x * 37 + 11) % 251 + 2 for x in range(TestLength)])
+
+
+########################################################
+def makechunks(data, chunklen):
+	"""Divide the data into chunks.
+	"""
+	return [data[x:x + chunklen] for x in range(0, len(data), chunklen)]
+
+
+##############################################################################
+class accumulators_general(unittest.TestCase):
+	"""Test the accumulators.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_accumulators_sum_A1(self):
+		"""Test SumAccumulator with different chunk sizes.
+		"""
+		for chunklen in ChunkLengths:
+			for nosimd in (False, True):
+				with self.subTest(msg='Failed with parameter', chunklen = chunklen, nosimd = nosimd):
+					acc = bytesfunc.SumAccumulator(nosimd=nosimd)
+					for chunk in makechunks(self.data, chunklen):
+						self.assertIsNone(acc.update(chunk))
+					self.assertEqual(acc.result(), sum(self.data))
+					self.assertEqual(acc.count, len(self.data))
+
+
+	########################################################
+	def test_accumulators_minmax_A2(self):
+		"""Test MinMaxAccumulator with different chunk sizes.
+		"""
+		for chunklen in ChunkLengths:
+			for nosimd in (False, True):
+				with self.subTest(msg='Failed with parameter', chunklen = chunklen, nosimd = nosimd):
+					acc = bytesfunc.MinMaxAccumulator(nosimd=nosimd)
+					for chunk in makechunks(self.data, chunklen):
+						self.assertIsNone(acc.update(chunk))
+					self.assertEqual(acc.result(), (min(self.data), max(self.data)))
+					self.assertEqual(acc.count, len(self.data))
+
+
+	########################################################
+	def test_accumulators_minmaxextremes_A3(self):
+		"""Test that the minimum and maximum may be in any chunk, including
+		the extreme values.
+		"""
+		acc = bytesfunc.MinMaxAccumulator()
+		acc.update(b'\x80\x81')
+		self.assertEqual(acc.result(), (0x80, 0x81))
+		acc.update(bytes([255] * 40))
+		self.assertEqual(acc.result(), (0x80, 255))
+		acc.update(bytes(40))
+		self.assertEqual(acc.result(), (0, 255))
+
+
+	########################################################
+	def test_accumulators_empty_A4(self):
+		"""Test empty chunks.
+		"""
+		acc = bytesfunc.SumAccumulator()
+		self.assertEqual(acc.result(), 0)
+		acc.update(b'')
+		self.assertEqual(acc.result(), 0)
+		self.assertEqual(acc.count, 0)
+
+		acc = bytesfunc.MinMaxAccumulator()
+		acc.update(b'')
+		acc.update(b'\x05')
+		acc.update(bytearray())
+		self.assertEqual(acc.result(), (5, 5))
+		self.assertEqual(acc.count, 1)
+
+
+	########################################################
+	def test_accumulators_buffertypes_A5(self):
+		"""Test that any byte buffer may be used.
+		"""
+		data = self.data[:1000]
+		for chunk in (bytearray(data), memoryview(data), array.array('B', data)):
+			with self.subTest(msg='Failed with parameter', chunktype = type(chunk)):
+				acc = bytesfunc.SumAccumulator()
+				acc.update(chunk)
+				self.assertEqual(acc.result(), sum(data))
+
+				acc = bytesfunc.MinMaxAccumulator()
+				acc.update(chunk)
+				self.assertEqual(acc.result(), (min(data), max(data)))
+
+
+	########################################################
+	def test_accumulators_matherrors_A6(self):
+		"""Test that matherrors is accepted.
+		"""
+		acc = bytesfunc.SumAccumulator(matherrors=True)
+		acc.update(self.data)
+		self.assertEqual(acc.result(), sum(self.data))
+
+
+##############################################################################
+class accumulators_errors(unittest.TestCase):
+	"""Test the accumulators for errors.
+	"""
+
+	########################################################
+	def test_accumulators_noresult_B1(self):
+		"""Test that MinMaxAccumulator has no result until data has been
+		examined.
+		"""
+		acc = bytesfunc.MinMaxAccumulator()
+		with self.assertRaises(IndexError):
+			acc.result()
+		acc.update(b'')
+		with self.assertRaises(IndexError):
+			acc.result()
+
+
+	########################################################
+	def test_accumulators_params_B2(self):
+		"""Test invalid parameters.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.SumAccumulator(True)
+		with self.assertRaises(TypeError):
+			bytesfunc.SumAccumulator(xyz=True)
+		with self.assertRaises(TypeError):
+			bytesfunc.MinMaxAccumulator(matherrors=True)
+		with self.assertRaises(TypeError):
+			bytesfunc.MinMaxAccumulator(nosimd=1.5)
+
+
+	########################################################
+	def test_accumulators_update_B3(self):
+		"""Test that update accepts only sequences.
+		"""
+		for acc in (bytesfunc.SumAccumulator(), bytesfunc.MinMaxAccumulator()):
+			with self.subTest(msg='Failed with parameter', acc = type(acc)):
+				with self.assertRaises(TypeError):
+					acc.update(5)
+				with self.assertRaises(TypeError):
+					acc.update('abc')
+				with self.assertRaises(TypeError):
+					acc.update(array.array('h', [1, 2]))
+				with self.assertRaises(TypeError):
+					acc.update()
+				self.assertEqual(acc.count, 0)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('accumulators\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_bstats.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for bstats, which calculates the minimum, maximum,
+and sum in one pass.
+"""
+
+##############################################################################
+import sys
+
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data. This is long enough to be divided between
+# threads.
+TestLength = 300007
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a bytes object. The minimum and maximum
+	are not at the ends.
+	"""
+	return bytes([((x * 37 + x // 251) % 200) + 20 for x in range(TestLength)])
+
+
+########################################################
+def statsexpected(data):
+	"""Return the expected result.
+	"""
+	return (min(data), max(data), sum(data))
+
+
+##############################################################################
+class bstats_general(unittest.TestCase):
+	"""Test calculating the statistics.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_bstats_basic_A1(self):
+		"""Test bytes and bytearray.
+		"""
+		for seqtype in (bytes, bytearray):
+			with self.subTest(msg='Failed with parameter', seqtype = seqtype):
+				result = bytesfunc.bstats(seqtype(self.data))
+				self.assertEqual(result, statsexpected(self.data))
+
+
+	########################################################
+	def test_bstats_lengths_A2(self):
+		"""Test short sequences, including ones which do not fill a SIMD register.
+		"""
+		for length in (1, 2, 15, 16, 17, 47, 48, 49, 95, 96, 97, 193, 385):
+			data = self.data[:length]
+			with self.subTest(msg='Failed with parameter', length = length):
+				self.assertEqual(bytesfunc.bstats(data), statsexpected(data))
+
+
+	########################################################
+	def test_bstats_limits_A3(self):
+		"""Test the minimum and maximum values.
+		"""
+		for minval, maxval in ((0, 255), (0, 0), (255, 255), (0, 1), (254, 255)):
+			data = bytearray([minval]) * 1000
+			data[501] = maxval
+			with self.subTest(msg='Failed with parameter', minval = minval, maxval = maxval):
+				self.assertEqual(bytesfunc.bstats(data), statsexpected(data))
+				self.assertEqual(bytesfunc.bstats(data, nosimd=True), statsexpected(data))
+
+
+	########################################################
+	def test_bstats_window_A4(self):
+		"""Test start, stop, step and maxlen.
+		"""
+		for start, stop, step in ((0, None, 2), (0, None, 3), (5, 100001, 7), (1000, None, 16), (17, 5000, 17)):
+			with self.subTest(msg='Failed with parameter', start = start, stop = stop, step = step):
+				kwargs = {'start' : start, 'step' : step}
+				if stop is not None:
+					kwargs['stop'] = stop
+				result = bytesfunc.bstats(self.data, **kwargs)
+				self.assertEqual(result, statsexpected(self.data[start:stop:step]))
+
+		result = bytesfunc.bstats(self.data, maxlen=500)
+		self.assertEqual(result, statsexpected(self.data[:500]))
+
+
+	########################################################
+	def test_bstats_extended_A5(self):
+		"""Test including the count and mean.
+		"""
+		for step in (1, 3):
+			data = self.data[::step]
+			with self.subTest(msg='Failed with parameter', step = step):
+				result = bytesfunc.bstats(self.data, step=step, extended=True)
+				self.assertEqual(result[:4], statsexpected(data) + (len(data),))
+				self.assertAlmostEqual(result[4], sum(data) / len(data))
+
+
+	########################################################
+	def test_bstats_nosimd_A6(self):
+		"""Test with SIMD disabled.
+		"""
+		result = bytesfunc.bstats(self.data, nosimd=True)
+		self.assertEqual(result, statsexpected(self.data))
+
+
+	########################################################
+	def test_bstats_threads_A7(self):
+		"""Test bstats divided between threads.
+		"""
+		for threads in (1, 2, 3, 4):
+			for step in (1, 5):
+				with self.subTest(msg='Failed with parameter', threads = threads, step = step):
+					result = bytesfunc.bstats(self.data, step=step, threads=threads)
+					self.assertEqual(result, statsexpected(self.data[::step]))
+
+
+##############################################################################
+class bstats_errors(unittest.TestCase):
+	"""Test for invalid parameters.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()[:100]
+
+
+	########################################################
+	def test_bstats_empty_B1(self):
+		"""Test an empty sequence.
+		"""
+		with self.assertRaises(IndexError):
+			bytesfunc.bstats(b'')
+		with self.assertRaises(IndexError):
+			bytesfunc.bstats(self.data, start=100)
+
+
+	########################################################
+	def test_bstats_invalidparams_B2(self):
+		"""Test invalid parameters.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.bstats([1, 2, 3])
+		with self.assertRaises(TypeError):
+			bytesfunc.bstats(5)
+		with self.assertRaises(TypeError):
+			bytesfunc.bstats(self.data, step=0)
+		with self.assertRaises(TypeError):
+			bytesfunc.bstats(self.data, matherrors=True)
+		with self.assertRaises(TypeError):
+			bytesfunc.bstats()
+
+
+	########################################################
+	def test_bstats_paramrange_B3(self):
+		"""Test integers which are out of range for a byte. A call with a 
+		memoryview first leaves a buffer on the stack to be released.
+		"""
+		bytesfunc.bstats(memoryview(bytearray(self.data)), extended=True)
+		with self.assertRaises(TypeError):
+			bytesfunc.bstats(-1)
+		with self.assertRaises(TypeError):
+			bytesfunc.bstats(256)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('bstats\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_buffertypes.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for the types of sequence accepted. Any object
+which supports the buffer protocol with contiguous data and one byte items
+may be used as input, and any such object which is writable may be used
+as output.
+"""
+
+##############################################################################
+import sys
+
+import array
+import mmap
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data.
+TestLength = 200
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a bytes object.
+	"""
+	return bytes([(x * 37 + 11) % 256 for x in range(TestLength)])
+
+
+########################################################
+def makemmap(data):
+	"""Return an anonymous memory map containing the data.
+	"""
+	mm = mmap.mmap(-1, len(data))
+	mm.write(data)
+	return mm
+
+
+##############################################################################
+class buffertypes_input(unittest.TestCase):
+	"""Test that different buffer types may be used as input.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+		self.mm = makemmap(self.data)
+
+		# Each of these contains the same data.
+		self.inputs = {
+			'memoryview' : memoryview(self.data),
+			'memoryview_slice' : memoryview(b'\x00' * 10 + self.data)[10:],
+			'array' : array.array('B', self.data),
+			'mmap' : self.mm,
+			'mmap_memoryview' : memoryview(self.mm),
+			'readonly_memoryview' : memoryview(bytearray(self.data)).toreadonly(),
+		}
+
+
+	########################################################
+	def tearDown(self):
+		"""Clean up.
+		"""
+		# The memoryviews must be released before the mmap can be closed.
+		for x in self.inputs.values():
+			if isinstance(x, memoryview):
+				x.release()
+		self.mm.close()
+
+
+	########################################################
+	def test_buffertypes_reductions_A1(self):
+		"""Test the reductions with different input types.
+		"""
+		for bufname, bufdata in self.inputs.items():
+			with self.subTest(msg='Failed with parameter', bufname = bufname):
+				self.assertEqual(bytesfunc.bmax(bufdata), max(self.data))
+				self.assertEqual(bytesfunc.bmin(bufdata), min(self.data))
+				self.assertEqual(bytesfunc.bsum(bufdata), sum(self.data))
+
+
+	########################################################
+	def test_buffertypes_search_A2(self):
+		"""Test ball, bany and findindex with different input types.
+		"""
+		for bufname, bufdata in self.inputs.items():
+			with self.subTest(msg='Failed with parameter', bufname = bufname):
+				self.assertEqual(bytesfunc.findindex('==', bufdata, self.data[-1]), self.data.index(self.data[-1]))
+				self.assertTrue(bytesfunc.bany('==', bufdata, self.data[-1]))
+				self.assertFalse(bytesfunc.ball('==', bufdata, self.data[-1]))
+
+
+	########################################################
+	def test_buffertypes_comp_A3(self):
+		"""Test the comparison functions with different input types.
+		"""
+		for bufname, bufdata in self.inputs.items():
+			with self.subTest(msg='Failed with parameter', bufname = bufname):
+				self.assertTrue(bytesfunc.eq(bufdata, self.data))
+				self.assertTrue(bytesfunc.eq(self.data, bufdata))
+				self.assertFalse(bytesfunc.ne(bufdata, self.data))
+
+
+	########################################################
+	def test_buffertypes_binops_A4(self):
+		"""Test the binary operators with different input types.
+		"""
+		expected = bytearray([x ^ 0x55 for x in self.data])
+
+		for bufname, bufdata in self.inputs.items():
+			with self.subTest(msg='Failed with parameter', bufname = bufname):
+				dataout = bytearray(TestLength)
+				bytesfunc.xor(bufdata, 0x55, dataout)
+				self.assertEqual(dataout, expected)
+
+
+	########################################################
+	def test_buffertypes_invert_A5(self):
+		"""Test invert with different input types.
+		"""
+		expected = bytearray([~x & 0xff for x in self.data])
+
+		for bufname, bufdata in self.inputs.items():
+			with self.subTest(msg='Failed with parameter', bufname = bufname):
+				dataout = bytearray(TestLength)
+				bytesfunc.invert(bufdata, dataout)
+				self.assertEqual(dataout, expected)
+
+
+
+##############################################################################
+class buffertypes_output(unittest.TestCase):
+	"""Test that different writable buffer types may be used as output.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+		self.expected = bytes([x & 0x0f for x in self.data])
+
+
+	########################################################
+	def test_buffertypes_array_B1(self):
+		"""Test output to an array.
+		"""
+		dataout = array.array('B', bytes(TestLength))
+		bytesfunc.and_(self.data, 0x0f, dataout)
+		self.assertEqual(dataout.tobytes(), self.expected)
+
+
+	########################################################
+	def test_buffertypes_inplace_B2(self):
+		"""Test in place operation on an array.
+		"""
+		dataout = array.array('B', self.data)
+		bytesfunc.and_(dataout, 0x0f)
+		self.assertEqual(dataout.tobytes(), self.expected)
+
+
+	########################################################
+	def test_buffertypes_memoryview_B3(self):
+		"""Test output to a slice of a bytearray through a memoryview. Only
+		the slice should be altered.
+		"""
+		databuf = bytearray(TestLength + 20)
+		with memoryview(databuf) as dataview:
+			bytesfunc.and_(self.data, 0x0f, dataview[10:TestLength + 10])
+		self.assertEqual(bytes(databuf), bytes(10) + self.expected + bytes(10))
+
+
+	########################################################
+	def test_buffertypes_mmap_B4(self):
+		"""Test output to a memory map.
+		"""
+		mm = mmap.mmap(-1, TestLength)
+		try:
+			bytesfunc.and_(self.data, 0x0f, mm)
+			self.assertEqual(mm[:], self.expected)
+		finally:
+			mm.close()
+
+
+
+##############################################################################
+class buffertypes_errors(unittest.TestCase):
+	"""Test that unsuitable buffers are rejected.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_buffertypes_readonlyout_C1(self):
+		"""Test that a read only buffer cannot be used as output.
+		"""
+		with memoryview(bytearray(TestLength)).toreadonly() as dataout:
+			with self.assertRaises(TypeError):
+				bytesfunc.and_(self.data, 0x0f, dataout)
+
+		with self.assertRaises(TypeError):
+			bytesfunc.invert(memoryview(self.data))
+
+
+	########################################################
+	def test_buffertypes_itemsize_C2(self):
+		"""Test that buffers with items larger than one byte are rejected.
+		"""
+		for typecode in ('h', 'H', 'i', 'f', 'd'):
+			with self.subTest(msg='Failed with parameter', typecode = typecode):
+				datax = array.array(typecode, [1] * TestLength)
+				with self.assertRaises(TypeError):
+					bytesfunc.bmax(datax)
+				with self.assertRaises(TypeError):
+					bytesfunc.and_(self.data[:len(datax) * datax.itemsize], 0x0f, datax)
+
+
+	########################################################
+	def test_buffertypes_noncontiguous_C3(self):
+		"""Test that non-contiguous buffers are rejected.
+		"""
+		with memoryview(self.data)[::2] as datax:
+			with self.assertRaises(TypeError):
+				bytesfunc.bsum(datax)
+
+		with memoryview(bytearray(TestLength * 2))[::2] as dataout:
+			with self.assertRaises(TypeError):
+				bytesfunc.and_(self.data, 0x0f, dataout)
+
+
+##############################################################################
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('buffertypes\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_cmpmask.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for cmpmask, which outputs the result of each
+comparison as a mask.
+"""
+
+##############################################################################
+import sys
+
+import operator
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data. This is long enough to be divided between
+# threads.
+TestLength = 200003
+
+# The comparison operators.
+OpsList = {'==' : operator.eq, '!=' : operator.ne, '>' : operator.gt,
+	'>=' : operator.ge, '<' : operator.lt, '<=' : operator.le}
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a bytes object.
+	"""
+	return bytes([(x * 37 + x // 251) % 256 for x in range(TestLength)])
+
+
+########################################################
+def maskexpected(opfunc, data1, data2):
+	"""Return the expected mask. Either of data1 or data2 may be a single
+	parameter instead of a sequence.
+	"""
+	if isinstance(data1, int):
+		return bytes([255 if opfunc(data1, y) else 0 for y in data2])
+	elif isinstance(data2, int):
+		return bytes([255 if opfunc(x, data2) else 0 for x in data1])
+	else:
+		return bytes([255 if opfunc(x, y) else 0 for x, y in zip(data1, data2)])
+
+
+##############################################################################
+class cmpmask_general(unittest.TestCase):
+	"""Test creating the masks.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+		self.data2 = self.data[::-1]
+
+
+	########################################################
+	def test_cmpmask_arr_num_A1(self):
+		"""Test cmpmask with each operator in the form sequence, param.
+		"""
+		for opstr, opfunc in OpsList.items():
+			for param in (0, 100, 255):
+				with self.subTest(msg='Failed with parameter', opstr = opstr, param = param):
+					data = bytearray(self.data)
+					dataout = bytearray(len(data))
+					expected = maskexpected(opfunc, self.data, param)
+
+					bytesfunc.cmpmask(opstr, data, param, dataout)
+					self.assertEqual(dataout, expected)
+					self.assertEqual(data, self.data)
+
+					bytesfunc.cmpmask(opstr, data, param)
+					self.assertEqual(data, expected)
+
+
+	########################################################
+	def test_cmpmask_num_arr_A2(self):
+		"""Test cmpmask with each operator in the form param, sequence.
+		"""
+		for opstr, opfunc in OpsList.items():
+			for param in (0, 100, 255):
+				with self.subTest(msg='Failed with parameter', opstr = opstr, param = param):
+					data = bytearray(self.data)
+					dataout = bytearray(len(data))
+					expected = maskexpected(opfunc, param, self.data)
+
+					bytesfunc.cmpmask(opstr, param, data, dataout)
+					self.assertEqual(dataout, expected)
+					self.assertEqual(data, self.data)
+
+					bytesfunc.cmpmask(opstr, param, data)
+					self.assertEqual(data, expected)
+
+
+	########################################################
+	def test_cmpmask_arr_arr_A3(self):
+		"""Test cmpmask with each operator in the form sequence, sequence.
+		"""
+		for opstr, opfunc in OpsList.items():
+			with self.subTest(msg='Failed with parameter', opstr = opstr):
+				data = bytearray(self.data)
+				dataout = bytearray(len(data))
+				expected = maskexpected(opfunc, self.data, self.data2)
+
+				bytesfunc.cmpmask(opstr, data, self.data2, dataout)
+				self.assertEqual(dataout, expected)
+				self.assertEqual(data, self.data)
+
+				bytesfunc.cmpmask(opstr, data, self.data2)
+				self.assertEqual(data, expected)
+
+
+	########################################################
+	def test_cmpmask_lengths_A4(self):
+		"""Test short sequences, including ones which do not fill a SIMD register.
+		"""
+		for length in (0, 1, 15, 16, 17, 31, 32, 33, 63, 64, 65, 193):
+			for opstr, opfunc in OpsList.items():
+				with self.subTest(msg='Failed with parameter', length = length, opstr = opstr):
+					data = self.data[:length]
+					data2 = self.data2[:length]
+					self.assertEqual(bytesfunc.cmpmask(opstr, data, 127, outtype=bytes), maskexpected(opfunc, data, 127))
+					self.assertEqual(bytesfunc.cmpmask(opstr, data, data2, outtype=bytes), maskexpected(opfunc, data, data2))
+
+
+	########################################################
+	def test_cmpmask_nosimd_A5(self):
+		"""Test with SIMD disabled.
+		"""
+		for opstr, opfunc in OpsList.items():
+			with self.subTest(msg='Failed with parameter', opstr = opstr):
+				result = bytesfunc.cmpmask(opstr, self.data, 200, outtype=bytes, nosimd=True)
+				self.assertEqual(result, maskexpected(opfunc, self.data, 200))
+				result = bytesfunc.cmpmask(opstr, self.data, self.data2, outtype=bytes, nosimd=True)
+				self.assertEqual(result, maskexpected(opfunc, self.data, self.data2))
+
+
+	########################################################
+	def test_cmpmask_threads_A6(self):
+		"""Test cmpmask divided between threads.
+		"""
+		for threads in (1, 2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				result = bytesfunc.cmpmask('>=', self.data, 128, outtype=bytes, threads=threads)
+				self.assertEqual(result, maskexpected(operator.ge, self.data, 128))
+				result = bytesfunc.cmpmask('<', self.data, self.data2, outtype=bytes, threads=threads)
+				self.assertEqual(result, maskexpected(operator.lt, self.data, self.data2))
+
+
+	########################################################
+	def test_cmpmask_window_A7(self):
+		"""Test start, stop and maxlen.
+		"""
+		result = bytesfunc.cmpmask('<=', self.data, 30, outtype=bytes, start=17, stop=5000)
+		self.assertEqual(result, maskexpected(operator.le, self.data[17:5000], 30))
+
+		result = bytesfunc.cmpmask('==', self.data, 37, outtype=bytearray, maxlen=500)
+		self.assertIsInstance(result, bytearray)
+		self.assertEqual(result, maskexpected(operator.eq, self.data[:500], 37))
+
+
+	########################################################
+	def test_cmpmask_filter_A8(self):
+		"""Test using the masks with and_ to select values in a range.
+		"""
+		lowmask = bytesfunc.cmpmask('>=', self.data, 50, outtype=bytearray)
+		highmask = bytesfunc.cmpmask('<', self.data, 150, outtype=bytes)
+		bytesfunc.and_(lowmask, highmask)
+
+		result = bytearray(self.data)
+		bytesfunc.and_(result, lowmask)
+
+		expected = bytes([x if 50 <= x < 150 else 0 for x in self.data])
+		self.assertEqual(result, expected)
+
+
+##############################################################################
+class cmpmask_errors(unittest.TestCase):
+	"""Test for invalid parameters.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = bytearray(maketestdata()[:100])
+
+
+	########################################################
+	def test_cmpmask_invalidop_B1(self):
+		"""Test an invalid operator.
+		"""
+		with self.assertRaises(ValueError):
+			bytesfunc.cmpmask('+', self.data, 1)
+		with self.assertRaises(TypeError):
+			bytesfunc.cmpmask(1, self.data, 1)
+
+
+	########################################################
+	def test_cmpmask_paramrange_B2(self):
+		"""Test a parameter which is out of range. This is reported the same
+		way as for and_.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.cmpmask('==', self.data, 256)
+		with self.assertRaises(TypeError):
+			bytesfunc.cmpmask('==', -1, self.data)
+
+
+	########################################################
+	def test_cmpmask_invalidparams_B3(self):
+		"""Test invalid parameters.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.cmpmask('==', [1, 2, 3], 1)
+		with self.assertRaises(TypeError):
+			bytesfunc.cmpmask('==', 1, 1)
+		with self.assertRaises(TypeError):
+			bytesfunc.cmpmask('==', self.data)
+		with self.assertRaises(TypeError):
+			bytesfunc.cmpmask('==', bytes(self.data), 1)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('cmpmask\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_countif.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for countif, which counts the values which meet
+a comparison.
+"""
+
+##############################################################################
+import sys
+
+import operator
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data. This is long enough for the counts kept in
+# each byte of a SIMD vector to be added to the total more than once, and
+# to be divided between threads.
+TestLength = 200003
+
+# The comparison operators.
+OpsList = {'==' : operator.eq, '!=' : operator.ne, '>' : operator.gt,
+	'>=' : operator.ge, '<' : operator.lt, '<=' : operator.le}
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a bytes object.
+	"""
+	return bytes([(x * 37 + x // 251) % 256 for x in range(TestLength)])
+
+
+########################################################
+def countexpected(opfunc, data, param, start=0, stop=None, step=1):
+	"""Return the number of matches.
+	"""
+	if stop is None:
+		stop = len(data)
+	return len([x for x in range(start, stop, step) if opfunc(data[x], param)])
+
+
+##############################################################################
+class countif_general(unittest.TestCase):
+	"""Test counting the matches.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_countif_ops_A1(self):
+		"""Test countif with each operator.
+		"""
+		for opstr, opfunc in OpsList.items():
+			for param in (0, 100, 255):
+				with self.subTest(msg='Failed with parameter', opstr = opstr, param = param):
+					result = bytesfunc.countif(opstr, self.data, param)
+					self.assertEqual(result, countexpected(opfunc, self.data, param))
+
+
+	########################################################
+	def test_countif_lengths_A2(self):
+		"""Test short sequences, including ones which do not fill a SIMD register.
+		"""
+		for length in (0, 1, 15, 16, 17, 47, 48, 49, 95, 96, 97, 193):
+			data = self.data[:length]
+			with self.subTest(msg='Failed with parameter', length = length):
+				self.assertEqual(bytesfunc.countif('>', data, 127), countexpected(operator.gt, data, 127))
+
+
+	########################################################
+	def test_countif_allmatch_A3(self):
+		"""Test when every value matches, so the counts are as large as possible.
+		"""
+		data = bytes([255]) * TestLength
+		for step in (1, 2, 3, 16, 17):
+			with self.subTest(msg='Failed with parameter', step = step):
+				self.assertEqual(bytesfunc.countif('==', data, 255, step=step), len(range(0, TestLength, step)))
+				self.assertEqual(bytesfunc.countif('!=', data, 255, step=step), 0)
+
+
+	########################################################
+	def test_countif_window_A4(self):
+		"""Test start, stop, step and maxlen.
+		"""
+		for start, stop, step in ((0, None, 3), (5, 100001, 7), (1000, None, 64), (17, 5000, 1)):
+			with self.subTest(msg='Failed with parameter', start = start, stop = stop, step = step):
+				kwargs = {'start' : start, 'step' : step}
+				if stop is not None:
+					kwargs['stop'] = stop
+				expected = countexpected(operator.le, self.data, 30, start, stop, step)
+				self.assertEqual(bytesfunc.countif('<=', self.data, 30, **kwargs), expected)
+
+		expected = countexpected(operator.eq, self.data, 37, 0, 500)
+		self.assertEqual(bytesfunc.countif('==', self.data, 37, maxlen=500), expected)
+
+
+	########################################################
+	def test_countif_nosimd_A5(self):
+		"""Test with SIMD disabled.
+		"""
+		expected = countexpected(operator.ne, self.data, 200)
+		self.assertEqual(bytesfunc.countif('!=', self.data, 200, nosimd=True), expected)
+
+
+	########################################################
+	def test_countif_threads_A6(self):
+		"""Test countif divided between threads.
+		"""
+		for threads in (1, 2, 3, 4):
+			for step in (1, 5):
+				with self.subTest(msg='Failed with parameter', threads = threads, step = step):
+					result = bytesfunc.countif('>=', self.data, 128, step=step, threads=threads)
+					self.assertEqual(result, countexpected(operator.ge, self.data, 128, step=step))
+
+
+##############################################################################
+class countif_errors(unittest.TestCase):
+	"""Test for invalid parameters.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()[:100]
+
+
+	########################################################
+	def test_countif_invalidop_B1(self):
+		"""Test an invalid operator.
+		"""
+		with self.assertRaises(ValueError):
+			bytesfunc.countif('+', self.data, 1)
+
+
+	########################################################
+	def test_countif_paramovfl_B2(self):
+		"""Test a parameter which is out of range.
+		"""
+		with self.assertRaises(OverflowError):
+			bytesfunc.countif('==', self.data, 256)
+		with self.assertRaises(OverflowError):
+			bytesfunc.countif('==', self.data, -1)
+
+
+	########################################################
+	def test_countif_invalidparams_B3(self):
+		"""Test invalid parameters.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.countif('==', [1, 2, 3], 1)
+		with self.assertRaises(TypeError):
+			bytesfunc.countif('==', self.data, 1, step=0)
+		with self.assertRaises(TypeError):
+			bytesfunc.countif('==', self.data)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('countif\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
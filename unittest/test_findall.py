@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_findall.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for findall and finditer, which find the index
+of every match rather than just the first one.
+"""
+
+##############################################################################
+import sys
+
+import array
+import operator
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data. This is long enough to be searched in more
+# than one block and to be divided between threads.
+TestLength = 200003
+
+# The comparison operators.
+OpsList = {'==' : operator.eq, '!=' : operator.ne, '>' : operator.gt,
+	'>=' : operator.ge, '<' : operator.lt, '<=' : operator.le}
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a bytes object.
+	"""
+	return bytes([(x * 37 + x // 251) % 256 for x in range(TestLength)])
+
+
+########################################################
+def findexpected(opfunc, data, param, start=0, stop=None, step=1):
+	"""Return the indexes of the matches as a list.
+	"""
+	if stop is None:
+		stop = len(data)
+	return [x for x in range(start, stop, step) if opfunc(data[x], param)]
+
+
+##############################################################################
+class findall_general(unittest.TestCase):
+	"""Test finding every match.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_findall_ops_A1(self):
+		"""Test findall with each operator.
+		"""
+		for opstr, opfunc in OpsList.items():
+			for param in (0, 100, 255):
+				with self.subTest(msg='Failed with parameter', opstr = opstr, param = param):
+					result = bytesfunc.findall(opstr, self.data, param)
+					self.assertIsInstance(result, array.array)
+					self.assertEqual(result.typecode, 'q')
+					self.assertEqual(list(result), findexpected(opfunc, self.data, param))
+
+
+	########################################################
+	def test_finditer_ops_A2(self):
+		"""Test finditer with each operator.
+		"""
+		for opstr, opfunc in OpsList.items():
+			for param in (0, 100, 255):
+				with self.subTest(msg='Failed with parameter', opstr = opstr, param = param):
+					result = list(bytesfunc.finditer(opstr, self.data, param))
+					self.assertEqual(result, findexpected(opfunc, self.data, param))
+
+
+	########################################################
+	def test_findall_lengths_A3(self):
+		"""Test short sequences, including ones which do not fill a SIMD register.
+		"""
+		for length in (0, 1, 15, 16, 17, 31, 32, 33, 63, 64, 65, 129):
+			data = self.data[:length]
+			with self.subTest(msg='Failed with parameter', length = length):
+				expected = findexpected(operator.gt, data, 127)
+				self.assertEqual(list(bytesfunc.findall('>', data, 127)), expected)
+				self.assertEqual(list(bytesfunc.finditer('>', data, 127)), expected)
+
+
+	########################################################
+	def test_findall_window_A4(self):
+		"""Test start, stop, step and maxlen. Indexes are in the whole sequence.
+		"""
+		for start, stop, step in ((0, None, 3), (5, 100001, 7), (1000, None, 64), (17, 5000, 1)):
+			with self.subTest(msg='Failed with parameter', start = start, stop = stop, step = step):
+				kwargs = {'start' : start, 'step' : step}
+				if stop is not None:
+					kwargs['stop'] = stop
+				expected = findexpected(operator.le, self.data, 30, start, stop, step)
+				self.assertEqual(list(bytesfunc.findall('<=', self.data, 30, **kwargs)), expected)
+				self.assertEqual(list(bytesfunc.finditer('<=', self.data, 30, **kwargs)), expected)
+
+		expected = findexpected(operator.eq, self.data, 37, 0, 500)
+		self.assertEqual(list(bytesfunc.findall('==', self.data, 37, maxlen=500)), expected)
+		self.assertEqual(list(bytesfunc.finditer('==', self.data, 37, maxlen=500)), expected)
+
+
+	########################################################
+	def test_findall_nosimd_A5(self):
+		"""Test with SIMD disabled.
+		"""
+		expected = findexpected(operator.ne, self.data, 200)
+		self.assertEqual(list(bytesfunc.findall('!=', self.data, 200, nosimd=True)), expected)
+		self.assertEqual(list(bytesfunc.finditer('!=', self.data, 200, nosimd=True)), expected)
+
+
+	########################################################
+	def test_findall_threads_A6(self):
+		"""Test findall divided between threads.
+		"""
+		for threads in (1, 2, 3, 4):
+			for step in (1, 5):
+				with self.subTest(msg='Failed with parameter', threads = threads, step = step):
+					result = bytesfunc.findall('>=', self.data, 128, step=step, threads=threads)
+					self.assertEqual(list(result), findexpected(operator.ge, self.data, 128, step=step))
+
+
+	########################################################
+	def test_finditer_lazy_A7(self):
+		"""Test that finditer can be stopped part way and that the
+		sequence cannot be resized until the iterator is finished.
+		"""
+		data = bytearray(self.data)
+		expected = findexpected(operator.eq, data, 37)
+		iterobj = bytesfunc.finditer('==', data, 37)
+		self.assertIs(iter(iterobj), iterobj)
+		self.assertEqual(next(iterobj), expected[0])
+
+		with self.assertRaises(BufferError):
+			data.append(0)
+
+		self.assertEqual(list(iterobj), expected[1:])
+		data.append(0)
+		self.assertEqual(list(iterobj), [])
+
+
+##############################################################################
+class findall_errors(unittest.TestCase):
+	"""Test for invalid parameters.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()[:100]
+
+
+	########################################################
+	def test_findall_invalidop_B1(self):
+		"""Test an invalid operator.
+		"""
+		with self.assertRaises(ValueError):
+			bytesfunc.findall('+', self.data, 1)
+		with self.assertRaises(ValueError):
+			bytesfunc.finditer('+', self.data, 1)
+
+
+	########################################################
+	def test_findall_paramovfl_B2(self):
+		"""Test a parameter which is out of range.
+		"""
+		with self.assertRaises(OverflowError):
+			bytesfunc.findall('==', self.data, 256)
+		with self.assertRaises(OverflowError):
+			bytesfunc.finditer('==', self.data, -1)
+
+
+	########################################################
+	def test_findall_invalidparams_B3(self):
+		"""Test invalid parameters.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.findall('==', [1, 2, 3], 1)
+		with self.assertRaises(TypeError):
+			bytesfunc.findall('==', self.data, 1, step=0)
+		with self.assertRaises(TypeError):
+			bytesfunc.finditer('==', self.data, 1, step=0)
+		# finditer is not divided between threads.
+		with self.assertRaises(TypeError):
+			bytesfunc.finditer('==', self.data, 1, threads=2)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('findall\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_histogram.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for histogram, which counts how many times each
+byte value occurs.
+"""
+
+##############################################################################
+import sys
+
+import array
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data. This is long enough to be divided between
+# threads.
+TestLength = 300007
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a bytes object.
+	"""
+	return bytes([(x * 37 + x // 251) % 256 for x in range(TestLength)])
+
+
+########################################################
+def histexpected(data):
+	"""Return the count of each value as a list.
+	"""
+	counts = [0] * 256
+	for x in data:
+		counts[x] += 1
+	return counts
+
+
+##############################################################################
+class histogram_general(unittest.TestCase):
+	"""Test counting each value.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_histogram_basic_A1(self):
+		"""Test bytes and bytearray.
+		"""
+		for seqtype in (bytes, bytearray):
+			with self.subTest(msg='Failed with parameter', seqtype = seqtype):
+				result = bytesfunc.histogram(seqtype(self.data))
+				self.assertIsInstance(result, array.array)
+				self.assertEqual(result.typecode, 'Q')
+				self.assertEqual(list(result), histexpected(self.data))
+
+
+	########################################################
+	def test_histogram_lengths_A2(self):
+		"""Test short sequences, including ones which do not use every table.
+		"""
+		for length in (0, 1, 2, 3, 4, 5, 7, 8, 9, 257):
+			data = self.data[:length]
+			with self.subTest(msg='Failed with parameter', length = length):
+				self.assertEqual(list(bytesfunc.histogram(data)), histexpected(data))
+
+
+	########################################################
+	def test_histogram_repeated_A3(self):
+		"""Test a sequence which contains only one value.
+		"""
+		data = bytes([200]) * TestLength
+		result = bytesfunc.histogram(data)
+		self.assertEqual(result[200], TestLength)
+		self.assertEqual(sum(result), TestLength)
+
+
+	########################################################
+	def test_histogram_window_A4(self):
+		"""Test start, stop, step and maxlen.
+		"""
+		for start, stop, step in ((0, None, 3), (5, 100001, 7), (1000, None, 64), (17, 5000, 1)):
+			with self.subTest(msg='Failed with parameter', start = start, stop = stop, step = step):
+				kwargs = {'start' : start, 'step' : step}
+				if stop is not None:
+					kwargs['stop'] = stop
+				result = bytesfunc.histogram(self.data, **kwargs)
+				self.assertEqual(list(result), histexpected(self.data[start:stop:step]))
+
+		result = bytesfunc.histogram(self.data, maxlen=500)
+		self.assertEqual(list(result), histexpected(self.data[:500]))
+
+
+	########################################################
+	def test_histogram_out_A5(self):
+		"""Test adding to an existing histogram.
+		"""
+		out = array.array('Q', [5] * 256)
+		result = bytesfunc.histogram(self.data, out)
+		self.assertIs(result, out)
+		self.assertEqual(list(out), [x + 5 for x in histexpected(self.data)])
+
+		# Accumulate over several chunks.
+		out = array.array('Q', [0] * 256)
+		for x in range(0, TestLength, 65536):
+			bytesfunc.histogram(self.data[x:x + 65536], out=out)
+		self.assertEqual(list(out), histexpected(self.data))
+
+		result = bytesfunc.histogram(self.data, out=None)
+		self.assertEqual(list(result), histexpected(self.data))
+
+
+	########################################################
+	def test_histogram_threads_A6(self):
+		"""Test histogram divided between threads.
+		"""
+		for threads in (1, 2, 3, 4):
+			for step in (1, 5):
+				with self.subTest(msg='Failed with parameter', threads = threads, step = step):
+					result = bytesfunc.histogram(self.data, step=step, threads=threads)
+					self.assertEqual(list(result), histexpected(self.data[::step]))
+
+
+##############################################################################
+class histogram_errors(unittest.TestCase):
+	"""Test for invalid parameters.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()[:100]
+
+
+	########################################################
+	def test_histogram_invalidout_B1(self):
+		"""Test an output which is not an array('Q') of 256 counts.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram(self.data, array.array('Q', [0] * 255))
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram(self.data, array.array('q', [0] * 256))
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram(self.data, bytes(2048))
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram(self.data, [0] * 256)
+
+
+	########################################################
+	def test_histogram_outunchanged_B2(self):
+		"""Test that an invalid output is not changed.
+		"""
+		out = array.array('Q', [0] * 256)
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram([1, 2, 3], out)
+		self.assertEqual(list(out), [0] * 256)
+
+
+	########################################################
+	def test_histogram_invalidparams_B3(self):
+		"""Test invalid parameters.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram([1, 2, 3])
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram(5)
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram(self.data, step=0)
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram()
+
+
+	########################################################
+	def test_histogram_paramrange_B4(self):
+		"""Test integers which are out of range for a byte.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram(256)
+		with self.assertRaises(TypeError):
+			bytesfunc.histogram(-1)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('histogram\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
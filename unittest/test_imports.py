@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_imports.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for importing the package. The functions are
+imported the first time they are used, so each test is run in a new
+interpreter to ensure that nothing has been imported already.
+"""
+
+##############################################################################
+import sys
+
+import os
+import subprocess
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The functions which have the same name as the extension module they are in
+# when built as separate extension modules.
+SameNameFuncs = ('xor', 'and_', 'where', 'bsum', 'eq', 'findindex', 'histogram')
+
+# Import an extension module explicitly. These do not exist when the functions
+# are built as a single extension module.
+ImportSub = 'try:\n\timport bytesfunc.%s\nexcept ImportError:\n\tpass\n'
+
+
+########################################################
+def runpython(source):
+	"""Run the source code in a new interpreter which imports this same
+	copy of the package, and return the result.
+	"""
+	env = dict(os.environ)
+	packpath = os.path.dirname(os.path.dirname(os.path.abspath(bytesfunc.__file__)))
+	env['PYTHONPATH'] = os.pathsep.join([packpath] + [x for x in [env.get('PYTHONPATH')] if x])
+	return subprocess.run([sys.executable, '-c', source], env=env,
+		stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+
+##############################################################################
+class imports_general(unittest.TestCase):
+	"""Test importing functions and submodules.
+	"""
+
+	########################################################
+	def test_imports_submodule_A1(self):
+		"""Test that a function is still callable after the extension
+		module of the same name is imported explicitly.
+		"""
+		for funcname in SameNameFuncs:
+			with self.subTest(msg='Failed with parameter', funcname = funcname):
+				source = (ImportSub % funcname + 'import bytesfunc\n'
+					+ 'print(callable(bytesfunc.%s))\n' % funcname)
+				result = runpython(source)
+				self.assertEqual(result.returncode, 0, result.stderr)
+				self.assertEqual(result.stdout.strip(), 'True')
+
+
+	########################################################
+	def test_imports_submodule_A2(self):
+		"""Test calling a function after importing the extension module of
+		the same name, both before and after the function is first used.
+		"""
+		source = (ImportSub % 'xor' + 'import bytesfunc\n'
+			'data = bytearray(b"\\x0f\\xf0")\n'
+			'bytesfunc.xor(data, 0xff)\n'
+			'print(list(data))\n'
+			'bytesfunc.and__many\n'
+			+ ImportSub % 'and_' +
+			'data = bytearray(b"\\x0f\\xf0")\n'
+			'bytesfunc.and_(data, 0x3c)\n'
+			'print(list(data))\n')
+		result = runpython(source)
+		self.assertEqual(result.returncode, 0, result.stderr)
+		self.assertEqual(result.stdout.split(), ['[240,', '15]', '[12,', '48]'])
+
+
+	########################################################
+	def test_imports_fromimport_A3(self):
+		"""Test importing a function by name.
+		"""
+		source = ('from bytesfunc import xor, xor_many\n'
+			'print(callable(xor), callable(xor_many))\n')
+		result = runpython(source)
+		self.assertEqual(result.returncode, 0, result.stderr)
+		self.assertEqual(result.stdout.strip(), 'True True')
+
+
+	########################################################
+	def test_imports_starimport_A4(self):
+		"""Test importing every public name with "from bytesfunc import *".
+		"""
+		source = ('from bytesfunc import *\n'
+			'names = dict(globals())\n'
+			'print(sorted(x for x in names if not x.startswith("__")))\n'
+			'print(all(callable(names[x]) for x in names if not x.startswith("__") and x != "simdsupport"))\n')
+		result = runpython(source)
+		self.assertEqual(result.returncode, 0, result.stderr)
+		names, allcallable = result.stdout.strip().split('\n')
+		self.assertEqual(names, str(sorted(bytesfunc.__all__)))
+		self.assertEqual(allcallable, 'True')
+		self.assertIn('xor', bytesfunc.__all__)
+		self.assertIn('simdsupport', bytesfunc.__all__)
+		self.assertNotIn('sys', bytesfunc.__all__)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('imports\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
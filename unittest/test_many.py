@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_many.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for the _many functions, which apply the same
+operation to each sequence in a batch.
+"""
+
+##############################################################################
+import sys
+
+import array
+import os
+import subprocess
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The lengths of the sequences in the test batch. These include lengths
+# which are shorter than, equal to, and longer than the SIMD sizes.
+TestLengths = (1, 7, 16, 31, 64, 65, 200, 1000)
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a list of bytes objects.
+	"""
+	return [bytes([(x * 37 + 11 + y) % 256 for x in range(y)]) for y in TestLengths]
+
+
+##############################################################################
+class many_general(unittest.TestCase):
+	"""Test the batch functions.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_many_valout_A1(self):
+		"""Test bmax_many, bmin_many and bsum_many.
+		"""
+		for nosimd in (False, True):
+			with self.subTest(msg='Failed with parameter', nosimd = nosimd):
+				self.assertEqual(bytesfunc.bmax_many(self.data, nosimd=nosimd), [max(x) for x in self.data])
+				self.assertEqual(bytesfunc.bmin_many(self.data, nosimd=nosimd), [min(x) for x in self.data])
+				self.assertEqual(bytesfunc.bsum_many(self.data, nosimd=nosimd), [sum(x) for x in self.data])
+
+
+	########################################################
+	def test_many_allany_A2(self):
+		"""Test ball_many, bany_many and findindex_many.
+		"""
+		for op in ('==', '>', '>=', '<', '<=', '!='):
+			for param in (0, 11, 128, 255):
+				with self.subTest(msg='Failed with parameter', op = op, param = param):
+					self.assertEqual(bytesfunc.ball_many(op, self.data, param), [bytesfunc.ball(op, x, param) for x in self.data])
+					self.assertEqual(bytesfunc.bany_many(op, self.data, param), [bytesfunc.bany(op, x, param) for x in self.data])
+					self.assertEqual(bytesfunc.findindex_many(op, self.data, param), [bytesfunc.findindex(op, x, param) for x in self.data])
+
+
+	########################################################
+	def test_many_binops_A3(self):
+		"""Test the binary operators working in place.
+		"""
+		for funcname, op in (('and_', lambda x: x & 0x3c), ('or_', lambda x: x | 0x81), ('xor', lambda x: x ^ 0x55),
+					('lshift', lambda x: (x << 3) & 0xff), ('rshift', lambda x: x >> 2)):
+			with self.subTest(msg='Failed with parameter', funcname = funcname):
+				param = {'and_' : 0x3c, 'or_' : 0x81, 'xor' : 0x55, 'lshift' : 3, 'rshift' : 2}[funcname]
+				datax = [bytearray(x) for x in self.data]
+				result = getattr(bytesfunc, funcname + '_many')(datax, param)
+				self.assertIsNone(result)
+				self.assertEqual(datax, [bytearray([op(y) for y in x]) for x in self.data])
+
+
+	########################################################
+	def test_many_outtype_A4(self):
+		"""Test the binary operators creating new output sequences.
+		"""
+		for outtype in (bytes, bytearray):
+			with self.subTest(msg='Failed with parameter', outtype = outtype):
+				result = bytesfunc.xor_many(self.data, 0xff, outtype=outtype)
+				self.assertEqual(len(result), len(self.data))
+				for x in result:
+					self.assertIs(type(x), outtype)
+				self.assertEqual(result, [outtype([~y & 0xff for y in x]) for x in self.data])
+
+
+	########################################################
+	def test_many_paramseq_A5(self):
+		"""Test a parameter sequence applied to each sequence.
+		"""
+		key = bytes(range(3, 67))
+		data = [x[:64] for x in self.data if len(x) >= 64]
+		self.assertEqual(bytesfunc.xor_many(data, key, outtype=bytes), [bytes([y ^ k for y, k in zip(x, key)]) for x in data])
+
+		datax = [bytearray(x) for x in data]
+		bytesfunc.and__many(datax, key)
+		self.assertEqual(datax, [bytearray([y & k for y, k in zip(x, key)]) for x in data])
+
+
+	########################################################
+	def test_many_inputtypes_A6(self):
+		"""Test that the batch may be any iterable, and the sequences may be
+		any byte buffer.
+		"""
+		data = self.data[:3]
+		expected = [sum(x) for x in data]
+		self.assertEqual(bytesfunc.bsum_many(tuple(data)), expected)
+		self.assertEqual(bytesfunc.bsum_many(iter(data)), expected)
+		self.assertEqual(bytesfunc.bsum_many([memoryview(data[0]), bytearray(data[1]), array.array('B', data[2])]), expected)
+
+
+	########################################################
+	def test_many_empty_A7(self):
+		"""Test an empty batch.
+		"""
+		self.assertEqual(bytesfunc.bmax_many([]), [])
+		self.assertEqual(bytesfunc.bsum_many([]), [])
+		self.assertEqual(bytesfunc.findindex_many('==', [], 0), [])
+		self.assertIsNone(bytesfunc.xor_many([], 1))
+		self.assertEqual(bytesfunc.xor_many([], 1, outtype=bytes), [])
+
+
+	########################################################
+	def test_many_matherrors_A8(self):
+		"""Test that matherrors is accepted by bsum_many.
+		"""
+		self.assertEqual(bytesfunc.bsum_many(self.data, matherrors=True), [sum(x) for x in self.data])
+
+
+	########################################################
+	def test_many_importorder_A9(self):
+		"""Test that using a batch function first does not hide the function
+		with the same name as its module. This needs a new interpreter, as
+		the functions are imported the first time they are used.
+		"""
+		env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+		result = subprocess.run([sys.executable, '-c', 
+				'import bytesfunc; bytesfunc.xor_many; print(callable(bytesfunc.xor))'],
+				stdout=subprocess.PIPE, env=env, check=True)
+		self.assertEqual(result.stdout.strip(), b'True')
+
+
+##############################################################################
+class many_errors(unittest.TestCase):
+	"""Test the batch functions for errors.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_many_emptyseq_B1(self):
+		"""Test that an empty sequence in the batch is an error.
+		"""
+		with self.assertRaises(IndexError):
+			bytesfunc.bmax_many([b'abc', b''])
+		with self.assertRaises(IndexError):
+			bytesfunc.bsum_many([b''])
+		with self.assertRaises(IndexError):
+			bytesfunc.bany_many('==', [b'', b'a'], 0)
+
+
+	########################################################
+	def test_many_notbatch_B2(self):
+		"""Test that the batch must be an iterable of sequences.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.bsum_many(b'abc')
+		with self.assertRaises(TypeError):
+			bytesfunc.bsum_many(5)
+		with self.assertRaises(TypeError):
+			bytesfunc.bmax_many([b'abc', 5])
+		with self.assertRaises(TypeError):
+			bytesfunc.bmin_many([b'abc', 'abc'])
+
+
+	########################################################
+	def test_many_notmutable_B3(self):
+		"""Test that sequences changed in place must be writable.
+		"""
+		datax = bytearray(self.data[1])
+		with self.assertRaises(TypeError):
+			bytesfunc.xor_many([datax, self.data[1]], 1)
+
+
+	########################################################
+	def test_many_lengthmismatch_B4(self):
+		"""Test that a parameter sequence must be the same length as each
+		sequence.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.xor_many([bytearray(5), bytearray(6)], bytes(5))
+
+
+	########################################################
+	def test_many_badop_B5(self):
+		"""Test invalid operators and parameters.
+		"""
+		with self.assertRaises(ValueError):
+			bytesfunc.ball_many('!', self.data, 0)
+		with self.assertRaises(OverflowError):
+			bytesfunc.findindex_many('==', self.data, 256)
+		with self.assertRaises(TypeError):
+			bytesfunc.xor_many(self.data, 1, outtype=str)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('many\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_outtype.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for the outtype parameter, which returns the
+results of the binary operators and invert in a new sequence.
+"""
+
+##############################################################################
+import sys
+
+import array
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data.
+TestLength = 200
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a bytes object.
+	"""
+	return bytes([(x * 37 + 11) % 256 for x in range(TestLength)])
+
+
+##############################################################################
+class outtype_general(unittest.TestCase):
+	"""Test creating a new output sequence.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+		self.datay = self.data[::-1]
+
+
+	########################################################
+	def test_outtype_binops_A1(self):
+		"""Test the binary operators with each parameter pattern.
+		"""
+		for outtype in (bytes, bytearray):
+			with self.subTest(msg='Failed with parameter', outtype = outtype):
+				result = bytesfunc.and_(self.data, 0x0f, outtype=outtype)
+				self.assertIs(type(result), outtype)
+				self.assertEqual(result, outtype([x & 0x0f for x in self.data]))
+
+				result = bytesfunc.or_(0x81, self.data, outtype=outtype)
+				self.assertIs(type(result), outtype)
+				self.assertEqual(result, outtype([0x81 | x for x in self.data]))
+
+				result = bytesfunc.xor(self.data, self.datay, outtype=outtype)
+				self.assertIs(type(result), outtype)
+				self.assertEqual(result, outtype([x ^ y for x, y in zip(self.data, self.datay)]))
+
+
+	########################################################
+	def test_outtype_shifts_A2(self):
+		"""Test the shift operators.
+		"""
+		for outtype in (bytes, bytearray):
+			with self.subTest(msg='Failed with parameter', outtype = outtype):
+				self.assertEqual(bytesfunc.lshift(self.data, 3, outtype=outtype), outtype([(x << 3) & 0xff for x in self.data]))
+				self.assertEqual(bytesfunc.rshift(self.data, 2, outtype=outtype), outtype([x >> 2 for x in self.data]))
+
+
+	########################################################
+	def test_outtype_invert_A3(self):
+		"""Test invert.
+		"""
+		for outtype in (bytes, bytearray):
+			with self.subTest(msg='Failed with parameter', outtype = outtype):
+				result = bytesfunc.invert(self.data, outtype=outtype)
+				self.assertIs(type(result), outtype)
+				self.assertEqual(result, outtype([~x & 0xff for x in self.data]))
+
+
+	########################################################
+	def test_outtype_inputunchanged_A4(self):
+		"""Test that the input is not changed, and that read only inputs
+		may be used.
+		"""
+		datax = bytearray(self.data)
+		bytesfunc.xor(datax, 0xff, outtype=bytearray)
+		bytesfunc.invert(datax, outtype=bytes)
+		self.assertEqual(datax, bytearray(self.data))
+
+		with memoryview(self.data) as dataview:
+			self.assertEqual(bytesfunc.and_(dataview, 0x0f, outtype=bytes), bytes([x & 0x0f for x in self.data]))
+		self.assertEqual(bytesfunc.invert(array.array('B', self.data), outtype=bytes), bytes([~x & 0xff for x in self.data]))
+
+
+	########################################################
+	def test_outtype_window_A5(self):
+		"""Test that the new sequence has the length of the part of the
+		input which is used.
+		"""
+		self.assertEqual(bytesfunc.xor(self.data, 0x55, outtype=bytes, start=10, stop=30), bytes([x ^ 0x55 for x in self.data[10:30]]))
+		self.assertEqual(bytesfunc.invert(self.data, outtype=bytes, start=-5), bytes([~x & 0xff for x in self.data[-5:]]))
+		self.assertEqual(bytesfunc.and_(self.data, self.datay, outtype=bytes, maxlen=7), bytes([x & y for x, y in zip(self.data[:7], self.datay[:7])]))
+		self.assertEqual(bytesfunc.invert(self.data, outtype=bytearray, start=50, stop=50), bytearray())
+
+
+	########################################################
+	def test_outtype_none_A6(self):
+		"""Test that None gives the normal behaviour.
+		"""
+		datax = bytearray(self.data)
+		self.assertIsNone(bytesfunc.xor(datax, 0x55, outtype=None))
+		self.assertEqual(datax, bytearray([x ^ 0x55 for x in self.data]))
+
+
+	########################################################
+	def test_outtype_threads_A7(self):
+		"""Test a new output sequence with multiple threads.
+		"""
+		data = bytes(range(256)) * 1000
+		result = bytesfunc.or_(data, 0x80, outtype=bytes, threads=4)
+		self.assertEqual(result, bytes([x | 0x80 for x in data]))
+
+
+
+##############################################################################
+class outtype_errors(unittest.TestCase):
+	"""Test invalid use of outtype.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_outtype_invalid_B1(self):
+		"""Test that outtype must be bytes, bytearray, or None.
+		"""
+		for val in (str, 'bytes', array.array, 1):
+			with self.subTest(msg='Failed with parameter', val = val):
+				with self.assertRaises(TypeError):
+					bytesfunc.and_(self.data, 0x0f, outtype=val)
+				with self.assertRaises(TypeError):
+					bytesfunc.invert(self.data, outtype=val)
+
+
+	########################################################
+	def test_outtype_withoutput_B2(self):
+		"""Test that outtype cannot be combined with an output sequence.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.and_(self.data, 0x0f, bytearray(TestLength), outtype=bytes)
+		with self.assertRaises(TypeError):
+			bytesfunc.invert(self.data, bytearray(TestLength), outtype=bytearray)
+
+
+	########################################################
+	def test_outtype_lengthmismatch_B3(self):
+		"""Test that the input sequences must still be the same length.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.xor(self.data, self.data[:-1], outtype=bytes)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('outtype\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
@@ -2984,6 +2984,127 @@ class rshift_seqlen_param_errors_bytes(unittest.TestCase):
 
 
 
+##############################################################################
+class rshift_shift_count_bytes(unittest.TestCase):
+	"""Test rshift for shift counts over the full range of a byte.
+	shift_count_template
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		# Long enough to use SIMD, with left over elements at the end.
+		testdatasize = 300
+
+		xdata = list(itertools.islice(itertools.cycle([1, 0x81, 0xff, 0x5a, 0x3c]), testdatasize))
+		ydata = list(itertools.islice(itertools.cycle(range(256)), testdatasize))
+
+		self.data1 = bytes(xdata)
+		self.data2 = bytes(ydata)
+
+		self.counts = [0, 1, 7, 8, 9, 15, 16, 31, 32, 33, 127, 128, 200, 255]
+
+
+	########################################################
+	def pyshift(self, lop, rop):
+		"""Perform the shift in Python, truncated to a byte.
+		"""
+		return (lop >> rop) & 255
+
+
+	########################################################
+	def test_rshift_array_num_none_a1(self):
+		"""Test rshift as *array-num-none* for shift counts - Array code bytes.
+		"""
+		for nosimd in (False, True):
+			for testval in self.counts:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					datax = bytearray(self.data1)
+					expected = [self.pyshift(x, testval) for x in datax]
+
+					bytesfunc.rshift(datax, testval, nosimd=nosimd)
+
+					self.assertEqual(list(datax), expected)
+
+
+	########################################################
+	def test_rshift_array_num_array_b1(self):
+		"""Test rshift as *array-num-array* for shift counts - Array code bytes.
+		"""
+		for nosimd in (False, True):
+			for testval in self.counts:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					dataout = bytearray(len(self.data1))
+					expected = [self.pyshift(x, testval) for x in self.data1]
+
+					bytesfunc.rshift(self.data1, testval, dataout, nosimd=nosimd)
+
+					self.assertEqual(list(dataout), expected)
+
+
+	########################################################
+	def test_rshift_num_array_none_c1(self):
+		"""Test rshift as *num-array-none* for shift counts - Array code bytes.
+		"""
+		for nosimd in (False, True):
+			for testval in self.data1[:5]:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					datay = bytearray(self.data2)
+					expected = [self.pyshift(testval, y) for y in datay]
+
+					bytesfunc.rshift(testval, datay, nosimd=nosimd)
+
+					self.assertEqual(list(datay), expected)
+
+
+	########################################################
+	def test_rshift_num_array_array_d1(self):
+		"""Test rshift as *num-array-array* for shift counts - Array code bytes.
+		"""
+		for nosimd in (False, True):
+			for testval in self.data1[:5]:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					dataout = bytearray(len(self.data2))
+					expected = [self.pyshift(testval, y) for y in self.data2]
+
+					bytesfunc.rshift(testval, self.data2, dataout, nosimd=nosimd)
+
+					self.assertEqual(list(dataout), expected)
+
+
+	########################################################
+	def test_rshift_array_array_none_e1(self):
+		"""Test rshift as *array-array-none* for shift counts - Array code bytes.
+		"""
+		for nosimd in (False, True):
+			with self.subTest(msg='Failed with parameter', nosimd = nosimd):
+				datax = bytearray(self.data1)
+				expected = [self.pyshift(x, y) for x, y in zip(self.data1, self.data2)]
+
+				bytesfunc.rshift(datax, self.data2, nosimd=nosimd)
+
+				self.assertEqual(list(datax), expected)
+
+
+	########################################################
+	def test_rshift_array_array_array_f1(self):
+		"""Test rshift as *array-array-array* for shift counts - Array code bytes.
+		"""
+		for nosimd in (False, True):
+			with self.subTest(msg='Failed with parameter', nosimd = nosimd):
+				dataout = bytearray(len(self.data1))
+				expected = [self.pyshift(x, y) for x, y in zip(self.data1, self.data2)]
+
+				bytesfunc.rshift(self.data1, self.data2, dataout, nosimd=nosimd)
+
+				self.assertEqual(list(dataout), expected)
+
+
+##############################################################################
+
+
+
 ##############################################################################
 class rshift_param_errors_bytearray(unittest.TestCase):
 	"""Test rshift for invalid array and numeric parameters.
@@ -3734,6 +3855,127 @@ class rshift_seqlen_param_errors_bytearray(unittest.TestCase):
 
 
 
+##############################################################################
+class rshift_shift_count_bytearray(unittest.TestCase):
+	"""Test rshift for shift counts over the full range of a byte.
+	shift_count_template
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		# Long enough to use SIMD, with left over elements at the end.
+		testdatasize = 300
+
+		xdata = list(itertools.islice(itertools.cycle([1, 0x81, 0xff, 0x5a, 0x3c]), testdatasize))
+		ydata = list(itertools.islice(itertools.cycle(range(256)), testdatasize))
+
+		self.data1 = bytearray(xdata)
+		self.data2 = bytearray(ydata)
+
+		self.counts = [0, 1, 7, 8, 9, 15, 16, 31, 32, 33, 127, 128, 200, 255]
+
+
+	########################################################
+	def pyshift(self, lop, rop):
+		"""Perform the shift in Python, truncated to a byte.
+		"""
+		return (lop >> rop) & 255
+
+
+	########################################################
+	def test_rshift_array_num_none_a1(self):
+		"""Test rshift as *array-num-none* for shift counts - Array code bytearray.
+		"""
+		for nosimd in (False, True):
+			for testval in self.counts:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					datax = bytearray(self.data1)
+					expected = [self.pyshift(x, testval) for x in datax]
+
+					bytesfunc.rshift(datax, testval, nosimd=nosimd)
+
+					self.assertEqual(list(datax), expected)
+
+
+	########################################################
+	def test_rshift_array_num_array_b1(self):
+		"""Test rshift as *array-num-array* for shift counts - Array code bytearray.
+		"""
+		for nosimd in (False, True):
+			for testval in self.counts:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					dataout = bytearray(len(self.data1))
+					expected = [self.pyshift(x, testval) for x in self.data1]
+
+					bytesfunc.rshift(self.data1, testval, dataout, nosimd=nosimd)
+
+					self.assertEqual(list(dataout), expected)
+
+
+	########################################################
+	def test_rshift_num_array_none_c1(self):
+		"""Test rshift as *num-array-none* for shift counts - Array code bytearray.
+		"""
+		for nosimd in (False, True):
+			for testval in self.data1[:5]:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					datay = bytearray(self.data2)
+					expected = [self.pyshift(testval, y) for y in datay]
+
+					bytesfunc.rshift(testval, datay, nosimd=nosimd)
+
+					self.assertEqual(list(datay), expected)
+
+
+	########################################################
+	def test_rshift_num_array_array_d1(self):
+		"""Test rshift as *num-array-array* for shift counts - Array code bytearray.
+		"""
+		for nosimd in (False, True):
+			for testval in self.data1[:5]:
+				with self.subTest(msg='Failed with parameter', testval = testval, nosimd = nosimd):
+					dataout = bytearray(len(self.data2))
+					expected = [self.pyshift(testval, y) for y in self.data2]
+
+					bytesfunc.rshift(testval, self.data2, dataout, nosimd=nosimd)
+
+					self.assertEqual(list(dataout), expected)
+
+
+	########################################################
+	def test_rshift_array_array_none_e1(self):
+		"""Test rshift as *array-array-none* for shift counts - Array code bytearray.
+		"""
+		for nosimd in (False, True):
+			with self.subTest(msg='Failed with parameter', nosimd = nosimd):
+				datax = bytearray(self.data1)
+				expected = [self.pyshift(x, y) for x, y in zip(self.data1, self.data2)]
+
+				bytesfunc.rshift(datax, self.data2, nosimd=nosimd)
+
+				self.assertEqual(list(datax), expected)
+
+
+	########################################################
+	def test_rshift_array_array_array_f1(self):
+		"""Test rshift as *array-array-array* for shift counts - Array code bytearray.
+		"""
+		for nosimd in (False, True):
+			with self.subTest(msg='Failed with parameter', nosimd = nosimd):
+				dataout = bytearray(len(self.data1))
+				expected = [self.pyshift(x, y) for x, y in zip(self.data1, self.data2)]
+
+				bytesfunc.rshift(self.data1, self.data2, dataout, nosimd=nosimd)
+
+				self.assertEqual(list(dataout), expected)
+
+
+##############################################################################
+
+
+
 ##############################################################################
 class rshift_seq_immutable_param_errors(unittest.TestCase):
 	"""Test rshift for immutable output sequence.
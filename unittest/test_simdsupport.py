@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_simdsupport.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for simdsupport. These check that the SIMD
+versions of the functions are actually in use on platforms and compilers
+which support them, and that the SIMD versions selected for this CPU give
+the same results as the non-SIMD versions.
+"""
+
+##############################################################################
+import sys
+
+import platform
+import unittest
+
+import bytesfunc
+import bytesfunc.simdsupport
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The names which platform.machine() uses for each SIMD architecture.
+SIMDArchNames = {
+	'x86_64' : 'x86_64',
+	'amd64' : 'x86_64',
+	'armv7l' : 'armv7l',
+	'aarch64' : 'aarch64',
+	'arm64' : 'aarch64',
+}
+
+# The SIMD levels which may be selected for each SIMD architecture.
+SIMDLevels = {
+	'x86_64' : ('sse2', 'avx2', 'avx512bw'),
+	'armv7l' : ('neon', 'none'),
+	'aarch64' : ('neon',),
+}
+
+# The array lengths to test. These cover the lengths either side of each
+# SIMD width, so that the left over elements at the end are tested too.
+TestLengths = list(range(1, 300)) + [1023, 1024, 1025, 4096 + 63]
+
+
+########################################################
+def expectedarch():
+	"""Return the SIMD architecture which the library should have been
+	compiled with on this platform, or 'none' if SIMD is not expected.
+	SIMD is used with GCC and Clang, but not with other compilers.
+	"""
+	compiler = platform.python_compiler()
+	if ('GCC' not in compiler) and ('Clang' not in compiler):
+		return 'none'
+
+	return SIMDArchNames.get(platform.machine().lower(), 'none')
+
+
+########################################################
+def cpuflags():
+	"""Return the set of CPU feature flags reported by Linux, or None if
+	they are not available on this platform.
+	"""
+	try:
+		with open('/proc/cpuinfo') as cpuf:
+			cpuinfo = cpuf.read()
+	except OSError:
+		return None
+
+	flaglines = [x for x in cpuinfo.split('\n') if x.startswith('flags')]
+	if len(flaglines) == 0:
+		return None
+
+	return set(flaglines[0].split(':')[1].split())
+
+
+##############################################################################
+class simdsupport_general(unittest.TestCase):
+	"""Test that SIMD is in use where it is expected.
+	"""
+
+	########################################################
+	def test_simdsupport_attributes_A1(self):
+		"""Test the simdsupport attribute types.
+		"""
+		self.assertIsInstance(bytesfunc.simdsupport.hassimd, bool)
+		self.assertIsInstance(bytesfunc.simdsupport.simdarch, str)
+		self.assertIsInstance(bytesfunc.simdsupport.simdlevel, str)
+
+
+	########################################################
+	def test_simdsupport_active_A2(self):
+		"""Test that SIMD is compiled in on platforms and compilers which
+		support it, and not in use otherwise. 
+		"""
+		arch = expectedarch()
+
+		# ARMv7 depends on whether the CPU has NEON.
+		if arch not in ('none', 'armv7l'):
+			self.assertTrue(bytesfunc.simdsupport.hassimd)
+
+		if bytesfunc.simdsupport.hassimd:
+			self.assertEqual(bytesfunc.simdsupport.simdarch, arch)
+			self.assertIn(bytesfunc.simdsupport.simdlevel, SIMDLevels[arch])
+		else:
+			self.assertEqual(bytesfunc.simdsupport.simdarch, 'none')
+			self.assertEqual(bytesfunc.simdsupport.simdlevel, 'none')
+
+
+	########################################################
+	def test_simdsupport_x86level_A3(self):
+		"""Test that the best x86 SIMD level supported by the CPU is selected.
+		This is checked only on x86-64 where the CPU flags are available.
+		"""
+		flags = cpuflags()
+
+		if (bytesfunc.simdsupport.simdarch == 'x86_64') and (flags is not None):
+			if 'avx512bw' in flags:
+				expected = 'avx512bw'
+			elif 'avx2' in flags:
+				expected = 'avx2'
+			else:
+				expected = 'sse2'
+
+			self.assertEqual(bytesfunc.simdsupport.simdlevel, expected)
+
+
+
+##############################################################################
+class simdsupport_results(unittest.TestCase):
+	"""Test that the SIMD versions selected for this CPU give the same
+	results as the non-SIMD versions, for a range of array lengths.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = {x : bytes([(y * 37 + 11) % 256 for y in range(x)]) for x in TestLengths}
+
+
+	########################################################
+	def test_simdsupport_binops_B1(self):
+		"""Test the binary operators with and without SIMD.
+		"""
+		for funcname in ('and_', 'or_', 'xor', 'lshift', 'rshift'):
+			func = getattr(bytesfunc, funcname)
+			for arraylen, data in self.data.items():
+				with self.subTest(msg='Failed with parameter', funcname = funcname, arraylen = arraylen):
+					simdout = bytearray(arraylen)
+					nosimdout = bytearray(arraylen)
+					func(data, 3, simdout)
+					func(data, 3, nosimdout, nosimd=True)
+					self.assertEqual(simdout, nosimdout)
+
+
+	########################################################
+	def test_simdsupport_invert_B2(self):
+		"""Test invert with and without SIMD.
+		"""
+		for arraylen, data in self.data.items():
+			with self.subTest(msg='Failed with parameter', arraylen = arraylen):
+				simdout = bytearray(arraylen)
+				nosimdout = bytearray(arraylen)
+				bytesfunc.invert(data, simdout)
+				bytesfunc.invert(data, nosimdout, nosimd=True)
+				self.assertEqual(simdout, nosimdout)
+
+
+	########################################################
+	def test_simdsupport_findindex_B3(self):
+		"""Test findindex with a match at the end of the array, with and
+		without SIMD.
+		"""
+		for arraylen in TestLengths:
+			data = bytes(arraylen - 1) + b'\x01'
+			with self.subTest(msg='Failed with parameter', arraylen = arraylen):
+				self.assertEqual(bytesfunc.findindex('==', data, 1), arraylen - 1)
+				self.assertEqual(bytesfunc.findindex('==', data, 1, nosimd=True), arraylen - 1)
+
+
+	########################################################
+	def test_simdsupport_allany_B4(self):
+		"""Test ball and bany with and without SIMD.
+		"""
+		for funcname in ('ball', 'bany'):
+			func = getattr(bytesfunc, funcname)
+			for arraylen, data in self.data.items():
+				for opstr in ('==', '>', '>=', '<', '<=', '!='):
+					with self.subTest(msg='Failed with parameter', funcname = funcname, arraylen = arraylen, opstr = opstr):
+						self.assertEqual(func(opstr, data, data[-1]), func(opstr, data, data[-1], nosimd=True))
+
+
+	########################################################
+	def test_simdsupport_maxmin_B5(self):
+		"""Test bmax and bmin with and without SIMD.
+		"""
+		for arraylen, data in self.data.items():
+			with self.subTest(msg='Failed with parameter', arraylen = arraylen):
+				self.assertEqual(bytesfunc.bmax(data), max(data))
+				self.assertEqual(bytesfunc.bmax(data, nosimd=True), max(data))
+				self.assertEqual(bytesfunc.bmin(data), min(data))
+				self.assertEqual(bytesfunc.bmin(data, nosimd=True), min(data))
+
+
+	########################################################
+	def test_simdsupport_comp_B6(self):
+		"""Test the comparison functions with and without SIMD.
+		"""
+		for funcname in ('eq', 'ne', 'gt', 'ge', 'lt', 'le'):
+			func = getattr(bytesfunc, funcname)
+			for arraylen, data in self.data.items():
+				with self.subTest(msg='Failed with parameter', funcname = funcname, arraylen = arraylen):
+					self.assertEqual(func(data, data), func(data, data, nosimd=True))
+					self.assertEqual(func(data, data[0]), func(data, data[0], nosimd=True))
+
+
+##############################################################################
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('simdsupport\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_step.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for the step parameter, which allows the
+functions to use only every step'th element of each sequence.
+"""
+
+##############################################################################
+import sys
+
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data. This is long enough to use SIMD, and is not
+# an even multiple of the SIMD size.
+TestLength = 1000
+
+# The steps to test. These include the steps which have SIMD versions and
+# some which do not.
+TestSteps = [1, 2, 3, 4, 5, 6, 7, 8, 12, 16, 17, 33, 999, 5000]
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a bytes object.
+	"""
+	return bytes([(x * 37 + 11) % 256 for x in range(TestLength)])
+
+
+##############################################################################
+class step_general(unittest.TestCase):
+	"""Test each function family with a step.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_step_reductions_A1(self):
+		"""Test the reductions with a step.
+		"""
+		for step in TestSteps:
+			for nosimd in (False, True):
+				with self.subTest(msg='Failed with parameter', step = step, nosimd = nosimd):
+					expected = self.data[::step]
+					self.assertEqual(bytesfunc.bmax(self.data, step=step, nosimd=nosimd), max(expected))
+					self.assertEqual(bytesfunc.bmin(self.data, step=step, nosimd=nosimd), min(expected))
+					self.assertEqual(bytesfunc.bsum(self.data, step=step, nosimd=nosimd), sum(expected))
+
+
+	########################################################
+	def test_step_interleaved_A2(self):
+		"""Test each channel of interleaved data. Only the elements of the
+		selected channel should affect the result.
+		"""
+		for step in (2, 3, 4, 8):
+			for channel in range(step):
+				with self.subTest(msg='Failed with parameter', step = step, channel = channel):
+					data = bytearray(TestLength)
+					data[channel::step] = bytes([100] * len(data[channel::step]))
+					data[channel::step * 7] = bytes([200] * len(data[channel::step * 7]))
+					self.assertEqual(bytesfunc.bmin(data, start=channel, step=step), 100)
+					self.assertEqual(bytesfunc.bmax(data, start=channel, step=step), 200)
+					self.assertEqual(bytesfunc.bsum(data, start=channel, step=step), sum(data[channel::step]))
+					self.assertTrue(bytesfunc.ball('>=', data, 100, start=channel, step=step))
+					self.assertTrue(bytesfunc.ge(data, 100, start=channel, step=step))
+
+
+	########################################################
+	def test_step_findindex_A3(self):
+		"""Test that findindex returns an index in the whole sequence.
+		"""
+		for step in TestSteps:
+			for nosimd in (False, True):
+				with self.subTest(msg='Failed with parameter', step = step, nosimd = nosimd):
+					sliced = self.data[5::step]
+					for val in (sliced[0], sliced[-1]):
+						self.assertEqual(bytesfunc.findindex('==', self.data, val, start=5, step=step, nosimd=nosimd), 5 + sliced.index(val) * step)
+
+		# Matches which are not on a step are ignored.
+		data = bytearray(TestLength)
+		data[301] = 1
+		self.assertEqual(bytesfunc.findindex('==', data, 1, step=2), -1)
+		self.assertEqual(bytesfunc.findindex('==', data, 1, start=1, step=2), 301)
+		self.assertEqual(bytesfunc.findindex('!=', data, 0, step=3), -1)
+		self.assertEqual(bytesfunc.findindex('>', data, 0, step=7), 301)
+
+
+	########################################################
+	def test_step_allany_A4(self):
+		"""Test ball and bany with a step.
+		"""
+		ops = (('==', lambda x, y: x == y), ('>', lambda x, y: x > y), ('>=', lambda x, y: x >= y), 
+				('<', lambda x, y: x < y), ('<=', lambda x, y: x <= y), ('!=', lambda x, y: x != y))
+
+		for step in TestSteps:
+			for opstr, opfunc in ops:
+				with self.subTest(msg='Failed with parameter', step = step, opstr = opstr):
+					sliced = self.data[::step]
+					for param in (0, 11, 128, 255):
+						self.assertEqual(bytesfunc.ball(opstr, self.data, param, step=step), all([opfunc(x, param) for x in sliced]))
+						self.assertEqual(bytesfunc.bany(opstr, self.data, param, step=step), any([opfunc(x, param) for x in sliced]))
+
+
+	########################################################
+	def test_step_comp_A5(self):
+		"""Test the comparison functions with a step.
+		"""
+		datay = bytearray(self.data)
+		datay[1::2] = bytes(len(datay[1::2]))
+
+		for nosimd in (False, True):
+			with self.subTest(msg='Failed with parameter', nosimd = nosimd):
+				self.assertFalse(bytesfunc.eq(self.data, datay, nosimd=nosimd))
+				self.assertTrue(bytesfunc.eq(self.data, datay, step=2, nosimd=nosimd))
+				self.assertFalse(bytesfunc.eq(self.data, datay, step=3, nosimd=nosimd))
+				self.assertTrue(bytesfunc.ge(self.data, datay, step=3, nosimd=nosimd))
+				self.assertFalse(bytesfunc.lt(datay, self.data, step=2, nosimd=nosimd))
+
+				# The parameter before and after the sequence.
+				self.assertTrue(bytesfunc.eq(datay, 0, start=1, step=2, nosimd=nosimd))
+				self.assertTrue(bytesfunc.le(0, datay, step=5, nosimd=nosimd))
+				self.assertTrue(bytesfunc.gt(1, datay, start=1, step=2, nosimd=nosimd))
+				self.assertFalse(bytesfunc.gt(datay, 0, start=1, step=2, nosimd=nosimd))
+				self.assertTrue(bytesfunc.ne(datay, 0, step=TestLength, nosimd=nosimd))
+
+
+	########################################################
+	def test_step_window_A6(self):
+		"""Test a step together with start, stop, and maxlen.
+		"""
+		self.assertEqual(bytesfunc.bsum(self.data, start=10, stop=500, step=3), sum(self.data[10:500:3]))
+		self.assertEqual(bytesfunc.bmax(self.data, start=-100, step=4), max(self.data[-100::4]))
+		self.assertEqual(bytesfunc.bsum(self.data, start=10, maxlen=100, step=6), sum(self.data[10:110:6]))
+
+
+	########################################################
+	def test_step_threads_A7(self):
+		"""Test a step with multiple threads.
+		"""
+		data = bytearray(300001)
+		data[200000] = 5
+		data[200001] = 7
+		for step in (2, 3, 4, 7, 65537):
+			with self.subTest(msg='Failed with parameter', step = step):
+				sliced = data[::step]
+				expected = sliced.index(max(sliced)) * step if max(sliced) else -1
+				self.assertEqual(bytesfunc.findindex('>', data, 0, step=step, threads=4), expected)
+				self.assertEqual(bytesfunc.bsum(data, step=step, threads=3), sum(sliced))
+				self.assertEqual(bytesfunc.bmax(data, step=step, threads=4), max(sliced))
+				self.assertEqual(bytesfunc.ball('==', data, 0, step=step, threads=2), not any(sliced))
+
+
+
+##############################################################################
+class step_errors(unittest.TestCase):
+	"""Test invalid steps.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_step_invalid_B1(self):
+		"""Test that the step must be a positive integer.
+		"""
+		for val in (0, -1, -2, 'x', 1.5, b'1'):
+			with self.subTest(msg='Failed with parameter', val = val):
+				with self.assertRaises(TypeError):
+					bytesfunc.bmax(self.data, step=val)
+				with self.assertRaises(TypeError):
+					bytesfunc.bsum(self.data, step=val)
+				with self.assertRaises(TypeError):
+					bytesfunc.eq(self.data, self.data, step=val)
+				with self.assertRaises(TypeError):
+					bytesfunc.findindex('==', self.data, 1, step=val)
+
+
+	########################################################
+	def test_step_positional_B2(self):
+		"""Test that step is keyword only.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.bmin(self.data, 0, False, 0, 0, 1, 2)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('step\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
@@ -0,0 +1,664 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_threads.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.4
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for calling functions from multiple threads.
+The GIL is released for long sequences, so these test that results
+remain correct when several threads are operating at the same time.
+This also tests dividing a calculation between threads using the
+'threads' parameter.
+"""
+
+##############################################################################
+import sys
+
+import itertools
+import operator
+import os
+import threading
+import time
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The number of threads to run at once.
+ThreadCount = 4
+
+# This must be longer than the length at which the GIL is released.
+ArrayLength = 200003
+
+# The length used to test that the GIL is released. This is much longer
+# than the length at which the GIL is released so that another thread has
+# time to see a call in progress.
+GILTestLength = 64 * 1024 * 1024
+
+
+##############################################################################
+class threads_general(unittest.TestCase):
+	"""Test functions called from multiple threads at the same time.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = [bytes(itertools.islice(itertools.cycle(range(x, 200 + x)), ArrayLength)) for x in range(ThreadCount)]
+
+
+	########################################################
+	def RunThreads(self, func):
+		"""Call func once per thread with the index of the thread and
+		return the list of results.
+		"""
+		results = [None] * ThreadCount
+		startbarrier = threading.Barrier(ThreadCount)
+
+		def worker(index):
+			startbarrier.wait()
+			results[index] = func(index)
+
+		threads = [threading.Thread(target = worker, args = (x,)) for x in range(ThreadCount)]
+		for t in threads:
+			t.start()
+		for t in threads:
+			t.join()
+
+		return results
+
+
+	########################################################
+	def test_threads_xor_A1(self):
+		"""Test xor from multiple threads.
+		"""
+		expected = [bytes([x ^ 85 for x in y]) for y in self.data]
+		dataout = [bytearray(ArrayLength) for x in range(ThreadCount)]
+
+		self.RunThreads(lambda i: bytesfunc.xor(self.data[i], 85, dataout[i]))
+
+		for result, expect in zip(dataout, expected):
+			self.assertEqual(result, expect)
+
+
+	########################################################
+	def test_threads_invert_A2(self):
+		"""Test invert from multiple threads.
+		"""
+		expected = [bytes([~x & 0xff for x in y]) for y in self.data]
+		dataout = [bytearray(ArrayLength) for x in range(ThreadCount)]
+
+		self.RunThreads(lambda i: bytesfunc.invert(self.data[i], dataout[i]))
+
+		for result, expect in zip(dataout, expected):
+			self.assertEqual(result, expect)
+
+
+	########################################################
+	def test_threads_eq_A3(self):
+		"""Test eq from multiple threads.
+		"""
+		results = self.RunThreads(lambda i: bytesfunc.eq(self.data[i], self.data[i]))
+
+		self.assertEqual(results, [True] * ThreadCount)
+
+
+	########################################################
+	def test_threads_findindex_A4(self):
+		"""Test findindex from multiple threads.
+		"""
+		expected = [y.index(200 + x - 1) for x, y in enumerate(self.data)]
+
+		results = self.RunThreads(lambda i: bytesfunc.findindex('==', self.data[i], 200 + i - 1))
+
+		self.assertEqual(results, expected)
+
+
+	########################################################
+	def test_threads_bmax_A5(self):
+		"""Test bmax from multiple threads.
+		"""
+		expected = [max(x) for x in self.data]
+
+		results = self.RunThreads(lambda i: bytesfunc.bmax(self.data[i]))
+
+		self.assertEqual(results, expected)
+
+
+	########################################################
+	def test_threads_bsum_A6(self):
+		"""Test bsum from multiple threads.
+		"""
+		expected = [sum(x) for x in self.data]
+
+		results = self.RunThreads(lambda i: bytesfunc.bsum(self.data[i]))
+
+		self.assertEqual(results, expected)
+
+
+##############################################################################
+class threads_binops(unittest.TestCase):
+	"""Test binary operators with the calculation divided between threads.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data1 = bytes(itertools.islice(itertools.cycle(range(256)), ArrayLength * 4))
+		self.data2 = bytes(itertools.islice(itertools.cycle(range(255, -1, -3)), ArrayLength * 4))
+		self.defaultthreads = bytesfunc.getthreads()
+
+
+	########################################################
+	def tearDown(self):
+		"""Restore the default.
+		"""
+		bytesfunc.setthreads(self.defaultthreads)
+
+
+	########################################################
+	def CheckOp(self, func, pyop, threads):
+		"""Check each parameter format for one function.
+		"""
+		# sequence, param.
+		expected = bytes([pyop(x, 5) & 0xff for x in self.data1])
+		data = bytearray(self.data1)
+		func(data, 5, threads=threads)
+		self.assertEqual(data, expected)
+
+		dataout = bytearray(len(self.data1))
+		func(self.data1, 5, dataout, threads=threads)
+		self.assertEqual(dataout, expected)
+
+		# The second sequence is limited to valid shift values.
+		data2 = bytes([x & 0x07 for x in self.data2])
+
+		# param, sequence.
+		expected = bytes([pyop(5, x) & 0xff for x in data2])
+		data = bytearray(data2)
+		func(5, data, threads=threads)
+		self.assertEqual(data, expected)
+
+		dataout = bytearray(len(data2))
+		func(5, data2, dataout, threads=threads)
+		self.assertEqual(dataout, expected)
+
+		# sequence, sequence.
+		expected = bytes([pyop(x, y) & 0xff for x, y in zip(self.data1, data2)])
+		data = bytearray(self.data1)
+		func(data, data2, threads=threads)
+		self.assertEqual(data, expected)
+
+		dataout = bytearray(len(self.data1))
+		func(self.data1, data2, dataout, threads=threads)
+		self.assertEqual(dataout, expected)
+
+
+	########################################################
+	def test_threads_binops_and_B1(self):
+		"""Test and_ with threads.
+		"""
+		for threads in (2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				self.CheckOp(bytesfunc.and_, operator.and_, threads)
+
+
+	########################################################
+	def test_threads_binops_or_B2(self):
+		"""Test or_ with threads.
+		"""
+		for threads in (2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				self.CheckOp(bytesfunc.or_, operator.or_, threads)
+
+
+	########################################################
+	def test_threads_binops_xor_B3(self):
+		"""Test xor with threads.
+		"""
+		for threads in (2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				self.CheckOp(bytesfunc.xor, operator.xor, threads)
+
+
+	########################################################
+	def test_threads_binops_lshift_B4(self):
+		"""Test lshift with threads.
+		"""
+		for threads in (2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				self.CheckOp(bytesfunc.lshift, operator.lshift, threads)
+
+
+	########################################################
+	def test_threads_binops_rshift_B5(self):
+		"""Test rshift with threads.
+		"""
+		for threads in (2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				self.CheckOp(bytesfunc.rshift, operator.rshift, threads)
+
+
+	########################################################
+	def test_threads_binops_default_B6(self):
+		"""Test the default number of threads.
+		"""
+		bytesfunc.setthreads(4)
+		self.assertEqual(bytesfunc.getthreads(), 4)
+
+		expected = bytes([x ^ 85 for x in self.data1])
+		dataout = bytearray(len(self.data1))
+		bytesfunc.xor(self.data1, 85, dataout)
+		self.assertEqual(dataout, expected)
+
+
+	########################################################
+	def test_threads_binops_short_B7(self):
+		"""Test a sequence which is too short to divide between threads.
+		"""
+		expected = bytes([x ^ 85 for x in self.data1[:1000]])
+		dataout = bytearray(1000)
+		bytesfunc.xor(self.data1[:1000], 85, dataout, threads=4)
+		self.assertEqual(dataout, expected)
+
+
+	########################################################
+	def test_threads_binops_maxlen_B8(self):
+		"""Test threads with maxlen.
+		"""
+		maxlen = len(self.data1) - 12345
+		expected = bytes([x ^ 85 for x in self.data1[:maxlen]]) + bytes(12345)
+		dataout = bytearray(len(self.data1))
+		bytesfunc.xor(self.data1, 85, dataout, maxlen=maxlen, threads=4)
+		self.assertEqual(dataout, expected)
+
+
+##############################################################################
+class threads_reductions(unittest.TestCase):
+	"""Test bsum, bmax and bmin with the calculation divided between threads.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = bytes(itertools.islice(itertools.cycle(range(10, 240)), ArrayLength * 4))
+
+
+	########################################################
+	def test_threads_reductions_bsum_D1(self):
+		"""Test bsum with threads.
+		"""
+		expected = sum(self.data)
+		for threads in (2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				self.assertEqual(bytesfunc.bsum(self.data, threads=threads), expected)
+				self.assertEqual(bytesfunc.bsum(self.data, matherrors=True, threads=threads), expected)
+
+
+	########################################################
+	def test_threads_reductions_bsum_maxlen_D2(self):
+		"""Test bsum with threads and maxlen.
+		"""
+		maxlen = len(self.data) - 12345
+		expected = sum(self.data[:maxlen])
+		result = bytesfunc.bsum(self.data, maxlen=maxlen, threads=4)
+		self.assertEqual(result, expected)
+
+
+	########################################################
+	def test_threads_reductions_bmax_D3(self):
+		"""Test bmax with threads, with the maximum in different parts.
+		"""
+		for pos in (0, len(self.data) // 2, len(self.data) - 1):
+			data = bytearray(self.data)
+			data[pos] = 255
+			for threads in (2, 3, 4):
+				with self.subTest(msg='Failed with parameter', threads = threads, pos = pos):
+					self.assertEqual(bytesfunc.bmax(data, threads=threads), 255)
+
+
+	########################################################
+	def test_threads_reductions_bmin_D4(self):
+		"""Test bmin with threads, with the minimum in different parts.
+		"""
+		for pos in (0, len(self.data) // 2, len(self.data) - 1):
+			data = bytearray(self.data)
+			data[pos] = 1
+			for threads in (2, 3, 4):
+				with self.subTest(msg='Failed with parameter', threads = threads, pos = pos):
+					self.assertEqual(bytesfunc.bmin(data, threads=threads), 1)
+
+
+	########################################################
+	def test_threads_reductions_errors_D5(self):
+		"""Test invalid threads values.
+		"""
+		for func in (bytesfunc.bsum, bytesfunc.bmax, bytesfunc.bmin):
+			with self.subTest(msg='Failed with parameter', func = func):
+				with self.assertRaises(ValueError):
+					func(self.data, threads=-1)
+
+
+##############################################################################
+class threads_search(unittest.TestCase):
+	"""Test findindex, bany and ball with the search divided between threads.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = bytes([5]) * (ArrayLength * 4)
+		# Positions at the start, end, and on and around block boundaries.
+		self.positions = [0, 100, 65535, 65536, 65537, ArrayLength * 2, len(self.data) - 1]
+
+
+	########################################################
+	def test_threads_search_findindex_E1(self):
+		"""Test findindex with threads, with a single match.
+		"""
+		for pos in self.positions:
+			data = bytearray(self.data)
+			data[pos] = 9
+			for threads in (2, 3, 4):
+				with self.subTest(msg='Failed with parameter', threads = threads, pos = pos):
+					self.assertEqual(bytesfunc.findindex('==', data, 9, threads=threads), pos)
+					self.assertEqual(bytesfunc.findindex('>', data, 5, threads=threads), pos)
+
+
+	########################################################
+	def test_threads_search_findindex_E2(self):
+		"""Test findindex with threads, with several matches in different parts.
+		"""
+		data = bytearray(self.data)
+		for pos in (ArrayLength * 3, ArrayLength, 70000, len(data) - 1):
+			data[pos] = 9
+
+		for threads in (2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				self.assertEqual(bytesfunc.findindex('==', data, 9, threads=threads), 70000)
+
+
+	########################################################
+	def test_threads_search_findindex_E3(self):
+		"""Test findindex with threads, with no match.
+		"""
+		for threads in (2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				self.assertEqual(bytesfunc.findindex('==', self.data, 9, threads=threads), -1)
+
+
+	########################################################
+	def test_threads_search_findindex_E4(self):
+		"""Test findindex with threads, with the only match excluded by maxlen.
+		"""
+		data = bytearray(self.data)
+		data[-1] = 9
+		result = bytesfunc.findindex('==', data, 9, maxlen=len(data) - 1, threads=4)
+		self.assertEqual(result, -1)
+
+
+	########################################################
+	def test_threads_search_bany_E5(self):
+		"""Test bany with threads.
+		"""
+		for threads in (2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				self.assertFalse(bytesfunc.bany('==', self.data, 9, threads=threads))
+
+		for pos in self.positions:
+			data = bytearray(self.data)
+			data[pos] = 9
+			for threads in (2, 3, 4):
+				with self.subTest(msg='Failed with parameter', threads = threads, pos = pos):
+					self.assertTrue(bytesfunc.bany('==', data, 9, threads=threads))
+
+
+	########################################################
+	def test_threads_search_ball_E6(self):
+		"""Test ball with threads.
+		"""
+		for threads in (2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				self.assertTrue(bytesfunc.ball('==', self.data, 5, threads=threads))
+
+		for pos in self.positions:
+			data = bytearray(self.data)
+			data[pos] = 9
+			for threads in (2, 3, 4):
+				with self.subTest(msg='Failed with parameter', threads = threads, pos = pos):
+					self.assertFalse(bytesfunc.ball('==', data, 5, threads=threads))
+					self.assertTrue(bytesfunc.ball('<=', data, 9, threads=threads))
+
+
+	########################################################
+	def test_threads_search_errors_E7(self):
+		"""Test invalid threads values.
+		"""
+		for func in (bytesfunc.findindex, bytesfunc.bany, bytesfunc.ball):
+			with self.subTest(msg='Failed with parameter', func = func):
+				with self.assertRaises(ValueError):
+					func('==', self.data, 5, threads=-1)
+
+
+##############################################################################
+class threads_param_errors(unittest.TestCase):
+	"""Test for invalid thread parameters.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = bytearray(range(256))
+
+
+	########################################################
+	def test_threads_param_errors_C1(self):
+		"""Test negative threads - Invalid value.
+		"""
+		with self.assertRaises(ValueError):
+			bytesfunc.xor(self.data, 5, threads=-1)
+
+
+	########################################################
+	def test_threads_param_errors_C2(self):
+		"""Test too many threads - Invalid value.
+		"""
+		with self.assertRaises(ValueError):
+			bytesfunc.xor(self.data, 5, threads=65)
+
+
+	########################################################
+	def test_threads_param_errors_C3(self):
+		"""Test non-integer threads - Invalid type.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.xor(self.data, 5, threads='a')
+
+
+	########################################################
+	def test_threads_param_errors_C4(self):
+		"""Test setthreads with invalid values.
+		"""
+		with self.assertRaises(ValueError):
+			bytesfunc.setthreads(0)
+
+		with self.assertRaises(ValueError):
+			bytesfunc.setthreads(65)
+
+		with self.assertRaises(TypeError):
+			bytesfunc.setthreads('a')
+
+
+##############################################################################
+class threads_fork(unittest.TestCase):
+	"""Test the worker threads in a child process created with fork.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = bytes(itertools.islice(itertools.cycle(range(256)), ArrayLength * 4))
+
+
+	########################################################
+	@unittest.skipUnless(hasattr(os, 'fork'), 'fork is not available')
+	def test_threads_fork_F1(self):
+		"""Test a calculation divided between threads in a child process, 
+		after the parent has already started the worker threads.
+		"""
+		expected = sum(self.data)
+		self.assertEqual(bytesfunc.bsum(self.data, threads=4), expected)
+
+		pid = os.fork()
+		if pid == 0:
+			try:
+				result = bytesfunc.bsum(self.data, threads=4)
+				os._exit(0 if result == expected else 1)
+			finally:
+				os._exit(2)
+
+		# Wait for the child, but do not wait forever if it hangs.
+		deadline = time.monotonic() + 60.0
+		while True:
+			waitpid, status = os.waitpid(pid, os.WNOHANG)
+			if waitpid != 0:
+				break
+			if time.monotonic() > deadline:
+				os.kill(pid, 9)
+				os.waitpid(pid, 0)
+				self.fail('The child process did not finish.')
+			time.sleep(0.01)
+
+		self.assertTrue(os.WIFEXITED(status))
+		self.assertEqual(os.WEXITSTATUS(status), 0)
+
+
+##############################################################################
+class threads_gilrelease(unittest.TestCase):
+	"""Test that a Python thread can run while a long calculation is in
+	progress in another thread.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		# Every output byte is changed from zero by each function, so the 
+		# output shows how far the calculation has progressed.
+		self.data = bytes(GILTestLength)
+
+
+	########################################################
+	def ProgressDuringCall(self, func, out):
+		"""Call func, which fills out from the start to the end. Another thread
+		is started just before the call. It waits for the first output byte
+		to be written and then records whether the last one still has not
+		been. This can only be seen while the call is in progress, so it can 
+		only be seen if the GIL was released. Returns True if the other 
+		thread saw the call in progress.
+		"""
+		started = threading.Event()
+		finished = threading.Event()
+		callreturned = threading.Event()
+		inprogress = []
+
+		def worker():
+			started.wait()
+			# This also stops if the call failed without writing anything.
+			while (out[0] == 0) and not callreturned.is_set():
+				pass
+			inprogress.append(out[-1] == 0)
+			finished.set()
+
+		t = threading.Thread(target=worker)
+		t.start()
+		try:
+			started.set()
+			func()
+		finally:
+			callreturned.set()
+			t.join()
+
+		self.assertTrue(finished.is_set())
+		self.assertNotEqual(out[-1], 0)
+		return inprogress[0]
+
+
+	########################################################
+	def test_threads_gilrelease_xor_G1(self):
+		"""Test xor.
+		"""
+		out = bytearray(GILTestLength)
+		self.assertTrue(self.ProgressDuringCall(lambda : bytesfunc.xor(self.data, 0x5a, out, nosimd=True, threads=1), out))
+
+
+	########################################################
+	def test_threads_gilrelease_invert_G2(self):
+		"""Test invert.
+		"""
+		out = bytearray(GILTestLength)
+		self.assertTrue(self.ProgressDuringCall(lambda : bytesfunc.invert(self.data, out, nosimd=True), out))
+
+
+	########################################################
+	def test_threads_gilrelease_cmpmask_G3(self):
+		"""Test cmpmask.
+		"""
+		out = bytearray(GILTestLength)
+		self.assertTrue(self.ProgressDuringCall(lambda : bytesfunc.cmpmask('==', self.data, 0, out, nosimd=True, threads=1), out))
+
+
+##############################################################################
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('threads\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
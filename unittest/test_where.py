@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_where.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for where, which selects values from two sources
+according to a mask.
+"""
+
+##############################################################################
+import sys
+
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data. This is long enough to be divided between
+# threads.
+TestLength = 200003
+
+
+########################################################
+def maketestdata():
+	"""Return the mask and the two sources as bytes objects. The mask
+	includes non-zero values other than 255.
+	"""
+	mask = bytes([(0, 255, 0, 1, 128, 0, 0, 7)[(x * 7 + x // 13) % 8] for x in range(TestLength)])
+	data1 = bytes([(x * 37 + x // 251) % 256 for x in range(TestLength)])
+	data2 = bytes([(x * 11 + 101) % 256 for x in range(TestLength)])
+	return mask, data1, data2
+
+
+########################################################
+def whereexpected(mask, data1, data2):
+	"""Return the expected result. Either of data1 or data2 may be a single
+	parameter instead of a sequence.
+	"""
+	if isinstance(data1, int):
+		data1 = [data1] * len(mask)
+	if isinstance(data2, int):
+		data2 = [data2] * len(mask)
+	return bytes([x if m else y for m, x, y in zip(mask, data1, data2)])
+
+
+##############################################################################
+class where_general(unittest.TestCase):
+	"""Test selecting the values.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.mask, self.data1, self.data2 = maketestdata()
+
+
+	########################################################
+	def test_where_arr_num_A1(self):
+		"""Test where in the form mask, sequence, param.
+		"""
+		for param in (0, 100, 255):
+			with self.subTest(msg='Failed with parameter', param = param):
+				data = bytearray(self.data1)
+				dataout = bytearray(len(data))
+				expected = whereexpected(self.mask, self.data1, param)
+
+				bytesfunc.where(self.mask, data, param, dataout)
+				self.assertEqual(dataout, expected)
+				self.assertEqual(data, self.data1)
+
+				bytesfunc.where(self.mask, data, param)
+				self.assertEqual(data, expected)
+
+
+	########################################################
+	def test_where_num_arr_A2(self):
+		"""Test where in the form mask, param, sequence.
+		"""
+		for param in (0, 100, 255):
+			with self.subTest(msg='Failed with parameter', param = param):
+				data = bytearray(self.data2)
+				dataout = bytearray(len(data))
+				expected = whereexpected(self.mask, param, self.data2)
+
+				bytesfunc.where(self.mask, param, data, dataout)
+				self.assertEqual(dataout, expected)
+				self.assertEqual(data, self.data2)
+
+				bytesfunc.where(self.mask, param, data)
+				self.assertEqual(data, expected)
+
+
+	########################################################
+	def test_where_arr_arr_A3(self):
+		"""Test where in the form mask, sequence, sequence.
+		"""
+		data = bytearray(self.data1)
+		dataout = bytearray(len(data))
+		expected = whereexpected(self.mask, self.data1, self.data2)
+
+		bytesfunc.where(self.mask, data, self.data2, dataout)
+		self.assertEqual(dataout, expected)
+		self.assertEqual(data, self.data1)
+
+		bytesfunc.where(self.mask, data, self.data2)
+		self.assertEqual(data, expected)
+
+
+	########################################################
+	def test_where_outmask_A4(self):
+		"""Test where with the mask used as the output.
+		"""
+		mask = bytearray(self.mask)
+		bytesfunc.where(mask, self.data1, self.data2, mask)
+		self.assertEqual(mask, whereexpected(self.mask, self.data1, self.data2))
+
+
+	########################################################
+	def test_where_lengths_A5(self):
+		"""Test short sequences, including ones which do not fill a SIMD register.
+		"""
+		for length in (0, 1, 15, 16, 17, 31, 32, 33, 63, 64, 65, 193):
+			with self.subTest(msg='Failed with parameter', length = length):
+				mask = self.mask[:length]
+				data1 = self.data1[:length]
+				data2 = self.data2[:length]
+				self.assertEqual(bytesfunc.where(mask, data1, data2, outtype=bytes), whereexpected(mask, data1, data2))
+				self.assertEqual(bytesfunc.where(mask, data1, 99, outtype=bytes), whereexpected(mask, data1, 99))
+				self.assertEqual(bytesfunc.where(mask, 99, data2, outtype=bytes), whereexpected(mask, 99, data2))
+
+
+	########################################################
+	def test_where_nosimd_A6(self):
+		"""Test with SIMD disabled.
+		"""
+		result = bytesfunc.where(self.mask, self.data1, self.data2, outtype=bytes, nosimd=True)
+		self.assertEqual(result, whereexpected(self.mask, self.data1, self.data2))
+		result = bytesfunc.where(self.mask, self.data1, 5, outtype=bytes, nosimd=True)
+		self.assertEqual(result, whereexpected(self.mask, self.data1, 5))
+		result = bytesfunc.where(self.mask, 5, self.data2, outtype=bytes, nosimd=True)
+		self.assertEqual(result, whereexpected(self.mask, 5, self.data2))
+
+
+	########################################################
+	def test_where_threads_A7(self):
+		"""Test where divided between threads.
+		"""
+		for threads in (1, 2, 3, 4):
+			with self.subTest(msg='Failed with parameter', threads = threads):
+				result = bytesfunc.where(self.mask, self.data1, self.data2, outtype=bytes, threads=threads)
+				self.assertEqual(result, whereexpected(self.mask, self.data1, self.data2))
+
+
+	########################################################
+	def test_where_window_A8(self):
+		"""Test start, stop and maxlen. The same part of the mask is used.
+		"""
+		result = bytesfunc.where(self.mask, self.data1, self.data2, outtype=bytes, start=17, stop=5000)
+		self.assertEqual(result, whereexpected(self.mask[17:5000], self.data1[17:5000], self.data2[17:5000]))
+
+		result = bytesfunc.where(self.mask, self.data1, 3, outtype=bytearray, maxlen=500)
+		self.assertIsInstance(result, bytearray)
+		self.assertEqual(result, whereexpected(self.mask[:500], self.data1[:500], 3))
+
+
+	########################################################
+	def test_where_cmpmask_A9(self):
+		"""Test using a mask from cmpmask to clip the values.
+		"""
+		mask = bytesfunc.cmpmask('>', self.data1, 200, outtype=bytes)
+		result = bytesfunc.where(mask, 200, self.data1, outtype=bytes)
+		self.assertEqual(result, bytes([min(x, 200) for x in self.data1]))
+
+
+	########################################################
+	def test_where_num_num_A10(self):
+		"""Test where in the form mask, param, param. The mask gives the length.
+		"""
+		expected = whereexpected(self.mask, 1, 0)
+
+		dataout = bytearray(len(self.mask))
+		bytesfunc.where(self.mask, 1, 0, dataout)
+		self.assertEqual(dataout, expected)
+
+		self.assertEqual(bytesfunc.where(self.mask, 1, 0, outtype=bytes), expected)
+		self.assertEqual(bytesfunc.where(self.mask, 1, 0, outtype=bytes, nosimd=True), expected)
+
+		# With no output sequence the results overwrite the mask.
+		mask = bytearray(self.mask)
+		bytesfunc.where(mask, 1, 0)
+		self.assertEqual(mask, expected)
+
+		for length in (0, 1, 31, 32, 33, 63, 64, 65, 193):
+			with self.subTest(msg='Failed with parameter', length = length):
+				mask = self.mask[:length]
+				self.assertEqual(bytesfunc.where(mask, 200, 7, outtype=bytes), whereexpected(mask, 200, 7))
+
+
+##############################################################################
+class where_errors(unittest.TestCase):
+	"""Test for invalid parameters.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		mask, data1, data2 = maketestdata()
+		self.mask = mask[:100]
+		self.data1 = bytearray(data1[:100])
+		self.data2 = bytearray(data2[:100])
+
+
+	########################################################
+	def test_where_invalidmask_B1(self):
+		"""Test a mask which is not a sequence.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.where(1, self.data1, self.data2)
+		with self.assertRaises(TypeError):
+			bytesfunc.where(list(self.mask), self.data1, self.data2)
+		with self.assertRaises(TypeError):
+			bytesfunc.where(256, self.data1, self.data2, bytearray(len(self.data1)))
+		with self.assertRaises(TypeError):
+			bytesfunc.where(-1, self.data1, self.data2, bytearray(len(self.data1)))
+
+
+	########################################################
+	def test_where_lengthmismatch_B2(self):
+		"""Test sequences which are not the same length.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.where(self.mask[:99], self.data1, self.data2)
+		with self.assertRaises(TypeError):
+			bytesfunc.where(self.mask, self.data1, self.data2[:99])
+		with self.assertRaises(TypeError):
+			bytesfunc.where(self.mask[:99], self.data1, 1)
+
+
+	########################################################
+	def test_where_invalidparams_B3(self):
+		"""Test invalid parameters.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.where(self.mask, 1, 2)
+		with self.assertRaises(TypeError):
+			bytesfunc.where(self.mask, 1, 2, bytearray(len(self.mask) - 1))
+		with self.assertRaises(TypeError):
+			bytesfunc.where(self.mask, self.data1, 256)
+		with self.assertRaises(TypeError):
+			bytesfunc.where(self.mask, self.data1)
+		with self.assertRaises(TypeError):
+			bytesfunc.where(self.mask, bytes(self.data1), 1)
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('where\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################
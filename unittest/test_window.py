@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+##############################################################################
+# Project:  bytesfunc
+# Module:   test_window.py
+# Purpose:  bytesfunc unit test.
+# Language: Python 3.6
+# Date:     18-Oct-2026.
+# Ver:      18-Oct-2026.
+#
+###############################################################################
+#
+#   Copyright 2014 - 2026    Michael Griffin    <m12.griffin@gmail.com>
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+##############################################################################
+"""This conducts unit tests for the start and stop parameters, which allow
+the functions to work on only part of each sequence.
+"""
+
+##############################################################################
+import sys
+
+import unittest
+
+import bytesfunc
+
+##############################################################################
+
+# Define the differences here so that it's easy to convert the unit test
+# to be used with different packages.
+
+LogfileName = 'bf_unittest.txt'
+
+# The length of the test data.
+TestLength = 200
+
+# The start and stop values to test. These include negative values, values
+# beyond the ends of the data, and None.
+TestWindows = [(0, TestLength), (5, 150), (1, 2), (-50, None), (None, -7),
+	(None, 90), (33, None), (-1000, 120), (10, 1000), (-60, -20)]
+
+
+########################################################
+def maketestdata():
+	"""Return the test data as a bytes object.
+	"""
+	return bytes([(x * 37 + 11) % 256 for x in range(TestLength)])
+
+
+########################################################
+def windowargs(start, stop):
+	"""Return the keyword parameters for a window. None values are left out
+	so that the defaults are tested as well.
+	"""
+	kwargs = {}
+	if start is not None:
+		kwargs['start'] = start
+	if stop is not None:
+		kwargs['stop'] = stop
+	return kwargs
+
+
+##############################################################################
+class window_general(unittest.TestCase):
+	"""Test each function family with a window.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_window_reductions_A1(self):
+		"""Test the reductions with a window.
+		"""
+		for start, stop in TestWindows:
+			with self.subTest(msg='Failed with parameter', start = start, stop = stop):
+				kwargs = windowargs(start, stop)
+				expected = self.data[start:stop]
+				self.assertEqual(bytesfunc.bmax(self.data, **kwargs), max(expected))
+				self.assertEqual(bytesfunc.bmin(self.data, **kwargs), min(expected))
+				self.assertEqual(bytesfunc.bsum(self.data, **kwargs), sum(expected))
+
+
+	########################################################
+	def test_window_findindex_A2(self):
+		"""Test that findindex returns an index relative to the whole
+		sequence.
+		"""
+		for start, stop in TestWindows:
+			with self.subTest(msg='Failed with parameter', start = start, stop = stop):
+				kwargs = windowargs(start, stop)
+				startpos = slice(start, stop).indices(TestLength)[0]
+				window = self.data[start:stop]
+				for val in (window[0], window[-1]):
+					self.assertEqual(bytesfunc.findindex('==', self.data, val, **kwargs), window.index(val) + startpos)
+
+
+	########################################################
+	def test_window_findindex_A3(self):
+		"""Test that findindex ignores matches outside the window.
+		"""
+		data = b'\x01' + bytes(TestLength - 2) + b'\x01'
+		self.assertEqual(bytesfunc.findindex('==', data, 1, start=1, stop=-1), -1)
+		self.assertEqual(bytesfunc.findindex('==', data, 1, start=1), TestLength - 1)
+
+
+	########################################################
+	def test_window_allany_A4(self):
+		"""Test ball and bany with a window.
+		"""
+		data = bytes(10) + b'\x01' * 20 + bytes(10)
+		self.assertTrue(bytesfunc.ball('==', data, 1, start=10, stop=30))
+		self.assertFalse(bytesfunc.ball('==', data, 1, start=9, stop=30))
+		self.assertFalse(bytesfunc.bany('==', data, 1, stop=10))
+		self.assertTrue(bytesfunc.bany('==', data, 1, stop=11))
+
+
+	########################################################
+	def test_window_comp_A5(self):
+		"""Test the comparison functions with a window.
+		"""
+		datay = bytearray(self.data)
+		datay[0] = (datay[0] + 1) % 256
+		datay[-1] = (datay[-1] + 1) % 256
+
+		self.assertFalse(bytesfunc.eq(self.data, datay))
+		self.assertTrue(bytesfunc.eq(self.data, datay, start=1, stop=-1))
+		self.assertFalse(bytesfunc.ne(self.data, datay, start=1, stop=-1))
+		self.assertTrue(bytesfunc.ne(self.data, datay, stop=1))
+		self.assertTrue(bytesfunc.ge(self.data, self.data[50], start=50, stop=51))
+		self.assertFalse(bytesfunc.gt(self.data, self.data[50], start=50, stop=51))
+
+
+	########################################################
+	def test_window_binops_A6(self):
+		"""Test the binary operators with a window. Only the window in the
+		output should be altered.
+		"""
+		for start, stop in TestWindows:
+			with self.subTest(msg='Failed with parameter', start = start, stop = stop):
+				kwargs = windowargs(start, stop)
+
+				expected = bytearray(TestLength)
+				expected[start:stop] = bytes([x ^ 0x55 for x in self.data[start:stop]])
+
+				dataout = bytearray(TestLength)
+				bytesfunc.xor(self.data, 0x55, dataout, **kwargs)
+				self.assertEqual(dataout, expected)
+
+				# In place.
+				expected = bytearray(self.data)
+				expected[start:stop] = bytes([x & 0x0f for x in self.data[start:stop]])
+
+				dataout = bytearray(self.data)
+				bytesfunc.and_(dataout, 0x0f, **kwargs)
+				self.assertEqual(dataout, expected)
+
+				# Two sequences.
+				expected = bytearray(TestLength)
+				expected[start:stop] = bytes([x | y for x, y in zip(self.data[start:stop], self.data[start:stop][::-1])])
+
+				dataout = bytearray(TestLength)
+				datay = bytearray(TestLength)
+				datay[start:stop] = self.data[start:stop][::-1]
+				bytesfunc.or_(self.data, datay, dataout, **kwargs)
+				self.assertEqual(dataout, expected)
+
+
+	########################################################
+	def test_window_invert_A7(self):
+		"""Test invert with a window.
+		"""
+		for start, stop in TestWindows:
+			with self.subTest(msg='Failed with parameter', start = start, stop = stop):
+				kwargs = windowargs(start, stop)
+
+				expected = bytearray(self.data)
+				expected[start:stop] = bytes([~x & 0xff for x in self.data[start:stop]])
+
+				dataout = bytearray(self.data)
+				bytesfunc.invert(dataout, **kwargs)
+				self.assertEqual(dataout, expected)
+
+
+	########################################################
+	def test_window_maxlen_A8(self):
+		"""Test that maxlen is applied to the window.
+		"""
+		self.assertEqual(bytesfunc.bsum(self.data, start=20, maxlen=10), sum(self.data[20:30]))
+		self.assertEqual(bytesfunc.bsum(self.data, start=20, stop=25, maxlen=10), sum(self.data[20:25]))
+
+		dataout = bytearray(TestLength)
+		bytesfunc.invert(self.data, dataout, start=20, maxlen=10)
+		self.assertEqual(dataout[20:30], bytearray([~x & 0xff for x in self.data[20:30]]))
+		self.assertEqual(dataout[:20] + dataout[30:], bytearray(TestLength - 10))
+
+
+	########################################################
+	def test_window_threads_A9(self):
+		"""Test a window with multiple threads.
+		"""
+		data = bytearray(100000)
+		data[60000] = 1
+		self.assertEqual(bytesfunc.findindex('==', data, 1, start=1000, threads=4), 60000)
+		self.assertEqual(bytesfunc.bsum(data, start=59000, stop=61000, threads=3), 1)
+		self.assertFalse(bytesfunc.bany('==', data, 1, stop=60000, threads=2))
+
+
+
+	########################################################
+	def test_window_binopspositional_A10(self):
+		"""Test passing every parameter which comes before the window by
+		position, in the original order.
+		"""
+		for func in (bytesfunc.and_, bytesfunc.or_, bytesfunc.xor, bytesfunc.lshift, bytesfunc.rshift):
+			for nosimd in (False, True):
+				with self.subTest(msg='Failed with parameter', func = func, nosimd = nosimd):
+					expected = bytearray(TestLength)
+					func(bytearray(self.data), 3, expected, maxlen=0, nosimd=nosimd)
+					result = bytearray(TestLength)
+					func(bytearray(self.data), 3, result, 0, nosimd)
+					self.assertEqual(result, expected)
+
+		mask = bytes([x % 3 == 0 for x in range(TestLength)])
+		expected = bytearray(TestLength)
+		bytesfunc.cmpmask('<', self.data, 100, expected, maxlen=0, nosimd=True)
+		result = bytearray(TestLength)
+		bytesfunc.cmpmask('<', self.data, 100, result, 0, True)
+		self.assertEqual(result, expected)
+
+		expected = bytearray(TestLength)
+		bytesfunc.where(mask, self.data, 7, expected, maxlen=0, nosimd=True)
+		result = bytearray(TestLength)
+		bytesfunc.where(mask, self.data, 7, result, 0, True)
+		self.assertEqual(result, expected)
+
+
+##############################################################################
+class window_errors(unittest.TestCase):
+	"""Test invalid windows.
+	"""
+
+	########################################################
+	def setUp(self):
+		"""Initialise.
+		"""
+		self.data = maketestdata()
+
+
+	########################################################
+	def test_window_empty_B1(self):
+		"""Test that an empty window is an error, as an empty sequence is.
+		"""
+		for start, stop in ((10, 10), (20, 10), (TestLength, None), (None, -TestLength)):
+			with self.subTest(msg='Failed with parameter', start = start, stop = stop):
+				kwargs = windowargs(start, stop)
+				with self.assertRaises(IndexError):
+					bytesfunc.bsum(self.data, **kwargs)
+				with self.assertRaises(IndexError):
+					bytesfunc.findindex('==', self.data, 1, **kwargs)
+
+
+	########################################################
+	def test_window_type_B2(self):
+		"""Test that start and stop must be integers.
+		"""
+		for val in ('x', 1.5, b'1'):
+			with self.subTest(msg='Failed with parameter', val = val):
+				with self.assertRaises(TypeError):
+					bytesfunc.bmax(self.data, start=val)
+				with self.assertRaises(TypeError):
+					bytesfunc.eq(self.data, self.data, stop=val)
+				with self.assertRaises(TypeError):
+					bytesfunc.findindex('==', self.data, 1, start=val)
+
+
+	########################################################
+	def test_window_positional_B3(self):
+		"""Test that start and stop are keyword only.
+		"""
+		with self.assertRaises(TypeError):
+			bytesfunc.bsum(self.data, False, 0, 1, 0, 1, 5)
+		for func in (bytesfunc.and_, bytesfunc.or_, bytesfunc.xor, bytesfunc.lshift, bytesfunc.rshift):
+			with self.subTest(msg='Failed with parameter', func = func):
+				with self.assertRaises(TypeError):
+					func(bytearray(self.data), 3, bytearray(TestLength), 0, False, 1)
+		with self.assertRaises(TypeError):
+			bytesfunc.cmpmask('<', self.data, 100, bytearray(TestLength), 0, False, 1)
+		with self.assertRaises(TypeError):
+			bytesfunc.where(self.data, self.data, 7, bytearray(TestLength), 0, False, 1)
+
+
+##############################################################################
+
+
+##############################################################################
+if __name__ == '__main__':
+
+	# Check to see if the log file option has been selected. This is an option
+	# which we have added in order to decide where to output the results.
+	if '-l' in sys.argv:
+		# Remove the option from the argument list so that "unittest" does
+		# not complain about unknown options.
+		sys.argv.remove('-l')
+
+		with open(LogfileName, 'a') as f:
+			f.write('\n\n')
+			f.write('window\n\n')
+			trun = unittest.TextTestRunner(f)
+			unittest.main(testRunner=trun)
+	else:
+		unittest.main()
+
+##############################################################################